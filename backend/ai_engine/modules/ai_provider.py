@@ -1,9 +1,11 @@
 """
-AI Provider Factory - supports Gemini
+AI Provider Factory - supports Gemini (and an offline stand-in, see local_provider.py)
 Uses google-genai (new unified SDK) for Gemini access.
 
 Model routing: PRO tier (3.1-pro) for article generation, FLASH tier for everything else.
-Rate limiter: Redis counters prevent 429s by auto-skipping models near their limits.
+Rate limiter: every call takes a token from rate_limiter.py (shared Redis
+token buckets per model) first, waiting up to AI_RATE_WAIT_SECONDS when the
+whole cascade is at its limits; provider 429s slow the model down.
 """
 import os
 import time
@@ -75,66 +77,20 @@ MODEL_RATE_LIMITS = {
     'gemini-2.5-pro-exp-03-25': {'rpm': 10, 'rpd': 500},
     'gemini-2.5-flash': {'rpm': 1000, 'rpd': 10000},
     'gemini-2.0-flash': {'rpm': 2000, 'rpd': None},  # unlimited RPD
+    'gemini-embedding-2-preview': {'rpm': 50, 'rpd': None},  # vector_search embeddings
 }
-RATE_LIMIT_THRESHOLD = 0.80  # Skip model at 80% of its limit
+RATE_LIMIT_THRESHOLD = 0.80  # Stay at 80% of each limit
 
 
 def _check_rate_limit(model_name: str) -> bool:
     """
-    Check if we should skip this model because it's near its rate limit.
-    Uses Redis counters for RPM (per-minute) and RPD (per-day).
+    Check if this model is at its soft rate limit right now (no token free in
+    its rate_limiter bucket). Takes no token.
     
     Returns True if model should be SKIPPED.
     """
-    limits = MODEL_RATE_LIMITS.get(model_name)
-    if not limits:
-        return False  # Unknown model, allow
-    
-    try:
-        from django.core.cache import cache
-        
-        # Check RPM (requests per minute)
-        minute_key = f"rl_rpm:{model_name}:{int(time.time()) // 60}"
-        rpm_count = cache.get(minute_key, 0)
-        rpm_limit = limits['rpm']
-        if rpm_count >= int(rpm_limit * RATE_LIMIT_THRESHOLD):
-            logger.info(f"⚡ Rate limit: {model_name} RPM {rpm_count}/{rpm_limit} — skipping")
-            return True
-        
-        # Check RPD (requests per day)
-        rpd_limit = limits.get('rpd')
-        if rpd_limit:
-            day_key = f"rl_rpd:{model_name}:{time.strftime('%Y%m%d')}"
-            rpd_count = cache.get(day_key, 0)
-            if rpd_count >= int(rpd_limit * RATE_LIMIT_THRESHOLD):
-                logger.info(f"⚡ Rate limit: {model_name} RPD {rpd_count}/{rpd_limit} — skipping")
-                return True
-        
-        return False
-    except Exception:
-        return False  # Redis down → allow all
-
-
-def _record_rate_limit(model_name: str):
-    """Increment rate limit counters after a successful API call."""
-    try:
-        from django.core.cache import cache
-        
-        # Increment RPM counter (expires in 60s)
-        minute_key = f"rl_rpm:{model_name}:{int(time.time()) // 60}"
-        try:
-            cache.incr(minute_key)
-        except ValueError:
-            cache.set(minute_key, 1, timeout=60)
-        
-        # Increment RPD counter (expires end of day → 24h is safe)
-        day_key = f"rl_rpd:{model_name}:{time.strftime('%Y%m%d')}"
-        try:
-            cache.incr(day_key)
-        except ValueError:
-            cache.set(day_key, 1, timeout=86400)
-    except Exception:
-        pass
+    from ai_engine.modules import rate_limiter
+    return not rate_limiter.available(model_name)
 
 
 class AIProvider:
@@ -171,18 +127,29 @@ class GeminiProvider(AIProvider):
         if system_prompt:
             gen_config.system_instruction = system_prompt
         
+        from django.conf import settings
+        from ai_engine.modules import rate_limiter
+        from news import profiling
+        deadline = time.monotonic() + getattr(settings, 'AI_RATE_WAIT_SECONDS', rate_limiter.DEFAULT_WAIT_SECONDS)
+        
         last_error = None
-        for model_name in model_names_to_try:
-            # Rate limit check — skip models near their quota
-            if _check_rate_limit(model_name):
-                continue
+        remaining = list(model_names_to_try)
+        while remaining:
+            # Token from the first model in the cascade that has one; when
+            # all are at their limits, wait for the first to free up
+            model_name = rate_limiter.acquire_any(remaining, timeout=max(0, deadline - time.monotonic()))
+            if model_name is None:
+                last_error = last_error or f"rate limits reached on {', '.join(remaining)}"
+                break
+            remaining = remaining[remaining.index(model_name) + 1:]
             
             try:
-                response = gemini_client.models.generate_content(
-                    model=model_name,
-                    contents=prompt,
-                    config=gen_config,
-                )
+                with profiling.span('llm'):
+                    response = gemini_client.models.generate_content(
+                        model=model_name,
+                        contents=prompt,
+                        config=gen_config,
+                    )
                 
                 # Robust text extraction
                 text = ""
@@ -199,8 +166,7 @@ class GeminiProvider(AIProvider):
                     tier = 'PRO' if caller in PRO_CALLERS else 'FLASH'
                     print(f"✅ Generated with {model_name} [{tier}] caller={caller}")
                     
-                    # Record rate limit counter
-                    _record_rate_limit(model_name)
+                    rate_limiter.record_success(model_name)
                     # Record which model succeeded for provider tracker
                     import ai_engine.modules.ai_provider as _self_mod
                     _self_mod._last_model_used = model_name
@@ -227,6 +193,8 @@ class GeminiProvider(AIProvider):
                     
             except Exception as e:
                 last_error = str(e)
+                if rate_limiter.is_rate_limit_error(e):
+                    rate_limiter.penalize(model_name)
                 print(f"Failed with model {model_name}: {e}")
                 continue
         
@@ -234,22 +202,39 @@ class GeminiProvider(AIProvider):
         raise Exception(f"All Gemini models failed. Last error: {last_error}")
 
 
+def _provider_override():
+    """AI_PROVIDER_OVERRIDE=local routes every factory below to the offline stand-in."""
+    return os.getenv('AI_PROVIDER_OVERRIDE', '').strip().lower()
+
+
+def _gemini_provider():
+    """GeminiProvider, wrapped to record responses when AI_RECORD_CASSETTE is set."""
+    record_path = os.getenv('AI_RECORD_CASSETTE')
+    if record_path:
+        from ai_engine.modules.local_provider import RecordingProvider
+        return RecordingProvider(GeminiProvider(), record_path)
+    return GeminiProvider()
+
+
 def get_ai_provider(provider_name='gemini'):
     """
     Factory function to get AI provider
     
     Args:
-        provider_name: 'gemini'
+        provider_name: 'gemini' or 'local' (offline stand-in, see local_provider.py)
     
     Returns:
         AIProvider instance
     """
-    provider_name = provider_name.lower()
+    provider_name = (_provider_override() or provider_name).lower()
     
     if provider_name == 'gemini':
-        return GeminiProvider()
+        return _gemini_provider()
+    elif provider_name == 'local':
+        from ai_engine.modules.local_provider import LocalProvider
+        return LocalProvider()
     else:
-        raise ValueError(f"Unknown AI provider: {provider_name}. Use 'gemini'")
+        raise ValueError(f"Unknown AI provider: {provider_name}. Use 'gemini' or 'local'")
 
 
 def get_light_provider():
@@ -258,14 +243,14 @@ def get_light_provider():
     This used to return Groq, but Groq was removed in favor of standardizing
     on Gemini for all tasks to improve output formatting stability.
     """
-    return GeminiProvider()
+    return get_ai_provider('gemini')
 
 def get_generate_provider():
     """Return Gemini for heavy tasks.
     
     This used to differentiate from light provider, but now all use Gemini.
     """
-    return GeminiProvider()
+    return get_ai_provider('gemini')
 
 def get_available_providers():
     """
@@ -284,4 +269,13 @@ def get_available_providers():
             'available': True
         })
     
+    if _provider_override() == 'local':
+        from ai_engine.modules.local_provider import LOCAL_MODEL_NAME
+        providers.append({
+            'name': 'local',
+            'display_name': 'Local stand-in (offline)',
+            'model': LOCAL_MODEL_NAME,
+            'available': True
+        })
+    
     return providers
@@ -6,14 +6,88 @@ car name shortening, price validation, duplicate paragraph removal,
 self-consistency checks, typo fixes, and empty card stripping.
 
 The `post_process_article` function is the single orchestrator entry-point.
+It runs the passes listed in `_PIPELINE` over one shared document, skipping
+passes whose trigger markers (compare-grid, prices, paragraphs) are absent.
+All patterns are compiled once at import time.
 """
 import re
+import time
 import logging
 
 logger = logging.getLogger(__name__)
 
 from ai_engine.modules.banned_phrases import clean_banned_phrases
 from ai_engine.modules.html_normalizer import ensure_html_only
+from ai_engine.modules.phrase_matcher import RegexRuleSet
+
+
+# ── Precompiled patterns ───────────────────────────────────────────────
+# Every pass used to compile (or re-look-up) its patterns on each call;
+# they are built once at import time instead.
+_TAG_RE = re.compile(r'<[^>]+>')
+_BLANK_LINES_RE = re.compile(r'\n\s*\n\s*\n')
+_EMPTY_UL_RE = re.compile(r'<ul>\s*</ul>')
+_BODY_BLOCK_RE = re.compile(r'<(?:p|li)>.*?</(?:p|li)>', re.DOTALL)
+_PARAGRAPH_RE = re.compile(r'<p>.*?</p>', re.DOTALL)
+_H2_RE = re.compile(r'<h2[^>]*>(.*?)</h2>', re.IGNORECASE)
+_FIRST_H2_RE = re.compile(r'<h2[^>]*>.*?</h2>', re.DOTALL)
+_HEADING_BLOCK_RE = re.compile(r'<h[1-6][^>]*>.*?</h[1-6]>', re.DOTALL | re.IGNORECASE)
+_REPETITION_SPEC_RE = re.compile(r'(\d[\d,.]*\s*(?:km|hp|kW|Nm|mm|kWh|mph|kg|seconds?|s)\b)', re.IGNORECASE)
+_CONSISTENCY_SPEC_RE = re.compile(
+    r'(\d[\d,.]*)\s*(kWh|km|hp|HP|kW|Nm|mm|kg|mph|liters?|litres?|seconds?)\b',
+    re.IGNORECASE
+)
+_FULL_CAR_NAME_RE = re.compile(
+    r'(?:The\s+)?(20\d{2})\s+([A-Z][A-Za-z]+(?:\s+[A-Z][A-Za-z]+)?)\s+([A-Z0-9][A-Za-z0-9]+(?:\s+[A-Z0-9]+)?)',
+)
+_PRICE_HINT_RE = re.compile(r'approx|CNY|RMB', re.IGNORECASE)
+_PRICE_DOUBLED_RE = re.compile(
+    r'\(approx\.?\s*\$[\d,]+\)\d*\s*\(approximately\s*(\$[\d,]+(?:\s*USD)?)\)', re.IGNORECASE,
+)
+_PRICE_DOUBLED_REVERSE_RE = re.compile(
+    r'\(approximately\s*\$[\d,]+(?:\s*USD)?\)\s*\(approx\.?\s*(\$[\d,]+)\)', re.IGNORECASE,
+)
+_CNY_COMMA_RE = re.compile(r'(CNY\s+|RMB\s+)(\d{1,3}),(\d{2})\b(?!\d)')
+_PRICE_STRAY_DIGITS_RE = re.compile(
+    r'(\(approx(?:imately)?\.?\s*\$[\d,]+(?:\s*USD)?\))(\d{1,2})(?=\s|[.,;)]|$)',
+)
+_PRICE_DUPLICATE_USD_RE = re.compile(
+    r'(\(approx(?:imately)?\.?\s*\$[\d,]+(?:\s*USD)?\))\s*\(approx(?:imately)?\.?\s*\$[\d,]+(?:\s*USD)?\)',
+    re.IGNORECASE,
+)
+_EMPTY_CARD_RE = re.compile(
+    r'<div\s+class="compare-card(?:[^"]*)?">\s*'
+    r'(?:<div\s+class="compare-badge">.*?</div>\s*)?'
+    r'<div\s+class="compare-card-name">.*?</div>\s*'
+    r'((?:<div\s+class="compare-row">.*?</div>\s*)*)'
+    r'</div>',
+    re.DOTALL
+)
+_CARD_VALUE_RE = re.compile(r'<span\s+class="v">(.*?)</span>', re.DOTALL | re.IGNORECASE)
+_LONE_FEATURED_GRID_RE = re.compile(
+    r'<div\s+class="compare-grid">\s*<div\s+class="compare-card[^>]*featured[^>]*>.*?</div>\s*</div>',
+    re.DOTALL
+)
+_PLAIN_CARD_RE = re.compile(
+    r'(<div\s+class="compare-card">\s*'
+    r'<div\s+class="compare-card-name">(.*?)</div>'
+    r'.*?'
+    r'</div>)',
+    re.DOTALL
+)
+_FEATURED_ONLY_GRID_RE = re.compile(
+    r'<div\s+class="compare-grid">\s*<div\s+class="compare-card featured">.*?</div>\s*</div>',
+    re.DOTALL
+)
+_GRID_OPEN_RE = re.compile(r'<div\s+class="compare-grid">', re.IGNORECASE)
+_DIV_TAG_RE = re.compile(r'(<div[\s>])|</div>', re.IGNORECASE)
+_COMPARE_ROW_RE = re.compile(
+    r'<div\s+class="compare-row">\s*<span\s+class="k">(.*?)</span>\s*<span\s+class="v">(.*?)</span>\s*</div>',
+    re.DOTALL | re.IGNORECASE
+)
+_CARD_OPEN_RE = re.compile(r'<div\s+class="compare-card(\s[^"]*)?">', re.IGNORECASE)
+_CARD_BADGE_RE = re.compile(r'<div\s+class="compare-badge">(.*?)</div>', re.IGNORECASE)
+_CARD_NAME_RE = re.compile(r'<div\s+class="compare-card-name">(.*?)</div>', re.IGNORECASE)
 
 
 def _reduce_repetition(html: str) -> str:
@@ -21,12 +95,12 @@ def _reduce_repetition(html: str) -> str:
     import collections
 
     # Extract all spec mentions: "1505 km", "530 hp", "82.5 kWh", etc.
-    spec_re = re.compile(r'(\d[\d,.]*\s*(?:km|hp|kW|Nm|mm|kWh|mph|kg|seconds?|s)\b)', re.IGNORECASE)
+    spec_re = _REPETITION_SPEC_RE
 
     # Count spec occurrences ONLY in body blocks (p, li) — NOT headings (h2/h3).
     # Specs in the article title heading are expected to appear in the body too,
     # so counting h2/h3 would wrongly flag normal spec mentions as "overused".
-    body_blocks = re.findall(r'<(?:p|li)>.*?</(?:p|li)>', html, re.DOTALL)
+    body_blocks = _BODY_BLOCK_RE.findall(html)
     if not body_blocks:
         return html
 
@@ -61,8 +135,8 @@ def _reduce_repetition(html: str) -> str:
 
     if removed:
         # Clean up empty space and empty <ul> tags
-        html = re.sub(r'\n\s*\n\s*\n', '\n\n', html)
-        html = re.sub(r'<ul>\s*</ul>', '', html)
+        html = _BLANK_LINES_RE.sub('\n\n', html)
+        html = _EMPTY_UL_RE.sub('', html)
         print(f"  🔁 Repetition detector: removed {removed} redundant blocks")
 
     return html
@@ -71,12 +145,8 @@ def _reduce_repetition(html: str) -> str:
 def _shorten_car_names(html: str) -> str:
     """Replace repeated full car names ('The 2026 BYD TANG 1240') with shorter forms after first 2 mentions."""
     # Match patterns like 'The 2026 BYD TANG 1240' or '2026 HUAWEI M8 REV'
-    full_name_re = re.compile(
-        r'(?:The\s+)?(20\d{2})\s+([A-Z][A-Za-z]+(?:\s+[A-Z][A-Za-z]+)?)\s+([A-Z0-9][A-Za-z0-9]+(?:\s+[A-Z0-9]+)?)',
-    )
-    
     # Find the most common full car name pattern
-    matches = full_name_re.findall(html)
+    matches = _FULL_CAR_NAME_RE.findall(html)
     if len(matches) < 4:
         return html  # Not enough repetition to matter
     
@@ -156,7 +226,7 @@ def _detect_missing_sections(html: str, word_count: int, has_competitors: bool =
         EXPECTED_SECTIONS['How It Compares'] = ['compares', 'comparison', 'competition', 'competitor', 'versus', 'vs.', 'rivals']
 
     # Extract all H2 headings from the article
-    h2_texts = [h.lower() for h in re.findall(r'<h2[^>]*>(.*?)</h2>', html, re.IGNORECASE)]
+    h2_texts = [h.lower() for h in _H2_RE.findall(html)]
     h2_combined = ' '.join(h2_texts)
 
     missing = []
@@ -166,7 +236,7 @@ def _detect_missing_sections(html: str, word_count: int, has_competitors: bool =
 
     # Detect thin sections (H2 followed by very little content)
     thin = []
-    h2_positions = [(m.start(), m.end(), m.group(1)) for m in re.finditer(r'<h2[^>]*>(.*?)</h2>', html, re.IGNORECASE)]
+    h2_positions = [(m.start(), m.end(), m.group(1)) for m in _H2_RE.finditer(html)]
     for i, (start, end, title) in enumerate(h2_positions):
         if i == 0:
             continue  # Skip the title H2 — it's the article headline, not a body section
@@ -177,7 +247,7 @@ def _detect_missing_sections(html: str, word_count: int, has_competitors: bool =
         # Content between this H2 and the next one (or end of doc)
         next_start = h2_positions[i + 1][0] if i + 1 < len(h2_positions) else len(html)
         section_html = html[end:next_start]
-        section_text = re.sub(r'<[^>]+>', ' ', section_html)
+        section_text = _TAG_RE.sub(' ', section_html)
         section_words = len(section_text.split())
         if section_words < 40:  # Less than ~2 sentences = practically empty
             thin.append(title.strip())
@@ -192,7 +262,7 @@ def _detect_missing_sections(html: str, word_count: int, has_competitors: bool =
         _, vend, _ = h2_positions[verdict_idx]
         vnext = h2_positions[verdict_idx + 1][0] if verdict_idx + 1 < len(h2_positions) else len(html)
         verdict_html = html[vend:vnext]
-        verdict_text = re.sub(r'<[^>]+>', ' ', verdict_html).strip()
+        verdict_text = _TAG_RE.sub(' ', verdict_html).strip()
         verdict_words = len(verdict_text.split())
         if verdict_words < 15:  # Heading exists but essentially empty
             if 'FreshMotors Verdict' not in missing:
@@ -245,22 +315,16 @@ def _detect_missing_sections(html: str, word_count: int, has_competitors: bool =
 # ── Price format validator ─────────────────────────────────────────────
 def _validate_prices(html: str) -> str:
     """Fix broken price formatting that LLMs sometimes produce."""
+    if not _PRICE_HINT_RE.search(html):
+        return html  # No approx/CNY/RMB anywhere — every rule below is a no-op
     original = html
 
     # 1. Fix doubled approximate conversions:
     #    "CNY 359,800 (approx. $5,000)0 (approximately $49,800 USD)"
     #    → "CNY 359,800 (approximately $49,800)"
-    html = re.sub(
-        r'\(approx\.?\s*\$[\d,]+\)\d*\s*\(approximately\s*(\$[\d,]+(?:\s*USD)?)\)',
-        r'(approximately \1)',
-        html, flags=re.IGNORECASE,
-    )
+    html = _PRICE_DOUBLED_RE.sub(r'(approximately \1)', html)
     # Catch the reverse order too
-    html = re.sub(
-        r'\(approximately\s*\$[\d,]+(?:\s*USD)?\)\s*\(approx\.?\s*(\$[\d,]+)\)',
-        r'(approximately \1)',
-        html, flags=re.IGNORECASE,
-    )
+    html = _PRICE_DOUBLED_REVERSE_RE.sub(r'(approximately \1)', html)
 
     # 2. Fix CNY prices with too few digits (broken comma placement):
     #    "CNY 359,80" → "CNY 359,800"  (probable dropped trailing zero)
@@ -277,24 +341,15 @@ def _validate_prices(html: str) -> str:
             return fixed
         return m.group(0)
 
-    html = re.sub(
-        r'(CNY\s+|RMB\s+)(\d{1,3}),(\d{2})\b(?!\d)',
-        _fix_cny_comma, html,
-    )
+    html = _CNY_COMMA_RE.sub(_fix_cny_comma, html)
 
     # 3. Fix stray digits after closing parenthesis in price conversions:
     #    "(approx. $49,800)0" → "(approx. $49,800)"
-    html = re.sub(
-        r'(\(approx(?:imately)?\.?\s*\$[\d,]+(?:\s*USD)?\))(\d{1,2})(?=\s|[.,;)]|$)',
-        r'\1', html,
-    )
+    html = _PRICE_STRAY_DIGITS_RE.sub(r'\1', html)
 
     # 4. Remove duplicate USD annotations on the same price:
     #    "CNY 359,800 (approximately $49,800) (approx. $49,800)"
-    html = re.sub(
-        r'(\(approx(?:imately)?\.?\s*\$[\d,]+(?:\s*USD)?\))\s*\(approx(?:imately)?\.?\s*\$[\d,]+(?:\s*USD)?\)',
-        r'\1', html, flags=re.IGNORECASE,
-    )
+    html = _PRICE_DUPLICATE_USD_RE.sub(r'\1', html)
 
     if html != original:
         print(f"  💰 Price validator: fixed formatting issues")
@@ -308,18 +363,21 @@ def _detect_duplicate_paragraphs(html: str) -> str:
     from difflib import SequenceMatcher
 
     # Extract all <p> blocks with their positions
-    para_pattern = re.compile(r'<p>.*?</p>', re.DOTALL)
-    matches = list(para_pattern.finditer(html))
+    matches = list(_PARAGRAPH_RE.finditer(html))
 
     if len(matches) < 3:
         return html  # Not enough paragraphs to compare
 
     # Convert to plain text for comparison
     def _plain(html_block):
-        return re.sub(r'<[^>]+>', ' ', html_block).strip().lower()
+        return _TAG_RE.sub(' ', html_block).strip().lower()
 
     texts = [_plain(m.group()) for m in matches]
 
+    # One matcher per later paragraph: SequenceMatcher caches its analysis of
+    # the second sequence, so only the first one is swapped per comparison.
+    matchers = {}
+
     # Find duplicate pairs (compare each para with all later ones)
     to_remove = set()
     for i in range(len(texts)):
@@ -332,7 +390,14 @@ def _detect_duplicate_paragraphs(html: str) -> str:
                 continue
             if len(texts[j]) < 80:
                 continue
-            ratio = SequenceMatcher(None, texts[i], texts[j]).ratio()
+            matcher = matchers.get(j)
+            if matcher is None:
+                matcher = matchers[j] = SequenceMatcher(None, '', texts[j])
+            matcher.set_seq1(texts[i])
+            # real_quick_ratio/quick_ratio are cheap upper bounds of ratio()
+            if matcher.real_quick_ratio() <= 0.70 or matcher.quick_ratio() <= 0.70:
+                continue
+            ratio = matcher.ratio()
             if ratio > 0.70:
                 # Remove the later (duplicate) paragraph
                 to_remove.add(j)
@@ -347,7 +412,7 @@ def _detect_duplicate_paragraphs(html: str) -> str:
         html = html[:m.start()] + html[m.end():]
 
     # Clean up leftover whitespace
-    html = re.sub(r'\n\s*\n\s*\n', '\n\n', html)
+    html = _BLANK_LINES_RE.sub('\n\n', html)
     print(f"  🔁 Duplicate detector: removed {len(to_remove)} duplicate paragraph(s)")
 
     return html
@@ -362,11 +427,8 @@ def _check_self_consistency(html: str) -> str:
     import collections
 
     # Extract all numeric claims with units (skip inside headings)
-    body_text = re.sub(r'<h[1-6][^>]*>.*?</h[1-6]>', '', html, flags=re.DOTALL | re.IGNORECASE)
-    spec_re = re.compile(
-        r'(\d[\d,.]*)\s*(kWh|km|hp|HP|kW|Nm|mm|kg|mph|liters?|litres?|seconds?)\b',
-        re.IGNORECASE
-    )
+    body_text = _HEADING_BLOCK_RE.sub('', html)
+    spec_re = _CONSISTENCY_SPEC_RE
 
     # Group by unit type
     unit_groups = collections.defaultdict(list)
@@ -462,17 +524,14 @@ _COMMON_TYPOS = [
 ]
 
 
+# Rules run in order, each only when its literal anchor ("staring", "luxary",
+# "suv", ...) is present — one automaton pass instead of 20 regex scans.
+_TYPO_RULES = RegexRuleSet(_COMMON_TYPOS)
+
+
 def _clean_source_typos(html: str) -> str:
     """Fix common typos that AI copies from source data and repeats throughout."""
-    original = html
-    fixed_count = 0
-
-    for pattern, replacement in _COMMON_TYPOS:
-        new_html = pattern.sub(replacement, html)
-        if new_html != html:
-            count = len(pattern.findall(html))
-            fixed_count += count
-            html = new_html
+    html, fixed_count = _TYPO_RULES.apply(html)
 
     if fixed_count > 0:
         print(f"  🔤 Typo guard: fixed {fixed_count} propagated typo(s)")
@@ -483,16 +542,9 @@ def _clean_source_typos(html: str) -> str:
 # ── Empty compare card stripper ────────────────────────────────────────
 def _strip_empty_compare_cards(html: str) -> str:
     """Remove compare-card divs that have no compare-row children OR only contain N/A values."""
-    # Match individual compare-card blocks
-    card_pattern = re.compile(
-        r'<div\s+class="compare-card(?:[^"]*)?">\s*'
-        r'(?:<div\s+class="compare-badge">.*?</div>\s*)?'
-        r'<div\s+class="compare-card-name">.*?</div>\s*'
-        r'((?:<div\s+class="compare-row">.*?</div>\s*)*)'
-        r'</div>',
-        re.DOTALL
-    )
-    
+    if 'compare-card' not in html:
+        return html
+
     removed = 0
     def _check_card(m):
         nonlocal removed
@@ -507,9 +559,8 @@ def _strip_empty_compare_cards(html: str) -> str:
             return m.group(0)
             
         # Check if ALL values are N/A, Unknown, or empty
-        val_pattern = re.compile(r'<span\s+class="v">(.*?)</span>', re.DOTALL | re.IGNORECASE)
-        values = val_pattern.findall(rows)
-        clean_values = [re.sub(r'<[^>]+>', '', v).strip().lower() for v in values]
+        values = _CARD_VALUE_RE.findall(rows)
+        clean_values = [_TAG_RE.sub('', v).strip().lower() for v in values]
         
         # If every value is missing info
         is_empty = all(v in ('n/a', 'unknown', 'tba', '-', '', 'none', 'unavailable') for v in clean_values)
@@ -520,18 +571,17 @@ def _strip_empty_compare_cards(html: str) -> str:
             
         return m.group(0)
     
-    html = card_pattern.sub(_check_card, html)
+    html = _EMPTY_CARD_RE.sub(_check_card, html)
     
     if removed:
         print(f"  🗑️ Compare cards: removed {removed} empty/NA competitor card(s)")
         # Clean up whitespace
-        html = re.sub(r'\n\s*\n\s*\n', '\n\n', html)
+        html = _BLANK_LINES_RE.sub('\n\n', html)
         
         # Clean up leftover empty compare-grid that ONLY has the featured card
-        html = re.sub(
-            r'<div\s+class="compare-grid">\s*<div\s+class="compare-card[^>]*featured[^>]*>.*?</div>\s*</div>', 
+        html = _LONE_FEATURED_GRID_RE.sub(
             lambda m: m.group(0) if m.group(0).count('class="compare-card') > 1 else '',
-            html, flags=re.DOTALL
+            html,
         )
     
     return html
@@ -562,19 +612,11 @@ def _strip_hallucinated_compare_cards(html: str, allowed_makes: list[str]) -> st
     # Normalise allowed makes for case-insensitive matching
     allowed_lower = {m.strip().lower() for m in allowed_makes}
 
-    # Pattern for non-featured cards (featured = subject car, never remove)
-    card_pattern = re.compile(
-        r'(<div\s+class="compare-card">\s*'
-        r'<div\s+class="compare-card-name">(.*?)</div>'
-        r'.*?'
-        r'</div>)',
-        re.DOTALL
-    )
-
+    # Non-featured cards only (featured = subject car, never remove): _PLAIN_CARD_RE
     removed_cards = []
 
     def _check_hallucinated(m):
-        card_name = re.sub(r'<[^>]+>', '', m.group(2)).strip()  # plain text of card-name
+        card_name = _TAG_RE.sub('', m.group(2)).strip()  # plain text of card-name
         # Check if any allowed make appears in the card name (word-boundary aware)
         for make in allowed_lower:
             if re.search(r'\b' + re.escape(make) + r'\b', card_name, re.IGNORECASE):
@@ -583,15 +625,16 @@ def _strip_hallucinated_compare_cards(html: str, allowed_makes: list[str]) -> st
         removed_cards.append(card_name)
         return ''
 
-    html = card_pattern.sub(_check_hallucinated, html)
+    html = _PLAIN_CARD_RE.sub(_check_hallucinated, html)
 
     if removed_cards:
         print(f"  🚫 Hallucination guard: removed {len(removed_cards)} invented competitor card(s): {removed_cards}")
         # Clean up leftover empty compare-grid
-        html = re.sub(r'<div\s+class="compare-grid">\s*<div\s+class="compare-card featured">.*?</div>\s*</div>', 
-                      lambda m: m.group(0) if 'compare-card">' in m.group(0) else '',
-                      html, flags=re.DOTALL)
-        html = re.sub(r'\n\s*\n\s*\n', '\n\n', html)
+        html = _FEATURED_ONLY_GRID_RE.sub(
+            lambda m: m.group(0) if 'compare-card">' in m.group(0) else '',
+            html,
+        )
+        html = _BLANK_LINES_RE.sub('\n\n', html)
 
     return html
 
@@ -599,7 +642,7 @@ def _strip_hallucinated_compare_cards(html: str, allowed_makes: list[str]) -> st
 # ── Dedup guard (shared helper) ────────────────────────────────────────
 def _dedup_guard(html: str) -> str:
     """If the article's first H2 appears twice, trim at second occurrence."""
-    first_h2 = re.search(r'<h2[^>]*>.*?</h2>', html, re.DOTALL)
+    first_h2 = _FIRST_H2_RE.search(html)
     if first_h2:
         second_pos = html.find(first_h2.group(0), first_h2.end())
         if second_pos > 0:
@@ -692,41 +735,30 @@ def _normalize_compare_rows(html: str) -> str:
     'Power' in another), this normalizes them to the most common label set.
     Missing rows get 'N/A' values.
     """
-    import re
     from collections import Counter
     
     if 'compare-grid' not in html:
         return html
     
     # Find each compare-grid block
-    grid_open_re = re.compile(r'<div\s+class="compare-grid">', re.IGNORECASE)
-    row_re = re.compile(
-        r'<div\s+class="compare-row">\s*<span\s+class="k">(.*?)</span>\s*<span\s+class="v">(.*?)</span>\s*</div>',
-        re.DOTALL | re.IGNORECASE
-    )
-    card_open_re = re.compile(r'<div\s+class="compare-card(\s[^"]*)?">', re.IGNORECASE)
+    row_re = _COMPARE_ROW_RE
+    card_open_re = _CARD_OPEN_RE
     
     result = html
-    for grid_match in list(grid_open_re.finditer(html)):
+    for grid_match in list(_GRID_OPEN_RE.finditer(html)):
         grid_start = grid_match.start()
-        # Find the end of this grid: count div depth
+        # Find the end of this grid: count div depth, jumping from tag to tag
+        # (the old char-by-char scan sliced the string at every position)
         depth = 0
-        pos = grid_start
         grid_end = None
-        while pos < len(html):
-            open_m = re.match(r'<div[\s>]', html[pos:], re.IGNORECASE)
-            close_m = re.match(r'</div>', html[pos:], re.IGNORECASE)
-            if open_m:
+        for tag in _DIV_TAG_RE.finditer(html, grid_start):
+            if tag.group(1):
                 depth += 1
-                pos += open_m.end()
-            elif close_m:
+            else:
                 depth -= 1
                 if depth == 0:
-                    grid_end = pos + close_m.end()
+                    grid_end = tag.end()
                     break
-                pos += close_m.end()
-            else:
-                pos += 1
         
         if grid_end is None:
             continue
@@ -749,8 +781,8 @@ def _normalize_compare_rows(html: str) -> str:
             rows = row_re.findall(card_html)  # list of (label, value) tuples
             
             # Extract badge and name
-            badge_m = re.search(r'<div\s+class="compare-badge">(.*?)</div>', card_html, re.IGNORECASE)
-            name_m = re.search(r'<div\s+class="compare-card-name">(.*?)</div>', card_html, re.IGNORECASE)
+            badge_m = _CARD_BADGE_RE.search(card_html)
+            name_m = _CARD_NAME_RE.search(card_html)
             
             cards_data.append({
                 'css': css_class,
@@ -797,6 +829,80 @@ def _normalize_compare_rows(html: str) -> str:
     return result
 
 
+# ── Pipeline ───────────────────────────────────────────────────────────
+# Markers that gate the passes below. The document is scanned for all of them
+# in one go and only re-scanned after a pass actually changed the HTML, so
+# passes whose trigger text is absent are skipped without touching the string.
+_MARKER_RE = re.compile(r'compare-grid|compare-card|approx|cny|rmb|<p>|<li>', re.IGNORECASE)
+
+
+class _Document:
+    """HTML buffer shared by the pipeline passes, with its cached marker set."""
+
+    def __init__(self, html: str):
+        self.html = html
+        self._markers = None
+
+    @property
+    def markers(self) -> set:
+        if self._markers is None:
+            self._markers = {m.lower() for m in _MARKER_RE.findall(self.html)}
+        return self._markers
+
+    def update(self, html: str):
+        if html is not self.html and html != self.html:
+            self.html = html
+            self._markers = None
+
+
+# (name, pass, markers) — a pass with markers runs only if one of them is
+# present (matched case-insensitively, a superset of what the pass needs).
+_PIPELINE = (
+    ('repair_compare_grid', _repair_compare_grid, ('compare-grid',)),       # Fix malformed structure first
+    ('normalize_compare_rows', _normalize_compare_rows, ('compare-grid',)), # Identical row labels per card
+    ('ensure_html_only', ensure_html_only, ()),
+    ('clean_banned_phrases', clean_banned_phrases, ()),
+    ('reduce_repetition', _reduce_repetition, ('<p>', '<li>')),
+    ('validate_prices', _validate_prices, ('approx', 'cny', 'rmb')),
+    ('detect_duplicate_paragraphs', _detect_duplicate_paragraphs, ('<p>',)),
+    ('check_self_consistency', _check_self_consistency, ()),
+    ('shorten_car_names', _shorten_car_names, ()),
+    ('clean_source_typos', _clean_source_typos, ()),
+    ('strip_empty_compare_cards', _strip_empty_compare_cards, ('compare-card',)),
+)
+
+
+def _run_pipeline(html: str, allowed_competitor_makes: list[str] | None = None,
+                  gated: bool = True, timings: dict | None = None) -> str:
+    """
+    Run every pass of `_PIPELINE` over one shared document.
+
+    Args:
+        gated: Skip passes whose markers are absent. ``False`` runs every pass
+            unconditionally (reference mode used by the benchmark).
+        timings: Optional dict accumulating seconds spent per pass name.
+    """
+    passes = _PIPELINE
+    if allowed_competitor_makes:
+        passes += ((
+            'strip_hallucinated_compare_cards',
+            lambda h: _strip_hallucinated_compare_cards(h, allowed_competitor_makes),
+            ('compare-grid',),
+        ),)
+
+    doc = _Document(html)
+    for name, rule, markers in passes:
+        if gated and markers and doc.markers.isdisjoint(markers):
+            continue
+        if timings is None:
+            doc.update(rule(doc.html))
+            continue
+        started = time.perf_counter()
+        doc.update(rule(doc.html))
+        timings[name] = timings.get(name, 0.0) + time.perf_counter() - started
+    return doc.html
+
+
 def post_process_article(html: str, allowed_competitor_makes: list[str] | None = None) -> str:
 
     """
@@ -815,17 +921,4 @@ def post_process_article(html: str, allowed_competitor_makes: list[str] | None =
 
     This is the single entry-point for callers (RSS generate, merge, publisher, etc.)
     """
-    html = _repair_compare_grid(html)   # Fix malformed compare-grid structure first
-    html = _normalize_compare_rows(html) # Ensure all cards have identical row labels
-    html = ensure_html_only(html)
-    html = clean_banned_phrases(html)
-    html = _reduce_repetition(html)
-    html = _validate_prices(html)
-    html = _detect_duplicate_paragraphs(html)
-    html = _check_self_consistency(html)
-    html = _shorten_car_names(html)
-    html = _clean_source_typos(html)
-    html = _strip_empty_compare_cards(html)
-    if allowed_competitor_makes:
-        html = _strip_hallucinated_compare_cards(html, allowed_competitor_makes)
-    return html
+    return _run_pipeline(html, allowed_competitor_makes)
@@ -8,6 +8,8 @@ in post-processing.
 import re
 import logging
 
+from ai_engine.modules.phrase_matcher import RegexRuleSet
+
 logger = logging.getLogger(__name__)
 
 
@@ -185,6 +187,74 @@ _BANNED_INLINE_REPLACEMENTS = [
 ]
 
 
+# Each rule is keyed by a literal it cannot match without ("paradigm",
+# "bombshell", ...). One automaton pass finds which anchors occur, so only the
+# handful of rules that can fire are run — in their original order.
+_BANNED_INLINE_RULES = RegexRuleSet(_BANNED_INLINE_REPLACEMENTS)
+
+_ALT_TEXTS_DIV_RE = re.compile(r'<div\s+class="alt-texts"[^>]*>.*?</div>', re.DOTALL | re.IGNORECASE)
+_ALT_TEXT_LINE_RE = re.compile(r'(?:^|\n)\s*ALT_TEXT_\d+:.*?(?:\n|$)')
+_SEO_ASSETS_P_RE = re.compile(r'<p>\s*(?:<strong>)?SEO Visual Assets:?(?:</strong>)?\s*</p>', re.IGNORECASE)
+_SEO_ASSETS_LINE_RE = re.compile(r'(?:^|\n)\s*SEO Visual Assets:?\s*(?:\n|$)', re.IGNORECASE)
+_BANNED_CONS_RE = re.compile(
+    r'<li>[^<]*(?:'
+    r'(?:are|is)\s+not\s+(?:fully\s+)?(?:detailed|specified|disclosed|confirmed|announced|yet\s+public|provided|available)'
+    r'|details?\s+(?:have\s+)?not\s+(?:yet\s+)?been\s+(?:released|confirmed|disclosed|provided)'
+    r'|(?:specific|full|complete)\s+[^<]*(?:not\s+(?:available|provided|disclosed|released|detailed))'
+    r'|not\s+yet\s+confirmed|remain\s+unknown|awaiting\s+(?:official\s+)?confirmation'
+    r')[^<]*</li>',
+    re.IGNORECASE
+)
+_SOURCE_LEAK_RE = re.compile(
+    r'<(p|li)>[^<]*(?:'
+    r'(?:not\s+)?(?:detailed|described|mentioned|covered|provided|available|specified|included)'
+    r'\s+in\s+(?:the\s+)?(?:provided\s+)?transcript'
+    r'|(?:in|from|based\s+on|as\s+(?:shown|mentioned|noted|discussed)\s+in)'
+    r'\s+(?:the\s+)?(?:video|transcript|footage|clip|source\s+material)'
+    r'|transcript\s+(?:mentions?|shows?|notes?|describes?|includes?|covers?|provides?)'
+    r'|according\s+to\s+(?:the\s+)?(?:video|transcript|reviewer|footage)'
+    r'|as\s+(?:shown|seen|demonstrated)\s+in\s+(?:the\s+)?(?:video|footage|clip)'
+    r'|from\s+(?:the\s+)?(?:youtube|video)\s+(?:review|footage|clip)'
+    r')[^<]*</(?:p|li)>',
+    re.IGNORECASE | re.DOTALL,
+)
+_EMPTY_P_RE = re.compile(r'<p>\s*</p>')
+_ORPHAN_HEADER_RE = re.compile(r'(<h[23][^>]*>[^<]+</h[23]>)\s*(?=<h[23])', re.IGNORECASE)
+_NOT_SPECIFIED_LINE_RE = re.compile(
+    r'(?m)^[ \t]*(?:▸\s*|•\s*)?[A-Z0-9 /()]+:\s*Not specified in web context\s*$\n?',
+    re.IGNORECASE,
+)
+_NOT_SPECIFIED_BLOCK_RE = re.compile(r'<(?:li|p)>[^<]*Not specified in web context[^<]*</(?:li|p)>', re.IGNORECASE)
+_RMB_RE = re.compile(r'\bRMB\b')
+_CNY_WITHOUT_USD_RE = re.compile(r'CNY\s+([\d,]+(?:\.\d+)?)(?!\s*(?:\(approx|\s*–|\s*to|\s*/|\s*\~))')
+
+
+def _inject_usd_approximations(html: str) -> str:
+    """Append '(approx. $X)' to CNY prices that have no USD conversion yet."""
+    if 'CNY' not in html:
+        return html  # Nothing to annotate — skip the currency rate lookup
+
+    # Get live CNY/USD rate from currency_service, fallback to approximate
+    try:
+        from ai_engine.modules.currency_service import get_cached_rates
+        cached = get_cached_rates()
+        cny_rate = cached['rates'].get('CNY', 7.25) if cached and cached.get('rates') else 7.25
+    except Exception:
+        cny_rate = 7.25
+
+    def _inject_usd(m):
+        amount_str = m.group(1).replace(',', '')
+        try:
+            cny = float(amount_str)
+            usd = round(cny / cny_rate / 1000) * 1000
+            usd_str = f'${usd:,.0f}'
+            return f"{m.group(0)} (approx. {usd_str})"
+        except ValueError:
+            return m.group(0)
+    # Only inject if '(approx.' not already present next to the price
+    return _CNY_WITHOUT_USD_RE.sub(_inject_usd, html)
+
+
 def clean_banned_phrases(html: str) -> str:
     """Remove or replace banned filler phrases that Gemini sometimes ignores."""
     original_len = len(html)
@@ -193,29 +263,19 @@ def clean_banned_phrases(html: str) -> str:
     html = _BANNED_SENTENCE_PATTERNS.sub('', html)
     
     # 2. Inline replacements for smaller phrases
-    for pattern, replacement in _BANNED_INLINE_REPLACEMENTS:
-        html = pattern.sub(replacement, html)
+    html, _ = _BANNED_INLINE_RULES.apply(html)
     
     # 3. Remove ALT_TEXT / SEO metadata that AI sometimes leaks into visible content
     # Remove entire hidden div block (when AI wraps it correctly)
-    html = re.sub(r'<div\s+class="alt-texts"[^>]*>.*?</div>', '', html, flags=re.DOTALL | re.IGNORECASE)
+    html = _ALT_TEXTS_DIV_RE.sub('', html)
     # Remove raw ALT_TEXT lines (when AI doesn't wrap them in a div)
-    html = re.sub(r'(?:^|\n)\s*ALT_TEXT_\d+:.*?(?:\n|$)', '\n', html)
+    html = _ALT_TEXT_LINE_RE.sub('\n', html)
     # Remove "SEO Visual Assets:" header
-    html = re.sub(r'<p>\s*(?:<strong>)?SEO Visual Assets:?(?:</strong>)?\s*</p>', '', html, flags=re.IGNORECASE)
-    html = re.sub(r'(?:^|\n)\s*SEO Visual Assets:?\s*(?:\n|$)', '\n', html, flags=re.IGNORECASE)
+    html = _SEO_ASSETS_P_RE.sub('', html)
+    html = _SEO_ASSETS_LINE_RE.sub('\n', html)
 
     # 3b. Remove <li> items that describe missing data (banned Cons in prompt)
-    _banned_cons_rx = re.compile(
-        r'<li>[^<]*(?:'
-        r'(?:are|is)\s+not\s+(?:fully\s+)?(?:detailed|specified|disclosed|confirmed|announced|yet\s+public|provided|available)'
-        r'|details?\s+(?:have\s+)?not\s+(?:yet\s+)?been\s+(?:released|confirmed|disclosed|provided)'
-        r'|(?:specific|full|complete)\s+[^<]*(?:not\s+(?:available|provided|disclosed|released|detailed))'
-        r'|not\s+yet\s+confirmed|remain\s+unknown|awaiting\s+(?:official\s+)?confirmation'
-        r')[^<]*</li>',
-        re.IGNORECASE
-    )
-    cleaned_cons = _banned_cons_rx.sub('', html)
+    cleaned_cons = _BANNED_CONS_RE.sub('', html)
     if cleaned_cons != html:
         removed_li = html.count('<li>') - cleaned_cons.count('<li>')
         print(f"  🧹 Removed {removed_li} invalid Cons items (missing-data phrases)")
@@ -223,80 +283,34 @@ def clean_banned_phrases(html: str) -> str:
 
     # 3c. Remove sentences/blocks that leak source format (transcript, video, YouTube, etc.)
     # These must NEVER appear in published articles — they signal AI-generated content to Google
-    _source_leak_rx = re.compile(
-        r'<(p|li)>[^<]*(?:'
-        r'(?:not\s+)?(?:detailed|described|mentioned|covered|provided|available|specified|included)'
-        r'\s+in\s+(?:the\s+)?(?:provided\s+)?transcript'
-        r'|(?:in|from|based\s+on|as\s+(?:shown|mentioned|noted|discussed)\s+in)'
-        r'\s+(?:the\s+)?(?:video|transcript|footage|clip|source\s+material)'
-        r'|transcript\s+(?:mentions?|shows?|notes?|describes?|includes?|covers?|provides?)'
-        r'|according\s+to\s+(?:the\s+)?(?:video|transcript|reviewer|footage)'
-        r'|as\s+(?:shown|seen|demonstrated)\s+in\s+(?:the\s+)?(?:video|footage|clip)'
-        r'|from\s+(?:the\s+)?(?:youtube|video)\s+(?:review|footage|clip)'
-        r')[^<]*</(?:p|li)>',
-        re.IGNORECASE | re.DOTALL,
-    )
-    cleaned_leaks = _source_leak_rx.sub('', html)
+    cleaned_leaks = _SOURCE_LEAK_RE.sub('', html)
     if cleaned_leaks != html:
         removed_leaks = html.count('<p>') + html.count('<li>') - cleaned_leaks.count('<p>') - cleaned_leaks.count('<li>')
         print(f"  🔒 Source leak cleanup: removed {removed_leaks} blocks mentioning transcript/video")
         html = cleaned_leaks
 
     # 4. Clean up empty paragraphs left behind
-    html = re.sub(r'<p>\s*</p>', '', html)
+    html = _EMPTY_P_RE.sub('', html)
 
     # 4b. Remove orphan section headers — h2/h3 with no content before next header
     # Happens when all <p> inside a section are stripped by banned-phrase filters
     # e.g. <h2>Driving Experience</h2><h2>Pricing & Availability</h2> → remove the empty one
-    html = re.sub(
-        r'(<h[23][^>]*>[^<]+</h[23]>)\s*(?=<h[23])',
-        '',
-        html,
-        flags=re.IGNORECASE,
-    )
+    html = _ORPHAN_HEADER_RE.sub('', html)
 
     # 5. Strip spec-table lines where value is 'Not specified in web context'
     #    Pattern: '▸ FIELD: Not specified in web context' (plain text lines inside <p> or bare)
-    _not_specified_rx = re.compile(
-        r'(?m)^[ \t]*(?:▸\s*|•\s*)?[A-Z0-9 /()]+:\s*Not specified in web context\s*$\n?',
-        re.IGNORECASE,
-    )
-    cleaned_spec = _not_specified_rx.sub('', html)
+    cleaned_spec = _NOT_SPECIFIED_LINE_RE.sub('', html)
     if cleaned_spec != html:
         print("  🧹 Spec-table cleaner: removed 'Not specified in web context' lines")
         html = cleaned_spec
     # Also remove inside <li> or <p> tags
-    html = re.sub(
-        r'<(?:li|p)>[^<]*Not specified in web context[^<]*</(?:li|p)>',
-        '', html, flags=re.IGNORECASE,
-    )
+    html = _NOT_SPECIFIED_BLOCK_RE.sub('', html)
 
     # 6. Currency normalisation:
     #    a) RMB → CNY
-    html = re.sub(r'\bRMB\b', 'CNY', html)
+    html = _RMB_RE.sub('CNY', html)
     #    b) If CNY price present but no USD approximation, add one
-    # Get live CNY/USD rate from currency_service, fallback to approximate
-    try:
-        from ai_engine.modules.currency_service import get_cached_rates
-        cached = get_cached_rates()
-        cny_rate = cached['rates'].get('CNY', 7.25) if cached and cached.get('rates') else 7.25
-    except Exception:
-        cny_rate = 7.25
-
-    def _inject_usd(m):
-        amount_str = m.group(1).replace(',', '')
-        try:
-            cny = float(amount_str)
-            usd = round(cny / cny_rate / 1000) * 1000
-            usd_str = f'${usd:,.0f}'
-            return f"{m.group(0)} (approx. {usd_str})"
-        except ValueError:
-            return m.group(0)
-    # Only inject if '(approx.' not already present next to the price
-    html = re.sub(
-        r'CNY\s+([\d,]+(?:\.\d+)?)(?!\s*(?:\(approx|\s*–|\s*to|\s*/|\s*\~))',
-        _inject_usd, html,
-    )
+    html = _inject_usd_approximations(html)
 
     cleaned = original_len - len(html)
     if cleaned > 0:
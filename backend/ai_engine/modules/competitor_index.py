@@ -0,0 +1,251 @@
+"""
+Competitor Index — in-memory candidate index behind competitor_lookup.
+
+Every usable VehicleSpecs row (make and model set) is packed into NumPy
+arrays once, in VehicleSpecs ordering, with row positions grouped per body
+type. The fallback cascade of get_competitor_context (body type → price band
+→ everything, then power and price narrowing) becomes boolean masks over
+those arrays instead of count() queries, and the candidate pool is the
+CANDIDATE_POOL nearest rows in a normalised feature space:
+
+    distance² = Σ weight · log(candidate / subject)²   over price, power, range, length
+
+Features the subject car does not provide are ignored, a candidate missing
+a feature the subject has counts as MISSING_RATIO off. With no subject
+features every distance is 0 and the pool is the first CANDIDATE_POOL rows,
+exactly like the old `[:50]` slice.
+
+Slow-moving ranking signals live in the index too:
+    engagement  — mean CompetitorPairLog.engagement_score_at_log per competitor
+    feedback    — mean ManualCompetitorFeedback.score per (subject, competitor)
+
+The index is rebuilt after INDEX_TTL, or when VehicleSpecs, editor feedback
+or scored pair logs change (news/cache_signals.py bumps a shared version,
+checked every VERSION_CHECK_SECONDS).
+
+Entry points:
+    get_competitor_index() → CompetitorIndex
+    invalidate(shared=True)
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import threading
+import time
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION_KEY = 'competitor_index:version'
+VERSION_CHECK_SECONDS = 30
+INDEX_TTL = 10 * 60
+
+CANDIDATE_POOL = 50
+# Feature weights in the nearest-neighbour distance
+FEATURE_WEIGHTS = {'price': 2.0, 'power': 1.0, 'range': 1.0, 'length': 1.0}
+# A candidate without a feature the subject has counts as this far off
+MISSING_RATIO = 2.0
+
+SPEC_FIELDS = (
+    'id', 'make', 'model_name', 'body_type', 'price_usd_from', 'power_hp',
+    'range_wltp', 'range_km', 'combined_range_km', 'battery_kwh',
+    'acceleration_0_100', 'length_mm',
+)
+
+
+def _log_feature(values):
+    """log(value) for positive values, NaN where missing."""
+    arr = np.array([v if v and v > 0 else np.nan for v in values], dtype=np.float64)
+    with np.errstate(invalid='ignore'):
+        return np.log(arr)
+
+
+class CompetitorIndex:
+    """VehicleSpecs candidates as arrays; see the module docstring."""
+
+    def __init__(self, rows, engagement=None, feedback=None):
+        self.ids = np.array([r[0] for r in rows], dtype=np.int64)
+        self.makes = [(r[1] or '').lower() for r in rows]
+        self.bodies = [(r[3] or '').lower() for r in rows]
+
+        # (make, model) lowercased → code; the subject and cooldown filters
+        # match on these like make__iexact & model_name__iexact
+        self.pair_codes = {}
+        self.pair = np.array(
+            [self.pair_codes.setdefault((m, (r[2] or '').lower()), len(self.pair_codes))
+             for m, r in zip(self.makes, rows)],
+            dtype=np.int64,
+        )
+        self.by_body = {}
+        for position, body in enumerate(self.bodies):
+            self.by_body.setdefault(body, []).append(position)
+        self.by_body = {body: np.array(positions, dtype=np.int64) for body, positions in self.by_body.items()}
+        self.all = np.arange(len(rows), dtype=np.int64)
+
+        # NaN = unknown, for the band filters (NULL never matches a range)
+        self.price = np.array([r[4] if r[4] is not None else np.nan for r in rows], dtype=np.float64)
+        self.power = np.array([r[5] if r[5] is not None else np.nan for r in rows], dtype=np.float64)
+
+        def has(value):
+            return 1 if value else 0
+
+        self.richness = np.array([
+            max(has(r[5]) + has(r[6] or r[7] or r[8]) + has(r[4]) + has(r[9]) + has(r[10]), 1)
+            for r in rows
+        ], dtype=np.float64)
+        self.features = {
+            'price': _log_feature(r[4] for r in rows),
+            'power': _log_feature(r[5] for r in rows),
+            'range': _log_feature(r[6] or r[7] or r[8] for r in rows),
+            'length': _log_feature(r[11] for r in rows),
+        }
+
+        # Mean engagement per row (NaN = no scored history)
+        by_code = np.full(len(self.pair_codes), np.nan)
+        for key, value in (engagement or {}).items():
+            code = self.pair_codes.get(key)
+            if code is not None:
+                by_code[code] = value
+        self.engagement = by_code[self.pair]
+        # subject (make, model) → {competitor pair code: mean editor score}
+        self.feedback = {}
+        for (subject, competitor), value in (feedback or {}).items():
+            code = self.pair_codes.get(competitor)
+            if code is not None:
+                self.feedback.setdefault(subject, {})[code] = value
+
+    def __len__(self):
+        return len(self.ids)
+
+    def code(self, make, model_name):
+        return self.pair_codes.get(((make or '').lower(), (model_name or '').lower()))
+
+    def in_band(self, positions, values, lo, hi):
+        """Positions whose value lies in [lo, hi] (unknown values never do)."""
+        v = values[positions]
+        with np.errstate(invalid='ignore'):
+            return positions[(v >= lo) & (v <= hi)]
+
+    def nearest(self, positions, subject, k=CANDIDATE_POOL):
+        """
+        The k positions closest to `subject` ({'price', 'power', 'range',
+        'length'} → value or None), returned in index order; ties go to
+        earlier positions.
+        """
+        if len(positions) <= k:
+            return positions
+        distance = np.zeros(len(positions))
+        missing = math.log(MISSING_RATIO) ** 2
+        for name, weight in FEATURE_WEIGHTS.items():
+            value = subject.get(name)
+            if not value or value <= 0:
+                continue
+            diff = (self.features[name][positions] - math.log(value)) ** 2
+            distance += weight * np.where(np.isnan(diff), missing, diff)
+        kth = np.partition(distance, k - 1)[k - 1]
+        closer = np.flatnonzero(distance < kth)
+        ties = np.flatnonzero(distance == kth)[:k - len(closer)]
+        return positions[np.sort(np.concatenate([closer, ties]))]
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Process-wide index
+# ═══════════════════════════════════════════════════════════════════
+
+_index = None
+_index_version = 0
+_index_built_at = 0.0
+_last_version_check = 0.0
+_index_lock = threading.Lock()
+
+
+def _shared_version():
+    try:
+        from django.core.cache import cache
+        return cache.get(INDEX_VERSION_KEY) or 0
+    except Exception:
+        return 0
+
+
+def _engagement_means():
+    """(make, model) lowercased → mean engagement of scored pair logs."""
+    from django.db.models import Count, Sum
+    from news.models.system import CompetitorPairLog
+
+    totals = {}
+    rows = (CompetitorPairLog.objects.filter(engagement_score_at_log__isnull=False)
+            .values('competitor_make', 'competitor_model')
+            .annotate(total=Sum('engagement_score_at_log'), n=Count('id')).order_by())
+    for row in rows:
+        key = (row['competitor_make'].lower(), row['competitor_model'].lower())
+        total, n = totals.get(key, (0.0, 0))
+        totals[key] = (total + row['total'], n + row['n'])
+    return {key: total / n for key, (total, n) in totals.items()}
+
+
+def _feedback_means():
+    """((subject make, model), (competitor make, model)) lowercased → mean editor score."""
+    from django.db.models import Count, Sum
+    from news.models.system import ManualCompetitorFeedback
+
+    totals = {}
+    rows = (ManualCompetitorFeedback.objects
+            .values('subject_make', 'subject_model', 'competitor_make', 'competitor_model')
+            .annotate(total=Sum('score'), n=Count('id')).order_by())
+    for row in rows:
+        key = ((row['subject_make'].lower(), (row['subject_model'] or '').lower()),
+               (row['competitor_make'].lower(), (row['competitor_model'] or '').lower()))
+        total, n = totals.get(key, (0.0, 0))
+        totals[key] = (total + row['total'], n + row['n'])
+    return {key: total / n for key, (total, n) in totals.items()}
+
+
+def _build_index():
+    from news.models.vehicles import VehicleSpecs
+
+    started = time.perf_counter()
+    rows = list(VehicleSpecs.objects.exclude(make='').exclude(model_name='').values_list(*SPEC_FIELDS))
+    index = CompetitorIndex(rows, _engagement_means(), _feedback_means())
+    logger.info(f"🏁 Competitor index: {len(index)} specs in {time.perf_counter() - started:.2f}s")
+    return index
+
+
+def get_competitor_index():
+    """Process-wide CompetitorIndex, rebuilt after INDEX_TTL or a shared version bump."""
+    global _index, _index_version, _index_built_at, _last_version_check
+    now = time.monotonic()
+    fresh = _index is not None and now - _index_built_at < INDEX_TTL
+    if fresh and now - _last_version_check < VERSION_CHECK_SECONDS:
+        return _index
+
+    version = _shared_version()
+    _last_version_check = now
+    if fresh and _index_version >= version:
+        return _index
+
+    with _index_lock:
+        if _index is None or now - _index_built_at >= INDEX_TTL or _index_version < version:
+            _index = _build_index()
+            _index_built_at = time.monotonic()
+        _index_version = version
+        return _index
+
+
+def invalidate(shared=True):
+    """
+    Drop this process's index and, unless ``shared=False``, bump the shared
+    version so other processes rebuild too.
+    """
+    global _index, _last_version_check
+    with _index_lock:
+        _index = None
+        _last_version_check = 0.0
+    if shared:
+        try:
+            from django.core.cache import cache
+            cache.set(INDEX_VERSION_KEY, time.time(), None)
+        except Exception:
+            pass
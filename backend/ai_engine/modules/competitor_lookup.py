@@ -2,12 +2,18 @@
 Competitor Lookup — finds relevant cars from the database to inject into article prompts.
 
 Two-phase approach:
-1. Rule-based: filter VehicleSpecs by same fuel_type + body_type, proximity of power/price
-2. ML-ranked: after enough data accumulates in CompetitorPairLog, sort candidates by
-   average engagement_score so well-performing competitor pairs surface first.
+1. Rule-based: filter VehicleSpecs by same body_type, proximity of power/price, then
+   keep the candidates nearest to the subject car (price, power, range, size)
+2. ML-ranked: after enough data accumulates in CompetitorPairLog, weight candidates by
+   average engagement_score so well-performing competitor pairs surface first;
+   editor scores from ManualCompetitorFeedback boost or veto specific pairings.
+
+Both phases run on the in-memory CompetitorIndex (competitor_index.py) — no
+per-step count() queries; only the cooldown check and the chosen rows hit the DB.
 
 Entry points:
-    get_competitor_context(make, model_name, fuel_type, body_type, power_hp, price_usd)
+    get_competitor_context(make, model_name, fuel_type, body_type, power_hp, price_usd,
+                           range_km=None, length_mm=None)
         → str: formatted block ready for prompt injection
         → empty string if no suitable competitors found (always safe to call)
 
@@ -25,6 +31,11 @@ from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+COOLDOWN_DAYS = 7
+COOLDOWN_MAX_APPEARANCES = 2
+# Mean editor score (ManualCompetitorFeedback) at or below which a pairing is never proposed
+FEEDBACK_REJECT_SCORE = -0.5
+
 
 # ─────────────────────────────────────────────────────────
 # Public: build competitor context string for the prompt
@@ -38,6 +49,8 @@ def get_competitor_context(
     power_hp: Optional[int] = None,
     price_usd: Optional[int] = None,
     max_competitors: int = 3,
+    range_km: Optional[int] = None,
+    length_mm: Optional[int] = None,
 ) -> tuple[str, list[dict]]:
     """
     Return (prompt_block, competitors_list) where:
@@ -45,219 +58,144 @@ def get_competitor_context(
         or empty string if no suitable competitors found.
       - competitors_list: list of dicts with raw competitor data for logging.
 
+    Candidates come from the in-memory CompetitorIndex (competitor_index.py);
+    range_km / length_mm only refine which candidates are nearest.
+
     Safe to call even if DB is empty — always returns ("", []) on any error.
     """
     try:
+        import numpy as np
         from news.models.vehicles import VehicleSpecs
-        from django.db.models import Avg, Count, Q
-        from news.models.system import CompetitorPairLog
+        from ai_engine.modules.competitor_index import get_competitor_index
+
+        index = get_competitor_index()
 
         # ── Step 1: candidate pool ───────────────────────────────────────────
-        qs = VehicleSpecs.objects.all()
+        # Index rows all have a make and model; exclude the subject car itself
+        subject_code = index.code(make, model_name) if make and model_name else None
 
-        # Exclude the subject car itself
-        if make and model_name:
-            qs = qs.exclude(
-                Q(make__iexact=make) & Q(model_name__iexact=model_name)
-            )
+        def _without_subject(positions):
+            if subject_code is None:
+                return positions
+            return positions[index.pair[positions] != subject_code]
 
-        # Must have at least a make and model to be useful
-        qs = qs.exclude(make="").exclude(model_name="")
+        everything = _without_subject(index.all)
 
         # ── Step 2: relevant segment filter ─────────────────────────────────
-        segment_qs = qs
-
         # Primary: body_type only — fuel_type was causing too many misses
         # because EREV/PHEV/Hybrid cars are stored inconsistently in DB.
         # Price proximity (Step 4) and body_type are reliable enough signals.
         if body_type:
-            segment_qs = segment_qs.filter(body_type__iexact=body_type)
-
-        count = segment_qs.count()
+            segment = _without_subject(index.by_body.get(body_type.lower(), index.all[:0]))
+        else:
+            segment = everything
 
         # Fallback hierarchy:
-        # 1. Same fuel + body (current segment_qs)
-        # 2. Same body (any fuel)
-        # 3. Same fuel (any body)
-        # 4. Same price range (±60%) regardless of fuel/body
-        # 5. All cars
-        if count < 2:
-            if body_type:
-                fallback_qs = qs.filter(body_type__iexact=body_type)
-                if fallback_qs.count() >= 2:
-                    segment_qs = fallback_qs
-                    count = segment_qs.count()
-            
-            # Fallback: price range (±60%) regardless of body type
+        # 1. Same body type (current segment)
+        # 2. Same price range (-60% / +70%) regardless of fuel/body
+        # 3. All cars
+        if len(segment) < 2:
             # Price-priority fallback: find ANY car in a similar price range
-            if count < 2 and price_usd and price_usd > 0:
+            if price_usd and price_usd > 0:
                 price_lo = int(price_usd * 0.4)
                 price_hi = int(price_usd * 1.7)
-                price_fallback = qs.filter(
-                    price_usd_from__gte=price_lo,
-                    price_usd_from__lte=price_hi,
-                )
-                if price_fallback.count() >= 2:
-                    segment_qs = price_fallback
-                    count = segment_qs.count()
+                price_fallback = index.in_band(everything, index.price, price_lo, price_hi)
+                if len(price_fallback) >= 2:
+                    segment = price_fallback
                     logger.info(
                         f"competitor_lookup: used price-priority fallback "
-                        f"(${price_lo:,}–${price_hi:,}), found {count} candidates"
+                        f"(${price_lo:,}–${price_hi:,}), found {len(segment)} candidates"
                     )
-            
-            if count < 2:
-                segment_qs = qs
+
+            if len(segment) < 2:
+                segment = everything
 
         # ── Step 3: power proximity filter (±60%) ───────────────────────────
         if power_hp and power_hp > 0:
-            lo = int(power_hp * 0.4)
-            hi = int(power_hp * 1.6)
-            power_qs = segment_qs.filter(
-                power_hp__gte=lo,
-                power_hp__lte=hi,
-            )
-            if power_qs.count() >= 2:
-                segment_qs = power_qs
+            power_pool = index.in_band(segment, index.power, int(power_hp * 0.4), int(power_hp * 1.6))
+            if len(power_pool) >= 2:
+                segment = power_pool
 
         # ── Step 4: price proximity filter (-20% / +25%) ──────────────────────────
         if price_usd and price_usd > 0:
-            lo = int(price_usd * 0.8)
-            hi = int(price_usd * 1.25)
-            price_qs = segment_qs.filter(price_usd_from__gte=lo, price_usd_from__lte=hi)
-            if price_qs.count() >= 2:
-                segment_qs = price_qs
+            price_pool = index.in_band(segment, index.price, int(price_usd * 0.8), int(price_usd * 1.25))
+            if len(price_pool) >= 2:
+                segment = price_pool
 
         # ── Step 5: Cooldown filter ──────────────────────────────────────────
         # Exclude competitors that appeared ≥2 times in the last 7 days.
         # This prevents the same car (e.g. Aito M7) from dominating every comparison.
-        COOLDOWN_DAYS = 7
-        COOLDOWN_MAX_APPEARANCES = 2
-
-        overused = set()  # (make_lower, model_lower) pairs on cooldown
-        try:
-            from django.utils import timezone as _tz
-            from datetime import timedelta
-            cutoff = _tz.now() - timedelta(days=COOLDOWN_DAYS)
-            recent_usage = (
-                CompetitorPairLog.objects
-                .filter(created_at__gte=cutoff)
-                .values('competitor_make', 'competitor_model')
-                .annotate(usage_count=Count('id'))
-                .filter(usage_count__gte=COOLDOWN_MAX_APPEARANCES)
-            )
-            for row in recent_usage:
-                pair = (row['competitor_make'].lower(), row['competitor_model'].lower())
-                overused.add(pair)
-                logger.info(
-                    f"competitor_lookup: cooldown — {row['competitor_make']} {row['competitor_model']} "
-                    f"used {row['usage_count']}x in last {COOLDOWN_DAYS} days, skipping"
-                )
-        except Exception as e:
-            logger.debug(f"competitor_lookup: cooldown check failed (non-fatal): {e}")
-
-        # Apply cooldown filter to segment queryset
-        if overused:
-            for make_l, model_l in overused:
-                segment_qs = segment_qs.exclude(
-                    Q(make__iexact=make_l) & Q(model_name__iexact=model_l)
-                )
+        overused = _overused_codes(index)
 
-        # ── Step 6: ML ranking ───────────────────────────────────────────────
-        # Annotate each candidate with its average engagement score from log history
-        # Candidates with no history get avg_engagement=None → sort them last
-        try:
-            pair_scores = (
-                CompetitorPairLog.objects
-                .filter(
-                    competitor_make__in=segment_qs.values_list('make', flat=True),
-                    engagement_score_at_log__isnull=False,
-                )
-                .values('competitor_make', 'competitor_model')
-                .annotate(
-                    avg_engagement=Avg('engagement_score_at_log'),
-                    pair_count=Count('id'),
-                )
-            )
-            # Build lookup: (make_lower, model_lower) → avg_engagement
-            score_map = {
-                (row['competitor_make'].lower(), row['competitor_model'].lower()): (
-                    row['avg_engagement'],
-                    row['pair_count'],
-                )
-                for row in pair_scores
-            }
-        except Exception:
-            score_map = {}
+        # Editors marked this pairing as a bad match (ManualCompetitorFeedback)
+        feedback = index.feedback.get(((make or '').lower(), (model_name or '').lower()), {})
+        rejected = {code for code, score in feedback.items() if score <= FEEDBACK_REJECT_SCORE}
 
-        # Convert to list for scoring
-        candidates = list(segment_qs.select_related('article')[:50])
+        if overused or rejected:
+            blocked = np.fromiter(overused | rejected, dtype=np.int64)
+            segment = segment[~np.isin(index.pair[segment], blocked)]
 
-        if not candidates:
+        # ── Step 6: nearest candidates ───────────────────────────────────────
+        candidates = index.nearest(segment, {
+            'price': price_usd, 'power': power_hp, 'range': range_km, 'length': length_mm,
+        })
+
+        if not len(candidates):
             return "", []
 
         import random
 
-        def _candidate_weight(v):
-            """Calculate selection weight: body match × engagement × price proximity × spec richness."""
-            key = (v.make.lower(), v.model_name.lower())
-            avg_eng, _ = score_map.get(key, (None, 0))
-
-            # Body type match bonus
-            body_bonus = 2.0 if (body_type and v.body_type
-                                  and v.body_type.lower() == body_type.lower()) else 1.0
-
-            # Engagement score (default 1.0 for unknown)
-            eng_weight = max(avg_eng, 0.1) if avg_eng is not None else 1.0
-
-            # Price proximity bonus (massive weight for very close price matches)
-            price_bonus = 1.0
-            if price_usd and price_usd > 0 and v.price_usd_from:
-                diff_pct = abs(v.price_usd_from - price_usd) / price_usd
-                if diff_pct <= 0.10:
-                    price_bonus = 3.0  # Within 10%
-                elif diff_pct <= 0.20:
-                    price_bonus = 2.0  # Within 20%
-
-            # Spec richness (1-5)
-            spec_richness = sum([
-                1 if v.power_hp else 0,
-                1 if v.range_wltp or v.range_km or v.combined_range_km else 0,
-                1 if v.price_usd_from else 0,
-                1 if v.battery_kwh else 0,
-                1 if v.acceleration_0_100 else 0,
-            ]) or 1  # minimum 1
-
-            return body_bonus * eng_weight * price_bonus * spec_richness
-
-        # ── Step 7: weighted random selection ────────────────────────────────
+        # ── Step 7: ML ranking weights ───────────────────────────────────────
+        # body match × engagement × price proximity × spec richness × editor feedback
+        body_bonus = np.array([
+            2.0 if body_type and index.bodies[c] == body_type.lower() else 1.0 for c in candidates
+        ])
+        # Engagement score (default 1.0 for unknown)
+        engagement = index.engagement[candidates]
+        eng_weight = np.where(np.isnan(engagement), 1.0, np.maximum(np.nan_to_num(engagement), 0.1))
+        # Price proximity bonus (massive weight for very close price matches)
+        price_bonus = np.ones(len(candidates))
+        if price_usd and price_usd > 0:
+            prices = index.price[candidates]
+            with np.errstate(invalid='ignore'):
+                diff_pct = np.abs(prices - price_usd) / price_usd
+                known = prices > 0
+                price_bonus[known & (diff_pct <= 0.20)] = 2.0   # Within 20%
+                price_bonus[known & (diff_pct <= 0.10)] = 3.0   # Within 10%
+        editor_bonus = np.array([1.0 + feedback.get(int(index.pair[c]), 0.0) for c in candidates])
+
+        weights = body_bonus * eng_weight * price_bonus * index.richness[candidates] * editor_bonus
+        weight_of = dict(zip(candidates.tolist(), weights.tolist()))
+
+        # ── Step 8: weighted random selection ────────────────────────────────
         # ALL slots are picked via weighted random sampling.
         # Enforce brand diversity: no two competitors from the same make.
         selected = []
         used_makes = set()
-        pool = list(candidates)
+        pool = candidates.tolist()
 
         for _ in range(max_competitors):
             # Filter pool by brand diversity
-            eligible = [c for c in pool if c.make.lower() not in used_makes]
+            eligible = [c for c in pool if index.makes[c] not in used_makes]
             if not eligible:
                 # Fallback: allow same brand, different model
-                eligible = [c for c in pool if c.id not in {s.id for s in selected}]
+                eligible = [c for c in pool if c not in selected]
             if not eligible:
                 break
 
-            weights = [_candidate_weight(c) for c in eligible]
-            total = sum(weights)
+            eligible_weights = [weight_of[c] for c in eligible]
+            total = sum(eligible_weights)
             if total == 0:
                 pick = random.choice(eligible)
             else:
                 # Weighted random selection
-                pick = random.choices(eligible, weights=weights, k=1)[0]
+                pick = random.choices(eligible, weights=eligible_weights, k=1)[0]
 
             selected.append(pick)
-            used_makes.add(pick.make.lower())
-            pool = [c for c in pool if c.id != pick.id]
+            used_makes.add(index.makes[pick])
+            pool = [c for c in pool if c != pick]
 
-        # ── Step 8: Hard price guard ──────────────────────────────────────────
+        # ── Step 9: Hard price guard ──────────────────────────────────────────
         # Even after all fallbacks, never return a competitor whose price is
         # wildly different from the subject car. This prevents nonsensical
         # comparisons (e.g. $22K SUV vs $43K luxury sedan).
@@ -267,8 +205,8 @@ def get_competitor_context(
             before_count = len(selected)
             selected = [
                 c for c in selected
-                if not c.price_usd_from  # keep cars with unknown price (benefit of doubt)
-                or (price_lo <= c.price_usd_from <= price_hi)
+                if not index.price[c] > 0  # keep cars with unknown price (benefit of doubt)
+                or (price_lo <= index.price[c] <= price_hi)
             ]
             removed = before_count - len(selected)
             if removed:
@@ -277,10 +215,14 @@ def get_competitor_context(
                     f"outside ${price_lo:,}–${price_hi:,} range"
                 )
 
+        # Full rows only for the chosen few (gone since the index was built → skipped)
+        specs = VehicleSpecs.objects.in_bulk([int(index.ids[c]) for c in selected])
+        selected = [specs[int(index.ids[c])] for c in selected if int(index.ids[c]) in specs]
+
         if not selected:
             return "", []
 
-        # ── Step 9: format for prompt ────────────────────────────────────────
+        # ── Step 10: format for prompt ───────────────────────────────────────
         lines = []
         competitors_data = []
         for v in selected:
@@ -303,6 +245,36 @@ def get_competitor_context(
         return "", []
 
 
+def _overused_codes(index) -> set:
+    """Index pair codes of competitors used COOLDOWN_MAX_APPEARANCES+ times recently."""
+    overused = set()
+    try:
+        from datetime import timedelta
+        from django.db.models import Count
+        from django.utils import timezone as _tz
+        from news.models.system import CompetitorPairLog
+
+        cutoff = _tz.now() - timedelta(days=COOLDOWN_DAYS)
+        recent_usage = (
+            CompetitorPairLog.objects
+            .filter(created_at__gte=cutoff)
+            .values('competitor_make', 'competitor_model')
+            .annotate(usage_count=Count('id'))
+            .filter(usage_count__gte=COOLDOWN_MAX_APPEARANCES)
+        )
+        for row in recent_usage:
+            code = index.code(row['competitor_make'], row['competitor_model'])
+            if code is not None:
+                overused.add(code)
+            logger.info(
+                f"competitor_lookup: cooldown — {row['competitor_make']} {row['competitor_model']} "
+                f"used {row['usage_count']}x in last {COOLDOWN_DAYS} days, skipping"
+            )
+    except Exception as e:
+        logger.debug(f"competitor_lookup: cooldown check failed (non-fatal): {e}")
+    return overused
+
+
 def _format_competitor_line(v) -> tuple[str, dict]:
     """Format a VehicleSpecs object → (prompt line, data dict for logging)."""
     parts = []
@@ -1161,6 +1161,18 @@ def detect_price_anomalies():
     return anomalies
 
 
+# Used by detect_brand until parent/child relationships exist in the Brand table
+_FALLBACK_SUB_BRANDS = {
+    'geely': ['ZEEKR', 'Smart'],
+    'saic': ['IM', 'Smart'],
+    'huawei': ['Avatr'],
+    'dongfeng': ['VOYAH'],
+    'great wall': ['GWM'],
+    'changan': ['Deepal', 'Avatr'],
+    'baic': ['ArcFox'],
+}
+
+
 def detect_brand(title: str, content: str = ''):
     """
     Detect car brand from article title and content.
@@ -1179,35 +1191,21 @@ def detect_brand(title: str, content: str = ''):
         dict: {brand: str, confidence: float, method: str} or None
     """
     # re already imported globally
-    from news.models import Brand, BrandAlias
+    from news.models import Brand
+    from ai_engine.modules.phrase_matcher import get_vocabulary
     
     text = f"{title} {title}".lower()  # Title weighted 2x
     
-    # Build sub-brand mappings from DB (parent → child brands)
-    # Falls back to hardcoded dict only if DB has no parent relationships
-    SUB_BRANDS = {}
-    parent_brands = Brand.objects.filter(
-        sub_brands__isnull=False
-    ).prefetch_related('sub_brands').distinct()
-    for parent in parent_brands:
-        SUB_BRANDS[parent.name.lower()] = [
-            sub.name for sub in parent.sub_brands.all()
-        ]
+    # Brand names, sub-brand mappings and aliases are compiled once per process
+    # and rebuilt when Brand/BrandAlias rows change (see phrase_matcher).
+    catalog = get_vocabulary('brands')
     
-    # Hardcoded fallback if DB has no parent relationships yet
-    if not SUB_BRANDS:
-        SUB_BRANDS = {
-            'geely': ['ZEEKR', 'Smart'],
-            'saic': ['IM', 'Smart'],
-            'huawei': ['Avatr'],
-            'dongfeng': ['VOYAH'],
-            'great wall': ['GWM'],
-            'changan': ['Deepal', 'Avatr'],
-            'baic': ['ArcFox'],
-        }
+    # Sub-brand mappings from DB (parent → child brands).
+    # Falls back to hardcoded dict only if DB has no parent relationships
+    SUB_BRANDS = catalog.sub_brands or _FALLBACK_SUB_BRANDS
     
     # Step 1: Load all known brands
-    brands = list(Brand.objects.values_list('name', flat=True))
+    brands = catalog.names
     if not brands:
         return None
     
@@ -1220,36 +1218,35 @@ def detect_brand(title: str, content: str = ''):
                     return {'brand': child, 'confidence': 0.95, 'method': 'sub_brand'}
     
     # Step 3: Direct brand match in title (highest confidence)
-    for brand in sorted(brands, key=len, reverse=True):  # Longest first
-        pattern = r'\b' + re.escape(brand) + r'\b'
-        if re.search(pattern, title, re.IGNORECASE):
-            return {'brand': brand, 'confidence': 1.0, 'method': 'exact_match'}
+    # One pass over the title; longest brand wins, ties by catalogue order
+    matches = catalog.matcher.find_all(title, overlapping=True)
+    if matches:
+        best = min(matches, key=lambda m: (m.start - m.end, m.value))
+        return {'brand': brands[best.value], 'confidence': 1.0, 'method': 'exact_match'}
     
     # Step 4: BrandAlias resolution
-    # Extract potential brand words from title (first 3 capitalized words)
-    title_words = title.split()
-    for i in range(min(4, len(title_words))):
-        word = title_words[i].strip('.,:-–')
-        if len(word) < 2:
-            continue
-        resolved = BrandAlias.resolve(word)
-        if resolved and resolved != word:
-            # Alias matched → find the brand
-            brand_match = Brand.objects.filter(name__iexact=resolved).first()
-            if brand_match:
-                return {'brand': brand_match.name, 'confidence': 0.9, 'method': 'alias'}
-        # Also try 2-word combos (e.g. "DongFeng VOYAH")
-        if i + 1 < len(title_words):
-            combo = f"{word} {title_words[i+1].strip('.,:-–')}"
-            resolved = BrandAlias.resolve(combo)
-            if resolved and resolved != combo:
-                brand_match = Brand.objects.filter(name__iexact=resolved).first()
-                if brand_match:
-                    return {'brand': brand_match.name, 'confidence': 0.9, 'method': 'alias_combo'}
+    # Look for alias phrases among the first 4 title words (single words and
+    # 2-word combos such as "DongFeng VOYAH"); at each word the single-word
+    # alias is tried before the combo.
+    words = [m for m in re.finditer(r'\S+', title)][:5]
+    window_end = words[4].start() if len(words) == 5 else len(title)
+    alias_matches = sorted(
+        (m for m in catalog.alias_matcher.find_all(title, overlapping=True)
+         if m.start < window_end and len(m.phrase) >= 2),
+        key=lambda m: (m.start, m.end),
+    )
+    for match in alias_matches:
+        resolved = match.value
+        if resolved == title[match.start:match.end]:
+            continue  # alias maps onto itself
+        brand_name = catalog.by_lower.get(resolved.lower())
+        if brand_name:
+            method = 'alias_combo' if ' ' in match.phrase else 'alias'
+            return {'brand': brand_name, 'confidence': 0.9, 'method': method}
     
     # Step 5: Case-insensitive partial match (lower confidence)
-    for brand in brands:
-        if brand.lower() in text:
+    for brand, brand_lower in zip(brands, catalog.names_lower):
+        if brand_lower in text:
             return {'brand': brand, 'confidence': 0.7, 'method': 'partial_match'}
     
     # Step 6: TF-IDF fallback — compare article text to brand corpus
@@ -32,6 +32,109 @@ except ImportError:
 # FFmpeg path (empty on production Linux)
 FFMPEG_PATH = os.getenv('FFMPEG_PATH', '')
 
+# YouTube thumbnail fetching (i.ytimg.com)
+THUMBNAIL_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'image/webp,image/apng,image/*,*/*;q=0.8',
+}
+THUMBNAIL_WORKERS = 6
+MIN_THUMBNAIL_BYTES = 5000
+MIN_THUMBNAIL_WIDTH = 320
+
+# JPEG start-of-frame markers (carry the image size); C4/C8/CC are other segments
+_JPEG_SOF = {0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF}
+
+
+def image_dimensions(data):
+    """
+    (width, height) read from the image header, without decoding pixels:
+    JPEG frame headers are parsed directly, other formats go through
+    Pillow's lazy open. None when the bytes aren't a readable image.
+    """
+    if data[:2] == b'\xff\xd8':
+        i = 2
+        while i + 9 < len(data):
+            if data[i] != 0xFF:
+                i += 1
+                continue
+            marker = data[i + 1]
+            if marker == 0xFF:  # fill byte
+                i += 1
+            elif marker == 0x01 or 0xD0 <= marker <= 0xD8:  # markers without a length
+                i += 2
+            elif marker in _JPEG_SOF:
+                height = int.from_bytes(data[i + 5:i + 7], 'big')
+                width = int.from_bytes(data[i + 7:i + 9], 'big')
+                return width, height
+            else:
+                i += 2 + int.from_bytes(data[i + 2:i + 4], 'big')
+        return None
+    try:
+        from PIL import Image
+        from io import BytesIO
+        return Image.open(BytesIO(data)).size
+    except Exception:
+        return None
+
+
+def fetch_best_variants(slots, min_bytes=MIN_THUMBNAIL_BYTES, min_width=MIN_THUMBNAIL_WIDTH):
+    """
+    For each slot — a list of URL variants, best first — find the first
+    variant that is a usable image (over `min_bytes`, at least `min_width`
+    wide). Every variant of every slot is requested at once over the
+    pooled web_fetch session (first choices queued first), and a slot's
+    worse variants are cancelled or skipped once a better one succeeds, so
+    the whole set costs roughly one round trip.
+
+    Returns, per slot, (url, content, (width, height)) or None.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    import threading
+    from ai_engine.modules import web_fetch
+
+    best_rank = [len(urls) for urls in slots]  # best successful variant per slot so far
+    futures = [[None] * len(urls) for urls in slots]
+    lock = threading.Lock()
+
+    def probe(slot, rank, url):
+        if best_rank[slot] < rank:  # a better variant already won
+            return None
+        response = web_fetch.get(url, timeout=15, headers=THUMBNAIL_HEADERS, retries=0)
+        if response.status_code != 200 or len(response.content) <= min_bytes:
+            return None
+        size = image_dimensions(response.content)
+        if not size or size[0] < min_width:
+            return None
+        with lock:
+            if rank < best_rank[slot]:
+                best_rank[slot] = rank
+                for worse in futures[slot][rank + 1:]:
+                    if worse is not None:
+                        worse.cancel()
+        return url, response.content, size
+
+    with ThreadPoolExecutor(max_workers=THUMBNAIL_WORKERS, thread_name_prefix='thumbnails') as pool:
+        for rank in range(max((len(urls) for urls in slots), default=0)):
+            for slot, urls in enumerate(slots):
+                if rank < len(urls):
+                    with lock:
+                        futures[slot][rank] = pool.submit(probe, slot, rank, urls[rank])
+
+    results = []
+    for slot_futures in futures:
+        found = None
+        for future in slot_futures:
+            if future.cancelled():
+                continue
+            try:
+                found = future.result()
+            except Exception:
+                found = None
+            if found:
+                break
+        results.append(found)
+    return results
+
 
 @retry_on_failure(max_retries=3, delay=10, exceptions=(Exception,))
 def download_audio_and_thumbnail(youtube_url):
@@ -130,45 +233,35 @@ def extract_video_screenshots(youtube_url, output_dir=None, count=6):
         print("⚠️ Could not extract video ID from URL")
         return []
 
-    import requests
-    from PIL import Image
-    from io import BytesIO
-
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-        'Accept': 'image/webp,image/apng,image/*,*/*;q=0.8',
-    }
-
-    def _download_best(url_variants, output_path, label="image"):
-        """Try URL variants in order, return path if successful."""
-        for url in url_variants:
-            try:
-                response = requests.get(url, timeout=15, headers=headers)
-                content_length = len(response.content)
-                variant_name = url.split('/')[-1]
-
-                if response.status_code == 200 and content_length > 5000:
-                    img = Image.open(BytesIO(response.content))
-                    width, height = img.size
-                    if width >= 320:  # Minimum usable width
-                        with open(output_path, 'wb') as f:
-                            f.write(response.content)
-                        print(f"  ✓ {label}: {variant_name} → {width}x{height} ({content_length//1024}KB)")
-                        return output_path
-            except Exception:
-                continue
-        return None
+    def _save(found, output_path, label):
+        """Write the winning variant of a slot; return its path."""
+        if not found:
+            return None
+        url, content, (width, height) = found
+        with open(output_path, 'wb') as f:
+            f.write(content)
+        print(f"  ✓ {label}: {url.split('/')[-1]} → {width}x{height} ({len(content)//1024}KB)")
+        return output_path
 
     thumbnails = []
-    seen_sizes = set()  # Track file sizes to detect duplicates
+    seen_sizes = set()  # Same file size = same JPEG (fallback for unhashable images)
+    try:
+        from news.image_hashing import NearDuplicateFilter
+        near_duplicates = NearDuplicateFilter()
+    except ImportError:
+        near_duplicates = None
 
     def _add_if_unique(path, label):
-        """Add image to list if not a duplicate (by file size)."""
+        """Add image to list unless it duplicates one already kept (same size or near-identical picture)."""
         if not path:
             return False
         file_size = os.path.getsize(path)
-        if file_size in seen_sizes:
-            print(f"  ⚠️ {label} is duplicate (same size), skipping")
+        duplicate = file_size in seen_sizes
+        if not duplicate and near_duplicates is not None:
+            with open(path, 'rb') as f:
+                duplicate = near_duplicates.is_duplicate(f.read())
+        if duplicate:
+            print(f"  ⚠️ {label} is a duplicate of an earlier thumbnail, skipping")
             try:
                 os.remove(path)
             except OSError:
@@ -178,40 +271,38 @@ def extract_video_screenshots(youtube_url, output_dir=None, count=6):
         thumbnails.append(path)
         return True
 
-    # ── 1. Main cover thumbnail ──
     print(f"📸 Downloading YouTube thumbnails for {video_id}...")
-    cover_path = os.path.join(output_dir, f"{video_id}_cover.jpg")
-    cover_urls = [
+    slots = []  # (label, output path, URL variants best first)
+
+    # ── 1. Main cover thumbnail ──
+    slots.append(("Cover", os.path.join(output_dir, f"{video_id}_cover.jpg"), [
         f"https://i.ytimg.com/vi/{video_id}/maxresdefault.jpg",
         f"https://i.ytimg.com/vi/{video_id}/sddefault.jpg",
         f"https://i.ytimg.com/vi/{video_id}/hqdefault.jpg",
-    ]
-    result = _download_best(cover_urls, cover_path, "Cover")
-    _add_if_unique(result, "Cover")
+    ]))
 
     # ── 2. High-res frame captures (unique frames from the video!) ──
     # YouTube auto-generates 3 frames at ~25%, ~50%, ~75% of the video.
     for frame_num in range(1, 4):
-        frame_path = os.path.join(output_dir, f"{video_id}_frame_{frame_num}.jpg")
-        frame_urls = [
+        slots.append((f"Frame {frame_num}", os.path.join(output_dir, f"{video_id}_frame_{frame_num}.jpg"), [
             f"https://i.ytimg.com/vi/{video_id}/maxres{frame_num}.jpg",
             f"https://i.ytimg.com/vi/{video_id}/sd{frame_num}.jpg",
             f"https://i.ytimg.com/vi/{video_id}/hq{frame_num}.jpg",
-        ]
-        result = _download_best(frame_urls, frame_path, f"Frame {frame_num}")
-        _add_if_unique(result, f"Frame {frame_num}")
+        ]))
 
     # ── 3. Standard-resolution thumbnails (additional angles/moments) ──
     # YouTube provides 0.jpg, 1.jpg, 2.jpg, 3.jpg at different video positions
     for std_num in range(4):
+        slots.append((f"Standard {std_num}", os.path.join(output_dir, f"{video_id}_std_{std_num}.jpg"), [
+            f"https://i.ytimg.com/vi/{video_id}/{std_num}.jpg",
+        ]))
+
+    # All slots are fetched together; keep them in order, up to 7 images
+    found = fetch_best_variants([urls for _, _, urls in slots])
+    for (label, path, _), best in zip(slots, found):
         if len(thumbnails) >= 7:  # Max 7 images total
             break
-        std_path = os.path.join(output_dir, f"{video_id}_std_{std_num}.jpg")
-        std_urls = [
-            f"https://i.ytimg.com/vi/{video_id}/{std_num}.jpg",
-        ]
-        result = _download_best(std_urls, std_path, f"Standard {std_num}")
-        _add_if_unique(result, f"Standard {std_num}")
+        _add_if_unique(_save(best, path, label), label)
 
     if thumbnails:
         print(f"✓ Downloaded {len(thumbnails)} unique thumbnails (1 cover + {len(thumbnails)-1} frames)")
@@ -354,8 +445,6 @@ def get_youtube_thumbnails(youtube_url, output_dir=None, count=3):
         output_dir: Directory to save thumbnails (optional, defaults to TRANSCRIPTS_DIR)
         count: Number of thumbnails to download
     """
-    import urllib.request
-    
     if output_dir is None:
         output_dir = TRANSCRIPTS_DIR
     
@@ -376,18 +465,19 @@ def get_youtube_thumbnails(youtube_url, output_dir=None, count=3):
     
     downloaded = []
     
-    for i, url in enumerate(thumbnail_urls[:count + 3]):  # Try a few extra in case some fail
+    # Try a few extra in case some fail — all at once, each URL its own slot
+    candidates = thumbnail_urls[:count + 3]
+    found = fetch_best_variants([[url] for url in candidates], min_bytes=1000, min_width=0)
+    for i, best in enumerate(found):
         if len(downloaded) >= count:
             break
-            
-        output_path = os.path.join(output_dir, f"{video_id}_thumb_{i+1}.jpg")
+        if not best:
+            continue  # Some thumbnails may not exist
         
-        try:
-            urllib.request.urlretrieve(url, output_path)
-            if os.path.exists(output_path) and os.path.getsize(output_path) > 1000:
-                downloaded.append(output_path)
-                print(f"  ✓ Downloaded thumbnail {len(downloaded)}")
-        except Exception as e:
-            pass  # Some thumbnails may not exist
+        output_path = os.path.join(output_dir, f"{video_id}_thumb_{i+1}.jpg")
+        with open(output_path, 'wb') as f:
+            f.write(best[1])
+        downloaded.append(output_path)
+        print(f"  ✓ Downloaded thumbnail {len(downloaded)}")
     
     return downloaded
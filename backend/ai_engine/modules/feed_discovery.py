@@ -10,6 +10,8 @@ import re
 import requests
 from urllib.parse import urlparse, urljoin
 
+from ai_engine.modules import web_fetch
+
 logger = logging.getLogger(__name__)
 
 HEADERS = {
@@ -219,7 +221,7 @@ def discover_feeds(check_license: bool = True) -> list:
 def _auto_detect_rss(website_url: str) -> str | None:
     """Auto-detect RSS feed from a website's HTML."""
     try:
-        resp = requests.get(website_url, timeout=10, headers=HEADERS, allow_redirects=True)
+        resp = web_fetch.get(website_url, timeout=10, headers=HEADERS, allow_redirects=True)
         if resp.status_code != 200:
             return None
         
@@ -243,7 +245,7 @@ def _auto_detect_rss(website_url: str) -> str | None:
         for path in common_paths:
             try:
                 test_url = urljoin(website_url, path)
-                test_resp = requests.get(test_url, timeout=5, headers={
+                test_resp = web_fetch.get(test_url, timeout=5, retries=0, headers={
                     'User-Agent': HEADERS['User-Agent'],
                     'Accept': 'application/rss+xml, application/xml, text/xml, */*',
                 })
@@ -266,7 +268,7 @@ def _validate_feed(feed_url: str) -> dict:
     try:
         import feedparser
         
-        resp = requests.get(feed_url, timeout=10, headers={
+        resp = web_fetch.get(feed_url, timeout=10, headers={
             'User-Agent': 'FreshMotors RSS Reader/1.0',
             'Accept': 'application/rss+xml, application/xml, text/xml, */*',
         })
@@ -332,7 +334,7 @@ def find_feed_by_url(url: str) -> dict:
     
     # First check if the URL itself is an RSS feed
     try:
-        resp = requests.get(url, timeout=10, headers={
+        resp = web_fetch.get(url, timeout=10, headers={
             'User-Agent': HEADERS['User-Agent'],
             'Accept': 'application/rss+xml, application/xml, text/xml, */*',
         })
@@ -470,7 +472,7 @@ def search_feeds_by_keyword(query: str, max_results: int = 10) -> list:
         
         # Check if URL itself is an RSS feed
         try:
-            resp = requests.get(url, timeout=8, headers={
+            resp = web_fetch.get(url, timeout=8, headers={
                 'User-Agent': HEADERS['User-Agent'],
                 'Accept': 'application/rss+xml, application/xml, text/xml, */*',
             })
@@ -12,6 +12,18 @@ except ImportError:
     from modules.utils import clean_html_markup
 
 
+_BOLD_ITALIC_RE = re.compile(r'\*\*\*(.*?)\*\*\*')
+_BOLD_RE = re.compile(r'\*\*(.*?)\*\*')
+_ITALIC_RE = re.compile(r'(?<![\\\s<>/])\*([^*\n]+?)\*(?![\\>/])')
+_H3_MD_RE = re.compile(r'^###\s+(.*)$', re.MULTILINE)
+_H2_MD_RE = re.compile(r'^##\s+(.*)$', re.MULTILINE)
+_H1_MD_RE = re.compile(r'^#\s+(.*)$', re.MULTILINE)
+_MD_LIST_LINE_RE = re.compile(r'^\s*[\*\-]\s+', re.MULTILINE)
+_MD_LIST_ITEM_RE = re.compile(r'^[\*\-]\s+(.+)')
+_MD_BULLET_RE = re.compile(r'^[\*\-]\s+')
+_CODE_FENCE_RE = re.compile(r'```[a-z]*\n?')
+
+
 def ensure_html_only(content):
     """
     Ensures the content is properly formatted HTML.
@@ -24,27 +36,29 @@ def ensure_html_only(content):
 
     # Step 1: Always clean markdown bold/italic remnants, even in otherwise-HTML content
     # Order matters: handle *** before ** before *
-    content = re.sub(r'\*\*\*(.*?)\*\*\*', r'<strong><em>\1</em></strong>', content)
-    content = re.sub(r'\*\*(.*?)\*\*', r'<strong>\1</strong>', content)
-    content = re.sub(r'(?<![\\\s<>/])\*([^*\n]+?)\*(?![\\>/])', r'<em>\1</em>', content)
+    if '*' in content:
+        content = _BOLD_ITALIC_RE.sub(r'<strong><em>\1</em></strong>', content)
+        content = _BOLD_RE.sub(r'<strong>\1</strong>', content)
+        content = _ITALIC_RE.sub(r'<em>\1</em>', content)
 
     # Step 2: Convert markdown headings (## / ###) if present
-    content = re.sub(r'^###\s+(.*)$', r'<h3>\1</h3>', content, flags=re.MULTILINE)
-    content = re.sub(r'^##\s+(.*)$', r'<h2>\1</h2>', content, flags=re.MULTILINE)
-    content = re.sub(r'^#\s+(.*)$', r'<h2>\1</h2>', content, flags=re.MULTILINE)
+    if '#' in content:
+        content = _H3_MD_RE.sub(r'<h3>\1</h3>', content)
+        content = _H2_MD_RE.sub(r'<h2>\1</h2>', content)
+        content = _H1_MD_RE.sub(r'<h2>\1</h2>', content)
 
     # Step 3: Convert markdown lists (* item, - item) to HTML <ul><li>
     # Process line by line to properly group consecutive list items
-    has_md_lists = bool(re.search(r'^\s*[\*\-]\s+', content, re.MULTILINE))
+    has_md_lists = bool(_MD_LIST_LINE_RE.search(content))
     if has_md_lists and '<li>' not in content:
         lines = content.split('\n')
         result_lines = []
         in_list = False
         for line in lines:
             stripped = line.strip()
-            is_list_item = bool(re.match(r'^[\*\-]\s+(.+)', stripped))
+            is_list_item = bool(_MD_LIST_ITEM_RE.match(stripped))
             if is_list_item:
-                item_text = re.sub(r'^[\*\-]\s+', '', stripped)
+                item_text = _MD_BULLET_RE.sub('', stripped)
                 if not in_list:
                     result_lines.append('<ul>')
                     in_list = True
@@ -73,7 +87,8 @@ def ensure_html_only(content):
         content = '\n\n'.join(new_blocks)
 
     # Step 5: Clean up backticks
-    content = re.sub(r'```[a-z]*\n?', '', content)
-    content = re.sub(r'```', '', content)
+    if '```' in content:
+        content = _CODE_FENCE_RE.sub('', content)
+        content = content.replace('```', '')
 
     return clean_html_markup(content)
@@ -15,6 +15,8 @@ import re
 import requests
 from urllib.parse import urlparse, urljoin
 
+from ai_engine.modules import web_fetch
+
 logger = logging.getLogger(__name__)
 
 # Common paths where Terms of Use pages are found
@@ -236,7 +238,7 @@ def _check_robots_txt(base_url: str) -> dict:
     robots_url = f"{base_url}/robots.txt"
     
     try:
-        resp = requests.get(robots_url, timeout=10, headers=HEADERS)
+        resp = web_fetch.get(robots_url, timeout=10, headers=HEADERS, ttl=86400)
         if resp.status_code != 200:
             return {'status': 'green', 'summary': 'No robots.txt (no restrictions)'}
         
@@ -293,7 +295,8 @@ def _find_tos_page(base_url: str) -> dict:
     for path in TOS_PATHS:
         url = urljoin(base_url, path)
         try:
-            resp = requests.get(url, timeout=8, headers=HEADERS, allow_redirects=True)
+            # Guessed paths: a miss is common, so don't retry it
+            resp = web_fetch.get(url, timeout=8, headers=HEADERS, allow_redirects=True, retries=0)
             if resp.status_code == 200 and len(resp.text) > 500:
                 lower_text = resp.text.lower()
                 # Skip soft 404 pages
@@ -306,7 +309,7 @@ def _find_tos_page(base_url: str) -> dict:
     
     # Method 2: Scrape homepage for ToS links in footer
     try:
-        resp = requests.get(base_url, timeout=10, headers=HEADERS, allow_redirects=True)
+        resp = web_fetch.get(base_url, timeout=10, headers=HEADERS, allow_redirects=True)
         if resp.status_code == 200:
             # Find links with terms/legal/copyright in href or text
             link_pattern = re.compile(
@@ -324,7 +327,7 @@ def _find_tos_page(base_url: str) -> dict:
                     continue
                 
                 try:
-                    tos_resp = requests.get(tos_url, timeout=8, headers=HEADERS, allow_redirects=True)
+                    tos_resp = web_fetch.get(tos_url, timeout=8, headers=HEADERS, allow_redirects=True)
                     if tos_resp.status_code == 200:
                         text = _strip_html(tos_resp.text)
                         if len(text) > 200:
@@ -455,7 +458,7 @@ def _analyze_homepage(website_url: str) -> dict:
     import json
     
     try:
-        resp = requests.get(website_url, timeout=10, headers=HEADERS, allow_redirects=True)
+        resp = web_fetch.get(website_url, timeout=10, headers=HEADERS, allow_redirects=True)
         if resp.status_code != 200:
             return None
         
@@ -0,0 +1,163 @@
+"""
+Internal-link candidate index for seo.inject_internal_links.
+
+Every published article is held once per process, newest first:
+
+    make → recent articles   lazily, on first lookup of a make
+                             (title contains the make, like title__icontains)
+    tag  → recent articles   eagerly, RECENT_PER_KEY per tag name
+    article → first tag names (anchor keywords for links to it)
+
+so choosing link targets costs no queries. Only RECENT_PER_KEY articles
+per key are ever needed — the linker picks among the 10 newest matches.
+
+The index is rebuilt after INDEX_TTL, or when an article is published,
+renamed or retagged (news/cache_signals.py bumps a shared version, checked
+at most every VERSION_CHECK_SECONDS — a bulk re-save rebuilds at most that
+often, not once per article).
+
+Anchor keywords are matched with a cached PhraseMatcher (phrase_matcher.py)
+per keyword set.
+"""
+import logging
+import threading
+import time
+from functools import lru_cache
+
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION_KEY = 'link_index:version'
+VERSION_CHECK_SECONDS = 30
+INDEX_TTL = 15 * 60
+RECENT_PER_KEY = 10
+ANCHOR_TAGS = 3
+
+
+class LinkIndex:
+    """Published articles (newest first) with make/tag → recent postings."""
+
+    def __init__(self, articles, tags_by_article):
+        """
+        Args:
+            articles: (id, slug, title) tuples, newest first.
+            tags_by_article: article id → tag names, in tag order.
+        """
+        self.ids = [a[0] for a in articles]
+        self.slugs = [a[1] for a in articles]
+        self.titles = [a[2] or '' for a in articles]
+        self._titles_lower = [t.lower() for t in self.titles]
+        self.tags = [tags_by_article.get(article_id, [])[:ANCHOR_TAGS] for article_id in self.ids]
+
+        self.by_tag = {}
+        for position, article_id in enumerate(self.ids):
+            for name in tags_by_article.get(article_id, ()):
+                posting = self.by_tag.setdefault(name, [])
+                if len(posting) < RECENT_PER_KEY and (not posting or posting[-1] != position):
+                    posting.append(position)
+        self._by_make = {}
+
+    def __len__(self):
+        return len(self.ids)
+
+    def recent_for_make(self, make, limit=RECENT_PER_KEY):
+        """Newest articles whose title contains `make` (case-insensitive)."""
+        key = make.lower()
+        posting = self._by_make.get(key)
+        if posting is None:
+            posting = []
+            for position, title in enumerate(self._titles_lower):
+                if key in title:
+                    posting.append(position)
+                    if len(posting) == RECENT_PER_KEY:
+                        break
+            self._by_make[key] = posting
+        return posting[:limit]
+
+    def recent_for_tags(self, tag_names, limit=RECENT_PER_KEY):
+        """Newest articles carrying any of `tag_names` (exact names), no repeats."""
+        merged = set()
+        for name in tag_names:
+            merged.update(self.by_tag.get(name, ()))
+        return sorted(merged)[:limit]
+
+
+@lru_cache(maxsize=512)
+def anchor_matcher(keywords):
+    """Whole-word, case-insensitive matcher over a tuple of anchor keywords."""
+    from ai_engine.modules.phrase_matcher import PhraseMatcher
+    return PhraseMatcher(keywords)
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Process-wide index
+# ═══════════════════════════════════════════════════════════════════
+
+_index = None
+_index_version = 0
+_index_built_at = 0.0
+_last_version_check = 0.0
+_index_lock = threading.Lock()
+
+
+def _shared_version():
+    try:
+        from django.core.cache import cache
+        return cache.get(INDEX_VERSION_KEY) or 0
+    except Exception:
+        return 0
+
+
+def _build_index():
+    from news.models import Article
+
+    started = time.perf_counter()
+    published = Article.objects.filter(is_published=True)
+    articles = list(published.order_by('-created_at', '-id').values_list('id', 'slug', 'title'))
+    tags_by_article = {}
+    rows = (Article.tags.through.objects.filter(article__is_published=True)
+            .order_by('id').values_list('article_id', 'tag__name'))
+    for article_id, name in rows.iterator(chunk_size=5000):
+        tags_by_article.setdefault(article_id, []).append(name)
+    index = LinkIndex(articles, tags_by_article)
+    logger.info(f"🔗 Internal link index: {len(index)} articles, {len(index.by_tag)} tags "
+                f"in {time.perf_counter() - started:.2f}s")
+    return index
+
+
+def get_link_index():
+    """Process-wide LinkIndex, rebuilt after INDEX_TTL or a shared version bump."""
+    global _index, _index_version, _index_built_at, _last_version_check
+    now = time.monotonic()
+    fresh = _index is not None and now - _index_built_at < INDEX_TTL
+    if fresh and now - _last_version_check < VERSION_CHECK_SECONDS:
+        return _index
+
+    version = _shared_version()
+    _last_version_check = now
+    if fresh and _index_version >= version:
+        return _index
+
+    with _index_lock:
+        if _index is None or now - _index_built_at >= INDEX_TTL or _index_version < version:
+            _index = _build_index()
+            _index_built_at = time.monotonic()
+        _index_version = version
+        return _index
+
+
+def invalidate(shared=True):
+    """
+    Ask every process to rebuild on its next version check. ``shared=False``
+    drops only this process's index, immediately (tests).
+    """
+    global _index, _last_version_check
+    if not shared:
+        with _index_lock:
+            _index = None
+            _last_version_check = 0.0
+        return
+    try:
+        from django.core.cache import cache
+        cache.set(INDEX_VERSION_KEY, time.time(), None)
+    except Exception:
+        pass
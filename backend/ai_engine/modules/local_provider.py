@@ -0,0 +1,454 @@
+"""
+Local LLM stand-in — offline replacement for GeminiProvider.
+
+Replays recorded responses (a JSONL "cassette") or fills per-caller templates,
+after sleeping for a latency drawn from a configurable distribution. Used to
+benchmark the generation pipelines without Gemini calls, and in development
+without an API key.
+
+Enable it for every get_*_provider() call with:
+
+    AI_PROVIDER_OVERRIDE=local
+
+Configuration (environment):
+    AI_LOCAL_CASSETTE   JSONL file of recorded responses to replay
+    AI_LOCAL_LATENCY    Latency spec, optionally per caller:
+                          "lognormal:1200:0.4"            (median ms, sigma)
+                          "fixed:800" | "uniform:200:900" | "normal:900:150"
+                          "lognormal:1200:0.4;article_generate=lognormal:25000:0.3"
+    AI_LOCAL_SEED       Seed for the latency RNG (reproducible runs)
+    AI_RECORD_CASSETTE  When set, real Gemini responses are appended to this
+                        JSONL file so they can be replayed later.
+
+Cassette lines: {"key": sha256, "caller": "...", "response": "...", "latency_ms": 1234}
+Keys hash caller + system prompt + prompt, so the same call replays the same
+response; a recorded latency_ms is replayed too unless AI_LOCAL_LATENCY is set.
+"""
+import os
+import re
+import json
+import time
+import random
+import hashlib
+import logging
+import threading
+from collections import defaultdict
+
+logger = logging.getLogger(__name__)
+
+LOCAL_MODEL_NAME = 'local-stand-in'
+DEFAULT_LATENCY = 'lognormal:1200:0.4'
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Latency distributions
+# ═══════════════════════════════════════════════════════════════════
+
+def _parse_distribution(spec: str):
+    """'lognormal:1200:0.4' → callable(rng) returning seconds."""
+    kind, *args = spec.strip().split(':')
+    try:
+        values = [float(a) for a in args]
+    except ValueError:
+        raise ValueError(f"Invalid latency spec: {spec!r}")
+    kind = kind.lower()
+    if kind == 'fixed' and len(values) == 1:
+        return lambda rng: values[0] / 1000
+    if kind == 'uniform' and len(values) == 2:
+        return lambda rng: rng.uniform(values[0], values[1]) / 1000
+    if kind == 'normal' and len(values) == 2:
+        return lambda rng: max(0.0, rng.gauss(values[0], values[1])) / 1000
+    if kind == 'lognormal' and len(values) == 2:
+        import math
+        mu = math.log(max(values[0], 1e-3))
+        return lambda rng: rng.lognormvariate(mu, values[1]) / 1000
+    raise ValueError(f"Invalid latency spec: {spec!r}")
+
+
+def parse_latency(spec: str | None) -> dict:
+    """
+    Parse AI_LOCAL_LATENCY into {caller or '*': distribution}.
+
+    "lognormal:1200:0.4;article_generate=fixed:20000" → default + one override.
+    """
+    result = {}
+    for part in (spec or DEFAULT_LATENCY).split(';'):
+        part = part.strip()
+        if not part:
+            continue
+        caller, _, dist = part.rpartition('=')
+        result[caller.strip() or '*'] = _parse_distribution(dist)
+    result.setdefault('*', _parse_distribution(DEFAULT_LATENCY))
+    return result
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Cassettes
+# ═══════════════════════════════════════════════════════════════════
+
+def cassette_key(prompt, system_prompt=None, caller='unknown') -> str:
+    payload = f"{caller}\x00{system_prompt or ''}\x00{prompt}"
+    return hashlib.sha256(payload.encode('utf-8', 'replace')).hexdigest()
+
+
+def load_cassette(path: str) -> dict:
+    """Read a JSONL cassette into {key: entry}. Missing file → empty."""
+    entries = {}
+    if not path or not os.path.exists(path):
+        return entries
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                entry = json.loads(line)
+                entries[entry['key']] = entry
+            except (ValueError, KeyError):
+                continue
+    return entries
+
+
+_record_lock = threading.Lock()
+
+
+def record_response(path, prompt, system_prompt, caller, response, latency_ms):
+    """Append one real response to a cassette file."""
+    entry = {
+        'key': cassette_key(prompt, system_prompt, caller),
+        'caller': caller,
+        'response': response,
+        'latency_ms': round(latency_ms),
+    }
+    try:
+        with _record_lock, open(path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+    except OSError as e:
+        logger.warning(f"⚠️ Could not record AI response to {path}: {e}")
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Response templates
+# ═══════════════════════════════════════════════════════════════════
+
+_ANALYSIS_TEMPLATE = """Make: {make}
+Model: {model}
+Trim/Version: Standard
+Year: {year}
+SEO Title: {year} {make} {model}: 530 hp, 620 km Range and a $32,000 Price
+Engine: Dual electric motors
+Horsepower: 530 hp
+Torque: 670 Nm
+Acceleration: 3.8 seconds (0-100 km/h)
+Top Speed: 240 km/h
+Drivetrain: AWD
+Battery: 82.5 kWh
+Range: 620 km
+Price: $32,000
+
+Key Features:
+- 800V architecture with 10-80% charging in 20 minutes
+- LiDAR-based driver assistance
+- 15.6-inch rotating infotainment screen
+
+Pros:
+- Strong performance for the price
+- Fast charging
+
+Cons:
+- Firm ride on large wheels
+
+Summary: The {year} {make} {model} combines a long range, quick charging and strong performance at a competitive price."""
+
+_ARTICLE_SECTIONS = (
+    ('Performance &amp; Specs', (
+        'Dual motors produce a combined 530 hp and 670 Nm, which is enough for 0-100 km/h in 3.8 seconds '
+        'and a limited top speed of 240 km/h. The rear motor does most of the work in normal driving, '
+        'while the front unit decouples at cruising speed to cut drag losses and only engages when the '
+        'traction control detects slip or the driver asks for full power.',
+        'An 82.5 kWh lithium iron phosphate pack sits under the floor and gives a rated 620 km on the CLTC '
+        'cycle. Real-world testing at motorway speeds suggests something closer to 480 km, which still puts '
+        'the {make} {model} ahead of most rivals at this price. The 800V architecture takes the pack from '
+        '10 to 80 percent in roughly twenty minutes on a suitable charger.',
+        'Thermal management is a strength. The battery is preconditioned automatically when a fast charger is '
+        'set as the navigation destination, and repeated launches on a closed circuit produced no noticeable '
+        'power reduction. Kerb weight is 2,150 kg, which is competitive for a dual-motor car with this much '
+        'battery capacity, and the low centre of gravity helps it feel stable through quick direction changes.',
+    )),
+    ('Design &amp; Interior', (
+        'The exterior keeps a clean, low profile with flush door handles, frameless windows and a full-width '
+        'light bar across the tail. A drag coefficient of 0.22 comes from a flat underbody, active grille '
+        'shutters and aero-optimised 20-inch wheels. The proportions are closer to a fastback than a '
+        'traditional three-box sedan, and the short overhangs make it look smaller than its 4.8 metre length.',
+        'Inside, soft-touch materials cover the dashboard and upper door cards, and the seats are trimmed in a '
+        'vegan leather that feels durable rather than plush. Rear passengers get a flat floor, generous knee '
+        'room and their own climate vents. The boot holds 480 litres, and a further 70 litres sit under the '
+        'bonnet, which is useful for charging cables and a small bag.',
+    )),
+    ('Technology &amp; Features', (
+        'A 15.6-inch rotating touchscreen runs the infotainment system, paired with a 10.25-inch digital '
+        'instrument cluster and a head-up display. Wireless CarPlay and Android Auto are standard, and '
+        'over-the-air updates have already added new driving modes and a revised navigation interface since '
+        'launch. Voice control handles climate, seat heating and media without needing a wake word.',
+        'The driver assistance suite uses a roof-mounted LiDAR unit, five radars and twelve cameras. Adaptive '
+        'cruise control and lane centring work smoothly on the motorway and rarely disengage, and automated '
+        'parking copes with tight bays. A 3.3 kW vehicle-to-load outlet can run camping equipment or power '
+        'tools, and the phone-as-key system works reliably with both major mobile platforms.',
+    )),
+    ('Driving Experience', (
+        'Steering is light at low speed but weights up progressively, and the adaptive dampers keep body '
+        'movements in check on twisting roads. The ride is firm on the larger wheels, especially over sharp '
+        'urban bumps, but it settles well once the speed rises. Acoustic glass on all four doors keeps wind '
+        'and road noise low enough for easy conversation at 120 km/h.',
+        'Regenerative braking has three levels plus a one-pedal mode that brings the car to a complete stop. '
+        'The transition between regenerative and friction braking is well judged, so the pedal feels '
+        'consistent in daily traffic. The heat pump keeps winter range losses to around fifteen percent, '
+        'which matters for owners in colder climates who rely on public charging.',
+        'On a mountain road the rear bias of the torque split is noticeable, with the car tightening its line '
+        'under power rather than pushing wide. The stability control intervenes late and gently in its sport '
+        'setting. Brake pedal travel is short and progressive, and the standard four-piston front calipers '
+        'showed no fade after several hard descents, which is not always the case with heavy electric sedans.',
+    )),
+    ('Pricing &amp; Availability', (
+        'Prices start at $32,000 for the rear-wheel-drive version, with the dual-motor car tested here costing '
+        'about $38,500. That undercuts the main European and American rivals while offering more equipment as '
+        'standard. Deliveries begin next quarter in China, with right-hand-drive markets following later in '
+        'the year once homologation is complete.',
+        'The warranty covers the battery for eight years or 160,000 km, and the rest of the car for six years. '
+        'Servicing intervals are set at two years or 30,000 km. Early owners also receive a home wall box and '
+        'two years of free access to the brand charging network, which makes the total cost of ownership '
+        'particularly competitive against petrol alternatives.',
+    )),
+)
+
+
+def _article_template(fields) -> str:
+    """Article in the generator's required structure, ~1,000 words with no repeated paragraphs."""
+    name = f"{fields['year']} {fields['make']} {fields['model']}"
+    parts = [
+        f"<h2>{name}: 530 hp and 620 km of Range for $32,000</h2>",
+        f"<p>The {name} arrives as one of the strongest value propositions in the mid-size electric segment, "
+        f"combining dual-motor performance, a long rated range and fast charging at a price that undercuts "
+        f"most established rivals. We spent a week with the car on motorways, city streets and mountain roads "
+        f"to see whether the numbers hold up, and how it compares with the cars buyers will cross-shop it "
+        f"against in showrooms this year.</p>",
+        '<div class="spec-bar">'
+        '<div class="spec-item"><div class="spec-label">STARTING PRICE</div><div class="spec-value">$32,000</div></div>'
+        '<div class="spec-item"><div class="spec-label">RANGE</div><div class="spec-value">620 km CLTC</div></div>'
+        '<div class="spec-item"><div class="spec-label">POWER</div><div class="spec-value">530 hp</div></div>'
+        '<div class="spec-item"><div class="spec-label">0-100 KM/H</div><div class="spec-value">3.8 sec</div></div>'
+        '<div class="spec-item"><div class="spec-label">POWERTRAIN</div><div class="spec-value">BEV AWD</div></div>'
+        '</div>',
+    ]
+    for heading, paragraphs in _ARTICLE_SECTIONS:
+        parts.append(f"<h2>{heading}</h2>")
+        parts.extend(f"<p>{p.format(**fields)}</p>" for p in paragraphs)
+        if heading.startswith('Performance'):
+            parts.append(
+                '<table class="specs-table"><tbody>'
+                '<tr><th>SYSTEM OUTPUT</th><td>530 hp / 395 kW</td></tr>'
+                '<tr><th>TORQUE</th><td>670 Nm</td></tr>'
+                '<tr><th>BATTERY</th><td>82.5 kWh (LFP)</td></tr>'
+                '<tr><th>RANGE</th><td>620 km CLTC</td></tr>'
+                '<tr><th>0-100 KM/H</th><td>3.8 sec</td></tr>'
+                '</tbody></table>'
+            )
+        elif heading.startswith('Pricing'):
+            parts.append('<div class="price-tag"><span class="price-main">$32,000</span> '
+                         f'<span class="price-note">Starting · Model Year {fields["year"]}</span></div>')
+    parts.append(
+        '<h2>Pros &amp; Cons</h2><div class="pros-cons">'
+        '<div class="pc-block pros"><div class="pc-title">Pros</div><ul class="pc-list">'
+        '<li>530 hp for the price of a mid-range rival</li><li>20-minute 10-80% charging</li>'
+        '<li>LiDAR driver assistance as standard</li></ul></div>'
+        '<div class="pc-block cons"><div class="pc-title">Cons</div><ul class="pc-list">'
+        '<li>Firm ride on 20-inch wheels</li><li>Real-world range well below the CLTC figure</li>'
+        '</ul></div></div>'
+    )
+    parts.append('<h2>FreshMotors Verdict</h2>')
+    parts.append(
+        f'<div class="fm-verdict"><div class="verdict-label">FreshMotors Verdict</div>'
+        f"<p>The {fields['make']} {fields['model']} makes a convincing case for buyers who want genuine "
+        f"performance without paying a premium badge tax. Its 800V charging and 530 hp drivetrain would be "
+        f"impressive at twice the price, and the equipment list leaves little to add. The firm ride on large "
+        f"wheels is the main compromise, so test the smaller wheel option first. For a family that covers long "
+        f"distances and charges in public, it is the one to beat.</p></div>"
+    )
+    parts.append(
+        '<div class="alt-texts" style="display:none">\n'
+        f"ALT_TEXT_1: {name} front three-quarter view\n"
+        f"ALT_TEXT_2: {name} dashboard and rotating touchscreen\n"
+        f"ALT_TEXT_3: {name} charging port detail\n"
+        '</div>'
+    )
+    return '\n'.join(parts)
+
+
+def _title_seo_template(fields) -> str:
+    name = f"{fields['year']} {fields['make']} {fields['model']}"
+    return (
+        f"TITLE: {name}: 530 hp, 620 km Range From $32,000\n"
+        f"SEO_DESCRIPTION: The {name} pairs 530 hp dual motors with an 82.5 kWh battery, 620 km of range "
+        f"and 20-minute fast charging from $32,000.\n"
+        f"SUMMARY: The {name} brings 530 hp, 620 km of range and 800V fast charging to the mid-size EV "
+        f"segment at a starting price of $32,000."
+    )
+
+
+def _categorize_template(fields) -> str:
+    return f"Category: Reviews\nTags: {fields['make']}, {fields['year']}, EV, Sedan, AWD, Fast Charging"
+
+
+# caller → template(fields) -> str
+LOCAL_RESPONSE_TEMPLATES = {
+    'transcript_analyze': lambda f: _ANALYSIS_TEMPLATE.format(**f),
+    'article_generate': _article_template,
+    'rss_generate': _article_template,
+    'fast_regenerate': _article_template,
+    'article_enhance': _article_template,
+    'article_review': _article_template,
+    'title_seo': _title_seo_template,
+    'categorize': _categorize_template,
+}
+
+_FIELD_PATTERNS = {
+    'make': re.compile(r'^\s*Make:\s*([^\n\[]+)$', re.M),
+    'model': re.compile(r'^\s*Model:\s*([^\n\[]+)$', re.M),
+    'year': re.compile(r'^\s*Year:\s*(\d{4})', re.M),
+}
+_DEFAULT_FIELDS = {'make': 'BYD', 'model': 'Seal 06', 'year': '2026'}
+_JSON_OBJECT_RE = re.compile(r'\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}')
+
+
+def _extract_fields(prompt: str) -> dict:
+    fields = dict(_DEFAULT_FIELDS)
+    for name, pattern in _FIELD_PATTERNS.items():
+        m = pattern.search(prompt or '')
+        if m and m.group(1).strip() and 'Not specified' not in m.group(1):
+            fields[name] = m.group(1).strip()
+    return fields
+
+
+def _echo_json_example(prompt: str) -> str | None:
+    """Prompts that ask for JSON embed an example object — return the first valid one."""
+    for m in _JSON_OBJECT_RE.finditer(prompt or ''):
+        try:
+            json.loads(m.group())
+            return m.group()
+        except ValueError:
+            continue
+    return None
+
+
+def render_template(prompt: str, caller: str) -> str:
+    """Templated response for `caller` (JSON echo / generic text as fallback)."""
+    template = LOCAL_RESPONSE_TEMPLATES.get(caller)
+    if template:
+        return template(_extract_fields(prompt))
+    if 'json' in (prompt or '').lower():
+        echoed = _echo_json_example(prompt)
+        if echoed:
+            return echoed
+    return 'OK'
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Provider
+# ═══════════════════════════════════════════════════════════════════
+
+class LocalProvider:
+    """Drop-in for GeminiProvider: same generate_completion() signature."""
+
+    _lock = threading.Lock()
+    _stats = defaultdict(lambda: {'calls': 0, 'replayed': 0, 'latency_s': 0.0,
+                                  'prompt_chars': 0, 'response_chars': 0})
+    _cassette = None
+    _cassette_path = None
+    _latency = None
+    _latency_spec = None
+    _rng = None
+
+    @classmethod
+    def configure(cls, cassette=None, latency=None, seed=None):
+        """(Re)load cassette and latency settings; None → read environment."""
+        with cls._lock:
+            cls._cassette_path = cassette if cassette is not None else os.getenv('AI_LOCAL_CASSETTE', '')
+            cls._cassette = load_cassette(cls._cassette_path)
+            cls._latency_spec = latency if latency is not None else os.getenv('AI_LOCAL_LATENCY')
+            cls._latency = parse_latency(cls._latency_spec)
+            seed = seed if seed is not None else os.getenv('AI_LOCAL_SEED')
+            cls._rng = random.Random(int(seed) if seed not in (None, '') else None)
+        if cls._cassette:
+            logger.info(f"[LocalProvider] Loaded {len(cls._cassette)} recorded responses")
+
+    @classmethod
+    def _ensure_configured(cls):
+        if cls._latency is None:
+            cls.configure()
+
+    @classmethod
+    def stats(cls) -> dict:
+        """Per-caller call counts and simulated latency since the last reset."""
+        with cls._lock:
+            return {caller: dict(values) for caller, values in cls._stats.items()}
+
+    @classmethod
+    def reset_stats(cls):
+        with cls._lock:
+            cls._stats.clear()
+
+    @classmethod
+    def generate_completion(cls, prompt, system_prompt=None, temperature=0.8, max_tokens=3000, caller='unknown'):
+        cls._ensure_configured()
+        entry = cls._cassette.get(cassette_key(prompt, system_prompt, caller)) if cls._cassette else None
+
+        if entry is not None:
+            response = entry['response']
+            recorded_ms = entry.get('latency_ms')
+            if recorded_ms is not None and not cls._latency_spec:
+                delay = recorded_ms / 1000
+            else:
+                delay = cls._sample_latency(caller)
+        else:
+            response = render_template(prompt, caller)
+            delay = cls._sample_latency(caller)
+
+        if delay > 0:
+            time.sleep(delay)
+
+        with cls._lock:
+            stats = cls._stats[caller]
+            stats['calls'] += 1
+            stats['replayed'] += entry is not None
+            stats['latency_s'] += delay
+            stats['prompt_chars'] += len(prompt or '') + len(system_prompt or '')
+            stats['response_chars'] += len(response)
+
+        import ai_engine.modules.ai_provider as _provider_mod
+        _provider_mod._last_model_used = LOCAL_MODEL_NAME
+        logger.debug(f"[LocalProvider] {caller}: {len(response)} chars after {delay * 1000:.0f}ms")
+        return response
+
+    @classmethod
+    def _sample_latency(cls, caller) -> float:
+        dist = cls._latency.get(caller) or cls._latency['*']
+        with cls._lock:
+            return dist(cls._rng)
+
+
+class RecordingProvider:
+    """Wraps a real provider and appends every response to a cassette."""
+
+    def __init__(self, inner, path):
+        self.inner = inner
+        self.path = path
+
+    def generate_completion(self, prompt, system_prompt=None, temperature=0.8, max_tokens=3000, caller='unknown'):
+        started = time.perf_counter()
+        response = self.inner.generate_completion(
+            prompt, system_prompt=system_prompt, temperature=temperature,
+            max_tokens=max_tokens, caller=caller,
+        )
+        record_response(self.path, prompt, system_prompt, caller, response,
+                        (time.perf_counter() - started) * 1000)
+        return response
@@ -0,0 +1,504 @@
+"""
+Cross-process rate limiter for AI provider calls (completions and embeddings).
+
+ai_provider used to keep fixed-minute counters (get, then incr after the
+call): concurrent Celery workers all read the same count and overshot,
+bursts straddling a minute boundary got 2× through, and a model at its
+limit was simply skipped. vector_search throttled embeddings with its own
+per-process deque. Both now take tokens here first.
+
+Every model in ai_provider.MODEL_RATE_LIMITS gets a GCRA bucket (a token
+bucket stored as one "theoretical arrival time") for its RPM and, if set,
+its RPD soft limit (× RATE_LIMIT_THRESHOLD). A single Lua script checks and
+updates both atomically in Redis, so every process shares them. Refill is
+continuous; BURST caps how much of a window can go out at once, which keeps
+any rolling minute/day at or under the provider's hard limit.
+
+  * acquire(model, timeout) / acquire_any(models, timeout) block until a
+    token is free or the deadline passes; try_acquire() and available()
+    don't wait.
+  * Priority classes — with priority('batch'): ... (BatchRunner does this)
+    a backfill only gets a token while more than AI_RATE_BATCH_RESERVE of
+    the burst is left, so interactive generation always finds headroom.
+  * 429 feedback — penalize(model) halves the model's rate (down to
+    MIN_FACTOR, shared via Redis) and empties its minute bucket;
+    record_success() steps it back up, and the penalty expires by itself
+    after PENALTY_TTL seconds of quiet.
+  * stats() — acquisitions, wait time histogram, timeouts and penalties
+    per model, for the admin token-usage API.
+
+Without Redis (DummyCache dev setups, tests) the same buckets live in
+process, as news/job_scheduler.py does for its leases. If Redis is
+configured but unreachable the buckets are per-process only until a retry
+(news/redis_state.py) reconnects; a warning is logged on every failed retry.
+"""
+import logging
+import math
+import random
+import threading
+import time
+from contextlib import contextmanager
+
+from news.redis_state import RedisReconnector, redis_configured
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = 'autonews:ratelimit'
+
+WINDOWS = (('rpm', 60), ('rpd', 86400))
+# Share of a window's soft limit that may go out back-to-back
+BURST = {'rpm': 0.10, 'rpd': 0.25}
+
+PRIORITIES = ('interactive', 'batch')
+DEFAULT_BATCH_RESERVE = 0.5   # share of the burst only interactive callers may use
+DEFAULT_WAIT_SECONDS = 30
+
+PENALTY_FACTOR = 0.5          # rate multiplier per 429
+MIN_FACTOR = 0.1
+RECOVERY_STEP = 0.05          # added back per successful call
+PENALTY_TTL = 600             # seconds without a 429 before full rate returns
+
+MAX_SLEEP = 5.0               # re-check at least this often while waiting
+WAIT_BUCKETS = (0.1, 1, 5, 15, 60)
+
+_RATE_LIMIT_MARKERS = ('429', 'rate limit', 'rate_limit', 'quota', 'resource exhausted', 'resource_exhausted')
+
+
+def _setting(name, default):
+    try:
+        from django.conf import settings
+        return getattr(settings, name, default)
+    except Exception:
+        return default
+
+
+def is_rate_limit_error(exc):
+    """True for provider errors that mean "slow down" (HTTP 429 / quota exhausted)."""
+    text = str(exc).lower()
+    return any(marker in text for marker in _RATE_LIMIT_MARKERS)
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Priority
+# ═══════════════════════════════════════════════════════════════════
+
+_local = threading.local()
+
+
+@contextmanager
+def priority(name):
+    """Run AI calls in this thread at priority `name` ('interactive' or 'batch')."""
+    if name not in PRIORITIES:
+        raise ValueError(f"Unknown rate limit priority: {name}")
+    previous = getattr(_local, 'priority', None)
+    _local.priority = name
+    try:
+        yield
+    finally:
+        _local.priority = previous
+
+
+def current_priority():
+    return getattr(_local, 'priority', None) or 'interactive'
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Buckets
+# ═══════════════════════════════════════════════════════════════════
+
+def _buckets(model):
+    """[(window, emission interval ms, burst window ms)] for a model's soft limits."""
+    from ai_engine.modules.ai_provider import MODEL_RATE_LIMITS, RATE_LIMIT_THRESHOLD
+    limits = MODEL_RATE_LIMITS.get(model) or {}
+    buckets = []
+    for window, period in WINDOWS:
+        limit = limits.get(window)
+        if not limit:
+            continue
+        soft = max(1.0, limit * RATE_LIMIT_THRESHOLD)
+        interval = period * 1000 / soft
+        burst = max(1.0, math.floor(soft * BURST[window]))
+        buckets.append((window, interval, interval * burst))
+    return buckets
+
+
+def _tolerance(burst_ms, interval_ms, prio):
+    """Burst window a caller of `prio` may fill; batch callers leave the reserve free."""
+    if prio == 'batch':
+        reserve = float(_setting('AI_RATE_BATCH_RESERVE', DEFAULT_BATCH_RESERVE))
+        return max(interval_ms, burst_ms * (1 - reserve))
+    return burst_ms
+
+
+def _tat_key(model, window):
+    return f'{KEY_PREFIX}:tat:{model}:{window}'
+
+
+def _factor_key(model):
+    return f'{KEY_PREFIX}:factor:{model}'
+
+
+def _stats_key(model):
+    return f'{KEY_PREFIX}:stats:{model}'
+
+
+# KEYS: one TAT key per bucket, then the model's rate factor key.
+# ARGV: commit (0 = peek), then per bucket: emission interval ms, tolerance ms.
+# Returns {allowed, wait ms, factor × 1000}.
+_ACQUIRE_SCRIPT = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local factor = tonumber(redis.call('GET', KEYS[#KEYS]) or '1')
+local commit = ARGV[1] == '1'
+local n = #KEYS - 1
+local wait = 0
+local tats = {}
+for i = 1, n do
+    local interval = tonumber(ARGV[2 * i]) / factor
+    local tolerance = tonumber(ARGV[2 * i + 1])
+    local tat = tonumber(redis.call('GET', KEYS[i]) or '0')
+    if tat < now then tat = now end
+    local new_tat = tat + interval
+    local over = new_tat - now - tolerance
+    if over > wait then wait = over end
+    tats[i] = new_tat
+end
+if wait > 0 then
+    return {0, math.ceil(wait), math.floor(factor * 1000)}
+end
+if commit then
+    for i = 1, n do
+        redis.call('SET', KEYS[i], tats[i], 'PX', math.ceil(tats[i] - now) + 1000)
+    end
+end
+return {1, 0, math.floor(factor * 1000)}
+"""
+
+# KEYS: minute TAT key, factor key. ARGV: multiplier, min factor, ttl ms, burst window ms.
+_PENALIZE_SCRIPT = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local factor = tonumber(redis.call('GET', KEYS[2]) or '1') * tonumber(ARGV[1])
+if factor < tonumber(ARGV[2]) then factor = tonumber(ARGV[2]) end
+redis.call('SET', KEYS[2], factor, 'PX', ARGV[3])
+local empty = now + tonumber(ARGV[4])
+if tonumber(redis.call('GET', KEYS[1]) or '0') < empty then
+    redis.call('SET', KEYS[1], empty, 'PX', math.ceil(tonumber(ARGV[4])) + 1000)
+end
+return math.floor(factor * 1000)
+"""
+
+# KEYS: factor key. ARGV: step. Full rate drops the key.
+_RECOVER_SCRIPT = """
+local current = redis.call('GET', KEYS[1])
+if not current then return 1000 end
+local factor = tonumber(current) + tonumber(ARGV[1])
+if factor >= 1 then
+    redis.call('DEL', KEYS[1])
+    return 1000
+end
+redis.call('SET', KEYS[1], factor, 'KEEPTTL')
+return math.floor(factor * 1000)
+"""
+
+
+class _RedisStore:
+    """Buckets as Lua scripts over a raw redis-py connection."""
+
+    def __init__(self, conn):
+        self.conn = conn
+        self._acquire = conn.register_script(_ACQUIRE_SCRIPT)
+        self._penalize = conn.register_script(_PENALIZE_SCRIPT)
+        self._recover = conn.register_script(_RECOVER_SCRIPT)
+
+    def attempt(self, model, buckets, commit):
+        keys = [_tat_key(model, window) for window, _, _ in buckets] + [_factor_key(model)]
+        args = [1 if commit else 0]
+        for _, interval, tolerance in buckets:
+            args += [interval, tolerance]
+        allowed, wait_ms, factor = self._acquire(keys=keys, args=args)
+        return bool(allowed), int(wait_ms) / 1000, int(factor) / 1000
+
+    def penalize(self, model, burst_ms):
+        factor = self._penalize(
+            keys=[_tat_key(model, 'rpm'), _factor_key(model)],
+            args=[PENALTY_FACTOR, MIN_FACTOR, PENALTY_TTL * 1000, burst_ms],
+        )
+        return int(factor) / 1000
+
+    def recover(self, model):
+        return int(self._recover(keys=[_factor_key(model)], args=[RECOVERY_STEP])) / 1000
+
+    def record(self, model, fields):
+        pipe = self.conn.pipeline(transaction=False)
+        for field, amount in fields.items():
+            pipe.hincrbyfloat(_stats_key(model), field, amount)
+        pipe.execute()
+
+    def read(self, model):
+        raw = self.conn.hgetall(_stats_key(model))
+        factor = self.conn.get(_factor_key(model))
+        stats = {(k.decode() if isinstance(k, bytes) else k): float(v) for k, v in raw.items()}
+        return stats, float(factor) if factor else 1.0
+
+    def reset(self):
+        keys = list(self.conn.scan_iter(f'{KEY_PREFIX}:*'))
+        if keys:
+            self.conn.delete(*keys)
+
+
+class _LocalStore:
+    """Same interface as _RedisStore, process-local (no Redis configured)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._tats = {}      # (model, window) → TAT ms
+        self._factors = {}   # model → (factor, expires ms)
+        self._stats = {}
+
+    @staticmethod
+    def _now():
+        return time.time() * 1000
+
+    def _factor(self, model, now):
+        factor, expires = self._factors.get(model, (1.0, 0))
+        if expires <= now:
+            self._factors.pop(model, None)
+            return 1.0
+        return factor
+
+    def attempt(self, model, buckets, commit):
+        with self._lock:
+            now = self._now()
+            factor = self._factor(model, now)
+            wait = 0.0
+            tats = []
+            for window, interval, tolerance in buckets:
+                new_tat = max(self._tats.get((model, window), 0), now) + interval / factor
+                wait = max(wait, new_tat - now - tolerance)
+                tats.append((window, new_tat))
+            if wait > 0:
+                return False, math.ceil(wait) / 1000, factor
+            if commit:
+                for window, new_tat in tats:
+                    self._tats[(model, window)] = new_tat
+            return True, 0.0, factor
+
+    def penalize(self, model, burst_ms):
+        with self._lock:
+            now = self._now()
+            factor = max(MIN_FACTOR, self._factor(model, now) * PENALTY_FACTOR)
+            self._factors[model] = (factor, now + PENALTY_TTL * 1000)
+            key = (model, 'rpm')
+            self._tats[key] = max(self._tats.get(key, 0), now + burst_ms)
+            return factor
+
+    def recover(self, model):
+        with self._lock:
+            now = self._now()
+            if model not in self._factors:
+                return 1.0
+            factor = self._factor(model, now) + RECOVERY_STEP
+            if factor >= 1:
+                self._factors.pop(model, None)
+                return 1.0
+            self._factors[model] = (factor, self._factors[model][1])
+            return factor
+
+    def record(self, model, fields):
+        with self._lock:
+            stats = self._stats.setdefault(model, {})
+            for field, amount in fields.items():
+                stats[field] = stats.get(field, 0) + amount
+
+    def read(self, model):
+        with self._lock:
+            return dict(self._stats.get(model, {})), self._factor(model, self._now())
+
+    def reset(self):
+        with self._lock:
+            self._tats.clear()
+            self._factors.clear()
+            self._stats.clear()
+
+
+_store = None
+_fallback = None  # per-process state while a configured Redis is unreachable
+_store_lock = threading.Lock()
+_redis = RedisReconnector('AI rate limiter')
+_factors_seen = {}  # model → last factor seen, so record_success() skips Redis at full rate
+
+
+def _get_store():
+    global _store, _fallback
+    if _store is not None:
+        return _store
+    with _store_lock:
+        if _store is None:
+            if not redis_configured():
+                _store = _LocalStore()
+            else:
+                conn = _redis.connect()
+                if conn is None:
+                    if _fallback is None:
+                        _fallback = _LocalStore()
+                    return _fallback
+                _store = _RedisStore(conn)
+                _fallback = None
+    return _store
+
+
+def reset():
+    """Drop all buckets, penalties and stats (tests, admin "reset")."""
+    _factors_seen.clear()
+    try:
+        _get_store().reset()
+    except Exception as e:
+        logger.warning(f"⚠️ Rate limiter reset failed: {e}")
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Acquiring tokens
+# ═══════════════════════════════════════════════════════════════════
+
+def _attempt(model, prio, commit=True):
+    """(allowed, seconds until a token frees up). Unknown models and Redis errors allow."""
+    buckets = _buckets(model)
+    if not buckets:
+        return True, 0.0
+    buckets = [(window, interval, _tolerance(burst, interval, prio)) for window, interval, burst in buckets]
+    try:
+        allowed, wait, factor = _get_store().attempt(model, buckets, commit)
+    except Exception as e:
+        logger.warning(f"⚠️ Rate limiter unavailable, allowing {model}: {e}")
+        return True, 0.0
+    _factors_seen[model] = factor
+    return allowed, wait
+
+
+def available(model, priority=None):
+    """Whether `model` has a token free right now (takes none)."""
+    return _attempt(model, priority or current_priority(), commit=False)[0]
+
+
+def try_acquire(model, priority=None):
+    """Take a token for `model` if one is free. Never waits."""
+    prio = priority or current_priority()
+    allowed, _ = _attempt(model, prio)
+    if allowed:
+        _record(model, prio, 0.0)
+    return allowed
+
+
+def acquire(model, timeout=None, priority=None):
+    """Take a token for `model`, waiting up to `timeout` seconds (AI_RATE_WAIT_SECONDS). False on timeout."""
+    return acquire_any([model], timeout, priority) == model
+
+
+def acquire_any(models, timeout=None, priority=None):
+    """
+    Take a token from the first of `models` (a cascade, in preference order)
+    that has one free; when none does, wait for whichever frees up first.
+    Returns the model, or None if nothing freed up within `timeout`.
+    """
+    if not models:
+        return None
+    prio = priority or current_priority()
+    if timeout is None:
+        timeout = float(_setting('AI_RATE_WAIT_SECONDS', DEFAULT_WAIT_SECONDS))
+    started = time.monotonic()
+    deadline = started + timeout
+    slept = False
+    while True:
+        soonest = None
+        for model in models:
+            allowed, wait = _attempt(model, prio)
+            if allowed:
+                _record(model, prio, time.monotonic() - started if slept else 0.0)
+                return model
+            soonest = wait if soonest is None else min(soonest, wait)
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            for model in models:
+                _record(model, prio, None)
+            logger.info(f"⚡ Rate limit: no token for {', '.join(models)} within {timeout:.0f}s [{prio}]")
+            return None
+        # Jitter so waiting processes don't retry in lockstep
+        time.sleep(min(soonest * (1 + random.random() / 10), remaining, MAX_SLEEP))
+        slept = True
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Provider feedback
+# ═══════════════════════════════════════════════════════════════════
+
+def penalize(model):
+    """The provider answered 429: halve the model's rate and empty its minute bucket."""
+    buckets = {window: burst for window, _, burst in _buckets(model)}
+    if 'rpm' not in buckets:
+        return
+    try:
+        factor = _get_store().penalize(model, buckets['rpm'])
+        _get_store().record(model, {'penalties': 1})
+    except Exception as e:
+        logger.warning(f"⚠️ Rate limiter penalty for {model} not stored: {e}")
+        return
+    _factors_seen[model] = factor
+    logger.warning(f"🐢 {model} rate limited by provider — running at {factor:.0%} of its soft limit")
+
+
+def record_success(model):
+    """A call went through: ease a penalized model back toward its full rate."""
+    if _factors_seen.get(model, 1.0) >= 1.0:
+        return
+    try:
+        _factors_seen[model] = _get_store().recover(model)
+    except Exception:
+        pass
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Metrics
+# ═══════════════════════════════════════════════════════════════════
+
+def _record(model, prio, waited):
+    """Count one acquisition (waited seconds) or, with waited=None, one timeout."""
+    if waited is None:
+        fields = {f'{prio}:timeouts': 1}
+    else:
+        fields = {f'{prio}:acquired': 1, f'{prio}:wait_seconds': round(waited, 3)}
+        if waited > 0:
+            fields[f'{prio}:waited'] = 1
+            bucket = next((b for b in WAIT_BUCKETS if waited <= b), None)
+            fields[f'wait_le_{bucket}' if bucket else 'wait_gt_max'] = 1
+    try:
+        _get_store().record(model, fields)
+    except Exception:
+        pass
+
+
+def stats(models=None):
+    """Per-model acquisitions, waits and penalties since the last reset()."""
+    from ai_engine.modules.ai_provider import MODEL_RATE_LIMITS
+    result = {}
+    for model in models or MODEL_RATE_LIMITS:
+        try:
+            raw, factor = _get_store().read(model)
+        except Exception:
+            continue
+        entry = {'rate_factor': round(factor, 2), 'penalties': int(raw.get('penalties', 0))}
+        for prio in PRIORITIES:
+            acquired = int(raw.get(f'{prio}:acquired', 0))
+            wait_seconds = raw.get(f'{prio}:wait_seconds', 0.0)
+            entry[prio] = {
+                'acquired': acquired,
+                'waited': int(raw.get(f'{prio}:waited', 0)),
+                'timeouts': int(raw.get(f'{prio}:timeouts', 0)),
+                'avg_wait_seconds': round(wait_seconds / acquired, 3) if acquired else 0.0,
+            }
+        entry['wait_histogram'] = {
+            **{f'<={b}s': int(raw.get(f'wait_le_{b}', 0)) for b in WAIT_BUCKETS},
+            f'>{WAIT_BUCKETS[-1]}s': int(raw.get('wait_gt_max', 0)),
+        }
+        result[model] = entry
+    return result
@@ -361,10 +361,10 @@ class RSSAggregator:
             return None
             
         try:
-            import requests as req
             from bs4 import BeautifulSoup
+            from ai_engine.modules import web_fetch
             
-            resp = req.get(url, timeout=10, headers={
+            resp = web_fetch.get(url, timeout=10, headers={
                 'User-Agent': 'Mozilla/5.0 (compatible; AutoNewsBot/1.0)'
             })
             
@@ -807,6 +807,10 @@ class RSSAggregator:
                 )
                 logger.info(f'Saved RSS news item (type={content_type}, score={llm_score}): {title[:50]}')
 
+                # Pre-count brand/topic mentions for the trending dashboards
+                from news.rss_intelligence import record_mentions
+                record_mentions(title, news_item.created_at)
+
                 # Auto-queue high-value items as PendingArticle (review/debut + auto_publish feed)
                 if content_type in ('review', 'debut') and rss_feed.auto_publish:
                     try:
@@ -148,10 +148,8 @@ def _cluster_items(items: list, threshold: float = 0.45) -> List[List[int]]:
 
 def _get_known_brands_set() -> set:
     """Get brand names from DB (cached)."""
-    from news.models import Brand
-    return set(
-        Brand.objects.values_list('name', flat=True)
-    )
+    from ai_engine.modules.phrase_matcher import get_vocabulary
+    return set(get_vocabulary('brands').names)
 
 
 def _compute_preference_score(item_title: str, item_excerpt: str) -> float:
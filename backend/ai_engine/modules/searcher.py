@@ -4,6 +4,10 @@ from bs4 import BeautifulSoup
 import time
 import logging
 import re
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from urllib.parse import urlsplit
+
+from ai_engine.modules import web_fetch
 
 logger = logging.getLogger(__name__)
 
@@ -74,7 +78,7 @@ def _scrape_page_content(url: str, max_chars: int = 3000) -> str:
     Returns clean text limited to max_chars.
     """
     try:
-        response = requests.get(url, headers=HEADERS, timeout=8, allow_redirects=True)
+        response = web_fetch.get(url, headers=HEADERS, timeout=8, allow_redirects=True)
         response.raise_for_status()
 
         # Only process HTML pages
@@ -261,19 +265,20 @@ DIRECT_SEARCH_SITES = [
 ]
 
 
-def _search_direct_sites(make: str, model: str, max_per_site: int = 3) -> list:
+def _search_direct_sites(make: str, model: str, max_per_site: int = 3, sites=None) -> list:
     """
     Directly search known automotive sites without a search engine.
     Much more reliable than DDG/Google for Chinese EVs.
+    `sites` limits the probe to some of DIRECT_SEARCH_SITES (default: all).
     Returns list of dicts with 'title', 'url', 'desc', 'trusted'.
     """
     query = f"{make}+{model}".replace(' ', '+')
     results = []
     
-    for site in DIRECT_SEARCH_SITES:
+    for site in (DIRECT_SEARCH_SITES if sites is None else sites):
         url = site['url_template'].format(query=query)
         try:
-            response = requests.get(url, headers=HEADERS, timeout=10, allow_redirects=True)
+            response = web_fetch.get(url, headers=HEADERS, timeout=10, allow_redirects=True)
             if response.status_code != 200:
                 continue
             
@@ -323,15 +328,173 @@ def _search_direct_sites(make: str, model: str, max_per_site: int = 3) -> list:
     return results
 
 
-def search_car_details(make, model, year=None):
+# --- Concurrent search pipeline ---
+
+SEARCH_WORKERS = 8
+MAX_SOURCES = 6   # results in the context
+MAX_SCRAPED = 3   # of which carry scraped page content
+
+# Result tiers, best first — a URL found by several engines keeps its best tier
+TIER_DIRECT, TIER_DDG, TIER_GOOGLE = 0, 1, 2
+
+
+def _web_context_key(make, model, year) -> str:
+    parts = (make or '', model or '', str(year or ''))
+    return 'web_context:' + ':'.join(re.sub(r'\s+', '_', p.strip().lower()) for p in parts)
+
+
+def _normalize_url(url: str) -> str:
+    """Dedup key: scheme, www., trailing slash, fragment and utm_* params don't matter."""
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower()
+    if host.startswith('www.'):
+        host = host[4:]
+    query = '&'.join(p for p in parts.query.split('&') if p and not p.lower().startswith('utm_'))
+    return f"{host}{parts.path.rstrip('/') or '/'}" + (f"?{query}" if query else '')
+
+
+def _gather_results(make, model, queries, deadline, google_after=None, google_min_results=1) -> list:
+    """
+    Run the direct-site probes and DuckDuckGo queries at once and scrape
+    result pages while the other searches are still running. Google stays a
+    fallback: it is queried only if fewer than `google_min_results` results
+    have come in once those searches finish or `google_after` seconds pass.
+    Returns up to MAX_SOURCES ranked results (trusted first), the top ones
+    with 'scraped' content — whatever finished before `deadline` seconds —
+    and whether every search and scrape finished in time.
+    """
+    started = time.monotonic()
+    ends_at = started + deadline
+    pool = ThreadPoolExecutor(max_workers=SEARCH_WORKERS, thread_name_prefix='web-search')
+    searches = {}
+    for i, site in enumerate(DIRECT_SEARCH_SITES):
+        searches[pool.submit(_search_direct_sites, make, model, 3, [site])] = (TIER_DIRECT, i, site['name'])
+    if HAS_DDGS:
+        for i, q in enumerate(queries):
+            searches[pool.submit(_search_ddgs, q, 6)] = (TIER_DDG, i, 'DuckDuckGo')
+
+    # When to decide on the Google fallback; None once decided
+    google_at = None
+    if HAS_GOOGLE and google_min_results > 0:
+        google_at = ends_at if google_after is None else min(ends_at, started + google_after)
+
+    found = {}    # normalized url → (rank, entry)
+    scrapes = {}  # normalized url → Future[str]
+    complete = True
+
+    def scrape(key, entry):
+        if key not in scrapes:
+            scrapes[key] = pool.submit(_scrape_page_content, entry['url'], 3000)
+
+    try:
+        pending = set(searches)
+        while True:
+            if google_at is not None and (not pending or time.monotonic() >= google_at):
+                google_at = None
+                if len(found) < google_min_results:
+                    print(f"  🔍 Google fallback ({len(found)} results so far)...")
+                    for i, q in enumerate(queries[:2]):  # Only first 2 queries for Google (rate limit risk)
+                        future = pool.submit(_search_google, q, 6)
+                        searches[future] = (TIER_GOOGLE, i, 'Google')
+                        pending.add(future)
+            if not pending:
+                break
+            wake_at = ends_at if google_at is None else google_at
+            done, pending = wait(pending, timeout=max(0, wake_at - time.monotonic()),
+                                 return_when=FIRST_COMPLETED)
+            if not done:
+                if time.monotonic() < ends_at:
+                    continue  # Google decision point, not the deadline
+                print(f"  ⏱️ Search deadline ({deadline}s) reached — {len(pending)} searches still running")
+                complete = False
+                break
+            for future in done:
+                tier, index, name = searches[future]
+                try:
+                    results = future.result()
+                except Exception as e:
+                    logger.debug(f"{name} search failed: {e}")
+                    continue
+                if tier == TIER_DIRECT and results:
+                    print(f"  🎯 {name}: {len(results)} articles")
+                for pos, entry in enumerate(results):
+                    key = _normalize_url(entry['url'])
+                    rank = (tier, index, pos)
+                    if key in found and found[key][0] <= rank:
+                        continue
+                    found[key] = (rank, entry)
+                    # Start scraping promising pages right away
+                    if entry['trusted'] and _is_automotive_result(entry) and len(scrapes) < MAX_SOURCES:
+                        scrape(key, entry)
+
+        if not found:
+            return [], complete
+
+        ranked = sorted(found.items(), key=lambda item: item[1][0])
+        automotive = [(k, e) for k, (_, e) in ranked if _is_automotive_result(e)]
+        if automotive:
+            print(f"  🚗 Filtered to {len(automotive)} automotive results (dropped {len(ranked) - len(automotive)} irrelevant)")
+            candidates = automotive
+        else:
+            print(f"  ⚠️ No results passed automotive filter, using all {len(ranked)} results")
+            candidates = [(k, e) for k, (_, e) in ranked]
+
+        # --- Prioritize trusted sources ---
+        trusted = [(k, e) for k, e in candidates if e['trusted']]
+        other = [(k, e) for k, e in candidates if not e['trusted']]
+        prioritized = (trusted + other)[:MAX_SOURCES]
+        print(f"  ✓ {len(trusted)} trusted, {len(other)} other sources (using top {len(prioritized)})")
+
+        # --- Deep scrape: top pages not already being scraped, within the deadline ---
+        for key, entry in prioritized[:MAX_SCRAPED]:
+            scrape(key, entry)
+        ours = [scrapes[k] for k, _ in prioritized if k in scrapes]
+        if wait(ours, timeout=max(0, ends_at - time.monotonic())).not_done:
+            print(f"  ⏱️ Search deadline ({deadline}s) reached while scraping")
+            complete = False
+
+        results, scraped = [], 0
+        for key, entry in prioritized:
+            entry = dict(entry)
+            future = scrapes.get(key)
+            if scraped < MAX_SCRAPED and future is not None and future.done() and not future.exception():
+                content = future.result()
+                if content:
+                    entry['scraped'] = content
+                    scraped += 1
+                    print(f"  📄 Scraped {len(content)} chars: {entry['url'][:80]}")
+            results.append(entry)
+        return results, complete
+    finally:
+        # Don't wait for stragglers past the deadline; their requests time out on their own
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def search_car_details(make, model, year=None, deadline=None):
     """
     Searches for car details and reviews on the web.
     Returns structured text with key info found, including scraped page content.
-    Uses DuckDuckGo as primary (reliable), Google as fallback.
+    Direct site probes and DuckDuckGo run concurrently, with Google as a
+    fallback when they come up short (WEB_CONTEXT_GOOGLE_AFTER /
+    WEB_CONTEXT_GOOGLE_MIN_RESULTS); pages are scraped as soon as their
+    results arrive, and whatever is ready when `deadline` seconds
+    (WEB_CONTEXT_DEADLINE) run out is returned.
     Runs diverse searches for comprehensive coverage, with China-specific queries
     for brands like BYD, NIO, Zeekr, Xpeng, SEALION, etc.
+    The combined context is cached per (make, model, year) for WEB_CONTEXT_CACHE_TTL.
     """
+    from django.conf import settings
+    from django.core.cache import cache
+
     year_str = str(year) if year else ''
+    cache_key = _web_context_key(make, model, year)
+    try:
+        cached = cache.get(cache_key)
+    except Exception:
+        cached = None
+    if cached:
+        print(f"🌐 Web context for {make} {model} {year_str} served from cache ({len(cached)} chars)")
+        return cached
 
     # Chinese brands that need China-specific queries
     CHINESE_BRANDS = {
@@ -366,76 +529,17 @@ def search_car_details(make, model, year=None):
     for i, q in enumerate(queries, 1):
         print(f"  🔍 Query {i}: {q}")
 
-    # --- Search Phase: 3 tiers ---
-    all_results = []
-    seen_urls = set()
-    
-    # Tier 1: Direct site search (most reliable, no rate limits)
-    print("  🎯 Tier 1: Direct site search (cnevpost, insideevs, electrek)...")
-    direct_results = _search_direct_sites(make, model)
-    for r in direct_results:
-        if r['url'] not in seen_urls:
-            all_results.append(r)
-            seen_urls.add(r['url'])
-    if direct_results:
-        print(f"  🎯 Direct search found {len(direct_results)} articles")
-    
-    # Tier 2: DuckDuckGo (works in Docker, no rate limits)
-    if HAS_DDGS:
-        print("  🦆 Tier 2: DuckDuckGo...")
-        for q in queries:
-            ddg_results = _search_ddgs(q, max_results=6)
-            for r in ddg_results:
-                if r['url'] not in seen_urls:
-                    all_results.append(r)
-                    seen_urls.add(r['url'])
-        
-        print(f"  🦆 DuckDuckGo found {len(all_results)} raw results")
-    
-    # Tier 3: Google (if nothing else returned results)
-    if not all_results and HAS_GOOGLE:
-        print("  🔍 Tier 3: Google fallback...")
-        for q in queries[:2]:  # Only first 2 queries for Google (rate limit risk)
-            google_results = _search_google(q, max_results=6)
-            for r in google_results:
-                if r['url'] not in seen_urls:
-                    all_results.append(r)
-                    seen_urls.add(r['url'])
-        print(f"  🔍 Google found {len(all_results)} results")
-    
-    if not all_results:
+    if deadline is None:
+        deadline = getattr(settings, 'WEB_CONTEXT_DEADLINE', 20)
+    prioritized, complete = _gather_results(
+        make, model, queries, deadline,
+        google_after=getattr(settings, 'WEB_CONTEXT_GOOGLE_AFTER', 8),
+        google_min_results=getattr(settings, 'WEB_CONTEXT_GOOGLE_MIN_RESULTS', 1),
+    )
+    if not prioritized:
         print("  ⚠️ No search results from any provider!")
         return "No relevant web results found."
 
-    # --- Filter out non-automotive results ---
-    automotive_results = [r for r in all_results if _is_automotive_result(r)]
-    if automotive_results:
-        print(f"  🚗 Filtered to {len(automotive_results)} automotive results (dropped {len(all_results) - len(automotive_results)} irrelevant)")
-        all_results = automotive_results
-    else:
-        print(f"  ⚠️ No results passed automotive filter, using all {len(all_results)} results")
-
-    # --- Prioritize trusted sources ---
-    trusted = [r for r in all_results if r['trusted']]
-    other = [r for r in all_results if not r['trusted']]
-    prioritized = trusted + other
-    prioritized = prioritized[:6]  # Take top 6
-
-    print(f"  ✓ {len(trusted)} trusted, {len(other)} other sources (using top {len(prioritized)})")
-
-    # --- Deep scrape top 3 pages for detailed content ---
-    for i, entry in enumerate(prioritized[:3]):
-        print(f"  📄 Scraping: {entry['url'][:80]}...")
-        scraped = _scrape_page_content(entry['url'], max_chars=3000)
-        if scraped:
-            entry['scraped'] = scraped
-            print(f"     ✓ Scraped {len(scraped)} chars")
-        else:
-            print(f"     ⚠️ No content scraped")
-        # Small delay between requests
-        if i < 2:
-            time.sleep(0.3)
-
     # --- Format results ---
     search_results = []
     for entry in prioritized:
@@ -450,6 +554,11 @@ def search_car_details(make, model, year=None):
 
     combined = "\n---\n".join(search_results)
     print(f"  ✓ Total web context: {len(combined)} chars from {len(search_results)} sources")
+    if complete:  # a deadline-truncated context isn't worth keeping for hours
+        try:
+            cache.set(cache_key, combined, getattr(settings, 'WEB_CONTEXT_CACHE_TTL', 6 * 3600))
+        except Exception as e:
+            logger.debug(f"Web context not cached: {e}")
     return combined
 
 
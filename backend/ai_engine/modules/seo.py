@@ -112,94 +112,78 @@ def extract_keywords_from_content(content, max_keywords=5):
 #  Internal Link Injection
 # ══════════════════════════════════════════════════════════════════
 
+# Generic anchors tried after the make and the target's own tags
+FALLBACK_ANCHORS = ('электромобиль', 'автомобиль', 'бренд', 'новинка', 'electric vehicle', 'new model')
+
+
 def inject_internal_links(article_html: str, tag_names: list, make: str = None) -> str:
     """
     Finds related past articles based on tags/make/model and injects contextual 
     internal <a> links into the article HTML to boost SEO.
-    Also appends a "Читайте также" (Read Also) block at the bottom.
+
+    Candidates come from the shared LinkIndex (link_index.py), anchors are
+    found with one keyword-automaton pass per text node, and the HTML is
+    parsed once and serialised once.
     """
     if not tag_names and not make:
         return article_html
         
     try:
-        from django.db.models import Q
-        from news.models import Article
-        
-        # 1. Find related articles
-        query = Article.objects.filter(is_published=True)
-        search_terms = []
-        
-        if make and make != 'Not specified':
-            query = query.filter(title__icontains=make)
-            search_terms.append(make)
+        from bs4 import NavigableString
+        from ai_engine.modules.link_index import anchor_matcher, get_link_index
+
+        index = get_link_index()
+
+        # 1. Find related articles (latest 10, pick 2 randomly)
+        has_make = bool(make and make != 'Not specified')
+        if has_make:
+            related = index.recent_for_make(make)
         elif tag_names:
-            query = query.filter(tags__name__in=tag_names).distinct()
-            search_terms.extend(tag_names)
-            
-        # Get latest 10 related articles to pick 2 randomly
-        related_articles = list(query.order_by('-created_at')[:10])
-        
-        if not related_articles:
+            related = index.recent_for_tags(tag_names)
+        else:
+            related = []
+
+        if not related:
             return article_html
-            
-        # Pick up to 2
-        selected_articles = random.sample(related_articles, min(2, len(related_articles)))
-        
-        # 2. Parse HTML and inject inline links
+
+        selected = random.sample(related, min(2, len(related)))
+
+        # 2. Parse HTML once; only standard <p> tags without links get anchors
         soup = BeautifulSoup(article_html, 'html.parser')
-        
-        # We only want to inject links into standard <p> tags
-        paragraphs = soup.find_all('p')
-        
-        linked_articles = []
-        
-        for article in selected_articles:
-            target_url = f"/articles/{article.slug}"
-            link_injected = False
-            
-            # Keywords to matching
-            anchor_keywords = [make] if make and make != 'Not specified' else []
-            try:
-                anchor_keywords.extend([t.name for t in article.tags.all()[:3]])
-            except Exception:
-                pass
-                
-            # Fallbacks
-            anchor_keywords.extend(['электромобиль', 'автомобиль', 'бренд', 'новинка', 'electric vehicle', 'new model'])
-            
-            # Look for these keywords in text paragraphs that don't already have links
+        paragraphs = [p for p in soup.find_all('p') if not p.find('a')]
+
+        for position in selected:
+            # Keywords in priority order: make, target's first tags, generic fallbacks
+            anchor_keywords = [make] if has_make else []
+            anchor_keywords.extend(index.tags[position])
+            anchor_keywords.extend(FALLBACK_ANCHORS)
+            anchor_keywords = tuple(dict.fromkeys(k.lower() for k in anchor_keywords if k and len(k) >= 3))
+            priority = {keyword: rank for rank, keyword in enumerate(anchor_keywords)}
+            matcher = anchor_matcher(anchor_keywords)
+
             for p in paragraphs:
-                if link_injected:
-                    break
-                    
-                if p.find('a'): # Skip paragraphs that already have links
+                # Best-priority keyword in this paragraph, at its first occurrence
+                best = None
+                for node in p.find_all(string=True):
+                    if type(node) is not NavigableString:
+                        continue  # comments, CDATA
+                    for match in matcher.find_all(str(node), overlapping=True):
+                        rank = priority[match.phrase]
+                        if best is None or rank < best[0]:
+                            best = (rank, node, match.start, match.end)
+                if best is None:
                     continue
-                    
-                text_content = p.get_text()
-                for keyword in anchor_keywords:
-                    if not keyword or len(keyword) < 3:
-                        continue
-                    
-                    # Exact word match (case insensitive)
-                    pattern = re.compile(r'\b' + re.escape(keyword) + r'\b', re.IGNORECASE)
-                    if pattern.search(text_content):
-                        # Build link HTML using the matched text
-                        match_str = pattern.search(text_content).group(0)
-                        link_html = f'<a href="{target_url}" title="{article.title}" data-seo-linker="true">{match_str}</a>'
-                        
-                        # Replace first occurrence in the paragraph's inner HTML
-                        inner_html = p.decode_contents()
-                        new_inner = pattern.sub(link_html, inner_html, count=1)
-                        p.clear()
-                        p.append(BeautifulSoup(new_inner, 'html.parser'))
-                        
-                        link_injected = True
-                        linked_articles.append(article)
-                        break
-            
-            # If we couldn't find a suitable inline anchor, just skip — we still get value from inline links
-            if not link_injected:
-                pass  # No inline slot found for this article, that's okay
+
+                _, node, start, end = best
+                text = str(node)
+                link = soup.new_tag('a', href=f"/articles/{index.slugs[position]}",
+                                    title=index.titles[position])
+                link['data-seo-linker'] = 'true'
+                link.string = text[start:end]
+                node.replace_with(*[part for part in (text[:start], link, text[end:]) if part != ''])
+                paragraphs.remove(p)
+                break
+            # No inline slot found for this article — that's okay
 
         # Read Also block removed — frontend already shows related articles with images
         
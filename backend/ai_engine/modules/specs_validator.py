@@ -129,11 +129,15 @@ def _get_competitor_context_safe(specs: dict, send_progress) -> tuple:
         _body_type = specs.get('body_type', '')
         _power_hp = None
         _price_usd = None
+        _range_km = None
         try:
             hp_match = re.search(r'(\d+)\s*(?:hp|HP|bhp)', specs.get('horsepower', ''))
             if hp_match:
                 _power_hp = int(hp_match.group(1))
             _price_usd = int(specs.get('price_usd', 0) or 0) or None
+            range_match = re.search(r'(\d[\d,]*)\s*km', str(specs.get('range') or ''))
+            if range_match:
+                _range_km = int(range_match.group(1).replace(',', ''))
         except Exception:
             pass
         if _make and _model:
@@ -141,7 +145,7 @@ def _get_competitor_context_safe(specs: dict, send_progress) -> tuple:
             ctx, data = get_competitor_context(
                 make=_make, model_name=_model,
                 fuel_type=_fuel_type, body_type=_body_type,
-                power_hp=_power_hp, price_usd=_price_usd,
+                power_hp=_power_hp, price_usd=_price_usd, range_km=_range_km,
             )
             if ctx:
                 print(f"✓ Competitor context: {len(data)} cars found for comparison")
@@ -8,6 +8,8 @@ Automatic technology tag detection and HTML injection.
 import re
 import logging
 
+from ai_engine.modules.phrase_matcher import PhraseMatcher
+
 logger = logging.getLogger(__name__)
 
 
@@ -120,6 +122,30 @@ _TECH_TAG_RULES: list[tuple[str, list[str]]] = [
 ]
 
 
+def _compile_tech_tag_rules():
+    """
+    Split _TECH_TAG_RULES into one substring automaton over all plain keywords
+    (value = tag name) and per-tag lists of precompiled regex keywords.
+    """
+    literals = []
+    regexes: dict[str, list] = {}
+    for tag_name, keywords in _TECH_TAG_RULES:
+        for kw in keywords:
+            # Treat keywords with regex chars as regex patterns
+            if any(c in kw for c in r'.?*+[](){}|\\'):
+                try:
+                    regexes.setdefault(tag_name, []).append(re.compile(kw))
+                except re.error:
+                    continue
+            else:
+                literals.append((kw, tag_name))
+    return PhraseMatcher(literals, whole_words=False), regexes
+
+
+_TECH_KEYWORD_MATCHER, _TECH_KEYWORD_REGEXES = _compile_tech_tag_rules()
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+
+
 def _auto_add_tech_tags(article_html: str, tag_names: list, specs: dict) -> None:
     """
     Auto-add Tech & Features tags by scanning the generated article HTML
@@ -129,7 +155,7 @@ def _auto_add_tech_tags(article_html: str, tag_names: list, specs: dict) -> None
     not the raw analysis (which often lacks tech details).
     """
     # Strip HTML tags → plain text for keyword matching
-    plain = re.sub(r'<[^>]+>', ' ', article_html).lower()
+    plain = _HTML_TAG_RE.sub(' ', article_html).lower()
 
     # Also include specs for extra signals
     specs_text = ' '.join(str(v) for v in specs.values() if v).lower()
@@ -137,29 +163,19 @@ def _auto_add_tech_tags(article_html: str, tag_names: list, specs: dict) -> None
 
     existing_lower = {t.lower() for t in tag_names}
     added = []
+    # One pass finds every tag with a plain keyword hit
+    literal_hits = set(_TECH_KEYWORD_MATCHER.values_in(combined_text))
 
-    for tag_name, keywords in _TECH_TAG_RULES:
+    for tag_name, _ in _TECH_TAG_RULES:
         # Skip if already present
         if tag_name.lower() in existing_lower:
             continue
-
-        for kw in keywords:
-            # Treat keywords with regex chars as regex patterns
-            if any(c in kw for c in r'.?*+[](){}|\\'):
-                try:
-                    if re.search(kw, combined_text):
-                        tag_names.append(tag_name)
-                        existing_lower.add(tag_name.lower())
-                        added.append(tag_name)
-                        break
-                except re.error:
-                    continue
-            else:
-                if kw in combined_text:
-                    tag_names.append(tag_name)
-                    existing_lower.add(tag_name.lower())
-                    added.append(tag_name)
-                    break
+        if tag_name in literal_hits or any(
+            rx.search(combined_text) for rx in _TECH_KEYWORD_REGEXES.get(tag_name, ())
+        ):
+            tag_names.append(tag_name)
+            existing_lower.add(tag_name.lower())
+            added.append(tag_name)
 
     if added:
         print(f"🏷️ Auto-added {len(added)} Tech & Features tag(s): {', '.join(added)}")
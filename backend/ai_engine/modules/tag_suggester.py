@@ -10,13 +10,30 @@ How it works:
 2. When new PendingArticle is created, we extract keywords from title
 3. We find historical articles with similar keywords  
 4. We return the most frequently used tags for those keywords, weighted by overlap
+
+Step 3 runs against an in-memory inverted index (keyword → learning logs)
+instead of loading every TagLearningLog per call: the index is built once
+per process, updated in place when a log is saved or deleted here, and
+synced incrementally (by updated_at) when another process bumps the shared
+version. Cost is O(keywords × postings) with the same scores as the old
+full scan.
 """
 import re
+import time
 import logging
+import threading
+from array import array
 from collections import Counter
+from datetime import timedelta
+
+import numpy as np
 
 logger = logging.getLogger('news')
 
+INDEX_VERSION_KEY = 'tag_suggester:index_version'
+VERSION_CHECK_SECONDS = 30
+SYNC_OVERLAP = timedelta(minutes=5)
+
 # Common stop words to ignore in titles
 STOP_WORDS = {
     'the', 'a', 'an', 'is', 'are', 'was', 'were', 'be', 'been', 'being',
@@ -59,6 +76,18 @@ POWERTRAIN_KEYWORDS = {
 }
 
 
+_direct = None
+
+
+def _direct_matcher():
+    """Body type + powertrain keywords compiled into one whole-word matcher."""
+    global _direct
+    if _direct is None:
+        from ai_engine.modules.phrase_matcher import PhraseMatcher
+        _direct = PhraseMatcher({**BODY_TYPE_KEYWORDS, **POWERTRAIN_KEYWORDS})
+    return _direct
+
+
 def extract_keywords(title):
     """Extract meaningful keywords from an article title.
     
@@ -92,71 +121,38 @@ def suggest_tags(title, max_suggestions=8):
     
     Returns list of tag name strings, ordered by confidence.
     """
-    from news.models import TagLearningLog, Tag
+    from news.models import Tag
     
     keywords = extract_keywords(title)
     if not keywords:
         return []
     
     # Strategy 1: Direct keyword → tag matches (body types, powertrain)
-    direct_tags = set()
+    # Whole-word matching avoids 'ev' matching 'rev', 'v8' matching 'tv80' etc.
     title_lower = title.lower()
-    
-    for keyword, tag_name in {**BODY_TYPE_KEYWORDS, **POWERTRAIN_KEYWORDS}.items():
-        # Use word-boundary to avoid 'ev' matching 'rev', 'v8' matching 'tv80' etc.
-        if re.search(r'\b' + re.escape(keyword) + r'\b', title_lower):
-            direct_tags.add(tag_name)
+    direct_tags = set(_direct_matcher().values_in(title_lower))
     
     # Strategy 2: Brand matching - check if any keyword matches a Manufacturers tag
-    manufacturer_tags = Tag.objects.filter(
-        group__name='Manufacturers'
-    ).values_list('name', flat=True)
-    
-    manufacturer_map = {m.lower(): m for m in manufacturer_tags}
+    # (tag names compiled once, rebuilt when tags change — see phrase_matcher)
+    from ai_engine.modules.phrase_matcher import get_vocabulary
+    manufacturers = get_vocabulary('manufacturer_tags')
     
     # Check extracted keywords against brand names (exact match)
     for keyword in keywords:
-        if keyword in manufacturer_map:
-            direct_tags.add(manufacturer_map[keyword])
+        brand_name = manufacturers.get(keyword)
+        if brand_name:
+            direct_tags.add(brand_name)
     
-    # Also check for compound brand names using word-boundary regex
+    # Also check for compound brand names using whole-word matching
     # (prevents "seat" in "6-seater", "ev" in "rev", etc.)
-    for brand_lower, brand_name in manufacturer_map.items():
+    for match in manufacturers.find_all(title_lower, overlapping=True):
         # Skip short brand names (≤3 chars) that were already checked as keywords
-        if len(brand_lower) <= 3:
-            continue
-        # Use word-boundary regex for longer brand names
-        pattern = r'\b' + re.escape(brand_lower) + r'\b'
-        if re.search(pattern, title_lower):
-            direct_tags.add(brand_name)
+        if len(match.phrase) > 3:
+            direct_tags.add(match.value)
     
     # Strategy 3: Historical pattern matching
     # Find learning logs where keywords overlap with our new title
-    historical_tags = Counter()
-    
-    all_logs = TagLearningLog.objects.all().only(
-        'title_keywords', 'final_tags'
-    )
-    
-    for log in all_logs:
-        log_keywords = set(log.title_keywords) if log.title_keywords else set()
-        
-        # Calculate keyword overlap (Jaccard-like)
-        overlap = keywords & log_keywords
-        if not overlap:
-            continue
-        
-        # Weight by overlap ratio
-        weight = len(overlap) / max(len(keywords), len(log_keywords))
-        
-        # Only consider if meaningful overlap (at least 2 keywords match
-        # or overlap ratio > 0.3)
-        if len(overlap) < 2 and weight < 0.3:
-            continue
-        
-        # Add tags weighted by overlap
-        for tag_name in (log.final_tags or []):
-            historical_tags[tag_name] += weight
+    historical_tags = historical_tag_weights(keywords)
     
     # Combine: direct matches get highest weight
     combined = Counter()
@@ -188,7 +184,8 @@ def suggest_tags(title, max_suggestions=8):
 def record_tag_choice(article):
     """Record the title→tags mapping from a published article for learning.
     
-    Called when user publishes/approves an article.
+    Called when user publishes/approves an article. The saved log reaches the
+    learning index through the TagLearningLog post_save signal (cache_signals).
     """
     from news.models import TagLearningLog
     
@@ -213,3 +210,227 @@ def record_tag_choice(article):
         f"[TAG-LEARN] {action}: '{article.title[:50]}' → {tag_names}"
     )
     return log
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Learning index
+# ═══════════════════════════════════════════════════════════════════
+
+class LearningIndex:
+    """
+    Inverted index over TagLearningLog: keyword → rows, plus each row's
+    keyword count and tags in flat arrays. historical_tags() scores exactly
+    like a scan of every log in id order — overlaps, weights and tag sums
+    are computed with NumPy, adding the same floats in the same order.
+
+    Rows are appended to array.array buffers (cheap inserts) that NumPy reads
+    without copying. Replaced/removed logs leave dead rows behind; the index
+    is compacted once a quarter of its rows are dead. Not thread-safe on its
+    own — callers hold _index_lock.
+    """
+
+    def __init__(self):
+        self.logs = {}            # log_id → (keywords, tags)
+        self.postings = {}        # keyword → [row, ...]
+        self._posting_arrays = {}
+        self._rows = {}           # log_id → row
+        self._ids = array('q')
+        self._sizes = array('q')
+        self._alive = array('b')
+        self._tag_ptr = array('q', [0])
+        self._tag_ids = array('q')
+        self._tag_names = []
+        self._tag_lookup = {}
+        self._in_id_order = True
+        self.synced_until = None
+
+    def __len__(self):
+        return len(self.logs)
+
+    def add(self, log_id, keywords, tags):
+        """Insert or replace one log."""
+        if log_id in self.logs:
+            self.remove(log_id)
+        keywords = tuple(set(keywords or ()))
+        tags = tuple(tags or ())
+        self.logs[log_id] = (keywords, tags)
+
+        row = len(self._ids)
+        if row and log_id < self._ids[-1]:
+            self._in_id_order = False
+        self._ids.append(log_id)
+        self._sizes.append(len(keywords))
+        self._alive.append(1)
+        self._rows[log_id] = row
+
+        for tag_name in tags:
+            tag_id = self._tag_lookup.get(tag_name)
+            if tag_id is None:
+                tag_id = self._tag_lookup[tag_name] = len(self._tag_names)
+                self._tag_names.append(tag_name)
+            self._tag_ids.append(tag_id)
+        self._tag_ptr.append(len(self._tag_ids))
+
+        for keyword in keywords:
+            self.postings.setdefault(keyword, []).append(row)
+            self._posting_arrays.pop(keyword, None)
+
+    def remove(self, log_id):
+        if self.logs.pop(log_id, None) is None:
+            return
+        self._alive[self._rows.pop(log_id)] = 0
+        if len(self._ids) > 1024 and len(self._ids) > 4 * len(self.logs) / 3:
+            self._compact()
+
+    def _compact(self):
+        live = sorted(self.logs.items())
+        synced_until = self.synced_until
+        self.__init__()
+        for log_id, (keywords, tags) in live:
+            self.add(log_id, keywords, tags)
+        self.synced_until = synced_until
+
+    def _posting_array(self, keyword):
+        array = self._posting_arrays.get(keyword)
+        if array is None:
+            array = self._posting_arrays[keyword] = np.array(self.postings.get(keyword, ()), dtype=np.int64)
+        return array
+
+    def historical_tags(self, keywords):
+        """Counter of tag → summed overlap weight over logs sharing keywords."""
+        historical = Counter()
+        postings = [self._posting_array(k) for k in keywords if k in self.postings]
+        if not postings:
+            return historical
+
+        sizes = np.frombuffer(self._sizes, dtype=np.int64)
+        alive = np.frombuffer(self._alive, dtype=np.int8)
+        tag_ptr = np.frombuffer(self._tag_ptr, dtype=np.int64)
+
+        overlap = np.bincount(np.concatenate(postings), minlength=len(sizes))
+        # Weight by overlap ratio
+        weight = overlap / np.maximum(len(keywords), sizes)
+        # Only consider if meaningful overlap (at least 2 keywords match
+        # or overlap ratio > 0.3)
+        rows = np.flatnonzero((alive > 0) & (overlap > 0) & ((overlap >= 2) | (weight >= 0.3)))
+        if not self._in_id_order:
+            ids = np.frombuffer(self._ids, dtype=np.int64)
+            rows = rows[np.argsort(ids[rows], kind='stable')]
+
+        starts = tag_ptr[rows]
+        counts = tag_ptr[rows + 1] - starts
+        total = int(counts.sum())
+        if not total:
+            return historical
+        # Flat positions of every selected row's tags, row by row
+        offsets = np.repeat(starts - np.cumsum(counts) + counts, counts) + np.arange(total)
+        tag_ids = np.frombuffer(self._tag_ids, dtype=np.int64)[offsets]
+        sums = np.bincount(tag_ids, weights=np.repeat(weight[rows], counts), minlength=len(self._tag_names))
+
+        # Counter order = first appearance (most_common keeps it for ties)
+        first_ids, first_pos = np.unique(tag_ids, return_index=True)
+        for tag_id in first_ids[np.argsort(first_pos)]:
+            historical[self._tag_names[tag_id]] = float(sums[tag_id])
+        return historical
+
+    def load(self, rows):
+        """Add (id, title_keywords, final_tags, updated_at) rows."""
+        for log_id, keywords, tags, updated_at in rows:
+            self.add(log_id, keywords, tags)
+            if self.synced_until is None or updated_at > self.synced_until:
+                self.synced_until = updated_at
+
+
+_index = None
+_index_version = 0
+_last_version_check = 0.0
+_index_lock = threading.Lock()
+
+
+def _shared_version():
+    try:
+        from django.core.cache import cache
+        return cache.get(INDEX_VERSION_KEY) or 0
+    except Exception:
+        return 0
+
+
+def _log_rows(queryset):
+    return queryset.order_by('id').values_list(
+        'id', 'title_keywords', 'final_tags', 'updated_at'
+    ).iterator(chunk_size=5000)
+
+
+def _build_index():
+    from news.models import TagLearningLog
+    started = time.perf_counter()
+    index = LearningIndex()
+    index.load(_log_rows(TagLearningLog.objects.all()))
+    logger.info(
+        f"[TAG-SUGGEST] Learning index: {len(index)} logs, {len(index.postings)} keywords "
+        f"in {(time.perf_counter() - started) * 1000:.0f}ms"
+    )
+    return index
+
+
+def _sync_index(index):
+    """Pull logs saved since the last sync; rebuild if rows were deleted elsewhere."""
+    from news.models import TagLearningLog
+    if index.synced_until is not None:
+        # Overlap covers transactions that committed after a later row was synced
+        since = index.synced_until - SYNC_OVERLAP
+        index.load(_log_rows(TagLearningLog.objects.filter(updated_at__gte=since)))
+    if len(index) != TagLearningLog.objects.count():
+        return _build_index()
+    return index
+
+
+def get_learning_index():
+    """Process-wide LearningIndex, built on first use."""
+    global _index, _index_version, _last_version_check
+    now = time.monotonic()
+    if _index is not None and now - _last_version_check < VERSION_CHECK_SECONDS:
+        return _index
+
+    version = _shared_version()
+    _last_version_check = now
+    if _index is not None and _index_version >= version:
+        return _index
+
+    with _index_lock:
+        if _index is None:
+            _index = _build_index()
+        elif _index_version < version:
+            _index = _sync_index(_index)
+        _index_version = version
+        return _index
+
+
+def historical_tag_weights(keywords):
+    """Tag → summed overlap weight from learning logs sharing `keywords`."""
+    index = get_learning_index()
+    with _index_lock:
+        return index.historical_tags(keywords)
+
+
+def on_learning_log_changed(log, deleted=False):
+    """Apply a saved/deleted TagLearningLog here and tell other processes to sync."""
+    with _index_lock:
+        if _index is not None:
+            if deleted:
+                _index.remove(log.id)
+            else:
+                _index.add(log.id, log.title_keywords, log.final_tags)
+    try:
+        from django.core.cache import cache
+        cache.set(INDEX_VERSION_KEY, time.time(), None)
+    except Exception:
+        pass
+
+
+def reset_learning_index():
+    global _index, _index_version, _last_version_check
+    with _index_lock:
+        _index = None
+        _index_version = 0
+        _last_version_check = 0.0
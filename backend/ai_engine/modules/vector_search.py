@@ -16,13 +16,12 @@ import hashlib
 import threading
 import logging
 import time
-from typing import List, Dict, Optional
-from collections import deque
+from collections import Counter
+from typing import List, Dict, Iterable, Optional
 from pathlib import Path
 
 from langchain_google_genai import GoogleGenerativeAIEmbeddings
 from langchain_community.vectorstores import FAISS
-from langchain_core.documents import Document
 import faiss
 import numpy as np
 
@@ -36,21 +35,41 @@ FAISS_REDIS_TTL = 60 * 60 * 24 * 7  # 7 days
 EMBEDDING_CACHE_PREFIX = 'emb_cache:'
 EMBEDDING_CACHE_TTL = 60 * 60  # 1 hour
 
-# Throttle: max embedding API calls per window
-THROTTLE_MAX_CALLS = 40
-THROTTLE_WINDOW_SECONDS = 60
+# Embedding model — its rate limit is in ai_provider.MODEL_RATE_LIMITS
+EMBEDDING_MODEL = 'gemini-embedding-2-preview'
+# Longest an embedding call waits for a rate_limiter token before going ahead anyway
+EMBEDDING_WAIT_SECONDS = 120
+
+# Rows per server-side cursor chunk / FAISS add during a database rebuild
+REBUILD_CHUNK_SIZE = 1000
+
+
+def _index_text(title: str, summary: Optional[str], content: str) -> str:
+    """Text that gets embedded and keyword-indexed for an article."""
+    return f"{title}\n\n{summary or ''}\n\n{content}"
+
+
+def _doc_text(title: str, summary: Optional[str]) -> str:
+    """Docstore page_content: title + summary only — bodies are fetched on demand."""
+    return f"{title}\n\n{summary or ''}"
 
 
 class BM25Index:
     """
     Lightweight in-memory BM25 keyword index.
     Built from article texts — no API calls, fully local.
+
+    Keeps each document's term counts, so upsert()/remove() change single
+    articles without re-reading or re-tokenising the rest of the corpus.
     """
 
     def __init__(self):
         self._bm25 = None
         self._doc_ids: List[int] = []   # article_id at each position
         self._doc_titles: List[str] = []
+        self._positions: Dict[int, int] = {}
+        self._df = Counter()            # term -> number of documents containing it
+        self._lock = threading.Lock()
 
     def _tokenize(self, text: str) -> List[str]:
         """Simple whitespace + lowercase tokenizer."""
@@ -58,9 +77,9 @@ class BM25Index:
         text = text.lower()
         return re.findall(r'[\w]+', text)
 
-    def build(self, docs: List[Dict]):
+    def build(self, docs: Iterable[Dict]):
         """
-        Build the BM25 index from a list of dicts:
+        Build the BM25 index from an iterable of dicts:
             {'article_id': int, 'title': str, 'text': str}
         """
         try:
@@ -69,33 +88,100 @@ class BM25Index:
             print("⚠️ rank-bm25 not installed — BM25 disabled. Run: pip install rank-bm25")
             return
 
+        # Tokenize as we go so a streamed iterable never holds every raw text at once
+        tokenized, doc_ids, doc_titles = [], [], []
+        for d in docs:
+            tokenized.append(self._tokenize(d['text']))
+            doc_ids.append(d['article_id'])
+            doc_titles.append(d.get('title', ''))
+
+        bm25 = BM25Okapi(tokenized) if tokenized else None
+        df = Counter()
+        for freqs in bm25.doc_freqs if bm25 else ():
+            df.update(freqs.keys())
+
+        with self._lock:
+            self._bm25 = bm25
+            self._doc_ids = doc_ids
+            self._doc_titles = doc_titles
+            self._positions = {aid: i for i, aid in enumerate(doc_ids)}
+            self._df = df
+        if bm25:
+            print(f"✓ BM25 index built with {len(doc_ids)} documents")
+
+    def upsert(self, docs: Iterable[Dict]):
+        """Add or replace documents (same dicts as build()); only these are tokenised."""
+        docs = list(docs)
         if not docs:
-            self._bm25 = None
-            self._doc_ids = []
-            self._doc_titles = []
             return
-
-        tokenized = [self._tokenize(d['text']) for d in docs]
-        self._bm25 = BM25Okapi(tokenized)
-        self._doc_ids = [d['article_id'] for d in docs]
-        self._doc_titles = [d.get('title', '') for d in docs]
-        print(f"✓ BM25 index built with {len(docs)} documents")
+        if self._bm25 is None:
+            self.build(docs)
+            return
+        with self._lock:
+            bm25 = self._bm25
+            for d in docs:
+                tokens = self._tokenize(d['text'])
+                freqs = dict(Counter(tokens))
+                pos = self._positions.get(d['article_id'])
+                if pos is None:
+                    self._positions[d['article_id']] = len(self._doc_ids)
+                    self._doc_ids.append(d['article_id'])
+                    self._doc_titles.append(d.get('title', ''))
+                    bm25.doc_freqs.append(freqs)
+                    bm25.doc_len.append(len(tokens))
+                else:
+                    self._df.subtract(bm25.doc_freqs[pos].keys())
+                    self._doc_titles[pos] = d.get('title', '')
+                    bm25.doc_freqs[pos] = freqs
+                    bm25.doc_len[pos] = len(tokens)
+                self._df.update(freqs.keys())
+            self._refresh_stats()
+
+    def remove(self, article_ids: Iterable[int]):
+        """Drop documents by article_id."""
+        with self._lock:
+            drop = {self._positions[aid] for aid in article_ids if aid in self._positions}
+            if not drop:
+                return
+            bm25 = self._bm25
+            for pos in drop:
+                self._df.subtract(bm25.doc_freqs[pos].keys())
+            keep = [i for i in range(len(self._doc_ids)) if i not in drop]
+            if not keep:
+                self._bm25 = None
+                self._doc_ids, self._doc_titles = [], []
+                self._positions, self._df = {}, Counter()
+                return
+            self._doc_ids = [self._doc_ids[i] for i in keep]
+            self._doc_titles = [self._doc_titles[i] for i in keep]
+            bm25.doc_freqs = [bm25.doc_freqs[i] for i in keep]
+            bm25.doc_len = [bm25.doc_len[i] for i in keep]
+            self._positions = {aid: i for i, aid in enumerate(self._doc_ids)}
+            self._refresh_stats()
+
+    def _refresh_stats(self):
+        """Recompute corpus size, avgdl and IDF from the kept term counts (caller holds the lock)."""
+        bm25 = self._bm25
+        self._df = +self._df  # drop terms no document contains any more
+        bm25.corpus_size = len(bm25.doc_len)
+        bm25.avgdl = sum(bm25.doc_len) / bm25.corpus_size
+        bm25.idf = {}
+        bm25._calc_idf(self._df)
 
     def search(self, query: str, k: int = 20) -> List[Dict]:
         """
         Keyword search. Returns list of {article_id, title, bm25_score, rank}.
         """
-        if self._bm25 is None or not self._doc_ids:
-            return []
-
         tokens = self._tokenize(query)
-        scores = self._bm25.get_scores(tokens)
-
-        # Pair with doc info and sort
-        paired = [
-            (score, self._doc_ids[i], self._doc_titles[i])
-            for i, score in enumerate(scores)
-        ]
+        with self._lock:
+            if self._bm25 is None or not self._doc_ids:
+                return []
+            scores = self._bm25.get_scores(tokens)
+            # Pair with doc info and sort
+            paired = [
+                (score, self._doc_ids[i], self._doc_titles[i])
+                for i, score in enumerate(scores)
+            ]
         paired.sort(key=lambda x: x[0], reverse=True)
 
         results = []
@@ -117,46 +203,43 @@ class BM25Index:
 class ThrottledEmbeddings:
     """Wrapper around GoogleGenerativeAIEmbeddings that enforces rate limiting.
     
-    Prevents burst embedding calls from exceeding Gemini API rate limits.
-    Max THROTTLE_MAX_CALLS per THROTTLE_WINDOW_SECONDS (default: 40/min).
+    Every call takes a token from rate_limiter.py for EMBEDDING_MODEL — the
+    same Redis buckets every process (web, Celery, commands) shares, at the
+    caller's priority — and a 429 slows the model down for all of them.
     Also proxies all attributes so langchain/FAISS sees it as a normal embeddings object.
     """
 
-    def __init__(self, embeddings, engine=None):
+    def __init__(self, embeddings, model=EMBEDDING_MODEL):
         self._embeddings = embeddings
-        self._engine = engine  # Reference to VectorSearchEngine for shared timestamp deque
-        self._local_timestamps = deque()  # Fallback if no engine
-
-    @property
-    def _timestamps(self):
-        if self._engine is not None:
-            return self._engine._throttle_timestamps
-        return self._local_timestamps
+        self._model = model
 
     def _throttle(self):
-        """Wait if we're exceeding rate limits."""
-        now = time.time()
-        # Clean old timestamps
-        while self._timestamps and self._timestamps[0] < now - THROTTLE_WINDOW_SECONDS:
-            self._timestamps.popleft()
-        
-        if len(self._timestamps) >= THROTTLE_MAX_CALLS:
-            wait_time = self._timestamps[0] + THROTTLE_WINDOW_SECONDS - now + 0.1
-            if wait_time > 0:
-                logger.info(f'⏳ Embedding throttle: waiting {wait_time:.1f}s ({len(self._timestamps)} calls in last {THROTTLE_WINDOW_SECONDS}s)')
-                time.sleep(wait_time)
-        
-        self._timestamps.append(time.time())
+        """Wait for a rate limit token (up to EMBEDDING_WAIT_SECONDS)."""
+        from ai_engine.modules import rate_limiter
+        if not rate_limiter.acquire(self._model, timeout=EMBEDDING_WAIT_SECONDS):
+            logger.warning(f'⏳ Embedding throttle: no token for {self._model} within {EMBEDDING_WAIT_SECONDS}s, calling anyway')
+
+    def _call(self, method, arg):
+        from ai_engine.modules import rate_limiter
+        from news import profiling
+        self._throttle()
+        try:
+            with profiling.span('llm'):
+                result = getattr(self._embeddings, method)(arg)
+        except Exception as e:
+            if rate_limiter.is_rate_limit_error(e):
+                rate_limiter.penalize(self._model)
+            raise
+        rate_limiter.record_success(self._model)
+        return result
 
     def embed_query(self, text: str) -> List[float]:
         """Embed a single query with throttling."""
-        self._throttle()
-        return self._embeddings.embed_query(text)
+        return self._call('embed_query', text)
 
     def embed_documents(self, texts: List[str]) -> List[List[float]]:
         """Embed multiple documents with throttling."""
-        self._throttle()
-        return self._embeddings.embed_documents(texts)
+        return self._call('embed_documents', texts)
 
     def __getattr__(self, name):
         """Proxy all other attributes to the underlying embeddings model."""
@@ -172,7 +255,6 @@ class VectorSearchEngine:
     def __init__(self):
         """Initialize the hybrid vector search engine"""
         self._lock = threading.Lock()  # Prevent concurrent rebuild races
-        self._throttle_timestamps = deque()  # Track recent API calls for throttling
         self.embedding_model = self._get_embedding_model()
         self.vector_store = None
         self.bm25 = BM25Index()
@@ -194,10 +276,9 @@ class VectorSearchEngine:
         
         return ThrottledEmbeddings(
             embeddings=GoogleGenerativeAIEmbeddings(
-            model="models/gemini-embedding-2-preview",
+            model=f"models/{EMBEDDING_MODEL}",
                 google_api_key=api_key
             ),
-            engine=self,
         )
     
     def _load_index_from_redis(self) -> bool:
@@ -259,70 +340,76 @@ class VectorSearchEngine:
             logger.warning(f'⚠️ Failed to load from disk: {e}')
             self._rebuild_from_database()
     
-    def _rebuild_from_database(self):
+    def _rebuild_from_database(self, chunk_size: int = REBUILD_CHUNK_SIZE, progress=None):
         """Rebuild FAISS + BM25 indexes from PostgreSQL (on first startup or corruption).
         Uses STORED embedding vectors from ArticleEmbedding — NO Gemini API calls needed!
+
+        Streams vectors plus title/summary/slug in server-side cursor chunks and
+        adds them to FAISS chunk by chunk; article bodies never enter the
+        docstore (see _article_text). `progress(done, total)` is called after
+        every chunk.
         """
         with self._lock:
             try:
                 from news.models import ArticleEmbedding
+                from news.embedding_storage import unpack_vector
 
-                embeddings = ArticleEmbedding.objects.select_related('article').all()
-                count = embeddings.count()
+                count = ArticleEmbedding.objects.count()
 
                 if count == 0:
                     logger.info('ℹ️ No embeddings in database, starting with empty index')
                     self.vector_store = None
+                    self.bm25 = BM25Index()
                     return
 
                 logger.info(f'🔄 Rebuilding FAISS + BM25 from {count} stored embeddings (no API calls)...')
 
-                documents = []
-                bm25_docs = []
-                emb_vectors = []
-                for emb in embeddings:
-                    article = emb.article
-                    text = f"{article.title}\n\n{article.summary or ''}\n\n{article.content}"
-
-                    doc = Document(
-                        page_content=text,
-                        metadata={
-                            "article_id": article.id,
-                            "title": article.title,
-                            "summary": article.summary or "",
-                            "slug": article.slug,
-                        }
-                    )
-                    documents.append(doc)
-                    bm25_docs.append({'article_id': article.id, 'title': article.title, 'text': text})
-
-                    # Use stored vector if available (no API call!)
-                    vec = getattr(emb, 'embedding_vector', None)
-                    if vec is not None:
-                        emb_vectors.append(vec)
-
-                if documents and len(emb_vectors) == len(documents):
-                    # Build FAISS directly from stored vectors (FREE — no Gemini API)
-                    text_embedding_pairs = list(zip(
-                        [doc.page_content for doc in documents],
-                        emb_vectors,
-                    ))
-                    metadatas = [doc.metadata for doc in documents]
-                    self.vector_store = FAISS.from_embeddings(
-                        text_embedding_pairs,
-                        self.embedding_model,
-                        metadatas=metadatas,
-                    )
-                    logger.info(f'✅ Rebuilt FAISS from stored vectors ({len(documents)} articles, 0 API calls)')
-                elif documents:
-                    # Fallback: re-embed via API (only if no stored vectors)
-                    logger.warning('⚠️ No stored vectors — re-embedding via Gemini API')
-                    self.vector_store = FAISS.from_documents(documents, self.embedding_model)
+                rows = ArticleEmbedding.objects.order_by('id').values_list(
+                    'article_id', 'vector_data', 'vector_dtype', 'vector_dim', 'vector_scale',
+                    'embedding_vector', 'article__title', 'article__summary', 'article__slug',
+                ).iterator(chunk_size=chunk_size)
+
+                self.vector_store = None
+                done = 0
+                missing = []  # article ids without a usable stored vector
+                pairs, metadatas = [], []
+                for article_id, data, dtype, dim, scale, legacy, title, summary, slug in rows:
+                    done += 1
+                    # Packed vectors decoded with np.frombuffer (JSON only for un-backfilled rows)
+                    if data is not None:
+                        vec = unpack_vector(data, dtype, dim, scale)
+                    elif legacy:
+                        vec = np.asarray(legacy, dtype=np.float32)
+                    else:
+                        missing.append(article_id)
+                        continue
+                    pairs.append((_doc_text(title, summary), vec))
+                    metadatas.append({
+                        "article_id": article_id,
+                        "title": title,
+                        "summary": summary or "",
+                        "slug": slug,
+                    })
+                    if len(pairs) >= chunk_size:
+                        self._add_embedding_chunk(pairs, metadatas)
+                        pairs, metadatas = [], []
+                        self._report_rebuild_progress(done, count, progress)
+                if pairs:
+                    self._add_embedding_chunk(pairs, metadatas)
+                self._report_rebuild_progress(done, count, progress)
+
+                if missing:
+                    # Fallback: re-embed via API (only rows with no stored vector)
+                    logger.warning(f'⚠️ {len(missing)} embeddings have no stored vector — re-embedding via Gemini API')
+                    self._reembed_articles(missing)
+
+                indexed = self.vector_store.index.ntotal if self.vector_store else 0
+                logger.info(f'✅ Rebuilt FAISS from stored vectors ({indexed} articles, {len(missing)} API calls)')
 
                 self._save_index_to_disk()
                 self._save_index_to_redis()
-                self.bm25.build(bm25_docs)
-                logger.info(f'✅ Rebuild complete: {len(documents)} articles indexed')
+                self._rebuild_bm25_from_faiss()
+                logger.info(f'✅ Rebuild complete: {indexed} articles indexed')
 
             except Exception as e:
                 logger.error(f'❌ Failed to rebuild from database: {e}')
@@ -330,6 +417,52 @@ class VectorSearchEngine:
                 traceback.print_exc()
                 self.vector_store = None
 
+    def _add_embedding_chunk(self, pairs, metadatas):
+        """Append (text, vector) pairs to the FAISS store, creating it on the first chunk."""
+        if self.vector_store is None:
+            self.vector_store = FAISS.from_embeddings(pairs, self.embedding_model, metadatas=metadatas)
+        else:
+            self.vector_store.add_embeddings(pairs, metadatas=metadatas)
+
+    @staticmethod
+    def _report_rebuild_progress(done: int, total: int, progress=None):
+        logger.info(f'🔄 Rebuild progress: {done}/{total} ({100 * done // max(total, 1)}%)')
+        if progress:
+            progress(done, total)
+
+    def _reembed_articles(self, article_ids: List[int]):
+        """Embed articles that have no stored vector (costs one API call each)."""
+        from news.models import Article
+        rows = Article.objects.filter(id__in=article_ids).values_list('id', 'title', 'summary', 'slug', 'content')
+        for article_id, title, summary, slug, content in rows:
+            vec = self.embedding_model.embed_query(_index_text(title, summary, content))
+            self._add_embedding_chunk(
+                [(_doc_text(title, summary), vec)],
+                [{"article_id": article_id, "title": title, "summary": summary or "", "slug": slug}],
+            )
+
+    def _article_text(self, article_id: int, fallback: str = '') -> str:
+        """Full indexed text (title + summary + body) — fetched on demand, not kept in the docstore."""
+        try:
+            from news.models import Article
+            row = Article.objects.filter(id=article_id).values_list('title', 'summary', 'content').first()
+            if row:
+                return _index_text(*row)
+        except Exception as e:
+            logger.warning(f'⚠️ Could not load text for article {article_id}: {e}')
+        return fallback
+
+    def _iter_article_texts(self, article_ids, chunk_size: int = REBUILD_CHUNK_SIZE):
+        """Yield BM25 docs for `article_ids`, reading bodies one chunk at a time."""
+        from news.models import Article
+        ids = sorted(aid for aid in set(article_ids) if aid is not None)
+        for start in range(0, len(ids), chunk_size):
+            rows = Article.objects.filter(id__in=ids[start:start + chunk_size]).values_list(
+                'id', 'title', 'summary', 'content'
+            )
+            for article_id, title, summary, content in rows:
+                yield {'article_id': article_id, 'title': title, 'text': _index_text(title, summary, content)}
+
     def _save_index_to_disk(self):
         """Save FAISS index to disk for faster startup"""
         if self.vector_store:
@@ -353,17 +486,18 @@ class VectorSearchEngine:
             # to avoid SELECT FOR UPDATE sequential scans
             existing = ArticleEmbedding.objects.filter(article=article).first()
             if existing:
-                existing.embedding_vector = embedding
+                existing.set_vector(embedding)
                 existing.model_name = 'models/gemini-embedding-2-preview'
                 existing.text_hash = text_hash
-                existing.save(update_fields=['embedding_vector', 'model_name', 'text_hash', 'updated_at'])
+                existing.save(update_fields=ArticleEmbedding.VECTOR_FIELDS + ['model_name', 'text_hash', 'updated_at'])
             else:
-                ArticleEmbedding.objects.create(
+                new_emb = ArticleEmbedding(
                     article=article,
-                    embedding_vector=embedding,
                     model_name='models/gemini-embedding-2-preview',
                     text_hash=text_hash,
                 )
+                new_emb.set_vector(embedding)
+                new_emb.save()
             print(f"✓ Saved embedding to database for article {article_id}")
             
         except Exception as e:
@@ -385,7 +519,7 @@ class VectorSearchEngine:
         """
         Index a single article into FAISS + BM25 + PostgreSQL.
         """
-        text_to_index = f"{title}\n\n{summary}\n\n{content}"
+        text_to_index = _index_text(title, summary, content)
         embedding = self.embedding_model.embed_query(text_to_index)
         self._save_to_database(article_id, embedding, text_to_index)
 
@@ -395,18 +529,13 @@ class VectorSearchEngine:
             "summary": summary,
             **(metadata or {})
         }
-        document = Document(page_content=text_to_index, metadata=doc_metadata)
-
-        if self.vector_store is None:
-            self.vector_store = FAISS.from_documents([document], self.embedding_model)
-        else:
-            self.vector_store.add_documents([document])
+        self._add_embedding_chunk([(_doc_text(title, summary), embedding)], [doc_metadata])
 
         self._save_index_to_disk()
         self._save_index_to_redis()
 
-        # Rebuild BM25 from all current docs (cheap, instant)
-        self._rebuild_bm25_from_faiss()
+        # Only this article is (re)tokenised — the text is already in hand
+        self.bm25.upsert([{'article_id': article_id, 'title': title, 'text': text_to_index}])
         return True
     
     def index_articles_bulk(self, articles: List[Dict]):
@@ -414,35 +543,33 @@ class VectorSearchEngine:
         Index multiple articles at once — more efficient than one-by-one.
         Articles: List of dicts with keys: id, title, content, summary, metadata
         """
-        documents = []
+        pairs = []
+        metadatas = []
         bm25_docs = []
 
         for article in articles:
-            text_to_index = f"{article['title']}\n\n{article.get('summary', '')}\n\n{article['content']}"
+            text_to_index = _index_text(article['title'], article.get('summary', ''), article['content'])
             embedding = self.embedding_model.embed_query(text_to_index)
             self._save_to_database(article['id'], embedding, text_to_index)
 
-            doc_metadata = {
+            metadatas.append({
                 "article_id": article['id'],
                 "title": article['title'],
                 "summary": article.get('summary', ''),
                 **article.get('metadata', {})
-            }
-            documents.append(Document(page_content=text_to_index, metadata=doc_metadata))
+            })
+            pairs.append((_doc_text(article['title'], article.get('summary', '')), embedding))
             bm25_docs.append({'article_id': article['id'], 'title': article['title'], 'text': text_to_index})
 
-        if not documents:
+        if not pairs:
             return False
 
-        if self.vector_store is None:
-            self.vector_store = FAISS.from_documents(documents, self.embedding_model)
-        else:
-            self.vector_store.add_documents(documents)
+        self._add_embedding_chunk(pairs, metadatas)
 
         self._save_index_to_disk()
         self._save_index_to_redis()
-        self._rebuild_bm25_from_faiss()
-        logger.info(f'✓ Indexed {len(documents)} articles (FAISS + BM25)')
+        self.bm25.upsert(bm25_docs)
+        logger.info(f'✓ Indexed {len(pairs)} articles (FAISS + BM25)')
         return True
     
     def remove_article(self, article_id: int):
@@ -471,11 +598,9 @@ class VectorSearchEngine:
         # Fetch stored embedding vectors from PostgreSQL
         try:
             from news.models import ArticleEmbedding
+            from news.embedding_storage import load_vectors
             remaining_ids = [doc.metadata.get('article_id') for doc in all_docs]
-            stored = ArticleEmbedding.objects.filter(
-                article_id__in=remaining_ids
-            ).values_list('article_id', 'embedding_vector')
-            stored_map = {aid: vec for aid, vec in stored}
+            stored_map = load_vectors(ArticleEmbedding.objects.filter(article_id__in=remaining_ids))
 
             # Build text-embedding pairs from docs + stored vectors
             text_embedding_pairs = []
@@ -500,7 +625,7 @@ class VectorSearchEngine:
                 # Add any docs without stored vectors (rare — needs API)
                 if docs_without_vectors:
                     logger.warning(f'⚠️ {len(docs_without_vectors)} docs missing stored vectors, re-embedding')
-                    self.vector_store.add_documents(docs_without_vectors)
+                    self._reembed_articles([doc.metadata.get('article_id') for doc in docs_without_vectors])
                 logger.info(f'✓ Removed article {article_id} from FAISS (0 API calls, {len(text_embedding_pairs)} stored vectors)')
             else:
                 # No stored vectors at all — fallback to API (shouldn't happen)
@@ -512,7 +637,7 @@ class VectorSearchEngine:
 
         self._save_index_to_disk()
         self._save_index_to_redis()
-        self._rebuild_bm25_from_faiss()
+        self.bm25.remove([article_id])
         return True
     
     # ─────────────────────────────────────────────────────────────
@@ -520,19 +645,29 @@ class VectorSearchEngine:
     # ─────────────────────────────────────────────────────────────
 
     def _rebuild_bm25_from_faiss(self):
-        """Sync BM25 index from current FAISS docstore (fast, local)."""
+        """Full BM25 build for the articles in the FAISS docstore — on index
+        load and database rebuild only; single-article changes use upsert()/remove().
+
+        Article bodies are streamed from the database in chunks (the docstore
+        only holds title + summary); falls back to the docstore text if the
+        database is unreachable.
+        """
         if self.vector_store is None:
             self.bm25 = BM25Index()
             return
-        bm25_docs = [
-            {
-                'article_id': doc.metadata.get('article_id'),
-                'title': doc.metadata.get('title', ''),
-                'text': doc.page_content,
-            }
-            for doc in self.vector_store.docstore._dict.values()
-        ]
-        self.bm25.build(bm25_docs)
+        docs = list(self.vector_store.docstore._dict.values())
+        try:
+            self.bm25.build(self._iter_article_texts(doc.metadata.get('article_id') for doc in docs))
+        except Exception as e:
+            logger.warning(f'⚠️ BM25 rebuild from database failed, using docstore text: {e}')
+            self.bm25.build(
+                {
+                    'article_id': doc.metadata.get('article_id'),
+                    'title': doc.metadata.get('title', ''),
+                    'text': doc.page_content,
+                }
+                for doc in docs
+            )
 
     def _cached_embed_query(self, text: str) -> List[float]:
         """Embed query text with Redis cache — avoids repeated API calls."""
@@ -667,7 +802,7 @@ class VectorSearchEngine:
             if not target_doc:
                 print(f"⚠️ Article {article_id} not found in index")
                 return []
-            results = self.search(target_doc.page_content, k=k + 1)
+            results = self.search(self._article_text(article_id, target_doc.page_content), k=k + 1)
             return [r for r in results if r['article_id'] != article_id][:k]
         except Exception as e:
             print(f"❌ Error finding similar articles: {e}")
@@ -687,7 +822,7 @@ class VectorSearchEngine:
                 print(f"⚠️ Article {article_id} not found in index")
                 return []
             # Use title + first 500 chars of content as query for better BM25 hits
-            query = target_doc.page_content[:500]
+            query = self._article_text(article_id, target_doc.page_content)[:500]
             results = self.hybrid_search(query, k=k + 1)
             return [r for r in results if r['article_id'] != article_id][:k]
         except Exception as e:
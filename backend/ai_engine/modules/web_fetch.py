@@ -0,0 +1,531 @@
+"""
+Shared HTTP fetcher for scraping.
+
+Web search scraping, license checks, feed discovery, og:image lookups and
+YouTube thumbnail downloads fetch the same brand homepages, spec pages and
+article pages again and again across generations. They all go through
+
+    from ai_engine.modules import web_fetch
+    resp = web_fetch.get(url, headers=HEADERS)
+
+which behaves like requests.get() — returns a Response whatever the status,
+raises requests.RequestException when the request fails — but:
+
+  * reuses one pooled requests.Session per host (the MAX_HOST_SESSIONS most
+    recently used hosts) and allows at most WEB_FETCH_PER_HOST requests to a
+    host at once;
+  * retries connection errors, timeouts, 429 and 5xx WEB_FETCH_RETRIES
+    times with exponential backoff (or the server's Retry-After);
+  * keeps 200 responses in an on-disk cache (WEB_FETCH_CACHE_DIR, LRU-evicted
+    to WEB_FETCH_CACHE_MAX_MB). Entries are served while fresh per
+    Cache-Control max-age / Expires — or the caller's ttl= when the server
+    says nothing — and revalidated with If-None-Match / If-Modified-Since
+    afterwards. no-store and Vary: * responses are never stored;
+  * remembers failures (network errors, 404/410, 5xx after retries) for
+    WEB_FETCH_NEGATIVE_TTL seconds, so a dead URL isn't retried on every
+    call — and a host that doesn't resolve or refuses connections for all of
+    its URLs.
+
+stats() reports hit rate, bytes downloaded and bytes saved, totalled across
+processes through the Django cache.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import random
+import tempfile
+import threading
+import time
+from collections import Counter, OrderedDict
+from email.utils import parsedate_to_datetime
+from http import HTTPStatus
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TIMEOUT = (5, 10)  # connect, read
+DEFAULT_PER_HOST = 4
+DEFAULT_RETRIES = 2
+DEFAULT_NEGATIVE_TTL = 300
+DEFAULT_CACHE_MAX_MB = 256
+DEFAULT_CACHE_DIR = os.path.join(tempfile.gettempdir(), 'autonews_web_cache')
+
+BACKOFF_SECONDS = 0.5
+MAX_RETRY_AFTER = 10
+MAX_HEURISTIC_TTL = 86400
+MAX_CACHED_BODY = 10 * 1024 * 1024
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+NEGATIVE_STATUSES = frozenset({404, 410})
+NEGATIVE_CACHE_SIZE = 2048
+MAX_HOST_SESSIONS = 256
+
+# Not meaningful for a body that has already been decoded and re-served
+_DROPPED_HEADERS = ('content-encoding', 'content-length', 'transfer-encoding', 'connection')
+
+
+def _setting(name, default):
+    try:
+        from django.conf import settings
+        return getattr(settings, name, default)
+    except Exception:
+        return default
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Metrics
+# ═══════════════════════════════════════════════════════════════════
+
+STATS_KEY = 'web_fetch:stats:{}'
+STAT_NAMES = ('requests', 'hits', 'revalidated', 'negative_hits', 'misses',
+              'errors', 'retries', 'bytes_downloaded', 'bytes_saved')
+
+
+class _Metrics:
+    """Per-process counters, added to shared cache counters every FLUSH_SECONDS."""
+
+    FLUSH_SECONDS = 30
+
+    def __init__(self):
+        self._local = Counter()
+        self._lock = threading.Lock()
+        self._flushed_at = time.monotonic()
+
+    def add(self, name, n=1):
+        with self._lock:
+            self._local[name] += n
+            if time.monotonic() - self._flushed_at < self.FLUSH_SECONDS:
+                return
+            pending, self._local = self._local, Counter()
+            self._flushed_at = time.monotonic()
+        self._flush(pending)
+
+    def flush(self):
+        with self._lock:
+            pending, self._local = self._local, Counter()
+            self._flushed_at = time.monotonic()
+        self._flush(pending)
+
+    @staticmethod
+    def _flush(pending):
+        try:
+            from django.core.cache import cache
+            for name, n in pending.items():
+                key = STATS_KEY.format(name)
+                try:
+                    cache.incr(key, n)
+                except ValueError:  # no counter yet
+                    if not cache.add(key, n, None):
+                        cache.incr(key, n)
+        except Exception as e:
+            logger.debug(f"Web fetch stats not flushed: {e}")
+
+    def discard(self):
+        with self._lock:
+            self._local = Counter()
+
+
+_metrics = _Metrics()
+
+
+def stats():
+    """Fetch counters for all processes, with hit_rate (cache + negative hits / requests)."""
+    _metrics.flush()
+    try:
+        from django.core.cache import cache
+        shared = cache.get_many([STATS_KEY.format(name) for name in STAT_NAMES])
+    except Exception:
+        shared = {}
+    totals = {name: shared.get(STATS_KEY.format(name), 0) for name in STAT_NAMES}
+    served = totals['hits'] + totals['revalidated'] + totals['negative_hits']
+    totals['hit_rate'] = round(served / totals['requests'], 3) if totals['requests'] else 0.0
+    return totals
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Per-host sessions
+# ═══════════════════════════════════════════════════════════════════
+
+_hosts = OrderedDict()  # host → (Session, BoundedSemaphore), least recently used first
+_hosts_lock = threading.Lock()
+
+
+def _host(url):
+    host = requests.utils.urlparse(url).netloc.lower()
+    evicted = []
+    with _hosts_lock:
+        entry = _hosts.get(host)
+        if entry is None:
+            limit = max(1, int(_setting('WEB_FETCH_PER_HOST', DEFAULT_PER_HOST)))
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=limit)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            entry = _hosts[host] = (session, threading.BoundedSemaphore(limit))
+            # Search results bring arbitrary domains — don't keep a pool for each forever
+            while len(_hosts) > MAX_HOST_SESSIONS:
+                evicted.append(_hosts.popitem(last=False)[1][0])
+        else:
+            _hosts.move_to_end(host)
+    for session in evicted:
+        # Idle connections close now; one still in use closes when it is released
+        session.close()
+    return entry
+
+
+def _retry_after(resp):
+    value = resp.headers.get('Retry-After', '')
+    try:
+        return min(float(value), MAX_RETRY_AFTER)
+    except ValueError:
+        return 0
+
+
+def _request(url, headers, timeout, allow_redirects, retries):
+    session, slots = _host(url)
+    attempt = 0
+    while True:
+        try:
+            with slots:
+                resp = session.get(url, headers=headers, timeout=timeout, allow_redirects=allow_redirects)
+        except (requests.ConnectionError, requests.Timeout):
+            if attempt >= retries:
+                raise
+            delay = 0
+        else:
+            if resp.status_code not in RETRY_STATUSES or attempt >= retries:
+                return resp
+            delay = _retry_after(resp)
+            resp.close()
+        delay = max(delay, BACKOFF_SECONDS * 2 ** attempt * (1 + random.random() / 2))
+        attempt += 1
+        _metrics.add('retries')
+        time.sleep(delay)
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Negative cache (in memory)
+# ═══════════════════════════════════════════════════════════════════
+
+def _host_unreachable(exc):
+    """
+    True for DNS resolution failures and refused connections — every URL on the
+    host would fail the same way. Resets, aborted connections and TLS errors can
+    be one-off and are only remembered for the URL.
+    """
+    from urllib3.exceptions import MaxRetryError, NewConnectionError
+
+    if not isinstance(exc, requests.ConnectionError) or isinstance(exc, (requests.Timeout, requests.exceptions.SSLError)):
+        return False
+    reason = exc.args[0] if exc.args else None
+    if isinstance(reason, MaxRetryError):
+        reason = reason.reason
+    # NameResolutionError is a NewConnectionError
+    return isinstance(reason, NewConnectionError)
+
+
+_negative = OrderedDict()  # key → (expires, status | exception class, message)
+_negative_lock = threading.Lock()
+
+
+def _remember_failure(key, failure, message=''):
+    ttl = _setting('WEB_FETCH_NEGATIVE_TTL', DEFAULT_NEGATIVE_TTL)
+    if ttl <= 0:
+        return
+    with _negative_lock:
+        _negative[key] = (time.monotonic() + ttl, failure, message)
+        _negative.move_to_end(key)
+        while len(_negative) > NEGATIVE_CACHE_SIZE:
+            _negative.popitem(last=False)
+
+
+def _recent_failure(key):
+    with _negative_lock:
+        entry = _negative.get(key)
+        if entry and entry[0] <= time.monotonic():
+            del _negative[key]
+            return None
+        return entry
+
+
+# ═══════════════════════════════════════════════════════════════════
+# On-disk HTTP cache
+# ═══════════════════════════════════════════════════════════════════
+
+class DiskCache:
+    """
+    One file per response — a JSON metadata line followed by the body —
+    written atomically. A file's mtime is its last use; the least recently
+    used files go first once the directory exceeds `max_bytes`.
+    """
+
+    def __init__(self, directory, max_bytes):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._size = None  # bytes on disk, counted on first store
+        self._lock = threading.Lock()
+
+    def _path(self, key):
+        return os.path.join(self.directory, key[:2], key)
+
+    def load(self, key):
+        """(meta, body) or None."""
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                meta = json.loads(f.readline())
+                body = f.read()
+            os.utime(path)  # mark as recently used
+            return meta, body
+        except (OSError, ValueError):
+            return None
+
+    def store(self, key, meta, body):
+        path = self._path(key)
+        tmp = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(tmp, 'wb') as f:
+                f.write(json.dumps(meta).encode() + b'\n')
+                f.write(body)
+            written = os.path.getsize(tmp)
+            os.replace(tmp, path)
+        except OSError as e:
+            logger.debug(f"Web cache write failed for {meta.get('url')}: {e}")
+            return
+        with self._lock:
+            if self._size is None:
+                self._size = self._scan_size()
+            else:
+                self._size += written
+            over = self._size > self.max_bytes
+        if over:
+            self.evict()
+
+    def _files(self):
+        for root, _, names in os.walk(self.directory):
+            for name in names:
+                if not name.endswith('.tmp'):
+                    path = os.path.join(root, name)
+                    try:
+                        st = os.stat(path)
+                    except OSError:
+                        continue
+                    yield st.st_mtime, st.st_size, path
+
+    def _scan_size(self):
+        return sum(size for _, size, _ in self._files())
+
+    def evict(self):
+        """Drop least recently used entries until the store is at 90% of its limit."""
+        with self._lock:
+            files = sorted(self._files())
+            total = sum(size for _, size, _ in files)
+            target = self.max_bytes * 0.9
+            removed = 0
+            for _, size, path in files:
+                if total <= target:
+                    break
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+                total -= size
+                removed += 1
+            self._size = total
+        if removed:
+            logger.info(f"🧹 Web cache: evicted {removed} entries ({total // 1024} KB kept)")
+
+
+_disk = None
+_disk_lock = threading.Lock()
+
+
+def _store():
+    """Process-wide DiskCache, or None when WEB_FETCH_CACHE_MAX_MB is 0."""
+    global _disk
+    max_mb = _setting('WEB_FETCH_CACHE_MAX_MB', DEFAULT_CACHE_MAX_MB)
+    if not max_mb:
+        return None
+    directory = _setting('WEB_FETCH_CACHE_DIR', '') or DEFAULT_CACHE_DIR
+    with _disk_lock:
+        if _disk is None or _disk.directory != directory:
+            _disk = DiskCache(directory, int(max_mb * 1024 * 1024))
+        _disk.max_bytes = int(max_mb * 1024 * 1024)
+        return _disk
+
+
+def _cache_key(url, headers):
+    # Callers negotiate content only through these; other headers don't change the body
+    vary = '\n'.join(headers.get(h, '') for h in ('Accept', 'Accept-Language'))
+    return hashlib.sha256(f'{url}\n{vary}'.encode()).hexdigest()
+
+
+def _directives(headers):
+    directives = {}
+    for part in headers.get('Cache-Control', '').lower().split(','):
+        name, _, value = part.strip().partition('=')
+        if name:
+            directives[name] = value.strip('"')
+    return directives
+
+
+def _http_date(value):
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError, IndexError):
+        return None
+
+
+def freshness(headers, ttl=None, now=None):
+    """
+    Seconds a response may be reused without revalidation, or None when it
+    must not be stored. Server directives win; `ttl` applies only when the
+    server gives no freshness information.
+    """
+    directives = _directives(headers)
+    if 'no-store' in directives or headers.get('Vary', '').strip() == '*':
+        return None
+    if 'no-cache' in directives:
+        return 0
+    age = str(headers.get('Age', ''))
+    age = int(age) if age.isdigit() else 0
+    for name in ('s-maxage', 'max-age'):
+        if directives.get(name, '').isdigit():
+            return max(0, int(directives[name]) - age)
+    expires = _http_date(headers.get('Expires'))
+    if expires is not None:
+        date = _http_date(headers.get('Date')) or now or time.time()
+        return max(0, expires - date)
+    if ttl is not None:
+        return ttl
+    # RFC 9111 heuristic: 10% of the time since the last modification
+    last_modified = _http_date(headers.get('Last-Modified'))
+    if last_modified is not None:
+        return min(MAX_HEURISTIC_TTL, max(0, ((now or time.time()) - last_modified) / 10))
+    return 0
+
+
+def _response(url, status, headers, body):
+    resp = requests.Response()
+    resp.status_code = status
+    resp.headers = CaseInsensitiveDict(headers)
+    resp._content = body
+    resp.url = url
+    try:
+        resp.reason = HTTPStatus(status).phrase
+    except ValueError:
+        resp.reason = ''
+    resp.encoding = requests.utils.get_encoding_from_headers(resp.headers)
+    return resp
+
+
+def _store_response(store, key, url, resp, ttl):
+    if store is None or resp.status_code != 200 or len(resp.content) > MAX_CACHED_BODY:
+        return
+    fresh_for = freshness(resp.headers, ttl)
+    validators = resp.headers.get('ETag') or resp.headers.get('Last-Modified')
+    if fresh_for is None or (fresh_for <= 0 and not validators):
+        return
+    headers = {k: v for k, v in resp.headers.items() if k.lower() not in _DROPPED_HEADERS}
+    store.store(key, {
+        'url': resp.url or url,
+        'status': resp.status_code,
+        'headers': headers,
+        'expires': time.time() + fresh_for,
+        'ttl': ttl,
+    }, resp.content)
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Public API
+# ═══════════════════════════════════════════════════════════════════
+
+def get(url, params=None, headers=None, timeout=None, allow_redirects=True,
+        ttl=None, use_cache=True, retries=None):
+    """
+    GET `url` like requests.get(), through the pooled, cached fetcher.
+
+    ttl:       freshness (seconds) to assume when the server sends no
+               Cache-Control/Expires — e.g. 86400 for robots.txt.
+    use_cache: False skips the HTTP and negative caches (still pooled/retried).
+    """
+    url = requests.Request('GET', url, params=params).prepare().url
+    headers = dict(headers or {})
+    timeout = timeout or DEFAULT_TIMEOUT
+    retries = _setting('WEB_FETCH_RETRIES', DEFAULT_RETRIES) if retries is None else retries
+    key = _cache_key(url, headers)
+    store = _store() if use_cache else None
+    cached = None
+    _metrics.add('requests')
+
+    host_key = 'host:' + requests.utils.urlparse(url).netloc.lower()
+    if use_cache:
+        failure = _recent_failure(key) or _recent_failure(host_key)
+        if failure:
+            _metrics.add('negative_hits')
+            _, kind, message = failure
+            if isinstance(kind, int):
+                return _response(url, kind, {}, b'')
+            raise kind(f'{message} (cached failure)')
+
+    if store is not None:
+        cached = store.load(key)
+        if cached:
+            meta, body = cached
+            if meta['expires'] > time.time():
+                _metrics.add('hits')
+                _metrics.add('bytes_saved', len(body))
+                return _response(meta['url'], meta['status'], meta['headers'], body)
+            stored_headers = CaseInsensitiveDict(meta['headers'])
+            etag, modified = stored_headers.get('ETag'), stored_headers.get('Last-Modified')
+            if etag:
+                headers.setdefault('If-None-Match', etag)
+            if modified:
+                headers.setdefault('If-Modified-Since', modified)
+
+    try:
+        resp = _request(url, headers, timeout, allow_redirects, retries)
+    except requests.RequestException as e:
+        _metrics.add('errors')
+        if use_cache:
+            _remember_failure(key, type(e), str(e)[:200])
+            if _host_unreachable(e):
+                _remember_failure(host_key, type(e), str(e)[:200])
+        raise
+
+    if resp.status_code == 304 and cached:
+        meta, body = cached
+        _metrics.add('revalidated')
+        _metrics.add('bytes_saved', len(body))
+        headers = CaseInsensitiveDict(meta['headers'])
+        headers.update({k: v for k, v in resp.headers.items() if k.lower() not in _DROPPED_HEADERS})
+        refreshed = _response(meta['url'], meta['status'], headers, body)
+        _store_response(store, key, url, refreshed, meta.get('ttl'))
+        return refreshed
+
+    _metrics.add('misses')
+    _metrics.add('bytes_downloaded', len(resp.content))
+    if resp.status_code == 200:
+        _store_response(store, key, url, resp, ttl)
+    elif use_cache and (resp.status_code in NEGATIVE_STATUSES or resp.status_code >= 500):
+        _remember_failure(key, resp.status_code)
+    return resp
+
+
+def reset():
+    """Forget sessions, remembered failures and unflushed counters (tests, settings changes)."""
+    global _disk
+    with _hosts_lock:
+        for session, _ in _hosts.values():
+            session.close()
+        _hosts.clear()
+    with _negative_lock:
+        _negative.clear()
+    with _disk_lock:
+        _disk = None
+    _metrics.discard()
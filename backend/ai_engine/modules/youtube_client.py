@@ -1,9 +1,15 @@
 import os
+import threading
 import requests
 from datetime import datetime, timedelta, timezone
 import re
 
 
+# YouTube Data API v3 quota costs (units per call)
+QUOTA_COST_LIST = 1      # channels.list, playlistItems.list, videos.list
+QUOTA_COST_SEARCH = 100  # search.list
+
+
 def _quota_reset_message():
     """Calculate hours until YouTube API quota resets (midnight Pacific Time)."""
     pacific = timezone(timedelta(hours=-8))
@@ -14,14 +20,55 @@ def _quota_reset_message():
         return "YouTube API quota exceeded. Resets in less than 1 hour."
     return f"YouTube API quota exceeded. Resets in ~{hours_left}h."
 
+
+class QuotaExhausted(Exception):
+    """Raised when a scan's shared YouTube quota budget has been spent."""
+
+
+class QuotaBudget:
+    """Thread-safe quota unit budget shared by concurrent channel fetches.
+
+    One budget is created per scan so that parallel workers cannot
+    collectively burn more than ``limit`` units. ``limit=None`` disables
+    the cap but still counts units for logging.
+    """
+
+    def __init__(self, limit=None):
+        self.limit = limit
+        self.used = 0
+        self._lock = threading.Lock()
+
+    def charge(self, units):
+        """Reserve ``units`` or raise QuotaExhausted if the budget is spent."""
+        with self._lock:
+            if self.limit is not None and self.used + units > self.limit:
+                raise QuotaExhausted(
+                    f"YouTube scan quota budget exhausted ({self.used}/{self.limit} units)"
+                )
+            self.used += units
+
+    @property
+    def remaining(self):
+        if self.limit is None:
+            return None
+        with self._lock:
+            return max(0, self.limit - self.used)
+
+
 class YouTubeClient:
-    def __init__(self, api_key=None):
+    def __init__(self, api_key=None, quota_budget=None):
         self.api_key = api_key or os.getenv('YOUTUBE_API_KEY')
         self.base_url = "https://www.googleapis.com/youtube/v3"
+        self.quota_budget = quota_budget
         
         if not self.api_key:
             print("⚠️ Warning: YOUTUBE_API_KEY not found in environment variables")
 
+    def _charge(self, units):
+        """Charge the shared quota budget (no-op when none is attached)."""
+        if self.quota_budget is not None:
+            self.quota_budget.charge(units)
+
     def _get_channel_id(self, channel_url):
         """Extract or fetch channel ID from URL"""
         # 1. Try to find channel ID in URL (if it's already an ID)
@@ -70,6 +117,7 @@ class YouTubeClient:
             'key': self.api_key,
         }
 
+        self._charge(QUOTA_COST_LIST)
         try:
             response = requests.get(url, params=params)
             if response.status_code == 200:
@@ -107,6 +155,7 @@ class YouTubeClient:
             'maxResults': 1
         }
         
+        self._charge(QUOTA_COST_SEARCH)
         try:
             response = requests.get(url, params=params)
             if response.status_code == 200:
@@ -160,6 +209,7 @@ class YouTubeClient:
             'key': self.api_key
         }
         
+        self._charge(QUOTA_COST_LIST)
         try:
             response = requests.get(url, params=params)
             if response.status_code != 200:
@@ -189,6 +239,7 @@ class YouTubeClient:
             'key': self.api_key
         }
         
+        self._charge(QUOTA_COST_LIST)
         try:
             response = requests.get(url, params=params)
             if response.status_code != 200:
@@ -237,6 +288,7 @@ class YouTubeClient:
         }
 
         try:
+            self._charge(QUOTA_COST_LIST)
             response = requests.get(url, params=params)
             if response.status_code != 200:
                 print(f"⚠️ videos.list enrichment failed: {response.status_code}")
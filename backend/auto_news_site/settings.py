@@ -98,6 +98,7 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'corsheaders.middleware.CorsMiddleware',  # CORS - MUST be first!
+    'news.profiling.ProfilingMiddleware',  # Sampled per-route SQL/cache/HTTP/LLM profiling (off unless PROFILING_SAMPLE_RATE)
     'django.middleware.security.SecurityMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',  # Serve static files
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -745,47 +746,76 @@ CELERY_WORKER_MAX_TASKS_PER_CHILD = 50  # Restart worker after 50 tasks to preve
 CELERY_WORKER_PREFETCH_MULTIPLIER = 1  # One task at a time (tasks are long-running)
 CELERY_BROKER_CONNECTION_RETRY_ON_STARTUP = True
 
-# Beat schedule — all periodic tasks
-from celery.schedules import crontab
-
+# YouTube scan: hand AI generation to Celery workers instead of generating inline.
+# Only enable where a worker is running (Railway's Procfile has web only).
+YOUTUBE_SCAN_ENQUEUE_GENERATION = os.getenv('YOUTUBE_SCAN_ENQUEUE_GENERATION', 'false').lower() == 'true'
+
+# ArticleEmbedding packed vector dtype: float32 (exact), float16 or int8 (quantised).
+# Existing rows are re-encoded with `manage.py pack_embeddings --repack`.
+EMBEDDING_STORAGE_DTYPE = os.getenv('EMBEDDING_STORAGE_DTYPE', 'float32').lower()
+
+# Off-request image renditions (news/image_pipeline.py): process-pool size,
+# 0 = half the CPUs.
+IMAGE_PIPELINE_WORKERS = int(os.getenv('IMAGE_PIPELINE_WORKERS', '0'))
+
+# Article save side effects (news/side_effects.py): pool size, per-article
+# coalescing window, and 'thread' (in-process pool) or 'celery' (worker queue).
+SIDE_EFFECT_WORKERS = int(os.getenv('SIDE_EFFECT_WORKERS', '4'))
+SIDE_EFFECT_COALESCE_SECONDS = float(os.getenv('SIDE_EFFECT_COALESCE_SECONDS', '2'))
+SIDE_EFFECT_BACKEND = os.getenv('SIDE_EFFECT_BACKEND', 'thread').lower()
+
+# RSS bulk generation (news/rss_bulk_generation.py): items generated at once
+# per job; each still waits for AI rate-limit headroom before starting.
+RSS_BULK_GENERATE_WORKERS = int(os.getenv('RSS_BULK_GENERATE_WORKERS', '3'))
+
+# Scraping fetcher (ai_engine/modules/web_fetch.py): concurrent requests per
+# host, retries, how long failures are remembered, and the on-disk HTTP cache
+# (0 MB disables it; the directory defaults to the system temp dir).
+WEB_FETCH_PER_HOST = int(os.getenv('WEB_FETCH_PER_HOST', '4'))
+WEB_FETCH_RETRIES = int(os.getenv('WEB_FETCH_RETRIES', '2'))
+WEB_FETCH_NEGATIVE_TTL = int(os.getenv('WEB_FETCH_NEGATIVE_TTL', '300'))
+WEB_FETCH_CACHE_MAX_MB = int(os.getenv('WEB_FETCH_CACHE_MAX_MB', '256'))
+WEB_FETCH_CACHE_DIR = os.getenv('WEB_FETCH_CACHE_DIR', '')
+
+# Web search context for generation (ai_engine/modules/searcher.py): time
+# budget for searching and scraping, and how long a car's context is reused.
+WEB_CONTEXT_DEADLINE = float(os.getenv('WEB_CONTEXT_DEADLINE', '20'))
+WEB_CONTEXT_CACHE_TTL = int(os.getenv('WEB_CONTEXT_CACHE_TTL', str(6 * 3600)))
+# Google is only a fallback (scraping it risks blocks): queried when direct
+# sites + DuckDuckGo have fewer than MIN_RESULTS results once they finish or
+# AFTER seconds pass. MIN_RESULTS=0 never queries Google.
+WEB_CONTEXT_GOOGLE_AFTER = float(os.getenv('WEB_CONTEXT_GOOGLE_AFTER', '8'))
+WEB_CONTEXT_GOOGLE_MIN_RESULTS = int(os.getenv('WEB_CONTEXT_GOOGLE_MIN_RESULTS', '1'))
+
+# Bulk AI maintenance commands (news/batch_runner.py): items processed at
+# once; starts are still paced to the model tier's rate limits.
+BATCH_WORKERS = int(os.getenv('BATCH_WORKERS', '4'))
+
+# AI provider rate limiter (ai_engine/modules/rate_limiter.py): how long a
+# call waits for a token when its whole model cascade is at its limits, and
+# the share of each burst that batch jobs leave for interactive generation.
+AI_RATE_WAIT_SECONDS = float(os.getenv('AI_RATE_WAIT_SECONDS', '30'))
+AI_RATE_BATCH_RESERVE = float(os.getenv('AI_RATE_BATCH_RESERVE', '0.5'))
+
+# Request profiling (news/profiling.py): share of requests profiled (0 = off),
+# samples kept per route for percentiles, and the threshold for keeping a
+# full trace of a sampled request.
+PROFILING_SAMPLE_RATE = float(os.getenv('PROFILING_SAMPLE_RATE', '0'))
+PROFILING_WINDOW = int(os.getenv('PROFILING_WINDOW', '200'))
+PROFILING_SLOW_MS = float(os.getenv('PROFILING_SLOW_MS', '1000'))
+PROFILING_TRACES_KEPT = int(os.getenv('PROFILING_TRACES_KEPT', '50'))
+
+# Periodic job scheduler (news/job_scheduler.py):
+#   'thread' — the Redis-elected leader web process runs the jobs (Railway: web only)
+#   'celery' — beat ticks, Celery workers run the jobs, web processes stay free
+SCHEDULER_MODE = os.getenv('SCHEDULER_MODE', 'thread').lower()
+
+# Beat only drives the scheduler tick; job intervals come from AutomationSettings
+# and news/scheduler.py, and duplicate ticks are absorbed by occurrence claims.
 CELERY_BEAT_SCHEDULE = {
-    # --- Fixed-interval tasks ---
-    'gsc-sync-every-6h': {
-        'task': 'news.tasks.gsc_sync',
-        'schedule': crontab(minute=0, hour='*/6'),
-    },
-    'currency-update-daily': {
-        'task': 'news.tasks.currency_update',
-        'schedule': crontab(minute=30, hour=3),  # 3:30 AM Israel time
-    },
-    'scheduled-publish-every-minute': {
-        'task': 'news.tasks.scheduled_publish',
-        'schedule': crontab(minute='*'),  # Every minute
-    },
-    'deep-specs-backfill-every-6h': {
-        'task': 'news.tasks.deep_specs_backfill',
-        'schedule': crontab(minute=15, hour='*/6'),
-    },
-    'ab-lifecycle-daily': {
-        'task': 'news.tasks.ab_lifecycle',
-        'schedule': crontab(minute=0, hour=4),  # 4 AM Israel time
-    },
-    'stale-error-cleanup-every-6h': {
-        'task': 'news.tasks.stale_error_cleanup',
-        'schedule': crontab(minute=45, hour='*/6'),
-    },
-    # --- Dynamic-interval tasks (check settings each run) ---
-    'rss-scan': {
-        'task': 'news.tasks.rss_scan',
-        'schedule': crontab(minute='*/30'),  # Check every 30 min, task itself checks settings
-    },
-    'youtube-scan': {
-        'task': 'news.tasks.youtube_scan',
-        'schedule': crontab(minute='*/30'),  # Check every 30 min, task itself checks settings
-    },
-    'auto-publish-check': {
-        'task': 'news.tasks.auto_publish',
-        'schedule': crontab(minute='*/10'),  # Every 10 min
+    'scheduler-tick': {
+        'task': 'news.tasks.scheduler_tick',
+        'schedule': 15.0,
     },
 }
 
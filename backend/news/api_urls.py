@@ -29,7 +29,7 @@ from .api_views import (
 )
 from .health import health_check, health_check_detailed, readiness_check
 from .api_views.video_inbox import VideoInboxViewSet
-from .api_views.system_graph import SystemGraphView, EmbeddingStatsView
+from .api_views.system_graph import SystemGraphView, EmbeddingStatsView, ProfilingStatsView
 from .ab_testing_views import (
     ABImpressionView, ABClickView, ABTestsListView,
     ABPickWinnerView, ABAutoPickView
@@ -172,7 +172,7 @@ from .search_analytics_views import (
 from .cars import CarBrandsListView, CarBrandDetailView, CarModelDetailView, BrandCleanupView, BrandViewSet, CarCompareView, CarPickerListView
 from .api_views.ai_costs import AICostDashboardView, TimingHistoryView
 from .api_views.moderation import ModerationQueueView
-from .api_views.token_usage import TokenUsageSummaryView, TokenUsageRealtimeView
+from .api_views.token_usage import TokenUsageSummaryView, TokenUsageRealtimeView, TokenUsageRateLimitsView
 from .api_views.ml_trainer import MLTrainerNextPairView, MLTrainerSubmitFeedbackView
 
 class RepairArticleHTMLView(APIView):
@@ -202,6 +202,7 @@ urlpatterns = [
     path('health/errors-summary/', HealthSummaryView.as_view(), name='health_errors_summary'),
     path('health/graph-data/', SystemGraphView.as_view(), name='system_graph_data'),
     path('health/embedding-stats/', EmbeddingStatsView.as_view(), name='embedding_stats'),
+    path('health/profiling/', ProfilingStatsView.as_view(), name='profiling_stats'),
     path('health/detailed/', health_check_detailed, name='health_check_detailed'),
     path('health/ready/', readiness_check, name='readiness_check'),
     
@@ -299,6 +300,7 @@ urlpatterns = [
     path('admin/ai-costs/timing-history/', TimingHistoryView.as_view(), name='admin_timing_history'),
     path('admin/token-usage/summary/', TokenUsageSummaryView.as_view(), name='admin_token_usage_summary'),
     path('admin/token-usage/realtime/', TokenUsageRealtimeView.as_view(), name='admin_token_usage_realtime'),
+    path('admin/token-usage/rate-limits/', TokenUsageRateLimitsView.as_view(), name='admin_token_usage_rate_limits'),
     path('admin/moderation/', ModerationQueueView.as_view(), name='admin_moderation'),
     path('admin/scheduled-tasks/', ScheduledTasksView.as_view(), name='admin_scheduled_tasks'),
     
@@ -7,7 +7,7 @@ from rest_framework.permissions import IsAuthenticatedOrReadOnly, IsAuthenticate
 from django.shortcuts import get_object_or_404
 from django.core.cache import cache
 from django.utils.decorators import method_decorator
-from django.views.decorators.cache import cache_page
+from ..cache_versions import versioned_cache_page
 from django_ratelimit.decorators import ratelimit
 from django.contrib.auth.models import User
 from django.utils import timezone
@@ -49,7 +49,9 @@ class ArticleViewSet(
     - ArticleEnrichmentMixin: extract_specs, re_enrich, bulk_re_enrich, bulk_re_enrich_status,
       debug_vehicle_specs
     """
-    queryset = Article.objects.filter(is_deleted=False).select_related('specs').prefetch_related('categories', 'tags', 'gallery').annotate(
+    queryset = Article.objects.filter(is_deleted=False).select_related(
+        'specs', 'image_asset', 'image_2_asset', 'image_3_asset',
+    ).prefetch_related('categories', 'tags', 'gallery__image_asset').annotate(
         avg_rating=Avg('ratings__rating'),
         num_ratings=Count('ratings'),
     )
@@ -163,7 +165,7 @@ class ArticleViewSet(
             return super().list(request, *args, **kwargs)
         return self._cached_list(request, *args, **kwargs)
 
-    @method_decorator(cache_page(60, key_prefix='articles_list'))  # Cache for 1 minute
+    @method_decorator(versioned_cache_page(60, 'articles_list'))  # Cache for 1 minute
     def _cached_list(self, request, *args, **kwargs):
         return super().list(request, *args, **kwargs)
 
@@ -7,7 +7,7 @@ from rest_framework.views import APIView
 from django.shortcuts import get_object_or_404
 from django.core.cache import cache
 from django.utils.decorators import method_decorator
-from django.views.decorators.cache import cache_page
+from ..cache_versions import versioned_cache_page
 from django_ratelimit.decorators import ratelimit
 from django.contrib.auth.models import User
 from django.contrib.auth.hashers import check_password
@@ -90,7 +90,7 @@ class CategoryViewSet(viewsets.ModelViewSet):
             return super().list(request, *args, **kwargs)
         return self._cached_list(request, *args, **kwargs)
 
-    @method_decorator(cache_page(300, key_prefix='categories_list'))  # Cache for 5 minutes
+    @method_decorator(versioned_cache_page(300, 'categories_list'))  # Cache for 5 minutes
     def _cached_list(self, request, *args, **kwargs):
         return super().list(request, *args, **kwargs)
 
@@ -147,7 +147,7 @@ class TagViewSet(viewsets.ModelViewSet):
             return Response(serializer.data)
         return self._cached_list(request, *args, **kwargs)
 
-    @method_decorator(cache_page(300, key_prefix='tags_list'))  # Cache for 5 minutes
+    @method_decorator(versioned_cache_page(300, 'tags_list'))  # Cache for 5 minutes
     def _cached_list(self, request, *args, **kwargs):
         queryset = self.filter_queryset(self.get_queryset())
         # Apply popularity ordering AFTER DRF's filter pipeline
@@ -7,7 +7,7 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, AllowAny, IsAdminUser
 from django.utils.decorators import method_decorator
-from django.views.decorators.cache import cache_page
+from news.cache_versions import versioned_cache_page
 from django_ratelimit.decorators import ratelimit
 import logging
 
@@ -517,7 +517,7 @@ class ArticleEngagementMixin:
         return Response({'success': True, 'new_image_source': winner.image_source, 'variant': winner.variant, 'ctr': winner.ctr})
 
     @action(detail=False, methods=['get'])
-    @method_decorator(cache_page(60 * 15, key_prefix='trending'))
+    @method_decorator(versioned_cache_page(60 * 15, 'trending'))
     def trending(self, request):
         """Get trending articles (most viewed in last 30 days, fallback to all-time)"""
         from django.utils import timezone
@@ -525,23 +525,29 @@ class ArticleEngagementMixin:
         from news.models import Article
         from news.serializers import ArticleListSerializer
         month_ago = timezone.now() - timedelta(days=30)
-        trending = Article.objects.defer('engagement_score', 'engagement_updated_at').filter(
+        trending = Article.objects.select_related('image_asset').defer(
+            'engagement_score', 'engagement_updated_at',
+        ).filter(
             is_published=True, is_deleted=False, created_at__gte=month_ago, views__gt=0,
         ).order_by('-views')[:10]
         if not trending.exists():
-            trending = Article.objects.defer('engagement_score', 'engagement_updated_at').filter(
+            trending = Article.objects.select_related('image_asset').defer(
+                'engagement_score', 'engagement_updated_at',
+            ).filter(
                 is_published=True, is_deleted=False,
             ).order_by('-views')[:10]
         serializer = ArticleListSerializer(trending, many=True, context={'request': request})
         return Response(serializer.data)
 
     @action(detail=False, methods=['get'])
-    @method_decorator(cache_page(60 * 60, key_prefix='popular'))
+    @method_decorator(versioned_cache_page(60 * 60, 'popular'))
     def popular(self, request):
         """Get most popular articles (all time)"""
         from news.models import Article
         from news.serializers import ArticleListSerializer
-        popular = Article.objects.defer('engagement_score', 'engagement_updated_at').filter(
+        popular = Article.objects.select_related('image_asset').defer(
+            'engagement_score', 'engagement_updated_at',
+        ).filter(
             is_published=True, is_deleted=False
         ).order_by('-views')[:10]
         serializer = ArticleListSerializer(popular, many=True, context={'request': request})
@@ -558,108 +564,46 @@ class ArticleEngagementMixin:
 
     @action(detail=True, methods=['get'])
     def similar_articles(self, request, slug=None):
-        """Find similar articles using TF-IDF ML model + make/model fallback."""
-        from news.models import Article, CarSpecification
+        """Similar articles from the materialised RelatedArticle table (see news/related_articles.py)."""
+        from news.models import Article
         from news.serializers import ArticleListSerializer
+        from news.related_articles import MAX_RELATED, fallback_related
+        from news import side_effects
+        from django.db.models import Avg, Count, F
         article = self.get_object()
-        result_ids = []
-        # Try local ML model first (free, instant, no API calls)
-        try:
-            from ai_engine.modules.content_recommender import find_similar, is_available
-            if is_available():
-                similar = find_similar(article.id, top_n=15)
-                result_ids = [s['id'] for s in similar]
-                logger.info(f"ML found {len(result_ids)} similar articles for {article.id}")
-        except Exception as e:
-            logger.warning(f"ML similar search failed for {article.id}: {e}")
-        # Fallback to vector search engine if ML didn't find enough
-        if len(result_ids) < 6:
-            try:
-                from ai_engine.modules.vector_search import get_vector_engine
-                engine = get_vector_engine()
-                similar = engine.find_similar_articles_hybrid(article.id, k=15)
-                for s in similar:
-                    aid = s['article_id']
-                    if aid not in result_ids and aid != article.id:
-                        result_ids.append(aid)
-            except Exception as e:
-                logger.warning(f"Hybrid vector search fallback failed for {article.id}: {e}")
-        if len(result_ids) < 6:
-            try:
-                car_spec = CarSpecification.objects.filter(article=article).first()
-                if car_spec and car_spec.make and car_spec.make != 'Not specified':
-                    existing_ids = set(result_ids) | {article.id}
-                    if car_spec.model and car_spec.model != 'Not specified':
-                        same_model = CarSpecification.objects.filter(
-                            make__iexact=car_spec.make, model__iexact=car_spec.model,
-                            article__is_published=True, article__is_deleted=False
-                        ).exclude(article_id__in=existing_ids).values_list('article_id', flat=True)[:5]
-                        result_ids.extend(same_model)
-                        existing_ids.update(same_model)
-                    same_make = CarSpecification.objects.filter(
-                        make__iexact=car_spec.make, article__is_published=True, article__is_deleted=False
-                    ).exclude(article_id__in=existing_ids).values_list('article_id', flat=True)[:8]
-                    result_ids.extend(same_make)
-            except Exception as e:
-                logger.warning(f"Make/model fallback failed: {e}")
-        # Fallback: match by price, body type, and horsepower via VehicleSpecs
-        if len(result_ids) < 6:
+        if article.related_computed_at is None:
+            # Never computed (new article, job not run yet) — serve the database-only
+            # ranking and queue the full refresh; GET stays read-only
+            side_effects.dispatch('related_articles', article.id)
             try:
-                from news.models.vehicles import VehicleSpecs
-                v_spec = VehicleSpecs.objects.filter(article=article).first()
-                if v_spec:
-                    existing_ids = set(result_ids) | {article.id}
-                    filters = {
-                        'article__is_published': True,
-                        'article__is_deleted': False,
-                    }
-                    # Match by body type (exact)
-                    if v_spec.body_type:
-                        filters['body_type'] = v_spec.body_type
-                    # Match by price range (±30%)
-                    if v_spec.price_from:
-                        price_low = int(v_spec.price_from * 0.7)
-                        price_high = int(v_spec.price_from * 1.3)
-                        filters['price_from__gte'] = price_low
-                        filters['price_from__lte'] = price_high
-                    # Match by horsepower (±40%)
-                    if v_spec.power_hp:
-                        hp_low = int(v_spec.power_hp * 0.6)
-                        hp_high = int(v_spec.power_hp * 1.4)
-                        filters['power_hp__gte'] = hp_low
-                        filters['power_hp__lte'] = hp_high
-                    spec_matches = VehicleSpecs.objects.filter(
-                        **filters
-                    ).exclude(
-                        article_id__in=existing_ids
-                    ).order_by('-article__views').values_list(
-                        'article_id', flat=True
-                    ).distinct()[:10]
-                    result_ids.extend(spec_matches)
-                    logger.info(f"VehicleSpecs similarity found {len(spec_matches)} matches for article {article.id}")
+                ranked = [aid for aid, _, _ in fallback_related(article)]
             except Exception as e:
-                logger.warning(f"VehicleSpecs similarity fallback failed: {e}")
-        if len(result_ids) < 6:
-            try:
-                existing_ids = set(result_ids) | {article.id}
-                cat_ids = article.categories.values_list('id', flat=True)
-                if cat_ids:
-                    same_cat = Article.objects.filter(
-                        categories__id__in=cat_ids, is_published=True, is_deleted=False
-                    ).exclude(id__in=existing_ids).order_by('-views').values_list('id', flat=True)[:10]
-                    result_ids.extend(same_cat)
-            except Exception:
-                pass
-        seen = set()
-        unique_ids = []
-        for aid in result_ids:
-            if aid not in seen and aid != article.id:
-                seen.add(aid)
-                unique_ids.append(aid)
-        articles = Article.objects.filter(id__in=unique_ids[:15], is_published=True, is_deleted=False)
-        id_order = {aid: i for i, aid in enumerate(unique_ids)}
-        sorted_articles = sorted(articles, key=lambda a: id_order.get(a.id, 999))
-        serializer = ArticleListSerializer(sorted_articles, many=True, context={'request': request})
+                logger.warning(f"Related articles fallback failed for {article.id}: {e}")
+                ranked = []
+            rank = {aid: i for i, aid in enumerate(ranked)}
+            similar = sorted(
+                Article.objects.filter(id__in=ranked, is_published=True, is_deleted=False).annotate(
+                    avg_rating=Avg('ratings__rating'),
+                    num_ratings=Count('ratings'),
+                ).select_related('image_asset').prefetch_related('categories', 'tags').defer(
+                    'content', 'content_original', 'seo_description', 'meta_keywords',
+                    'engagement_score', 'engagement_updated_at',
+                ),
+                key=lambda a: rank[a.id],
+            )
+            serializer = ArticleListSerializer(similar, many=True, context={'request': request})
+            return Response({'success': True, 'similar_articles': serializer.data})
+        similar = Article.objects.filter(
+            related_backlinks__article_id=article.id, is_published=True, is_deleted=False,
+        ).annotate(
+            related_score=F('related_backlinks__score'),
+            avg_rating=Avg('ratings__rating'),
+            num_ratings=Count('ratings'),
+        ).select_related('image_asset').prefetch_related('categories', 'tags').defer(
+            'content', 'content_original', 'seo_description', 'meta_keywords',
+            'engagement_score', 'engagement_updated_at',
+        ).order_by('-related_score', 'id')[:MAX_RELATED]
+        serializer = ArticleListSerializer(similar, many=True, context={'request': request})
         return Response({'success': True, 'similar_articles': serializer.data})
 
     @action(detail=True, methods=['get'], url_path='next-article', permission_classes=[AllowAny])
@@ -843,7 +787,7 @@ class ArticleEngagementMixin:
                 )
                 articles = Article.objects.filter(
                     id__in=article_ids, is_published=True, is_deleted=False
-                ).annotate(ml_rank=preserved).order_by('ml_rank')
+                ).select_related('image_asset').annotate(ml_rank=preserved).order_by('ml_rank')
                 serializer = ArticleListSerializer(articles, many=True, context={'request': request})
                 return Response({
                     'results': serializer.data,
@@ -213,6 +213,11 @@ class PendingArticleViewSet(viewsets.ModelViewSet):
             elif pending.featured_image:
                 image_sources = [pending.featured_image]
             
+            # Mirrors of one press photo (og:image, media:content, Pexels) are
+            # attached once; gallery screenshots skip the inline ones too
+            from news.image_hashing import NearDuplicateFilter
+            near_duplicates = NearDuplicateFilter()
+
             if image_sources:
                 from django.core.files import File
                 from django.core.files.base import ContentFile
@@ -327,6 +332,14 @@ class PendingArticleViewSet(viewsets.ModelViewSet):
                         else:
                             logger.warning(f"[APPROVE] Image path not recognized/found: {image_path}")
                                 
+                        if content_file:
+                            content_file.seek(0)
+                            duplicate = near_duplicates.is_duplicate(content_file.read())
+                            content_file.seek(0)
+                            if duplicate:
+                                logger.info(f"[APPROVE] Image {i+1} is a near-duplicate of an earlier image, skipping")
+                                continue
+
                         # Save to Article via .save() — works with any storage backend
                         if content_file:
                             logger.info(f"[APPROVE] Saving image {i+1} ({file_name}, {len(content_file)} bytes) to article...")
@@ -367,6 +380,9 @@ class PendingArticleViewSet(viewsets.ModelViewSet):
                             'Accept': 'image/*,*/*;q=0.8',
                         })
                         if resp.status_code == 200 and len(resp.content) > 1000:
+                            if near_duplicates.is_duplicate(resp.content):
+                                logger.info(f"[APPROVE] Gallery image {gi_idx + 1} is a near-duplicate, skipping")
+                                continue
                             file_name = f"{article.slug}_gallery_{gi_idx + 1}.jpg"
                             content_file = ContentFile(resp.content, name=file_name)
                             ArticleImage.objects.create(
@@ -315,112 +315,52 @@ class RSSNewsItemViewSet(viewsets.ModelViewSet):
 
     @action(detail=False, methods=['post'])
     def bulk_generate(self, request):
-        """Generate articles for multiple RSS news items (max 10)."""
-        ids = request.data.get('ids', [])
+        """Generate articles for multiple RSS news items in the background.
+
+        Returns a job_id immediately; items are generated concurrently
+        (news/rss_bulk_generation.py) and each PendingArticle is saved as
+        soon as its item finishes. Poll /bulk_generate_status/?job_id=xxx.
+        """
+        ids = request.data.get('ids') or request.data.get('item_ids') or []
         provider = request.data.get('provider', 'gemini')
         
         if not ids:
             return Response({'error': 'No IDs provided'}, status=status.HTTP_400_BAD_REQUEST)
         
-        if len(ids) > 10:
-            return Response({'error': 'Maximum 10 items per bulk operation'}, status=status.HTTP_400_BAD_REQUEST)
-        
         if provider not in ('groq', 'gemini'):
             provider = 'gemini'
         
-        items = RSSNewsItem.objects.filter(
-            id__in=ids,
-            status__in=['new', 'read']
-        ).select_related('rss_feed')
-        
-        if not items.exists():
+        from ..rss_bulk_generation import claim_items, start_bulk_generation
+        claimed = claim_items(ids)
+        if not claimed:
             return Response({'error': 'No eligible items found (must be new or read status)'}, 
                           status=status.HTTP_400_BAD_REQUEST)
         
-        from ai_engine.modules.article_generator import expand_press_release
-        from ai_engine.main import extract_title, validate_title, _is_generic_header
-        
-        results = []
-        success_count = 0
-        fail_count = 0
-        
-        for item in items:
-            try:
-                item.status = 'generating'
-                item.save(update_fields=['status'])
-                
-                plain_text = re.sub(r'<[^>]+>', '', item.content).strip()
-                if not plain_text:
-                    plain_text = item.excerpt
-                
-                expanded_content = expand_press_release(
-                    press_release_text=plain_text,
-                    source_url=item.source_url,
-                    provider=provider,
-                    source_title=item.title,
-                )
-                
-                ai_title = extract_title(expanded_content)
-                if not ai_title or _is_generic_header(ai_title):
-                    ai_title = item.title
-                ai_title = validate_title(ai_title)
-                
-                word_count = len(re.sub(r'<[^>]+>', '', expanded_content).split())
-                if word_count < 200:
-                    item.status = 'new'
-                    item.save(update_fields=['status'])
-                    results.append({'id': item.id, 'success': False, 'error': f'Too short ({word_count} words)'})
-                    fail_count += 1
-                    continue
-                
-                # Build images based on feed's image policy
-                feed = item.rss_feed
-                image_policy = feed.image_policy if feed else 'pexels_fallback'
-                
-                if image_policy == 'pexels_only':
-                    images = []
-                    featured_image = ''
-                    img_source = 'pexels'
-                else:
-                    images = [item.image_url] if item.image_url else []
-                    featured_image = item.image_url or ''
-                    img_source = 'rss_original' if images else 'unknown'
-                
-                pending = PendingArticle.objects.create(
-                    rss_feed=item.rss_feed,
-                    source_url=item.source_url,
-                    content_hash=item.content_hash,
-                    title=ai_title,
-                    content=expanded_content,
-                    excerpt=plain_text[:500],
-                    images=images,
-                    featured_image=featured_image,
-                    image_source=img_source,
-                    suggested_category=item.rss_feed.default_category if item.rss_feed else None,
-                    status='pending',
-                )
-                
-                item.status = 'generated'
-                item.pending_article = pending
-                item.save(update_fields=['status', 'pending_article'])
-                
-                results.append({'id': item.id, 'success': True, 'title': ai_title, 'pending_id': pending.id})
-                success_count += 1
-                
-            except Exception as e:
-                logger.error(f'Bulk generate failed for item {item.id}: {e}', exc_info=True)
-                item.status = 'new'
-                item.save(update_fields=['status'])
-                results.append({'id': item.id, 'success': False, 'error': str(e)[:200]})
-                fail_count += 1
-        
+        job_id = start_bulk_generation(claimed, provider)
         return Response({
             'success': True,
-            'total': len(results),
-            'generated': success_count,
-            'failed': fail_count,
-            'results': results,
-        })
+            'job_id': job_id,
+            'total': len(claimed),
+            'item_ids': claimed,
+        }, status=status.HTTP_202_ACCEPTED)
+
+    @action(detail=False, methods=['get'])
+    def bulk_generate_status(self, request):
+        """Poll a bulk_generate job.
+
+        GET /api/v1/rss-news-items/bulk_generate_status/?job_id=xxx
+        Returns: { status: 'running'|'done'|'error', total, done, generated,
+                   failed, progress, message, items: {id: {...}}, results }
+        """
+        job_id = request.query_params.get('job_id')
+        if not job_id:
+            return Response({'error': 'job_id is required'}, status=status.HTTP_400_BAD_REQUEST)
+        
+        from ..rss_bulk_generation import get_job
+        job = get_job(job_id)
+        if job is None:
+            return Response({'status': 'not_found'}, status=status.HTTP_404_NOT_FOUND)
+        return Response(job)
 
     # ================================================================
     # RSS Intelligence Endpoints
@@ -7,7 +7,7 @@ from rest_framework.views import APIView
 from django.shortcuts import get_object_or_404
 from django.core.cache import cache
 from django.utils.decorators import method_decorator
-from django.views.decorators.cache import cache_page
+from ..cache_versions import versioned_cache_page
 from django_ratelimit.decorators import ratelimit
 from django.contrib.auth.models import User
 from django.contrib.auth.hashers import check_password
@@ -90,7 +90,7 @@ class CurrencyRatesView(APIView):
     """
     permission_classes = [AllowAny]
     
-    @method_decorator(cache_page(60 * 60, key_prefix='currency_rates'))  # Cache for 1 hour
+    @method_decorator(versioned_cache_page(60 * 60, 'currency_rates'))  # Cache for 1 hour
     def get(self, request):
         cache_key = 'currency_rates_usd'
         rates = cache.get(cache_key)
@@ -625,18 +625,21 @@ class AutomationTriggerView(APIView):
                 )
         
         if task_type == 'rss':
-            from news.scheduler import _run_rss_scan
-            threading.Thread(target=_run_rss_scan, daemon=True).start()
+            from news.job_scheduler import run_job
+            import news.scheduler  # noqa: F401 — registers jobs
+            threading.Thread(target=run_job, args=('rss_scan',), daemon=True).start()
             return Response({'message': 'RSS scan triggered', 'status': 'running'})
         
         elif task_type == 'youtube':
-            from news.scheduler import _run_youtube_scan
-            threading.Thread(target=_run_youtube_scan, daemon=True).start()
+            from news.job_scheduler import run_job
+            import news.scheduler  # noqa: F401 — registers jobs
+            threading.Thread(target=run_job, args=('youtube_scan',), daemon=True).start()
             return Response({'message': 'YouTube scan triggered', 'status': 'running'})
         
         elif task_type == 'auto-publish':
-            from news.scheduler import _run_auto_publish
-            threading.Thread(target=_run_auto_publish, daemon=True).start()
+            from news.job_scheduler import run_job
+            import news.scheduler  # noqa: F401 — registers jobs
+            threading.Thread(target=run_job, args=('auto_publish',), daemon=True).start()
             return Response({'message': 'Auto-publish triggered', 'status': 'running'})
         
         elif task_type == 'score':
@@ -645,8 +648,9 @@ class AutomationTriggerView(APIView):
             return Response({'message': 'Quality scoring triggered', 'status': 'running'})
         
         elif task_type == 'deep-specs':
-            from news.scheduler import _run_deep_specs_backfill
-            threading.Thread(target=_run_deep_specs_backfill, daemon=True).start()
+            from news.job_scheduler import run_job
+            import news.scheduler  # noqa: F401 — registers jobs
+            threading.Thread(target=run_job, args=('deep_specs',), daemon=True).start()
             return Response({'message': 'VehicleSpecs backfill triggered', 'status': 'running'})
         
         elif task_type == 'ml-retrain':
@@ -1179,11 +1183,25 @@ class BackendErrorLogViewSet(viewsets.ModelViewSet):
 class ScheduledTasksView(APIView):
     """
     GET /api/v1/admin/scheduled-tasks/
-    Returns Celery Beat schedule with next-run times and last-run status.
+    Returns periodic jobs with next-run times, last-run status and run-duration
+    stats from news.job_scheduler (estimates are used until a job is first seen).
     Includes manual-only tasks so the admin can see everything in one place.
     """
     permission_classes = [IsAdminUser]
 
+    # task_id shown in the admin → job name in news.job_scheduler
+    TASK_JOB_MAP = {
+        'gsc-sync-every-6h': 'gsc_sync',
+        'currency-update-daily': 'currency_update',
+        'rss-scan': 'rss_scan',
+        'youtube-scan': 'youtube_scan',
+        'auto-publish-check': 'auto_publish',
+        'scheduled-publish-every-minute': 'scheduled_publish',
+        'deep-specs-backfill-every-6h': 'deep_specs',
+        'ab-lifecycle-daily': 'ab_lifecycle',
+        'stale-error-cleanup-every-6h': 'stale_error_cleanup',
+    }
+
     def get(self, request):
         from datetime import timedelta
         from news.models import AutomationSettings
@@ -1373,8 +1391,28 @@ class ScheduledTasksView(APIView):
                 except Exception:
                     t['last_run'] = str(t['last_run'])
 
+        # Real next/last runs and duration stats from the job scheduler
+        from django.conf import settings as django_settings
+        from news import job_scheduler
+        import news.scheduler  # noqa: F401 — registers jobs
+        job_status = {j['name']: j for j in job_scheduler.get_jobs_status()}
+        for t in tasks:
+            job = job_status.get(self.TASK_JOB_MAP.get(t['task_id']))
+            if not job:
+                continue
+            t['job'] = job
+            if job['next_run']:
+                t['next_run'] = job['next_run']
+            if job['last_run'] and not t.get('last_run'):
+                t['last_run'] = job['last_run']
+
         return Response({
             'tasks': tasks,
+            'scheduler': {
+                'mode': getattr(django_settings, 'SCHEDULER_MODE', 'thread'),
+                'leader': job_scheduler.get_leader(),
+                'jobs': list(job_status.values()),
+            },
             'server_time': now.isoformat(),
             'total_automated': sum(1 for t in tasks if t['type'] == 'automated'),
             'total_manual': sum(1 for t in tasks if t['type'] == 'manual'),
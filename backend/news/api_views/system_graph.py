@@ -323,6 +323,24 @@ class SystemGraphView(APIView):
         if emb_coverage < 80:
             warnings.append({'level': 'warning', 'message': f'Only {emb_coverage}% of articles have embeddings'})
 
+        from news.related_articles import staleness_stats
+        related = staleness_stats()
+        nodes.append({
+            'id': 'related_articles', 'label': 'Related Articles', 'group': 'ml',
+            'icon': '🔗', 'count': related['rows'],
+            'breakdown': {
+                'computed': related['computed'],
+                'never_computed': related['never_computed'],
+                'stale': related['stale'],
+                'oldest_age_hours': related['oldest_age_hours'],
+            },
+            'health': 'warning' if related['stale_pct'] > 20 else 'healthy',
+        })
+        edges.append({'from': 'articles', 'to': 'related_articles', 'label': 'materialised', 'count': related['computed']})
+
+        if related['stale_pct'] > 20:
+            warnings.append({'level': 'warning', 'message': f"{related['stale_pct']}% of related-article sets are stale"})
+
         ab_total = ArticleTitleVariant.objects.count()
         ab_active = ArticleTitleVariant.objects.filter(is_active=True).count()
         nodes.append({
@@ -359,6 +377,21 @@ class SystemGraphView(APIView):
         if err_total > 0:
             warnings.append({'level': 'error' if err_total > 10 else 'warning', 'message': f'{err_total} unresolved errors ({be_errors} backend, {fe_errors} frontend)'})
 
+        from ai_engine.modules import web_fetch
+        fetch = web_fetch.stats()
+        nodes.append({
+            'id': 'web_fetch', 'label': 'Web Fetch Cache', 'group': 'system',
+            'icon': '🌐', 'count': fetch['requests'],
+            'breakdown': {
+                'hit_rate': fetch['hit_rate'],
+                'revalidated': fetch['revalidated'],
+                'errors': fetch['errors'],
+                'mb_downloaded': round(fetch['bytes_downloaded'] / 1048576, 1),
+                'mb_saved': round(fetch['bytes_saved'] / 1048576, 1),
+            },
+            'health': 'healthy',
+        })
+
         # ── Telegram / Social ─────────────────────────────────────
         try:
             from news.models import SocialPost
@@ -798,3 +831,28 @@ class EmbeddingStatsView(APIView):
             'not_indexed': not_indexed,
             'pct': pct,
         })
+
+
+class ProfilingStatsView(APIView):
+    """Per-route request profiles (news/profiling.py), slowest p95 first.
+    GET /api/v1/health/profiling/?route=GET%20/api/v1/articles/
+    Returns: {sample_rate, routes: [{route, samples, ms/sql/sql_ms/cache/http_ms/llm_ms percentiles,
+              repeated_statements}], traces: [slow request traces, newest first]}
+    DELETE clears the windows and traces.
+    """
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        from django.conf import settings
+        from news import profiling
+        route = request.query_params.get('route') or None
+        return Response({
+            'sample_rate': getattr(settings, 'PROFILING_SAMPLE_RATE', 0.0),
+            'routes': profiling.route_stats(route),
+            'traces': profiling.traces(route),
+        })
+
+    def delete(self, request):
+        from news import profiling
+        profiling.reset()
+        return Response(status=204)
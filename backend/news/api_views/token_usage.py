@@ -35,3 +35,16 @@ class TokenUsageRealtimeView(APIView):
         except Exception as e:
             logger.error(f"Token usage realtime failed: {e}")
             return Response({'error': str(e)}, status=500)
+
+
+class TokenUsageRateLimitsView(APIView):
+    """GET /api/v1/token-usage/rate-limits/ — rate limiter waits, timeouts and 429 penalties per model"""
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        try:
+            from ai_engine.modules import rate_limiter
+            return Response(rate_limiter.stats())
+        except Exception as e:
+            logger.error(f"Rate limit stats failed: {e}")
+            return Response({'error': str(e)}, status=500)
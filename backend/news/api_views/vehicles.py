@@ -1029,10 +1029,10 @@ RULES:
         Returns scored vehicle pairs for comparison articles.
         Query params: ?segment=SUV&fuel=EV&brands=BYD,Tesla&limit=30
         """
-        from itertools import combinations
         from django.utils.text import slugify
+        from news.comparison_pairs import SCORING_FIELDS, score_pairs
 
-        qs = VehicleSpecs.objects.select_related('article').exclude(make='').exclude(model_name='').filter(
+        qs = VehicleSpecs.objects.exclude(make='').exclude(model_name='').filter(
             body_type__isnull=False,
             fuel_type__isnull=False,
         )
@@ -1048,65 +1048,40 @@ RULES:
         if fuel:
             qs = qs.filter(fuel_type__iexact=fuel)
 
-        all_specs = list(qs)
-        
         brand_list = []
         if brands:
             brand_list = [b.strip().lower() for b in brands.split(',') if b.strip()]
 
-        # Group by segment
-        segments_map = {}
-        for spec in all_specs:
-            key = (spec.body_type, spec.fuel_type)
-            segments_map.setdefault(key, []).append(spec)
+        # Score every cross-brand pair per segment on plain value rows; only
+        # the specs of the returned pairs are loaded as model instances
+        rows = list(qs.values_list(*SCORING_FIELDS))
+        raw_pairs, total_pairs, segments_map = score_pairs(rows, brand_list, limit)
+        spec_ids = {rows[i][0] for _, a, b in raw_pairs for i in (a, b)}
+        specs = VehicleSpecs.objects.select_related('article').in_bulk(spec_ids)
+
+        # Existing comparison articles for all returned pairs in one query
+        pair_slugs = []
+        for _, a, b in raw_pairs:
+            a, b = specs[rows[a][0]], specs[rows[b][0]]
+            pair_slugs.append((
+                slugify(f"{a.make}-{a.model_name}-vs-{b.make}-{b.model_name}-comparison")[:200],
+                slugify(f"{b.make}-{b.model_name}-vs-{a.make}-{a.model_name}-comparison")[:200],
+            ))
+        # slug → (position in default ordering, first article with that slug)
+        articles = {}
+        all_slugs = {slug for both in pair_slugs for slug in both}
+        if all_slugs:
+            found = Article.objects.filter(slug__in=all_slugs, is_deleted=False).values(
+                'id', 'slug', 'is_published', 'title')
+            for position, article in enumerate(found):
+                articles.setdefault(article['slug'], (position, article))
 
-        # Generate and score pairs
-        raw_pairs = []
-        for (bt, ft), specs in segments_map.items():
-            if len(specs) < 2:
-                continue
-            for a, b in combinations(specs, 2):
-                if a.make.lower() == b.make.lower():
-                    continue  # No intra-brand comparisons
-
-                # If brands filter is active, AT LEAST ONE car must match the selected brands
-                if brand_list:
-                    if a.make.lower() not in brand_list and b.make.lower() not in brand_list:
-                        continue
-
-                score = 0
-                for spec in (a, b):
-                    if spec.power_hp:
-                        score += 2
-                    if spec.price_from:
-                        score += 3
-                    if spec.range_km or spec.range_wltp:
-                        score += 2
-                    if spec.battery_kwh:
-                        score += 1
-                    if spec.acceleration_0_100:
-                        score += 2
-                    if spec.length_mm:
-                        score += 1
-
-                if a.price_from and b.price_from:
-                    ratio = min(a.price_from, b.price_from) / max(a.price_from, b.price_from)
-                    if ratio >= 0.6:
-                        score += 5
-
-                raw_pairs.append((score, a, b))
-
-        raw_pairs.sort(key=lambda x: -x[0])
-
-        # Check for existing comparison articles
         pairs = []
-        for score, a, b in raw_pairs[:limit]:
-            slug_a = slugify(f"{a.make}-{a.model_name}-vs-{b.make}-{b.model_name}-comparison")[:200]
-            slug_b = slugify(f"{b.make}-{b.model_name}-vs-{a.make}-{a.model_name}-comparison")[:200]
-
-            existing = Article.objects.filter(
-                slug__in=[slug_a, slug_b], is_deleted=False,
-            ).values('id', 'slug', 'is_published', 'title').first()
+        for (score, a, b), (slug_a, slug_b) in zip(raw_pairs, pair_slugs):
+            a, b = specs[rows[a][0]], specs[rows[b][0]]
+            # Whichever direction comes first in the default ordering
+            found = [articles[slug] for slug in (slug_a, slug_b) if slug in articles]
+            existing = min(found, key=lambda item: item[0])[1] if found else None
 
             pairs.append({
                 'score': score,
@@ -1122,13 +1097,13 @@ RULES:
 
         # Segment summary
         seg_summary = {}
-        for (bt, ft), specs in segments_map.items():
+        for (bt, ft), members in segments_map.items():
             label = f"{ft} {bt}"
-            seg_summary[label] = len(specs)
+            seg_summary[label] = len(members)
 
         return Response({
-            'total_vehicles': len(all_specs),
-            'total_pairs': len(raw_pairs),
+            'total_vehicles': len(rows),
+            'total_pairs': total_pairs,
             'showing': len(pairs),
             'segments': seg_summary,
             'pairs': pairs,
@@ -11,10 +11,10 @@ class NewsConfig(AppConfig):
         import news.cache_signals
         import news.signals  # Notification signals
         
-        # Start background scheduler (threading.Timer based).
+        # Start background scheduler (news/job_scheduler.py).
         # Celery Beat is NOT running on Railway (Procfile only has web process),
-        # so we need the in-process scheduler for all background tasks:
-        # RSS scan, YouTube scan, auto-publish, scheduled publish, etc.
+        # so by default the Redis-elected leader web process runs all background
+        # tasks: RSS scan, YouTube scan, auto-publish, scheduled publish, etc.
         # Skip during pytest — scheduler threads can't access test DB.
         if 'pytest' not in sys.modules:
             from news.scheduler import start_scheduler
@@ -83,6 +83,64 @@ BRAND_DISPLAY_NAMES = {
     'seres': 'SERES', 'changan': 'Changan', 'canoo': 'Canoo',
 }
 
+# ============================================================
+# TITLE / INTRO PATTERNS (compiled once, used by extract_tags_from_title)
+# ============================================================
+_GENERIC_MODEL_WORDS = {'review', 'preview', 'test', 'drive', 'reveals', 'launches',
+                        'announces', 'the', 'new', 'all', 'its', 'first'}
+
+# Matched title brands are tagged (and tried for the model) in KNOWN_BRANDS
+# iteration order, exactly as the per-brand regex loops did
+_BRAND_ORDER = {brand: i for i, brand in enumerate(KNOWN_BRANDS)}
+
+_YEAR_RE = re.compile(r'\b(202[0-9])\b')
+
+
+def _compile_patterns(patterns):
+    return [(re.compile(p, re.IGNORECASE), tag) for p, tag in patterns.items()]
+
+
+_FUEL_PATTERNS = _compile_patterns({
+    r'\bplug-in hybrid\b|\bphev\b': ('Plug-in Hybrid', 'Fuel Types'),
+    r'\bhybrid\b': ('Hybrid', 'Fuel Types'),
+    r'\belectric\b': ('Electric', 'Fuel Types'),
+    r'\bev\b': ('EV', 'Fuel Types'),
+    r'\bhydrogen\b': ('Hydrogen', 'Fuel Types'),
+})
+
+_BODY_PATTERNS = _compile_patterns({
+    r'\bsuv\b': ('SUV', 'Body Types'),
+    r'\bsedan\b': ('Sedan', 'Body Types'),
+    r'\bcoupe\b|coupé': ('Coupe', 'Body Types'),
+    r'\bcrossover\b': ('Crossover', 'Body Types'),
+    r'\bhatchback\b': ('Hatchback', 'Body Types'),
+    r'\bmpv\b': ('MPV', 'Body Types'),
+    r'\bwagon\b|estate': ('Wagon', 'Body Types'),
+    r'\bconvertible\b|cabriolet': ('Convertible', 'Body Types'),
+    r'\bpickup\b': ('Pickup Truck', 'Body Types'),
+    r'\bsupercar\b|hypercar': ('Supercar', 'Body Types'),
+})
+
+_DRIVE_PATTERNS = _compile_patterns({
+    r'\bawd\b': ('AWD', 'Drivetrain'),
+    r'\brwd\b': ('RWD', 'Drivetrain'),
+    r'\bfwd\b': ('FWD', 'Drivetrain'),
+    r'\b4wd\b|4x4': ('4WD', 'Drivetrain'),
+})
+
+_TECH_PATTERNS = _compile_patterns({
+    r'\badas\b': ('ADAS', 'Tech & Features'),
+    r'\bcarplay\b': ('CarPlay', 'Tech & Features'),
+    r'\bandroid auto\b': ('Android Auto', 'Tech & Features'),
+    r'\blidar\b': ('LiDAR', 'Tech & Features'),
+    r'\bautopilot\b|\bself.driving\b|\bautonomous\b': ('Autonomous', 'Tech & Features'),
+    r'\bfast.charg\b': ('Fast Charging', 'Tech & Features'),
+    r'\bhead.up display\b|\bhud\b': ('Head-Up Display', 'Tech & Features'),
+    r'\blane.(?:keep|assist)\b': ('Lane Assist', 'Tech & Features'),
+    r'\bota\b': ('OTA Update', 'Tech & Features'),
+    r'\bair suspension\b': ('Air Suspension', 'Tech & Features'),
+})
+
 # ============================================================
 # TAG ALIASES — map variations to canonical names
 # ============================================================
@@ -279,29 +337,30 @@ def extract_tags_from_title(article):
     title_lower = article.title.lower()
     
     # Use ONLY first paragraph for fuel/body scanning (intro = subject car, rest = competitors)
-    first_para = re.split(r'</p>', article.content or '', maxsplit=1)[0]
+    first_para = (article.content or '').split('</p>', 1)[0]
     first_para_lower = first_para[:500].lower()
     # Title + first paragraph = subject car context
     subject_context = f"{title_lower} {first_para_lower}"
 
     # --- MANUFACTURERS: scan TITLE ONLY (NOT body text) ---
-    for brand in KNOWN_BRANDS:
-        pattern = rf'\b{re.escape(brand)}\b'
-        if re.search(pattern, title_lower, re.IGNORECASE):
-            tags.append((brand, 'Manufacturers'))
+    # One automaton pass over the title (overlapping, so "im motors" also
+    # yields "im"), then back into KNOWN_BRANDS order.
+    from ai_engine.modules.phrase_matcher import get_vocabulary
+    matches = get_vocabulary('known_brands').find_all(title_lower, overlapping=True)
+    title_brands = sorted({m.value for m in matches}, key=lambda b: _BRAND_ORDER.get(b, len(_BRAND_ORDER)))
+    for brand in title_brands:
+        tags.append((brand, 'Manufacturers'))
 
     # --- MODEL: extract model name from title ---
     # Pattern: "{Brand} {Model}" where model is 1-3 words after brand
-    for brand in KNOWN_BRANDS:
+    for brand in title_brands:
         pattern = rf'\b{re.escape(brand)}\s+([\w#]+(?:\s+[\w#]+)?(?:\s+[\w#]+)?)\b'
         model_match = re.search(pattern, title_lower, re.IGNORECASE)
         if model_match:
             model_name = model_match.group(1).strip()
             # Skip if model is a generic word
-            generic_model_words = {'review', 'preview', 'test', 'drive', 'reveals', 'launches', 
-                                   'announces', 'the', 'new', 'all', 'its', 'first'}
             model_parts = model_name.split()
-            if model_parts and model_parts[0].lower() not in generic_model_words:
+            if model_parts and model_parts[0].lower() not in _GENERIC_MODEL_WORDS:
                 # Get display brand name
                 display_brand = BRAND_DISPLAY_NAMES.get(brand, brand.title())
                 full_model = f"{display_brand} {model_name.title()}"
@@ -309,21 +368,14 @@ def extract_tags_from_title(article):
                 break  # Only one model per article
 
     # --- YEAR: from title ---
-    year_match = re.search(r'\b(202[0-9])\b', title_lower)
+    year_match = _YEAR_RE.search(title_lower)
     if year_match:
         tags.append((year_match.group(1), 'Years'))
 
     # --- FUEL TYPE: scan title + first paragraph ONLY (subject car context) ---
-    fuel_patterns = {
-        r'\bplug-in hybrid\b|\bphev\b': ('Plug-in Hybrid', 'Fuel Types'),
-        r'\bhybrid\b': ('Hybrid', 'Fuel Types'),
-        r'\belectric\b': ('Electric', 'Fuel Types'),
-        r'\bev\b': ('EV', 'Fuel Types'),
-        r'\bhydrogen\b': ('Hydrogen', 'Fuel Types'),
-    }
     fuel_found = False
-    for pattern, (tag_name, group) in fuel_patterns.items():
-        if re.search(pattern, subject_context, re.IGNORECASE):
+    for pattern, (tag_name, group) in _FUEL_PATTERNS:
+        if pattern.search(subject_context):
             tags.append((tag_name, group))
             fuel_found = True
             # For PHEV: don't also add hybrid/electric separately
@@ -331,31 +383,13 @@ def extract_tags_from_title(article):
                 break
     
     # --- BODY TYPE: scan title + first paragraph ---
-    body_patterns = {
-        r'\bsuv\b': ('SUV', 'Body Types'),
-        r'\bsedan\b': ('Sedan', 'Body Types'),
-        r'\bcoupe\b|coupé': ('Coupe', 'Body Types'),
-        r'\bcrossover\b': ('Crossover', 'Body Types'),
-        r'\bhatchback\b': ('Hatchback', 'Body Types'),
-        r'\bmpv\b': ('MPV', 'Body Types'),
-        r'\bwagon\b|estate': ('Wagon', 'Body Types'),
-        r'\bconvertible\b|cabriolet': ('Convertible', 'Body Types'),
-        r'\bpickup\b': ('Pickup Truck', 'Body Types'),
-        r'\bsupercar\b|hypercar': ('Supercar', 'Body Types'),
-    }
-    for pattern, (tag_name, group) in body_patterns.items():
-        if re.search(pattern, subject_context, re.IGNORECASE):
+    for pattern, (tag_name, group) in _BODY_PATTERNS:
+        if pattern.search(subject_context):
             tags.append((tag_name, group))
 
     # --- DRIVETRAIN: title + first paragraph ---
-    drive_patterns = {
-        r'\bawd\b': ('AWD', 'Drivetrain'),
-        r'\brwd\b': ('RWD', 'Drivetrain'),
-        r'\bfwd\b': ('FWD', 'Drivetrain'),
-        r'\b4wd\b|4x4': ('4WD', 'Drivetrain'),
-    }
-    for pattern, (tag_name, group) in drive_patterns.items():
-        if re.search(pattern, subject_context, re.IGNORECASE):
+    for pattern, (tag_name, group) in _DRIVE_PATTERNS:
+        if pattern.search(subject_context):
             tags.append((tag_name, group))
 
     # --- SEGMENTS: title only ---
@@ -365,20 +399,8 @@ def extract_tags_from_title(article):
         tags.append(('Budget', 'Segments'))
 
     # --- TECH & FEATURES: scan first paragraph for key tech terms ---
-    tech_patterns = {
-        r'\badas\b': ('ADAS', 'Tech & Features'),
-        r'\bcarplay\b': ('CarPlay', 'Tech & Features'),
-        r'\bandroid auto\b': ('Android Auto', 'Tech & Features'),
-        r'\blidar\b': ('LiDAR', 'Tech & Features'),
-        r'\bautopilot\b|\bself.driving\b|\bautonomous\b': ('Autonomous', 'Tech & Features'),
-        r'\bfast.charg\b': ('Fast Charging', 'Tech & Features'),
-        r'\bhead.up display\b|\bhud\b': ('Head-Up Display', 'Tech & Features'),
-        r'\blane.(?:keep|assist)\b': ('Lane Assist', 'Tech & Features'),
-        r'\bota\b': ('OTA Update', 'Tech & Features'),
-        r'\bair suspension\b': ('Air Suspension', 'Tech & Features'),
-    }
-    for pattern, (tag_name, group) in tech_patterns.items():
-        if re.search(pattern, subject_context, re.IGNORECASE):
+    for pattern, (tag_name, group) in _TECH_PATTERNS:
+        if pattern.search(subject_context):
             tags.append((tag_name, group))
 
     return tags
@@ -0,0 +1,361 @@
+"""
+Shared runner for bulk AI maintenance commands.
+
+bulk_enrich, extract_all_specs, backfill_missing_specs, backfill_vehicle_specs
+and generate_comparisons used to walk their articles one at a time, waiting
+on each LLM call (some with a fixed sleep between calls). They now hand the
+item keys to a BatchRunner:
+
+    def add_arguments(self, parser):
+        add_batch_arguments(parser)
+
+    def handle(self, *args, **options):
+        runner = BatchRunner('extract_all_specs', options, params={'force': force},
+                             tier='flash', stdout=self.stdout, style=self.style)
+        runner.run(article_ids, self.process_article)
+
+process(key, log) loads and handles one item in a worker thread, writes
+its output through log(message, style=None) and returns a short status
+('created', 'updated', 'skipped', ...) that is counted; raising retries
+the item. Every command gets:
+
+  * --workers concurrent workers (default BATCH_WORKERS);
+  * a rate budget for the model tier it calls: item starts are paced to the
+    tier's combined soft RPM (MODEL_RATE_LIMITS × RATE_LIMIT_THRESHOLD) and
+    pause while every model of the tier is at its limit — the counters are
+    shared with live generation, and the AI calls themselves run at
+    rate_limiter 'batch' priority so they leave headroom for it. Rate-limit
+    errors slow the pace down, successes bring it back;
+  * per-item retries with exponential backoff (--retries);
+  * a checkpoint in the database (BatchJobCheckpoint) keyed on the command
+    and the options that select its items, so rerunning after a crash
+    skips what already finished (--restart ignores it);
+  * progress lines with rate and ETA, and estimate() for a dry-run cost
+    estimate from token_tracker pricing (--estimate).
+"""
+
+import hashlib
+import json
+import logging
+import random
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WORKERS = 4
+DEFAULT_RETRIES = 2
+BACKOFF_SECONDS = 2.0
+RATE_LIMIT_WAIT_SECONDS = 300  # give up on an item after waiting this long for quota
+RATE_LIMIT_POLL_SECONDS = 5
+CHECKPOINT_EVERY = 10  # items
+CHECKPOINT_SECONDS = 15
+ESTIMATE_HISTORY_HOURS = 7 * 24
+
+
+def add_batch_arguments(parser):
+    """--workers / --retries / --restart / --estimate for commands that run through BatchRunner."""
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Items processed concurrently (default: BATCH_WORKERS)')
+    parser.add_argument('--retries', type=int, default=DEFAULT_RETRIES,
+                        help='Retries per failed item, with exponential backoff')
+    parser.add_argument('--restart', action='store_true',
+                        help='Ignore the checkpoint of an interrupted run and start over')
+    parser.add_argument('--estimate', action='store_true',
+                        help='Only print how many AI calls the run would make and what they would cost')
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Rate budget
+# ═══════════════════════════════════════════════════════════════════
+
+def tier_models(tier):
+    """Models GeminiProvider cascades through for a 'pro' or 'flash' caller."""
+    from ai_engine.modules.ai_provider import FLASH_MODELS, PRO_MODELS
+    return {'pro': PRO_MODELS, 'flash': FLASH_MODELS}.get(tier, [])
+
+
+def wait_for_models(models, timeout=RATE_LIMIT_WAIT_SECONDS, poll=RATE_LIMIT_POLL_SECONDS):
+    """
+    Block until some model in `models` is under its rate limit
+    (ai_provider._check_rate_limit). False if none frees up within `timeout`.
+    """
+    if not models:
+        return True
+    from ai_engine.modules.ai_provider import _check_rate_limit
+    deadline = time.monotonic() + timeout
+    while True:
+        if not all(_check_rate_limit(model) for model in models):
+            return True
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(poll, remaining))
+
+
+class RateBudget:
+    """
+    Paces item starts to the combined soft RPM of a model cascade.
+    penalize() doubles the spacing (up to MAX_SLOWDOWN×) after a rate-limit
+    error; reward() eases it back after each success.
+    """
+
+    MAX_SLOWDOWN = 16
+
+    def __init__(self, models, calls_per_item=1, min_interval=0.0):
+        from ai_engine.modules.ai_provider import MODEL_RATE_LIMITS, RATE_LIMIT_THRESHOLD
+        rpm = sum(MODEL_RATE_LIMITS[m]['rpm'] * RATE_LIMIT_THRESHOLD for m in models if m in MODEL_RATE_LIMITS)
+        self.models = list(models)
+        self.interval = max(min_interval, 60.0 * calls_per_item / rpm if rpm else 0.0)
+        self.slowdown = 1.0
+        self._next = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, timeout=RATE_LIMIT_WAIT_SECONDS):
+        """Wait for this item's start slot and for quota. False if quota never frees up."""
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + self.interval * self.slowdown
+        if start > now:
+            time.sleep(start - now)
+        return wait_for_models(self.models, timeout)
+
+    def penalize(self):
+        with self._lock:
+            self.slowdown = min(self.slowdown * 2, self.MAX_SLOWDOWN)
+
+    def reward(self):
+        with self._lock:
+            self.slowdown = max(1.0, self.slowdown * 0.8)
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Checkpoints
+# ═══════════════════════════════════════════════════════════════════
+
+class Checkpoint:
+    """
+    Keys a run has finished, saved to BatchJobCheckpoint every
+    CHECKPOINT_EVERY items / CHECKPOINT_SECONDS. Deleted when a run ends
+    with nothing failed; kept otherwise, so the rerun only does the rest.
+    """
+
+    def __init__(self, job, params):
+        self.job = job
+        self.fingerprint = hashlib.sha1(
+            json.dumps(params or {}, sort_keys=True, default=str).encode()
+        ).hexdigest()
+        self.done = set()
+        self.total = 0
+        self._unsaved = 0
+        self._saved_at = time.monotonic()
+
+    def load(self):
+        from news.models import BatchJobCheckpoint
+        row = BatchJobCheckpoint.objects.filter(job=self.job, fingerprint=self.fingerprint).first()
+        self.done = set(row.done_keys) if row else set()
+        return self.done
+
+    def clear(self):
+        from news.models import BatchJobCheckpoint
+        BatchJobCheckpoint.objects.filter(job=self.job, fingerprint=self.fingerprint).delete()
+        self.done = set()
+
+    def mark(self, key):
+        self.done.add(str(key))
+        self._unsaved += 1
+        if self._unsaved >= CHECKPOINT_EVERY or time.monotonic() - self._saved_at >= CHECKPOINT_SECONDS:
+            self.save()
+
+    def save(self, failed=()):
+        from news.models import BatchJobCheckpoint
+        try:
+            BatchJobCheckpoint.objects.update_or_create(
+                job=self.job, fingerprint=self.fingerprint,
+                defaults={'done_keys': sorted(self.done), 'failed_keys': sorted(map(str, failed)),
+                          'total': self.total or len(self.done)},
+            )
+        except Exception as e:
+            logger.warning(f"⚠️ Batch checkpoint for {self.job} not saved: {e}")
+            return
+        self._unsaved = 0
+        self._saved_at = time.monotonic()
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Runner
+# ═══════════════════════════════════════════════════════════════════
+
+class BatchRunner:
+
+    def __init__(self, job, options=None, params=None, tier=None, calls_per_item=1,
+                 min_interval=0.0, checkpoint=True, stdout=None, style=None):
+        from django.conf import settings
+        options = options or {}
+        self.job = job
+        self.workers = max(1, options.get('workers') or getattr(settings, 'BATCH_WORKERS', DEFAULT_WORKERS))
+        self.retries = max(0, options.get('retries', DEFAULT_RETRIES))
+        self.restart = options.get('restart', False)
+        self.models = tier_models(tier) if tier else []
+        self.calls_per_item = calls_per_item
+        self.budget = RateBudget(self.models, calls_per_item, min_interval)
+        self.checkpoint = Checkpoint(job, params) if checkpoint else None
+        self.stdout = stdout
+        self.style = style
+        self._write_lock = threading.Lock()
+
+    # ── Output ──────────────────────────────────────────────────────
+
+    def write(self, message, style=None):
+        if style and self.style is not None:
+            message = getattr(self.style, style)(message)
+        with self._write_lock:
+            if self.stdout is not None:
+                self.stdout.write(message)
+            else:
+                print(message)
+
+    # ── Dry run ─────────────────────────────────────────────────────
+
+    def estimate(self, count, prompt_tokens, completion_tokens, callers=()):
+        """
+        Cost of `count` items × calls_per_item calls, priced for each model of
+        the tier (token_tracker.PRICING). Token counts come from recent calls
+        by `callers` when token_tracker has any, else the given per-call guess.
+        """
+        from ai_engine.modules import token_tracker
+
+        observed_calls = 0
+        if callers:
+            by_caller = token_tracker.get_summary(hours=ESTIMATE_HISTORY_HOURS)['by_caller']
+            seen = [by_caller[c] for c in callers if by_caller.get(c, {}).get('calls')]
+            observed_calls = sum(s['calls'] for s in seen)
+            if observed_calls:
+                prompt_tokens = sum(s['prompt_tokens'] for s in seen) / observed_calls
+                completion_tokens = sum(s['completion_tokens'] for s in seen) / observed_calls
+
+        calls = count * self.calls_per_item
+        costs = []
+        for model in self.models or [None]:
+            pricing = token_tracker.PRICING.get(model, token_tracker.DEFAULT_PRICING)
+            costs.append(calls * (prompt_tokens * pricing['input'] + completion_tokens * pricing['output']) / 1_000_000)
+        result = {
+            'items': count,
+            'calls': calls,
+            'prompt_tokens': int(calls * prompt_tokens),
+            'completion_tokens': int(calls * completion_tokens),
+            'cost_min': round(min(costs), 4),
+            'cost_max': round(max(costs), 4),
+            'based_on_calls': observed_calls,
+        }
+        basis = f'avg of {observed_calls} recent calls' if observed_calls else 'estimated tokens per call'
+        cost = (f"${result['cost_min']:.2f}" if result['cost_min'] == result['cost_max']
+                else f"${result['cost_min']:.2f}–${result['cost_max']:.2f}")
+        self.write(
+            f"💰 Estimate: {count} items → {calls} AI calls, "
+            f"~{result['prompt_tokens'] + result['completion_tokens']:,} tokens, {cost} ({basis})"
+        )
+        return result
+
+    # ── Run ─────────────────────────────────────────────────────────
+
+    def run(self, keys, process):
+        """Process every key not already checkpointed. Returns a Counter of statuses (plus 'failed')."""
+        keys = list(keys)
+        done = set()
+        if self.checkpoint is not None:
+            if self.restart:
+                self.checkpoint.clear()
+            done = self.checkpoint.load()
+            self.checkpoint.total = len(keys)
+        todo = [key for key in keys if str(key) not in done]
+        if len(todo) < len(keys):
+            self.write(f"⏩ Resuming {self.job}: {len(keys) - len(todo)} items already done, {len(todo)} left")
+
+        stats = Counter()
+        failed = []
+        total = len(todo)
+        if not total:
+            if self.checkpoint is not None:
+                self.checkpoint.clear()
+            return stats
+
+        self.write(f"🚀 {self.job}: {total} items, {self.workers} workers")
+        started = time.monotonic()
+        pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix=f'batch-{self.job}')
+        try:
+            futures = {pool.submit(self._run_item, key, process): key for key in todo}
+            for finished, future in enumerate(as_completed(futures), 1):
+                key = futures[future]
+                status, lines, seconds = future.result()
+                stats[status] += 1
+                if status == 'failed':
+                    failed.append(key)
+                elif self.checkpoint is not None:
+                    self.checkpoint.mark(key)
+
+                elapsed = time.monotonic() - started
+                rate = finished / elapsed * 60 if elapsed else 0
+                eta = (total - finished) * elapsed / finished
+                with self._write_lock:
+                    for message, style in lines:
+                        if style and self.style is not None:
+                            message = getattr(self.style, style)(message)
+                        (self.stdout.write if self.stdout is not None else print)(message)
+                self.write(
+                    f"[{finished}/{total}] {key} → {status} ({seconds:.1f}s) | "
+                    f"{rate:.1f}/min, ETA {int(eta // 60)}m{int(eta % 60):02d}s"
+                )
+        finally:
+            # Ctrl-C / crash: keep what finished so the next run resumes from here
+            pool.shutdown(wait=False, cancel_futures=True)
+            if self.checkpoint is not None:
+                if failed or sum(stats.values()) < total:
+                    self.checkpoint.save(failed=failed)
+                else:
+                    self.checkpoint.clear()
+
+        elapsed = time.monotonic() - started
+        summary = ', '.join(f'{status}: {n}' for status, n in stats.most_common())
+        self.write(f"✅ {self.job} finished in {elapsed:.1f}s — {summary}",
+                   'WARNING' if failed else 'SUCCESS')
+        if failed:
+            self.write(f"   ⚠️ {len(failed)} failed items stay in the checkpoint; rerun to retry them", 'WARNING')
+        return stats
+
+    def _run_item(self, key, process):
+        """(status, buffered output lines, seconds) for one item, with retries."""
+        from django.db import connection
+        from ai_engine.modules import rate_limiter
+
+        lines = []
+
+        def log(message, style=None):
+            lines.append((message, style))
+
+        started = time.monotonic()
+        try:
+            with rate_limiter.priority('batch'):
+                for attempt in range(self.retries + 1):
+                    if not self.budget.acquire():
+                        log(f"   ⏳ {key}: no AI quota freed up within {RATE_LIMIT_WAIT_SECONDS}s", 'ERROR')
+                        return 'failed', lines, time.monotonic() - started
+                    try:
+                        status = process(key, log) or 'done'
+                        self.budget.reward()
+                        return status, lines, time.monotonic() - started
+                    except Exception as e:
+                        if rate_limiter.is_rate_limit_error(e):
+                            self.budget.penalize()
+                        if attempt >= self.retries:
+                            log(f"   ❌ {key}: {e}", 'ERROR')
+                            logger.warning(f"Batch {self.job}: item {key} failed after {attempt + 1} attempts: {e}")
+                            return 'failed', lines, time.monotonic() - started
+                        delay = BACKOFF_SECONDS * 2 ** attempt * (1 + random.random() / 2)
+                        log(f"   🔁 {key}: {e} — retrying in {delay:.0f}s", 'WARNING')
+                        time.sleep(delay)
+        finally:
+            connection.close()  # worker threads keep their own connection otherwise
@@ -2,18 +2,24 @@
 Cache invalidation signals for automatic cache clearing when data changes.
 
 Strategy:
-- Each @cache_page uses a key_prefix so we can invalidate it by name
-- On model save/delete, we clear specific cache groups instead of nuking everything
+- Each cached view uses @versioned_cache_page(timeout, group) (news/cache_versions.py)
+- On model save/delete, we bump the generation of specific cache groups — one
+  INCR per group, no key scans; superseded responses expire with their TTL
 - SiteSettings uses manual cache.set/delete (no cache_page decorator)
 """
 from django.db.models.signals import post_save, post_delete, m2m_changed
 from django.dispatch import receiver
 from django.core.cache import cache
-from .models import Article, Category, Tag, Rating, Comment
+from . import side_effects
+from .cache_versions import bump
+from .models import (
+    Article, Category, Tag, TagGroup, Rating, Comment, Brand, BrandAlias, TagLearningLog,
+    VehicleSpecs, CompetitorPairLog, ManualCompetitorFeedback, CarSpecification,
+)
 
 
 # ──────────────────────────────────────────────────────────────
-# Cache key prefixes — must match the key_prefix in @cache_page()
+# Cache groups — must match the group in @versioned_cache_page()
 # ──────────────────────────────────────────────────────────────
 CACHE_PREFIXES = {
     'articles':     'articles_list',       # ArticleViewSet._cached_list
@@ -22,67 +28,45 @@ CACHE_PREFIXES = {
     'trending':     'trending',            # ArticleEngagementMixin.trending
     'popular':      'popular',             # ArticleEngagementMixin.popular
     'cars_picker':  'cars_picker',         # CarPickerListView
+    'cars_brands':  'cars_brands',         # CarBrandsListView
     'currency':     'currency_rates',      # CurrencyRatesView
     'robots':       'robots_txt',          # robots.txt view
     'settings':     'site_settings_api_v1', # SiteSettingsViewSet (manual cache)
 }
 
 
-def _delete_cache_page_prefix(prefix):
-    """Delete all cache_page keys with the given prefix.
-    
-    Django's cache_page with key_prefix stores keys like:
-    views.decorators.cache.cache_page.<prefix>.<method>.<url_hash>.<content_hash>
-    With Redis key version prefix: :1:views.decorators.cache.cache_page.<prefix>.*
+def invalidate_article_caches(article_id=None, slug=None, articles=()):
+    """Clear article-related caches. Called on Article save/delete.
+
+    `articles` adds more (article_id, slug) pairs — the list caches are
+    cleared once for all of them.
     """
-    if hasattr(cache, 'delete_pattern'):
-        cache.delete_pattern(f'views.decorators.cache.cache_page.{prefix}*')
-        cache.delete_pattern(f':1:views.decorators.cache.cache_page.{prefix}*')
-    else:
-        # Fallback: try Redis SCAN
-        try:
-            redis_client = cache._cache.get_client() if hasattr(cache._cache, 'get_client') else cache._cache
-            pattern = f'*cache_page.{prefix}*'
-            cursor = 0
-            while True:
-                cursor, keys = redis_client.scan(cursor, match=pattern, count=100)
-                if keys:
-                    str_keys = [k.decode('utf-8') if isinstance(k, bytes) else k for k in keys]
-                    cache.delete_many(str_keys)
-                if cursor == 0:
-                    break
-        except Exception:
-            pass
-
-
-def invalidate_article_caches(article_id=None, slug=None):
-    """Clear article-related caches. Called on Article save/delete."""
     # Specific article keys
     keys = ['trending_articles']
-    if article_id:
-        keys.append(f'article_{article_id}')
-    if slug:
-        keys.append(f'article_{slug}')
+    for article_id, slug in [(article_id, slug), *articles]:
+        if article_id:
+            keys.append(f'article_{article_id}')
+        if slug:
+            keys.append(f'article_{slug}')
     cache.delete_many(keys)
     
-    # Clear cache_page responses for article lists, trending, popular
-    for prefix in ['articles_list', 'trending', 'popular']:
-        _delete_cache_page_prefix(prefix)
+    # Retire cached responses for article lists, trending, popular
+    bump('articles_list', 'trending', 'popular')
 
 
 def invalidate_category_caches():
     """Clear category-related caches."""
-    _delete_cache_page_prefix('categories_list')
+    bump('categories_list')
 
 
 def invalidate_tag_caches():
     """Clear tag-related caches."""
-    _delete_cache_page_prefix('tags_list')
+    bump('tags_list')
 
 
 def invalidate_cars_caches():
-    """Clear car picker/compare caches."""
-    _delete_cache_page_prefix('cars_picker')
+    """Clear car picker/compare and brand catalogue caches."""
+    bump('cars_picker', 'cars_brands')
 
 
 def invalidate_settings_cache():
@@ -94,35 +78,48 @@ def invalidate_settings_cache():
 # Django signals → targeted invalidation
 # ──────────────────────────────────────────────────────────────
 
+# Article fields only counters/ranking jobs write — saving just these leaves
+# every cached page as it was.
+COUNTER_FIELDS = ('views', 'engagement_score', 'engagement_updated_at', 'related_computed_at')
+# Fields visible on Next.js pages (cards, hero, article head)
+REVALIDATE_FIELDS = ('is_published', 'is_deleted', 'is_hero', 'title', 'slug', 'summary', 'image')
+
+
 @receiver([post_save, post_delete], sender=Article)
 def on_article_change(sender, instance, **kwargs):
     """Article saved/deleted → clear article + category caches + Vercel ISR."""
-    invalidate_article_caches(article_id=instance.id, slug=instance.slug)
-    # Categories are affected because article counts change
-    invalidate_category_caches()
+    # post_delete always triggers (deleted articles must disappear from homepage).
+    is_delete = kwargs.get('signal') == post_delete
+    if not is_delete and not side_effects.changed(instance, ignore=COUNTER_FIELDS):
+        return  # e.g. save(update_fields=['views'])
+
+    # Inside side_effects.bulk_mode() these run once, on exit
+    side_effects.collect('article_caches', [(instance.id, instance.slug)], _invalidate_articles)
 
     # Trigger Next.js ISR revalidation when publish-relevant fields change.
-    # We check update_fields to avoid triggering on every save (e.g. view count).
-    # post_delete always triggers (deleted articles must disappear from homepage).
-    is_delete = not kwargs.get('created', False) and kwargs.get('signal') == post_delete
-    update_fields = kwargs.get('update_fields')
-    publish_fields = {'is_published', 'is_deleted', 'is_hero', 'title', 'slug', 'summary', 'image'}
-
-    should_revalidate = (
-        is_delete
-        or update_fields is None  # full save (admin form, list_editable, etc.)
-        or bool(publish_fields & set(update_fields))  # targeted save with relevant field
-    )
+    # Full saves (admin form, list_editable) always count; targeted saves
+    # only with a relevant field.
+    if is_delete or side_effects.changed(instance, REVALIDATE_FIELDS):
+        _invalidate_link_index()
+        paths = ['/', '/articles', '/trending']
+        if instance.slug:
+            paths.append(f'/articles/{instance.slug}')
+        side_effects.collect('nextjs_revalidation', paths, _revalidate)
+
+
+def _invalidate_articles(articles):
+    invalidate_article_caches(articles=articles)
+    # Categories are affected because article counts change, and so are
+    # brand article counts and images
+    bump('categories_list', 'cars_brands')
+
 
-    if should_revalidate:
-        try:
-            from news.api_views._shared import trigger_nextjs_revalidation
-            paths = ['/', '/articles', '/trending']
-            if instance.slug:
-                paths.append(f'/articles/{instance.slug}')
-            trigger_nextjs_revalidation(paths=paths)
-        except Exception:
-            pass
+def _revalidate(paths):
+    try:
+        from news.api_views._shared import trigger_nextjs_revalidation
+        trigger_nextjs_revalidation(paths=paths)
+    except Exception:
+        pass
 
 
 @receiver([post_save, post_delete], sender=Category)
@@ -135,14 +132,80 @@ def on_category_change(sender, instance, **kwargs):
 def on_tag_change(sender, instance, **kwargs):
     """Tag saved/deleted → clear tag caches."""
     invalidate_tag_caches()
+    _invalidate_phrase_vocabularies('Tag')
+
+
+@receiver([post_save, post_delete], sender=TagGroup)
+def on_tag_group_change(sender, instance, **kwargs):
+    """Tag group renamed/deleted → recompile tag-name matchers."""
+    _invalidate_phrase_vocabularies('TagGroup')
+
+
+@receiver([post_save, post_delete], sender=Brand)
+@receiver([post_save, post_delete], sender=BrandAlias)
+def on_brand_change(sender, instance, **kwargs):
+    """Brand or alias changed → recompile brand matchers (detect_brand, RSS curator), clear the catalogue."""
+    _invalidate_phrase_vocabularies(sender.__name__)
+    invalidate_cars_caches()
+
+
+@receiver([post_save, post_delete], sender=CarSpecification)
+def on_car_specification_change(sender, instance, **kwargs):
+    """Article's make/model changed → brand counts and images change."""
+    bump('cars_brands')
+
+
+def _invalidate_phrase_vocabularies(model_name):
+    from ai_engine.modules.phrase_matcher import invalidate
+    invalidate(model_name)
+
+
+@receiver(post_save, sender=TagLearningLog)
+def on_tag_learning_log_save(sender, instance, **kwargs):
+    """Learning log recorded → update the tag suggester's keyword index."""
+    from ai_engine.modules.tag_suggester import on_learning_log_changed
+    on_learning_log_changed(instance)
+
+
+@receiver(post_delete, sender=TagLearningLog)
+def on_tag_learning_log_delete(sender, instance, **kwargs):
+    """Learning log deleted (with its article) → drop it from the keyword index."""
+    from ai_engine.modules.tag_suggester import on_learning_log_changed
+    on_learning_log_changed(instance, deleted=True)
+
+
+@receiver([post_save, post_delete], sender=VehicleSpecs)
+@receiver([post_save, post_delete], sender=ManualCompetitorFeedback)
+def on_competitor_data_change(sender, instance, **kwargs):
+    """Specs or editor pairing feedback changed → rebuild the competitor index."""
+    _invalidate_competitor_index()
+
+
+@receiver(post_save, sender=CompetitorPairLog)
+def on_competitor_pair_scored(sender, instance, **kwargs):
+    """Pair log got its engagement score → competitor weights changed."""
+    if instance.engagement_score_at_log is not None:
+        _invalidate_competitor_index()
+
+
+def _invalidate_link_index():
+    from ai_engine.modules.link_index import invalidate
+    invalidate()
+
+
+def _invalidate_competitor_index():
+    from ai_engine.modules.competitor_index import invalidate
+    invalidate()
 
 
 @receiver(m2m_changed, sender=Article.tags.through)
 def on_article_tags_change(sender, instance, **kwargs):
-    """Article tags changed → clear article + tag caches."""
+    """Article tags changed → clear article + tag caches, re-index link anchors."""
     if isinstance(instance, Article):
         invalidate_article_caches(article_id=instance.id, slug=instance.slug)
         invalidate_tag_caches()
+        if instance.is_published:
+            _invalidate_link_index()
 
 
 @receiver(m2m_changed, sender=Article.categories.through)
@@ -0,0 +1,79 @@
+"""
+Generation-versioned response caches.
+
+Every cached API group (articles_list, trending, categories_list, ...) has a
+generation counter in the cache; the counter is part of each response key:
+
+    views.decorators.cache.cache_page.articles_list.g1729350000123.GET.<hashes>
+
+Invalidating a group is one atomic INCR — requests build keys with the new
+generation and miss, while the old entries are never read again and expire
+with their page timeout. No keyspace scan (delete_pattern / SCAN) is needed,
+however many keys the group has.
+
+A missing counter (first use, Redis flush or eviction) is seeded from the
+clock in milliseconds, so it never lands on a generation used before.
+
+Entry points:
+    versioned_cache_page(timeout, group)   view decorator (method_decorator for CBVs)
+    bump(*groups)                          invalidate
+    generation(group)
+"""
+
+import logging
+import time
+from functools import wraps
+
+from django.core.cache import cache
+from django.views.decorators.cache import cache_page
+
+logger = logging.getLogger(__name__)
+
+GENERATION_KEY = 'cache_gen:{}'
+
+
+def _seed():
+    return int(time.time() * 1000)
+
+
+def generation(group):
+    """Current generation of `group` (seeded on first use)."""
+    key = GENERATION_KEY.format(group)
+    value = cache.get(key)
+    if value is None:
+        cache.add(key, _seed(), None)
+        value = cache.get(key) or 0
+    return value
+
+
+def bump(*groups):
+    """Invalidate every response cached under `groups`."""
+    for group in groups:
+        key = GENERATION_KEY.format(group)
+        try:
+            cache.incr(key)
+        except ValueError:  # no counter yet — nothing cached under it
+            if not cache.add(key, _seed(), None):
+                cache.incr(key)
+        except Exception as e:
+            logger.warning(f"⚠️ Cache generation bump failed for {group}: {e}")
+
+
+def versioned_cache_page(timeout, group):
+    """cache_page() keyed by the current generation of `group`."""
+    def decorator(view):
+        cached_views = {}  # generation → cache_page-wrapped view
+
+        @wraps(view)
+        def wrapped(request, *args, **kwargs):
+            try:
+                gen = generation(group)
+            except Exception:
+                return view(request, *args, **kwargs)  # cache down — serve uncached
+            cached = cached_views.get(gen)
+            if cached is None:
+                cached_views.clear()  # older generations are never requested again
+                cached = cached_views[gen] = cache_page(timeout, key_prefix=f'{group}.g{gen}')(view)
+            return cached(request, *args, **kwargs)
+        return wrapped
+    return decorator
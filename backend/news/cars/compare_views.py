@@ -10,7 +10,7 @@ from rest_framework.response import Response
 from rest_framework.permissions import AllowAny
 from django.utils.text import slugify
 from django.utils.decorators import method_decorator
-from django.views.decorators.cache import cache_page
+from ..cache_versions import versioned_cache_page
 
 from .utils import get_image_url, serialize_vehicle_specs
 
@@ -162,7 +162,7 @@ class CarPickerListView(APIView):
     """
     permission_classes = [AllowAny]
 
-    @method_decorator(cache_page(600, key_prefix='cars_picker'))  # Cache for 10 minutes
+    @method_decorator(versioned_cache_page(600, 'cars_picker'))  # Cache for 10 minutes
     def get(self, request):
         from ..models import VehicleSpecs
         from django.db.models import Q
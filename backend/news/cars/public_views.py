@@ -9,109 +9,134 @@ Endpoints:
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny
-from django.db.models import Count
+from django.db import connection
+from django.db.models import Count, Q
+from django.db.models.functions import Lower, Upper
+from django.utils.decorators import method_decorator
 from django.utils.text import slugify
+from ..cache_versions import versioned_cache_page
 
 from ..models import CarSpecification, Article, Tag, Brand
 from .utils import get_image_url
 
 
-class CarBrandsListView(APIView):
-    """GET /api/v1/cars/brands/ — List all brands with model counts."""
-    permission_classes = [AllowAny]
+def _catalogue_specs():
+    """Specs that put a brand in the public catalogue (published, not news-only)."""
+    return (
+        CarSpecification.objects
+        .filter(article__is_published=True, article__is_news_only=False)
+        .exclude(make='')
+        .exclude(make='Not specified')
+    )
 
-    def get(self, request):
-        brand_count = Brand.objects.count()
-
-        if brand_count > 0:
-            brands = (
-                Brand.objects
-                .filter(is_visible=True)
-                .select_related('parent')
-                .prefetch_related('sub_brands')
-            )
 
-            # Load ALL published non-news specs in one query
-            # (used for both counting AND image lookup — no Subquery needed)
-            all_specs = (
-                CarSpecification.objects
-                .filter(article__is_published=True, article__is_news_only=False)
-                .exclude(make='')
-                .exclude(make='Not specified')
-                .select_related('article')
-                .order_by('make', 'id')
-            )
+def _first_spec_per_make(fold):
+    """
+    {fold(make): (make, article_id)} of the first catalogue spec per make,
+    in (make, id) order — DISTINCT ON where the database supports it.
+    """
+    specs = _catalogue_specs().annotate(make_key=fold('make'))
+    if connection.features.can_distinct_on_fields:
+        specs = specs.order_by('make_key', 'make', 'id').distinct('make_key')
+    else:
+        specs = specs.order_by('make', 'id')
+    first = {}
+    for key, make, article_id in specs.values_list('make_key', 'make', 'article_id'):
+        first.setdefault(key, (make, article_id))
+    return first
 
-            # Build per-brand counts and first-spec lookup from the loaded specs
-            spec_by_make = {}        # first spec per brand (for image)
-            models_by_make = {}      # set of distinct model names per brand
-            articles_by_make = {}    # set of distinct article IDs per brand
-            for spec in all_specs:
-                key = spec.make.lower()
-                if key not in spec_by_make:
-                    spec_by_make[key] = spec
-                if spec.model and spec.model != 'Not specified':
-                    models_by_make.setdefault(key, set()).add(spec.model)
-                articles_by_make.setdefault(key, set()).add(spec.article_id)
 
-            result = []
-            for brand in brands:
-                brand_key = brand.name.lower()
-                model_count = len(models_by_make.get(brand_key, set()))
-                article_count = len(articles_by_make.get(brand_key, set()))
+def _article_images(article_ids, request):
+    """{article_id: absolute image URL or None} in one query."""
+    articles = Article.objects.only('id', 'image').in_bulk(set(article_ids))
+    return {aid: get_image_url(article, request) for aid, article in articles.items()}
+
+
+class CarBrandsListView(APIView):
+    """
+    GET /api/v1/cars/brands/ — List all brands with model counts.
+
+    A fixed number of queries however many brands exist: all brands, one
+    grouped count per make, one first-spec-per-make lookup for images and
+    one article fetch. Responses are cached under 'cars_brands', cleared by
+    invalidate_cars_caches().
+    """
+    permission_classes = [AllowAny]
 
-                # Get image from logo or first spec
-                image = None
+    @method_decorator(versioned_cache_page(600, 'cars_brands'))  # Cache for 10 minutes
+    def get(self, request):
+        all_brands = list(Brand.objects.all())
+
+        if all_brands:
+            # Per-make counts, grouped case-insensitively like brand names
+            not_a_model = Q(model='') | Q(model='Not specified') | Q(model__isnull=True)
+            counts = {
+                row['make_key']: row
+                for row in _catalogue_specs()
+                .annotate(make_key=Lower('make'))
+                .values('make_key')
+                .annotate(
+                    article_count=Count('article', distinct=True),
+                    model_count=Count('model', distinct=True, filter=~not_a_model),
+                )
+                .order_by()
+            }
+            first_spec = _first_spec_per_make(Lower)
+
+            visible = [b for b in all_brands if b.is_visible]
+            sub_brands = {}
+            for b in visible:
+                if b.parent_id:
+                    sub_brands.setdefault(b.parent_id, []).append({'name': b.name, 'slug': b.slug})
+
+            # Get image from logo or first spec
+            images = {}
+            for brand in visible:
                 if brand.logo:
                     raw = str(brand.logo)
                     if raw.startswith('http://') or raw.startswith('https://'):
-                        image = raw
+                        images[brand.id] = raw
                     elif hasattr(brand.logo, 'url'):
-                        image = request.build_absolute_uri(brand.logo.url)
-
-                if not image:
-                    first_spec = spec_by_make.get(brand_key)
-                    if first_spec:
-                        image = get_image_url(first_spec.article, request)
+                        images[brand.id] = request.build_absolute_uri(brand.logo.url)
+            need_spec_image = {
+                brand.id: first_spec[brand.name.lower()][1]
+                for brand in visible
+                if not images.get(brand.id) and brand.name.lower() in first_spec
+            }
+            article_images = _article_images(need_spec_image.values(), request)
+            for brand_id, article_id in need_spec_image.items():
+                images[brand_id] = article_images.get(article_id)
 
+            result = []
+            for brand in visible:
+                brand_counts = counts.get(brand.name.lower(), {})
                 result.append({
                     'id': brand.id,
                     'name': brand.name,
                     'slug': brand.slug,
-                    'model_count': model_count,
-                    'article_count': article_count,
-                    'image': image,
+                    'model_count': brand_counts.get('model_count', 0),
+                    'article_count': brand_counts.get('article_count', 0),
+                    'image': images.get(brand.id),
                     'country': brand.country,
                     'description': brand.description,
-                    'sub_brands': [
-                        {'name': s.name, 'slug': s.slug}
-                        for s in brand.sub_brands.filter(is_visible=True)
-                    ],
+                    'sub_brands': sub_brands.get(brand.id, []),
                 })
 
-            # Sort by article_count desc
-            result.sort(key=lambda x: (-x.get('article_count', 0),))
-            # Brands with sort_order > 0 go first
-            result.sort(key=lambda x: 0 if not any(
-                b.sort_order for b in brands if b.name == x['name']
-            ) else -1)
+            # Brands with sort_order > 0 go first, then by article_count desc
+            pinned = {brand.id for brand in visible if brand.sort_order}
+            result.sort(key=lambda x: (0 if x['id'] in pinned else 1, -x['article_count']))
 
             # Return wrapped response with totals if requested
             if request.query_params.get('include_totals'):
-                total_articles = len(set(
-                    aid for aids in articles_by_make.values() for aid in aids
-                ))
-                total_models = sum(len(m) for m in models_by_make.values())
                 return Response({
                     'brands': result,
-                    'total_articles': total_articles,
-                    'total_models': total_models,
+                    'total_articles': _catalogue_specs().values('article').distinct().count(),
+                    'total_models': sum(row['model_count'] for row in counts.values()),
                 })
 
             return Response(result)
 
         # Fallback: old aggregation (no Brand records yet)
-        from django.db.models.functions import Upper
         brands_qs = (
             CarSpecification.objects
             .exclude(make='')
@@ -126,34 +151,18 @@ class CarBrandsListView(APIView):
             .order_by('-article_count')
         )
 
-        all_specs = (
-            CarSpecification.objects
-            .filter(article__is_published=True, article__is_news_only=False)
-            .exclude(make='')
-            .exclude(make='Not specified')
-            .select_related('article')
-            .order_by('make', 'id')
-        )
-        spec_by_make = {}
-        for spec in all_specs:
-            key = spec.make.upper()
-            if key not in spec_by_make:
-                spec_by_make[key] = spec
+        first_spec = _first_spec_per_make(Upper)
+        rows = [(b, first_spec[b['make_upper']]) for b in brands_qs if b['make_upper'] in first_spec]
+        article_images = _article_images((article_id for _, (_, article_id) in rows), request)
 
         result = []
-        for b in brands_qs:
-            make_upper = b['make_upper']
-            first_spec = spec_by_make.get(make_upper)
-            if not first_spec:
-                continue
-            make = first_spec.make
-            image = get_image_url(first_spec.article, request)
+        for b, (make, article_id) in rows:
             result.append({
                 'name': make,
                 'slug': slugify(make),
                 'model_count': b['model_count'],
                 'article_count': b['article_count'],
-                'image': image,
+                'image': article_images.get(article_id),
             })
 
         return Response(result)
@@ -10,7 +10,7 @@ from rest_framework.decorators import action
 from django.db.models import Count, Q
 from django.utils.text import slugify
 from django.utils.decorators import method_decorator
-from django.views.decorators.cache import cache_page
+from .cache_versions import versioned_cache_page
 from .models import CarSpecification, Article, Tag, Brand, BrandAlias
 from .serializers import BrandSerializer
 
@@ -33,126 +33,8 @@ def _get_image_url(article, request):
     return request.build_absolute_uri(relative)
 
 
-class CarBrandsListView(APIView):
-    """GET /api/v1/cars/brands/ — List all brands with model counts."""
-    permission_classes = [AllowAny]
-
-    def get(self, request):
-        # Use Brand model if populated, otherwise fall back to old aggregation
-        brand_count = Brand.objects.count()
-        
-        if brand_count > 0:
-            # New path: read from managed Brand model
-            brands = (
-                Brand.objects
-                .filter(is_visible=True)  # All visible brands as separate cards
-                .select_related('parent')
-            )
-            
-            # Prefetch all first specs for images in ONE query
-            all_specs = (
-                CarSpecification.objects
-                .filter(article__is_published=True)
-                .exclude(make='')
-                .exclude(make='Not specified')
-                .select_related('article')
-                .order_by('make', 'id')
-            )
-            spec_by_make = {}
-            for spec in all_specs:
-                key = spec.make.lower()
-                if key not in spec_by_make:
-                    spec_by_make[key] = spec
-            
-            result = []
-            for brand in brands:
-                # Get image from first spec (or logo if uploaded)
-                image = None
-                if brand.logo:
-                    raw = str(brand.logo)
-                    if raw.startswith('http://') or raw.startswith('https://'):
-                        image = raw
-                    elif hasattr(brand.logo, 'url'):
-                        image = request.build_absolute_uri(brand.logo.url)
-                
-                if not image:
-                    first_spec = spec_by_make.get(brand.name.lower())
-                    if first_spec:
-                        image = _get_image_url(first_spec.article, request)
-                
-                result.append({
-                    'id': brand.id,
-                    'name': brand.name,
-                    'slug': brand.slug,
-                    'model_count': brand.get_model_count(),
-                    'article_count': brand.get_article_count(),
-                    'image': image,
-                    'country': brand.country,
-                    'description': brand.description,
-                    'sub_brands': [
-                        {'name': s.name, 'slug': s.slug}
-                        for s in brand.sub_brands.filter(is_visible=True)
-                    ],
-                })
-            
-            # Sort: manual sort_order first (desc), then by article_count
-            result.sort(key=lambda x: (-x.get('article_count', 0),))
-            # Brands with sort_order > 0 go first
-            result.sort(key=lambda x: 0 if not any(
-                b.sort_order for b in brands if b.name == x['name']
-            ) else -1)
-            
-            return Response(result)
-        
-        # Fallback: old aggregation (no Brand records yet)
-        from django.db.models.functions import Upper
-        brands_qs = (
-            CarSpecification.objects
-            .exclude(make='')
-            .exclude(make='Not specified')
-            .annotate(make_upper=Upper('make'))
-            .values('make_upper')
-            .annotate(
-                model_count=Count('model', distinct=True),
-                article_count=Count('article', distinct=True),
-            )
-            .filter(model_count__gt=0)
-            .order_by('-article_count')
-        )
-
-        all_specs = (
-            CarSpecification.objects
-            .filter(article__is_published=True)
-            .exclude(make='')
-            .exclude(make='Not specified')
-            .select_related('article')
-            .order_by('make', 'id')
-        )
-        spec_by_make = {}
-        for spec in all_specs:
-            key = spec.make.upper()
-            if key not in spec_by_make:
-                spec_by_make[key] = spec
-
-        result = []
-        for b in brands_qs:
-            make_upper = b['make_upper']
-            first_spec = spec_by_make.get(make_upper)
-            if not first_spec:
-                continue
-
-            make = first_spec.make
-            image = _get_image_url(first_spec.article, request)
-
-            result.append({
-                'name': make,
-                'slug': slugify(make),
-                'model_count': b['model_count'],
-                'article_count': b['article_count'],
-                'image': image,
-            })
-
-        return Response(result)
+# Brand catalogue: one implementation, shared with the news.cars package
+from .cars.public_views import CarBrandsListView  # noqa: E402,F401
 
 
 class CarBrandDetailView(APIView):
@@ -616,7 +498,7 @@ class CarPickerListView(APIView):
     """
     permission_classes = [AllowAny]
     
-    @method_decorator(cache_page(600, key_prefix='cars_picker'))  # Cache for 10 minutes
+    @method_decorator(versioned_cache_page(600, 'cars_picker'))  # Cache for 10 minutes
     def get(self, request):
         from .models import VehicleSpecs
         from django.db.models import Q
@@ -0,0 +1,196 @@
+"""
+Comparison-pair scoring for VehicleSpecsViewSet.comparison_pairs.
+
+Specs are grouped into segments (body type × fuel type); every cross-brand
+pair inside a segment is a candidate comparison, scored by how complete both
+spec sheets are plus a bonus for similar prices:
+
+    completeness  power 2 · price 3 · range 2 · battery 1 · 0–100 2 · length 1
+    price bonus   +5 when min(price) / max(price) ≥ 0.6
+
+Scoring runs on NumPy arrays of spec attributes, one block of rows × segment
+at a time, and only the best `limit` pairs survive each block
+(np.partition on the scores). Once `limit` pairs are held, rows and columns
+whose best possible pair score cannot beat the weakest of them are skipped.
+Memory stays bounded by BLOCK_ELEMENTS however large a segment is, and the
+result is the same as scoring every pair, stable-sorting by score and
+slicing: ties keep enumeration order (segment, then combinations order).
+"""
+import numpy as np
+
+COMPLETENESS_WEIGHTS = (
+    ('power_hp', 2),
+    ('price_from', 3),
+    ('range', 2),          # range_km or range_wltp
+    ('battery_kwh', 1),
+    ('acceleration_0_100', 2),
+    ('length_mm', 1),
+)
+PRICE_RATIO_MIN = 0.6
+PRICE_BONUS = 5
+
+# Pair scores evaluated per block (rows × columns)
+BLOCK_ELEMENTS = 2_000_000
+
+# values_list() fields scoring needs, in this order
+SCORING_FIELDS = (
+    'id', 'make', 'body_type', 'fuel_type', 'power_hp', 'price_from',
+    'range_km', 'range_wltp', 'battery_kwh', 'acceleration_0_100', 'length_mm',
+)
+
+
+def completeness(rows):
+    """Per-spec completeness score for SCORING_FIELDS rows."""
+    def filled(values):
+        return np.array([bool(v) for v in values], dtype=bool)
+
+    columns = dict(zip(SCORING_FIELDS, zip(*rows))) if rows else {}
+    if not columns:
+        return np.zeros(0, dtype=np.int32)
+    score = np.zeros(len(rows), dtype=np.int32)
+    for field, weight in COMPLETENESS_WEIGHTS:
+        if field == 'range':
+            present = filled(columns['range_km']) | filled(columns['range_wltp'])
+        else:
+            present = filled(columns[field])
+        score += weight * present
+    return score
+
+
+def _top_k(scores, k):
+    """Positions of the k best scores (higher first, earlier position on ties)."""
+    if len(scores) > k:
+        kth = np.partition(scores, len(scores) - k)[len(scores) - k]
+        above = np.flatnonzero(scores > kth)
+        ties = np.flatnonzero(scores == kth)[:k - len(above)]
+        picked = np.sort(np.concatenate([above, ties]))
+    else:
+        picked = np.arange(len(scores))
+    return picked[np.argsort(-scores[picked], kind='stable')]
+
+
+class _Best:
+    """The best `limit` pairs seen so far, in enumeration order of arrival."""
+
+    def __init__(self, limit):
+        self.limit = limit
+        self.scores = np.zeros(0, dtype=np.int32)
+        self.a = np.zeros(0, dtype=np.int64)
+        self.b = np.zeros(0, dtype=np.int64)
+
+    @property
+    def floor(self):
+        """A new pair must beat this score to enter (ties lose to earlier pairs)."""
+        return int(self.scores.min()) if len(self.scores) >= self.limit else None
+
+    def offer(self, scores, a, b):
+        if not len(scores):
+            return
+        scores = np.concatenate([self.scores, scores])
+        a = np.concatenate([self.a, a])
+        b = np.concatenate([self.b, b])
+        keep = np.sort(_top_k(scores, self.limit))
+        self.scores, self.a, self.b = scores[keep], a[keep], b[keep]
+
+    def ranked(self):
+        order = np.argsort(-self.scores, kind='stable')
+        return [(int(self.scores[i]), int(self.a[i]), int(self.b[i])) for i in order]
+
+
+def score_pairs(rows, brands=(), limit=30):
+    """
+    Score cross-brand pairs within each (body_type, fuel_type) segment.
+
+    Args:
+        rows: SCORING_FIELDS tuples, in the order pairs should be enumerated.
+        brands: Lowercase makes; when given, at least one car of a pair
+            must be one of them.
+        limit: Number of pairs to return.
+
+    Returns:
+        (pairs, total_pairs, segments): pairs is [(score, row_a, row_b)]
+        best first (row indexes into `rows`), total_pairs counts every
+        candidate pair, segments maps (body_type, fuel_type) → row indexes.
+    """
+    segments = {}
+    for i, row in enumerate(rows):
+        segments.setdefault((row[2], row[3]), []).append(i)
+    total = _count_pairs(rows, segments, brands)
+    if not rows or limit <= 0:
+        return [], total, segments
+
+    makes = [(row[1] or '').lower() for row in rows]
+    make_codes = {m: n for n, m in enumerate(dict.fromkeys(makes))}
+    make = np.array([make_codes[m] for m in makes], dtype=np.int64)
+    brand_set = set(brands or ())
+    in_brands = np.array([m in brand_set for m in makes], dtype=bool)
+    price = np.array([row[5] or 0 for row in rows], dtype=np.float64)
+    base = completeness(rows)
+
+    best = _Best(limit)
+    for members in segments.values():
+        n = len(members)
+        if n < 2:
+            continue
+        seg = np.asarray(members, dtype=np.int64)
+        s_make, s_brand, s_price, s_base = make[seg], in_brands[seg], price[seg], base[seg]
+        # Best score any pair (i, j > i) could still reach — skips rows and
+        # columns that cannot beat the current top `limit`
+        row_bound = s_base[:-1] + np.maximum.accumulate(s_base[::-1])[::-1][1:] + PRICE_BONUS
+        col_bound = s_base + s_base.max() + PRICE_BONUS
+        block = max(1, BLOCK_ELEMENTS // n)
+        for start in range(0, n - 1, block):
+            rows_i = np.arange(start, min(start + block, n - 1))
+            cols = np.arange(start + 1, n)
+            floor = best.floor
+            if floor is not None:
+                rows_i = rows_i[row_bound[rows_i] > floor]
+                cols = cols[col_bound[cols] > floor]
+                if not len(rows_i) or not len(cols):
+                    continue
+            # Pair (i, j) with j > i — combinations order when flattened row-major
+            valid = cols[None, :] > rows_i[:, None]
+            valid &= s_make[rows_i][:, None] != s_make[cols][None, :]
+            if brand_set:
+                valid &= s_brand[rows_i][:, None] | s_brand[cols][None, :]
+            flat = np.flatnonzero(valid)
+            if not len(flat):
+                continue
+
+            ii = rows_i[flat // len(cols)]
+            jj = cols[flat % len(cols)]
+            scores = s_base[ii] + s_base[jj]
+            pa, pb = s_price[ii], s_price[jj]
+            both = (pa != 0) & (pb != 0)
+            ratio = np.divide(np.minimum(pa, pb), np.maximum(pa, pb),
+                              out=np.zeros_like(pa), where=both)
+            scores = scores + PRICE_BONUS * (both & (ratio >= PRICE_RATIO_MIN))
+
+            if floor is not None:
+                keep = np.flatnonzero(scores > floor)
+                ii, jj, scores = ii[keep], jj[keep], scores[keep]
+            if len(scores):
+                top = np.sort(_top_k(scores, limit))
+                best.offer(scores[top], seg[ii[top]], seg[jj[top]])
+
+    return best.ranked(), total, segments
+
+
+def _count_pairs(rows, segments, brands):
+    """Cross-brand pairs per segment, counted from make frequencies."""
+    brand_set = set(brands or ())
+    total = 0
+    for members in segments.values():
+        makes = [(rows[i][1] or '').lower() for i in members]
+        counts, outside = {}, {}
+        for m in makes:
+            counts[m] = counts.get(m, 0) + 1
+            if brand_set and m not in brand_set:
+                outside[m] = outside.get(m, 0) + 1
+
+        def cross_brand(per_make):
+            n = sum(per_make.values())
+            return n * (n - 1) // 2 - sum(c * (c - 1) // 2 for c in per_make.values())
+
+        total += cross_brand(counts) - (cross_brand(outside) if brand_set else 0)
+    return total
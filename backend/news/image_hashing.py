@@ -0,0 +1,286 @@
+"""
+Perceptual image hashing and near-duplicate lookup.
+
+Every image is reduced once to a 32×32 grayscale thumbnail (JPEG DCT draft
+decoding keeps this cheap), and three 64-bit hashes are derived from it with
+matrix operations that work on a whole batch at once:
+
+    ahash — 8×8 block means above their mean
+    dhash — horizontal gradient signs on an 8×9 grid
+    phash — 8×8 low-frequency DCT coefficients above their median
+
+Two images are near-duplicates when their pHashes are within DEDUP_RADIUS
+bits (resized / recompressed / slightly cropped copies land at 0–4) and
+their dHashes confirm it within CONFIRM_RADIUS — dHash flips more easily on
+smooth gradients, unrelated images sit ~32 bits apart on both. Flat images (black frames, solid placeholders) have no usable
+structure and get no hashes — only the exact SHA-256 dedup applies to them.
+
+HashIndex keeps the hashes of every ready ImageAsset in one contiguous uint64
+array and answers radius queries with a vectorised XOR + popcount scan:
+well under 1 ms at 100k images, ~100× faster than a BK-tree on 64-bit hashes
+(see `manage.py benchmark_image_hashing`).
+
+    NearDuplicateFilter  — per-batch ingestion filter (screenshots, approvals)
+    find_similar_asset   — stored asset to reuse instead of rendering again
+"""
+import logging
+import threading
+import time
+from io import BytesIO
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+THUMB_SIZE = 32
+HASH_SIZE = 8
+DEDUP_RADIUS = 6
+CONFIRM_RADIUS = 10
+# Thumbnails with less grayscale spread than this are treated as flat
+FLAT_STD = 2.0
+# In-process index is rebuilt from the database after this many seconds
+INDEX_TTL = 15 * 60
+
+HASH_KINDS = ('ahash', 'dhash', 'phash')
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Hashing
+# ═══════════════════════════════════════════════════════════════════
+
+def _box_matrix(src, dst):
+    """(dst, src) weights of a box (area) resample from `src` to `dst` samples."""
+    edges = np.linspace(0, src, dst + 1)
+    weights = np.zeros((dst, src), dtype=np.float32)
+    for i in range(dst):
+        for j in range(src):
+            overlap = min(edges[i + 1], j + 1) - max(edges[i], j)
+            if overlap > 0:
+                weights[i, j] = overlap
+    return weights / weights.sum(axis=1, keepdims=True)
+
+
+def _dct_matrix(n):
+    k = np.arange(n)[:, None]
+    x = np.arange(n)[None, :]
+    m = np.cos(np.pi * (2 * x + 1) * k / (2 * n)) * np.sqrt(2 / n)
+    m[0] /= np.sqrt(2)
+    return m.astype(np.float32)
+
+
+_ROWS_8 = _box_matrix(THUMB_SIZE, HASH_SIZE)
+_COLS_9 = _box_matrix(THUMB_SIZE, HASH_SIZE + 1)
+_DCT = _dct_matrix(THUMB_SIZE)
+
+
+def gray_thumbnail(data):
+    """32×32 float32 grayscale of image bytes (EXIF orientation applied)."""
+    from PIL import Image, ImageOps
+
+    img = Image.open(BytesIO(data))
+    img.draft('L', (THUMB_SIZE * 4, THUMB_SIZE * 4))
+    img = ImageOps.exif_transpose(img)
+    if img.mode in ('RGBA', 'LA', 'P'):
+        img = img.convert('RGBA')
+        background = Image.new('RGBA', img.size, (255, 255, 255, 255))
+        img = Image.alpha_composite(background, img)
+    img = img.convert('L').resize((THUMB_SIZE, THUMB_SIZE), Image.Resampling.BOX)
+    return np.asarray(img, dtype=np.float32)
+
+
+def _pack(bits):
+    """(N, 64) bool → (N,) uint64, first bit most significant."""
+    return np.packbits(bits, axis=1).view('>u8').ravel().astype(np.uint64)
+
+
+def hash_pixels(pixels):
+    """
+    Hashes for a (N, 32, 32) stack of grayscale thumbnails.
+    Returns {'ahash', 'dhash', 'phash'} → (N,) uint64 arrays.
+    """
+    pixels = np.asarray(pixels, dtype=np.float32).reshape(-1, THUMB_SIZE, THUMB_SIZE)
+    n = len(pixels)
+
+    blocks = _ROWS_8 @ pixels @ _ROWS_8.T
+    flat_blocks = blocks.reshape(n, -1)
+    ahash = flat_blocks > flat_blocks.mean(axis=1, keepdims=True)
+
+    grid = _ROWS_8 @ pixels @ _COLS_9.T
+    dhash = (grid[:, :, 1:] > grid[:, :, :-1]).reshape(n, -1)
+
+    low = (_DCT @ pixels @ _DCT.T)[:, :HASH_SIZE, :HASH_SIZE].reshape(n, -1)
+    phash = low > np.median(low, axis=1, keepdims=True)
+
+    return {'ahash': _pack(ahash), 'dhash': _pack(dhash), 'phash': _pack(phash)}
+
+
+def hash_many(datas):
+    """
+    Hashes for a list of image bytes, in order. Unreadable or flat images
+    yield None.
+    """
+    thumbs, positions = [], []
+    for i, data in enumerate(datas):
+        try:
+            thumb = gray_thumbnail(data)
+        except Exception:
+            continue
+        if thumb.std() >= FLAT_STD:
+            thumbs.append(thumb)
+            positions.append(i)
+
+    results = [None] * len(datas)
+    if thumbs:
+        hashes = hash_pixels(np.stack(thumbs))
+        for row, i in enumerate(positions):
+            results[i] = {kind: int(hashes[kind][row]) for kind in HASH_KINDS}
+    return results
+
+
+def image_hashes(data):
+    """{'ahash', 'dhash', 'phash'} ints for image bytes, or None."""
+    return hash_many([data])[0]
+
+
+def _popcount(values):
+    """Per-element bit count of a uint64 array (np.bitwise_count on NumPy ≥ 2)."""
+    if hasattr(np, 'bitwise_count'):
+        return np.bitwise_count(values)
+    return np.unpackbits(values.view(np.uint8).reshape(-1, 8), axis=1).sum(axis=1)
+
+
+def hamming(a, b):
+    return (a ^ b).bit_count()
+
+
+def is_near_duplicate(a, b, radius=DEDUP_RADIUS, confirm_radius=CONFIRM_RADIUS):
+    return hamming(a['phash'], b['phash']) <= radius and hamming(a['dhash'], b['dhash']) <= confirm_radius
+
+
+# Postgres bigint is signed: store the same 64 bits as a signed value
+
+def to_db(value):
+    return value - (1 << 64) if value >= 1 << 63 else value
+
+
+def from_db(value):
+    return value + (1 << 64) if value < 0 else value
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Lookup
+# ═══════════════════════════════════════════════════════════════════
+
+class HashIndex:
+    """
+    pHash/dHash pairs in growable uint64 arrays with vectorised radius
+    search. Not thread-safe on its own (the module index is guarded).
+    """
+
+    def __init__(self, capacity=1024):
+        self._phash = np.zeros(capacity, dtype=np.uint64)
+        self._dhash = np.zeros(capacity, dtype=np.uint64)
+        self._ids = np.zeros(capacity, dtype=np.int64)
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def add(self, item_id, hashes):
+        if self._size == len(self._ids):
+            grow = max(1024, self._size)
+            self._phash = np.concatenate([self._phash, np.zeros(grow, dtype=np.uint64)])
+            self._dhash = np.concatenate([self._dhash, np.zeros(grow, dtype=np.uint64)])
+            self._ids = np.concatenate([self._ids, np.zeros(grow, dtype=np.int64)])
+        self._phash[self._size] = hashes['phash']
+        self._dhash[self._size] = hashes['dhash']
+        self._ids[self._size] = item_id
+        self._size += 1
+
+    def search(self, hashes, radius=DEDUP_RADIUS, confirm_radius=CONFIRM_RADIUS):
+        """[(distance, id)] of near-duplicates (see is_near_duplicate), closest first."""
+        n = self._size
+        if not n:
+            return []
+        p = _popcount(self._phash[:n] ^ np.uint64(hashes['phash']))
+        d = _popcount(self._dhash[:n] ^ np.uint64(hashes['dhash']))
+        hits = np.flatnonzero((p <= radius) & (d <= confirm_radius))
+        distance = p[hits].astype(np.int64) + d[hits]
+        order = np.argsort(distance, kind='stable')
+        return [(int(distance[i]), int(self._ids[hits[i]])) for i in order]
+
+
+class NearDuplicateFilter:
+    """
+    Rejects images that near-duplicate one already accepted in this batch.
+    Images that cannot be hashed are always accepted.
+    """
+
+    def __init__(self, radius=DEDUP_RADIUS, confirm_radius=CONFIRM_RADIUS):
+        self.radius = radius
+        self.confirm_radius = confirm_radius
+        self.accepted = []
+
+    def is_duplicate(self, data):
+        hashes = image_hashes(data)
+        if hashes is None:
+            return False
+        if any(is_near_duplicate(hashes, seen, self.radius, self.confirm_radius) for seen in self.accepted):
+            return True
+        self.accepted.append(hashes)
+        return False
+
+
+_index = None
+_index_built_at = 0.0
+_index_lock = threading.Lock()
+
+
+def _load_index():
+    from news.models import ImageAsset
+    index = HashIndex()
+    rows = (ImageAsset.objects.filter(status='ready', phash__isnull=False)
+            .values_list('id', 'phash', 'dhash').iterator(chunk_size=5000))
+    for asset_id, phash, dhash in rows:
+        index.add(asset_id, {'phash': from_db(phash), 'dhash': from_db(dhash)})
+    return index
+
+
+def get_index():
+    """Process-wide HashIndex of ready assets, rebuilt every INDEX_TTL."""
+    global _index, _index_built_at
+    with _index_lock:
+        if _index is None or time.monotonic() - _index_built_at > INDEX_TTL:
+            started = time.perf_counter()
+            _index = _load_index()
+            _index_built_at = time.monotonic()
+            logger.info(f"🧩 Image hash index: {len(_index)} assets in {time.perf_counter() - started:.2f}s")
+        return _index
+
+
+def register_asset(asset_id, hashes):
+    """Add a newly rendered asset to the in-process index."""
+    with _index_lock:
+        if _index is not None:
+            _index.add(asset_id, hashes)
+
+
+def reset_index():
+    global _index
+    with _index_lock:
+        _index = None
+
+
+def find_similar_asset(hashes, radius=DEDUP_RADIUS):
+    """Closest ready ImageAsset within `radius` of `hashes`, or None."""
+    from news.models import ImageAsset
+    try:
+        matches = get_index().search(hashes, radius)
+    except Exception as e:
+        logger.warning(f"⚠️ Image hash lookup failed: {e}")
+        return None
+    for _, asset_id in matches:
+        asset = ImageAsset.objects.filter(id=asset_id, status='ready').first()
+        if asset is not None:
+            return asset
+    return None
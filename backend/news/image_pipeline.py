@@ -0,0 +1,359 @@
+"""
+Off-request image optimisation.
+
+Article/ArticleImage saves used to run Pillow LANCZOS + WebP method=6 inline
+for up to three images. Uploads are now stored as-is and processed here:
+
+    schedule_image_processing(instance, fields) → after commit, in a daemon thread
+    process_image_field(model, pk, field)       → hash → ImageAsset → renditions
+    process_pending(limit)                      → scheduler sweep: images stored
+                                                  by other paths (publisher,
+                                                  screenshots, restarts)
+
+Decoding/resizing/encoding runs in a process pool (render_variants is a pure
+bytes → bytes function), producing RESPONSIVE_WIDTHS in WebP and, when Pillow
+supports it, AVIF. Source bytes are hashed first: an image that was already
+processed (re-upload, same screenshot on two articles) is linked to the
+existing ImageAsset without rendering. The same goes for near-duplicates —
+a resized or recompressed copy whose perceptual hash is within
+DEDUP_RADIUS of a ready asset reuses that asset's renditions.
+
+After processing, the image field points at the widest WebP rendition (so
+every existing `.url` consumer gets the optimised file) and `<field>_asset`
+holds the renditions for `srcset` (ImageAsset.srcset, serializers).
+"""
+import hashlib
+import logging
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from io import BytesIO
+
+logger = logging.getLogger(__name__)
+
+RESPONSIVE_WIDTHS = (320, 640, 1280, 1920)
+# Every rendition also fits this height (portrait images stop growing early)
+MAX_HEIGHT = 1080
+
+WEBP_QUALITY = 82
+# method=6 is ~3× slower than 4 for ~2% smaller files
+WEBP_METHOD = 4
+AVIF_QUALITY = 60
+AVIF_SPEED = 8
+
+# Which image fields carry renditions, and the FK that stores them
+IMAGE_FIELDS = {
+    'news.Article': {'image': 'image_asset', 'image_2': 'image_2_asset', 'image_3': 'image_3_asset'},
+    'news.ArticleImage': {'image': 'image_asset'},
+}
+
+LOCK_PREFIX = 'image_pipeline:lock:'
+LOCK_TTL = 10 * 60
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Rendering (runs in worker processes)
+# ═══════════════════════════════════════════════════════════════════
+
+def avif_supported():
+    try:
+        from PIL import features
+        return bool(features.check('avif'))
+    except Exception:
+        return False
+
+
+def default_formats():
+    return ('webp', 'avif') if avif_supported() else ('webp',)
+
+
+def _to_rgb(img):
+    """Flatten transparency onto white, like image_utils.optimize_image."""
+    from PIL import Image
+    if img.mode in ('RGBA', 'LA', 'P'):
+        if img.mode == 'P':
+            img = img.convert('RGBA')
+        background = Image.new('RGB', img.size, (255, 255, 255))
+        background.paste(img, mask=img.split()[-1])
+        return background
+    if img.mode != 'RGB':
+        return img.convert('RGB')
+    return img
+
+
+def render_variants(data, widths=RESPONSIVE_WIDTHS, formats=('webp',)):
+    """
+    Decode `data` once and encode every width × format.
+
+    Returns {'width', 'height', 'variants': [{width, height, format, data}]},
+    widest first. Widths larger than the source are dropped (the source size
+    itself is always produced), as are widths that collapse to the same size
+    under MAX_HEIGHT.
+    """
+    from PIL import Image, ImageOps
+
+    img = Image.open(BytesIO(data))
+    src_w, src_h = img.size
+    if img.getexif().get(0x0112, 1) in (5, 6, 7, 8):
+        # EXIF rotation by 90°/270° — report the displayed size
+        src_w, src_h = src_h, src_w
+    largest = min(max(widths), src_w)
+    # JPEG DCT scaling: decode at ≥ the largest box needed instead of full
+    # resolution (no-op for other formats)
+    img.draft('RGB', (max(widths), MAX_HEIGHT))
+    img = _to_rgb(ImageOps.exif_transpose(img))
+
+    targets = sorted({w for w in widths if w < largest} | {largest}, reverse=True)
+    variants = []
+    seen_sizes = set()
+    current = img
+    for width in targets:
+        frame = current.copy()
+        frame.thumbnail((width, MAX_HEIGHT), Image.Resampling.LANCZOS)
+        if frame.size in seen_sizes:
+            continue
+        seen_sizes.add(frame.size)
+        # Next (smaller) width resamples from this one — cheaper than from full size
+        current = frame
+        for fmt in formats:
+            out = BytesIO()
+            if fmt == 'avif':
+                frame.save(out, format='AVIF', quality=AVIF_QUALITY, speed=AVIF_SPEED)
+            else:
+                frame.save(out, format='WEBP', quality=WEBP_QUALITY, method=WEBP_METHOD)
+            variants.append({
+                'width': frame.width, 'height': frame.height,
+                'format': fmt, 'data': out.getvalue(),
+            })
+    return {'width': src_w, 'height': src_h, 'variants': variants}
+
+
+def _worker_count():
+    from django.conf import settings
+    configured = getattr(settings, 'IMAGE_PIPELINE_WORKERS', 0)
+    return configured or max(1, (os.cpu_count() or 2) // 2)
+
+
+def _executor():
+    """Shared process pool (spawn: no forked Django/DB state in workers)."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            import multiprocessing
+            _pool = ProcessPoolExecutor(
+                max_workers=_worker_count(),
+                mp_context=multiprocessing.get_context('spawn'),
+            )
+        return _pool
+
+
+def _render(data, formats):
+    """render_variants in the pool; inline if the pool is unavailable."""
+    global _pool
+    try:
+        return _executor().submit(render_variants, data, RESPONSIVE_WIDTHS, formats).result(timeout=120)
+    except (BrokenProcessPool, OSError, RuntimeError) as e:
+        logger.warning(f"⚠️ Image pool unavailable ({e}) — rendering inline")
+        with _pool_lock:
+            _pool = None
+        return render_variants(data, RESPONSIVE_WIDTHS, formats)
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Assets
+# ═══════════════════════════════════════════════════════════════════
+
+def content_hash(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def _variant_name(digest, width, fmt):
+    return f"variants/{digest[:2]}/{digest}/{width}.{fmt}"
+
+
+def build_asset(data, source_name=''):
+    """
+    ImageAsset for `data`, rendering it only if no ready asset has the same
+    bytes or (news/image_hashing.py) nearly the same picture.
+    Returns None if another worker is rendering the same image right now.
+    """
+    from django.core.cache import cache
+    from django.core.files.base import ContentFile
+    from django.core.files.storage import default_storage
+    from django.utils import timezone
+    from news.models import ImageAsset
+
+    from news.image_hashing import find_similar_asset, image_hashes, register_asset
+
+    digest = content_hash(data)
+    asset = ImageAsset.objects.filter(content_hash=digest).first()
+    if asset is not None and asset.status == 'ready':
+        return asset
+
+    hashes = image_hashes(data)
+    if asset is None and hashes:
+        # Resized / recompressed copy of an image we already rendered
+        similar = find_similar_asset(hashes)
+        if similar is not None:
+            logger.info(f"♻️ {source_name or digest[:12]} is a near-duplicate of asset #{similar.id}")
+            return similar
+    if asset is None:
+        asset, _ = ImageAsset.objects.get_or_create(content_hash=digest, defaults={'source_name': source_name})
+        if asset.status == 'ready':
+            return asset
+
+    if not cache.add(f'{LOCK_PREFIX}{digest}', 1, LOCK_TTL):
+        return None
+    try:
+        rendered = _render(data, default_formats())
+        variants = []
+        for v in rendered['variants']:
+            name = default_storage.save(_variant_name(digest, v['width'], v['format']), ContentFile(v['data']))
+            variants.append({
+                'width': v['width'], 'height': v['height'], 'format': v['format'],
+                'name': name, 'bytes': len(v['data']),
+            })
+        asset.width, asset.height = rendered['width'], rendered['height']
+        asset.variants = variants
+        asset.status = 'ready'
+        asset.error = ''
+    except Exception as e:
+        logger.warning(f"⚠️ Image {digest[:12]} ({source_name}) failed: {e}")
+        asset.status = 'failed'
+        asset.error = str(e)[:500]
+    finally:
+        cache.delete(f'{LOCK_PREFIX}{digest}')
+    asset.set_hashes(hashes)
+    asset.processed_at = timezone.now()
+    asset.save(update_fields=['width', 'height', 'variants', 'status', 'error',
+                              'ahash', 'dhash', 'phash', 'processed_at'])
+    if asset.status == 'ready' and hashes:
+        register_asset(asset.id, hashes)
+    return asset
+
+
+def _is_referenced(name):
+    """Is storage `name` still used by any image field?"""
+    from django.apps import apps
+    return any(
+        apps.get_model(label).objects.filter(**{field: name}).exists()
+        for label, fields in IMAGE_FIELDS.items()
+        for field in fields
+    )
+
+
+def process_image_field(model_label, pk, field):
+    """
+    Build (or reuse) the ImageAsset for one image field and point the field
+    at its widest WebP rendition. Returns the asset, or None if skipped.
+    """
+    from django.apps import apps
+    from django.core.files.storage import default_storage
+
+    model = apps.get_model(model_label)
+    asset_field = IMAGE_FIELDS[model_label][field]
+    obj = model.objects.filter(pk=pk).only('pk', field).first()
+    if obj is None:
+        return None
+    image = getattr(obj, field)
+    source_name = image.name if image else ''
+    if not source_name or source_name.startswith('http'):
+        return None
+
+    try:
+        with image.open('rb') as fh:
+            data = fh.read()
+    except Exception as e:
+        logger.warning(f"⚠️ Cannot read {source_name} for {model_label}#{pk}.{field}: {e}")
+        return None
+
+    asset = build_asset(data, source_name)
+    if asset is None:
+        return None
+
+    updates = {asset_field: asset}
+    webp = asset.variants_for('webp')
+    if asset.status == 'ready' and webp:
+        updates[field] = webp[0]['name']
+    # Only if the field still holds the image we processed
+    updated = model.objects.filter(pk=pk, **{field: source_name}).update(**updates)
+
+    # A duplicate upload is now unused — the shared asset serves it
+    if (updated and field in updates and source_name != asset.source_name
+            and not _is_referenced(source_name)):
+        try:
+            default_storage.delete(source_name)
+        except Exception as e:
+            logger.debug(f"Could not delete duplicate upload {source_name}: {e}")
+    return asset
+
+
+def _process_fields(model_label, pk, fields):
+    from django.db import close_old_connections
+    try:
+        for field in fields:
+            asset = process_image_field(model_label, pk, field)
+            if asset is not None:
+                logger.info(f"🖼️ {model_label}#{pk}.{field}: {asset.status}, {len(asset.variants)} renditions")
+    except Exception as e:
+        logger.error(f"❌ Image pipeline failed for {model_label}#{pk}: {e}")
+    finally:
+        close_old_connections()
+
+
+def schedule_image_processing(instance, fields):
+    """Process `fields` of a saved instance after the transaction commits."""
+    from django.db import transaction
+
+    model_label = instance._meta.label
+    pk = instance.pk
+
+    def _start():
+        threading.Thread(
+            target=_process_fields, args=(model_label, pk, list(fields)), daemon=True,
+        ).start()
+
+    transaction.on_commit(_start)
+
+
+def _pending_querysets():
+    from django.apps import apps
+    for label, fields in IMAGE_FIELDS.items():
+        model = apps.get_model(label)
+        for field, asset_field in fields.items():
+            qs = (model.objects.filter(**{f'{asset_field}__isnull': True})
+                  .exclude(**{f'{field}__isnull': True}).exclude(**{field: ''})
+                  .exclude(**{f'{field}__startswith': 'http'}))
+            yield label, field, qs
+
+
+def process_pending(limit=50):
+    """
+    Process up to `limit` stored images that have no asset yet (newest first).
+    Returns {'processed', 'reused', 'failed', 'remaining'}.
+    """
+    from django.utils import timezone
+
+    counts = {'processed': 0, 'reused': 0, 'failed': 0}
+    budget = limit
+    for label, field, qs in _pending_querysets():
+        if budget <= 0:
+            break
+        for pk in qs.order_by('-pk').values_list('pk', flat=True)[:budget]:
+            budget -= 1
+            started = timezone.now()
+            asset = process_image_field(label, pk, field)
+            if asset is None:
+                continue
+            if asset.status == 'failed':
+                counts['failed'] += 1
+            elif asset.processed_at and asset.processed_at < started:
+                counts['reused'] += 1
+            else:
+                counts['processed'] += 1
+    counts['remaining'] = sum(qs.count() for _, _, qs in _pending_querysets())
+    return counts
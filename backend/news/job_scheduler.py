@@ -0,0 +1,493 @@
+"""
+Cluster-wide periodic job scheduler.
+
+Replaces the per-process ``threading.Timer`` chains. Every job is registered
+once (see news/scheduler.py) and its state lives in Redis:
+
+  * Leader election — one process holds ``scheduler:leader`` (a renewed lease)
+    and runs the single ticker thread. Other gunicorn/daphne workers only
+    retry the lease, so N web workers no longer mean N copies of every timer.
+  * Occurrence claims — each due run is claimed with SET NX on
+    ``scheduler:claim:<job>:<due_ts>``, so even two tickers (e.g. the web
+    leader and Celery beat) dispatch a given run exactly once.
+  * Run slots — ``run_job`` holds one of ``max_concurrency`` leases while the
+    job body executes, which prevents overlapping runs across the cluster,
+    including manual triggers from the admin panel.
+  * Stats — last/next run, last status and a run-duration histogram per job,
+    read by the admin Scheduled Tasks view and ``manage.py scheduler_status``.
+
+SCHEDULER_MODE='thread' (default) runs jobs in the leader's process.
+SCHEDULER_MODE='celery' keeps web processes free of scheduler threads:
+Celery beat calls ``news.tasks.scheduler_tick`` and due jobs are sent to
+workers via ``news.tasks.run_scheduled_job``.
+
+Without Redis (DummyCache dev setups, tests) state falls back to in-process
+dicts, which gives the old single-process behaviour. When Redis is configured
+but unreachable, the process keeps retrying it (news/redis_state.py) and
+neither takes leadership nor ticks until it is back — an unfenced ticker in
+every process would bring back the duplicate runs.
+"""
+import logging
+import os
+import random
+import socket
+import threading
+import time
+import uuid
+
+from news.redis_state import RedisReconnector, redis_configured
+
+logger = logging.getLogger('news')
+
+KEY_PREFIX = 'autonews:scheduler'
+
+# Ticker wakes up this often to look for due jobs
+TICK_SECONDS = 5
+# Leader lease — renewed every tick, expires if the leader process dies
+LEADER_TTL = 30
+# Default ± fraction applied to every interval so jobs don't align across restarts
+DEFAULT_JITTER = 0.05
+
+# Run-duration histogram buckets (upper bounds, seconds)
+DURATION_BUCKETS = (1, 5, 30, 60, 300, 900, 1800)
+
+# Unique per process — used as lease owner
+INSTANCE_ID = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+
+
+class Job:
+    """A registered periodic job."""
+
+    def __init__(self, name, func, interval, initial_delay=60, jitter=DEFAULT_JITTER,
+                 max_concurrency=1, timeout=30 * 60, label=''):
+        self.name = name
+        self.func = func
+        self.interval = interval          # default seconds between runs
+        self.initial_delay = initial_delay
+        self.jitter = jitter
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout            # run-slot lease TTL (renewed while running)
+        self.label = label or name
+
+    def __repr__(self):
+        return f"Job(name='{self.name}', interval={self.interval})"
+
+
+_jobs = {}
+
+
+def register(name, func, interval, **kwargs):
+    """Register (or replace) a job. Safe to call repeatedly."""
+    _jobs[name] = Job(name, func, interval, **kwargs)
+    return _jobs[name]
+
+
+def get_job(name):
+    return _jobs.get(name)
+
+
+def get_jobs():
+    return list(_jobs.values())
+
+
+# =============================================================================
+# State store — Redis when available, in-process fallback otherwise
+# =============================================================================
+
+_RENEW_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('expire', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+_RELEASE_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+
+class _RedisStore:
+    """Lease and hash primitives on a raw redis-py connection."""
+
+    def __init__(self, conn):
+        self.conn = conn
+        self._renew = conn.register_script(_RENEW_SCRIPT)
+        self._release = conn.register_script(_RELEASE_SCRIPT)
+
+    def claim(self, key, owner, ttl):
+        return bool(self.conn.set(key, owner, nx=True, ex=max(1, int(ttl))))
+
+    def renew(self, key, owner, ttl):
+        return bool(self._renew(keys=[key], args=[owner, max(1, int(ttl))]))
+
+    def release(self, key, owner):
+        self._release(keys=[key], args=[owner])
+
+    def owner(self, key):
+        value = self.conn.get(key)
+        return value.decode() if isinstance(value, bytes) else value
+
+    def hset(self, key, mapping):
+        self.conn.hset(key, mapping={k: str(v) for k, v in mapping.items()})
+
+    def hgetall(self, key):
+        return {
+            (k.decode() if isinstance(k, bytes) else k): (v.decode() if isinstance(v, bytes) else v)
+            for k, v in self.conn.hgetall(key).items()
+        }
+
+    def hincr(self, key, field, amount=1):
+        if isinstance(amount, float):
+            self.conn.hincrbyfloat(key, field, amount)
+        else:
+            self.conn.hincrby(key, field, amount)
+
+
+class _LocalStore:
+    """Same interface as _RedisStore, process-local (no Redis configured)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._leases = {}   # key → (owner, expires_at)
+        self._hashes = {}
+
+    def _live_owner(self, key):
+        entry = self._leases.get(key)
+        if entry and entry[1] > time.time():
+            return entry[0]
+        return None
+
+    def claim(self, key, owner, ttl):
+        with self._lock:
+            if self._live_owner(key) is not None:
+                return False
+            self._leases[key] = (owner, time.time() + ttl)
+            return True
+
+    def renew(self, key, owner, ttl):
+        with self._lock:
+            if self._live_owner(key) != owner:
+                return False
+            self._leases[key] = (owner, time.time() + ttl)
+            return True
+
+    def release(self, key, owner):
+        with self._lock:
+            if self._live_owner(key) == owner:
+                self._leases.pop(key, None)
+
+    def owner(self, key):
+        with self._lock:
+            return self._live_owner(key)
+
+    def hset(self, key, mapping):
+        with self._lock:
+            self._hashes.setdefault(key, {}).update({k: str(v) for k, v in mapping.items()})
+
+    def hgetall(self, key):
+        with self._lock:
+            return dict(self._hashes.get(key, {}))
+
+    def hincr(self, key, field, amount=1):
+        with self._lock:
+            h = self._hashes.setdefault(key, {})
+            current = float(h.get(field, 0))
+            new = current + amount
+            h[field] = str(new if isinstance(amount, float) else int(new))
+
+
+_store = None
+_fallback = None  # per-process state while a configured Redis is unreachable
+_store_lock = threading.Lock()
+_redis = RedisReconnector('Job scheduler')
+
+
+def _get_store():
+    global _store, _fallback
+    if _store is not None:
+        return _store
+    with _store_lock:
+        if _store is None:
+            if not redis_configured():
+                _store = _LocalStore()
+            else:
+                conn = _redis.connect()
+                if conn is None:
+                    if _fallback is None:
+                        _fallback = _LocalStore()
+                    return _fallback
+                _store = _RedisStore(conn)
+                _fallback = None
+    return _store
+
+
+def _fenced():
+    """False while Redis is configured but down — leases would be per-process."""
+    return _get_store() is not _fallback
+
+
+def _job_key(name):
+    return f'{KEY_PREFIX}:job:{name}'
+
+
+def _hist_key(name):
+    return f'{KEY_PREFIX}:hist:{name}'
+
+
+def _jittered(seconds, jitter):
+    if seconds <= 0 or not jitter:
+        return max(0, seconds)
+    return max(1, seconds * (1 + random.uniform(-jitter, jitter)))
+
+
+# =============================================================================
+# Scheduling
+# =============================================================================
+
+def schedule_next(name, interval_seconds):
+    """Set the next run of ``name`` to now + jittered interval."""
+    job = _jobs.get(name)
+    jitter = job.jitter if job else DEFAULT_JITTER
+    _get_store().hset(_job_key(name), {'next_run': time.time() + _jittered(interval_seconds, jitter)})
+
+
+def run_soon(name):
+    """Make ``name`` due on the next tick (startup recovery, manual 'run now')."""
+    _get_store().hset(_job_key(name), {'next_run': time.time()})
+
+
+def _next_run(name):
+    value = _get_store().hgetall(_job_key(name)).get('next_run')
+    return float(value) if value else None
+
+
+def tick(dispatch=None):
+    """
+    Dispatch every due job once. Returns the names dispatched.
+
+    ``dispatch(job)`` starts the run; defaults to a local daemon thread.
+    The next run is pre-set from the job's default interval before dispatch —
+    job bodies that compute their own interval override it via schedule_next().
+    """
+    if not _fenced():
+        return []
+    store = _get_store()
+    dispatch = dispatch or _dispatch_thread
+    now = time.time()
+    dispatched = []
+
+    for job in get_jobs():
+        due_at = _next_run(job.name)
+        if due_at is None:
+            # First time this job is seen cluster-wide
+            store.hset(_job_key(job.name), {'next_run': now + job.initial_delay})
+            continue
+        if due_at > now:
+            continue
+
+        claim_key = f'{KEY_PREFIX}:claim:{job.name}:{int(due_at)}'
+        if not store.claim(claim_key, INSTANCE_ID, max(60, job.interval)):
+            continue
+
+        schedule_next(job.name, job.interval)
+        try:
+            dispatch(job)
+            dispatched.append(job.name)
+        except Exception as e:
+            logger.error(f"[SCHEDULER] ❌ Dispatch failed for {job.name}: {e}")
+
+    return dispatched
+
+
+def _dispatch_thread(job):
+    threading.Thread(target=run_job, args=(job.name,), name=f'job-{job.name}', daemon=True).start()
+
+
+def _dispatch_celery(job):
+    from news.tasks import run_scheduled_job
+    run_scheduled_job.delay(job.name)
+
+
+# =============================================================================
+# Execution
+# =============================================================================
+
+def _acquire_slot(job, owner):
+    store = _get_store()
+    for i in range(job.max_concurrency):
+        key = f'{KEY_PREFIX}:run:{job.name}:{i}'
+        if store.claim(key, owner, job.timeout):
+            return key
+    return None
+
+
+def _heartbeat(job, slot, owner, done):
+    """Keep the run slot alive while the job body runs (like the leader lease)."""
+    store = _get_store()
+    interval = job.timeout / 3
+    while not done.wait(interval):
+        try:
+            if not store.renew(slot, owner, job.timeout):
+                logger.warning(f"[SCHEDULER] ⚠️ {job.name} lost its run slot — an overlapping run may start")
+                return
+        except Exception as e:
+            logger.warning(f"[SCHEDULER] ⚠️ {job.name} slot renewal failed: {e}")
+
+
+def _observe(name, duration, status):
+    store = _get_store()
+    bucket = next((str(b) for b in DURATION_BUCKETS if duration <= b), '+Inf')
+    store.hincr(_hist_key(name), bucket, 1)
+    store.hincr(_hist_key(name), 'count', 1)
+    store.hincr(_hist_key(name), 'sum', float(round(duration, 3)))
+    store.hset(_job_key(name), {
+        'last_run': time.time(),
+        'last_duration': round(duration, 3),
+        'last_status': status,
+        'last_instance': INSTANCE_ID,
+    })
+
+
+def run_job(name):
+    """
+    Run a registered job body under a cluster-wide run slot.
+
+    Returns True if the job ran, False if it was unknown or all
+    ``max_concurrency`` slots were taken (overlap prevented).
+    """
+    job = _jobs.get(name)
+    if job is None:
+        logger.warning(f"[SCHEDULER] Unknown job '{name}'")
+        return False
+
+    owner = f'{INSTANCE_ID}:{uuid.uuid4().hex[:8]}'
+    slot = _acquire_slot(job, owner)
+    if slot is None:
+        logger.info(f"[SCHEDULER] ⏭️ {name} skipped — already running (limit {job.max_concurrency})")
+        _get_store().hset(_job_key(name), {'last_skipped': time.time()})
+        return False
+
+    done = threading.Event()
+    threading.Thread(target=_heartbeat, args=(job, slot, owner, done),
+                     name=f'job-heartbeat-{name}', daemon=True).start()
+    started = time.monotonic()
+    status = 'ok'
+    try:
+        job.func()
+    except Exception as e:
+        status = 'error'
+        logger.error(f"[SCHEDULER] ❌ Job {name} failed: {e}", exc_info=True)
+    finally:
+        done.set()
+        duration = time.monotonic() - started
+        if duration > job.timeout:
+            logger.warning(
+                f"[SCHEDULER] ⚠️ {name} ran {duration:.0f}s, past its {job.timeout}s timeout "
+                f"(slot was kept alive by heartbeat)"
+            )
+        _observe(name, duration, status)
+        _get_store().release(slot, owner)
+    return True
+
+
+# =============================================================================
+# Leader ticker thread
+# =============================================================================
+
+_ticker = None
+_stop = threading.Event()
+
+
+def is_leader():
+    return _get_store().owner(f'{KEY_PREFIX}:leader') == INSTANCE_ID
+
+
+def _hold_leadership():
+    if not _fenced():
+        return False
+    store = _get_store()
+    key = f'{KEY_PREFIX}:leader'
+    if store.renew(key, INSTANCE_ID, LEADER_TTL):
+        return True
+    if store.claim(key, INSTANCE_ID, LEADER_TTL):
+        logger.info(f"[SCHEDULER] 👑 {INSTANCE_ID} became scheduler leader")
+        return True
+    return False
+
+
+def _ticker_loop():
+    while not _stop.is_set():
+        try:
+            if _hold_leadership():
+                tick(_dispatch_thread)
+        except Exception as e:
+            logger.error(f"[SCHEDULER] ❌ Tick failed: {e}")
+        _stop.wait(TICK_SECONDS)
+
+
+def start():
+    """Start the ticker thread in this process (idempotent)."""
+    global _ticker
+    if _ticker is not None and _ticker.is_alive():
+        return _ticker
+    _stop.clear()
+    _ticker = threading.Thread(target=_ticker_loop, name='job-scheduler', daemon=True)
+    _ticker.start()
+    return _ticker
+
+
+def stop():
+    _stop.set()
+
+
+# =============================================================================
+# Introspection (admin view / CLI)
+# =============================================================================
+
+def _ts(value):
+    if not value:
+        return None
+    from datetime import datetime, timezone as dt_timezone
+    return datetime.fromtimestamp(float(value), tz=dt_timezone.utc).isoformat()
+
+
+def get_jobs_status():
+    """Per-job next/last run, last status and duration histogram."""
+    store = _get_store()
+    result = []
+    for job in sorted(get_jobs(), key=lambda j: j.name):
+        state = store.hgetall(_job_key(job.name))
+        hist = store.hgetall(_hist_key(job.name))
+        count = int(float(hist.get('count', 0)))
+        total = float(hist.get('sum', 0))
+        running = sum(
+            1 for i in range(job.max_concurrency)
+            if store.owner(f'{KEY_PREFIX}:run:{job.name}:{i}')
+        )
+        result.append({
+            'name': job.name,
+            'label': job.label,
+            'interval_seconds': job.interval,
+            'max_concurrency': job.max_concurrency,
+            'next_run': _ts(state.get('next_run')),
+            'last_run': _ts(state.get('last_run')),
+            'last_skipped': _ts(state.get('last_skipped')),
+            'last_status': state.get('last_status'),
+            'last_duration': float(state['last_duration']) if state.get('last_duration') else None,
+            'last_instance': state.get('last_instance'),
+            'running': running,
+            'runs': count,
+            'avg_duration': round(total / count, 3) if count else None,
+            'duration_histogram': {
+                b: int(float(hist.get(b, 0)))
+                for b in [str(b) for b in DURATION_BUCKETS] + ['+Inf']
+            },
+        })
+    return result
+
+
+def get_leader():
+    return _get_store().owner(f'{KEY_PREFIX}:leader')
@@ -3,8 +3,17 @@ Backfill CarSpecification for articles that don't have one,
 or refresh ALL existing specs with AI re-analysis.
 Uses shared spec_extractor module for AI extraction and normalization.
 Also optionally deletes duplicate articles.
+
+Extraction runs through news/batch_runner.py (concurrent, rate-paced,
+retried and checkpointed).
+
+Usage:
+    python manage.py backfill_missing_specs                  # articles without specs
+    python manage.py backfill_missing_specs --refresh-all --workers 8
+    python manage.py backfill_missing_specs --estimate       # count + AI cost estimate
 """
 from django.core.management.base import BaseCommand
+from news.batch_runner import BatchRunner, add_batch_arguments
 from news.models import Article, CarSpecification
 from news.spec_extractor import (
     extract_specs_from_content, save_specs_for_article, SKIP_ARTICLE_IDS,
@@ -21,6 +30,7 @@ class Command(BaseCommand):
         parser.add_argument('--article-id', nargs='+', type=int,
                           help='Process only specific article IDs')
         parser.add_argument('--delete-dupes', nargs='+', type=int, help='Article IDs to delete')
+        add_batch_arguments(parser)
 
     def handle(self, *args, **options):
         dry_run = options['dry_run']
@@ -74,55 +84,51 @@ class Command(BaseCommand):
             self.stdout.write(self.style.SUCCESS('✅ Nothing to process!'))
             return
 
-        created = 0
-        updated = 0
-
-        for article in articles:
-            try:
-                self.stdout.write(f'\n🔍 [{article.id}] "{article.title[:60]}"')
-
-                specs = extract_specs_from_content(article)
-                if not specs:
-                    self.stdout.write(self.style.WARNING('  ⚠️ Could not extract specs'))
-                    continue
-
-                make = specs.get('make', '')
-                model = specs.get('model', '')
-                if not make or make == 'Not specified':
-                    self.stdout.write(self.style.WARNING(f'  ⚠️ No make extracted, skipping'))
-                    continue
-
-                self.stdout.write(
-                    f'  → {make} {model} | engine={specs.get("engine","?")} | '
-                    f'hp={specs.get("horsepower","?")} | drivetrain={specs.get("drivetrain","?")} | '
-                    f'price={specs.get("price","?")}'
-                )
-
-                if not dry_run:
-                    existing = CarSpecification.objects.filter(article=article).exists()
-                    result = save_specs_for_article(article, specs)
-                    if result:
-                        if existing:
-                            self.stdout.write(f'  ✅ Updated spec')
-                            updated += 1
-                        else:
-                            self.stdout.write(f'  ✅ Created new spec')
-                            created += 1
-                    else:
-                        self.stdout.write(self.style.WARNING(f'  ⚠️ Could not save specs'))
-                else:
-                    existing = CarSpecification.objects.filter(article=article).exists()
-                    if existing:
-                        self.stdout.write(f'  [DRY] Would update')
-                        updated += 1
-                    else:
-                        self.stdout.write(f'  [DRY] Would create')
-                        created += 1
-            except Exception as e:
-                self.stderr.write(self.style.ERROR(f'  ❌ Error processing [{article.id}]: {e}'))
-                continue
+        runner = BatchRunner(
+            'backfill_missing_specs', options,
+            params={'article_id': article_ids, 'refresh_all': refresh_all},
+            tier='flash', checkpoint=not dry_run, stdout=self.stdout, style=self.style,
+        )
+        if options['estimate']:
+            runner.estimate(total, prompt_tokens=3000, completion_tokens=500)
+            return
+
+        self.dry_run = dry_run
+        stats = runner.run(articles.values_list('id', flat=True), self.process_article)
 
         action_verb = 'Would' if dry_run else ''
         self.stdout.write(self.style.SUCCESS(
-            f'\n✅ {action_verb} Created {created}, Updated {updated} CarSpecification records'
+            f'\n✅ {action_verb} Created {stats["created"]}, Updated {stats["updated"]} CarSpecification records'
         ))
+
+    def process_article(self, article_id, log):
+        article = Article.objects.get(id=article_id)
+        log(f'\n🔍 [{article.id}] "{article.title[:60]}"')
+
+        specs = extract_specs_from_content(article)
+        if not specs:
+            log('  ⚠️ Could not extract specs', 'WARNING')
+            return 'skipped'
+
+        make = specs.get('make', '')
+        model = specs.get('model', '')
+        if not make or make == 'Not specified':
+            log(f'  ⚠️ No make extracted, skipping', 'WARNING')
+            return 'skipped'
+
+        log(
+            f'  → {make} {model} | engine={specs.get("engine","?")} | '
+            f'hp={specs.get("horsepower","?")} | drivetrain={specs.get("drivetrain","?")} | '
+            f'price={specs.get("price","?")}'
+        )
+
+        existing = CarSpecification.objects.filter(article=article).exists()
+        if self.dry_run:
+            log(f'  [DRY] Would {"update" if existing else "create"}')
+            return 'updated' if existing else 'created'
+
+        if not save_specs_for_article(article, specs):
+            log(f'  ⚠️ Could not save specs', 'WARNING')
+            return 'skipped'
+        log(f'  ✅ {"Updated spec" if existing else "Created new spec"}')
+        return 'updated' if existing else 'created'
@@ -0,0 +1,43 @@
+"""
+Management command: backfill_rss_mentions
+-----------------------------------------
+Populate the hourly RSSMentionBucket counts (news/rss_intelligence.py) that
+back the trending brands/topics endpoints from stored RSSNewsItems. New
+items are counted at ingest; run this once after deploying, or to repair
+counts. Missing buckets are created and short ones raised to the recount;
+none are lowered or deleted, because cleanup_old removes new/read items after
+7 days and their hours must keep the counts recorded at ingest. Reruns are
+safe with any --days.
+
+Usage:
+    python manage.py backfill_rss_mentions            # every stored item
+    python manage.py backfill_rss_mentions --days 30  # only the last 30 days
+"""
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+
+class Command(BaseCommand):
+    help = 'Rebuild hourly RSS brand/topic mention buckets from stored news items'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=0,
+                            help='Only rebuild the last N days (0 = all stored items)')
+
+    def handle(self, *args, **options):
+        from news.rss_intelligence import rebuild_mention_buckets
+
+        since = timezone.now() - timedelta(days=options['days']) if options['days'] else None
+        scope = f"last {options['days']} days" if since else 'all stored items'
+        self.stdout.write(f"📊 Counting RSS mentions ({scope})...")
+
+        started = time.time()
+        stats = rebuild_mention_buckets(since=since)
+        self.stdout.write(self.style.SUCCESS(
+            f"✅ {stats['items']} items → {stats['mentions']} mentions in "
+            f"hourly buckets ({stats['buckets_created']} created, {stats['buckets_raised']} raised) "
+            f"in {time.time() - started:.1f}s"
+        ))
@@ -6,9 +6,14 @@ Usage:
     python manage.py backfill_vehicle_specs --with-ai # ML + Gemini deep_specs
     python manage.py backfill_vehicle_specs --dry-run  # Preview without creating
     python manage.py backfill_vehicle_specs --all       # Re-process ALL articles
+    python manage.py backfill_vehicle_specs --with-ai --estimate   # AI cost estimate
+
+Articles run through news/batch_runner.py; with --with-ai the runner paces
+the deep_specs calls to the FLASH tier's rate limits.
 """
 
 from django.core.management.base import BaseCommand
+from news.batch_runner import BatchRunner, add_batch_arguments
 from news.models import Article, VehicleSpecs, CarSpecification
 import logging
 
@@ -25,10 +30,9 @@ class Command(BaseCommand):
                             help='Preview what would be created without saving')
         parser.add_argument('--all', action='store_true',
                             help='Process all articles, not just missing ones')
+        add_batch_arguments(parser)
 
     def handle(self, *args, **options):
-        from ai_engine.modules.content_recommender import extract_specs_from_text
-
         dry_run = options['dry_run']
         with_ai = options['with_ai']
         process_all = options['all']
@@ -49,59 +53,72 @@ class Command(BaseCommand):
         total = car_specs.count()
         self.stdout.write(f"\n{'[DRY RUN] ' if dry_run else ''}Processing {total} articles...\n")
 
-        created = 0
-        updated = 0
-        errors = 0
+        if not total:
+            return
+
+        runner = BatchRunner(
+            'backfill_vehicle_specs', options, params={'with_ai': with_ai, 'all': process_all},
+            tier='flash' if with_ai else None, checkpoint=not dry_run,
+            stdout=self.stdout, style=self.style,
+        )
+        if options['estimate']:
+            if with_ai:
+                runner.estimate(total, prompt_tokens=1500, completion_tokens=1200, callers=('deep_specs',))
+            else:
+                self.stdout.write('💰 ML-only extraction makes no AI calls')
+            return
+
+        self.dry_run = dry_run
+        self.with_ai = with_ai
+        stats = runner.run(car_specs.values_list('id', flat=True), self.process_spec)
+
+        self.stdout.write(
+            f"\n{'[DRY RUN] ' if dry_run else ''}Done! Created: {stats['created']}, "
+            f"Updated: {stats['updated']}, Errors: {stats['failed']}\n"
+        )
+
+    def process_spec(self, spec_id, log):
+        from ai_engine.modules.content_recommender import extract_specs_from_text
+
+        cs = CarSpecification.objects.select_related('article').get(id=spec_id)
+        article = cs.article
 
-        for cs in car_specs:
-            article = cs.article
+        # Step 1: ML regex extraction (free)
+        ml_specs = extract_specs_from_text(article.title, article.content)
+        ml_specs['make'] = cs.make
+        ml_specs['model_name'] = cs.model or ''
+        ml_specs['trim_name'] = cs.trim or ''
+        ml_specs['article'] = article
+
+        field_count = len(ml_specs) - 1  # Exclude 'article'
+        status = f"  {'📋' if not self.dry_run else '👀'} [{article.id}] {cs.make} {cs.model} — {field_count} fields"
+
+        if self.dry_run:
+            log(f"{status} (dry run)")
+            return 'previewed'
+
+        # Step 2: Optionally use Gemini for deeper specs
+        if self.with_ai:
             try:
-                # Step 1: ML regex extraction (free)
-                ml_specs = extract_specs_from_text(article.title, article.content)
-                ml_specs['make'] = cs.make
-                ml_specs['model_name'] = cs.model or ''
-                ml_specs['trim_name'] = cs.trim or ''
-                ml_specs['article'] = article
-
-                field_count = len(ml_specs) - 1  # Exclude 'article'
-                status = f"  {'📋' if not dry_run else '👀'} [{article.id}] {cs.make} {cs.model} — {field_count} fields"
-
-                if dry_run:
-                    self.stdout.write(f"{status} (dry run)")
-                    continue
-
-                # Step 2: Optionally use Gemini for deeper specs
-                if with_ai:
-                    try:
-                        from ai_engine.modules.deep_specs import generate_deep_vehicle_specs
-                        deep_result = generate_deep_vehicle_specs(
-                            article,
-                            specs={'make': cs.make, 'model': cs.model, 'trim': cs.trim},
-                            provider='gemini',
-                        )
-                        if deep_result:
-                            self.stdout.write(f"{status} + AI ✅")
-                            created += 1
-                            continue
-                    except Exception as e:
-                        self.stdout.write(f"  ⚠️ AI failed: {e}, using ML-only")
-
-                # Step 3: Create VehicleSpecs from ML data
-                vs, was_created = VehicleSpecs.objects.update_or_create(
-                    make=ml_specs.get('make', ''),
-                    model_name=ml_specs.get('model_name', ''),
-                    trim_name=ml_specs.get('trim_name', ''),
-                    defaults={k: v for k, v in ml_specs.items()
-                              if k not in ('make', 'model_name', 'trim_name')},
+                from ai_engine.modules.deep_specs import generate_deep_vehicle_specs
+                deep_result = generate_deep_vehicle_specs(
+                    article,
+                    specs={'make': cs.make, 'model': cs.model, 'trim': cs.trim},
+                    provider='gemini',
                 )
-                if was_created:
-                    created += 1
-                else:
-                    updated += 1
-                self.stdout.write(f"{status} {'✅ created' if was_created else '🔄 updated'}")
-
+                if deep_result:
+                    log(f"{status} + AI ✅")
+                    return 'created'
             except Exception as e:
-                errors += 1
-                self.stdout.write(f"  ❌ [{article.id}] Error: {e}")
-
-        self.stdout.write(f"\n{'[DRY RUN] ' if dry_run else ''}Done! Created: {created}, Updated: {updated}, Errors: {errors}\n")
+                log(f"  ⚠️ AI failed: {e}, using ML-only")
+
+        # Step 3: Create VehicleSpecs from ML data
+        vs, was_created = VehicleSpecs.objects.update_or_create(
+            make=ml_specs.get('make', ''),
+            model_name=ml_specs.get('model_name', ''),
+            trim_name=ml_specs.get('trim_name', ''),
+            defaults={k: v for k, v in ml_specs.items()
+                      if k not in ('make', 'model_name', 'trim_name')},
+        )
+        log(f"{status} {'✅ created' if was_created else '🔄 updated'}")
+        return 'created' if was_created else 'updated'
@@ -0,0 +1,129 @@
+"""
+Management command: benchmark_comparison_pairs
+-----------------------------------------------
+Comparison-pair scoring behind /vehicle-specs/comparison-pairs/: the
+vectorised top-k scorer in news/comparison_pairs.py against the old loop
+(every itertools.combinations pair scored in Python, the full list sorted,
+then sliced), on synthetic specs or the stored ones, checking both return
+the same pairs in the same order.
+
+Nothing is written to the database.
+
+Usage:
+    python manage.py benchmark_comparison_pairs                  # 10k synthetic specs
+    python manage.py benchmark_comparison_pairs --specs 20000 --limit 100
+    python manage.py benchmark_comparison_pairs --brands byd,tesla
+    python manage.py benchmark_comparison_pairs --db             # stored VehicleSpecs
+"""
+import random
+import time
+from itertools import combinations
+
+from django.core.management.base import BaseCommand
+
+MAKES = ['BYD', 'Tesla', 'BMW', 'Audi', 'Mercedes', 'Zeekr', 'NIO', 'XPeng', 'Li Auto', 'Toyota',
+         'Hyundai', 'Kia', 'Volvo', 'Polestar', 'Geely', 'Chery', 'Porsche', 'Lucid', 'Ford', 'Xiaomi']
+BODY_TYPES = ['suv', 'sedan', 'hatchback', 'crossover', 'wagon', 'pickup']
+FUEL_TYPES = ['EV', 'PHEV', 'Hybrid', 'Gas']
+
+
+def _synthetic_rows(count, seed=3):
+    """SCORING_FIELDS tuples with realistic gaps in the spec sheets."""
+    rng = random.Random(seed)
+
+    def maybe(value, present=0.7):
+        return value if rng.random() < present else None
+
+    rows = []
+    for spec_id in range(1, count + 1):
+        rows.append((
+            spec_id,
+            rng.choice(MAKES),
+            rng.choice(BODY_TYPES),
+            rng.choice(FUEL_TYPES),
+            maybe(rng.randint(90, 1000)),
+            maybe(rng.randint(15_000, 150_000), 0.6),
+            maybe(rng.randint(300, 800), 0.5),
+            maybe(rng.randint(300, 800), 0.3),
+            maybe(round(rng.uniform(20, 120), 1), 0.5),
+            maybe(round(rng.uniform(2.5, 12), 1)),
+            maybe(rng.randint(3800, 5300), 0.6),
+        ))
+    # The view enumerates specs in VehicleSpecs ordering (make, model_name, ...)
+    rows.sort(key=lambda row: (row[1], row[0]))
+    return rows
+
+
+def _legacy(rows, brands, limit):
+    """The pre-vectorisation loop: score every pair, sort all, slice."""
+    segments = {}
+    for i, row in enumerate(rows):
+        segments.setdefault((row[2], row[3]), []).append(i)
+    raw_pairs = []
+    for members in segments.values():
+        for a, b in combinations(members, 2):
+            ra, rb = rows[a], rows[b]
+            if ra[1].lower() == rb[1].lower():
+                continue
+            if brands and ra[1].lower() not in brands and rb[1].lower() not in brands:
+                continue
+            score = 0
+            for r in (ra, rb):
+                score += 2 * bool(r[4]) + 3 * bool(r[5]) + 2 * bool(r[6] or r[7])
+                score += bool(r[8]) + 2 * bool(r[9]) + bool(r[10])
+            if ra[5] and rb[5] and min(ra[5], rb[5]) / max(ra[5], rb[5]) >= 0.6:
+                score += 5
+            raw_pairs.append((score, a, b))
+    raw_pairs.sort(key=lambda x: -x[0])
+    return raw_pairs[:limit], len(raw_pairs)
+
+
+class Command(BaseCommand):
+    help = 'Benchmark vectorised comparison-pair scoring against the full combinations loop'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--specs', type=int, default=10_000, help='Synthetic vehicle specs')
+        parser.add_argument('--limit', type=int, default=30, help='Pairs to return')
+        parser.add_argument('--brands', default='', help='Comma-separated brand filter')
+        parser.add_argument('--db', action='store_true', help='Use stored VehicleSpecs rows')
+
+    def handle(self, *args, **options):
+        from news.comparison_pairs import SCORING_FIELDS, score_pairs
+
+        if options['db']:
+            from news.models import VehicleSpecs
+            rows = list(VehicleSpecs.objects.exclude(make='').exclude(model_name='')
+                        .filter(body_type__isnull=False, fuel_type__isnull=False)
+                        .values_list(*SCORING_FIELDS))
+        else:
+            self.stdout.write(f"🧪 Generating {options['specs']:,} synthetic vehicle specs...")
+            rows = _synthetic_rows(options['specs'])
+        if len(rows) < 2:
+            self.stdout.write(self.style.WARNING('Not enough vehicle specs'))
+            return
+
+        brands = [b.strip().lower() for b in options['brands'].split(',') if b.strip()]
+        limit = options['limit']
+
+        started = time.perf_counter()
+        new_pairs, new_total, segments = score_pairs(rows, brands, limit)
+        vector_s = time.perf_counter() - started
+
+        self.stdout.write(f"Specs: {len(rows):,} in {len(segments)} segments, limit {limit}"
+                          + (f", brands {', '.join(brands)}" if brands else ''))
+        self.stdout.write("⏳ Running the combinations loop (this is the slow part)...")
+        started = time.perf_counter()
+        old_pairs, old_total = _legacy(rows, brands, limit)
+        legacy_s = time.perf_counter() - started
+
+        same = new_pairs == old_pairs and new_total == old_total
+        self.stdout.write("")
+        self.stdout.write(f"{'case':<16}{'ms':>12}{'pairs':>16}")
+        self.stdout.write(f"{'combinations':<16}{legacy_s * 1000:>12.1f}{old_total:>16,}")
+        self.stdout.write(f"{'vectorised':<16}{vector_s * 1000:>12.1f}{new_total:>16,}")
+        self.stdout.write(f"Speed-up: {legacy_s / vector_s if vector_s else 0:.0f}x")
+        self.stdout.write("")
+        if same:
+            self.stdout.write(self.style.SUCCESS(f'✅ Top {len(new_pairs)} pairs identical to the full sort'))
+        else:
+            self.stdout.write(self.style.ERROR('❌ Vectorised pairs differ from the full sort'))
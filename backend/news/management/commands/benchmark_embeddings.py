@@ -0,0 +1,168 @@
+"""
+Management command: benchmark_embeddings
+-----------------------------------------
+Compares the JSON embedding column with packed float32/float16/int8 storage
+(news/embedding_storage.py) on the full-index load path used by
+VectorSearchEngine._rebuild_from_database:
+
+    bytes/row   — what the database stores and sends per embedding
+    decode      — wire format → (n, dim) float32 matrix (json.loads vs np.frombuffer)
+    faiss       — IndexFlatL2 build from that matrix
+    recall@10   — nearest-neighbour agreement with the exact float32 index
+
+Vectors come from ArticleEmbedding (whatever format each row is stored in) or,
+with --synthetic, from random unit vectors, so it also runs on an empty DB.
+--db additionally times the real queries: JSON column vs load_vectors().
+
+Usage:
+    python manage.py benchmark_embeddings                   # stored embeddings
+    python manage.py benchmark_embeddings --synthetic 5000  # no DB needed
+    python manage.py benchmark_embeddings --db              # + real DB round-trips
+"""
+import json
+import time
+
+import numpy as np
+from django.core.management.base import BaseCommand
+
+FORMATS = ['json', 'float32', 'float16', 'int8']
+
+
+class Command(BaseCommand):
+    help = 'Benchmark JSON vs packed embedding storage on the FAISS rebuild path'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--limit', type=int, default=0,
+                            help='Use at most this many stored embeddings (0 = all)')
+        parser.add_argument('--synthetic', type=int, default=0,
+                            help='Use N random 768-d vectors instead of the database')
+        parser.add_argument('--dim', type=int, default=768,
+                            help='Dimensions for --synthetic vectors')
+        parser.add_argument('--repeat', type=int, default=3,
+                            help='Runs per case (the fastest run is kept)')
+        parser.add_argument('--db', action='store_true',
+                            help='Also time the real database queries')
+
+    def handle(self, *args, **options):
+        from news.embedding_storage import pack_vector, stack_vectors, unpack_vector
+
+        vectors = self._source_vectors(options)
+        if not vectors:
+            self.stdout.write(self.style.WARNING('No embeddings found — try --synthetic 5000'))
+            return
+        n, dim = len(vectors), len(vectors[0])
+        repeat = max(1, options['repeat'])
+        exact = stack_vectors(vectors)
+        self.stdout.write(f"Benchmarking {n} vectors × {dim} dims, best of {repeat}...")
+        self.stdout.write("")
+
+        # Wire formats as the DB driver hands them back
+        encoded = {'json': [json.dumps([float(x) for x in v]) for v in vectors]}
+        for dtype in FORMATS[1:]:
+            encoded[dtype] = [pack_vector(v, dtype) for v in vectors]
+
+        decoders = {
+            'json': lambda rows: stack_vectors(np.asarray(json.loads(r), dtype=np.float32) for r in rows),
+        }
+        for dtype in FORMATS[1:]:
+            decoders[dtype] = lambda rows, dtype=dtype: stack_vectors(
+                unpack_vector(data, dtype, d, scale) for data, d, scale in rows
+            )
+
+        queries = exact[np.random.default_rng(0).choice(n, size=min(100, n), replace=False)]
+        truth = self._neighbours(exact, queries)
+
+        self.stdout.write(f"{'format':<9}{'bytes/row':>10}{'total MB':>10}{'decode ms':>11}"
+                          f"{'faiss ms':>10}{'speed-up':>10}{'recall@10':>11}")
+        baseline = None
+        for fmt in FORMATS:
+            rows = encoded[fmt]
+            size = sum(len(r if fmt == 'json' else r[0]) for r in rows)
+            decode_s, matrix = self._time(lambda: decoders[fmt](rows), repeat)
+            build_s, _ = self._time(lambda: self._build_index(matrix), repeat)
+            total = decode_s + build_s
+            baseline = baseline or total
+            recall = self._recall(truth, self._neighbours(matrix, queries))
+            self.stdout.write(
+                f"{fmt:<9}{size / n:>10.0f}{size / 1024 / 1024:>10.2f}{decode_s * 1000:>11.1f}"
+                f"{build_s * 1000:>10.1f}{baseline / total if total else 0:>9.1f}x{recall:>11.3f}"
+            )
+
+        if options['db'] and not options['synthetic']:
+            self._benchmark_queries(options['limit'], repeat)
+
+    def _source_vectors(self, options):
+        if options['synthetic']:
+            rng = np.random.default_rng(42)
+            vecs = rng.standard_normal((options['synthetic'], options['dim'])).astype(np.float32)
+            vecs /= np.linalg.norm(vecs, axis=1, keepdims=True)
+            return list(vecs)
+
+        from news.models import ArticleEmbedding
+        from news.embedding_storage import load_vectors
+        queryset = ArticleEmbedding.objects.order_by('-id')
+        if options['limit']:
+            queryset = ArticleEmbedding.objects.filter(
+                id__in=list(queryset.values_list('id', flat=True)[:options['limit']])
+            )
+        vectors = list(load_vectors(queryset).values())
+        dims = {len(v) for v in vectors}
+        if len(dims) > 1:
+            # Mixed embedding models — benchmark the most common dimension only
+            common = max(dims, key=lambda d: sum(len(v) == d for v in vectors))
+            vectors = [v for v in vectors if len(v) == common]
+        return vectors
+
+    def _benchmark_queries(self, limit, repeat):
+        """Real round-trips: JSON column (old rebuild) vs packed columns (new)."""
+        from news.models import ArticleEmbedding
+        from news.embedding_storage import load_vectors
+
+        queryset = ArticleEmbedding.objects.all()
+        if limit:
+            queryset = queryset.filter(id__in=list(
+                ArticleEmbedding.objects.order_by('-id').values_list('id', flat=True)[:limit]
+            ))
+
+        def json_path():
+            return {aid: np.asarray(vec, dtype=np.float32)
+                    for aid, vec in queryset.exclude(embedding_vector=None)
+                    .values_list('article_id', 'embedding_vector')}
+
+        json_s, json_rows = self._time(json_path, repeat)
+        packed_s, packed_rows = self._time(lambda: load_vectors(queryset), repeat)
+        self.stdout.write("")
+        self.stdout.write(f"DB query  JSON column: {json_s * 1000:.1f} ms ({len(json_rows)} rows with JSON)")
+        self.stdout.write(f"DB query  load_vectors: {packed_s * 1000:.1f} ms ({len(packed_rows)} rows)")
+        if not json_rows:
+            self.stdout.write("ℹ️ JSON column already cleared — run pack_embeddings --keep-json "
+                              "on a copy to compare both paths on the same rows")
+
+    @staticmethod
+    def _build_index(matrix):
+        import faiss
+        index = faiss.IndexFlatL2(matrix.shape[1])
+        index.add(matrix)
+        return index
+
+    @staticmethod
+    def _neighbours(matrix, queries, k=10):
+        import faiss
+        index = faiss.IndexFlatL2(matrix.shape[1])
+        index.add(matrix)
+        return index.search(queries, min(k, len(matrix)))[1]
+
+    @staticmethod
+    def _recall(truth, found):
+        hits = sum(len(set(t) & set(f)) for t, f in zip(truth, found))
+        return hits / truth.size if truth.size else 1.0
+
+    @staticmethod
+    def _time(fn, repeat):
+        best, result = None, None
+        for _ in range(repeat):
+            started = time.perf_counter()
+            result = fn()
+            elapsed = time.perf_counter() - started
+            best = elapsed if best is None else min(best, elapsed)
+        return best, result
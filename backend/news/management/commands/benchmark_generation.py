@@ -0,0 +1,356 @@
+"""
+Management command: benchmark_generation
+-----------------------------------------
+Drives the YouTube, RSS and curator pipelines end-to-end against the
+configured PostgreSQL/Redis with the offline LLM stand-in
+(ai_engine/modules/local_provider.py) and reports, per stage:
+
+    wall time (mean / p50 / p95), DB queries and net allocations
+
+Network edges are replaced with fixtures (transcript, web context, no
+screenshots, no video facts) and any other outbound `requests` call fails
+immediately, so the numbers measure our own code plus the simulated LLM
+latency. Every iteration runs inside a transaction that is rolled back.
+
+DB queries are counted on the calling thread's connection only.
+
+Usage:
+    python manage.py benchmark_generation                         # all pipelines, 3 runs
+    python manage.py benchmark_generation --pipeline youtube --iterations 10
+    python manage.py benchmark_generation --latency fixed:0 --allocations
+    python manage.py benchmark_generation --cassette recorded.jsonl --json out.json
+"""
+import os
+import sys
+import json
+import time
+import tracemalloc
+from collections import defaultdict
+from contextlib import ExitStack, contextmanager
+from importlib import import_module
+from unittest.mock import patch
+
+from django.core.management.base import BaseCommand
+
+# Stages are "module:function" (or "module:Class.method"); nested stages
+# report inclusive time.
+PIPELINE_STAGES = {
+    'youtube': (
+        'ai_engine.modules.duplicate_checker:check_duplicate',
+        'ai_engine.modules.content_generator:_generate_article_content',
+        'ai_engine.modules.analyzer:analyze_transcript',
+        'ai_engine.modules.analyzer:categorize_article',
+        'ai_engine.modules.specs_enricher:enrich_specs_from_web',
+        'ai_engine.modules.specs_tribunal:convene_specs_tribunal',
+        'ai_engine.modules.article_prompt_builder:generate_article',
+        'ai_engine.modules.article_post_processor:post_process_article',
+        'ai_engine.modules.fact_checker:run_fact_check',
+        'ai_engine.modules.title_seo_generator:_generate_title_and_seo',
+        'ai_engine.modules.content_sanitizer:sanitize_article_html',
+        'ai_engine.modules.publisher:publish_article',
+        'ai_engine.modules.seo:generate_title_variants',
+        'ai_engine.modules.deep_specs:generate_deep_vehicle_specs',
+    ),
+    'rss': (
+        'ai_engine.modules.rss_aggregator:RSSAggregator.create_pending_with_ai',
+        'ai_engine.modules.article_prompt_builder:expand_press_release',
+        'ai_engine.modules.article_post_processor:post_process_article',
+        'ai_engine.modules.content_sanitizer:sanitize_article_html',
+    ),
+    'curator': (
+        'ai_engine.modules.rss_curator:_scan_items',
+        'ai_engine.modules.rss_curator:_cluster_items',
+        'ai_engine.modules.rss_curator:_score_item',
+        'ai_engine.modules.rss_curator:_generate_cluster_summary',
+    ),
+}
+
+# Imported before instrumenting so their `from x import y` bindings exist
+# and get patched too (instead of binding a wrapper that outlives the run).
+ENTRY_MODULES = (
+    'ai_engine.main',
+    'ai_engine.modules.article_generator',
+    'ai_engine.modules.content_generator',
+    'ai_engine.modules.rss_aggregator',
+    'ai_engine.modules.rss_curator',
+)
+
+FIXTURE_TRANSCRIPT = ' '.join([
+    "Today we're driving the new BYD Seal 06, a mid-size electric sedan.",
+    "It has dual motors with 530 horsepower and 670 newton metres of torque.",
+    "The 82.5 kilowatt-hour battery is rated at 620 kilometres of range.",
+    "On the 800 volt platform it charges from 10 to 80 percent in about 20 minutes.",
+    "Inside there is a 15.6 inch rotating screen and a digital cockpit.",
+    "Pricing starts at around 32,000 dollars, which undercuts the Tesla Model 3.",
+] * 20)
+
+FIXTURE_WEB_CONTEXT = (
+    "BYD Seal 06 2026 specifications: dual-motor AWD, 530 hp, 670 Nm, 0-100 km/h 3.8 s, "
+    "82.5 kWh LFP Blade battery, CLTC range 620 km, 800V charging 10-80% in 20 min, "
+    "length 4,830 mm, wheelbase 2,920 mm, price from $32,000."
+)
+
+FIXTURE_PRESS_RELEASE = (
+    "<p>BYD today announced the Seal 06, a mid-size electric sedan with dual motors producing "
+    "530 hp and an 82.5 kWh Blade battery rated at 620 km. The 800V platform supports "
+    "10-80% charging in 20 minutes. Deliveries start next month from $32,000.</p>"
+) * 4
+
+
+def _percentile(values, pct):
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+class _StageProbe:
+    """Wraps stage functions and collects wall time / queries / allocations per call."""
+
+    def __init__(self, allocations=False):
+        self.allocations = allocations
+        self.queries = 0
+        self.samples = defaultdict(list)
+
+    def count_query(self, execute, sql, params, many, context):
+        self.queries += 1
+        return execute(sql, params, many, context)
+
+    def wrap(self, name, func):
+        probe = self
+
+        def timed(*args, **kwargs):
+            queries_before = probe.queries
+            alloc_before = tracemalloc.get_traced_memory()[0] if probe.allocations else 0
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                probe.samples[name].append({
+                    'ms': (time.perf_counter() - started) * 1000,
+                    'queries': probe.queries - queries_before,
+                    'alloc_kb': ((tracemalloc.get_traced_memory()[0] - alloc_before) / 1024
+                                 if probe.allocations else 0.0),
+                })
+        timed.__wrapped__ = func
+        return timed
+
+    @contextmanager
+    def instrument(self, stages):
+        """Replace every module-level reference to each stage with a timed wrapper."""
+        for module_path in ENTRY_MODULES:
+            import_module(module_path)
+        with ExitStack() as stack:
+            for stage in stages:
+                module_path, _, attr = stage.partition(':')
+                owner = import_module(module_path)
+                if '.' in attr:
+                    class_name, method = attr.split('.', 1)
+                    cls = getattr(owner, class_name)
+                    stack.enter_context(patch.object(cls, method, self.wrap(attr, getattr(cls, method))))
+                    continue
+                original = getattr(owner, attr)
+                wrapped = self.wrap(attr, original)
+                for module in list(sys.modules.values()):
+                    namespace = getattr(module, '__dict__', None)
+                    if not namespace:
+                        continue
+                    for name, value in list(namespace.items()):
+                        if value is original:
+                            stack.enter_context(patch.object(module, name, wrapped))
+            yield
+
+
+class Command(BaseCommand):
+    help = 'Benchmark the YouTube/RSS/curator pipelines end-to-end with the offline LLM stand-in'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--pipeline', choices=['youtube', 'rss', 'curator', 'all'], default='all')
+        parser.add_argument('--iterations', type=int, default=3, help='Runs per pipeline')
+        parser.add_argument('--latency', default=None,
+                            help='LLM latency spec (see local_provider.py), e.g. "fixed:0"')
+        parser.add_argument('--cassette', default=None, help='JSONL cassette of recorded responses')
+        parser.add_argument('--seed', type=int, default=42, help='Latency RNG seed')
+        parser.add_argument('--curator-items', type=int, default=60,
+                            help='RSS items seeded for the curator pipeline')
+        parser.add_argument('--allocations', action='store_true',
+                            help='Track net allocations per stage with tracemalloc (slower)')
+        parser.add_argument('--json', dest='json_path', default=None, help='Also write results as JSON')
+
+    def handle(self, *args, **options):
+        from django.db import connection, transaction
+        from ai_engine.modules.local_provider import LocalProvider
+
+        pipelines = list(PIPELINE_STAGES) if options['pipeline'] == 'all' else [options['pipeline']]
+        iterations = max(1, options['iterations'])
+
+        os.environ['AI_PROVIDER_OVERRIDE'] = 'local'
+        LocalProvider.configure(cassette=options['cassette'], latency=options['latency'], seed=options['seed'])
+        if options['allocations']:
+            tracemalloc.start()
+
+        report = {}
+        try:
+            for pipeline in pipelines:
+                runner = getattr(self, f'_run_{pipeline}')
+                probe = _StageProbe(allocations=options['allocations'])
+                LocalProvider.reset_stats()
+                totals, blocked = [], []
+                self.stdout.write(f"▶ {pipeline}: {iterations} iteration(s)...")
+                for iteration in range(iterations):
+                    with ExitStack() as stack:
+                        stack.enter_context(self._offline(blocked))
+                        stack.enter_context(connection.execute_wrapper(probe.count_query))
+                        stack.enter_context(probe.instrument(PIPELINE_STAGES[pipeline]))
+                        queries_before = probe.queries
+                        started = time.perf_counter()
+                        with transaction.atomic():
+                            ok = runner(iteration, options)
+                            transaction.set_rollback(True)
+                        totals.append({
+                            'ms': (time.perf_counter() - started) * 1000,
+                            'queries': probe.queries - queries_before,
+                            'ok': bool(ok),
+                        })
+                report[pipeline] = self._summarise(probe, totals, blocked, LocalProvider.stats())
+                self._print(pipeline, report[pipeline], options['allocations'])
+        finally:
+            if options['allocations']:
+                tracemalloc.stop()
+            os.environ.pop('AI_PROVIDER_OVERRIDE', None)
+
+        if options['json_path']:
+            with open(options['json_path'], 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2)
+            self.stdout.write(f"📝 Results written to {options['json_path']}")
+
+    # ── Pipelines ─────────────────────────────────────────────────────
+
+    def _run_youtube(self, iteration, options):
+        from ai_engine.main import generate_article_from_youtube
+
+        url = f'https://www.youtube.com/watch?v=bench{iteration:06d}'
+        result = generate_article_from_youtube(url, provider='local', is_published=False)
+        if not result.get('success'):
+            self.stdout.write(self.style.WARNING(f"  ⚠️ youtube run failed: {result.get('error')}"))
+        return result.get('success')
+
+    def _run_rss(self, iteration, options):
+        from news.models import RSSFeed
+        from ai_engine.modules.rss_aggregator import RSSAggregator
+
+        feed = RSSFeed.objects.create(
+            name='Benchmark feed', feed_url=f'https://bench.invalid/feed-{iteration}.xml',
+        )
+        entry = {
+            'title': 'BYD Seal 06 launches with 620 km range',
+            'link': f'https://bench.invalid/seal-06-{iteration}',
+        }
+        pending = RSSAggregator().create_pending_with_ai(
+            feed, entry, FIXTURE_PRESS_RELEASE, [], f'bench-{iteration}',
+        )
+        return pending is not None
+
+    def _run_curator(self, iteration, options):
+        from news.models import RSSFeed, RSSNewsItem
+        from ai_engine.modules.rss_curator import curate
+
+        feed = RSSFeed.objects.create(
+            name='Benchmark feed', feed_url=f'https://bench.invalid/curator-{iteration}.xml',
+        )
+        makes = ['BYD', 'Zeekr', 'Xpeng', 'NIO', 'Li Auto', 'Geely']
+        RSSNewsItem.objects.bulk_create([
+            RSSNewsItem(
+                rss_feed=feed,
+                title=f'{makes[i % len(makes)]} unveils model {i // len(makes)} with 600 km range',
+                excerpt=f'{makes[i % len(makes)]} announced a new EV with 500 hp and 800V charging.',
+                source_url=f'https://bench.invalid/item-{iteration}-{i}',
+                content_hash=f'bench-{iteration}-{i}',
+                status='new',
+            )
+            for i in range(options['curator_items'])
+        ])
+        result = curate(days=1, max_results=20, include_ai_summary=True, provider='local')
+        return bool(result)
+
+    # ── Offline fixtures ──────────────────────────────────────────────
+
+    @contextmanager
+    def _offline(self, blocked):
+        import requests
+
+        def refuse(session, method, url, *args, **kwargs):
+            blocked.append(url)
+            raise requests.ConnectionError(f'offline benchmark: {method} {url}')
+
+        with ExitStack() as stack:
+            for target, value in (
+                ('ai_engine.modules.transcriber.transcribe_from_youtube', FIXTURE_TRANSCRIPT),
+                ('ai_engine.modules.video_fact_extractor.extract_facts_from_video', {}),
+                ('ai_engine.modules.searcher.get_web_context', FIXTURE_WEB_CONTEXT),
+                ('ai_engine.modules.downloader.extract_video_screenshots', []),
+            ):
+                stack.enter_context(patch(target, return_value=value))
+            stack.enter_context(patch.object(requests.Session, 'request', refuse))
+            yield
+
+    # ── Reporting ─────────────────────────────────────────────────────
+
+    @staticmethod
+    def _summarise(probe, totals, blocked, llm_stats):
+        stages = {}
+        for name, samples in probe.samples.items():
+            ms = [s['ms'] for s in samples]
+            stages[name] = {
+                'calls': len(samples),
+                'mean_ms': sum(ms) / len(ms),
+                'p50_ms': _percentile(ms, 50),
+                'p95_ms': _percentile(ms, 95),
+                'queries_per_call': sum(s['queries'] for s in samples) / len(samples),
+                'alloc_kb_per_call': sum(s['alloc_kb'] for s in samples) / len(samples),
+            }
+        total_ms = [t['ms'] for t in totals]
+        llm_seconds = sum(s['latency_s'] for s in llm_stats.values())
+        return {
+            'runs': len(totals),
+            'succeeded': sum(t['ok'] for t in totals),
+            'total': {
+                'mean_ms': sum(total_ms) / len(total_ms),
+                'p50_ms': _percentile(total_ms, 50),
+                'p95_ms': _percentile(total_ms, 95),
+                'queries_per_run': sum(t['queries'] for t in totals) / len(totals),
+                'llm_ms_per_run': llm_seconds * 1000 / len(totals),
+            },
+            'stages': stages,
+            'llm': llm_stats,
+            'blocked_requests': len(blocked),
+        }
+
+    def _print(self, pipeline, result, allocations):
+        total = result['total']
+        self.stdout.write("")
+        self.stdout.write(self.style.MIGRATE_HEADING(
+            f"{pipeline}: {result['succeeded']}/{result['runs']} succeeded — "
+            f"mean {total['mean_ms']:.0f} ms (p95 {total['p95_ms']:.0f} ms), "
+            f"{total['queries_per_run']:.0f} queries/run, "
+            f"{total['llm_ms_per_run']:.0f} ms simulated LLM/run"
+        ))
+        header = f"  {'stage':<34}{'calls':>6}{'mean ms':>10}{'p50 ms':>10}{'p95 ms':>10}{'queries':>9}"
+        if allocations:
+            header += f"{'alloc KiB':>11}"
+        self.stdout.write(header)
+        for name, s in sorted(result['stages'].items(), key=lambda kv: -kv[1]['mean_ms'] * kv[1]['calls']):
+            line = (f"  {name[:33]:<34}{s['calls']:>6}{s['mean_ms']:>10.1f}{s['p50_ms']:>10.1f}"
+                    f"{s['p95_ms']:>10.1f}{s['queries_per_call']:>9.1f}")
+            if allocations:
+                line += f"{s['alloc_kb_per_call']:>11.1f}"
+            self.stdout.write(line)
+
+        if result['llm']:
+            self.stdout.write(f"  {'LLM caller':<34}{'calls':>6}{'sim ms':>10}")
+            for caller, s in sorted(result['llm'].items(), key=lambda kv: -kv[1]['latency_s']):
+                self.stdout.write(f"  {caller[:33]:<34}{s['calls']:>6}{s['latency_s'] * 1000:>10.0f}")
+        if result['blocked_requests']:
+            self.stdout.write(f"  🚫 {result['blocked_requests']} outbound HTTP request(s) blocked")
+        self.stdout.write("")
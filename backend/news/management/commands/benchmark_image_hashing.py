@@ -0,0 +1,184 @@
+"""
+Management command: benchmark_image_hashing
+--------------------------------------------
+Perceptual hashing (news/image_hashing.py) throughput and near-duplicate
+lookup latency:
+
+    hashing   — decode to a 32×32 thumbnail, then aHash/dHash/pHash per image
+                and as one batched matrix pass
+    lookup    — HashIndex (vectorised XOR + popcount scan) against a BK-tree
+                over the same hashes, at --index-size entries with planted
+                near-duplicates, reporting p50/p99 latency and recall
+
+Nothing touches the database or storage.
+
+Usage:
+    python manage.py benchmark_image_hashing                     # 100k-entry index
+    python manage.py benchmark_image_hashing --index-size 1000000 --queries 500
+    python manage.py benchmark_image_hashing --dir ~/photos
+"""
+import time
+from pathlib import Path
+
+from django.core.management.base import BaseCommand
+
+IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.webp'}
+
+
+class _BKTree:
+    """Baseline: Burkhard-Keller tree keyed on pHash Hamming distance."""
+
+    def __init__(self):
+        self.root = None
+
+    def add(self, item_id, hashes):
+        node = (hashes['phash'], hashes['dhash'], item_id, {})
+        if self.root is None:
+            self.root = node
+            return
+        current = self.root
+        while True:
+            distance = (current[0] ^ node[0]).bit_count()
+            child = current[3].get(distance)
+            if child is None:
+                current[3][distance] = node
+                return
+            current = child
+
+    def search(self, hashes, radius, confirm_radius):
+        found, stack, visited = [], [self.root] if self.root else [], 0
+        while stack:
+            phash, dhash, item_id, children = stack.pop()
+            visited += 1
+            distance = (phash ^ hashes['phash']).bit_count()
+            if distance <= radius and (dhash ^ hashes['dhash']).bit_count() <= confirm_radius:
+                found.append(item_id)
+            for edge, child in children.items():
+                if distance - radius <= edge <= distance + radius:
+                    stack.append(child)
+        return found, visited
+
+
+def _percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+class Command(BaseCommand):
+    help = 'Benchmark perceptual hashing throughput and near-duplicate lookup latency'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dir', help='Directory of images to hash instead of synthetic photos')
+        parser.add_argument('--count', type=int, default=100, help='Number of synthetic images to hash')
+        parser.add_argument('--size', default='1920x1080', help='Synthetic image size WxH')
+        parser.add_argument('--index-size', type=int, default=100_000, help='Hashes in the lookup index')
+        parser.add_argument('--queries', type=int, default=200, help='Lookups per structure')
+        parser.add_argument('--radius', type=int, default=None, help='Hamming radius (default DEDUP_RADIUS)')
+
+    def handle(self, *args, **options):
+        from news.image_hashing import DEDUP_RADIUS
+        radius = DEDUP_RADIUS if options['radius'] is None else options['radius']
+        self._bench_hashing(options)
+        self.stdout.write("")
+        self._bench_lookup(options['index_size'], options['queries'], radius)
+
+    # ── hashing ──────────────────────────────────────────────────────
+
+    def _load(self, options):
+        if options['dir']:
+            paths = sorted(p for p in Path(options['dir']).expanduser().iterdir()
+                           if p.suffix.lower() in IMAGE_EXTENSIONS)
+            return [p.read_bytes() for p in paths]
+        from news.management.commands.benchmark_image_pipeline import _synthetic_photo
+        width, height = (int(v) for v in options['size'].lower().split('x'))
+        self.stdout.write(f"🧪 Generating {options['count']} synthetic {width}×{height} JPEGs...")
+        return [_synthetic_photo(i, (width, height)) for i in range(options['count'])]
+
+    def _bench_hashing(self, options):
+        import numpy as np
+        from news.image_hashing import gray_thumbnail, hash_pixels
+
+        images = self._load(options)
+        if not images:
+            self.stdout.write(self.style.WARNING('No images to hash'))
+            return
+        avg_kb = sum(map(len, images)) / len(images) / 1024
+        self.stdout.write(f"Hashing {len(images)} image(s), avg {avg_kb:.0f} kB")
+
+        started = time.perf_counter()
+        thumbs = np.stack([gray_thumbnail(data) for data in images])
+        decode = time.perf_counter() - started
+
+        started = time.perf_counter()
+        for thumb in thumbs:
+            hash_pixels(thumb[None])
+        single = time.perf_counter() - started
+
+        started = time.perf_counter()
+        hash_pixels(thumbs)
+        batched = time.perf_counter() - started
+
+        n = len(images)
+        self.stdout.write(f"{'stage':<28}{'ms/img':>10}{'img/s':>12}")
+        for label, elapsed in (('decode → 32×32 thumbnail', decode),
+                               ('hash (one at a time)', single),
+                               ('hash (batched)', batched),
+                               ('end to end (batched)', decode + batched)):
+            self.stdout.write(f"{label:<28}{elapsed / n * 1000:>10.3f}{n / elapsed if elapsed else 0:>12.0f}")
+
+    # ── lookup ───────────────────────────────────────────────────────
+
+    def _bench_lookup(self, size, queries, radius):
+        import numpy as np
+        from news.image_hashing import CONFIRM_RADIUS, HashIndex
+
+        rng = np.random.default_rng(42)
+
+        def _random(n):
+            return [int(v) for v in rng.integers(0, 2 ** 64, n, dtype=np.uint64)]
+
+        phashes, dhashes = _random(size), _random(size)
+
+        def _flip(value, bits):
+            for bit in rng.choice(64, size=bits, replace=False):
+                value ^= 1 << int(bit)
+            return value
+
+        # Half the queries are near-duplicates of a stored hash, half are new images
+        targets = rng.choice(size, size=queries, replace=False)
+        probes = []
+        for n, target in enumerate(targets):
+            if n % 2:
+                probes.append((None, dict(zip(('phash', 'dhash'), _random(2)))))
+            else:
+                flips = int(rng.integers(0, radius + 1))
+                probes.append((int(target), {'phash': _flip(phashes[target], flips),
+                                             'dhash': _flip(dhashes[target], flips)}))
+
+        self.stdout.write(f"Lookup: {size:,} hashes, {queries} queries, radius {radius}")
+        self.stdout.write(f"{'structure':<18}{'build s':>9}{'p50 ms':>9}{'p99 ms':>9}{'recall':>8}{'visited':>10}")
+
+        for label, structure in (('HashIndex (scan)', HashIndex()), ('BK-tree', _BKTree())):
+            started = time.perf_counter()
+            for item_id, (phash, dhash) in enumerate(zip(phashes, dhashes)):
+                structure.add(item_id, {'phash': phash, 'dhash': dhash})
+            build = time.perf_counter() - started
+
+            latencies, hits, planted, visited = [], 0, 0, 0
+            for expected, probe in probes:
+                started = time.perf_counter()
+                if isinstance(structure, HashIndex):
+                    found = [item_id for _, item_id in structure.search(probe, radius)]
+                    visited += size
+                else:
+                    found, seen = structure.search(probe, radius, CONFIRM_RADIUS)
+                    visited += seen
+                latencies.append((time.perf_counter() - started) * 1000)
+                if expected is not None:
+                    planted += 1
+                    hits += expected in found
+
+            self.stdout.write(
+                f"{label:<18}{build:>9.2f}{_percentile(latencies, 50):>9.3f}{_percentile(latencies, 99):>9.3f}"
+                f"{hits / planted if planted else 0:>8.2f}{visited // len(probes):>10,}"
+            )
@@ -0,0 +1,131 @@
+"""
+Management command: benchmark_image_pipeline
+---------------------------------------------
+Image processing throughput (news/image_pipeline.py) on synthetic photos or a
+directory of real images:
+
+    legacy      — image_utils.optimize_image: one 1920×1080 WebP, method=6
+    renditions  — render_variants: RESPONSIVE_WIDTHS in WebP (+ AVIF if available)
+
+Renditions are measured inline and in a spawn process pool at 1..N workers,
+reporting images/s, images/s per worker and encoded bytes. Nothing touches the
+database or storage.
+
+Usage:
+    python manage.py benchmark_image_pipeline                  # 24 synthetic 4000×3000 JPEGs
+    python manage.py benchmark_image_pipeline --dir ~/photos --workers 4
+    python manage.py benchmark_image_pipeline --count 48 --no-avif
+"""
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+from pathlib import Path
+
+from django.core.management.base import BaseCommand
+
+IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.webp'}
+
+
+def _synthetic_photo(seed, size):
+    """A smooth gradient with noise, closer to a photo than pure noise."""
+    import numpy as np
+    from PIL import Image
+    rng = np.random.default_rng(seed)
+    w, h = size
+    y, x = np.mgrid[0:h, 0:w].astype(np.float32)
+    base = np.stack([
+        128 + 100 * np.sin(x / (80 + 40 * rng.random()) + c) * np.cos(y / (120 + 60 * rng.random()))
+        for c in range(3)
+    ], axis=-1)
+    noise = rng.normal(0, 12, size=base.shape)
+    pixels = np.clip(base + noise, 0, 255).astype(np.uint8)
+    out = BytesIO()
+    Image.fromarray(pixels).save(out, format='JPEG', quality=90)
+    return out.getvalue()
+
+
+def _legacy(data):
+    from django.core.files.uploadedfile import SimpleUploadedFile
+    from news.image_utils import optimize_image
+    return len(optimize_image(SimpleUploadedFile('bench.jpg', data)).read())
+
+
+def _renditions(data, formats):
+    from news.image_pipeline import RESPONSIVE_WIDTHS, render_variants
+    return sum(len(v['data']) for v in render_variants(data, RESPONSIVE_WIDTHS, formats)['variants'])
+
+
+class Command(BaseCommand):
+    help = 'Benchmark image rendition throughput per worker'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dir', help='Directory of images to use instead of synthetic photos')
+        parser.add_argument('--count', type=int, default=24, help='Number of synthetic images')
+        parser.add_argument('--size', default='4000x3000', help='Synthetic image size WxH')
+        parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                            help='Largest process pool size to measure')
+        parser.add_argument('--no-avif', action='store_true', help='WebP renditions only')
+        parser.add_argument('--no-legacy', action='store_true', help='Skip the optimize_image baseline')
+
+    def handle(self, *args, **options):
+        from news.image_pipeline import avif_supported
+
+        images = self._load(options)
+        if not images:
+            self.stdout.write(self.style.WARNING('No images to benchmark'))
+            return
+        formats = ('webp',) if options['no_avif'] or not avif_supported() else ('webp', 'avif')
+        avg_kb = sum(map(len, images)) / len(images) / 1024
+        self.stdout.write(f"Benchmarking {len(images)} image(s), avg {avg_kb:.0f} kB, "
+                          f"formats {'+'.join(formats)}, {os.cpu_count()} CPU(s)")
+        self.stdout.write("")
+        self.stdout.write(f"{'case':<22}{'workers':>8}{'img/s':>9}{'img/s/worker':>14}{'out kB/img':>12}")
+
+        if not options['no_legacy']:
+            elapsed, out = self._inline(_legacy, images)
+            self._row('legacy optimize_image', 1, len(images), elapsed, out)
+
+        elapsed, out = self._inline(lambda d: _renditions(d, formats), images)
+        self._row('renditions (inline)', 1, len(images), elapsed, out)
+
+        workers = 1
+        while workers <= max(1, options['workers']):
+            elapsed, out = self._pooled(images, formats, workers)
+            self._row('renditions (pool)', workers, len(images), elapsed, out)
+            workers *= 2
+
+    def _load(self, options):
+        if options['dir']:
+            paths = sorted(p for p in Path(options['dir']).expanduser().iterdir()
+                           if p.suffix.lower() in IMAGE_EXTENSIONS)
+            return [p.read_bytes() for p in paths]
+        width, height = (int(v) for v in options['size'].lower().split('x'))
+        self.stdout.write(f"🧪 Generating {options['count']} synthetic {width}×{height} JPEGs...")
+        return [_synthetic_photo(i, (width, height)) for i in range(options['count'])]
+
+    @staticmethod
+    def _inline(fn, images):
+        started = time.perf_counter()
+        out = sum(fn(data) for data in images)
+        return time.perf_counter() - started, out
+
+    @staticmethod
+    def _pooled(images, formats, workers):
+        from news.image_pipeline import RESPONSIVE_WIDTHS, render_variants
+        with ProcessPoolExecutor(max_workers=workers,
+                                 mp_context=multiprocessing.get_context('spawn')) as pool:
+            # Warm the workers (interpreter + Pillow import) outside the timing
+            list(pool.map(render_variants, images[:workers], [(320,)] * workers, [('webp',)] * workers))
+            started = time.perf_counter()
+            results = list(pool.map(render_variants, images,
+                                    [RESPONSIVE_WIDTHS] * len(images), [formats] * len(images)))
+            elapsed = time.perf_counter() - started
+        out = sum(len(v['data']) for r in results for v in r['variants'])
+        return elapsed, out
+
+    def _row(self, label, workers, count, elapsed, out_bytes):
+        rate = count / elapsed if elapsed else 0
+        self.stdout.write(f"{label:<22}{workers:>8}{rate:>9.2f}{rate / workers:>14.2f}"
+                          f"{out_bytes / count / 1024:>12.0f}")
@@ -0,0 +1,133 @@
+"""
+Management command: benchmark_phrase_matcher
+---------------------------------------------
+Compares the shared phrase matcher (ai_engine/modules/phrase_matcher.py)
+against the per-pattern scans it replaced, on stored article titles and
+article-sized HTML, and checks that both return the same matches.
+
+    brands   — `\\bbrand\\b` search per KNOWN_BRANDS entry vs one title pass
+    tech     — per-keyword substring/regex scan vs one automaton pass
+    banned   — ~100 sequential substitutions vs anchor-gated RegexRuleSet
+
+Usage:
+    python manage.py benchmark_phrase_matcher               # 200 newest articles
+    python manage.py benchmark_phrase_matcher --limit 1000 --repeat 5
+"""
+import re
+import time
+
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = 'Benchmark the shared phrase matcher against per-pattern scanning'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--limit', type=int, default=200,
+                            help='Number of articles to use (newest first)')
+        parser.add_argument('--repeat', type=int, default=3,
+                            help='Runs per case (the fastest run is kept)')
+
+    def handle(self, *args, **options):
+        from news.models import Article
+
+        rows = list(
+            Article.objects.exclude(content='').order_by('-created_at')
+            .values_list('title', 'content')[:options['limit']]
+        )
+        if not rows:
+            self.stdout.write(self.style.WARNING('No articles with content found'))
+            return
+
+        titles = [title.lower() for title, _ in rows]
+        bodies = [content for _, content in rows]
+        plain_bodies = [re.sub(r'<[^>]+>', ' ', content).lower() for content in bodies]
+        repeat = max(1, options['repeat'])
+        avg_kb = sum(map(len, bodies)) / len(bodies) / 1024
+
+        self.stdout.write(
+            f"Benchmarking {len(rows)} article(s) (avg {avg_kb:.1f} kB), best of {repeat}..."
+        )
+        self.stdout.write("")
+        self.stdout.write(f"{'case':<10}{'per-pattern µs':>16}{'matcher µs':>14}{'speed-up':>10}  result")
+        all_ok = True
+        for label, baseline, candidate, inputs in self._cases(titles, plain_bodies, bodies):
+            base_s, base_out = self._time(lambda: [baseline(x) for x in inputs], repeat)
+            new_s, new_out = self._time(lambda: [candidate(x) for x in inputs], repeat)
+            same = base_out == new_out
+            all_ok &= same
+            self.stdout.write(
+                f"{label:<10}{base_s * 1e6 / len(inputs):>16.1f}{new_s * 1e6 / len(inputs):>14.1f}"
+                f"{base_s / new_s if new_s else 0:>9.1f}x  {'identical' if same else 'DIFFERENT'}"
+            )
+
+        self.stdout.write("")
+        if all_ok:
+            self.stdout.write(self.style.SUCCESS('✅ Matcher results identical to per-pattern scans'))
+        else:
+            self.stdout.write(self.style.ERROR('❌ Matcher results differ from per-pattern scans'))
+
+    @staticmethod
+    def _cases(titles, plain_bodies, bodies):
+        from news.auto_tags import KNOWN_BRANDS
+        from ai_engine.modules.phrase_matcher import get_vocabulary
+        from ai_engine.modules.tag_detector import (
+            _TECH_TAG_RULES, _TECH_KEYWORD_MATCHER, _TECH_KEYWORD_REGEXES,
+        )
+        from ai_engine.modules.banned_phrases import (
+            _BANNED_INLINE_REPLACEMENTS, _BANNED_INLINE_RULES,
+        )
+
+        brand_patterns = [(b, re.compile(rf'\b{re.escape(b)}\b')) for b in KNOWN_BRANDS]
+        brands = get_vocabulary('known_brands')
+
+        def brands_loop(title):
+            return sorted(b for b, pattern in brand_patterns if pattern.search(title))
+
+        def brands_matcher(title):
+            return sorted(brands.values_in(title))
+
+        def tech_loop(text):
+            found = []
+            for tag_name, keywords in _TECH_TAG_RULES:
+                for kw in keywords:
+                    if any(c in kw for c in r'.?*+[](){}|\\'):
+                        hit = re.search(kw, text)
+                    else:
+                        hit = kw in text
+                    if hit:
+                        found.append(tag_name)
+                        break
+            return found
+
+        def tech_matcher(text):
+            literal_hits = set(_TECH_KEYWORD_MATCHER.values_in(text))
+            return [
+                tag_name for tag_name, _ in _TECH_TAG_RULES
+                if tag_name in literal_hits
+                or any(rx.search(text) for rx in _TECH_KEYWORD_REGEXES.get(tag_name, ()))
+            ]
+
+        def banned_loop(html):
+            for pattern, replacement in _BANNED_INLINE_REPLACEMENTS:
+                html = pattern.sub(replacement, html)
+            return html
+
+        def banned_rules(html):
+            return _BANNED_INLINE_RULES.apply(html)[0]
+
+        return (
+            ('brands', brands_loop, brands_matcher, titles),
+            ('tech', tech_loop, tech_matcher, plain_bodies),
+            ('banned', banned_loop, banned_rules, bodies),
+        )
+
+    @staticmethod
+    def _time(func, repeat):
+        best, result = None, None
+        for _ in range(repeat):
+            started = time.perf_counter()
+            result = func()
+            elapsed = time.perf_counter() - started
+            best = elapsed if best is None else min(best, elapsed)
+        return best, result
@@ -0,0 +1,106 @@
+"""
+Management command: benchmark_post_processor
+---------------------------------------------
+Times `post_process_article` over stored articles and checks that the gated
+pipeline (passes skipped when their markers are absent) produces exactly the
+same HTML as running every pass unconditionally.
+
+Usage:
+    python manage.py benchmark_post_processor                 # 200 newest articles
+    python manage.py benchmark_post_processor --limit 1000 --per-pass
+    python manage.py benchmark_post_processor --slug zeekr-8x-review --repeat 5
+"""
+import contextlib
+import io
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = 'Benchmark the article post-processing pipeline on stored articles'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--limit', type=int, default=200,
+                            help='Number of articles to process (newest first)')
+        parser.add_argument('--slug', type=str, default=None,
+                            help='Benchmark a single article by slug')
+        parser.add_argument('--repeat', type=int, default=1,
+                            help='Runs per article (the fastest run is kept)')
+        parser.add_argument('--per-pass', action='store_true', default=False,
+                            help='Print the time spent in each pipeline pass')
+
+    def handle(self, *args, **options):
+        from news.models import Article
+        from ai_engine.modules.article_post_processor import _run_pipeline
+
+        qs = Article.objects.exclude(content='').order_by('-created_at')
+        if options['slug']:
+            qs = qs.filter(slug=options['slug'])
+        rows = list(qs.values_list('slug', 'content')[:options['limit']])
+        if not rows:
+            self.stdout.write(self.style.WARNING('No articles with content found'))
+            return
+
+        repeat = max(1, options['repeat'])
+        reference_ms, gated_ms = [], []
+        pass_totals = {}
+        mismatches = []
+
+        self.stdout.write(f"Benchmarking {len(rows)} article(s), {repeat} run(s) each...")
+        for slug, content in rows:
+            # The passes print their fixes — keep the benchmark output readable
+            with contextlib.redirect_stdout(io.StringIO()):
+                ref_best, ref_out = self._time(lambda: _run_pipeline(content, gated=False), repeat)
+                timings = {}
+                gated_best, gated_out = self._time(
+                    lambda: _run_pipeline(content, timings=timings), repeat,
+                )
+            reference_ms.append(ref_best)
+            gated_ms.append(gated_best)
+            for name, seconds in timings.items():
+                pass_totals[name] = pass_totals.get(name, 0.0) + seconds / repeat
+            if ref_out != gated_out:
+                mismatches.append(slug)
+
+        self.stdout.write("")
+        self.stdout.write(f"{'':<12}{'mean ms':>10}{'p50 ms':>10}{'p95 ms':>10}{'max ms':>10}")
+        for label, samples in (('all passes', reference_ms), ('gated', gated_ms)):
+            self.stdout.write(
+                f"{label:<12}{statistics.fmean(samples):>10.2f}{self._pct(samples, 50):>10.2f}"
+                f"{self._pct(samples, 95):>10.2f}{max(samples):>10.2f}"
+            )
+        speedup = sum(reference_ms) / sum(gated_ms) if sum(gated_ms) else 0
+        self.stdout.write(f"Speed-up: {speedup:.2f}x")
+
+        if options['per_pass']:
+            self.stdout.write("")
+            total = sum(pass_totals.values()) or 1
+            for name, seconds in sorted(pass_totals.items(), key=lambda kv: -kv[1]):
+                self.stdout.write(
+                    f"  {name:<34}{seconds * 1000 / len(rows):>9.2f} ms/article  {seconds / total:>6.1%}"
+                )
+
+        self.stdout.write("")
+        if mismatches:
+            self.stdout.write(self.style.ERROR(
+                f"❌ Output differs for {len(mismatches)} article(s): {', '.join(mismatches[:20])}"
+            ))
+        else:
+            self.stdout.write(self.style.SUCCESS(f"✅ Identical output for all {len(rows)} article(s)"))
+
+    @staticmethod
+    def _time(func, repeat):
+        best, result = None, None
+        for _ in range(repeat):
+            started = time.perf_counter()
+            result = func()
+            elapsed = (time.perf_counter() - started) * 1000
+            best = elapsed if best is None else min(best, elapsed)
+        return best, result
+
+    @staticmethod
+    def _pct(samples, pct):
+        ordered = sorted(samples)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
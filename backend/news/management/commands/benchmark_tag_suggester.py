@@ -0,0 +1,161 @@
+"""
+Management command: benchmark_tag_suggester
+--------------------------------------------
+Historical tag matching in ai_engine/modules/tag_suggester.py: the inverted
+LearningIndex against the full scan over every TagLearningLog it replaced,
+on synthetic learning logs (or the stored ones), checking both produce the
+same weighted tag ranking.
+
+    scan     — the old loop: every log's keywords intersected per call
+               (rows already in memory; the old path also fetched them from
+               the database on every call)
+    index    — keyword → log postings, O(keywords × postings)
+    direct   — `\\bkeyword\\b` search per body/powertrain keyword vs one
+               precompiled matcher pass
+
+Usage:
+    python manage.py benchmark_tag_suggester                  # 100k synthetic logs
+    python manage.py benchmark_tag_suggester --logs 500000 --queries 500
+    python manage.py benchmark_tag_suggester --db             # stored learning logs
+"""
+import random
+import re
+import time
+import tracemalloc
+from collections import Counter
+
+from django.core.management.base import BaseCommand
+
+BRANDS = ['bmw', 'audi', 'mercedes', 'tesla', 'byd', 'zeekr', 'nio', 'xpeng', 'li', 'toyota',
+          'honda', 'porsche', 'ford', 'chevrolet', 'hyundai', 'kia', 'volvo', 'polestar',
+          'lotus', 'geely', 'chery', 'haval', 'lexus', 'mazda', 'nissan', 'lucid', 'rivian']
+WORDS = ['launch', 'price', 'range', 'interior', 'test', 'drive', 'spied', 'facelift', 'revealed',
+         'specs', 'update', 'battery', 'charging', 'china', 'europe', 'market', 'sales', 'recall',
+         'concept', 'prototype', 'performance', 'edition', 'sport', 'luxury', 'budget', 'family']
+BODIES = ['suv', 'sedan', 'coupe', 'hatchback', 'wagon', 'pickup', 'mpv', 'convertible']
+POWERTRAINS = ['electric', 'ev', 'hybrid', 'phev', 'turbo', 'awd', 'v8']
+
+
+def _synthetic_title(rng):
+    brand = rng.choice(BRANDS)
+    model = f"{rng.choice('abcdefghjkmnpqrstuvwxyz')}{rng.randint(1, 99)}"
+    parts = [str(rng.randint(2020, 2026)), brand, model, rng.choice(BODIES)]
+    if rng.random() < 0.6:
+        parts.append(rng.choice(POWERTRAINS))
+    parts += rng.sample(WORDS, rng.randint(1, 3))
+    rng.shuffle(parts[3:])
+    return ' '.join(parts), brand
+
+
+def _synthetic_logs(count, seed=7):
+    from ai_engine.modules.tag_suggester import extract_keywords
+    rng = random.Random(seed)
+    tag_pool = [f'Tag {i}' for i in range(150)]
+    rows = []
+    for log_id in range(1, count + 1):
+        title, brand = _synthetic_title(rng)
+        tags = [brand.upper()] + rng.sample(tag_pool, rng.randint(1, 4))
+        rows.append((log_id, list(extract_keywords(title)), tags))
+    return rows
+
+
+def _scan(rows, keywords):
+    """The pre-index historical matching loop (rows in id order)."""
+    historical_tags = Counter()
+    for _, title_keywords, final_tags in rows:
+        log_keywords = set(title_keywords) if title_keywords else set()
+        overlap = keywords & log_keywords
+        if not overlap:
+            continue
+        weight = len(overlap) / max(len(keywords), len(log_keywords))
+        if len(overlap) < 2 and weight < 0.3:
+            continue
+        for tag_name in (final_tags or []):
+            historical_tags[tag_name] += weight
+    return historical_tags
+
+
+def _direct_regex(title_lower):
+    from ai_engine.modules.tag_suggester import BODY_TYPE_KEYWORDS, POWERTRAIN_KEYWORDS
+    found = set()
+    for keyword, tag_name in {**BODY_TYPE_KEYWORDS, **POWERTRAIN_KEYWORDS}.items():
+        if re.search(r'\b' + re.escape(keyword) + r'\b', title_lower):
+            found.add(tag_name)
+    return found
+
+
+class Command(BaseCommand):
+    help = 'Benchmark the tag suggester learning index against a full log scan'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--logs', type=int, default=100_000, help='Synthetic learning logs')
+        parser.add_argument('--queries', type=int, default=200, help='Titles to suggest tags for')
+        parser.add_argument('--db', action='store_true', help='Use stored TagLearningLog rows')
+
+    def handle(self, *args, **options):
+        from ai_engine.modules.tag_suggester import LearningIndex, _direct_matcher, extract_keywords
+
+        if options['db']:
+            from news.models import TagLearningLog
+            rows = list(TagLearningLog.objects.order_by('id').values_list('id', 'title_keywords', 'final_tags'))
+        else:
+            self.stdout.write(f"🧪 Generating {options['logs']:,} synthetic learning logs...")
+            rows = _synthetic_logs(options['logs'])
+        if not rows:
+            self.stdout.write(self.style.WARNING('No learning logs'))
+            return
+
+        rng = random.Random(11)
+        titles = [_synthetic_title(rng)[0] for _ in range(options['queries'])]
+        queries = [extract_keywords(title) for title in titles]
+
+        def _build():
+            built = LearningIndex()
+            for log_id, keywords, tags in rows:
+                built.add(log_id, keywords, tags)
+            return built
+
+        started = time.perf_counter()
+        index = _build()
+        build = time.perf_counter() - started
+        tracemalloc.start()
+        traced = _build()
+        memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del traced
+        self.stdout.write(f"Index: {len(index):,} logs, {len(index.postings):,} keywords, "
+                          f"built in {build:.2f}s, {memory / 1024 / 1024:.0f} MB")
+        self.stdout.write("")
+
+        started = time.perf_counter()
+        scanned = [_scan(rows, keywords) for keywords in queries]
+        scan_s = time.perf_counter() - started
+        started = time.perf_counter()
+        indexed = [index.historical_tags(keywords) for keywords in queries]
+        index_s = time.perf_counter() - started
+        # Same tags, same weights, same insertion order (most_common ties)
+        same = all(list(a.items()) == list(b.items()) for a, b in zip(scanned, indexed))
+
+        lowered = [title.lower() for title in titles]
+        started = time.perf_counter()
+        direct_old = [_direct_regex(title) for title in lowered]
+        regex_s = time.perf_counter() - started
+        matcher = _direct_matcher()
+        started = time.perf_counter()
+        direct_new = [set(matcher.values_in(title)) for title in lowered]
+        matcher_s = time.perf_counter() - started
+        same_direct = direct_old == direct_new
+
+        n = len(queries)
+        self.stdout.write(f"{'case':<10}{'before ms':>12}{'after ms':>12}{'speed-up':>10}  result")
+        for label, before, after, ok in (('history', scan_s, index_s, same),
+                                         ('direct', regex_s, matcher_s, same_direct)):
+            self.stdout.write(
+                f"{label:<10}{before * 1000 / n:>12.3f}{after * 1000 / n:>12.3f}"
+                f"{before / after if after else 0:>9.0f}x  {'identical' if ok else 'DIFFERENT'}"
+            )
+        self.stdout.write("")
+        if same and same_direct:
+            self.stdout.write(self.style.SUCCESS('✅ Index rankings identical to the full scan'))
+        else:
+            self.stdout.write(self.style.ERROR('❌ Index rankings differ from the full scan'))
@@ -0,0 +1,199 @@
+"""
+Management command: benchmark_vector_rebuild
+---------------------------------------------
+Measures FAISS + BM25 cold start (VectorSearchEngine, ai_engine/modules/vector_search.py):
+
+    legacy     — the old rebuild: select_related('article').all(), full body
+                 text in every docstore Document, one FAISS.from_embeddings
+    streaming  — _rebuild_from_database: chunked server-side cursor, vectors
+                 and title/summary/slug only, FAISS grown chunk by chunk
+    disk load  — FAISS.load_local of the index the streaming rebuild saved
+
+and reports wall time, DB queries, Python heap peak (tracemalloc) and the
+pickled docstore size. The engine runs with an embedding stub — no API calls —
+and writes its index to a temp directory; Redis is not touched.
+
+With --synthetic N, N articles with packed random embeddings are created
+inside a transaction that is rolled back afterwards.
+
+Usage:
+    python manage.py benchmark_vector_rebuild                    # stored embeddings
+    python manage.py benchmark_vector_rebuild --synthetic 5000   # generated corpus
+    python manage.py benchmark_vector_rebuild --chunk-size 500 --no-legacy
+"""
+import tempfile
+import threading
+import time
+import tracemalloc
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+SYNTHETIC_PARAGRAPH = (
+    "<p>The new model pairs a dual-motor layout with an 800V architecture, "
+    "charging from 10 to 80 percent in under twenty minutes while the cabin "
+    "gets a larger display, ventilated seats and an updated driver-assist suite.</p>"
+)
+
+
+class _NoEmbeddings:
+    """Embedding stub: a rebuild from stored vectors must never call the API."""
+
+    def embed_query(self, text):
+        raise RuntimeError('benchmark_vector_rebuild: unexpected embedding API call')
+
+    def embed_documents(self, texts):
+        raise RuntimeError('benchmark_vector_rebuild: unexpected embedding API call')
+
+    def __call__(self, text):
+        return self.embed_query(text)
+
+
+class Command(BaseCommand):
+    help = 'Benchmark FAISS + BM25 cold start: legacy vs streaming rebuild vs disk load'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--synthetic', type=int, default=0,
+                            help='Create N throwaway articles with random embeddings (rolled back)')
+        parser.add_argument('--dim', type=int, default=768,
+                            help='Dimensions for --synthetic embeddings')
+        parser.add_argument('--chunk-size', type=int, default=None,
+                            help='Rows per chunk for the streaming rebuild')
+        parser.add_argument('--no-legacy', action='store_true',
+                            help='Skip the old all-in-memory rebuild')
+        parser.add_argument('--no-memory', action='store_true',
+                            help='Skip the tracemalloc pass (it slows every case down)')
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            if options['synthetic']:
+                self._create_synthetic(options['synthetic'], options['dim'])
+            try:
+                self._run(options)
+            finally:
+                transaction.set_rollback(True)
+
+    def _run(self, options):
+        from ai_engine.modules.vector_search import REBUILD_CHUNK_SIZE
+        from news.models import ArticleEmbedding
+
+        total = ArticleEmbedding.objects.count()
+        if not total:
+            self.stdout.write(self.style.WARNING('No embeddings found — try --synthetic 5000'))
+            return
+        chunk_size = options['chunk_size'] or REBUILD_CHUNK_SIZE
+        self.stdout.write(f"Benchmarking cold start over {total} embeddings (chunk size {chunk_size})...")
+        self.stdout.write("")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            engine = self._engine(Path(tmp) / 'faiss_index')
+            cases = []
+            if not options['no_legacy']:
+                cases.append(('legacy', lambda: self._legacy_rebuild(engine)))
+            cases.append(('streaming', lambda: engine._rebuild_from_database(chunk_size=chunk_size)))
+            cases.append(('disk load', lambda: engine._load_index_from_disk()))
+
+            self.stdout.write(f"{'case':<11}{'wall s':>9}{'queries':>9}{'heap peak MB':>14}"
+                              f"{'docstore MB':>13}{'vectors':>9}")
+            with patch.object(engine, '_save_index_to_redis'):
+                for label, fn in cases:
+                    wall, queries = self._timed(fn)
+                    docstore_mb = self._docstore_mb(engine)
+                    vectors = engine.vector_store.index.ntotal if engine.vector_store else 0
+                    peak = None if options['no_memory'] else self._heap_peak(fn)
+                    self.stdout.write(
+                        f"{label:<11}{wall:>9.2f}{queries:>9}"
+                        f"{'-' if peak is None else f'{peak:.1f}':>14}{docstore_mb:>13.2f}{vectors:>9}"
+                    )
+                    if label == 'legacy':
+                        # The streaming case saves the index the disk-load case reads
+                        engine.vector_store = None
+
+        self.stdout.write("")
+        self.stdout.write(self.style.SUCCESS('✅ Done (synthetic rows rolled back)' if options['synthetic']
+                                             else '✅ Done'))
+
+    @staticmethod
+    def _engine(index_path):
+        from ai_engine.modules.vector_search import BM25Index, VectorSearchEngine
+        engine = VectorSearchEngine.__new__(VectorSearchEngine)
+        engine._lock = threading.Lock()
+        engine.embedding_model = _NoEmbeddings()
+        engine.vector_store = None
+        engine.bm25 = BM25Index()
+        engine.index_path = index_path
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        return engine
+
+    @staticmethod
+    def _legacy_rebuild(engine):
+        """The pre-streaming _rebuild_from_database, kept here as the baseline."""
+        from langchain_community.vectorstores import FAISS
+        from news.models import ArticleEmbedding
+
+        texts, vectors, metadatas, bm25_docs = [], [], [], []
+        for emb in ArticleEmbedding.objects.select_related('article').all():
+            article = emb.article
+            text = f"{article.title}\n\n{article.summary or ''}\n\n{article.content}"
+            texts.append(text)
+            vectors.append(emb.get_vector())
+            metadatas.append({
+                "article_id": article.id, "title": article.title,
+                "summary": article.summary or "", "slug": article.slug,
+            })
+            bm25_docs.append({'article_id': article.id, 'title': article.title, 'text': text})
+        engine.vector_store = FAISS.from_embeddings(
+            list(zip(texts, vectors)), engine.embedding_model, metadatas=metadatas,
+        )
+        engine.bm25.build(bm25_docs)
+
+    @staticmethod
+    def _timed(fn):
+        queries = [0]
+
+        def count(execute, sql, params, many, context):
+            queries[0] += 1
+            return execute(sql, params, many, context)
+
+        with connection.execute_wrapper(count):
+            started = time.perf_counter()
+            fn()
+            return time.perf_counter() - started, queries[0]
+
+    @staticmethod
+    def _heap_peak(fn):
+        tracemalloc.start()
+        try:
+            fn()
+            return tracemalloc.get_traced_memory()[1] / 1024 / 1024
+        finally:
+            tracemalloc.stop()
+
+    @staticmethod
+    def _docstore_mb(engine):
+        import pickle
+        if engine.vector_store is None:
+            return 0.0
+        return len(pickle.dumps(engine.vector_store.docstore)) / 1024 / 1024
+
+    def _create_synthetic(self, n, dim):
+        from news.models import Article, ArticleEmbedding
+
+        self.stdout.write(f"🧪 Creating {n} synthetic articles with {dim}-d embeddings...")
+        rng = np.random.default_rng(42)
+        content = SYNTHETIC_PARAGRAPH * 30
+        stamp = int(time.time())
+        articles = Article.objects.bulk_create([
+            Article(title=f'Benchmark article {i}', slug=f'benchmark-rebuild-{stamp}-{i}',
+                    summary='Synthetic article for benchmark_vector_rebuild.', content=content)
+            for i in range(n)
+        ], batch_size=500)
+        embeddings = []
+        for article in articles:
+            emb = ArticleEmbedding(article=article, text_hash='benchmark')
+            emb.set_vector(rng.standard_normal(dim).astype(np.float32))
+            embeddings.append(emb)
+        ArticleEmbedding.objects.bulk_create(embeddings, batch_size=500)
@@ -1,11 +1,20 @@
 """
 Bulk re-enrich all published articles missing enrichments.
-Usage: python manage.py bulk_enrich [--mode missing|all] [--ids 1,2,3] [--dry-run]
+Usage: python manage.py bulk_enrich [--mode missing|all] [--ids 1,2,3] [--dry-run] [--workers N]
+
+Articles run through news/batch_runner.py: several at once, paced to the
+FLASH tier's rate limits, retried on errors and checkpointed so a rerun
+after a crash skips what already finished. --dry-run also prints an AI
+cost estimate.
 """
 import json
 import os
+import threading
 import time
+from collections import Counter
 from django.core.management.base import BaseCommand
+from news import side_effects
+from news.batch_runner import BatchRunner, add_batch_arguments
 from news.models import Article, Tag, VehicleSpecs, ArticleTitleVariant, CarSpecification
 
 
@@ -33,6 +42,7 @@ class Command(BaseCommand):
             '--no-ai-tags', action='store_true',
             help='Skip AI tag extraction (Layer 2) — only use structured data and keyword matching'
         )
+        add_batch_arguments(parser)
 
     def handle(self, *args, **options):
         mode = options['mode']
@@ -63,106 +73,47 @@ class Command(BaseCommand):
         total = articles.count()
         self.stdout.write(f'📊 Found {total} articles to process\n')
 
-        if dry_run:
-            for a in articles.order_by('id'):
-                has_specs = VehicleSpecs.objects.filter(article=a).exists()
-                has_ab = ArticleTitleVariant.objects.filter(article=a).exists()
-                tag_count = a.tags.count()
-                self.stdout.write(
-                    f'  #{a.id:>3d} | Specs:{"✅" if has_specs else "❌"} | A/B:{"✅" if has_ab else "❌"} | Tags:{tag_count:>2d} | {a.title[:60]}'
-                )
+        # Deep specs + A/B titles, plus one call when tags use AI extraction
+        calls_per_item = (0 if tags_only else 2) + (0 if no_ai_tags else 1)
+        runner = BatchRunner(
+            'bulk_enrich', options,
+            params={'mode': mode, 'ids': ids_str, 'tags_only': tags_only, 'no_ai_tags': no_ai_tags},
+            tier='flash' if calls_per_item else None, calls_per_item=max(calls_per_item, 1),
+            stdout=self.stdout, style=self.style,
+        )
+
+        if dry_run or options['estimate']:
+            if dry_run:
+                for a in articles.order_by('id'):
+                    has_specs = VehicleSpecs.objects.filter(article=a).exists()
+                    has_ab = ArticleTitleVariant.objects.filter(article=a).exists()
+                    tag_count = a.tags.count()
+                    self.stdout.write(
+                        f'  #{a.id:>3d} | Specs:{"✅" if has_specs else "❌"} | A/B:{"✅" if has_ab else "❌"} | Tags:{tag_count:>2d} | {a.title[:60]}'
+                    )
+            if calls_per_item:
+                runner.estimate(total, prompt_tokens=2000, completion_tokens=800,
+                                callers=('deep_specs', 'title_variants'))
             self.stdout.write(f'\n  --dry-run mode, no changes made.')
             return
 
-        from news.auto_tags import auto_tag_article
-
-        success = 0
-        errors = 0
-        total_tags_created = 0
-        total_tags_matched = 0
+        self.tags_only = tags_only
+        self.no_ai_tags = no_ai_tags
+        self.tag_totals = Counter()
+        self._totals_lock = threading.Lock()
         start = time.time()
 
-        for i, article in enumerate(articles.order_by('id'), 1):
-            self.stdout.write(f'\n[{i}/{total}] Processing: {article.title[:60]}...')
-
-            if not tags_only:
-                specs_dict = None
-                web_context = ''
-
-                # Step 1: Web search
-                try:
-                    car_spec = CarSpecification.objects.filter(article=article).first()
-                    if car_spec and car_spec.make:
-                        specs_dict = {
-                            'make': car_spec.make, 'model': car_spec.model or '',
-                            'trim': car_spec.trim or '',
-                        }
-                    else:
-                        import re
-                        m = re.match(r'(\d{4})\s+(.+?)(?:\s+(?:Review|First|Walk|Test|Preview|Deep|Comp))', article.title, re.I)
-                        if m:
-                            parts = m.group(2).strip().split(' ', 1)
-                            if len(parts) >= 2:
-                                specs_dict = {'make': parts[0], 'model': parts[1], 'year': int(m.group(1))}
-
-                    if specs_dict and specs_dict.get('make'):
-                        try:
-                            from ai_engine.modules.searcher import get_web_context
-                            web_context = get_web_context(specs_dict)
-                            self.stdout.write(f'   🔍 Web context: {len(web_context)} chars')
-                        except Exception:
-                            pass
-                except Exception:
-                    pass
-
-                # Step 2: Deep specs
-                has_specs = VehicleSpecs.objects.filter(article=article).exists()
-                if not has_specs and specs_dict and specs_dict.get('make'):
-                    try:
-                        from ai_engine.modules.deep_specs import generate_deep_vehicle_specs
-                        vs = generate_deep_vehicle_specs(article, specs=specs_dict, web_context=web_context, provider='gemini')
-                        self.stdout.write(self.style.SUCCESS(f'   🚗 Deep specs: {vs.make} {vs.model_name}' if vs else '   ⚠️ Deep specs: empty'))
-                    except Exception as e:
-                        self.stdout.write(self.style.ERROR(f'   ❌ Deep specs: {e}'))
-                        errors += 1
-                        continue
-                elif has_specs:
-                    self.stdout.write(f'   ⏭️  Deep specs: already exists')
-
-                # Step 3: A/B titles
-                has_ab = ArticleTitleVariant.objects.filter(article=article).exists()
-                if not has_ab:
-                    try:
-                        from ai_engine.main import generate_title_variants
-                        generate_title_variants(article, provider='gemini')
-                        count = ArticleTitleVariant.objects.filter(article=article).count()
-                        self.stdout.write(self.style.SUCCESS(f'   📝 A/B titles: {count} variants created'))
-                    except Exception as e:
-                        self.stdout.write(self.style.ERROR(f'   ❌ A/B titles: {e}'))
-                else:
-                    self.stdout.write(f'   ⏭️  A/B titles: already exists')
-
-            # Step 4: Smart Auto-Tags (always runs)
-            try:
-                tag_result = auto_tag_article(article, use_ai=not no_ai_tags)
-                created = tag_result['created']
-                matched = tag_result['matched']
-                total_tags_created += len(created)
-                total_tags_matched += len(matched)
-
-                if created:
-                    self.stdout.write(self.style.SUCCESS(f'   🏷️  Tags: +{len(created)} NEW ({", ".join(created[:5])})'))
-                if matched:
-                    self.stdout.write(f'   🏷️  Tags: +{len(matched)} existing ({", ".join(matched[:5])})')
-                if not created and not matched:
-                    self.stdout.write(f'   🏷️  Tags: no new matches')
-                if tag_result['ai_used']:
-                    self.stdout.write(f'   🤖 AI extraction was used')
-
-            except Exception as e:
-                self.stdout.write(self.style.ERROR(f'   ❌ Tags: {e}'))
+        # Article saves/retags below request their side effects (re-index,
+        # cache deletes, revalidation); workers join this block so each is
+        # issued once for the whole run, on exit
+        with side_effects.bulk_mode() as self.bulk_scope:
+            stats = runner.run(articles.order_by('id').values_list('id', flat=True), self.enrich_article)
+        side_effects.wait_idle(timeout=600)
 
-            success += 1
+        errors = stats['failed']
+        success = sum(stats.values()) - errors
+        total_tags_created = self.tag_totals['created']
+        total_tags_matched = self.tag_totals['matched']
 
         elapsed = round(time.time() - start, 1)
         self.stdout.write(f'\n{"="*50}')
@@ -211,3 +162,88 @@ class Command(BaseCommand):
                 self.stdout.write(f'   💾 Report saved to database (AutomationSettings)')
             except Exception as e:
                 self.stdout.write(self.style.WARNING(f'   ⚠️ Could not save report to DB: {e}'))
+
+    def enrich_article(self, article_id, log):
+        with side_effects.join_bulk(self.bulk_scope):
+            return self._enrich(Article.objects.get(id=article_id), log)
+
+    def _enrich(self, article, log):
+        from news.auto_tags import auto_tag_article
+
+        log(f'\nProcessing: {article.title[:60]}...')
+
+        if not self.tags_only:
+            specs_dict = None
+            web_context = ''
+
+            # Step 1: Web search
+            try:
+                car_spec = CarSpecification.objects.filter(article=article).first()
+                if car_spec and car_spec.make:
+                    specs_dict = {
+                        'make': car_spec.make, 'model': car_spec.model or '',
+                        'trim': car_spec.trim or '',
+                    }
+                else:
+                    import re
+                    m = re.match(r'(\d{4})\s+(.+?)(?:\s+(?:Review|First|Walk|Test|Preview|Deep|Comp))', article.title, re.I)
+                    if m:
+                        parts = m.group(2).strip().split(' ', 1)
+                        if len(parts) >= 2:
+                            specs_dict = {'make': parts[0], 'model': parts[1], 'year': int(m.group(1))}
+
+                if specs_dict and specs_dict.get('make'):
+                    try:
+                        from ai_engine.modules.searcher import get_web_context
+                        web_context = get_web_context(specs_dict)
+                        log(f'   🔍 Web context: {len(web_context)} chars')
+                    except Exception:
+                        pass
+            except Exception:
+                pass
+
+            # Step 2: Deep specs — errors propagate so the runner retries the article
+            has_specs = VehicleSpecs.objects.filter(article=article).exists()
+            if not has_specs and specs_dict and specs_dict.get('make'):
+                from ai_engine.modules.deep_specs import generate_deep_vehicle_specs
+                vs = generate_deep_vehicle_specs(article, specs=specs_dict, web_context=web_context, provider='gemini')
+                log(f'   🚗 Deep specs: {vs.make} {vs.model_name}' if vs else '   ⚠️ Deep specs: empty', 'SUCCESS')
+            elif has_specs:
+                log(f'   ⏭️  Deep specs: already exists')
+
+            # Step 3: A/B titles
+            has_ab = ArticleTitleVariant.objects.filter(article=article).exists()
+            if not has_ab:
+                try:
+                    from ai_engine.main import generate_title_variants
+                    generate_title_variants(article, provider='gemini')
+                    count = ArticleTitleVariant.objects.filter(article=article).count()
+                    log(f'   📝 A/B titles: {count} variants created', 'SUCCESS')
+                except Exception as e:
+                    log(f'   ❌ A/B titles: {e}', 'ERROR')
+            else:
+                log(f'   ⏭️  A/B titles: already exists')
+
+        # Step 4: Smart Auto-Tags (always runs)
+        try:
+            tag_result = auto_tag_article(article, use_ai=not self.no_ai_tags)
+            created = tag_result['created']
+            matched = tag_result['matched']
+            with self._totals_lock:
+                self.tag_totals['created'] += len(created)
+                self.tag_totals['matched'] += len(matched)
+
+            if created:
+                log(f'   🏷️  Tags: +{len(created)} NEW ({", ".join(created[:5])})', 'SUCCESS')
+            if matched:
+                log(f'   🏷️  Tags: +{len(matched)} existing ({", ".join(matched[:5])})')
+            if not created and not matched:
+                log(f'   🏷️  Tags: no new matches')
+            if tag_result['ai_used']:
+                log(f'   🤖 AI extraction was used')
+
+        except Exception as e:
+            log(f'   ❌ Tags: {e}', 'ERROR')
+
+        return 'enriched'
+
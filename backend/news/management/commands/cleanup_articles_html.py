@@ -1,4 +1,5 @@
 from django.core.management.base import BaseCommand
+from news import side_effects
 from news.models import Article
 import markdown
 import re
@@ -30,20 +31,24 @@ class Command(BaseCommand):
         articles = Article.objects.filter(is_deleted=False)
         count = 0
         
-        for article in articles:
-            updated = False
+        # One cache flush / revalidation for the whole run, one reaction per article
+        with side_effects.bulk_mode():
+            for article in articles:
+                updated = False
             
-            # Clean main content
-            new_content = self.ensure_html_only(article.content)
-            if new_content != article.content:
-                article.content = new_content
-                updated = True
+                # Clean main content
+                new_content = self.ensure_html_only(article.content)
+                if new_content != article.content:
+                    article.content = new_content
+                    updated = True
             
-            if updated:
-                # We use save() to ensure all signal/save logic applies
-                # New image optimization logic will skip already optimized images
-                article.save()
-                count += 1
-                self.stdout.write(self.style.SUCCESS(f'✅ Updated: {article.title}'))
-                
+                if updated:
+                    # We use save() to ensure all signal/save logic applies
+                    # New image optimization logic will skip already optimized images
+                    article.save()
+                    count += 1
+                    self.stdout.write(self.style.SUCCESS(f'✅ Updated: {article.title}'))
+
         self.stdout.write(self.style.SUCCESS(f'\n✨ Done! Cleaned up {count} articles.'))
+        if not side_effects.wait_idle(timeout=600):
+            self.stdout.write(self.style.WARNING('⚠️ Some background side effects were still running'))
@@ -1,11 +1,21 @@
 """
 Management command to extract vehicle specifications from all articles using AI
+
+Articles run through news/batch_runner.py: several at once, paced to the
+FLASH tier's rate limits, retried on errors and checkpointed so an
+interrupted run picks up where it stopped.
+
+Usage:
+    python manage.py extract_all_specs                 # articles without specs
+    python manage.py extract_all_specs --force         # re-extract all
+    python manage.py extract_all_specs --estimate      # count + AI cost estimate
+    python manage.py extract_all_specs --workers 8
 """
 
 from django.core.management.base import BaseCommand
+from news.batch_runner import BatchRunner, add_batch_arguments
 from news.models import Article, VehicleSpecs
 from ai_engine.modules.specs_extractor import extract_vehicle_specs
-import time
 
 
 class Command(BaseCommand):
@@ -26,14 +36,14 @@ class Command(BaseCommand):
         parser.add_argument(
             '--delay',
             type=float,
-            default=1.0,
-            help='Delay between API calls in seconds (to avoid rate limits)',
+            default=0.0,
+            help='Minimum seconds between API calls (pacing otherwise follows the model rate limits)',
         )
+        add_batch_arguments(parser)
     
     def handle(self, *args, **options):
         force = options['force']
         limit = options['limit']
-        delay = options['delay']
         
         self.stdout.write(self.style.SUCCESS('🤖 Starting AI specs extraction...'))
         
@@ -45,78 +55,68 @@ class Command(BaseCommand):
         
         if not force:
             # Only process articles without specs
-            articles_qs = articles_qs.filter(vehicle_specs__isnull=True)
+            articles_qs = articles_qs.filter(vehicle_specs_set__isnull=True)
             self.stdout.write('📋 Processing only articles without existing specs')
         else:
             self.stdout.write('🔄 Force mode: Re-extracting all specs')
         
+        article_ids = list(articles_qs.order_by('id').values_list('id', flat=True))
         if limit:
-            articles_qs = articles_qs[:limit]
+            article_ids = article_ids[:limit]
         
-        total = articles_qs.count()
+        total = len(article_ids)
         self.stdout.write(f'📊 Found {total} articles to process')
         
         if total == 0:
             self.stdout.write(self.style.WARNING('⚠️  No articles to process'))
             return
         
-        # Process articles
-        success_count = 0
-        error_count = 0
-        skipped_count = 0
+        runner = BatchRunner(
+            'extract_all_specs', options, params={'force': force, 'limit': limit},
+            tier='flash', min_interval=options['delay'], stdout=self.stdout, style=self.style,
+        )
+        if options['estimate']:
+            runner.estimate(total, prompt_tokens=2500, completion_tokens=600)
+            return
         
-        for i, article in enumerate(articles_qs, 1):
-            self.stdout.write(f'\n[{i}/{total}] Processing: {article.title[:60]}...')
-            
-            try:
-                # Extract specs using AI
-                specs_data = extract_vehicle_specs(
-                    title=article.title,
-                    content=article.content,
-                    summary=article.summary or ""
-                )
-                
-                # Check if we got meaningful data
-                if not specs_data or specs_data.get('confidence_score', 0) < 0.3:
-                    self.stdout.write(self.style.WARNING(f'   ⚠️  Low confidence or no data extracted'))
-                    skipped_count += 1
-                    continue
-                
-                # Create or update VehicleSpecs
-                vehicle_specs, created = VehicleSpecs.objects.update_or_create(
-                    article=article,
-                    defaults=specs_data
-                )
-                
-                action = "Created" if created else "Updated"
-                confidence = specs_data.get('confidence_score', 0)
-                self.stdout.write(self.style.SUCCESS(
-                    f'   ✅ {action} specs (confidence: {confidence:.2f})'
-                ))
-                
-                # Show some extracted data
-                if specs_data.get('power_hp'):
-                    self.stdout.write(f'      Power: {specs_data["power_hp"]} HP')
-                if specs_data.get('range_km'):
-                    self.stdout.write(f'      Range: {specs_data["range_km"]} km')
-                if specs_data.get('price_from'):
-                    self.stdout.write(f'      Price: ${specs_data["price_from"]:,.0f}+')
-                
-                success_count += 1
-                
-                # Delay to avoid rate limits
-                if delay > 0 and i < total:
-                    time.sleep(delay)
-                
-            except Exception as e:
-                self.stdout.write(self.style.ERROR(f'   ❌ Error: {e}'))
-                error_count += 1
-                continue
+        stats = runner.run(article_ids, self.process_article)
         
         # Summary
         self.stdout.write('\n' + '='*60)
         self.stdout.write(self.style.SUCCESS(f'✅ Extraction complete!'))
-        self.stdout.write(f'   - Successful: {success_count}')
-        self.stdout.write(f'   - Skipped (low confidence): {skipped_count}')
-        self.stdout.write(f'   - Errors: {error_count}')
+        self.stdout.write(f'   - Successful: {stats["created"] + stats["updated"]}')
+        self.stdout.write(f'   - Skipped (low confidence): {stats["skipped"]}')
+        self.stdout.write(f'   - Errors: {stats["failed"]}')
         self.stdout.write(f'   - Total processed: {total}')
+
+    def process_article(self, article_id, log):
+        article = Article.objects.get(id=article_id)
+        log(f'\n📄 [{article.id}] {article.title[:60]}...')
+        
+        # Extract specs using AI
+        specs_data = extract_vehicle_specs(article)
+        
+        # Check if we got meaningful data
+        if not specs_data or specs_data.get('confidence_score', 0) < 0.3:
+            log(f'   ⚠️  Low confidence or no data extracted', 'WARNING')
+            return 'skipped'
+        
+        # Create or update VehicleSpecs
+        vehicle_specs, created = VehicleSpecs.objects.update_or_create(
+            article=article,
+            defaults=specs_data
+        )
+        
+        action = "Created" if created else "Updated"
+        confidence = specs_data.get('confidence_score', 0)
+        log(f'   ✅ {action} specs (confidence: {confidence:.2f})', 'SUCCESS')
+        
+        # Show some extracted data
+        if specs_data.get('power_hp'):
+            log(f'      Power: {specs_data["power_hp"]} HP')
+        if specs_data.get('range_km'):
+            log(f'      Range: {specs_data["range_km"]} km')
+        if specs_data.get('price_from'):
+            log(f'      Price: ${specs_data["price_from"]:,.0f}+')
+        
+        return 'created' if created else 'updated'
@@ -8,11 +8,20 @@ Usage:
     python manage.py generate_comparisons --segment SUV   # Only SUV comparisons
     python manage.py generate_comparisons --provider groq # Use Groq (free tier)
     python manage.py generate_comparisons --brands BYD,Tesla  # Only these brands
+    python manage.py generate_comparisons --execute --limit 20 --workers 4
+
+Pairs are generated through news/batch_runner.py: several at once, paced to
+the PRO tier's rate limits (the 'comparison' caller) and retried on errors.
+The preview prints an AI cost estimate. Pairs that already have an article
+are filtered out up front, so an interrupted run resumes by itself.
 """
 
 from django.core.management.base import BaseCommand
+from django.db import transaction
 from django.utils.text import slugify
+from news.batch_runner import BatchRunner, add_batch_arguments
 import logging
+import threading
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +44,7 @@ class Command(BaseCommand):
                             help='Comma-separated brand filter, e.g. BYD,Tesla,ZEEKR')
         parser.add_argument('--auto', action='store_true',
                             help='Automated mode: check AutomationSettings, respect weekly limits, enforce diversity')
+        add_batch_arguments(parser)
 
     def handle(self, *args, **options):
         from news.models import VehicleSpecs, Article, CarSpecification, Category, Tag
@@ -242,6 +252,16 @@ class Command(BaseCommand):
                 f"(score: {score}, price: {price_a} / {price_b})"
             )
 
+        runner = BatchRunner(
+            'generate_comparisons', options, tier='pro' if provider == 'gemini' else None,
+            checkpoint=False, stdout=self.stdout, style=self.style,
+        )
+        if not execute or options['estimate']:
+            runner.estimate(len(to_generate), prompt_tokens=3000, completion_tokens=3500, callers=('comparison',))
+        if options['estimate']:
+            if auto_mode:
+                AutomationSettings.release_lock('comparison')
+            return
         if not execute:
             self.stdout.write(self.style.WARNING(
                 f"\n👀 DRY-RUN: Add --execute to actually generate these articles\n"
@@ -249,90 +269,19 @@ class Command(BaseCommand):
             return
 
         # ── Step 6: Generate articles ──
-        from ai_engine.modules.comparison_generator import generate_comparison
-
-        created = 0
-        errors = 0
-
         # Get or create "Comparisons" category
         comparisons_cat, _ = Category.objects.get_or_create(
             name='Comparisons',
             defaults={'slug': 'comparisons'},
         )
 
-        for i, (score, spec_a, spec_b) in enumerate(to_generate, 1):
-            name_a = f"{spec_a.make} {spec_a.model_name}"
-            name_b = f"{spec_b.make} {spec_b.model_name}"
-
-            try:
-                self.stdout.write(f"\n  [{i}/{len(to_generate)}] Generating {name_a} vs {name_b}...")
-
-                result = generate_comparison(spec_a, spec_b, provider=provider)
-
-                # Ensure unique slug
-                slug = result['slug']
-                base_slug = slug
-                counter = 1
-                while Article.objects.filter(slug=slug, is_deleted=False).exists():
-                    slug = f"{base_slug}-{counter}"
-                    counter += 1
-
-                # Create draft article
-                article = Article.objects.create(
-                    title=result['title'],
-                    slug=slug,
-                    content=result['content'],
-                    content_original=result['content'],
-                    summary=result['summary'],
-                    seo_description=result['seo_description'][:160],
-                    is_published=False,  # Always draft
-                    is_news_only=False,
-                    generation_metadata={
-                        'source': 'comparison_generator',
-                        'provider': provider,
-                        'spec_a': f"{spec_a.make} {spec_a.model_name}",
-                        'spec_b': f"{spec_b.make} {spec_b.model_name}",
-                        'word_count': result['word_count'],
-                        'pair_score': score,
-                    },
-                )
-
-                # Assign category
-                article.categories.add(comparisons_cat)
-
-                # Auto-assign brand tags
-                for spec in (spec_a, spec_b):
-                    brand_tag = Tag.objects.filter(name__iexact=spec.make).first()
-                    if brand_tag:
-                        article.tags.add(brand_tag)
-
-                # Segment tag (e.g., "SUV", "EV")
-                for tag_name in [spec_a.body_type, spec_a.fuel_type]:
-                    if tag_name:
-                        seg_tag = Tag.objects.filter(name__iexact=tag_name).first()
-                        if seg_tag:
-                            article.tags.add(seg_tag)
-
-                # Create CarSpecification for primary vehicle
-                CarSpecification.objects.update_or_create(
-                    article=article,
-                    defaults={
-                        'make': spec_a.make,
-                        'model': spec_a.model_name,
-                        'trim': spec_a.trim_name or '',
-                    },
-                )
-
-                created += 1
-                self.stdout.write(self.style.SUCCESS(
-                    f"  ✅ Created draft: \"{result['title']}\" "
-                    f"({result['word_count']} words, slug: {slug})"
-                ))
-
-            except Exception as e:
-                errors += 1
-                self.stdout.write(self.style.ERROR(f"  ❌ Error: {e}"))
-                logger.error(f"Comparison generation failed for {name_a} vs {name_b}: {e}", exc_info=True)
+        self.provider = provider
+        self.comparisons_cat = comparisons_cat
+        self._slug_lock = threading.Lock()
+        self.pairs = {f"{spec_a.id}-{spec_b.id}": (score, spec_a, spec_b) for score, spec_a, spec_b in to_generate}
+        stats = runner.run(self.pairs, self.create_comparison)
+        created = stats['created']
+        errors = stats['failed']
 
         self.stdout.write(f"\n{'='*60}")
         self.stdout.write(f"Done! Created: {created}, Errors: {errors}")
@@ -350,3 +299,80 @@ class Command(BaseCommand):
                 'comparison_this_week_count', 'comparison_last_run', 'comparison_last_status'
             ])
             AutomationSettings.release_lock('comparison')
+
+    def create_comparison(self, key, log):
+        from ai_engine.modules.comparison_generator import generate_comparison
+        from news.models import Article, CarSpecification, Tag
+
+        score, spec_a, spec_b = self.pairs[key]
+        name_a = f"{spec_a.make} {spec_a.model_name}"
+        name_b = f"{spec_b.make} {spec_b.model_name}"
+        log(f"\n  Generating {name_a} vs {name_b}...")
+
+        try:
+            result = generate_comparison(spec_a, spec_b, provider=self.provider)
+        except Exception as e:
+            logger.error(f"Comparison generation failed for {name_a} vs {name_b}: {e}", exc_info=True)
+            raise
+
+        # Ensure unique slug — workers finishing together could pick the same one
+        with self._slug_lock, transaction.atomic():
+            slug = result['slug']
+            base_slug = slug
+            counter = 1
+            while Article.objects.filter(slug=slug, is_deleted=False).exists():
+                slug = f"{base_slug}-{counter}"
+                counter += 1
+
+            # Create draft article
+            article = Article.objects.create(
+                title=result['title'],
+                slug=slug,
+                content=result['content'],
+                content_original=result['content'],
+                summary=result['summary'],
+                seo_description=result['seo_description'][:160],
+                is_published=False,  # Always draft
+                is_news_only=False,
+                generation_metadata={
+                    'source': 'comparison_generator',
+                    'provider': self.provider,
+                    'spec_a': f"{spec_a.make} {spec_a.model_name}",
+                    'spec_b': f"{spec_b.make} {spec_b.model_name}",
+                    'word_count': result['word_count'],
+                    'pair_score': score,
+                },
+            )
+
+            # Assign category
+            article.categories.add(self.comparisons_cat)
+
+            # Auto-assign brand tags
+            for spec in (spec_a, spec_b):
+                brand_tag = Tag.objects.filter(name__iexact=spec.make).first()
+                if brand_tag:
+                    article.tags.add(brand_tag)
+
+            # Segment tag (e.g., "SUV", "EV")
+            for tag_name in [spec_a.body_type, spec_a.fuel_type]:
+                if tag_name:
+                    seg_tag = Tag.objects.filter(name__iexact=tag_name).first()
+                    if seg_tag:
+                        article.tags.add(seg_tag)
+
+            # Create CarSpecification for primary vehicle
+            CarSpecification.objects.update_or_create(
+                article=article,
+                defaults={
+                    'make': spec_a.make,
+                    'model': spec_a.model_name,
+                    'trim': spec_a.trim_name or '',
+                },
+            )
+
+        log(
+            f"  ✅ Created draft: \"{result['title']}\" "
+            f"({result['word_count']} words, slug: {slug})",
+            'SUCCESS',
+        )
+        return 'created'
@@ -0,0 +1,142 @@
+"""
+Management command: pack_embeddings
+------------------------------------
+Backfill ArticleEmbedding.vector_data from the legacy JSON `embedding_vector`
+column (news/embedding_storage.py), or re-encode packed rows into another dtype.
+
+Usage:
+    python manage.py pack_embeddings                    # pack JSON rows (settings dtype)
+    python manage.py pack_embeddings --dtype float16    # pack as float16
+    python manage.py pack_embeddings --repack --dtype int8   # re-encode packed rows too
+    python manage.py pack_embeddings --keep-json        # keep the JSON copy (rollback safety)
+    python manage.py pack_embeddings --status           # storage breakdown only
+"""
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+
+class Command(BaseCommand):
+    help = 'Pack JSON embedding vectors into compact binary storage'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dtype', choices=['float32', 'float16', 'int8'],
+                            help='Storage dtype (default: settings.EMBEDDING_STORAGE_DTYPE)')
+        parser.add_argument('--batch-size', type=int, default=500,
+                            help='Rows per bulk update')
+        parser.add_argument('--repack', action='store_true',
+                            help='Also re-encode packed rows stored with a different dtype')
+        parser.add_argument('--keep-json', action='store_true',
+                            help='Keep embedding_vector populated after packing')
+        parser.add_argument('--status', action='store_true',
+                            help='Print storage breakdown and exit')
+
+    def handle(self, *args, **options):
+        from news.embedding_storage import default_dtype
+
+        if options['status']:
+            self._print_status()
+            return
+
+        dtype = options['dtype'] or default_dtype()
+        batch_size = options['batch_size']
+        if batch_size < 1:
+            raise CommandError('--batch-size must be positive')
+
+        started = time.time()
+        self.stdout.write(f"📦 Packing legacy JSON embeddings as {dtype}...")
+        packed, skipped = self._pack_legacy(dtype, batch_size, options['keep_json'])
+        self.stdout.write(f"   {packed} packed, {skipped} skipped (empty or invalid)")
+
+        if options['repack']:
+            self.stdout.write(f"🔁 Re-encoding packed embeddings into {dtype}...")
+            repacked = self._repack(dtype, batch_size)
+            self.stdout.write(f"   {repacked} re-encoded")
+
+        self.stdout.write(self.style.SUCCESS(f"✅ Done in {time.time() - started:.1f}s"))
+        self._print_status()
+
+    def _batches(self, queryset, batch_size):
+        """Yield lists of rows in primary-key order without holding the table in memory."""
+        last_pk = 0
+        while True:
+            batch = list(queryset.filter(pk__gt=last_pk).order_by('pk')[:batch_size])
+            if not batch:
+                return
+            last_pk = batch[-1].pk
+            yield batch
+
+    def _pack_legacy(self, dtype, batch_size, keep_json):
+        from news.models import ArticleEmbedding
+
+        legacy = ArticleEmbedding.objects.filter(
+            vector_data__isnull=True, embedding_vector__isnull=False
+        ).only('pk', *ArticleEmbedding.VECTOR_FIELDS)
+        packed = skipped = 0
+        for batch in self._batches(legacy, batch_size):
+            changed = []
+            for emb in batch:
+                vector = emb.embedding_vector
+                try:
+                    if not vector:
+                        raise ValueError('empty vector')
+                    emb.set_vector(vector, dtype)
+                except (TypeError, ValueError) as e:
+                    skipped += 1
+                    self.stderr.write(f"   ⚠️ Embedding {emb.pk}: {e}")
+                    continue
+                if keep_json:
+                    emb.embedding_vector = vector
+                changed.append(emb)
+            with transaction.atomic():
+                ArticleEmbedding.objects.bulk_update(changed, ArticleEmbedding.VECTOR_FIELDS)
+            packed += len(changed)
+            self.stdout.write(f"   … {packed} packed")
+        return packed, skipped
+
+    def _repack(self, dtype, batch_size):
+        from news.models import ArticleEmbedding
+
+        stale = ArticleEmbedding.objects.filter(vector_data__isnull=False).exclude(
+            vector_dtype=dtype
+        ).only('pk', *ArticleEmbedding.VECTOR_FIELDS)
+        repacked = 0
+        for batch in self._batches(stale, batch_size):
+            for emb in batch:
+                emb.set_vector(emb.get_vector(), dtype)
+            with transaction.atomic():
+                ArticleEmbedding.objects.bulk_update(
+                    batch, ['vector_data', 'vector_dtype', 'vector_dim', 'vector_scale']
+                )
+            repacked += len(batch)
+        return repacked
+
+    def _print_status(self):
+        from django.db.models import Count
+        from news.models import ArticleEmbedding
+
+        total = ArticleEmbedding.objects.count()
+        legacy = ArticleEmbedding.objects.filter(vector_data__isnull=True).count()
+        by_dtype = {
+            row['vector_dtype']: row['n']
+            for row in ArticleEmbedding.objects.filter(vector_data__isnull=False)
+            .values('vector_dtype').annotate(n=Count('id')).order_by()
+        }
+        self.stdout.write("")
+        self.stdout.write(f"📊 {total} embeddings — {legacy} JSON only")
+        for dtype, n in sorted(by_dtype.items()):
+            self.stdout.write(f"   {dtype:<8} {n}")
+
+        if connection.vendor == 'postgresql':
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT COALESCE(SUM(pg_column_size(embedding_vector)), 0), "
+                    "COALESCE(SUM(pg_column_size(vector_data)), 0), "
+                    "pg_total_relation_size('article_embeddings') FROM article_embeddings"
+                )
+                json_bytes, packed_bytes, table_bytes = cursor.fetchone()
+            self.stdout.write(
+                f"   JSON column {json_bytes / 1024 / 1024:.1f} MB, packed column "
+                f"{packed_bytes / 1024 / 1024:.1f} MB, table total {table_bytes / 1024 / 1024:.1f} MB"
+            )
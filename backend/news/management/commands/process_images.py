@@ -0,0 +1,131 @@
+"""
+Management command: process_images
+-----------------------------------
+Build responsive WebP/AVIF renditions (news/image_pipeline.py) for stored
+article and gallery images that have none yet — the same sweep the scheduler
+runs every 10 minutes, without the batch limit.
+
+Usage:
+    python manage.py process_images                 # everything pending
+    python manage.py process_images --limit 200
+    python manage.py process_images --retry-failed  # re-render failed assets first
+    python manage.py process_images --hash-missing  # perceptual hashes for older assets
+    python manage.py process_images --status
+"""
+import time
+
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = 'Build responsive renditions for stored images'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--limit', type=int, default=0,
+                            help='Maximum number of images to process (0 = all pending)')
+        parser.add_argument('--batch-size', type=int, default=50,
+                            help='Images per sweep batch')
+        parser.add_argument('--retry-failed', action='store_true',
+                            help='Unlink failed assets so their images are processed again')
+        parser.add_argument('--hash-missing', action='store_true',
+                            help='Compute perceptual hashes for ready assets that have none, then exit')
+        parser.add_argument('--status', action='store_true',
+                            help='Print pipeline status and exit')
+
+    def handle(self, *args, **options):
+        from news.image_pipeline import IMAGE_FIELDS, process_pending
+        from news.models import ImageAsset
+
+        if options['status']:
+            self._print_status()
+            return
+
+        if options['hash_missing']:
+            self._hash_missing(options['batch_size'])
+            return
+
+        if options['retry_failed']:
+            from django.apps import apps
+            failed = list(ImageAsset.objects.filter(status='failed').values_list('id', flat=True))
+            for label, fields in IMAGE_FIELDS.items():
+                model = apps.get_model(label)
+                for asset_field in fields.values():
+                    model.objects.filter(**{f'{asset_field}__in': failed}).update(**{asset_field: None})
+            ImageAsset.objects.filter(id__in=failed).update(status='pending', error='')
+            self.stdout.write(f"🔁 {len(failed)} failed asset(s) queued for retry")
+
+        started = time.time()
+        limit = options['limit'] or 10 ** 9
+        totals = {'processed': 0, 'reused': 0, 'failed': 0}
+        while limit > 0:
+            result = process_pending(limit=min(options['batch_size'], limit))
+            done = result['processed'] + result['reused'] + result['failed']
+            for key in totals:
+                totals[key] += result[key]
+            limit -= options['batch_size']
+            self.stdout.write(
+                f"   … {totals['processed']} processed, {totals['reused']} reused, "
+                f"{totals['failed']} failed, {result['remaining']} remaining"
+            )
+            if not done or not result['remaining']:
+                break
+
+        self.stdout.write(self.style.SUCCESS(
+            f"✅ {totals['processed']} processed, {totals['reused']} reused (same content), "
+            f"{totals['failed']} failed in {time.time() - started:.1f}s"
+        ))
+
+    def _hash_missing(self, batch_size):
+        """Hash the smallest rendition of each ready asset (same picture, cheapest read)."""
+        from django.core.files.storage import default_storage
+        from news.image_hashing import hash_many
+        from news.models import ImageAsset
+
+        started = time.time()
+        hashed = skipped = 0
+        last_id = 0
+        while True:
+            # Flat / unreadable images stay unhashed — walk by id so they are not retried
+            batch = list(ImageAsset.objects.filter(status='ready', phash__isnull=True, id__gt=last_id)
+                         .order_by('id')[:batch_size])
+            if not batch:
+                break
+            last_id = batch[-1].id
+            datas = []
+            for asset in batch:
+                smallest = min(asset.variants, key=lambda v: v['width'], default=None)
+                try:
+                    with default_storage.open(smallest['name'], 'rb') as fh:
+                        datas.append(fh.read())
+                except Exception:
+                    datas.append(b'')
+            for asset, hashes in zip(batch, hash_many(datas)):
+                if hashes is None:
+                    skipped += 1
+                    continue
+                asset.set_hashes(hashes)
+                asset.save(update_fields=['ahash', 'dhash', 'phash'])
+                hashed += 1
+            self.stdout.write(f"   … {hashed} hashed, {skipped} skipped (flat or unreadable)")
+
+        self.stdout.write(self.style.SUCCESS(
+            f"✅ Perceptual hashes: {hashed} asset(s) hashed, {skipped} skipped in {time.time() - started:.1f}s"
+        ))
+
+    def _print_status(self):
+        from django.db.models import Count
+        from news.image_pipeline import _pending_querysets, avif_supported
+        from news.models import ImageAsset
+
+        by_status = dict(ImageAsset.objects.values_list('status').annotate(n=Count('id')).order_by())
+        pending = sum(qs.count() for _, _, qs in _pending_querysets())
+        self.stdout.write(f"🖼️ Assets: {by_status.get('ready', 0)} ready, "
+                          f"{by_status.get('pending', 0)} pending, {by_status.get('failed', 0)} failed")
+        self.stdout.write(f"   Image fields without renditions: {pending}")
+        hashed = ImageAsset.objects.filter(status='ready', phash__isnull=False).count()
+        self.stdout.write(f"   Perceptually hashed: {hashed}/{by_status.get('ready', 0)} ready assets")
+        self.stdout.write(f"   AVIF encoder: {'available' if avif_supported() else 'not available (WebP only)'}")
+        total = 0
+        for variants in ImageAsset.objects.filter(status='ready').values_list('variants', flat=True).iterator():
+            total += sum(v.get('bytes', 0) for v in variants)
+        self.stdout.write(f"   Rendition storage: {total / 1024 / 1024:.1f} MB")
@@ -0,0 +1,91 @@
+"""
+Management command: rebuild_related_articles
+----------------------------------------------
+Recompute the materialised RelatedArticle table (news/related_articles.py)
+that backs the similar-articles endpoint.
+
+Usage:
+    python manage.py rebuild_related_articles              # every published article
+    python manage.py rebuild_related_articles --stale      # only stale / never computed
+    python manage.py rebuild_related_articles --missing    # backfill never-computed sets (after deploy)
+    python manage.py rebuild_related_articles --article 42 # one article
+    python manage.py rebuild_related_articles --status     # staleness metrics only
+"""
+import time
+
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = 'Recompute materialised related articles'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--stale', action='store_true',
+                            help='Only refresh never-computed, edited or expired sets')
+        parser.add_argument('--missing', action='store_true',
+                            help='Only compute sets that were never computed, most viewed first')
+        parser.add_argument('--article', type=int, help='Refresh a single article by ID')
+        parser.add_argument('--limit', type=int, default=0,
+                            help='Maximum number of articles to refresh (0 = no limit)')
+        parser.add_argument('--status', action='store_true',
+                            help='Print staleness metrics and exit')
+
+    def handle(self, *args, **options):
+        from news.models import Article
+        from news.related_articles import refresh_related, refresh_stale, staleness_stats
+
+        if options['status']:
+            self._print_stats(staleness_stats())
+            return
+
+        if options['article']:
+            related = refresh_related(options['article'])
+            self.stdout.write(self.style.SUCCESS(
+                f"✅ Article {options['article']}: {len(related)} related articles"
+            ))
+            return
+
+        started = time.time()
+        if options['stale']:
+            self.stdout.write("🔗 Refreshing stale related-article sets...")
+            result = refresh_stale(limit=options['limit'] or 10 ** 9)
+            refreshed, failed = result['refreshed'], result['failed']
+        else:
+            published = Article.objects.filter(is_published=True, is_deleted=False)
+            if options['missing']:
+                # Until computed these pages serve the database-only fallback ranking
+                published = published.filter(related_computed_at__isnull=True).order_by('-views')
+            else:
+                published = published.order_by('-created_at')
+            ids = list(published.values_list('id', flat=True))
+            if options['limit']:
+                ids = ids[:options['limit']]
+            self.stdout.write(f"🔗 Recomputing related articles for {len(ids)} article(s)...")
+            refreshed = failed = 0
+            for i, article_id in enumerate(ids, 1):
+                try:
+                    # Full rebuild: every set is recomputed anyway — skip the per-neighbour back-links.
+                    # Backfill: computed sets must pick up the new articles, so link back.
+                    refresh_related(article_id, link_back=options['missing'])
+                    refreshed += 1
+                except Exception as e:
+                    failed += 1
+                    self.stdout.write(self.style.WARNING(f"   ⚠️ {article_id}: {e}"))
+                if i % 50 == 0:
+                    self.stdout.write(f"   {i}/{len(ids)} ({time.time() - started:.0f}s)")
+
+        self.stdout.write(self.style.SUCCESS(
+            f"✅ Done in {time.time() - started:.1f}s: {refreshed} refreshed, {failed} failed"
+        ))
+        self._print_stats(staleness_stats())
+
+    def _print_stats(self, stats):
+        self.stdout.write("")
+        self.stdout.write(f"   Published articles: {stats['published']}")
+        self.stdout.write(f"   Computed:           {stats['computed']} ({stats['rows']} rows)")
+        self.stdout.write(f"   Never computed:     {stats['never_computed']}")
+        self.stdout.write(f"   Edited since:       {stats['edited_since']}")
+        self.stdout.write(f"   Older than max age: {stats['expired']}")
+        self.stdout.write(f"   Stale:              {stats['stale']} ({stats['stale_pct']}%)")
+        if stats['oldest_age_hours'] is not None:
+            self.stdout.write(f"   Oldest set:         {stats['oldest_age_hours']}h")
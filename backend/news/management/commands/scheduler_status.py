@@ -0,0 +1,57 @@
+"""
+Show periodic job state from the cluster-wide job scheduler.
+
+Usage:
+    python manage.py scheduler_status
+    python manage.py scheduler_status --run-soon rss_scan
+    python manage.py scheduler_status --run youtube_scan   # run now, in this process
+"""
+from django.core.management.base import BaseCommand, CommandError
+
+from news import job_scheduler
+import news.scheduler  # noqa: F401 — registers jobs
+
+
+class Command(BaseCommand):
+    help = 'Show next/last runs and duration stats of periodic jobs'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--run-soon', metavar='JOB',
+                            help='Mark a job as due on the next scheduler tick')
+        parser.add_argument('--run', metavar='JOB',
+                            help='Run a job now in this process (respects its run slots)')
+
+    def handle(self, *args, **options):
+        names = {job.name for job in job_scheduler.get_jobs()}
+        for opt in ('run_soon', 'run'):
+            if options[opt] and options[opt] not in names:
+                raise CommandError(f"Unknown job '{options[opt]}'. Jobs: {', '.join(sorted(names))}")
+
+        if options['run_soon']:
+            job_scheduler.run_soon(options['run_soon'])
+            self.stdout.write(self.style.SUCCESS(f"✓ {options['run_soon']} will run on the next tick"))
+            return
+
+        if options['run']:
+            ran = job_scheduler.run_job(options['run'])
+            if ran:
+                self.stdout.write(self.style.SUCCESS(f"✓ {options['run']} finished"))
+            else:
+                self.stdout.write(self.style.WARNING(f"⏭ {options['run']} is already running elsewhere"))
+            return
+
+        self.stdout.write(f"Leader: {job_scheduler.get_leader() or '— (no leader)'}")
+        self.stdout.write(
+            f"{'JOB':<22}{'NEXT RUN':<28}{'LAST RUN':<28}{'STATUS':<8}{'LAST s':>9}{'AVG s':>9}{'RUNS':>7}{'RUNNING':>9}"
+        )
+        for job in job_scheduler.get_jobs_status():
+            self.stdout.write(
+                f"{job['name']:<22}"
+                f"{(job['next_run'] or '—')[:25]:<28}"
+                f"{(job['last_run'] or '—')[:25]:<28}"
+                f"{(job['last_status'] or '—'):<8}"
+                f"{job['last_duration'] if job['last_duration'] is not None else '—':>9}"
+                f"{job['avg_duration'] if job['avg_duration'] is not None else '—':>9}"
+                f"{job['runs']:>7}"
+                f"{job['running']:>9}"
+            )
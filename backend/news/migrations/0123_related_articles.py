@@ -0,0 +1,37 @@
+# Generated by Django 6.0.3 on 2026-10-18 21:40
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0122_manualcompetitorfeedback'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='article',
+            name='related_computed_at',
+            field=models.DateTimeField(blank=True, db_index=True, help_text='When the materialised related articles were last computed (see RelatedArticle)', null=True),
+        ),
+        migrations.CreateModel(
+            name='RelatedArticle',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('score', models.FloatField(help_text='Merged similarity score (higher = more similar)')),
+                ('source', models.CharField(choices=[('ml', 'TF-IDF similarity'), ('vector', 'Vector search'), ('make_model', 'Same make/model'), ('specs', 'Similar specs'), ('category', 'Same category')], help_text='Signal that contributed most to the score', max_length=20)),
+                ('computed_at', models.DateTimeField(auto_now=True)),
+                ('article', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='related_links', to='news.article')),
+                ('related', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='related_backlinks', to='news.article')),
+            ],
+            options={
+                'verbose_name': 'Related Article',
+                'verbose_name_plural': 'Related Articles',
+                'db_table': 'related_articles',
+                'indexes': [models.Index(fields=['article', '-score'], name='related_article_score_idx')],
+                'constraints': [models.UniqueConstraint(fields=('article', 'related'), name='unique_related_article')],
+            },
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 6.0.3 on 2026-10-18 21:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0123_related_articles'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='articleembedding',
+            name='vector_data',
+            field=models.BinaryField(blank=True, help_text='Packed embedding bytes (see news/embedding_storage.py)', null=True),
+        ),
+        migrations.AddField(
+            model_name='articleembedding',
+            name='vector_dim',
+            field=models.PositiveIntegerField(default=0, help_text='Number of dimensions in vector_data'),
+        ),
+        migrations.AddField(
+            model_name='articleembedding',
+            name='vector_dtype',
+            field=models.CharField(choices=[('float32', 'float32'), ('float16', 'float16'), ('int8', 'int8 (quantised)')], default='float32', help_text='Element type of vector_data', max_length=10),
+        ),
+        migrations.AddField(
+            model_name='articleembedding',
+            name='vector_scale',
+            field=models.FloatField(default=1.0, help_text='Dequantisation scale (int8 only)'),
+        ),
+        migrations.AlterField(
+            model_name='articleembedding',
+            name='embedding_vector',
+            field=models.JSONField(blank=True, help_text='Legacy JSON array — cleared once packed into vector_data (manage.py pack_embeddings)', null=True),
+        ),
+    ]
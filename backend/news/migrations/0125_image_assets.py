@@ -0,0 +1,54 @@
+# Generated by Django 6.0.3 on 2026-10-18 21:52
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0124_packed_embeddings'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ImageAsset',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('content_hash', models.CharField(help_text='SHA-256 of the source bytes', max_length=64, unique=True)),
+                ('source_name', models.CharField(blank=True, help_text='Storage name of the original upload', max_length=255)),
+                ('width', models.PositiveIntegerField(default=0)),
+                ('height', models.PositiveIntegerField(default=0)),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('ready', 'Ready'), ('failed', 'Failed')], db_index=True, default='pending', max_length=10)),
+                ('variants', models.JSONField(blank=True, default=list, help_text='Renditions: [{width, height, format, name, bytes}], widest first')),
+                ('error', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('processed_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'verbose_name': 'Image Asset',
+                'verbose_name_plural': 'Image Assets',
+                'db_table': 'image_assets',
+            },
+        ),
+        migrations.AddField(
+            model_name='article',
+            name='image_2_asset',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='news.imageasset'),
+        ),
+        migrations.AddField(
+            model_name='article',
+            name='image_3_asset',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='news.imageasset'),
+        ),
+        migrations.AddField(
+            model_name='article',
+            name='image_asset',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='news.imageasset'),
+        ),
+        migrations.AddField(
+            model_name='articleimage',
+            name='image_asset',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='news.imageasset'),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 6.0.3 on 2026-10-18 21:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0125_image_assets'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='imageasset',
+            name='ahash',
+            field=models.BigIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='imageasset',
+            name='dhash',
+            field=models.BigIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='imageasset',
+            name='phash',
+            field=models.BigIntegerField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 6.0.3 on 2026-10-18 22:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0126_image_asset_hashes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RSSMentionBucket',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('brand', 'Brand'), ('topic', 'Topic')], max_length=10)),
+                ('name', models.CharField(help_text='Brand display name or topic label', max_length=100)),
+                ('hour', models.DateTimeField(help_text='Start of the hour the items were ingested')),
+                ('count', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'verbose_name': 'RSS Mention Bucket',
+                'verbose_name_plural': 'RSS Mention Buckets',
+                'db_table': 'rss_mention_buckets',
+                'indexes': [models.Index(fields=['kind', 'hour'], name='rss_mention_kind_555645_idx')],
+                'constraints': [models.UniqueConstraint(fields=('kind', 'name', 'hour'), name='rss_mention_bucket_unique')],
+            },
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 6.0.3 on 2026-10-18 23:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0127_rss_mention_buckets'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BatchJobCheckpoint',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('job', models.CharField(help_text='Management command name', max_length=100)),
+                ('fingerprint', models.CharField(help_text='Hash of the options that select the items', max_length=40)),
+                ('done_keys', models.JSONField(default=list, help_text='Keys of items that finished')),
+                ('failed_keys', models.JSONField(default=list, help_text='Keys of items that failed every retry')),
+                ('total', models.PositiveIntegerField(default=0)),
+                ('started_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Batch Job Checkpoint',
+                'verbose_name_plural': 'Batch Job Checkpoints',
+                'db_table': 'batch_job_checkpoints',
+                'constraints': [models.UniqueConstraint(fields=('job', 'fingerprint'), name='batch_job_checkpoint_unique')],
+            },
+        ),
+    ]
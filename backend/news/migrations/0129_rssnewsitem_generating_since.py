@@ -0,0 +1,18 @@
+# Generated by Django 6.0.3 on 2026-10-19 01:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0128_batch_job_checkpoints'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='rssnewsitem',
+            name='generating_since',
+            field=models.DateTimeField(blank=True, help_text='Last heartbeat of the bulk generation job holding this item (news/rss_bulk_generation.py)', null=True),
+        ),
+    ]
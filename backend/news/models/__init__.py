@@ -1,5 +1,5 @@
 from .content import Category, TagGroup, Tag, IMAGE_SOURCE_CHOICES, Article, ArticleImage, PendingArticle
 from .interactions import Comment, CommentModerationLog, Rating, Favorite, ArticleFeedback, ArticleCapsuleFeedback
 from .vehicles import Brand, BrandAlias, CarSpecification, VehicleSpecs
-from .sources import YouTubeChannel, RSSFeed, RSSNewsItem, YouTubeVideoCandidate
-from .system import SiteSettings, EmailPreferences, Subscriber, NewsletterHistory, AdminNotification, SecurityLog, EmailVerification, PasswordResetToken, GSCReport, ArticleGSCStats, NewsletterSubscriber, ArticleEmbedding, ArticleTitleVariant, ArticleImageVariant, AdPlacement, AutomationSettings, AutoPublishLog, SocialPost, TagLearningLog, TrainingPair, ThemeAnalytics, AdminActionLog, FrontendEventLog, PageAnalyticsEvent, BackendErrorLog, CompetitorPairLog, ManualCompetitorFeedback, TOTPDevice, WebAuthnCredential, CuratorDecisionLog
+from .sources import YouTubeChannel, RSSFeed, RSSNewsItem, RSSMentionBucket, YouTubeVideoCandidate
+from .system import SiteSettings, EmailPreferences, Subscriber, NewsletterHistory, AdminNotification, SecurityLog, EmailVerification, PasswordResetToken, GSCReport, ArticleGSCStats, NewsletterSubscriber, ArticleEmbedding, RelatedArticle, ImageAsset, ArticleTitleVariant, ArticleImageVariant, AdPlacement, AutomationSettings, AutoPublishLog, SocialPost, TagLearningLog, TrainingPair, ThemeAnalytics, AdminActionLog, FrontendEventLog, PageAnalyticsEvent, BackendErrorLog, CompetitorPairLog, ManualCompetitorFeedback, TOTPDevice, WebAuthnCredential, CuratorDecisionLog, BatchJobCheckpoint
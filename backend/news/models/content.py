@@ -1,6 +1,5 @@
 from django.db import models
 from django.utils.text import slugify
-from ..image_utils import optimize_image
 
 
 # Intra-package imports to resolve foreign keys if needed
@@ -85,6 +84,13 @@ class Article(models.Model):
     image = models.ImageField(upload_to='articles/', blank=True, null=True, max_length=255, help_text="Main featured image (screenshot 1)")
     image_2 = models.ImageField(upload_to='articles/', blank=True, null=True, max_length=255, help_text="Screenshot 2 from video")
     image_3 = models.ImageField(upload_to='articles/', blank=True, null=True, max_length=255, help_text="Screenshot 3 from video")
+    # Responsive renditions of image / image_2 / image_3 (news/image_pipeline.py)
+    image_asset = models.ForeignKey('news.ImageAsset', on_delete=models.SET_NULL, null=True, blank=True,
+                                    related_name='+', editable=False)
+    image_2_asset = models.ForeignKey('news.ImageAsset', on_delete=models.SET_NULL, null=True, blank=True,
+                                      related_name='+', editable=False)
+    image_3_asset = models.ForeignKey('news.ImageAsset', on_delete=models.SET_NULL, null=True, blank=True,
+                                      related_name='+', editable=False)
     youtube_url = models.URLField(max_length=2000, blank=True, help_text="YouTube video URL for AI generation")
     
     # Author / Source Credits
@@ -138,6 +144,10 @@ class Article(models.Model):
         null=True, blank=True, db_index=True,
         help_text="When this article was last bulk-enriched (Deep Specs + AB Titles + Tags)"
     )
+    related_computed_at = models.DateTimeField(
+        null=True, blank=True, db_index=True,
+        help_text="When the materialised related articles were last computed (see RelatedArticle)"
+    )
     
     # Content Moderation Queue — human-in-the-loop review before publish
     MODERATION_STATUS_CHOICES = [
@@ -185,53 +195,17 @@ class Article(models.Model):
         ]
     
     def save(self, *args, **kwargs):
-        # Optimize images before saving
-        from ..image_utils import optimize_image
-        from django.core.files.uploadedfile import InMemoryUploadedFile, TemporaryUploadedFile
-        
-        # Helper for batch optimization — only process genuinely NEW uploads
-        def process_img(field_name):
-            img = getattr(self, field_name)
-            if not img:
-                return
-            img_name = getattr(img, 'name', str(img))
-            
-            # Skip Cloudinary/external URLs/already prefixed paths
-            if (img_name.startswith('http') or 
-                'cloudinary' in img_name or 
-                img_name.startswith('articles/') or 
-                img_name.startswith('media/articles/')):
-                return
-                
-            # Skip if already optimized
-            if '_optimized' in img_name:
-                return
-                
-            # Now safe to check if it's a fresh upload
-            try:
-                # In-memory or temporary files are from user uploads/manual approve
-                from django.core.files.uploadedfile import InMemoryUploadedFile, TemporaryUploadedFile
-                img_file = getattr(img, 'file', None)
-                if not isinstance(img_file, (InMemoryUploadedFile, TemporaryUploadedFile, BytesIO)):
-                    return
-            except (IOError, OSError, AttributeError):
-                return
-
-            try:
-                optimized_img = optimize_image(img, max_width=1920, max_height=1080, quality=85)
-                if optimized_img:
-                    # By now optimize_image returns just a basename filename
-                    setattr(self, field_name, optimized_img)
-            except Exception as e:
-                import logging
-                logger = logging.getLogger(__name__)
-                logger.error(f"[{field_name}] optimization failed: {e}")
+        # Fresh uploads are stored as-is and optimised off-request
+        # (news/image_pipeline.py: responsive WebP/AVIF renditions).
+        # Only uncommitted files are new; stored ones are never opened here.
+        fresh_images = [
+            f for f in ('image', 'image_2', 'image_3')
+            if getattr(self, f) and not getattr(self, f)._committed
+        ]
+        for field_name in fresh_images:
+            # Previous renditions belong to the replaced image
+            setattr(self, f'{field_name}_asset', None)
 
-        from io import BytesIO
-        process_img('image')
-        process_img('image_2')
-        process_img('image_3')
-        
         if not self.slug:
             base_slug = slugify(self.title)
             slug = base_slug
@@ -264,6 +238,10 @@ class Article(models.Model):
                 pass
 
         super().save(*args, **kwargs)
+
+        if fresh_images:
+            from ..image_pipeline import schedule_image_processing
+            schedule_image_processing(self, fresh_images)
     
     def average_rating(self):
         """Calculate average rating (1-5 stars)"""
@@ -284,15 +262,18 @@ class ArticleImage(models.Model):
     caption = models.CharField(max_length=200, blank=True, help_text="Image caption/description")
     order = models.IntegerField(default=0, help_text="Display order")
     created_at = models.DateTimeField(auto_now_add=True)
+    image_asset = models.ForeignKey('news.ImageAsset', on_delete=models.SET_NULL, null=True, blank=True,
+                                    related_name='+', editable=False)
     
     def save(self, *args, **kwargs):
-        # Optimize gallery images before saving
-        if self.image and hasattr(self.image, 'file'):
-            try:
-                self.image = optimize_image(self.image, max_width=1920, max_height=1080, quality=85)
-            except Exception as e:
-                print(f"Gallery image optimization failed: {e}")
+        # Gallery uploads are optimised off-request (news/image_pipeline.py)
+        fresh = bool(self.image) and not self.image._committed
+        if fresh:
+            self.image_asset = None
         super().save(*args, **kwargs)
+        if fresh:
+            from ..image_pipeline import schedule_image_processing
+            schedule_image_processing(self, ['image'])
     
     class Meta:
         ordering = ['order', '-created_at']
@@ -214,6 +214,10 @@ class RSSNewsItem(models.Model):
     )
     published_at = models.DateTimeField(null=True, blank=True, help_text="Original publication date")
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='new')
+    generating_since = models.DateTimeField(
+        null=True, blank=True,
+        help_text="Last heartbeat of the bulk generation job holding this item (news/rss_bulk_generation.py)"
+    )
     is_favorite = models.BooleanField(
         default=False,
         db_index=True,
@@ -268,6 +272,37 @@ class RSSNewsItem(models.Model):
         return f"[{self.get_status_display()}] {self.title[:80]}"
 
 
+class RSSMentionBucket(models.Model):
+    """Brand/topic mentions in RSS titles, pre-counted per hour at ingest.
+
+    Trending queries (news/rss_intelligence.py) sum these buckets instead of
+    re-extracting brands from every RSSNewsItem title in the window.
+    """
+    KIND_CHOICES = [
+        ('brand', 'Brand'),
+        ('topic', 'Topic'),
+    ]
+
+    kind = models.CharField(max_length=10, choices=KIND_CHOICES)
+    name = models.CharField(max_length=100, help_text="Brand display name or topic label")
+    hour = models.DateTimeField(help_text="Start of the hour the items were ingested")
+    count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        db_table = 'rss_mention_buckets'
+        verbose_name = "RSS Mention Bucket"
+        verbose_name_plural = "RSS Mention Buckets"
+        constraints = [
+            models.UniqueConstraint(fields=['kind', 'name', 'hour'], name='rss_mention_bucket_unique'),
+        ]
+        indexes = [
+            models.Index(fields=['kind', 'hour']),
+        ]
+
+    def __str__(self):
+        return f"{self.kind}:{self.name} @ {self.hour:%Y-%m-%d %H:00} = {self.count}"
+
+
 class YouTubeVideoCandidate(models.Model):
     """YouTube videos discovered by channel scans — inbox for cherry-picking.
     
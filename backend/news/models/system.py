@@ -408,8 +408,35 @@ class ArticleEmbedding(models.Model):
         related_name='embedding',
         help_text="Article this embedding belongs to"
     )
+    VECTOR_DTYPE_CHOICES = [
+        ('float32', 'float32'),
+        ('float16', 'float16'),
+        ('int8', 'int8 (quantised)'),
+    ]
+    # Fields written by set_vector() — pass to save(update_fields=...)
+    VECTOR_FIELDS = ['embedding_vector', 'vector_data', 'vector_dtype', 'vector_dim', 'vector_scale']
+
     embedding_vector = models.JSONField(
-        help_text="768-dimensional embedding vector from Gemini (stored as JSON array)"
+        null=True, blank=True,
+        help_text="Legacy JSON array — cleared once packed into vector_data (manage.py pack_embeddings)"
+    )
+    vector_data = models.BinaryField(
+        null=True, blank=True,
+        help_text="Packed embedding bytes (see news/embedding_storage.py)"
+    )
+    vector_dtype = models.CharField(
+        max_length=10,
+        choices=VECTOR_DTYPE_CHOICES,
+        default='float32',
+        help_text="Element type of vector_data"
+    )
+    vector_dim = models.PositiveIntegerField(
+        default=0,
+        help_text="Number of dimensions in vector_data"
+    )
+    vector_scale = models.FloatField(
+        default=1.0,
+        help_text="Dequantisation scale (int8 only)"
     )
     model_name = models.CharField(
         max_length=100,
@@ -437,10 +464,127 @@ class ArticleEmbedding(models.Model):
     
     def get_vector_dimension(self):
         """Return dimension of embedding vector"""
+        if self.vector_data is not None:
+            return self.vector_dim
         if self.embedding_vector:
             return len(self.embedding_vector)
         return 0
 
+    def set_vector(self, vector, dtype=None):
+        """Pack `vector` into vector_data and drop the legacy JSON copy."""
+        from news.embedding_storage import default_dtype, pack_vector
+        dtype = dtype or default_dtype()
+        self.vector_data, self.vector_dim, self.vector_scale = pack_vector(vector, dtype)
+        self.vector_dtype = dtype
+        self.embedding_vector = None
+
+    def get_vector(self):
+        """Embedding as a float32 numpy array (None if nothing stored)."""
+        import numpy as np
+        from news.embedding_storage import unpack_vector
+        if self.vector_data is not None:
+            return unpack_vector(self.vector_data, self.vector_dtype, self.vector_dim, self.vector_scale)
+        if self.embedding_vector:
+            return np.asarray(self.embedding_vector, dtype=np.float32)
+        return None
+
+
+
+class RelatedArticle(models.Model):
+    """
+    Materialised "similar articles" for an article.
+    Computed off-request by news/related_articles.py (TF-IDF, vector search,
+    make/model and VehicleSpecs signals merged into one score).
+    """
+    SOURCE_CHOICES = [
+        ('ml', 'TF-IDF similarity'),
+        ('vector', 'Vector search'),
+        ('make_model', 'Same make/model'),
+        ('specs', 'Similar specs'),
+        ('category', 'Same category'),
+    ]
+
+    article = models.ForeignKey('news.Article',
+        on_delete=models.CASCADE,
+        related_name='related_links',
+    )
+    related = models.ForeignKey('news.Article',
+        on_delete=models.CASCADE,
+        related_name='related_backlinks',
+    )
+    score = models.FloatField(help_text="Merged similarity score (higher = more similar)")
+    source = models.CharField(max_length=20, choices=SOURCE_CHOICES,
+        help_text="Signal that contributed most to the score")
+    computed_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'related_articles'
+        verbose_name = 'Related Article'
+        verbose_name_plural = 'Related Articles'
+        constraints = [
+            models.UniqueConstraint(fields=['article', 'related'], name='unique_related_article'),
+        ]
+        indexes = [
+            models.Index(fields=['article', '-score'], name='related_article_score_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.article_id} → {self.related_id} ({self.source}, {self.score:.2f})"
+
+
+class ImageAsset(models.Model):
+    """
+    One distinct source image (by SHA-256 of its bytes) and its responsive
+    renditions. Built off-request by news/image_pipeline.py; identical
+    uploads share one asset and are processed once.
+    """
+    STATUS_CHOICES = [
+        ('pending', 'Pending'),
+        ('ready', 'Ready'),
+        ('failed', 'Failed'),
+    ]
+
+    content_hash = models.CharField(max_length=64, unique=True, help_text="SHA-256 of the source bytes")
+    source_name = models.CharField(max_length=255, blank=True, help_text="Storage name of the original upload")
+    width = models.PositiveIntegerField(default=0)
+    height = models.PositiveIntegerField(default=0)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='pending', db_index=True)
+    variants = models.JSONField(
+        default=list, blank=True,
+        help_text="Renditions: [{width, height, format, name, bytes}], widest first"
+    )
+    error = models.TextField(blank=True)
+    # Perceptual hashes (news/image_hashing.py), 64 bits stored as signed bigint
+    ahash = models.BigIntegerField(null=True, blank=True)
+    dhash = models.BigIntegerField(null=True, blank=True)
+    phash = models.BigIntegerField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    processed_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = 'image_assets'
+        verbose_name = 'Image Asset'
+        verbose_name_plural = 'Image Assets'
+
+    def __str__(self):
+        return f"{self.content_hash[:12]} ({self.status}, {len(self.variants)} variants)"
+
+    def variants_for(self, fmt='webp'):
+        return [v for v in self.variants if v.get('format') == fmt]
+
+    def srcset(self, fmt='webp'):
+        """`url 320w, url 640w, …` for an <img srcset> / <source> of one format."""
+        from django.core.files.storage import default_storage
+        return ', '.join(
+            f"{default_storage.url(v['name'])} {v['width']}w"
+            for v in sorted(self.variants_for(fmt), key=lambda v: v['width'])
+        )
+
+    def set_hashes(self, hashes):
+        from news.image_hashing import to_db
+        for kind in ('ahash', 'dhash', 'phash'):
+            setattr(self, kind, to_db(hashes[kind]) if hashes else None)
+
 class ArticleTitleVariant(models.Model):
     """A/B testing variants for article titles.
     AI generates 2-3 title variants per article, and the system
@@ -1778,3 +1922,30 @@ class WebAuthnCredential(models.Model):
 
     def __str__(self):
         return f'{self.user.username} — {self.device_name} ({self.created_at:%Y-%m-%d})'
+
+
+class BatchJobCheckpoint(models.Model):
+    """
+    Progress of a bulk maintenance command run through news/batch_runner.py,
+    so a crashed or interrupted run resumes where it stopped. One row per
+    command and item selection (hash of the options that pick the items).
+    """
+    job = models.CharField(max_length=100, help_text="Management command name")
+    fingerprint = models.CharField(max_length=40,
+        help_text="Hash of the options that select the items")
+    done_keys = models.JSONField(default=list, help_text="Keys of items that finished")
+    failed_keys = models.JSONField(default=list, help_text="Keys of items that failed every retry")
+    total = models.PositiveIntegerField(default=0)
+    started_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'batch_job_checkpoints'
+        verbose_name = 'Batch Job Checkpoint'
+        verbose_name_plural = 'Batch Job Checkpoints'
+        constraints = [
+            models.UniqueConstraint(fields=['job', 'fingerprint'], name='batch_job_checkpoint_unique'),
+        ]
+
+    def __str__(self):
+        return f"{self.job} ({len(self.done_keys)}/{self.total} done)"
@@ -0,0 +1,472 @@
+"""
+Request profiling — SQL, cache, outbound HTTP and LLM cost per request.
+
+N+1 regressions (a serializer that queries once per row, a view that
+re-reads the same setting) used to be found by accident. A profile counts,
+for one request or any block of code in the current thread:
+
+  * SQL queries and their time, with duplicate-query fingerprints (the same
+    statement shape run more than once — the N+1 signature) and the slowest
+    statements, via connection.execute_wrapper();
+  * Django cache calls (one Redis command each with django-redis);
+  * outbound HTTP calls through requests (web_fetch, scrapers, webhooks);
+  * LLM calls and their time (ai_provider / vector_search mark them with span('llm')).
+
+    with profiling.profile('rebuild') as prof:
+        ...
+    prof.summary()   # {'sql': 12, 'sql_ms': 8.1, 'duplicates': [...], ...}
+
+ProfilingMiddleware profiles a PROFILING_SAMPLE_RATE share of requests and
+files each under "<METHOD> <url route>" in a rolling window of the last
+PROFILING_WINDOW samples per route (Redis, shared by every worker; in
+process without it, and while a configured Redis is down until it is
+reachable again). Sampled requests slower than PROFILING_SLOW_MS also
+keep a trace. GET /api/v1/health/profiling/ returns per-route percentiles
+and the traces.
+
+With the rate at 0 (the default) the middleware returns straight away and
+none of the hooks are installed.
+"""
+import hashlib
+import json
+import logging
+import math
+import random
+import re
+import threading
+import time
+from collections import Counter, deque
+from contextlib import ExitStack, contextmanager, nullcontext
+
+from news.redis_state import RedisReconnector, redis_configured
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = 'autonews:profiling'
+
+DEFAULT_WINDOW = 200        # samples kept per route
+DEFAULT_SLOW_MS = 1000
+DEFAULT_TRACES_KEPT = 50
+TOP_QUERIES = 5             # duplicate fingerprints / slow statements kept per profile
+ROUTE_TTL = 7 * 86400       # a route's window expires after a week without samples
+
+_local = threading.local()
+
+
+def _setting(name, default):
+    from django.conf import settings
+    return getattr(settings, name, default)
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Profiles
+# ═══════════════════════════════════════════════════════════════════
+
+_NUMBER = re.compile(r'\b\d+(\.\d+)?\b')
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_PLACEHOLDER_LIST = re.compile(r'(%s|\?)(\s*,\s*(%s|\?))+')
+
+
+def fingerprint(sql):
+    """Statement shape: literals and IN-list lengths removed, so "WHERE id = 3" matches "WHERE id = 7"."""
+    shape = _STRING.sub('?', sql)
+    shape = _NUMBER.sub('?', shape)
+    shape = _PLACEHOLDER_LIST.sub('?, ...', shape)
+    shape = ' '.join(shape.split())
+    return hashlib.sha1(shape.encode()).hexdigest()[:12], shape
+
+
+class Profile:
+    """Counters for one profiled block. Filled by the hooks while it is active in this thread."""
+
+    def __init__(self, name=''):
+        self.name = name
+        self.started = time.perf_counter()
+        self.total_ms = 0.0
+        self.sql = 0
+        self.sql_ms = 0.0
+        self.cache = 0
+        self.http = 0
+        self.http_ms = 0.0
+        self.llm = 0
+        self.llm_ms = 0.0
+        self._shapes = Counter()
+        self._shape_sql = {}
+        self._slowest = []       # (ms, sql)
+        self._http_calls = []    # (method, host, status, ms)
+
+    def _sql(self, sql, ms):
+        self.sql += 1
+        self.sql_ms += ms
+        key, shape = fingerprint(sql)
+        self._shapes[key] += 1
+        self._shape_sql.setdefault(key, shape[:300])
+        if len(self._slowest) < TOP_QUERIES or ms > self._slowest[-1][0]:
+            self._slowest.append((ms, sql[:300]))
+            self._slowest.sort(key=lambda q: -q[0])
+            del self._slowest[TOP_QUERIES:]
+
+    def _http(self, method, url, status, ms):
+        from urllib.parse import urlsplit
+        self.http += 1
+        self.http_ms += ms
+        if len(self._http_calls) < 20:
+            self._http_calls.append((method, urlsplit(url).netloc, status, round(ms, 1)))
+
+    def duplicates(self):
+        """[(fingerprint, count, statement shape)] run more than once, most repeated first."""
+        return [(key, n, self._shape_sql[key]) for key, n in self._shapes.most_common(TOP_QUERIES) if n > 1]
+
+    def summary(self):
+        return {
+            'name': self.name,
+            'ms': round(self.total_ms, 1),
+            'sql': self.sql,
+            'sql_ms': round(self.sql_ms, 1),
+            'duplicate_queries': sum(n - 1 for n in self._shapes.values() if n > 1),
+            'duplicates': [{'fingerprint': k, 'count': n, 'sql': s} for k, n, s in self.duplicates()],
+            'cache': self.cache,
+            'http': self.http,
+            'http_ms': round(self.http_ms, 1),
+            'llm': self.llm,
+            'llm_ms': round(self.llm_ms, 1),
+        }
+
+    def trace(self):
+        """summary() plus the slowest statements and the outbound calls."""
+        return {
+            **self.summary(),
+            'slowest_sql': [{'ms': round(ms, 2), 'sql': sql} for ms, sql in self._slowest],
+            'http_calls': [{'method': m, 'host': h, 'status': s, 'ms': ms} for m, h, s, ms in self._http_calls],
+        }
+
+
+def _active():
+    return getattr(_local, 'stack', None)
+
+
+@contextmanager
+def profile(name=''):
+    """Profile the enclosed block in this thread. Nested profiles each see the inner calls."""
+    from django.db import connections
+
+    _install_hooks()
+    prof = Profile(name)
+
+    def record_sql(execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            prof._sql(sql, (time.perf_counter() - started) * 1000)
+
+    stack = _active()
+    if stack is None:
+        stack = _local.stack = []
+    stack.append(prof)
+    try:
+        with ExitStack() as wrappers:
+            for conn in connections.all():
+                wrappers.enter_context(conn.execute_wrapper(record_sql))
+            yield prof
+    finally:
+        prof.total_ms = (time.perf_counter() - prof.started) * 1000
+        stack.remove(prof)
+
+
+@contextmanager
+def _span(kind):
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        ms = (time.perf_counter() - started) * 1000
+        for prof in _active() or ():
+            setattr(prof, kind, getattr(prof, kind) + 1)
+            setattr(prof, f'{kind}_ms', getattr(prof, f'{kind}_ms') + ms)
+
+
+def span(kind):
+    """Time the enclosed call as `kind` ('llm' or 'http') in every active profile; free when none is active."""
+    if not _active():
+        return nullcontext()
+    return _span(kind)
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Hooks — installed on first use, pass straight through without a profile
+# ═══════════════════════════════════════════════════════════════════
+
+_hooks_installed = False
+_hooks_lock = threading.Lock()
+
+_CACHE_METHODS = ('get', 'set', 'add', 'delete', 'get_many', 'set_many', 'delete_many',
+                  'incr', 'decr', 'touch', 'has_key', 'get_or_set')
+
+
+def _install_hooks():
+    global _hooks_installed
+    if _hooks_installed:
+        return
+    with _hooks_lock:
+        if _hooks_installed:
+            return
+        _hook_requests()
+        _hook_cache()
+        _hooks_installed = True
+
+
+def _hook_requests():
+    import requests
+
+    original = requests.Session.request
+
+    def request(self, method, url, *args, **kwargs):
+        if not _active():
+            return original(self, method, url, *args, **kwargs)
+        started = time.perf_counter()
+        status = None
+        try:
+            response = original(self, method, url, *args, **kwargs)
+            status = response.status_code
+            return response
+        finally:
+            ms = (time.perf_counter() - started) * 1000
+            for prof in _active():
+                prof._http(method, url, status, ms)
+
+    requests.Session.request = request
+
+
+def _hook_cache():
+    from django.core.cache import caches
+
+    for alias in caches:
+        backend_class = type(caches[alias])
+        if getattr(backend_class, '_profiling_hooked', False):
+            continue
+        for name in _CACHE_METHODS:
+            original = getattr(backend_class, name, None)
+            if original is None:
+                continue
+            setattr(backend_class, name, _counted(original))
+        backend_class._profiling_hooked = True
+
+
+def _counted(method):
+    def wrapper(self, *args, **kwargs):
+        stack = _active()
+        if stack:
+            # get_or_set() calls get()/add() on the same backend: count the outer call only
+            if getattr(_local, 'in_cache', False):
+                return method(self, *args, **kwargs)
+            _local.in_cache = True
+            for prof in stack:
+                prof.cache += 1
+            try:
+                return method(self, *args, **kwargs)
+            finally:
+                _local.in_cache = False
+        return method(self, *args, **kwargs)
+    wrapper.__name__ = method.__name__
+    wrapper.__doc__ = method.__doc__
+    return wrapper
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Route windows — Redis when available, in-process fallback otherwise
+# ═══════════════════════════════════════════════════════════════════
+
+class _RedisStore:
+
+    def __init__(self, conn):
+        self.conn = conn
+
+    def push(self, route, sample, window, trace=None, traces_kept=DEFAULT_TRACES_KEPT):
+        key = f'{KEY_PREFIX}:route:{route}'
+        pipe = self.conn.pipeline(transaction=False)
+        pipe.lpush(key, json.dumps(sample))
+        pipe.ltrim(key, 0, window - 1)
+        pipe.expire(key, ROUTE_TTL)
+        pipe.zadd(f'{KEY_PREFIX}:routes', {route: time.time()})
+        if trace is not None:
+            pipe.lpush(f'{KEY_PREFIX}:traces', json.dumps(trace))
+            pipe.ltrim(f'{KEY_PREFIX}:traces', 0, traces_kept - 1)
+        pipe.execute()
+
+    def routes(self):
+        cutoff = time.time() - ROUTE_TTL
+        self.conn.zremrangebyscore(f'{KEY_PREFIX}:routes', 0, cutoff)
+        return [r.decode() if isinstance(r, bytes) else r for r in self.conn.zrange(f'{KEY_PREFIX}:routes', 0, -1)]
+
+    def samples(self, route):
+        return [json.loads(s) for s in self.conn.lrange(f'{KEY_PREFIX}:route:{route}', 0, -1)]
+
+    def traces(self):
+        return [json.loads(t) for t in self.conn.lrange(f'{KEY_PREFIX}:traces', 0, -1)]
+
+    def reset(self):
+        keys = list(self.conn.scan_iter(f'{KEY_PREFIX}:*'))
+        if keys:
+            self.conn.delete(*keys)
+
+
+class _LocalStore:
+    """Same interface as _RedisStore, process-local (no Redis configured)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._routes = {}
+        self._traces = deque(maxlen=DEFAULT_TRACES_KEPT)
+
+    def push(self, route, sample, window, trace=None, traces_kept=DEFAULT_TRACES_KEPT):
+        with self._lock:
+            samples = self._routes.get(route)
+            if samples is None or samples.maxlen != window:
+                samples = self._routes[route] = deque(samples or (), maxlen=window)
+            samples.appendleft(sample)
+            if trace is not None:
+                if self._traces.maxlen != traces_kept:
+                    self._traces = deque(self._traces, maxlen=traces_kept)
+                self._traces.appendleft(trace)
+
+    def routes(self):
+        with self._lock:
+            return list(self._routes)
+
+    def samples(self, route):
+        with self._lock:
+            return list(self._routes.get(route, ()))
+
+    def traces(self):
+        with self._lock:
+            return list(self._traces)
+
+    def reset(self):
+        with self._lock:
+            self._routes.clear()
+            self._traces.clear()
+
+
+_store = None
+_fallback = None  # per-process state while a configured Redis is unreachable
+_store_lock = threading.Lock()
+_redis = RedisReconnector('Profiling')
+
+
+def _get_store():
+    global _store, _fallback
+    if _store is not None:
+        return _store
+    with _store_lock:
+        if _store is None:
+            if not redis_configured():
+                _store = _LocalStore()
+            else:
+                conn = _redis.connect()
+                if conn is None:
+                    if _fallback is None:
+                        _fallback = _LocalStore()
+                    return _fallback
+                _store = _RedisStore(conn)
+                _fallback = None
+    return _store
+
+
+def record(route, prof, status=None, path=''):
+    """File a finished profile under `route`; keep a trace if it was slow."""
+    summary = prof.summary()
+    sample = {k: summary[k] for k in ('ms', 'sql', 'sql_ms', 'duplicate_queries', 'cache', 'http_ms', 'llm_ms')}
+    sample['dups'] = [[d['fingerprint'], d['count'], d['sql'][:200]] for d in summary['duplicates'][:3]]
+    trace = None
+    if prof.total_ms >= _setting('PROFILING_SLOW_MS', DEFAULT_SLOW_MS):
+        trace = {**prof.trace(), 'route': route, 'path': path[:300], 'status': status,
+                 'at': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())}
+    try:
+        _get_store().push(route, sample, int(_setting('PROFILING_WINDOW', DEFAULT_WINDOW)), trace,
+                          int(_setting('PROFILING_TRACES_KEPT', DEFAULT_TRACES_KEPT)))
+    except Exception as e:
+        logger.warning(f"⚠️ Profiling sample for {route} not stored: {e}")
+
+
+def reset():
+    _get_store().reset()
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Reports
+# ═══════════════════════════════════════════════════════════════════
+
+def _percentile(values, pct):
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(pct / 100 * len(ordered)) - 1)]
+
+
+def route_stats(route=None):
+    """Per-route percentiles over each rolling window, slowest p95 first."""
+    store = _get_store()
+    result = []
+    for name in [route] if route else store.routes():
+        samples = store.samples(name)
+        if not samples:
+            continue
+        entry = {'route': name, 'samples': len(samples)}
+        for field in ('ms', 'sql', 'sql_ms', 'cache', 'http_ms', 'llm_ms'):
+            values = [s.get(field, 0) for s in samples]
+            entry[field] = {
+                'p50': _percentile(values, 50),
+                'p95': _percentile(values, 95),
+                'p99': _percentile(values, 99),
+                'max': max(values),
+            }
+        dup_counts = Counter()
+        dup_sql = {}
+        for s in samples:
+            for key, count, sql in s.get('dups', ()):
+                dup_counts[key] += 1
+                dup_sql[key] = (sql, max(count, dup_sql.get(key, ('', 0))[1]))
+        entry['duplicate_queries_avg'] = round(sum(s.get('duplicate_queries', 0) for s in samples) / len(samples), 1)
+        entry['repeated_statements'] = [
+            {'fingerprint': key, 'requests': n, 'max_repeats': dup_sql[key][1], 'sql': dup_sql[key][0]}
+            for key, n in dup_counts.most_common(TOP_QUERIES)
+        ]
+        result.append(entry)
+    result.sort(key=lambda e: -e['ms']['p95'])
+    return result
+
+
+def traces(route=None):
+    """Slow-request traces, newest first."""
+    found = _get_store().traces()
+    return [t for t in found if t.get('route') == route] if route else found
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Middleware
+# ═══════════════════════════════════════════════════════════════════
+
+class ProfilingMiddleware:
+    """
+    Profiles PROFILING_SAMPLE_RATE of requests (0 = off: one comparison per
+    request) and records them per URL route. Never fails a request.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.rate = float(_setting('PROFILING_SAMPLE_RATE', 0.0))
+
+    def __call__(self, request):
+        if not self.rate or random.random() >= self.rate:
+            return self.get_response(request)
+
+        with profile(request.path) as prof:
+            response = self.get_response(request)
+        try:
+            match = getattr(request, 'resolver_match', None)
+            route = (match.route or match.view_name) if match else '(unresolved)'
+            record(f'{request.method} /{route.lstrip("^")}', prof,
+                   status=getattr(response, 'status_code', None), path=request.path)
+        except Exception as e:
+            logger.warning(f"⚠️ Profiling failed for {request.path}: {e}")
+        return response
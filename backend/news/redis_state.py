@@ -0,0 +1,70 @@
+"""
+Redis connection for the cluster-wide state stores.
+
+The job scheduler (leases, run slots), the AI rate limiter (shared token
+buckets) and request profiling keep their state in Redis so that every
+web/Celery process sees the same numbers. Each has an in-process fallback
+for setups without Redis (DummyCache dev setups, tests).
+
+When Redis *is* configured but unreachable — a blip at boot, a failover —
+the fallback is only temporary: RedisReconnector retries with exponential
+backoff and logs a warning on every failed attempt, so a process doesn't
+stay on per-process state for the rest of its life.
+
+    _redis = RedisReconnector('AI rate limiter')
+
+    conn = _redis.connect()   # pinged connection, or None while degraded
+    _redis.degraded           # True while Redis is configured but down
+"""
+
+import logging
+import threading
+import time
+
+logger = logging.getLogger('news')
+
+RETRY_MIN_SECONDS = 5
+RETRY_MAX_SECONDS = 300
+
+
+def redis_configured():
+    """Whether the default cache (and so the shared state) lives in Redis."""
+    from django.conf import settings
+    backend = settings.CACHES.get('default', {}).get('BACKEND', '')
+    return 'redis' in backend.lower()
+
+
+class RedisReconnector:
+    """Connects to Redis on demand, backing off while it is unreachable."""
+
+    def __init__(self, label):
+        self.label = label
+        self.degraded = False
+        self._lock = threading.Lock()
+        self._delay = RETRY_MIN_SECONDS
+        self._next_try = 0.0
+
+    def connect(self):
+        """A pinged redis-py connection, or None until the next retry is due."""
+        with self._lock:
+            now = time.monotonic()
+            if now < self._next_try:
+                return None
+            try:
+                from django_redis import get_redis_connection
+                conn = get_redis_connection('default')
+                conn.ping()
+            except Exception as e:
+                self.degraded = True
+                self._next_try = now + self._delay
+                logger.warning(
+                    f"⚠️ {self.label}: Redis unreachable ({e}) — using per-process state, "
+                    f"retrying in {self._delay}s"
+                )
+                self._delay = min(self._delay * 2, RETRY_MAX_SECONDS)
+                return None
+            if self.degraded:
+                logger.info(f"✅ {self.label}: Redis reachable again")
+            self.degraded = False
+            self._delay = RETRY_MIN_SECONDS
+            return conn
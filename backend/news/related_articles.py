@@ -0,0 +1,347 @@
+"""
+Materialised related articles.
+
+The similar-articles endpoint used to cascade through four signals on every
+request (TF-IDF model → hybrid vector search → make/model → VehicleSpecs).
+They are now merged off-request into RelatedArticle rows:
+
+    compute_related(article)   → [(related_id, score, source)] from all signals
+    refresh_related(id)        → recompute one article and link it back into
+                                 its neighbours' sets
+    fallback_related(article)  → read-only ranking from the database signals,
+                                 served until the first refresh has run
+    refresh_stale(limit)       → scheduler job: never computed, edited since,
+                                 or older than MAX_AGE
+    staleness_stats()          → coverage / freshness numbers for monitoring
+
+The endpoint reads the rows with a single indexed query.
+"""
+import logging
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import Count, F, Max, Min, Q
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+MAX_RELATED = 15
+# Below this many candidates the same-category fallback is added
+MIN_RELATED = 6
+# Fully recompute sets older than this even if nothing changed
+MAX_AGE = timedelta(days=7)
+
+# Weight of each signal in the merged score; each signal yields a strength in [0, 1]
+SOURCE_WEIGHTS = {
+    'ml': 1.0,
+    'vector': 0.8,
+    'make_model': 0.6,
+    'specs': 0.4,
+    'category': 0.15,
+}
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Signals
+# ═══════════════════════════════════════════════════════════════════
+
+def _ml_candidates(article):
+    """TF-IDF similarity from the local content recommender."""
+    try:
+        from ai_engine.modules.content_recommender import find_similar, is_available
+        if not is_available():
+            return []
+        return [(s['id'], float(s['score'])) for s in find_similar(article.id, top_n=MAX_RELATED)]
+    except Exception as e:
+        logger.warning(f"[RELATED] ML similarity failed for {article.id}: {e}")
+        return []
+
+
+def _ranked(ids, floor=0.5):
+    """Rank-only signals: strength decays linearly from 1.0 to `floor`."""
+    ids = list(ids)
+    if not ids:
+        return []
+    step = (1.0 - floor) / max(len(ids) - 1, 1)
+    return [(aid, 1.0 - i * step) for i, aid in enumerate(ids)]
+
+
+def _vector_candidates(article):
+    """Hybrid BM25 + FAISS neighbours."""
+    try:
+        from ai_engine.modules.vector_search import get_vector_engine
+        similar = get_vector_engine().find_similar_articles_hybrid(article.id, k=MAX_RELATED)
+        return _ranked([s['article_id'] for s in similar], floor=0.3)
+    except Exception as e:
+        logger.warning(f"[RELATED] Hybrid vector search failed for {article.id}: {e}")
+        return []
+
+
+def _make_model_candidates(article):
+    """Same model (strength 1.0), then same make (0.6)."""
+    from news.models import CarSpecification
+    try:
+        car_spec = CarSpecification.objects.filter(article=article).first()
+        if not car_spec or not car_spec.make or car_spec.make == 'Not specified':
+            return []
+        published = {'article__is_published': True, 'article__is_deleted': False}
+        found = []
+        if car_spec.model and car_spec.model != 'Not specified':
+            same_model = CarSpecification.objects.filter(
+                make__iexact=car_spec.make, model__iexact=car_spec.model, **published
+            ).exclude(article_id=article.id).values_list('article_id', flat=True)[:5]
+            found.extend((aid, 1.0) for aid in same_model)
+        seen = {aid for aid, _ in found} | {article.id}
+        same_make = CarSpecification.objects.filter(
+            make__iexact=car_spec.make, **published
+        ).exclude(article_id__in=seen).values_list('article_id', flat=True)[:8]
+        found.extend((aid, 0.6) for aid in same_make)
+        return found
+    except Exception as e:
+        logger.warning(f"[RELATED] Make/model signal failed for {article.id}: {e}")
+        return []
+
+
+def _spec_candidates(article):
+    """VehicleSpecs neighbours: same body type, price ±30%, power ±40%."""
+    from news.models.vehicles import VehicleSpecs
+    try:
+        v_spec = VehicleSpecs.objects.filter(article=article).first()
+        if not v_spec:
+            return []
+        filters = {'article__is_published': True, 'article__is_deleted': False}
+        if v_spec.body_type:
+            filters['body_type'] = v_spec.body_type
+        if v_spec.price_from:
+            filters['price_from__gte'] = int(v_spec.price_from * 0.7)
+            filters['price_from__lte'] = int(v_spec.price_from * 1.3)
+        if v_spec.power_hp:
+            filters['power_hp__gte'] = int(v_spec.power_hp * 0.6)
+            filters['power_hp__lte'] = int(v_spec.power_hp * 1.4)
+        matches = VehicleSpecs.objects.filter(**filters).exclude(
+            article_id=article.id
+        ).order_by('-article__views').values_list('article_id', flat=True).distinct()[:10]
+        return _ranked(matches)
+    except Exception as e:
+        logger.warning(f"[RELATED] VehicleSpecs signal failed for {article.id}: {e}")
+        return []
+
+
+def _category_candidates(article, exclude):
+    """Most viewed articles in the same categories (fallback only)."""
+    from news.models import Article
+    try:
+        cat_ids = list(article.categories.values_list('id', flat=True))
+        if not cat_ids:
+            return []
+        same_cat = Article.objects.filter(
+            categories__id__in=cat_ids, is_published=True, is_deleted=False
+        ).exclude(id__in=exclude).order_by('-views').values_list('id', flat=True).distinct()[:10]
+        return _ranked(same_cat)
+    except Exception as e:
+        logger.warning(f"[RELATED] Category signal failed for {article.id}: {e}")
+        return []
+
+
+def merge_candidates(signals, exclude_id=None, limit=MAX_RELATED):
+    """
+    Merge {source: [(article_id, strength)]} into [(article_id, score, source)].
+
+    score = Σ weight(source) × strength; `source` is the signal that contributed
+    most. Sorted by score, best first.
+    """
+    totals = {}
+    best = {}
+    for source, candidates in signals.items():
+        weight = SOURCE_WEIGHTS[source]
+        seen = set()
+        for aid, strength in candidates:
+            if aid == exclude_id or aid in seen:
+                continue
+            seen.add(aid)
+            contribution = weight * max(0.0, min(float(strength), 1.0))
+            totals[aid] = totals.get(aid, 0.0) + contribution
+            if contribution > best.get(aid, (None, -1.0))[1]:
+                best[aid] = (source, contribution)
+    ranked = sorted(totals.items(), key=lambda kv: (-kv[1], kv[0]))[:limit]
+    return [(aid, round(score, 4), best[aid][0]) for aid, score in ranked]
+
+
+def compute_related(article):
+    """All signals for `article`, merged. Only published, non-deleted targets."""
+    from news.models import Article
+
+    signals = {
+        'ml': _ml_candidates(article),
+        'vector': _vector_candidates(article),
+        'make_model': _make_model_candidates(article),
+        'specs': _spec_candidates(article),
+    }
+    candidate_ids = {aid for candidates in signals.values() for aid, _ in candidates}
+    # ML/vector indexes can lag behind unpublish/delete — keep live targets only
+    live = set(Article.objects.filter(
+        id__in=candidate_ids, is_published=True, is_deleted=False
+    ).values_list('id', flat=True)) if candidate_ids else set()
+    live.discard(article.id)
+    signals = {
+        source: [(aid, s) for aid, s in candidates if aid in live]
+        for source, candidates in signals.items()
+    }
+    if len(live) < MIN_RELATED:
+        signals['category'] = _category_candidates(article, exclude=live | {article.id})
+    return merge_candidates(signals, exclude_id=article.id)
+
+
+def fallback_related(article):
+    """
+    Make/model, VehicleSpecs and same-category candidates, merged — database
+    queries only (no ML model, no embedding calls) and nothing stored. Served
+    while an article's set has never been computed.
+    """
+    signals = {
+        'make_model': _make_model_candidates(article),
+        'specs': _spec_candidates(article),
+    }
+    found = {aid for candidates in signals.values() for aid, _ in candidates}
+    if len(found) < MIN_RELATED:
+        signals['category'] = _category_candidates(article, exclude=found | {article.id})
+    return merge_candidates(signals, exclude_id=article.id)
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Storage
+# ═══════════════════════════════════════════════════════════════════
+
+def _store(article_id, related, computed_at):
+    from news.models import Article, RelatedArticle
+
+    with transaction.atomic():
+        RelatedArticle.objects.filter(article_id=article_id).delete()
+        RelatedArticle.objects.bulk_create([
+            RelatedArticle(article_id=article_id, related_id=rid, score=score, source=source)
+            for rid, score, source in related
+        ])
+        # .update() — no updated_at bump, no post_save
+        Article.objects.filter(id=article_id).update(related_computed_at=computed_at)
+
+
+def _link_back(article_id, related):
+    """
+    Insert `article_id` into each neighbour's set (similarity is symmetric),
+    keeping every set at MAX_RELATED — new articles show up on their
+    neighbours' pages without recomputing them.
+    """
+    from news.models import RelatedArticle
+
+    if not related:
+        return
+    RelatedArticle.objects.bulk_create(
+        [RelatedArticle(article_id=rid, related_id=article_id, score=score, source=source)
+         for rid, score, source in related],
+        update_conflicts=True,
+        unique_fields=['article', 'related'],
+        update_fields=['score', 'source', 'computed_at'],
+    )
+    for rid, _, _ in related:
+        overflow = list(RelatedArticle.objects.filter(article_id=rid)
+                        .order_by('-score', 'related_id')
+                        .values_list('id', flat=True)[MAX_RELATED:])
+        if overflow:
+            RelatedArticle.objects.filter(id__in=overflow).delete()
+
+
+def refresh_related(article_id, link_back=True):
+    """Recompute and store the related set of one article. Returns the new set."""
+    from news.models import Article
+
+    article = Article.objects.filter(id=article_id).first()
+    if article is None:
+        return []
+    if not article.is_published or article.is_deleted:
+        remove_article(article_id)
+        return []
+    started = timezone.now()
+    related = compute_related(article)
+    _store(article_id, related, started)
+    if link_back:
+        _link_back(article_id, related)
+    logger.debug(f"[RELATED] {article_id}: {len(related)} related articles")
+    return related
+
+
+def remove_article(article_id):
+    """Drop an unpublished/deleted article from every related set."""
+    from news.models import RelatedArticle
+    RelatedArticle.objects.filter(Q(article_id=article_id) | Q(related_id=article_id)).delete()
+
+
+def _stale_queryset(now=None):
+    from news.models import Article
+    now = now or timezone.now()
+    return Article.objects.filter(is_published=True, is_deleted=False).filter(
+        Q(related_computed_at__isnull=True)
+        | Q(updated_at__gt=F('related_computed_at'))
+        | Q(related_computed_at__lt=now - MAX_AGE)
+    )
+
+
+def refresh_stale(limit=200):
+    """
+    Refresh up to `limit` stale sets: never computed first, then the longest
+    out of date. Returns {'refreshed', 'failed', 'remaining'}.
+    """
+    ids = list(
+        _stale_queryset()
+        .order_by(F('related_computed_at').asc(nulls_first=True), '-updated_at')
+        .values_list('id', flat=True)[:limit]
+    )
+    refreshed = failed = 0
+    for article_id in ids:
+        try:
+            refresh_related(article_id)
+            refreshed += 1
+        except Exception as e:
+            failed += 1
+            logger.warning(f"[RELATED] Refresh failed for {article_id}: {e}")
+    remaining = _stale_queryset().count() if ids else 0
+    return {'refreshed': refreshed, 'failed': failed, 'remaining': remaining}
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Metrics
+# ═══════════════════════════════════════════════════════════════════
+
+def staleness_stats():
+    """
+    Coverage and freshness of the materialised table:
+    published, computed, never_computed, edited_since, expired, stale,
+    rows, oldest_age_hours, newest_age_hours.
+    """
+    from news.models import Article, RelatedArticle
+
+    now = timezone.now()
+    agg = Article.objects.filter(is_published=True, is_deleted=False).aggregate(
+        published=Count('id'),
+        never_computed=Count('id', filter=Q(related_computed_at__isnull=True)),
+        edited_since=Count('id', filter=Q(updated_at__gt=F('related_computed_at'))),
+        expired=Count('id', filter=Q(related_computed_at__lt=now - MAX_AGE)),
+        oldest=Min('related_computed_at'),
+        newest=Max('related_computed_at'),
+    )
+    stale = _stale_queryset(now).count()
+
+    def _age(ts):
+        return round((now - ts).total_seconds() / 3600, 1) if ts else None
+
+    return {
+        'published': agg['published'],
+        'computed': agg['published'] - agg['never_computed'],
+        'never_computed': agg['never_computed'],
+        'edited_since': agg['edited_since'],
+        'expired': agg['expired'],
+        'stale': stale,
+        'stale_pct': round(100 * stale / agg['published'], 1) if agg['published'] else 0.0,
+        'rows': RelatedArticle.objects.count(),
+        'oldest_age_hours': _age(agg['oldest']),
+        'newest_age_hours': _age(agg['newest']),
+    }
@@ -0,0 +1,336 @@
+"""
+Background bulk generation of PendingArticles from RSS news items.
+
+POST /rss-news-items/bulk_generate/ used to expand up to 10 press releases
+one after another inside the request — a minute or more per item, against
+proxy timeouts. It now claims the items, starts a job and returns its id:
+
+    job_id = start_bulk_generation(item_ids, provider)
+
+The job runs in a daemon thread (like the YouTube/video-inbox generators)
+and fans the items out over RSS_BULK_GENERATE_WORKERS threads. Before each
+item it waits until at least one model of the cascade the press-release
+expansion uses is under its soft limit (ai_provider._check_rate_limit), so
+a large batch slows down instead of burning through every model and failing.
+
+Each PendingArticle is created as soon as its item finishes. Progress goes
+to the usual channels:
+    gen_task:<job_id>      job status in the cache — polled by bulk_generate_status
+    generation_<job_id>    WebSocket group, one message per item started/finished
+
+A deploy or restart kills the thread mid-job. While it runs, the job
+refreshes a heartbeat in its status and in its items' generating_since;
+get_job() reports a job whose heartbeat stopped as 'error', and the
+scheduler's release_stale_claims() puts its abandoned items back to 'new'.
+"""
+
+import json
+import logging
+import re
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WORKERS = 3
+JOB_TTL = 3600  # seconds the job status stays readable
+RATE_LIMIT_WAIT_SECONDS = 300  # give up on an item after waiting this long for quota
+RATE_LIMIT_POLL_SECONDS = 5
+HEARTBEAT_SECONDS = 30
+STALE_JOB_SECONDS = 120  # a 'running' job without a heartbeat this long is dead
+STALE_CLAIM_SECONDS = 15 * 60  # claims not refreshed this long are released
+
+ELIGIBLE_STATUSES = ('new', 'read')
+
+
+def _job_key(job_id):
+    return f'gen_task:{job_id}'
+
+
+def get_job(job_id):
+    """Job status dict, or None when unknown/expired. A dead job reads as 'error'."""
+    from django.core.cache import cache
+    raw = cache.get(_job_key(job_id))
+    if not raw:
+        return None
+    job = json.loads(raw)
+    if job['status'] == 'running' and time.time() - job.get('heartbeat', 0) > STALE_JOB_SECONDS:
+        job['status'] = 'error'
+        job['error'] = 'Job stopped (server restart?) — unfinished items are released for retry'
+    return job
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Rate limits
+# ═══════════════════════════════════════════════════════════════════
+
+def _cascade(provider):
+    """Models generate_completion() will try for press-release expansion."""
+    if provider != 'gemini':
+        return []
+    from ai_engine.modules.ai_provider import PRO_MODELS
+    return PRO_MODELS
+
+
+def wait_for_capacity(provider, timeout=RATE_LIMIT_WAIT_SECONDS, poll=RATE_LIMIT_POLL_SECONDS):
+    """
+    Block until some model in the provider's cascade is under its rate limit.
+    False if none frees up within `timeout`.
+    """
+    from news.batch_runner import wait_for_models
+    return wait_for_models(_cascade(provider), timeout, poll)
+
+
+# ═══════════════════════════════════════════════════════════════════
+# One item
+# ═══════════════════════════════════════════════════════════════════
+
+def generate_pending_article(item, provider):
+    """
+    Expand one RSS item into a PendingArticle and mark the item generated.
+
+    Returns the result dict reported to the admin; raises on AI/DB errors
+    (the caller resets the item).
+    """
+    from news.models import PendingArticle
+    from ai_engine.modules.article_generator import expand_press_release
+    from ai_engine.main import extract_title, validate_title, _is_generic_header
+
+    plain_text = re.sub(r'<[^>]+>', '', item.content).strip()
+    if not plain_text:
+        plain_text = item.excerpt
+
+    expanded_content = expand_press_release(
+        press_release_text=plain_text,
+        source_url=item.source_url,
+        provider=provider,
+        source_title=item.title,
+    )
+
+    ai_title = extract_title(expanded_content)
+    if not ai_title or _is_generic_header(ai_title):
+        ai_title = item.title
+    ai_title = validate_title(ai_title)
+
+    word_count = len(re.sub(r'<[^>]+>', '', expanded_content).split())
+    if word_count < 200:
+        item.status = 'new'
+        item.save(update_fields=['status'])
+        return {'id': item.id, 'success': False, 'error': f'Too short ({word_count} words)'}
+
+    # Build images based on feed's image policy
+    feed = item.rss_feed
+    image_policy = feed.image_policy if feed else 'pexels_fallback'
+
+    if image_policy == 'pexels_only':
+        images = []
+        featured_image = ''
+        img_source = 'pexels'
+    else:
+        images = [item.image_url] if item.image_url else []
+        featured_image = item.image_url or ''
+        img_source = 'rss_original' if images else 'unknown'
+
+    pending = PendingArticle.objects.create(
+        rss_feed=feed,
+        source_url=item.source_url,
+        content_hash=item.content_hash,
+        title=ai_title,
+        content=expanded_content,
+        excerpt=plain_text[:500],
+        images=images,
+        featured_image=featured_image,
+        image_source=img_source,
+        suggested_category=feed.default_category if feed else None,
+        status='pending',
+    )
+
+    item.status = 'generated'
+    item.pending_article = pending
+    item.save(update_fields=['status', 'pending_article'])
+    return {'id': item.id, 'success': True, 'title': ai_title, 'pending_id': pending.id}
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Job
+# ═══════════════════════════════════════════════════════════════════
+
+def claim_items(item_ids):
+    """Move eligible items to 'generating'; returns the ids this call claimed."""
+    from django.utils import timezone
+    from news.models import RSSNewsItem
+    claimed = []
+    for item_id in item_ids:
+        # Conditional per-row update — a concurrent job can't claim the same item
+        if RSSNewsItem.objects.filter(id=item_id, status__in=ELIGIBLE_STATUSES).update(
+                status='generating', generating_since=timezone.now()):
+            claimed.append(item_id)
+    return claimed
+
+
+def release_stale_claims(max_age=STALE_CLAIM_SECONDS):
+    """
+    Put items claimed by a job that died (deploy/restart mid-job) back to 'new'.
+
+    Only bulk-generation claims carry generating_since; items the RSS scan
+    auto-queued (status 'generating' with a pending article) are left alone.
+    Returns the number of items released.
+    """
+    from datetime import timedelta
+    from django.utils import timezone
+    from news.models import RSSNewsItem
+    return RSSNewsItem.objects.filter(
+        status='generating',
+        pending_article__isnull=True,
+        generating_since__lt=timezone.now() - timedelta(seconds=max_age),
+    ).update(status='new', generating_since=None)
+
+
+def _load_item(item_id):
+    from news.models import RSSNewsItem
+    return RSSNewsItem.objects.select_related('rss_feed').get(id=item_id)
+
+
+def _reset_item(item_id):
+    from news.models import RSSNewsItem
+    RSSNewsItem.objects.filter(id=item_id, status='generating').update(status='new', generating_since=None)
+
+
+class BulkGenerationJob:
+    """Generates the claimed items concurrently and publishes progress."""
+
+    def __init__(self, job_id, item_ids, provider, workers=DEFAULT_WORKERS):
+        self.job_id = job_id
+        self.item_ids = list(item_ids)
+        self.provider = provider
+        self.workers = max(1, workers)
+        self.state = {
+            'status': 'running',
+            'total': len(self.item_ids),
+            'done': 0,
+            'generated': 0,
+            'failed': 0,
+            'progress': 0,
+            'message': 'Queued',
+            'items': {str(item_id): {'status': 'queued'} for item_id in self.item_ids},
+            'results': [],
+        }
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+
+    def run(self):
+        from django.db import close_old_connections
+        close_old_connections()
+        self._publish()
+        threading.Thread(target=self._heartbeat, name=f'rss-bulk-hb-{self.job_id[:8]}', daemon=True).start()
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='rss-bulk') as pool:
+                list(pool.map(self._process, self.item_ids))
+            with self._lock:
+                self.state['status'] = 'done'
+                self.state['message'] = f"{self.state['generated']} generated, {self.state['failed']} failed"
+            logger.info(f"📰 Bulk generation {self.job_id}: {self.state['message']}")
+        except Exception as e:
+            logger.error(f"❌ Bulk generation {self.job_id} failed: {e}", exc_info=True)
+            with self._lock:
+                self.state['status'] = 'error'
+                self.state['error'] = str(e)[:500]
+        finally:
+            self._stopped.set()
+            self._publish()
+            close_old_connections()
+
+    def _heartbeat(self):
+        """Keep the status and the item claims fresh while items take minutes each."""
+        from django.db import connection
+        from django.utils import timezone
+        from news.models import RSSNewsItem
+        try:
+            while not self._stopped.wait(HEARTBEAT_SECONDS):
+                self._publish()
+                try:
+                    RSSNewsItem.objects.filter(id__in=self.item_ids, status='generating').update(
+                        generating_since=timezone.now())
+                except Exception as e:
+                    logger.warning(f"⚠️ Bulk generation {self.job_id}: claims not refreshed: {e}")
+        finally:
+            connection.close()
+
+    def _process(self, item_id):
+        from django.db import connection
+        try:
+            if not wait_for_capacity(self.provider):
+                _reset_item(item_id)
+                self._finish({'id': item_id, 'success': False, 'error': 'AI rate limit — try again later'})
+                return
+            item = _load_item(item_id)
+            self._update_item(item_id, {'status': 'generating', 'title': item.title},
+                              f'Generating: {item.title[:80]}')
+            try:
+                result = generate_pending_article(item, self.provider)
+            except Exception as e:
+                logger.error(f'Bulk generate failed for item {item_id}: {e}', exc_info=True)
+                _reset_item(item_id)
+                result = {'id': item_id, 'success': False, 'error': str(e)[:200]}
+            self._finish(result)
+        except Exception as e:  # item vanished, DB down, ...
+            logger.error(f'Bulk generate failed for item {item_id}: {e}', exc_info=True)
+            self._finish({'id': item_id, 'success': False, 'error': str(e)[:200]})
+        finally:
+            connection.close()  # pool threads end with the job
+
+    def _update_item(self, item_id, item_state, message):
+        with self._lock:
+            self.state['items'][str(item_id)].update(item_state)
+            self.state['message'] = message
+            done, progress = self.state['done'], self.state['progress']
+        self._publish()
+        self._send(done, progress, message)
+
+    def _finish(self, result):
+        with self._lock:
+            state = self.state
+            state['results'].append(result)
+            state['done'] += 1
+            state['generated' if result['success'] else 'failed'] += 1
+            state['progress'] = int(state['done'] * 100 / state['total'])
+            item_state = {'status': 'generated' if result['success'] else 'failed'}
+            item_state.update({k: v for k, v in result.items() if k not in ('id', 'success')})
+            state['items'][str(result['id'])].update(item_state)
+            if result['success']:
+                state['message'] = f"Generated: {result['title'][:80]}"
+            else:
+                state['message'] = f"Item {result['id']} failed: {result['error']}"
+            done, progress, message = state['done'], state['progress'], state['message']
+        self._publish()
+        self._send(done, progress, message)
+
+    def _send(self, step, progress, message):
+        from ai_engine.modules.generation_progress import _send_progress
+        _send_progress(self.job_id, step, progress, message)
+
+    def _publish(self):
+        from django.core.cache import cache
+        with self._lock:
+            self.state['heartbeat'] = time.time()
+            payload = json.dumps(self.state)
+        try:
+            cache.set(_job_key(self.job_id), payload, timeout=JOB_TTL)
+        except Exception as e:
+            logger.warning(f"⚠️ Bulk generation {self.job_id}: status not cached: {e}")
+
+
+def start_bulk_generation(item_ids, provider):
+    """Start a background job for the already-claimed `item_ids`; returns its id."""
+    from django.conf import settings
+    job = BulkGenerationJob(
+        job_id=str(uuid.uuid4()),
+        item_ids=item_ids,
+        provider=provider,
+        workers=getattr(settings, 'RSS_BULK_GENERATE_WORKERS', DEFAULT_WORKERS),
+    )
+    job._publish()  # pollable before the thread gets going
+    threading.Thread(target=job.run, name=f'rss-bulk-{job.job_id[:8]}', daemon=True).start()
+    return job.job_id
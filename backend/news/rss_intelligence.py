@@ -14,7 +14,7 @@ from collections import Counter
 from django.utils import timezone
 from django.utils.text import slugify
 
-from news.auto_tags import KNOWN_BRANDS, BRAND_DISPLAY_NAMES
+from news.auto_tags import BRAND_DISPLAY_NAMES
 
 logger = logging.getLogger(__name__)
 
@@ -119,25 +119,25 @@ def extract_brands_from_title(title: str) -> list[dict]:
     title_lower = title.lower()
     results = []
     
-    # Sort by length descending to match "li auto" before "li", "land rover" before "land"
-    sorted_brands = sorted(KNOWN_BRANDS, key=len, reverse=True)
+    # First occurrence of every brand in one automaton pass
+    from ai_engine.modules.phrase_matcher import get_vocabulary
+    first_seen = {}
+    for match in get_vocabulary('known_brands').find_all(title_lower, overlapping=True):
+        first_seen.setdefault(match.value, (match.start, match.end))
+
+    # Longest first to match "li auto" before "li", "land rover" before "land"
     matched_positions = set()  # Avoid overlapping matches
-    
-    for brand in sorted_brands:
-        pattern = rf'\b{re.escape(brand)}\b'
-        match = re.search(pattern, title_lower)
-        if match:
-            start, end = match.start(), match.end()
-            # Skip if this position already claimed by a longer brand
-            if any(start >= ms and start < me for ms, me in matched_positions):
-                continue
-            matched_positions.add((start, end))
-            display = BRAND_DISPLAY_NAMES.get(brand, brand.title())
-            results.append({
-                'brand_key': brand,
-                'display_name': display,
-                'position': start,
-            })
+    for brand, (start, end) in sorted(first_seen.items(), key=lambda kv: (-len(kv[0]), kv[1][0])):
+        # Skip if this position already claimed by a longer brand
+        if any(start >= ms and start < me for ms, me in matched_positions):
+            continue
+        matched_positions.add((start, end))
+        display = BRAND_DISPLAY_NAMES.get(brand, brand.title())
+        results.append({
+            'brand_key': brand,
+            'display_name': display,
+            'position': start,
+        })
     
     return results
 
@@ -277,51 +277,157 @@ def process_rss_intelligence(queryset=None, dry_run=False):
 # Feature 3: Trending Topics
 # ============================================================
 
-def get_trending_brands(days: int = 7, min_mentions: int = 2) -> list[dict]:
+TOPIC_PATTERNS = {
+    'EV': r'\belectric\b|\bev\b|\bbev\b',
+    'Hybrid': r'\bhybrid\b',
+    'PHEV': r'\bphev\b|\bplug-in hybrid\b',
+    'Hydrogen': r'\bhydrogen\b',
+    'SUV': r'\bsuv\b',
+    'Sedan': r'\bsedan\b',
+    'Crossover': r'\bcrossover\b',
+    'Autonomous': r'\bautonomous\b|\bself-driving\b',
+    'Recall': r'\brecall\b',
+    'Price Cut': r'\bprice cut\b|\bprice drop\b',
+    'New Model': r'\bnew model\b|\ball-new\b|\ball new\b',
+    'Fast Charging': r'\bfast charg\b',
+    'Safety': r'\bsafety\b|\bcrash test\b',
+    'Sales': r'\bsales\b|\bdeliveries\b',
+}
+_TOPIC_RES = [(topic, re.compile(pattern)) for topic, pattern in TOPIC_PATTERNS.items()]
+
+
+def extract_topics_from_title(title: str) -> list[str]:
+    """Topic labels (EV, SUV, Recall, ...) mentioned in an RSS title."""
+    if not title:
+        return []
+    title_lower = title.lower()
+    return [topic for topic, pattern in _TOPIC_RES if pattern.search(title_lower)]
+
+
+# Mentions are counted once, when an item is ingested, into hourly
+# RSSMentionBucket rows; trending reads sum buckets (one aggregate query)
+# instead of re-extracting brands from every title in the window.
+
+def _hour(dt):
+    return dt.replace(minute=0, second=0, microsecond=0)
+
+
+def count_mentions(items) -> Counter:
+    """Counter of (kind, name, hour) over (title, created_at) pairs."""
+    counts = Counter()
+    for title, created_at in items:
+        hour = _hour(created_at)
+        for brand_info in extract_brands_from_title(title):
+            counts[('brand', brand_info['display_name'][:100], hour)] += 1
+        for topic in extract_topics_from_title(title):
+            counts[('topic', topic, hour)] += 1
+    return counts
+
+
+def _add_to_buckets(counts: Counter):
+    from django.db import IntegrityError, transaction
+    from django.db.models import F
+    from news.models import RSSMentionBucket
+
+    for (kind, name, hour), n in counts.items():
+        bucket = RSSMentionBucket.objects.filter(kind=kind, name=name, hour=hour)
+        if bucket.update(count=F('count') + n):
+            continue
+        try:
+            with transaction.atomic():
+                RSSMentionBucket.objects.create(kind=kind, name=name, hour=hour, count=n)
+        except IntegrityError:  # created by a concurrent scan in between
+            bucket.update(count=F('count') + n)
+
+
+def record_mentions(title: str, created_at=None):
+    """Count one ingested item's brand/topic mentions. Never raises."""
+    try:
+        _add_to_buckets(count_mentions([(title, created_at or timezone.now())]))
+    except Exception as e:
+        logger.warning(f"⚠️ Mention counting failed for '{title[:50]}': {e}")
+
+
+def rebuild_mention_buckets(since=None, chunk_size=2000) -> dict:
     """
-    Get trending brands from RSS news items in the last N days.
+    Recount buckets from stored RSSNewsItems created at or after `since`
+    (all of them when None), creating missing buckets and raising ones that
+    are short. Buckets are never lowered or deleted: cleanup_old removes
+    new/read items after a few days, and the hours they were in keep the
+    counts recorded at ingest. Running it twice gives the same counts.
+    """
+    from django.db import transaction
+    from news.models import RSSMentionBucket, RSSNewsItem
+
+    items = RSSNewsItem.objects.order_by()
+    if since is not None:
+        items = items.filter(created_at__gte=_hour(since))
+
+    rows = items.values_list('title', 'created_at')
+    counts = count_mentions(rows.iterator(chunk_size=chunk_size))
+    existing = {}
+    if counts:
+        first_hour = min(hour for _, _, hour in counts)
+        for pk, kind, name, hour, n in (RSSMentionBucket.objects.filter(hour__gte=first_hour)
+                                        .values_list('pk', 'kind', 'name', 'hour', 'count')
+                                        .iterator(chunk_size=chunk_size)):
+            existing[(kind, name, hour)] = (pk, n)
+
+    raised = 0
+    with transaction.atomic():
+        RSSMentionBucket.objects.bulk_create(
+            [RSSMentionBucket(kind=kind, name=name, hour=hour, count=n)
+             for (kind, name, hour), n in counts.items() if (kind, name, hour) not in existing],
+            batch_size=chunk_size,
+        )
+        for key, n in counts.items():
+            pk, current = existing.get(key, (None, n))
+            if current < n:
+                # Conditional, so a concurrent ingest increment isn't overwritten by a lower value
+                raised += RSSMentionBucket.objects.filter(pk=pk, count__lt=n).update(count=n)
+    return {
+        'items': rows.count(),
+        'buckets_created': sum(1 for key in counts if key not in existing),
+        'buckets_raised': raised,
+        'mentions': sum(counts.values()),
+    }
+
+
+def _window_counts(kind: str, days: float, until=None) -> dict:
+    """{name: (count in the last `days`, count in the `days` before)}."""
+    from django.db.models import Q, Sum
+    from news.models import RSSMentionBucket
+
+    until = until or timezone.now()
+    current_start = _hour(until - timedelta(days=days))
+    previous_start = _hour(current_start - timedelta(days=days))
+    rows = (
+        RSSMentionBucket.objects
+        .filter(kind=kind, hour__gte=previous_start, hour__lte=until)
+        .values('name')
+        .annotate(
+            current=Sum('count', filter=Q(hour__gte=current_start)),
+            previous=Sum('count', filter=Q(hour__lt=current_start)),
+        )
+    )
+    return {row['name']: (row['current'] or 0, row['previous'] or 0) for row in rows}
+
+
+def get_trending_brands(days: float = 7, min_mentions: int = 2, until=None) -> list[dict]:
+    """
+    Get trending brands from RSS news items in the `days` before `until`
+    (default now).
     
     Returns sorted list:
       [{'brand': 'Tesla', 'count': 42, 'velocity': 2.1, 'rank': 1}, ...]
     
     velocity = mentions this period / mentions previous period
     """
-    from news.models import RSSNewsItem
-    
-    now = timezone.now()
-    current_start = now - timedelta(days=days)
-    previous_start = current_start - timedelta(days=days)
-    
-    # Current period
-    current_items = RSSNewsItem.objects.filter(
-        created_at__gte=current_start,
-    ).values_list('title', flat=True)
-    
-    current_counts = Counter()
-    for title in current_items:
-        for brand_info in extract_brands_from_title(title):
-            current_counts[brand_info['display_name']] += 1
-    
-    # Previous period (for velocity calculation)
-    previous_items = RSSNewsItem.objects.filter(
-        created_at__gte=previous_start,
-        created_at__lt=current_start,
-    ).values_list('title', flat=True)
-    
-    previous_counts = Counter()
-    for title in previous_items:
-        for brand_info in extract_brands_from_title(title):
-            previous_counts[brand_info['display_name']] += 1
-    
-    # Build trending list
     trending = []
-    for brand, count in current_counts.most_common():
+    for brand, (count, prev) in _window_counts('brand', days, until).items():
         if count < min_mentions:
             continue
-        
-        prev = previous_counts.get(brand, 0)
         velocity = round(count / prev, 1) if prev > 0 else None  # None = "new this period"
-        
         trending.append({
             'brand': brand,
             'count': count,
@@ -331,7 +437,7 @@ def get_trending_brands(days: int = 7, min_mentions: int = 2) -> list[dict]:
         })
     
     # Sort by count descending
-    trending.sort(key=lambda x: x['count'], reverse=True)
+    trending.sort(key=lambda x: (-x['count'], x['brand']))
     
     # Add rank
     for i, item in enumerate(trending, 1):
@@ -340,48 +446,18 @@ def get_trending_brands(days: int = 7, min_mentions: int = 2) -> list[dict]:
     return trending
 
 
-def get_trending_topics(days: int = 7, min_mentions: int = 3) -> list[dict]:
+def get_trending_topics(days: float = 7, min_mentions: int = 3, until=None) -> list[dict]:
     """
     Get trending topics (non-brand) from RSS titles.
     Extracts fuel types, body types, tech keywords.
     
     Returns: [{'topic': 'EV', 'group': 'Fuel Types', 'count': 15}, ...]
     """
-    from news.models import RSSNewsItem
-    from news.auto_tags import TAG_ALIASES, TAG_GROUP_MAP
-    
-    cutoff = timezone.now() - timedelta(days=days)
-    titles = RSSNewsItem.objects.filter(
-        created_at__gte=cutoff,
-    ).values_list('title', flat=True)
-    
-    topic_counts = Counter()
-    
-    topic_patterns = {
-        r'\belectric\b|\bev\b|\bbev\b': 'EV',
-        r'\bhybrid\b': 'Hybrid',
-        r'\bphev\b|\bplug-in hybrid\b': 'PHEV',
-        r'\bhydrogen\b': 'Hydrogen',
-        r'\bsuv\b': 'SUV',
-        r'\bsedan\b': 'Sedan',
-        r'\bcrossover\b': 'Crossover',
-        r'\bautonomous\b|\bself-driving\b': 'Autonomous',
-        r'\brecall\b': 'Recall',
-        r'\bprice cut\b|\bprice drop\b': 'Price Cut',
-        r'\bnew model\b|\ball-new\b|\ball new\b': 'New Model',
-        r'\bfast charg\b': 'Fast Charging',
-        r'\bsafety\b|\bcrash test\b': 'Safety',
-        r'\bsales\b|\bdeliveries\b': 'Sales',
-    }
-    
-    for title in titles:
-        title_lower = title.lower()
-        for pattern, topic in topic_patterns.items():
-            if re.search(pattern, title_lower):
-                topic_counts[topic] += 1
+    from news.auto_tags import TAG_GROUP_MAP
     
+    counts = _window_counts('topic', days, until)
     results = []
-    for topic, count in topic_counts.most_common():
+    for topic, (count, _) in sorted(counts.items(), key=lambda kv: (-kv[1][0], kv[0])):
         if count < min_mentions:
             continue
         group = TAG_GROUP_MAP.get(topic, 'Topics')
@@ -450,13 +526,16 @@ def check_semantic_duplicates(text: str, threshold: float = 0.85, max_results: i
             return []
         
         # Load recent article embeddings (limit to last 500 for performance)
-        embeddings = ArticleEmbedding.objects.select_related('article').order_by(
-            '-article__created_at'
-        )[:500]
+        embeddings = ArticleEmbedding.objects.select_related('article').only(
+            'article', 'article__title', 'article__slug', 'embedding_vector',
+            'vector_data', 'vector_dtype', 'vector_dim', 'vector_scale',
+        ).order_by('-article__created_at')[:500]
         
         similar = []
         for emb in embeddings:
-            stored_vec = np.array(emb.embedding_vector, dtype=np.float32)
+            stored_vec = emb.get_vector()
+            if stored_vec is None:
+                continue
             stored_norm = np.linalg.norm(stored_vec)
             if stored_norm == 0:
                 continue
@@ -1,6 +1,9 @@
 """
-Lightweight background scheduler for periodic tasks.
-Runs inside the Django process — no separate services needed.
+Periodic background jobs (RSS/YouTube scans, auto-publish, backups, ...).
+
+Job bodies live here; timing, leader election and overlap prevention are
+handled by news.job_scheduler. Each ``_schedule_*`` helper records the next
+run time for its job instead of starting a threading.Timer.
 """
 import threading
 import logging
@@ -8,6 +11,8 @@ import os
 
 from django.db.models import F
 
+from news import job_scheduler
+
 logger = logging.getLogger('news')
 
 # Interval: 6 hours in seconds
@@ -22,9 +27,22 @@ SCHEDULED_PUBLISH_INTERVAL = 60
 DISABLED_CHECK_INTERVAL = 60  # Check again in 60s if disabled
 # DB backup: once every 24 hours
 DB_BACKUP_INTERVAL = 24 * 60 * 60
-
-# Track which tasks were already triggered by recovery to prevent double-fire
-_recovery_triggered = set()
+# A/B lifecycle cleanup: daily
+AB_LIFECYCLE_INTERVAL = 24 * 60 * 60
+# Stale error auto-resolve: every 6 hours
+STALE_ERROR_CLEANUP_INTERVAL = 6 * 60 * 60
+# System Graph dashboard cache refresh
+SYSTEM_GRAPH_CACHE_INTERVAL = 60
+# Materialised related articles: refresh stale sets every 15 minutes
+RELATED_ARTICLES_INTERVAL = 15 * 60
+RELATED_ARTICLES_BATCH = 200
+
+# Image renditions sweep: stored images without an ImageAsset (news/image_pipeline.py)
+IMAGE_PIPELINE_INTERVAL = 10 * 60
+IMAGE_PIPELINE_BATCH = 50
+
+# RSS bulk generation: release items held by jobs that died mid-run (news/rss_bulk_generation.py)
+RSS_CLAIMS_SWEEP_INTERVAL = 10 * 60
 
 # Cache key for scheduler heartbeat — System Graph reads this to verify scheduler is alive
 SCHEDULER_HEARTBEAT_KEY = 'scheduler:heartbeat'
@@ -114,9 +132,7 @@ def _run_gsc_sync():
 
 def _schedule_gsc_sync():
     """Schedule the next GSC sync run."""
-    timer = threading.Timer(GSC_SYNC_INTERVAL, _run_gsc_sync)
-    timer.daemon = True
-    timer.start()
+    job_scheduler.schedule_next('gsc_sync', GSC_SYNC_INTERVAL)
 
 
 def _run_currency_update():
@@ -143,9 +159,7 @@ def _run_currency_update():
 
 def _schedule_currency_update():
     """Schedule the next currency rate update."""
-    timer = threading.Timer(CURRENCY_UPDATE_INTERVAL, _run_currency_update)
-    timer.daemon = True
-    timer.start()
+    job_scheduler.schedule_next('currency_update', CURRENCY_UPDATE_INTERVAL)
 
 
 # =============================================================================
@@ -237,9 +251,7 @@ def _run_rss_scan():
 
 def _schedule_rss_scan(interval_seconds):
     """Schedule the next RSS scan."""
-    timer = threading.Timer(interval_seconds, _run_rss_scan)
-    timer.daemon = True
-    timer.start()
+    job_scheduler.schedule_next('rss_scan', interval_seconds)
 
 
 def _run_youtube_scan():
@@ -247,9 +259,8 @@ def _run_youtube_scan():
     from django.db import close_old_connections
     close_old_connections()
     try:
-        from news.models import AutomationSettings, YouTubeChannel, PendingArticle, Article
-        from ai_engine.modules.youtube_client import YouTubeClient
-        from ai_engine.main import create_pending_article
+        from news.models import AutomationSettings, YouTubeChannel
+        from ai_engine.modules.youtube_client import YouTubeClient, QuotaBudget
         from django.utils import timezone
         
         settings = AutomationSettings.load()
@@ -292,7 +303,7 @@ def _run_youtube_scan():
         logger.info("[SCHEDULER/YOUTUBE] 🎬 Auto YouTube scan starting...")
         
         try:
-            client = YouTubeClient()
+            client = YouTubeClient(quota_budget=QuotaBudget(YOUTUBE_SCAN_QUOTA_BUDGET))
         except Exception as e:
             logger.error(f"[SCHEDULER/YOUTUBE] ❌ Client init failed: {e}")
             settings.youtube_last_status = f"❌ Client error: {str(e)[:100]}"
@@ -301,54 +312,11 @@ def _run_youtube_scan():
             _schedule_youtube_scan(settings.youtube_scan_interval_minutes * 60)
             return
         
-        channels = YouTubeChannel.objects.filter(is_enabled=True)
-        total_created = 0
-        
-        for channel in channels:
-            try:
-                videos = client.get_latest_videos(
-                    channel.channel_url, 
-                    max_results=settings.youtube_max_videos_per_scan
-                )
-                if not videos:
-                    channel.last_checked = timezone.now()
-                    channel.save(update_fields=['last_checked'])
-                    continue
-            except Exception as e:
-                logger.error(f"[SCHEDULER/YOUTUBE] ❌ Channel error '{channel.name}': {e}")
-                _log_scheduler_error('youtube_scan', e, severity='warning')
-                continue
-            
-            for video in videos:
-                video_id = video['id']
-                video_url = video['url']
-                video_title = video['title']
-                
-                # Skip duplicates — check both Article and PendingArticle tables
-                if Article.objects.filter(youtube_url=video_url).exists():
-                    continue
-                if video_id and PendingArticle.objects.filter(video_id=video_id).exists():
-                    continue
-                
-                try:
-                    result = create_pending_article(
-                        youtube_url=video_url,
-                        channel_id=channel.id,
-                        video_title=video_title,
-                        video_id=video_id,
-                        generation_source='auto_youtube_scanner'
-                    )
-                    
-                    if result['success']:
-                        total_created += 1
-                        channel.last_video_id = video_id
-                        channel.videos_processed += 1
-                        channel.save()
-                except Exception as e:
-                    logger.error(f"[SCHEDULER/YOUTUBE] ❌ Article error for '{video_title[:40]}': {e}")
-            
-            channel.last_checked = timezone.now()
-            channel.save(update_fields=['last_checked'])
+        channels = list(YouTubeChannel.objects.filter(is_enabled=True))
+        total_created = scan_youtube_channels(
+            client, channels, settings.youtube_max_videos_per_scan,
+            log_prefix='[SCHEDULER/YOUTUBE]',
+        )
         
         # Score newly created pending articles
         _score_new_pending_articles()
@@ -356,12 +324,12 @@ def _run_youtube_scan():
         # Update settings
         AutomationSettings.objects.filter(pk=1).update(
             youtube_last_run=timezone.now(),
-            youtube_last_status=f"✅ {total_created} articles from {channels.count()} channels",
+            youtube_last_status=f"✅ {total_created} articles from {len(channels)} channels",
             youtube_articles_today=F('youtube_articles_today') + total_created
         )
         settings.refresh_from_db()
         
-        logger.info(f"[SCHEDULER/YOUTUBE] ✅ Done: {total_created} articles from {channels.count()} channels")
+        logger.info(f"[SCHEDULER/YOUTUBE] ✅ Done: {total_created} articles from {len(channels)} channels")
         
         _schedule_youtube_scan(settings.youtube_scan_interval_minutes * 60)
         
@@ -371,11 +339,185 @@ def _run_youtube_scan():
         _schedule_youtube_scan(5 * 60)
 
 
+# =============================================================================
+# YouTube scan helpers (shared with news/tasks.py)
+# =============================================================================
+
+# Concurrent channel fetches — I/O bound, each channel costs 2-3 API calls
+YOUTUBE_SCAN_WORKERS = 8
+# Max YouTube Data API units a single scan may spend (daily quota is 10,000)
+YOUTUBE_SCAN_QUOTA_BUDGET = 1500
+# How long an enqueued video is remembered so back-to-back scans don't re-enqueue it
+YOUTUBE_ENQUEUE_GUARD_TTL = 2 * 60 * 60
+
+
+def _channel_identifier(channel):
+    """Prefer the stored UC... channel ID — skips the handle-resolution API call."""
+    channel_id = (channel.channel_id or '').strip()
+    if channel_id.startswith('UC') and len(channel_id) == 24:
+        return channel_id
+    return channel.channel_url
+
+
+def _fetch_channel_videos(client, channels, max_results, log_prefix):
+    """
+    Fetch latest videos for all channels concurrently.
+
+    All workers share the client's quota budget, so once it is spent the
+    remaining channels fail fast with QuotaExhausted instead of calling the API.
+    Returns a list of (channel, videos) for channels that were fetched.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    from ai_engine.modules.youtube_client import QuotaExhausted
+
+    if not channels:
+        return []
+
+    def _fetch(channel):
+        try:
+            return channel, client.get_latest_videos(
+                _channel_identifier(channel), max_results=max_results
+            )
+        except Exception as e:
+            return channel, e
+
+    workers = max(1, min(YOUTUBE_SCAN_WORKERS, len(channels)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(_fetch, channels))
+
+    fetched = []
+    quota_skipped = 0
+    for channel, videos in results:
+        if isinstance(videos, QuotaExhausted):
+            quota_skipped += 1
+            continue
+        if isinstance(videos, Exception):
+            logger.error(f"{log_prefix} ❌ Channel error '{channel.name}': {videos}")
+            _log_scheduler_error('youtube_scan', videos, severity='warning')
+            continue
+        fetched.append((channel, videos or []))
+
+    if quota_skipped:
+        logger.warning(f"{log_prefix} ⚠️ Quota budget spent — {quota_skipped} channels deferred to next scan")
+    return fetched
+
+
+def _filter_new_videos(channel_videos):
+    """
+    Drop videos that already have an Article or PendingArticle.
+
+    One set-based query per table for the whole scan instead of two
+    exists() queries per video. Also drops videos seen twice in this scan.
+    Returns a list of (channel, video) pairs.
+    """
+    from news.models import Article, PendingArticle
+
+    all_videos = [v for _, videos in channel_videos for v in videos]
+    if not all_videos:
+        return []
+
+    urls = {v['url'] for v in all_videos if v.get('url')}
+    video_ids = {v['id'] for v in all_videos if v.get('id')}
+    known_urls = set(
+        Article.objects.filter(youtube_url__in=urls).values_list('youtube_url', flat=True)
+    )
+    known_ids = set(
+        PendingArticle.objects.filter(video_id__in=video_ids).values_list('video_id', flat=True)
+    )
+
+    new_videos = []
+    for channel, videos in channel_videos:
+        for video in videos:
+            if video['url'] in known_urls or (video['id'] and video['id'] in known_ids):
+                continue
+            known_urls.add(video['url'])
+            if video['id']:
+                known_ids.add(video['id'])
+            new_videos.append((channel, video))
+    return new_videos
+
+
+def _enqueue_youtube_generation(channel, video):
+    """Queue a Celery generation job. Returns False if it was already queued recently."""
+    from django.core.cache import cache
+    from news.tasks import generate_pending_from_youtube_task
+
+    guard_key = f"yt_gen_enqueued:{video['id'] or video['url']}"
+    if not cache.add(guard_key, 1, YOUTUBE_ENQUEUE_GUARD_TTL):
+        return False
+    generate_pending_from_youtube_task.delay(
+        youtube_url=video['url'],
+        channel_id=channel.id,
+        video_title=video['title'],
+        video_id=video['id'],
+    )
+    return True
+
+
+def scan_youtube_channels(client, channels, max_results, log_prefix='[SCHEDULER/YOUTUBE]'):
+    """
+    Scan YouTube channels for new videos and generate PendingArticles.
+
+    Channel playlists are fetched concurrently under the client's shared quota
+    budget and deduplicated in bulk. With YOUTUBE_SCAN_ENQUEUE_GENERATION on,
+    generation is handed to Celery (concurrency bounded by the worker pool);
+    otherwise videos are generated inline, one at a time.
+
+    Returns the number of articles created (inline) or jobs enqueued.
+    """
+    from django.conf import settings as django_settings
+    from django.utils import timezone
+    from news.models import YouTubeChannel
+
+    channel_videos = _fetch_channel_videos(client, channels, max_results, log_prefix)
+
+    now = timezone.now()
+    checked_ids = [channel.id for channel, _ in channel_videos]
+    if checked_ids:
+        YouTubeChannel.objects.filter(id__in=checked_ids).update(last_checked=now)
+
+    new_videos = _filter_new_videos(channel_videos)
+    if not new_videos:
+        return 0
+
+    enqueue = getattr(django_settings, 'YOUTUBE_SCAN_ENQUEUE_GENERATION', False)
+    total = 0
+
+    if enqueue:
+        for channel, video in new_videos:
+            try:
+                if _enqueue_youtube_generation(channel, video):
+                    total += 1
+            except Exception as e:
+                logger.error(f"{log_prefix} ❌ Enqueue error for '{video['title'][:40]}': {e}")
+        logger.info(f"{log_prefix} 📨 Enqueued {total}/{len(new_videos)} generation jobs")
+        return total
+
+    from ai_engine.main import create_pending_article
+
+    for channel, video in new_videos:
+        try:
+            result = create_pending_article(
+                youtube_url=video['url'],
+                channel_id=channel.id,
+                video_title=video['title'],
+                video_id=video['id'],
+                generation_source='auto_youtube_scanner'
+            )
+            if result['success']:
+                total += 1
+                YouTubeChannel.objects.filter(id=channel.id).update(
+                    last_video_id=video['id'],
+                    videos_processed=F('videos_processed') + 1,
+                )
+        except Exception as e:
+            logger.error(f"{log_prefix} ❌ Article error for '{video['title'][:40]}': {e}")
+    return total
+
+
 def _schedule_youtube_scan(interval_seconds):
     """Schedule the next YouTube scan."""
-    timer = threading.Timer(interval_seconds, _run_youtube_scan)
-    timer.daemon = True
-    timer.start()
+    job_scheduler.schedule_next('youtube_scan', interval_seconds)
 
 
 def _run_auto_publish():
@@ -416,9 +558,7 @@ def _run_auto_publish():
 
 def _schedule_auto_publish(interval_seconds):
     """Schedule the next auto-publish check."""
-    timer = threading.Timer(interval_seconds, _run_auto_publish)
-    timer.daemon = True
-    timer.start()
+    job_scheduler.schedule_next('auto_publish', interval_seconds)
 
 
 def _score_new_pending_articles():
@@ -541,9 +681,7 @@ def _run_scheduled_publish():
 
 def _schedule_scheduled_publish():
     """Schedule the next scheduled-publish check."""
-    timer = threading.Timer(SCHEDULED_PUBLISH_INTERVAL, _run_scheduled_publish)
-    timer.daemon = True
-    timer.start()
+    job_scheduler.schedule_next('scheduled_publish', SCHEDULED_PUBLISH_INTERVAL)
 
 
 # =============================================================================
@@ -670,9 +808,7 @@ def _schedule_deep_specs_backfill(interval_seconds=None):
     """Schedule the next deep specs backfill."""
     if interval_seconds is None:
         interval_seconds = 6 * 3600
-    timer = threading.Timer(interval_seconds, _run_deep_specs_backfill)
-    timer.daemon = True
-    timer.start()
+    job_scheduler.schedule_next('deep_specs', interval_seconds)
 
 
 
@@ -763,18 +899,15 @@ def _run_ab_lifecycle_daily():
         run_ab_test_lifecycle()
     except Exception as e:
         _log_scheduler_error('ab_lifecycle', e)
-    timer = threading.Timer(24 * 3600, _run_ab_lifecycle_daily)
-    timer.daemon = True
-    timer.start()
+    job_scheduler.schedule_next('ab_lifecycle', AB_LIFECYCLE_INTERVAL)
 
 
 def _check_overdue_tasks():
     """
-    Startup recovery: check if tasks are overdue and run them immediately.
-    Called once shortly after server start to handle tasks that were missed
-    during downtime/deploys.
+    Startup recovery: clear stale locks and mark overdue tasks as due now.
+    Called once on scheduler start so tasks missed during downtime/deploys
+    run on the next tick (exactly once, even if several workers restart).
     """
-    global _recovery_triggered
     try:
         from news.models import AutomationSettings
         from django.utils import timezone
@@ -798,39 +931,61 @@ def _check_overdue_tasks():
         if settings.rss_scan_enabled and settings.rss_last_run:
             rss_interval = timedelta(minutes=settings.rss_scan_interval_minutes)
             if now - settings.rss_last_run > rss_interval:
-                overdue.append('rss')
-                _recovery_triggered.add('rss')
-                threading.Thread(target=_run_rss_scan, daemon=True).start()
+                overdue.append('rss_scan')
         
         # Check YouTube  
         if settings.youtube_scan_enabled and settings.youtube_last_run:
             yt_interval = timedelta(minutes=settings.youtube_scan_interval_minutes)
             if now - settings.youtube_last_run > yt_interval:
-                overdue.append('youtube')
-                _recovery_triggered.add('youtube')
-                threading.Thread(target=_run_youtube_scan, daemon=True).start()
+                overdue.append('youtube_scan')
         
         # Check Auto-publish (every 10 mins, so likely always overdue after restart)
         if settings.auto_publish_enabled:
-            overdue.append('auto-publish')
-            _recovery_triggered.add('auto-publish')
-            threading.Thread(target=_run_auto_publish, daemon=True).start()
+            overdue.append('auto_publish')
         
         # Check Scheduled Publish — always run on recovery to catch articles
         # that were due during downtime/deploys
-        overdue.append('scheduled-publish')
-        _recovery_triggered.add('scheduled-publish')
-        threading.Thread(target=_run_scheduled_publish, daemon=True).start()
+        overdue.append('scheduled_publish')
         
-        if overdue:
-            logger.info(f"[SCHEDULER] 🔄 Startup recovery: triggered overdue tasks: {', '.join(overdue)}")
-        else:
-            logger.info("[SCHEDULER] ✅ Startup recovery: no overdue tasks found")
+        for name in overdue:
+            job_scheduler.run_soon(name)
+        logger.info(f"[SCHEDULER] 🔄 Startup recovery: overdue tasks due now: {', '.join(overdue)}")
             
     except Exception as e:
         logger.error(f"[SCHEDULER] ❌ Startup recovery error: {e}", exc_info=True)
 
 
+def _register_jobs():
+    """Register every periodic job with the cluster-wide scheduler."""
+    register = job_scheduler.register
+    # name, body, default interval, first run after (seconds since first sight)
+    register('gsc_sync', _run_gsc_sync, GSC_SYNC_INTERVAL, initial_delay=60, label='GSC Sync')
+    register('currency_update', _run_currency_update, CURRENCY_UPDATE_INTERVAL,
+             initial_delay=120, label='Currency Update')
+    register('rss_scan', _run_rss_scan, 30 * 60, initial_delay=180, label='RSS Scan')
+    register('youtube_scan', _run_youtube_scan, 30 * 60, initial_delay=240, label='YouTube Scan')
+    register('auto_publish', _run_auto_publish, AUTO_PUBLISH_CHECK_INTERVAL,
+             initial_delay=300, label='Auto Publish')
+    register('scheduled_publish', _run_scheduled_publish, SCHEDULED_PUBLISH_INTERVAL,
+             initial_delay=120, jitter=0, timeout=10 * 60, label='Scheduled Publish')
+    register('deep_specs', _run_deep_specs_backfill, 6 * 3600, initial_delay=360,
+             label='Deep Specs Backfill')
+    register('stale_error_cleanup', _auto_resolve_stale_errors, STALE_ERROR_CLEANUP_INTERVAL,
+             initial_delay=600, timeout=10 * 60, label='Stale Error Cleanup')
+    register('ab_lifecycle', _run_ab_lifecycle_daily, AB_LIFECYCLE_INTERVAL,
+             initial_delay=5 * 60, label='A/B Lifecycle')
+    register('db_backup', _run_db_backup, DB_BACKUP_INTERVAL, initial_delay=420,
+             timeout=60 * 60, label='Database Backup')
+    register('system_graph_cache', _run_system_graph_cache, SYSTEM_GRAPH_CACHE_INTERVAL,
+             initial_delay=90, timeout=5 * 60, label='System Graph Cache')
+    register('related_articles', _run_related_articles_refresh, RELATED_ARTICLES_INTERVAL,
+             initial_delay=480, timeout=30 * 60, label='Related Articles Refresh')
+    register('image_pipeline', _run_image_pipeline_sweep, IMAGE_PIPELINE_INTERVAL,
+             initial_delay=540, timeout=30 * 60, label='Image Renditions')
+    register('rss_bulk_claims', _run_rss_claims_sweep, RSS_CLAIMS_SWEEP_INTERVAL,
+             initial_delay=150, timeout=5 * 60, label='RSS Bulk Claims Sweep')
+
+
 def start_scheduler():
     """
     Start background scheduler. Called once from AppConfig.ready().
@@ -849,20 +1004,15 @@ def start_scheduler():
         # Parent process of autoreload — skip, child will handle it
         return
 
-    logger.info("🕐 Starting background scheduler (GSC 6h, currency 7d, RSS/YouTube/auto-publish from settings)")
+    logger.info("🕐 Starting background scheduler (GSC 6h, currency daily, RSS/YouTube/auto-publish from settings)")
     
     # --- Deploy cache flush: clear stale API caches from Redis ---
-    # Redis survives deploys, so cached API responses (cache_page) may contain
-    # stale data. We flush all cache_page keys on startup but preserve sessions.
+    # Redis survives deploys, so cached API responses may contain stale data.
+    # We retire every cached response group on startup but preserve sessions.
     try:
-        from news.cache_signals import (
-            invalidate_article_caches, invalidate_category_caches,
-            invalidate_tag_caches, invalidate_cars_caches, invalidate_settings_cache,
-            _delete_cache_page_prefix
-        )
-        for prefix in ['articles_list', 'trending', 'popular', 'categories_list',
-                        'tags_list', 'cars_picker', 'currency_rates', 'robots_txt']:
-            _delete_cache_page_prefix(prefix)
+        from news.cache_signals import CACHE_PREFIXES, invalidate_settings_cache
+        from news.cache_versions import bump
+        bump(*(group for name, group in CACHE_PREFIXES.items() if name != 'settings'))
         invalidate_settings_cache()
         logger.info("🧹 Deploy cache flush: cleared all cache_page API responses from Redis")
         
@@ -873,94 +1023,22 @@ def start_scheduler():
     except Exception as e:
         logger.warning(f"⚠️ Deploy cache flush failed (non-critical): {e}")
     
-    # --- Startup recovery: check for overdue tasks ---
+    # --- Startup recovery: mark overdue tasks as due (off the startup path) ---
     recovery_timer = threading.Timer(30, _check_overdue_tasks)
     recovery_timer.daemon = True
     recovery_timer.start()
     
-    # --- Existing tasks ---
-    
-    # Run first GSC sync after 60 seconds (let app finish starting)
-    initial_timer = threading.Timer(60, _run_gsc_sync)
-    initial_timer.daemon = True
-    initial_timer.start()
-    
-    # Run first currency update after 120 seconds
-    currency_timer = threading.Timer(120, _run_currency_update)
-    currency_timer.daemon = True
-    currency_timer.start()
-    
-    # --- Automation tasks: only start if NOT already triggered by recovery ---
-    # Recovery runs at +30s. These timers fire at +180/240/300s.
-    # If recovery already triggered a task, the scheduled timer skips it
-    # and lets the recovery-triggered task handle rescheduling.
-    
-    def _start_rss_if_not_recovered():
-        if 'rss' not in _recovery_triggered:
-            _run_rss_scan()
-        else:
-            logger.info("[SCHEDULER] ⏭️ Skipping scheduled RSS — already triggered by recovery")
-    
-    def _start_youtube_if_not_recovered():
-        if 'youtube' not in _recovery_triggered:
-            _run_youtube_scan()
-        else:
-            logger.info("[SCHEDULER] ⏭️ Skipping scheduled YouTube — already triggered by recovery")
-    
-    def _start_auto_publish_if_not_recovered():
-        if 'auto-publish' not in _recovery_triggered:
-            _run_auto_publish()
-        else:
-            logger.info("[SCHEDULER] ⏭️ Skipping scheduled auto-publish — already triggered by recovery")
-    
-    # RSS scan — start after 180 seconds (if not already recovered)
-    rss_timer = threading.Timer(180, _start_rss_if_not_recovered)
-    rss_timer.daemon = True
-    rss_timer.start()
-    
-    # YouTube scan — start after 240 seconds (if not already recovered)
-    yt_timer = threading.Timer(240, _start_youtube_if_not_recovered)
-    yt_timer.daemon = True
-    yt_timer.start()
-    
-    # Auto-publish — start after 300 seconds (if not already recovered)
-    ap_timer = threading.Timer(300, _start_auto_publish_if_not_recovered)
-    ap_timer.daemon = True
-    ap_timer.start()
+    # In 'celery' mode Celery beat drives news.tasks.scheduler_tick and workers
+    # run the jobs — keep request-serving processes free of scheduler threads.
+    from django.conf import settings as django_settings
+    if getattr(django_settings, 'SCHEDULER_MODE', 'thread') == 'celery':
+        logger.info("[SCHEDULER] 🧵 SCHEDULER_MODE=celery — jobs run on Celery workers")
+        return
     
-    # VehicleSpecs auto-backfill — start after 360 seconds
-    deep_specs_timer = threading.Timer(360, _run_deep_specs_backfill)
-    deep_specs_timer.daemon = True
-    deep_specs_timer.start()
-
-    # Scheduled publish — check every 60s, start after 120 seconds
-    sched_pub_timer = threading.Timer(120, _run_scheduled_publish)
-    sched_pub_timer.daemon = True
-    sched_pub_timer.start()
-    logger.info("[SCHEDULER] 📅 Scheduled publish timer started (every 60s)")
-
-    # Auto-resolve stale errors — start after 600 seconds, then every 6 hours
-    stale_timer = threading.Timer(600, _auto_resolve_stale_errors)
-    stale_timer.daemon = True
-    stale_timer.start()
-
-    # A/B test lifecycle cleanup — runs once daily, first fire after 5 minutes
-    ab_lifecycle_timer = threading.Timer(5 * 60, _run_ab_lifecycle_daily)
-    ab_lifecycle_timer.daemon = True
-    ab_lifecycle_timer.start()
-    logger.info("[SCHEDULER] 🧹 A/B lifecycle cleanup scheduled (daily)")
-
-    # Database backup — daily, first fire after 420 seconds
-    backup_timer = threading.Timer(420, _run_db_backup)
-    backup_timer.daemon = True
-    backup_timer.start()
-    logger.info("[SCHEDULER] 🗄️ Database backup scheduled (daily)")
-
-    # System Graph caching — every 60s, start after 90 seconds
-    system_graph_timer = threading.Timer(90, _run_system_graph_cache)
-    system_graph_timer.daemon = True
-    system_graph_timer.start()
-    logger.info("[SCHEDULER] 📊 System Graph cache scheduled (every 60s)")
+    # One ticker thread per process; only the Redis-elected leader dispatches jobs
+    job_scheduler.start()
+    logger.info(f"[SCHEDULER] 🕐 Job scheduler started ({len(job_scheduler.get_jobs())} jobs, "
+                f"instance {job_scheduler.INSTANCE_ID})")
 
 
 def _run_db_backup():
@@ -981,9 +1059,7 @@ def _run_db_backup():
 
 def _schedule_db_backup():
     """Schedule the next database backup."""
-    timer = threading.Timer(DB_BACKUP_INTERVAL, _run_db_backup)
-    timer.daemon = True
-    timer.start()
+    job_scheduler.schedule_next('db_backup', DB_BACKUP_INTERVAL)
 
 
 def _auto_resolve_stale_errors():
@@ -1017,10 +1093,7 @@ def _auto_resolve_stale_errors():
     except Exception as e:
         logger.warning(f"[SCHEDULER/STALE-CLEANUP] ⚠️ Failed: {e}")
     finally:
-        # Reschedule every 6 hours
-        next_timer = threading.Timer(6 * 3600, _auto_resolve_stale_errors)
-        next_timer.daemon = True
-        next_timer.start()
+        job_scheduler.schedule_next('stale_error_cleanup', STALE_ERROR_CLEANUP_INTERVAL)
 
 
 def _run_system_graph_cache():
@@ -1042,6 +1115,69 @@ def _run_system_graph_cache():
 
 def _schedule_system_graph_cache():
     """Schedule the next System Graph cache update."""
-    timer = threading.Timer(60, _run_system_graph_cache)
-    timer.daemon = True
-    timer.start()
+    job_scheduler.schedule_next('system_graph_cache', SYSTEM_GRAPH_CACHE_INTERVAL)
+
+
+def _run_related_articles_refresh():
+    """Recompute stale materialised related-article sets (see news/related_articles.py)."""
+    from django.db import close_old_connections
+    close_old_connections()
+    try:
+        from news.related_articles import refresh_stale, staleness_stats
+
+        result = refresh_stale(limit=RELATED_ARTICLES_BATCH)
+        stats = staleness_stats()
+        if result['refreshed'] or result['failed']:
+            logger.info(
+                f"[SCHEDULER/RELATED] 🔗 Refreshed {result['refreshed']} related sets "
+                f"({result['failed']} failed, {result['remaining']} still stale, "
+                f"{stats['stale_pct']}% of {stats['published']} published)"
+            )
+    except Exception as e:
+        logger.error(f"[SCHEDULER/RELATED] ❌ Related articles refresh failed: {e}")
+        _log_scheduler_error('related_articles', e)
+    finally:
+        close_old_connections()
+        job_scheduler.schedule_next('related_articles', RELATED_ARTICLES_INTERVAL)
+
+
+def _run_image_pipeline_sweep():
+    """Build responsive renditions for stored images that have none yet."""
+    from django.db import close_old_connections
+    close_old_connections()
+    try:
+        from news.image_pipeline import process_pending
+
+        result = process_pending(limit=IMAGE_PIPELINE_BATCH)
+        if result['processed'] or result['reused'] or result['failed']:
+            logger.info(
+                f"[SCHEDULER/IMAGES] 🖼️ {result['processed']} processed, {result['reused']} reused, "
+                f"{result['failed']} failed, {result['remaining']} remaining"
+            )
+    except Exception as e:
+        logger.error(f"[SCHEDULER/IMAGES] ❌ Image renditions sweep failed: {e}")
+        _log_scheduler_error('image_pipeline', e)
+    finally:
+        close_old_connections()
+        job_scheduler.schedule_next('image_pipeline', IMAGE_PIPELINE_INTERVAL)
+
+
+def _run_rss_claims_sweep():
+    """Put RSS items claimed by a bulk generation job that died back to 'new'."""
+    from django.db import close_old_connections
+    close_old_connections()
+    try:
+        from news.rss_bulk_generation import release_stale_claims
+
+        released = release_stale_claims()
+        if released:
+            logger.info(f"[SCHEDULER/RSS] ♻️ Released {released} items from dead bulk generation jobs")
+    except Exception as e:
+        logger.error(f"[SCHEDULER/RSS] ❌ Bulk claims sweep failed: {e}")
+        _log_scheduler_error('rss_bulk_claims', e)
+    finally:
+        close_old_connections()
+        job_scheduler.schedule_next('rss_bulk_claims', RSS_CLAIMS_SWEEP_INTERVAL)
+
+
+_register_jobs()
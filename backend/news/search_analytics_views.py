@@ -41,7 +41,7 @@ class SearchAPIView(APIView):
                     id__in=article_ids_ordered,
                     is_published=True,
                     is_deleted=False,
-                )
+                ).select_related('image_asset')
 
                 # Optional filters
                 if category_slug:
@@ -113,7 +113,7 @@ class SearchAPIView(APIView):
 
         total = articles.count()
         start = (page - 1) * page_size
-        articles_page = articles[start:start + page_size]
+        articles_page = articles.select_related('image_asset')[start:start + page_size]
 
         serializer = ArticleListSerializer(articles_page, many=True, context={'request': request})
         return Response({
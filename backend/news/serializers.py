@@ -30,6 +30,19 @@ def _fix_cloudinary_image_urls(representation):
     return representation
 
 
+def _image_srcsets(obj, asset_field='image_asset'):
+    """Responsive renditions of obj.<asset_field> as {format: srcset}, None until processed.
+
+    Querysets used with these serializers should select_related the asset FKs.
+    """
+    if getattr(obj, f'{asset_field}_id', None) is None:
+        return None
+    asset = getattr(obj, asset_field)
+    if asset.status != 'ready' or not asset.variants:
+        return None
+    return {fmt: asset.srcset(fmt) for fmt in ('avif', 'webp') if asset.variants_for(fmt)}
+
+
 def validate_image_file(image):
     """Validate image file size and format"""
     if not image:
@@ -164,10 +177,11 @@ class VehicleSpecsSerializer(serializers.ModelSerializer):
 
 class ArticleImageSerializer(serializers.ModelSerializer):
     image_url = serializers.SerializerMethodField()
+    image_srcset = serializers.SerializerMethodField()
     
     class Meta:
         model = ArticleImage
-        fields = ['id', 'article', 'image', 'image_url', 'caption', 'order', 'created_at']
+        fields = ['id', 'article', 'image', 'image_url', 'image_srcset', 'caption', 'order', 'created_at']
         read_only_fields = ['created_at']
     
     def validate_image(self, value):
@@ -182,6 +196,9 @@ class ArticleImageSerializer(serializers.ModelSerializer):
             return obj.image.url
         return None
 
+    def get_image_srcset(self, obj):
+        return _image_srcsets(obj)
+
 
 class ArticleListSerializer(serializers.ModelSerializer):
     """Lightweight serializer for article lists"""
@@ -191,12 +208,13 @@ class ArticleListSerializer(serializers.ModelSerializer):
     average_rating = serializers.SerializerMethodField()
     rating_count = serializers.SerializerMethodField()
     thumbnail_url = serializers.SerializerMethodField()
+    image_srcset = serializers.SerializerMethodField()
     is_favorited = serializers.SerializerMethodField()
     
     class Meta:
         model = Article
         fields = ['id', 'title', 'slug', 'summary', 'categories', 'category_names',
-                  'tag_names', 'image', 'thumbnail_url',
+                  'tag_names', 'image', 'thumbnail_url', 'image_srcset',
                   'price_usd', 'average_rating', 'views',
                   'rating_count', 'created_at', 'updated_at', 'is_published', 'scheduled_publish_at', 'is_favorited', 
                   'is_hero', 'is_news_only', 'author_name', 'author_channel_url',
@@ -243,7 +261,9 @@ class ArticleListSerializer(serializers.ModelSerializer):
             if hasattr(obj.image, 'url'):
                 return obj.image.url
         return None
-    
+
+    def get_image_srcset(self, obj):
+        return _image_srcsets(obj)
 
 
     def to_representation(self, instance):
@@ -314,6 +334,7 @@ class ArticleDetailSerializer(serializers.ModelSerializer):
     thumbnail_url = serializers.SerializerMethodField()
     image_2_url = serializers.SerializerMethodField()
     image_3_url = serializers.SerializerMethodField()
+    image_srcsets = serializers.SerializerMethodField()
     is_favorited = serializers.SerializerMethodField()
     # Source attribution — channel/feed info for the bottom-of-article block
     youtube_channel_name = serializers.SerializerMethodField()
@@ -327,7 +348,7 @@ class ArticleDetailSerializer(serializers.ModelSerializer):
         model = Article
         fields = ['id', 'title', 'slug', 'content', 'summary', 'seo_description', 'categories', 'category_ids',
                   'tags', 'tag_ids', 'image', 'thumbnail_url', 'image_2', 'image_2_url',
-                  'image_3', 'image_3_url', 'youtube_url', 'price_usd', 'views', 
+                  'image_3', 'image_3_url', 'image_srcsets', 'youtube_url', 'price_usd', 'views', 
                   'car_specification', 'vehicle_specs', 'images', 'average_rating', 'rating_count',
                   'created_at', 'updated_at', 'is_published', 'scheduled_publish_at', 'is_favorited', 'is_hero', 'is_news_only',
                   'author_name', 'author_channel_url',
@@ -391,6 +412,13 @@ class ArticleDetailSerializer(serializers.ModelSerializer):
                 return obj.image_3.url
         return None
 
+    def get_image_srcsets(self, obj):
+        """{'image': {'avif': srcset, 'webp': srcset}, 'image_2': …} for processed images."""
+        return {
+            field: _image_srcsets(obj, f'{field}_asset')
+            for field in ('image', 'image_2', 'image_3')
+        }
+
     def to_representation(self, instance):
         rep = super().to_representation(instance)
         rep = _fix_cloudinary_image_urls(rep)
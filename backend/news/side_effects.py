@@ -0,0 +1,348 @@
+"""
+Side-effect dispatcher for model signals.
+
+A single Article.save() used to start one daemon thread per reaction
+(vector re-index, recommender rebuild, spec extraction, Telegram, training
+pairs, tag learning) — a bulk command re-saving 5 000 articles started tens
+of thousands. Reactions are now named functions of one key (usually an
+article id) that reload whatever they need, and receivers only request them:
+
+    @side_effects.reaction('vector_index')
+    def _reindex(article_id): ...
+
+    side_effects.dispatch('vector_index', instance.id)
+
+Requests are queued once the current transaction commits and run
+SIDE_EFFECT_COALESCE_SECONDS later on a bounded pool of SIDE_EFFECT_WORKERS
+threads; repeated requests for the same (reaction, key) inside that window
+run once, against the latest row. With SIDE_EFFECT_BACKEND='celery' they
+become news.tasks.run_side_effect tasks instead, deduplicated across
+processes through the cache.
+
+Receivers skip reactions a save cannot affect: track_changes() remembers
+field values when a model is loaded and changed() tells which of them the
+save touched (update_fields, or a field diff for full saves) — a
+views/engagement_score update triggers nothing.
+
+bulk_mode() defers everything requested inside it — reactions, and
+collect()ed synchronous work such as cache deletes and Next.js revalidation
+paths — and issues each distinct request once on exit.
+
+Entry points:
+    reaction(name)              register fn(key)
+    dispatch(name, key)         request after commit
+    collect(name, items, flush) flush(items) now, or merged on bulk_mode() exit
+    bulk_mode() / join_bulk(scope)
+    track_changes(model, fields) / changed(instance, fields=None, ignore=())
+    wait_idle(timeout)          block until queued reactions have run
+"""
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import partial
+
+from django.db import close_old_connections, transaction
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WORKERS = 4
+DEFAULT_COALESCE_SECONDS = 2.0
+
+# Stands for "fields outside the tracked set may have changed" (full saves)
+ANY_FIELD = '*'
+
+_reactions = {}
+
+
+def reaction(name):
+    """Register ``fn(key)`` as the reaction called `name`."""
+    def register(fn):
+        _reactions[name] = fn
+        return fn
+    return register
+
+
+def run(name, key):
+    """Run a registered reaction in the calling thread."""
+    _reactions[name](key)
+
+
+# ═══════════════════════════════════════════════════════════════════
+# In-process dispatcher
+# ═══════════════════════════════════════════════════════════════════
+
+class Dispatcher:
+    """Coalescing delay queue in front of a bounded thread pool."""
+
+    def __init__(self, workers=DEFAULT_WORKERS, window=DEFAULT_COALESCE_SECONDS, runner=run):
+        self.workers = workers
+        self.window = window
+        self.stats = {'requested': 0, 'coalesced': 0, 'run': 0, 'failed': 0}
+        self._runner = runner
+        self._due = []  # heap of (due, seq, (name, key))
+        self._queued = set()
+        self._active = 0
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._pool = None
+        self._timer = None
+
+    def submit(self, name, key, delay=None):
+        """Queue (name, key) to run after `delay` (default: the window). False if already queued."""
+        item = (name, key)
+        with self._cond:
+            self.stats['requested'] += 1
+            if item in self._queued:
+                self.stats['coalesced'] += 1
+                return False
+            self._queued.add(item)
+            due = time.monotonic() + (self.window if delay is None else delay)
+            heapq.heappush(self._due, (due, next(self._seq), item))
+            if self._timer is None or not self._timer.is_alive():
+                if self._pool is None:
+                    self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='side-effect')
+                self._timer = threading.Thread(target=self._loop, name='side-effect-timer', daemon=True)
+                self._timer.start()
+            self._cond.notify_all()
+        return True
+
+    def pending(self):
+        with self._cond:
+            return len(self._due) + self._active
+
+    def wait_idle(self, timeout=None):
+        """Block until nothing is queued or running. False on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while self._due or self._active:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def _loop(self):
+        while True:
+            with self._cond:
+                while not self._due or self._due[0][0] > time.monotonic():
+                    self._cond.wait(self._due[0][0] - time.monotonic() if self._due else None)
+                _, _, item = heapq.heappop(self._due)
+                # A request arriving from here on queues a fresh run — the row may
+                # change after this one has read it.
+                self._queued.discard(item)
+                self._active += 1
+            try:
+                self._pool.submit(self._run, *item)
+            except RuntimeError:  # interpreter shutting down
+                with self._cond:
+                    self._active -= 1
+                    self._cond.notify_all()
+                return
+
+    def _run(self, name, key):
+        close_old_connections()
+        try:
+            self._runner(name, key)
+            failed = False
+        except Exception as e:
+            failed = True
+            logger.error(f"❌ Side effect {name}[{key}] failed: {e}")
+        finally:
+            close_old_connections()
+            with self._cond:
+                self.stats['failed' if failed else 'run'] += 1
+                self._active -= 1
+                self._cond.notify_all()
+
+
+_dispatcher = None
+_dispatcher_lock = threading.Lock()
+
+
+def get_dispatcher():
+    """Process-wide Dispatcher sized from settings."""
+    global _dispatcher
+    if _dispatcher is None:
+        with _dispatcher_lock:
+            if _dispatcher is None:
+                from django.conf import settings
+                _dispatcher = Dispatcher(
+                    workers=getattr(settings, 'SIDE_EFFECT_WORKERS', DEFAULT_WORKERS),
+                    window=getattr(settings, 'SIDE_EFFECT_COALESCE_SECONDS', DEFAULT_COALESCE_SECONDS),
+                )
+    return _dispatcher
+
+
+def wait_idle(timeout=None):
+    """Block until this process's queued reactions have run (management commands)."""
+    return _dispatcher is None or _dispatcher.wait_idle(timeout)
+
+
+def _enqueue(name, key, delay=None):
+    from django.conf import settings
+    if getattr(settings, 'SIDE_EFFECT_BACKEND', 'thread') == 'celery':
+        window = getattr(settings, 'SIDE_EFFECT_COALESCE_SECONDS', DEFAULT_COALESCE_SECONDS)
+        countdown = window if delay is None else delay
+        try:
+            from django.core.cache import cache
+            # One task per (reaction, key) per window, across processes; the
+            # task runs when the marker expires, so it sees every absorbed save.
+            if countdown and not cache.add(f'side_effect:{name}:{key}', 1, timeout=max(1, round(countdown))):
+                return
+            from news.tasks import run_side_effect
+            run_side_effect.apply_async((name, key), countdown=countdown)
+            return
+        except Exception as e:
+            logger.warning(f"⚠️ Side effect {name}[{key}] not queued on Celery, running locally: {e}")
+    get_dispatcher().submit(name, key, delay)
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Requests and bulk mode
+# ═══════════════════════════════════════════════════════════════════
+
+_local = threading.local()
+
+
+def dispatch(name, key=None):
+    """Request reaction `name` for `key` once the current transaction commits."""
+    pending = getattr(_local, 'pending', None)
+    if pending is not None:
+        pending[(name, key)] = None
+        return
+    transaction.on_commit(partial(_enqueue, name, key))
+
+
+def collect(name, items, flush):
+    """
+    Call ``flush(items)`` now — or, inside bulk_mode(), once on exit with every
+    item collected under `name` (first-seen order, no repeats).
+    """
+    batches = getattr(_local, 'batches', None)
+    if batches is None:
+        flush(list(items))
+        return
+    merged = batches.setdefault(name, ({}, flush))[0]
+    merged.update(dict.fromkeys(items))
+
+
+@contextmanager
+def bulk_mode():
+    """
+    Defer every dispatch()/collect() in this thread until the block exits,
+    then issue each distinct request once. Nested blocks join the outermost.
+    Yields the block's scope, for join_bulk() in worker threads.
+    """
+    if getattr(_local, 'pending', None) is not None:
+        yield _local.pending, _local.batches
+        return
+    _local.pending, _local.batches = {}, {}
+    try:
+        yield _local.pending, _local.batches
+    finally:
+        pending, batches = _local.pending, _local.batches
+        _local.pending = _local.batches = None
+        for name, (items, flush) in batches.items():
+            try:
+                flush(list(items))
+            except Exception as e:
+                logger.error(f"❌ Deferred {name} failed: {e}")
+        for name, key in pending:
+            # Already coalesced over the whole block — no window needed
+            transaction.on_commit(partial(_enqueue, name, key, 0))
+        if pending or batches:
+            logger.info(f"📦 Bulk mode: {len(pending)} side effects, {len(batches)} batched flushes")
+
+
+@contextmanager
+def join_bulk(scope):
+    """
+    Defer this thread's requests into a bulk_mode() block opened by another
+    thread (`scope` is what it yielded), e.g. from a batch worker pool. The
+    owning block issues them on exit; leaving this one issues nothing.
+    """
+    previous = getattr(_local, 'pending', None), getattr(_local, 'batches', None)
+    _local.pending, _local.batches = scope
+    try:
+        yield
+    finally:
+        _local.pending, _local.batches = previous
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Field-change tracking
+# ═══════════════════════════════════════════════════════════════════
+
+_UNKNOWN = object()  # deferred / not loaded
+_tracked = {}  # model → {field name: (attname, is_file)}
+
+
+def _values(instance, fields):
+    values = instance.__dict__  # never triggers a deferred-field query
+    current = {}
+    for name, (attname, is_file) in fields.items():
+        value = values.get(attname, _UNKNOWN)
+        if is_file and value is not _UNKNOWN:
+            value = getattr(value, 'name', value)
+        current[name] = value
+    return current
+
+
+def _snapshot(sender, instance, **kwargs):
+    instance._side_effect_snapshot = _values(instance, _tracked[sender])
+
+
+def _diff(sender, instance, update_fields=None, **kwargs):
+    if instance._state.adding:
+        instance._side_effect_changes = None
+        return
+    fields = _tracked[sender]
+    before = getattr(instance, '_side_effect_snapshot', None) or {}
+    differing = set()
+    for name, value in _values(instance, fields).items():
+        old = before.get(name, _UNKNOWN)
+        if old is _UNKNOWN or value is _UNKNOWN:
+            if old is not value:  # loaded or assigned since — assume changed
+                differing.add(name)
+        elif old != value:
+            differing.add(name)
+    if update_fields is None:
+        instance._side_effect_changes = differing | {ANY_FIELD}
+    else:
+        instance._side_effect_changes = {f for f in update_fields if f not in fields or f in differing}
+
+
+def track_changes(model, fields):
+    """Remember `fields` of every loaded `model` instance so changed() can diff its saves."""
+    from django.db.models import FileField
+    from django.db.models.signals import post_init, post_save, pre_save
+
+    tracked = _tracked.setdefault(model, {})
+    for name in fields:
+        field = model._meta.get_field(name)
+        tracked[name] = (field.attname, isinstance(field, FileField))
+    uid = f'side_effects:{model._meta.label}'
+    post_init.connect(_snapshot, sender=model, dispatch_uid=uid)
+    pre_save.connect(_diff, sender=model, dispatch_uid=uid)
+    post_save.connect(_snapshot, sender=model, dispatch_uid=uid)
+
+
+def changed(instance, fields=None, ignore=()):
+    """
+    For the save being signalled: did it touch any of `fields` — or, without
+    `fields`, anything outside `ignore`? True when unknown (new rows, models
+    without track_changes()).
+    """
+    changes = getattr(instance, '_side_effect_changes', None)
+    if changes is None:
+        return True
+    if fields is None:
+        return bool(changes.difference(ignore))
+    if ANY_FIELD in changes and not _tracked.get(type(instance), {}).keys() >= set(fields):
+        return True
+    return not changes.isdisjoint(fields)
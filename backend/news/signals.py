@@ -1,14 +1,35 @@
 """
 Django signals for automatic notification creation.
 Creates admin notifications when important events occur.
+
+Background reactions to Article saves (vector index, recommender, specs,
+Telegram, training pairs, ...) are requested through news/side_effects.py:
+bounded pool, coalesced per article, skipped when their fields didn't change.
 """
 
+import logging
+import threading
+
 from django.db.models.signals import post_save
 from django.db.models.signals import post_delete
+from django.db.models.signals import m2m_changed
 from django.dispatch import receiver
 from django.db import transaction
+from . import side_effects
 from .models import Comment, Subscriber, Article, PendingArticle, AdminNotification, VehicleSpecs, CarSpecification, TagLearningLog
 
+logger = logging.getLogger(__name__)
+
+# Article fields each background reaction depends on. Saves that change none
+# of them (view counters, engagement scores, metadata) don't request it.
+PUBLISH_FIELDS = ('is_published', 'is_deleted')
+LEARNING_FIELDS = PUBLISH_FIELDS + ('title',)
+SEARCH_FIELDS = PUBLISH_FIELDS + ('title', 'slug', 'summary', 'content')
+SPEC_SOURCE_FIELDS = PUBLISH_FIELDS + ('title', 'content')
+TRAINING_FIELDS = PUBLISH_FIELDS + ('title', 'content', 'content_original')
+
+side_effects.track_changes(Article, set(SEARCH_FIELDS + TRAINING_FIELDS))
+
 
 @receiver(post_save, sender=Comment)
 def notify_new_comment(sender, instance, created, **kwargs):
@@ -83,6 +104,8 @@ def log_human_review_decision(sender, instance, created, **kwargs):
     """
     if created:
         return  # Only care about updates, not initial creation
+    if not side_effects.changed(instance, PUBLISH_FIELDS):
+        return  # Not a publish toggle
     
     # Check if this article came from auto-publish (has a source_pending with is_auto_published=True)
     source = instance.source_pending.filter(is_auto_published=True).first()
@@ -137,50 +160,37 @@ def log_human_review_decision(sender, instance, created, **kwargs):
 
 @receiver(post_save, sender=Article)
 def learn_tag_choices(sender, instance, **kwargs):
-    """Record tag choices for the learning system whenever a published article is saved."""
+    """Record tag choices for the learning system when a published article's title or status changes."""
     if not instance.is_published or instance.is_deleted:
         return
-    
-    # Run in background to avoid blocking
-    article_id = instance.id
-    
-    def _record():
-        try:
-            from ai_engine.modules.tag_suggester import record_tag_choice
-            article = Article.objects.get(id=article_id)
-            record_tag_choice(article)
-        except Exception as e:
-            import logging
-            logging.getLogger('news').error(f"[TAG-LEARN] Failed to record tags for [{article_id}]: {e}")
-    
-    thread = threading.Thread(target=_record, daemon=True)
-    transaction.on_commit(lambda: thread.start())
-
+    if side_effects.changed(instance, LEARNING_FIELDS):
+        side_effects.dispatch('tag_learning', instance.id)
 
-# ============================================================================
-# AUTO-INDEXING SIGNALS FOR VECTOR SEARCH
-# ============================================================================
 
-import logging
-import threading
+@receiver(m2m_changed, sender=Article.tags.through)
+def learn_retagged_article(sender, instance, action, **kwargs):
+    """Tags are saved after the article itself — re-learn and re-index once they change."""
+    if action not in ('post_add', 'post_remove', 'post_clear') or not isinstance(instance, Article):
+        return
+    if instance.is_published and not instance.is_deleted:
+        side_effects.dispatch('tag_learning', instance.id)
+        side_effects.dispatch('vector_index', instance.id)
 
-logger = logging.getLogger(__name__)
 
+@side_effects.reaction('tag_learning')
+def _record_tag_choice(article_id):
+    try:
+        from ai_engine.modules.tag_suggester import record_tag_choice
+        article = Article.objects.filter(id=article_id, is_published=True, is_deleted=False).first()
+        if article:
+            record_tag_choice(article)
+    except Exception as e:
+        logger.error(f"[TAG-LEARN] Failed to record tags for [{article_id}]: {e}")
 
-def _remove_from_vector_async(article_id, title=""):
-    """Remove article from vector index in background thread (non-blocking)"""
-    def _remove():
-        try:
-            from ai_engine.modules.vector_search import get_vector_engine
-            engine = get_vector_engine()
-            engine.remove_article(article_id)
-            logger.info(f"🗑️ Removed article from vector index: {title} (ID: {article_id})")
-        except Exception as e:
-            logger.error(f"Failed to remove article {article_id} from vector index: {e}")
-    
-    thread = threading.Thread(target=_remove, daemon=True)
-    transaction.on_commit(lambda: thread.start())
 
+# ============================================================================
+# AUTO-INDEXING SIGNALS FOR VECTOR SEARCH
+# ============================================================================
 
 @receiver(post_save, sender=Article)
 def auto_index_article_vector(sender, instance, created, **kwargs):
@@ -188,52 +198,10 @@ def auto_index_article_vector(sender, instance, created, **kwargs):
     Automatically index article for vector search when saved
     Only indexes published, non-deleted articles
     """
-    # Only index published articles
-    if not instance.is_published or instance.is_deleted:
-        # If article was unpublished/deleted, remove from index
-        if not created:
-            _remove_from_vector_async(instance.id, instance.title)
-        return
-    
-    # Index the article in background thread
-    def _index():
-        try:
-            from ai_engine.modules.vector_search import get_vector_engine
-            
-            engine = get_vector_engine()
-            
-            # Prepare metadata
-            metadata = {
-                'slug': instance.slug,
-                'is_published': instance.is_published,
-                'created_at': instance.created_at.isoformat() if instance.created_at else None,
-            }
-            
-            # Add categories
-            if instance.categories.exists():
-                metadata['categories'] = [cat.slug for cat in instance.categories.all()]
-            
-            # Add tags
-            if instance.tags.exists():
-                metadata['tags'] = [tag.slug for tag in instance.tags.all()]
-            
-            # Index the article
-            engine.index_article(
-                article_id=instance.id,
-                title=instance.title,
-                content=instance.content,
-                summary=instance.summary or "",
-                metadata=metadata
-            )
-            
-            action = "📊 Indexed" if created else "🔄 Re-indexed"
-            logger.info(f"{action} article for vector search: {instance.title} (ID: {instance.id})")
-            
-        except Exception as e:
-            logger.error(f"Failed to auto-index article {instance.id} for vector search: {e}")
-    
-    thread = threading.Thread(target=_index, daemon=True)
-    transaction.on_commit(lambda: thread.start())
+    if created and (not instance.is_published or instance.is_deleted):
+        return  # Never indexed — nothing to add or remove
+    if side_effects.changed(instance, SEARCH_FIELDS):
+        side_effects.dispatch('vector_index', instance.id)
 
 
 @receiver(post_delete, sender=Article)
@@ -241,7 +209,49 @@ def auto_remove_from_vector_index(sender, instance, **kwargs):
     """
     Automatically remove article from vector index when deleted
     """
-    _remove_from_vector_async(instance.id, instance.title)
+    side_effects.dispatch('vector_index', instance.id)
+
+
+@side_effects.reaction('vector_index')
+def _sync_vector_index(article_id):
+    """Index the article as it is now — or remove it once unpublished, deleted or gone."""
+    from ai_engine.modules.vector_search import get_vector_engine
+
+    article = Article.objects.filter(id=article_id).first()
+    if article is None or not article.is_published or article.is_deleted:
+        try:
+            get_vector_engine().remove_article(article_id)
+            logger.info(f"🗑️ Removed article from vector index (ID: {article_id})")
+        except Exception as e:
+            logger.error(f"Failed to remove article {article_id} from vector index: {e}")
+        return
+
+    try:
+        engine = get_vector_engine()
+
+        # Prepare metadata
+        metadata = {
+            'slug': article.slug,
+            'is_published': article.is_published,
+            'created_at': article.created_at.isoformat() if article.created_at else None,
+        }
+        categories = [cat.slug for cat in article.categories.all()]
+        if categories:
+            metadata['categories'] = categories
+        tags = [tag.slug for tag in article.tags.all()]
+        if tags:
+            metadata['tags'] = tags
+
+        engine.index_article(
+            article_id=article.id,
+            title=article.title,
+            content=article.content,
+            summary=article.summary or "",
+            metadata=metadata
+        )
+        logger.info(f"📊 Indexed article for vector search: {article.title} (ID: {article.id})")
+    except Exception as e:
+        logger.error(f"Failed to auto-index article {article_id} for vector search: {e}")
 
 
 # ============================================================================
@@ -251,27 +261,60 @@ def auto_remove_from_vector_index(sender, instance, **kwargs):
 
 @receiver(post_save, sender=Article)
 def rebuild_content_recommender(sender, instance, **kwargs):
-    """Rebuild TF-IDF model when a published article is saved (debounced 5 min)."""
+    """Rebuild TF-IDF model when a published article's text changes (debounced 5 min)."""
     if not instance.is_published or instance.is_deleted:
         return
-    
-    def _rebuild():
-        try:
-            from django.core.cache import cache
-            lock_key = 'content_recommender_rebuild_lock'
-            if cache.get(lock_key):
-                return  # Already rebuilt recently
-            cache.set(lock_key, True, timeout=300)  # 5 min debounce
-            
-            from ai_engine.modules.content_recommender import build
-            result = build()
-            if result.get('success') and not result.get('skipped'):
-                logger.info(f"🧠 Content Recommender rebuilt: {result.get('article_count')} articles")
-        except Exception as e:
-            logger.error(f"❌ Content Recommender rebuild failed: {e}")
-    
-    thread = threading.Thread(target=_rebuild, daemon=True)
-    transaction.on_commit(lambda: thread.start())
+    if side_effects.changed(instance, SEARCH_FIELDS):
+        side_effects.dispatch('content_recommender')
+
+
+@side_effects.reaction('content_recommender')
+def _rebuild_content_recommender(_key=None):
+    try:
+        from django.core.cache import cache
+        lock_key = 'content_recommender_rebuild_lock'
+        if cache.get(lock_key):
+            return  # Already rebuilt recently
+        cache.set(lock_key, True, timeout=300)  # 5 min debounce
+
+        from ai_engine.modules.content_recommender import build
+        result = build()
+        if result.get('success') and not result.get('skipped'):
+            logger.info(f"🧠 Content Recommender rebuilt: {result.get('article_count')} articles")
+    except Exception as e:
+        logger.error(f"❌ Content Recommender rebuild failed: {e}")
+
+
+# ============================================================================
+# MATERIALISED RELATED ARTICLES
+# Recompute the article's related set on publish/edit (debounced per article);
+# drop it from every set when unpublished or deleted.
+# ============================================================================
+
+@receiver(post_save, sender=Article)
+def refresh_related_articles(sender, instance, created, **kwargs):
+    """Refresh RelatedArticle rows for a saved article (background)."""
+    is_live = instance.is_published and not instance.is_deleted
+    if not is_live and created:
+        return
+    if side_effects.changed(instance, SEARCH_FIELDS):
+        side_effects.dispatch('related_articles', instance.id)
+
+
+@side_effects.reaction('related_articles')
+def _refresh_related_articles(article_id):
+    try:
+        from news import related_articles
+        if not Article.objects.filter(id=article_id, is_published=True, is_deleted=False).exists():
+            related_articles.remove_article(article_id)
+            return
+        from django.core.cache import cache
+        if not cache.add(f'related_articles:refresh:{article_id}', 1, timeout=60):
+            return  # Refreshed within the last minute — the job catches later edits
+        related = related_articles.refresh_related(article_id)
+        logger.info(f"🔗 Related articles refreshed for {article_id}: {len(related)}")
+    except Exception as e:
+        logger.error(f"❌ Related articles refresh failed for {article_id}: {e}")
 
 # ============================================================================
 # AUTO-CREATE CAR SPECIFICATIONS ON ARTICLE PUBLISH
@@ -282,108 +325,106 @@ def auto_create_car_specs(sender, instance, **kwargs):
     """
     Automatically create CarSpecification when an article is published
     and doesn't have one yet. Uses AI to extract specs from content.
-    Runs in background thread to avoid blocking the save.
+    Runs in the side-effect pool to avoid blocking the save.
     """
     # Only process published, non-deleted articles
     if not instance.is_published or instance.is_deleted:
         return
 
-    # Skip if article already has a CarSpecification
-    from news.models import CarSpecification
-    if CarSpecification.objects.filter(article=instance).exists():
-        return
-
     # Skip known non-car articles
     from news.spec_extractor import SKIP_ARTICLE_IDS
     if instance.id in SKIP_ARTICLE_IDS:
         return
 
-    # Run AI extraction in background thread
-    article_id = instance.id
+    # Existing specs are checked in the reaction — one query per extraction,
+    # not per save
+    if side_effects.changed(instance, SPEC_SOURCE_FIELDS):
+        side_effects.dispatch('car_specs', instance.id)
 
-    def _extract():
-        import time
-        max_retries = 3
-        for attempt in range(max_retries):
-            try:
-                from news.spec_extractor import extract_specs_from_content, save_specs_for_article
-                # Re-check in case specs were created between signal fire and thread start
-                if CarSpecification.objects.filter(article_id=article_id).exists():
-                    logger.info(f"ℹ️ Specs already exist for [{article_id}], skipping")
-                    break
-                article = Article.objects.get(id=article_id)
-                specs = extract_specs_from_content(article)
-                if specs and specs.get('make') and specs['make'] != 'Not specified':
-                    result = save_specs_for_article(article, specs)
-                    if result:
-                        logger.info(f"🚗 Auto-created CarSpecification for [{article_id}] {result.make} {result.model}")
-                    else:
-                        logger.warning(f"⚠️ Could not save specs for [{article_id}]")
-                else:
-                    logger.info(f"ℹ️ No car specs extracted for [{article_id}] (not a car article?)")
-                    return  # Not a car article — skip VehicleSpecs too
-                break  # Success - exit retry loop
-            except Exception as e:
-                error_str = str(e)
-                if '429' in error_str and attempt < max_retries - 1:
-                    wait = 30 * (attempt + 1)
-                    logger.warning(f"⏳ Gemini rate limit for [{article_id}], retry in {wait}s (attempt {attempt+1}/{max_retries})")
-                    time.sleep(wait)
-                else:
-                    logger.error(f"❌ Auto-spec extraction failed for [{article_id}]: {e}")
-                    return
 
-        # ── Phase 2: Auto-create VehicleSpecs (car catalog card) ──
+@side_effects.reaction('car_specs')
+def _extract_car_specs(article_id):
+    import time
+    max_retries = 3
+    for attempt in range(max_retries):
         try:
-            if VehicleSpecs.objects.filter(article_id=article_id).exists():
-                logger.info(f"ℹ️ VehicleSpecs already exist for [{article_id}], skipping")
+            from news.spec_extractor import extract_specs_from_content, save_specs_for_article
+            # Re-check in case specs were created since the save
+            if CarSpecification.objects.filter(article_id=article_id).exists():
+                logger.info(f"ℹ️ Specs already exist for [{article_id}], skipping")
+                break
+            article = Article.objects.filter(id=article_id, is_published=True, is_deleted=False).first()
+            if article is None:
                 return
-
-            article = Article.objects.get(id=article_id)
-            car_spec = CarSpecification.objects.filter(article=article).first()
-            if not car_spec or not car_spec.make:
+            specs = extract_specs_from_content(article)
+            if specs and specs.get('make') and specs['make'] != 'Not specified':
+                result = save_specs_for_article(article, specs)
+                if result:
+                    logger.info(f"🚗 Auto-created CarSpecification for [{article_id}] {result.make} {result.model}")
+                else:
+                    logger.warning(f"⚠️ Could not save specs for [{article_id}]")
+            else:
+                logger.info(f"ℹ️ No car specs extracted for [{article_id}] (not a car article?)")
+                return  # Not a car article — skip VehicleSpecs too
+            break  # Success - exit retry loop
+        except Exception as e:
+            error_str = str(e)
+            if '429' in error_str and attempt < max_retries - 1:
+                wait = 30 * (attempt + 1)
+                logger.warning(f"⏳ Gemini rate limit for [{article_id}], retry in {wait}s (attempt {attempt+1}/{max_retries})")
+                time.sleep(wait)
+            else:
+                logger.error(f"❌ Auto-spec extraction failed for [{article_id}]: {e}")
                 return
 
-            # Step 1: ML Regex extraction (free, instant, 15-20 fields)
-            from ai_engine.modules.content_recommender import extract_specs_from_text
-            ml_specs = extract_specs_from_text(article.title, article.content)
+    # ── Phase 2: Auto-create VehicleSpecs (car catalog card) ──
+    try:
+        if VehicleSpecs.objects.filter(article_id=article_id).exists():
+            logger.info(f"ℹ️ VehicleSpecs already exist for [{article_id}], skipping")
+            return
 
-            # Add make/model from CarSpecification
-            ml_specs['make'] = car_spec.make
-            ml_specs['model_name'] = car_spec.model or ''
-            ml_specs['trim_name'] = car_spec.trim or ''
-            ml_specs['article'] = article
+        article = Article.objects.get(id=article_id)
+        car_spec = CarSpecification.objects.filter(article=article).first()
+        if not car_spec or not car_spec.make:
+            return
 
-            # Step 2: Try Gemini deep_specs to fill gaps (if available)
-            try:
-                from ai_engine.modules.deep_specs import generate_deep_vehicle_specs
-                deep_result = generate_deep_vehicle_specs(
-                    article,
-                    specs={'make': car_spec.make, 'model': car_spec.model, 'trim': car_spec.trim},
-                    provider='gemini',
-                )
-                if deep_result:
-                    logger.info(f"🤖 Deep specs generated for [{article_id}] via Gemini")
-                    return  # deep_specs already creates VehicleSpecs
-            except Exception as e:
-                logger.warning(f"⚠️ Gemini deep specs failed for [{article_id}], using ML-only: {e}")
-
-            # Step 3: Fallback — create VehicleSpecs from ML-only data
-            vs, created = VehicleSpecs.objects.update_or_create(
-                make=ml_specs.get('make', ''),
-                model_name=ml_specs.get('model_name', ''),
-                trim_name=ml_specs.get('trim_name', ''),
-                defaults={k: v for k, v in ml_specs.items()
-                          if k not in ('make', 'model_name', 'trim_name')},
-            )
-            action = "Created" if created else "Updated"
-            logger.info(f"📋 {action} VehicleSpecs for [{article_id}] {car_spec.make} {car_spec.model} (ML: {len(ml_specs)} fields)")
+        # Step 1: ML Regex extraction (free, instant, 15-20 fields)
+        from ai_engine.modules.content_recommender import extract_specs_from_text
+        ml_specs = extract_specs_from_text(article.title, article.content)
+
+        # Add make/model from CarSpecification
+        ml_specs['make'] = car_spec.make
+        ml_specs['model_name'] = car_spec.model or ''
+        ml_specs['trim_name'] = car_spec.trim or ''
+        ml_specs['article'] = article
 
+        # Step 2: Try Gemini deep_specs to fill gaps (if available)
+        try:
+            from ai_engine.modules.deep_specs import generate_deep_vehicle_specs
+            deep_result = generate_deep_vehicle_specs(
+                article,
+                specs={'make': car_spec.make, 'model': car_spec.model, 'trim': car_spec.trim},
+                provider='gemini',
+            )
+            if deep_result:
+                logger.info(f"🤖 Deep specs generated for [{article_id}] via Gemini")
+                return  # deep_specs already creates VehicleSpecs
         except Exception as e:
-            logger.error(f"❌ Auto VehicleSpecs failed for [{article_id}]: {e}")
+            logger.warning(f"⚠️ Gemini deep specs failed for [{article_id}], using ML-only: {e}")
+
+        # Step 3: Fallback — create VehicleSpecs from ML-only data
+        vs, created = VehicleSpecs.objects.update_or_create(
+            make=ml_specs.get('make', ''),
+            model_name=ml_specs.get('model_name', ''),
+            trim_name=ml_specs.get('trim_name', ''),
+            defaults={k: v for k, v in ml_specs.items()
+                      if k not in ('make', 'model_name', 'trim_name')},
+        )
+        action = "Created" if created else "Updated"
+        logger.info(f"📋 {action} VehicleSpecs for [{article_id}] {car_spec.make} {car_spec.model} (ML: {len(ml_specs)} fields)")
 
-    thread = threading.Thread(target=_extract, daemon=True)
-    transaction.on_commit(lambda: thread.start())
+    except Exception as e:
+        logger.error(f"❌ Auto VehicleSpecs failed for [{article_id}]: {e}")
 
 
 # ============================================================================
@@ -544,7 +585,8 @@ def auto_telegram_on_publish(sender, instance, created, **kwargs):
     - Skips if article was just created (AI pipeline handles its own posting)
     - Skips if already posted to Telegram (checks generation_metadata)
     - Skips if TELEGRAM_AUTO_POST is disabled
-    - Runs in background thread via on_commit
+    - Skips saves that don't change is_published/is_deleted
+    - Runs in the side-effect pool after commit
     """
     # Only care about updates (not initial creation — AI pipeline does that)
     if created:
@@ -564,53 +606,54 @@ def auto_telegram_on_publish(sender, instance, created, **kwargs):
     if not getattr(settings, 'TELEGRAM_AUTO_POST', False):
         return
 
-    article_id = instance.id
+    # Only on the publish itself, not on every later edit
+    if side_effects.changed(instance, PUBLISH_FIELDS):
+        side_effects.dispatch('telegram_publish', instance.id)
 
-    def _send():
-        try:
-            from ai_engine.modules.telegram_publisher import (
-                send_to_channel, format_telegram_post
-            )
-            from news.models import SocialPost, AutomationSettings as AS
-            from django.utils import timezone as tz
-            from django.db.models import F as F_expr
 
-            # Re-fetch to get fresh state
-            article = Article.objects.get(id=article_id)
+@side_effects.reaction('telegram_publish')
+def _send_to_telegram(article_id):
+    try:
+        from ai_engine.modules.telegram_publisher import (
+            send_to_channel, format_telegram_post
+        )
+        from news.models import SocialPost, AutomationSettings as AS
+        from django.utils import timezone as tz
+        from django.db.models import F as F_expr
 
-            # Double-check not already posted (race condition guard)
-            fresh_meta = article.generation_metadata or {}
-            if fresh_meta.get('telegram_post'):
-                return
+        # Re-fetch to get fresh state
+        article = Article.objects.get(id=article_id)
 
-            result = send_to_channel(article, force=True)  # force=True: we already checked the setting
-            if result.get('ok'):
-                msg_id = result.get('result', {}).get('message_id', '?')
-                logger.info(f"📱 Auto-posted to Telegram on manual publish: [{article_id}] (msg_id={msg_id})")
-                try:
-                    SocialPost.objects.create(
-                        article=article, platform='telegram', status='sent',
-                        message_text=format_telegram_post(article),
-                        external_id=str(msg_id),
-                        channel_id='@freshmotors_news',
-                        posted_at=tz.now(),
-                    )
-                    AS.objects.filter(pk=1).update(
-                        telegram_last_run=tz.now(),
-                        telegram_last_status=f'✅ Auto: {article.title[:50]}',
-                        telegram_today_count=F_expr('telegram_today_count') + 1,
-                    )
-                except Exception as sp_err:
-                    logger.warning(f"⚠️ SocialPost record failed: {sp_err}")
-            else:
-                desc = result.get('description', 'Unknown')
-                logger.warning(f"📱 Telegram auto-post failed for [{article_id}]: {desc}")
+        # Double-check not already posted or unpublished since (race condition guard)
+        fresh_meta = article.generation_metadata or {}
+        if fresh_meta.get('telegram_post') or not article.is_published or article.is_deleted:
+            return
 
-        except Exception as e:
-            logger.error(f"❌ auto_telegram_on_publish failed for [{article_id}]: {e}")
+        result = send_to_channel(article, force=True)  # force=True: we already checked the setting
+        if result.get('ok'):
+            msg_id = result.get('result', {}).get('message_id', '?')
+            logger.info(f"📱 Auto-posted to Telegram on manual publish: [{article_id}] (msg_id={msg_id})")
+            try:
+                SocialPost.objects.create(
+                    article=article, platform='telegram', status='sent',
+                    message_text=format_telegram_post(article),
+                    external_id=str(msg_id),
+                    channel_id='@freshmotors_news',
+                    posted_at=tz.now(),
+                )
+                AS.objects.filter(pk=1).update(
+                    telegram_last_run=tz.now(),
+                    telegram_last_status=f'✅ Auto: {article.title[:50]}',
+                    telegram_today_count=F_expr('telegram_today_count') + 1,
+                )
+            except Exception as sp_err:
+                logger.warning(f"⚠️ SocialPost record failed: {sp_err}")
+        else:
+            desc = result.get('description', 'Unknown')
+            logger.warning(f"📱 Telegram auto-post failed for [{article_id}]: {desc}")
 
-    thread = threading.Thread(target=_send, daemon=True)
-    transaction.on_commit(lambda: thread.start())
+    except Exception as e:
+        logger.error(f"❌ auto_telegram_on_publish failed for [{article_id}]: {e}")
 
 
 # ============================================================================
@@ -623,7 +666,7 @@ from news.models.interactions import ArticleCapsuleFeedback
 @receiver(post_save, sender=Article)
 def record_training_pair(sender, instance, created, **kwargs):
     """Record a training pair when an article is published with edits.
-    
+
     Captures: original AI content → final admin-edited content.
     Source can be PendingArticle.content or Article.content_original.
     """
@@ -633,117 +676,115 @@ def record_training_pair(sender, instance, created, **kwargs):
     if not instance.is_published or instance.is_deleted:
         return
 
-    # Need either content_original or a linked PendingArticle
-    input_text = ''
-    input_title = ''
-    source_type = 'manual'
-
-    # Strategy 1: content_original field (set by AI Editor)
-    if instance.content_original and instance.content_original.strip():
-        input_text = instance.content_original
-        input_title = instance.title  # title may not have changed
-
-    # Strategy 2: linked PendingArticle (has original AI-generated content)
-    if not input_text:
-        pending = instance.source_pending.first()
-        if pending:
-            input_text = pending.content
-            input_title = pending.title
-            if pending.rss_feed:
-                source_type = 'rss'
-            elif pending.video_url:
-                source_type = 'youtube'
-
-    # No source content found — nothing to record
-    if not input_text:
-        return
+    if side_effects.changed(instance, TRAINING_FIELDS):
+        side_effects.dispatch('training_pair', instance.id)
 
-    # Only create pair if content actually differs (admin made edits)
-    output_text = instance.content or ''
-    if input_text.strip() == output_text.strip():
-        return  # No edits made, skip
 
-    article_id = instance.id
-    final_source_type = source_type
-    final_input_title = input_title
-    final_input_text = input_text
-    final_output_text = output_text
-    final_output_title = instance.title
+@side_effects.reaction('training_pair')
+def _record_training_pair(article_id):
+    try:
+        article = Article.objects.filter(id=article_id, is_published=True, is_deleted=False).first()
+        if article is None:
+            return
 
-    def _record():
-        try:
-            from news.models.system import TrainingPair
-            TrainingPair.objects.update_or_create(
-                article_id=article_id,
-                pair_type='generation',
-                defaults={
-                    'source_type': final_source_type,
-                    'input_title': final_input_title[:500],
-                    'output_title': final_output_title[:500],
-                    'input_text': final_input_text,
-                    'output_text': final_output_text,
-                    'quality_signals': {
-                        'views': Article.objects.filter(id=article_id).values_list('views', flat=True).first() or 0,
-                        'engagement_score': Article.objects.filter(id=article_id).values_list('engagement_score', flat=True).first() or 0,
-                    },
-                },
-            )
-            logger.info(f"[TRAINING] 📝 Recorded generation pair for [{article_id}]")
-        except Exception as e:
-            logger.error(f"[TRAINING] ❌ Failed to record pair for [{article_id}]: {e}")
+        # Need either content_original or a linked PendingArticle
+        input_text = ''
+        input_title = ''
+        source_type = 'manual'
+
+        # Strategy 1: content_original field (set by AI Editor)
+        if article.content_original and article.content_original.strip():
+            input_text = article.content_original
+            input_title = article.title  # title may not have changed
+
+        # Strategy 2: linked PendingArticle (has original AI-generated content)
+        if not input_text:
+            pending = article.source_pending.first()
+            if pending:
+                input_text = pending.content
+                input_title = pending.title
+                if pending.rss_feed:
+                    source_type = 'rss'
+                elif pending.video_url:
+                    source_type = 'youtube'
+
+        # No source content found — nothing to record
+        if not input_text:
+            return
 
-    thread = threading.Thread(target=_record, daemon=True)
-    transaction.on_commit(lambda: thread.start())
+        # Only create pair if content actually differs (admin made edits)
+        output_text = article.content or ''
+        if input_text.strip() == output_text.strip():
+            return  # No edits made, skip
+
+        from news.models.system import TrainingPair
+        TrainingPair.objects.update_or_create(
+            article_id=article_id,
+            pair_type='generation',
+            defaults={
+                'source_type': source_type,
+                'input_title': input_title[:500],
+                'output_title': article.title[:500],
+                'input_text': input_text,
+                'output_text': output_text,
+                'quality_signals': {
+                    'views': article.views or 0,
+                    'engagement_score': article.engagement_score or 0,
+                },
+            },
+        )
+        logger.info(f"[TRAINING] 📝 Recorded generation pair for [{article_id}]")
+    except Exception as e:
+        logger.error(f"[TRAINING] ❌ Failed to record pair for [{article_id}]: {e}")
 
 
 @receiver(post_save, sender=ArticleCapsuleFeedback)
 def enrich_training_pair_quality(sender, instance, **kwargs):
     """Enrich TrainingPair quality_signals when capsule feedback arrives.
-    
+
     Aggregates positive/negative capsule votes into a capsule_score
     and updates the corresponding TrainingPair (if one exists).
     """
-    article_id = instance.article_id
+    side_effects.dispatch('training_pair_quality', instance.article_id)
 
-    def _enrich():
-        try:
-            from news.models.system import TrainingPair
-            pair = TrainingPair.objects.filter(
-                article_id=article_id, pair_type='generation'
-            ).first()
-            if not pair:
-                return  # No training pair for this article yet
-
-            # Aggregate capsule feedback
-            positive = ArticleCapsuleFeedback.objects.filter(
-                article_id=article_id, is_positive=True
-            ).count()
-            negative = ArticleCapsuleFeedback.objects.filter(
-                article_id=article_id, is_positive=False
-            ).count()
-            total = positive + negative
-
-            signals = pair.quality_signals or {}
-            signals['capsule_positive'] = positive
-            signals['capsule_negative'] = negative
-            signals['capsule_score'] = round(positive / total, 2) if total > 0 else None
-            # Refresh views and engagement from article
-            from news.models.content import Article as ArticleModel
-            article = ArticleModel.objects.filter(id=article_id).values(
-                'views', 'engagement_score'
-            ).first()
-            if article:
-                signals['views'] = article['views']
-                signals['engagement_score'] = float(article['engagement_score'] or 0)
-
-            pair.quality_signals = signals
-            pair.save(update_fields=['quality_signals', 'updated_at'])
-            logger.info(f"[TRAINING] 📊 Updated quality signals for [{article_id}]: score={signals.get('capsule_score')}")
-        except Exception as e:
-            logger.error(f"[TRAINING] ❌ Failed to enrich pair for [{article_id}]: {e}")
 
-    thread = threading.Thread(target=_enrich, daemon=True)
-    transaction.on_commit(lambda: thread.start())
+@side_effects.reaction('training_pair_quality')
+def _enrich_training_pair_quality(article_id):
+    try:
+        from news.models.system import TrainingPair
+        pair = TrainingPair.objects.filter(
+            article_id=article_id, pair_type='generation'
+        ).first()
+        if not pair:
+            return  # No training pair for this article yet
+
+        # Aggregate capsule feedback
+        positive = ArticleCapsuleFeedback.objects.filter(
+            article_id=article_id, is_positive=True
+        ).count()
+        negative = ArticleCapsuleFeedback.objects.filter(
+            article_id=article_id, is_positive=False
+        ).count()
+        total = positive + negative
+
+        signals = pair.quality_signals or {}
+        signals['capsule_positive'] = positive
+        signals['capsule_negative'] = negative
+        signals['capsule_score'] = round(positive / total, 2) if total > 0 else None
+        # Refresh views and engagement from article
+        from news.models.content import Article as ArticleModel
+        article = ArticleModel.objects.filter(id=article_id).values(
+            'views', 'engagement_score'
+        ).first()
+        if article:
+            signals['views'] = article['views']
+            signals['engagement_score'] = float(article['engagement_score'] or 0)
+
+        pair.quality_signals = signals
+        pair.save(update_fields=['quality_signals', 'updated_at'])
+        logger.info(f"[TRAINING] 📊 Updated quality signals for [{article_id}]: score={signals.get('capsule_score')}")
+    except Exception as e:
+        logger.error(f"[TRAINING] ❌ Failed to enrich pair for [{article_id}]: {e}")
 
 
 # ═══════════════════════════════════════════════════════════════════
@@ -757,21 +798,21 @@ def notify_search_engines_on_publish(sender, instance, **kwargs):
     """Submit newly published articles to IndexNow for instant indexing."""
     if not instance.is_published or instance.is_deleted:
         return
-    
+
     # Only trigger on actual publish (not every save of a published article)
-    update_fields = kwargs.get('update_fields')
-    if update_fields and 'is_published' not in update_fields:
-        return
-    
-    def _notify():
-        try:
-            from news.indexnow import notify_indexnow
-            article_path = f'/articles/{instance.slug}'
-            notify_indexnow(article_path)
-            logger.info(f"[INDEXNOW] Queued notification for: {instance.title[:50]}")
-        except Exception as e:
-            # Never break article save because of IndexNow failure
-            logger.warning(f"[INDEXNOW] Failed to notify: {e}")
-    
-    transaction.on_commit(_notify)
+    if side_effects.changed(instance, PUBLISH_FIELDS + ('slug',)):
+        side_effects.dispatch('indexnow', instance.id)
 
+
+@side_effects.reaction('indexnow')
+def _notify_indexnow(article_id):
+    try:
+        article = Article.objects.filter(id=article_id, is_published=True, is_deleted=False).first()
+        if article is None:
+            return
+        from news.indexnow import notify_indexnow
+        notify_indexnow(f'/articles/{article.slug}')
+        logger.info(f"[INDEXNOW] Queued notification for: {article.title[:50]}")
+    except Exception as e:
+        # Never break article save because of IndexNow failure
+        logger.warning(f"[INDEXNOW] Failed to notify: {e}")
@@ -1,19 +1,13 @@
 """
 Celery tasks for AutoNews background processing.
 
-These tasks replace the threading.Timer-based scheduler.
-Each task wraps the existing business logic from scheduler.py.
-
-All tasks:
-  1. GSC Sync (every 6h)
-  2. Currency Update (daily 3:30 AM)
-  3. RSS Scan (every 30 min, checks AutomationSettings)
-  4. YouTube Scan (every 30 min, checks AutomationSettings + daytime)
-  5. Auto Publish (every 10 min, checks AutomationSettings)
-  6. Scheduled Publish (every minute)
-  7. Deep Specs Backfill (every 6h)
-  8. A/B Lifecycle Cleanup (daily 4 AM)
-  9. Stale Error Cleanup (every 6h)
+Periodic jobs are defined once in news/scheduler.py and timed by
+news/job_scheduler.py. With SCHEDULER_MODE=celery, beat only runs
+``scheduler_tick``, which sends due jobs to workers as ``run_scheduled_job``.
+The per-job named tasks (gsc_sync, rss_scan, ...) are thin wrappers over the
+same run slots, so they can never overlap a scheduler-driven run.
+
+Async API tasks (regenerate, generate from YouTube, ...) are defined below.
 """
 import logging
 from celery import shared_task
@@ -62,517 +56,99 @@ def _log_scheduler_error(task_name, exception, severity='error'):
 
 
 # =============================================================================
-# 1. GSC Sync
+# Periodic jobs — bodies live in news/scheduler.py, timing in news/job_scheduler.py
 # =============================================================================
 
-@shared_task(name='news.tasks.gsc_sync', ignore_result=True)
-def gsc_sync():
-    """Sync Google Search Console data (every 6 hours)."""
-    close_old_connections()
+@shared_task(name='news.tasks.scheduler_tick', ignore_result=True)
+def scheduler_tick():
+    """
+    Beat-driven tick (SCHEDULER_MODE=celery): send every due job to a worker.
+    Occurrence claims in job_scheduler make duplicate ticks harmless.
+    """
+    from news import scheduler  # noqa: F401 — registers jobs
+    from news import job_scheduler
     try:
-        from news.services.gsc_service import GSCService
-        service = GSCService()
-        if service.service:
-            success = service.sync_data(days=7)
-            if success:
-                logger.info("[CELERY/GSC] Scheduled GSC sync completed successfully")
-            else:
-                logger.warning("[CELERY/GSC] Scheduled GSC sync returned failure")
-        else:
-            logger.warning("[CELERY/GSC] GSC Service not initialized — missing credentials")
+        job_scheduler.tick(job_scheduler._dispatch_celery)
     except Exception as e:
-        logger.error(f"[CELERY/GSC] GSC sync error: {e}")
-        _log_scheduler_error('gsc_sync', e)
-    finally:
-        close_old_connections()
+        logger.error(f"[CELERY/SCHEDULER] Tick failed: {e}", exc_info=True)
 
 
-# =============================================================================
-# 2. Currency Update
-# =============================================================================
-
-@shared_task(name='news.tasks.currency_update', ignore_result=True)
-def currency_update():
-    """Update USD price equivalents and exchange rates (daily)."""
+@shared_task(name='news.tasks.run_scheduled_job', ignore_result=True)
+def run_scheduled_job(job_name):
+    """Run one registered job under its cluster-wide run slot."""
+    from news import scheduler  # noqa: F401 — registers jobs
+    from news import job_scheduler
     close_old_connections()
     try:
-        from news.services.currency_service import update_all_usd_prices
-        updated, errors = update_all_usd_prices()
-        logger.info(f"[CELERY/CURRENCY] Currency update: {updated} prices updated, {errors} errors")
-    except Exception as e:
-        logger.error(f"[CELERY/CURRENCY] Currency update error: {e}")
-        _log_scheduler_error('currency_update', e)
-
-    # Also refresh exchange rates for AI prompt injection
-    try:
-        from ai_engine.modules.currency_service import fetch_and_cache_rates
-        fetch_and_cache_rates()
-    except Exception as e:
-        logger.warning(f"[CELERY/CURRENCY] Exchange rate fetch failed (non-critical): {e}")
+        job_scheduler.run_job(job_name)
     finally:
         close_old_connections()
 
 
-# =============================================================================
-# 3. RSS Scan
-# =============================================================================
-
-@shared_task(name='news.tasks.rss_scan', ignore_result=True)
-def rss_scan():
-    """Scan RSS feeds if enabled in AutomationSettings."""
+def _run_registered(job_name):
+    from news import scheduler  # noqa: F401 — registers jobs
+    from news import job_scheduler
     close_old_connections()
     try:
-        from news.models import AutomationSettings, RSSFeed
-        from ai_engine.modules.rss_aggregator import RSSAggregator
-        from django.utils import timezone
-        from django.db.models import F
-
-        settings = AutomationSettings.load()
-
-        if not settings.rss_scan_enabled:
-            return
-
-        if not AutomationSettings.acquire_lock('rss'):
-            logger.warning("[CELERY/RSS] Skipped — another RSS scan is already running")
-            return
-
-        settings.reset_daily_counters()
+        return job_scheduler.run_job(job_name)
+    finally:
+        close_old_connections()
 
-        logger.info("[CELERY/RSS] Auto RSS scan starting...")
-        aggregator = RSSAggregator()
-        feeds = RSSFeed.objects.filter(is_enabled=True)
 
-        total_created = 0
-        for feed in feeds:
-            try:
-                created = aggregator.process_feed(
-                    feed,
-                    limit=settings.rss_max_articles_per_scan
-                )
-                total_created += created
-            except Exception as e:
-                logger.error(f"[CELERY/RSS] Feed error '{feed.name}': {e}")
+# Named wrappers kept for manual `celery call` usage and existing beat entries.
 
-        # Score newly created pending articles
-        _score_new_pending_articles()
+@shared_task(name='news.tasks.gsc_sync', ignore_result=True)
+def gsc_sync():
+    """Sync Google Search Console data."""
+    _run_registered('gsc_sync')
 
-        # Update settings
-        AutomationSettings.objects.filter(pk=1).update(
-            rss_last_run=timezone.now(),
-            rss_last_status=f"✅ {total_created} articles from {feeds.count()} feeds",
-            rss_articles_today=F('rss_articles_today') + total_created
-        )
 
-        logger.info(f"[CELERY/RSS] Done: {total_created} articles from {feeds.count()} feeds")
+@shared_task(name='news.tasks.currency_update', ignore_result=True)
+def currency_update():
+    """Update USD price equivalents and exchange rates."""
+    _run_registered('currency_update')
 
-    except Exception as e:
-        logger.error(f"[CELERY/RSS] Fatal error: {e}", exc_info=True)
-        _log_scheduler_error('rss_scan', e)
-    finally:
-        close_old_connections()
 
+@shared_task(name='news.tasks.rss_scan', ignore_result=True)
+def rss_scan():
+    """Scan RSS feeds if enabled in AutomationSettings."""
+    _run_registered('rss_scan')
 
-# =============================================================================
-# 4. YouTube Scan
-# =============================================================================
 
 @shared_task(name='news.tasks.youtube_scan', ignore_result=True)
 def youtube_scan():
     """Scan YouTube channels if enabled in AutomationSettings."""
-    close_old_connections()
-    try:
-        from news.models import AutomationSettings, YouTubeChannel, PendingArticle, Article
-        from ai_engine.modules.youtube_client import YouTubeClient
-        from ai_engine.main import create_pending_article
-        from django.utils import timezone
-        from django.db.models import F
-
-        settings = AutomationSettings.load()
-
-        if not settings.youtube_scan_enabled:
-            return
-
-        # Daytime-only check
-        if settings.youtube_daytime_only:
-            try:
-                import pytz
-                israel_tz = pytz.timezone('Asia/Jerusalem')
-                current_hour = timezone.now().astimezone(israel_tz).hour
-            except ImportError:
-                current_hour = (timezone.now().hour + 2) % 24
-
-            start_h = settings.youtube_active_hours_start
-            end_h = settings.youtube_active_hours_end
-            if not (start_h <= current_hour < end_h):
-                logger.info(f"[CELERY/YOUTUBE] Night skip — {current_hour}:xx Israel time "
-                            f"(active: {start_h}:00-{end_h}:00)")
-                settings.youtube_last_status = f"🌙 Night skip ({current_hour}:xx, active {start_h}-{end_h})"
-                settings.youtube_last_run = timezone.now()
-                settings.save(update_fields=['youtube_last_status', 'youtube_last_run'])
-                return
-
-        # Acquire lock
-        if not AutomationSettings.acquire_lock('youtube'):
-            logger.warning("[CELERY/YOUTUBE] Skipped — another YouTube scan is already running")
-            return
-
-        settings.reset_daily_counters()
-
-        logger.info("[CELERY/YOUTUBE] Auto YouTube scan starting...")
-
-        try:
-            client = YouTubeClient()
-        except Exception as e:
-            logger.error(f"[CELERY/YOUTUBE] Client init failed: {e}")
-            settings.youtube_last_status = f"❌ Client error: {str(e)[:100]}"
-            settings.youtube_last_run = timezone.now()
-            settings.save(update_fields=['youtube_last_status', 'youtube_last_run'])
-            return
-
-        channels = YouTubeChannel.objects.filter(is_enabled=True)
-        total_created = 0
-
-        for channel in channels:
-            try:
-                videos = client.get_latest_videos(
-                    channel.channel_url,
-                    max_results=settings.youtube_max_videos_per_scan
-                )
-                if not videos:
-                    channel.last_checked = timezone.now()
-                    channel.save(update_fields=['last_checked'])
-                    continue
-            except Exception as e:
-                logger.error(f"[CELERY/YOUTUBE] Channel error '{channel.name}': {e}")
-                _log_scheduler_error('youtube_scan', e, severity='warning')
-                continue
-
-            for video in videos:
-                video_id = video['id']
-                video_url = video['url']
-                video_title = video['title']
-
-                # Skip duplicates
-                if Article.objects.filter(youtube_url=video_url).exists():
-                    continue
-                if video_id and PendingArticle.objects.filter(video_id=video_id).exists():
-                    continue
-
-                try:
-                    result = create_pending_article(
-                        youtube_url=video_url,
-                        channel_id=channel.id,
-                        video_title=video_title,
-                        video_id=video_id,
-                        generation_source='auto_youtube_scanner'
-                    )
-
-                    if result['success']:
-                        total_created += 1
-                        channel.last_video_id = video_id
-                        channel.videos_processed += 1
-                        channel.save()
-                except Exception as e:
-                    logger.error(f"[CELERY/YOUTUBE] Article error for '{video_title[:40]}': {e}")
-
-            channel.last_checked = timezone.now()
-            channel.save(update_fields=['last_checked'])
-
-        # Score newly created pending articles
-        _score_new_pending_articles()
-
-        # Update settings
-        AutomationSettings.objects.filter(pk=1).update(
-            youtube_last_run=timezone.now(),
-            youtube_last_status=f"✅ {total_created} articles from {channels.count()} channels",
-            youtube_articles_today=F('youtube_articles_today') + total_created
-        )
-
-        logger.info(f"[CELERY/YOUTUBE] Done: {total_created} articles from {channels.count()} channels")
+    _run_registered('youtube_scan')
 
-    except Exception as e:
-        logger.error(f"[CELERY/YOUTUBE] Fatal error: {e}", exc_info=True)
-        _log_scheduler_error('youtube_scan', e)
-    finally:
-        close_old_connections()
-
-
-# =============================================================================
-# 5. Auto Publish
-# =============================================================================
 
 @shared_task(name='news.tasks.auto_publish', ignore_result=True)
 def auto_publish():
     """Check for eligible pending articles and auto-publish."""
-    close_old_connections()
-    try:
-        from news.models import AutomationSettings
-        from ai_engine.modules.auto_publisher import auto_publish_pending
-        from django.utils import timezone
-
-        settings = AutomationSettings.load()
-
-        if not settings.auto_publish_enabled:
-            return
-
-        published, reason = auto_publish_pending()
-
-        settings.auto_publish_last_run = timezone.now()
-        settings.save(update_fields=['auto_publish_last_run'])
-
-        if published > 0:
-            logger.info(f"[CELERY/AUTO-PUBLISH] {published} articles published")
-            try:
-                from news.api_views._shared import invalidate_article_cache
-                invalidate_article_cache()
-            except Exception:
-                pass
-
-    except Exception as e:
-        logger.error(f"[CELERY/AUTO-PUBLISH] Fatal error: {e}", exc_info=True)
-        _log_scheduler_error('auto_publish', e)
-    finally:
-        close_old_connections()
+    _run_registered('auto_publish')
 
 
-# =============================================================================
-# 6. Scheduled Publish (every minute)
-# =============================================================================
-
 @shared_task(name='news.tasks.scheduled_publish', ignore_result=True)
 def scheduled_publish():
     """Publish articles whose scheduled_publish_at has arrived."""
-    close_old_connections()
-    try:
-        from django.utils import timezone
-        from news.models.content import Article
+    _run_registered('scheduled_publish')
 
-        now = timezone.now()
-        due_articles = Article.objects.filter(
-            is_published=False,
-            is_deleted=False,
-            scheduled_publish_at__isnull=False,
-            scheduled_publish_at__lte=now,
-        )
-
-        published_count = 0
-        for article in due_articles:
-            try:
-                meta = article.generation_metadata or {}
-                meta['telegram_post'] = 'scheduled'
-                article.generation_metadata = meta
-                article.is_published = True
-                article.scheduled_publish_at = None
-                article.save(update_fields=['is_published', 'scheduled_publish_at', 'generation_metadata'])
-                published_count += 1
-                logger.info(f"[CELERY/SCHEDULED] Published: {article.title[:60]}")
-
-                # Telegram auto-post
-                try:
-                    from news.models import AutomationSettings
-                    settings = AutomationSettings.load()
-                    if settings.telegram_enabled:
-                        from ai_engine.modules.telegram_publisher import send_to_channel
-                        tg_result = send_to_channel(article, force=True)
-
-                        # Create SocialPost audit record
-                        from news.models.system import SocialPost
-                        SocialPost.objects.create(
-                            article=article,
-                            platform='telegram',
-                            status='sent' if tg_result.get('ok') else 'failed',
-                            message_text='Scheduled auto-post',
-                            external_id=str(tg_result.get('result', {}).get('message_id', '')),
-                            channel_id=settings.telegram_channel_id,
-                            error_message=tg_result.get('description', '') if not tg_result.get('ok') else '',
-                            posted_at=now if tg_result.get('ok') else None,
-                        )
-
-                        if tg_result.get('ok'):
-                            settings.telegram_today_count += 1
-                            settings.telegram_last_run = now
-                            settings.telegram_last_status = f'Scheduled: {article.title[:60]}'
-                            settings.save(update_fields=['telegram_today_count', 'telegram_last_run', 'telegram_last_status'])
-                except Exception as tg_err:
-                    logger.warning(f"[CELERY/SCHEDULED] Telegram post failed for '{article.title[:40]}': {tg_err}")
-
-                # Invalidate cache
-                try:
-                    from news.api_views._shared import invalidate_article_cache
-                    invalidate_article_cache()
-                except Exception:
-                    pass
-
-            except Exception as e:
-                logger.error(f"[CELERY/SCHEDULED] Failed to publish '{article.title[:40]}': {e}")
-                _log_scheduler_error('scheduled_publish', e)
-
-        if published_count > 0:
-            logger.info(f"[CELERY/SCHEDULED] Published {published_count} scheduled articles")
-
-    except Exception as e:
-        logger.error(f"[CELERY/SCHEDULED] Fatal error: {e}", exc_info=True)
-        _log_scheduler_error('scheduled_publish', e)
-    finally:
-        close_old_connections()
-
-
-# =============================================================================
-# 7. Deep Specs Backfill
-# =============================================================================
 
 @shared_task(name='news.tasks.deep_specs_backfill', ignore_result=True)
 def deep_specs_backfill():
     """Auto-generate VehicleSpecs for published articles without them."""
-    close_old_connections()
-    try:
-        from django.utils import timezone
-        from datetime import timedelta
-        from news.models import Article, VehicleSpecs, AutomationSettings
-
-        settings = AutomationSettings.objects.first()
-        if not settings or not settings.deep_specs_enabled:
-            logger.info("[CELERY/DEEP-SPECS] Module disabled, skipping")
-            return
-
-        max_per_cycle = settings.deep_specs_max_per_cycle or 3
-        cutoff = timezone.now() - timedelta(hours=24)
-
-        articles_with_vehicle_specs = set(
-            VehicleSpecs.objects.values_list('article_id', flat=True)
-        )
-
-        candidates = list(
-            Article.objects
-            .filter(
-                is_published=True,
-                is_deleted=False,
-                created_at__lte=cutoff,
-                specs__isnull=False,
-            )
-            .exclude(id__in=articles_with_vehicle_specs)
-            .order_by('-views')[:max_per_cycle]
-        )
-
-        if not candidates:
-            status_msg = "All published articles have VehicleSpecs cards"
-            logger.info(f"[CELERY/DEEP-SPECS] {status_msg}")
-            settings.deep_specs_last_run = timezone.now()
-            settings.deep_specs_last_status = status_msg
-            settings.save(update_fields=['deep_specs_last_run', 'deep_specs_last_status'])
-            return
-
-        logger.info(f"[CELERY/DEEP-SPECS] Found {len(candidates)} articles without VehicleSpecs")
-
-        filled = 0
-        for article in candidates:
-            try:
-                from ai_engine.modules.deep_specs import generate_deep_vehicle_specs
-
-                specs_dict = {}
-                if hasattr(article, 'specs') and article.specs:
-                    car_spec = article.specs
-                    specs_dict = {
-                        'make': car_spec.make or '',
-                        'model': car_spec.model or '',
-                        'year': car_spec.release_date or '',
-                        'trim': car_spec.trim or '',
-                        'engine': car_spec.engine or '',
-                        'horsepower': car_spec.horsepower or '',
-                        'drivetrain': car_spec.drivetrain or '',
-                        'price': car_spec.price or '',
-                    }
-
-                logger.info(f"[CELERY/DEEP-SPECS] Generating VehicleSpecs for [{article.id}] {article.title[:50]}")
-                result = generate_deep_vehicle_specs(article, specs=specs_dict, provider='gemini')
-
-                if result:
-                    filled += 1
-                    logger.info(f"[CELERY/DEEP-SPECS] Created VehicleSpecs for '{article.title[:40]}'")
-                else:
-                    logger.warning(f"[CELERY/DEEP-SPECS] No result for '{article.title[:40]}'")
-
-            except Exception as e:
-                logger.error(f"[CELERY/DEEP-SPECS] Error for [{article.id}]: {e}")
-                continue
-
-        status_msg = f"Filled {filled}/{len(candidates)} VehicleSpecs cards"
-        logger.info(f"[CELERY/DEEP-SPECS] {status_msg}")
-
-        settings.deep_specs_last_run = timezone.now()
-        settings.deep_specs_last_status = status_msg
-        settings.deep_specs_today_count = (settings.deep_specs_today_count or 0) + filled
-        settings.save(update_fields=['deep_specs_last_run', 'deep_specs_last_status', 'deep_specs_today_count'])
-
-    except Exception as e:
-        logger.error(f"[CELERY/DEEP-SPECS] Fatal error: {e}", exc_info=True)
-        _log_scheduler_error('deep_specs', e)
-        try:
-            settings = AutomationSettings.objects.first()
-            if settings:
-                settings.deep_specs_last_status = f"Error: {str(e)[:200]}"
-                settings.save(update_fields=['deep_specs_last_status'])
-        except Exception:
-            pass
-    finally:
-        close_old_connections()
+    _run_registered('deep_specs')
 
 
-# =============================================================================
-# 8. A/B Lifecycle Cleanup
-# =============================================================================
-
 @shared_task(name='news.tasks.ab_lifecycle', ignore_result=True)
 def ab_lifecycle():
     """Daily A/B test lifecycle cleanup."""
-    close_old_connections()
-    try:
-        from news.scheduler import run_ab_test_lifecycle
-        result = run_ab_test_lifecycle()
-        logger.info(f"[CELERY/AB] A/B lifecycle complete: {result}")
-    except Exception as e:
-        logger.error(f"[CELERY/AB] A/B lifecycle error: {e}", exc_info=True)
-        _log_scheduler_error('ab_lifecycle', e)
-    finally:
-        close_old_connections()
+    _run_registered('ab_lifecycle')
 
 
-# =============================================================================
-# 9. Stale Error Cleanup
-# =============================================================================
-
 @shared_task(name='news.tasks.stale_error_cleanup', ignore_result=True)
 def stale_error_cleanup():
     """Auto-resolve errors older than 24h that haven't repeated recently."""
-    close_old_connections()
-    try:
-        from news.models.system import BackendErrorLog, FrontendEventLog
-        from django.utils import timezone
-        from datetime import timedelta
-
-        cutoff = timezone.now() - timedelta(hours=24)
-
-        stale_backend = BackendErrorLog.objects.filter(
-            resolved=False,
-            last_seen__lt=cutoff,
-        ).update(resolved=True, resolved_at=timezone.now(), resolution_notes='Auto-resolved: no recurrence in 24h')
-
-        try:
-            stale_frontend = FrontendEventLog.objects.filter(
-                resolved=False,
-                last_seen__lt=cutoff,
-            ).update(resolved=True, resolved_at=timezone.now(), resolution_notes='Auto-resolved: no recurrence in 24h')
-        except Exception:
-            stale_frontend = 0
-
-        total = stale_backend + stale_frontend
-        if total > 0:
-            logger.info(f"[CELERY/STALE-CLEANUP] Auto-resolved {total} stale errors ({stale_backend} backend, {stale_frontend} frontend)")
-
-    except Exception as e:
-        logger.warning(f"[CELERY/STALE-CLEANUP] Failed: {e}")
-    finally:
-        close_old_connections()
+    _run_registered('stale_error_cleanup')
 
 
 # =============================================================================
@@ -674,3 +250,57 @@ def generate_from_youtube_task(self, youtube_url, provider='gemini', user_id=Non
         return {'success': False, 'message': str(e)}
     finally:
         close_old_connections()
+
+
+@shared_task(
+    name='news.tasks.generate_pending_from_youtube_task',
+    ignore_result=True,
+    soft_time_limit=14 * 60,
+    time_limit=15 * 60,
+)
+def generate_pending_from_youtube_task(youtube_url, channel_id, video_title, video_id):
+    """
+    Generate a PendingArticle for one video found by the YouTube scan.
+    Enqueued by scan_youtube_channels when YOUTUBE_SCAN_ENQUEUE_GENERATION is on,
+    so throughput is bounded by the worker pool instead of the scan loop.
+    """
+    close_old_connections()
+    try:
+        from ai_engine.main import create_pending_article
+        from news.models import YouTubeChannel
+        from django.db.models import F
+
+        result = create_pending_article(
+            youtube_url=youtube_url,
+            channel_id=channel_id,
+            video_title=video_title,
+            video_id=video_id,
+            generation_source='auto_youtube_scanner'
+        )
+        if result.get('success'):
+            YouTubeChannel.objects.filter(id=channel_id).update(
+                last_video_id=video_id,
+                videos_processed=F('videos_processed') + 1,
+            )
+            _score_new_pending_articles()
+    except Exception as e:
+        logger.error(f"[CELERY/YOUTUBE_GEN] Generation failed for {youtube_url}: {e}")
+        _log_scheduler_error('youtube_generation', e)
+    finally:
+        close_old_connections()
+
+
+@shared_task(name='news.tasks.run_side_effect', ignore_result=True)
+def run_side_effect(name, key=None):
+    """
+    One coalesced Article side effect (news/side_effects.py), queued here
+    instead of the in-process pool when SIDE_EFFECT_BACKEND=celery.
+    """
+    close_old_connections()
+    try:
+        from news import side_effects
+        side_effects.run(name, key)
+    except Exception as e:
+        logger.error(f"[CELERY/SIDE_EFFECT] {name}[{key}] failed: {e}")
+    finally:
+        close_old_connections()
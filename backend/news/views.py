@@ -67,9 +67,9 @@ def serve_media_with_cors(request, path):
     return response
 
 
-from django.views.decorators.cache import cache_page
+from .cache_versions import versioned_cache_page
 
-@cache_page(86400, key_prefix='robots_txt')  # Cache for 24 hours — content is static
+@versioned_cache_page(86400, 'robots_txt')  # Cache for 24 hours — content is static
 def robots_txt(request):
     """Serve robots.txt for search engine crawlers"""
     from django.http import HttpResponse
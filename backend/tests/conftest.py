@@ -31,6 +31,15 @@ django.setup()
 from django.conf import settings
 settings.AXES_ENABLED = False
 
+# Run signal side effects (news/side_effects.py) without the coalescing
+# window — tests that save and then briefly wait expect them promptly.
+settings.SIDE_EFFECT_COALESCE_SECONDS = 0
+
+# Keep ai_engine.modules.web_fetch from serving mocked responses out of its
+# on-disk HTTP cache or remembered failures across tests.
+settings.WEB_FETCH_CACHE_MAX_MB = 0
+settings.WEB_FETCH_NEGATIVE_TTL = 0
+
 
 @pytest.fixture
 def sample_analysis():
@@ -97,14 +106,16 @@ def _disable_heavy_signals():
     NOTE: sync_vehicle_specs_to_car_spec and sync_car_spec_tags are NOT disabled here
     because they are synchronous (no threads) and are tested directly in TestSignals.
     """
-    from django.db.models.signals import post_save, post_delete
+    from django.db.models.signals import post_save, post_delete, m2m_changed
 
     from news.signals import (
         auto_index_article_vector,
         auto_remove_from_vector_index,
         rebuild_content_recommender,
+        refresh_related_articles,
         auto_create_car_specs,
         learn_tag_choices,
+        learn_retagged_article,
         log_human_review_decision,
     )
     from news.models import Article
@@ -113,9 +124,11 @@ def _disable_heavy_signals():
     post_save.disconnect(auto_index_article_vector, sender=Article)
     post_delete.disconnect(auto_remove_from_vector_index, sender=Article)
     post_save.disconnect(rebuild_content_recommender, sender=Article)
+    post_save.disconnect(refresh_related_articles, sender=Article)
     post_save.disconnect(auto_create_car_specs, sender=Article)
     post_save.disconnect(learn_tag_choices, sender=Article)
     post_save.disconnect(log_human_review_decision, sender=Article)
+    m2m_changed.disconnect(learn_retagged_article, sender=Article.tags.through)
 
     yield
 
@@ -123,6 +136,36 @@ def _disable_heavy_signals():
     post_save.connect(auto_index_article_vector, sender=Article)
     post_delete.connect(auto_remove_from_vector_index, sender=Article)
     post_save.connect(rebuild_content_recommender, sender=Article)
+    post_save.connect(refresh_related_articles, sender=Article)
     post_save.connect(auto_create_car_specs, sender=Article)
     post_save.connect(learn_tag_choices, sender=Article)
     post_save.connect(log_human_review_decision, sender=Article)
+    m2m_changed.connect(learn_retagged_article, sender=Article.tags.through)
+
+
+@pytest.fixture(autouse=True)
+def _reset_phrase_vocabularies():
+    """
+    Drop compiled brand/tag vocabularies between tests — the test DB is rolled
+    back without firing the signals that normally invalidate them.
+    """
+    from ai_engine.modules import phrase_matcher
+    phrase_matcher.invalidate(shared=False)
+    yield
+
+
+@pytest.fixture(autouse=True)
+def _reset_in_memory_indexes():
+    """Same for the competitor and internal-link indexes — rolled-back rows must not linger."""
+    from ai_engine.modules import competitor_index, link_index
+    competitor_index.invalidate(shared=False)
+    link_index.invalidate(shared=False)
+    yield
+
+
+@pytest.fixture(autouse=True)
+def _reset_rate_limiter():
+    """Fresh AI rate limiter buckets — tests that mock provider calls must not drain them for the next."""
+    from ai_engine.modules import rate_limiter
+    rate_limiter.reset()
+    yield
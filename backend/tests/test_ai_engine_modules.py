@@ -243,6 +243,121 @@ class TestSearchCarDetails:
         result = search_car_details('UnknownBrand', 'UnknownModel')
         assert isinstance(result, str)
 
+    @patch('ai_engine.modules.searcher.HAS_GOOGLE', False)
+    @patch('ai_engine.modules.searcher.HAS_DDGS', True)
+    @patch('ai_engine.modules.searcher._search_ddgs')
+    @patch('ai_engine.modules.searcher._search_direct_sites')
+    @patch('ai_engine.modules.searcher._scrape_page_content', return_value='Page text')
+    def test_urls_deduplicated_across_engines(self, mock_scrape, mock_direct, mock_ddgs):
+        from ai_engine.modules.searcher import search_car_details
+        mock_direct.side_effect = lambda make, model, per_site, sites: [
+            {'title': 'BYD Seal review', 'url': 'https://www.cnevpost.com/byd-seal/',
+             'desc': 'EV review', 'trusted': True},
+        ] if sites[0]['name'] == 'CNEVPost' else []
+        mock_ddgs.return_value = [
+            {'title': 'BYD Seal review', 'url': 'http://cnevpost.com/byd-seal?utm_source=ddg',
+             'desc': 'EV review', 'trusted': True},
+        ]
+        result = search_car_details('BYD', 'Seal', 2026)
+        assert result.count('Source: BYD Seal review') == 1
+        assert 'https://www.cnevpost.com/byd-seal/' in result  # direct-site tier wins
+        assert 'Page Content:\nPage text' in result
+        mock_scrape.assert_called_once()
+
+    @patch('ai_engine.modules.searcher.HAS_GOOGLE', False)
+    @patch('ai_engine.modules.searcher.HAS_DDGS', True)
+    @patch('ai_engine.modules.searcher._search_ddgs')
+    @patch('ai_engine.modules.searcher._search_direct_sites')
+    @patch('ai_engine.modules.searcher._scrape_page_content', return_value='')
+    def test_deadline_returns_results_ready_so_far(self, mock_scrape, mock_direct, mock_ddgs):
+        import threading
+        import time
+        from ai_engine.modules.searcher import search_car_details
+        release = threading.Event()
+        mock_direct.side_effect = lambda make, model, per_site, sites: [
+            {'title': f'Tesla Model 3 on {sites[0]["name"]}', 'url': f'https://{sites[0]["domain"]}/model-3',
+             'desc': 'EV specs', 'trusted': True},
+        ]
+        mock_ddgs.side_effect = lambda query, max_results: release.wait(5) and []
+        try:
+            started = time.monotonic()
+            result = search_car_details('Tesla', 'Model 3', deadline=0.5)
+            assert time.monotonic() - started < 2
+        finally:
+            release.set()
+        assert 'Tesla Model 3 on CNEVPost' in result
+
+    @patch('ai_engine.modules.searcher.HAS_GOOGLE', True)
+    @patch('ai_engine.modules.searcher.HAS_DDGS', True)
+    @patch('ai_engine.modules.searcher._search_google')
+    @patch('ai_engine.modules.searcher._search_ddgs')
+    @patch('ai_engine.modules.searcher._search_direct_sites', return_value=[])
+    @patch('ai_engine.modules.searcher._scrape_page_content', return_value='')
+    def test_google_only_a_fallback(self, mock_scrape, mock_direct, mock_ddgs, mock_google):
+        from ai_engine.modules.searcher import _gather_results
+        hit = {'title': 'Tesla Model 3 review', 'url': 'https://example.com/model-3',
+               'desc': 'EV specs', 'trusted': False}
+        mock_google.return_value = [dict(hit, url='https://example.com/google')]
+        queries = ['q1', 'q2', 'q3']
+
+        mock_ddgs.return_value = [hit]
+        results, complete = _gather_results('Tesla', 'Model 3', queries, 5)
+        assert complete and [r['url'] for r in results] == [hit['url']]
+        mock_google.assert_not_called()
+
+        mock_ddgs.return_value = []
+        results, _ = _gather_results('Tesla', 'Model 3', queries, 5)
+        assert [r['url'] for r in results] == ['https://example.com/google']
+        assert mock_google.call_count == 2  # first two queries only
+
+        mock_google.reset_mock()
+        _gather_results('Tesla', 'Model 3', queries, 5, google_min_results=0)
+        mock_google.assert_not_called()
+
+    @patch('ai_engine.modules.searcher.HAS_GOOGLE', True)
+    @patch('ai_engine.modules.searcher.HAS_DDGS', True)
+    @patch('ai_engine.modules.searcher._search_google')
+    @patch('ai_engine.modules.searcher._search_ddgs')
+    @patch('ai_engine.modules.searcher._search_direct_sites', return_value=[])
+    @patch('ai_engine.modules.searcher._scrape_page_content', return_value='')
+    def test_google_starts_at_sub_deadline_when_short(self, mock_scrape, mock_direct, mock_ddgs, mock_google):
+        import threading
+        import time
+        from ai_engine.modules.searcher import _gather_results
+        release = threading.Event()
+        mock_ddgs.side_effect = lambda query, max_results: release.wait(5) and []
+        mock_google.return_value = [{'title': 'Tesla Model 3 review', 'url': 'https://example.com/google',
+                                     'desc': 'EV specs', 'trusted': False}]
+        try:
+            started = time.monotonic()
+            results, complete = _gather_results('Tesla', 'Model 3', ['q1'], 1.0, google_after=0.2)
+            assert time.monotonic() - started < 2
+        finally:
+            release.set()
+        assert not complete  # DuckDuckGo still hanging at the deadline
+        assert [r['url'] for r in results] == ['https://example.com/google']
+
+    @patch('ai_engine.modules.searcher._search_ddgs', return_value=[])
+    @patch('ai_engine.modules.searcher._search_direct_sites')
+    @patch('ai_engine.modules.searcher._scrape_page_content', return_value='')
+    def test_context_cached_per_car(self, mock_scrape, mock_direct, mock_ddgs):
+        from django.core.cache import cache
+        from django.test import override_settings
+        from ai_engine.modules.searcher import search_car_details
+        mock_direct.return_value = [
+            {'title': 'Zeekr 001 long-term review', 'url': 'https://insideevs.com/zeekr-001',
+             'desc': 'EV review', 'trusted': True},
+        ]
+        locmem = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'web-context'}}
+        with override_settings(CACHES=locmem):
+            cache.clear()
+            first = search_car_details('Zeekr', '001', 2025)
+            calls = mock_direct.call_count
+            assert search_car_details('ZEEKR', ' 001', 2025) == first
+            assert mock_direct.call_count == calls
+            search_car_details('Zeekr', '001', 2026)
+            assert mock_direct.call_count == 2 * calls
+
 
 class TestGetWebContext:
 
@@ -437,15 +437,18 @@ class TestAutomationViews:
         resp = staff_client.get('/api/v1/automation/stats/', **UA)
         assert resp.status_code == 200
 
-    def test_trigger_rss(self, staff_client):
+    @patch('threading.Thread.start')  # don't run real scans against the test DB
+    def test_trigger_rss(self, mock_start, staff_client):
         resp = staff_client.post('/api/v1/automation/trigger/rss/', **UA)
         assert resp.status_code in (200, 202, 500)
 
-    def test_trigger_youtube(self, staff_client):
+    @patch('threading.Thread.start')
+    def test_trigger_youtube(self, mock_start, staff_client):
         resp = staff_client.post('/api/v1/automation/trigger/youtube/', **UA)
         assert resp.status_code in (200, 202, 500)
 
-    def test_trigger_auto_publish(self, staff_client):
+    @patch('threading.Thread.start')
+    def test_trigger_auto_publish(self, mock_start, staff_client):
         resp = staff_client.post('/api/v1/automation/trigger/auto-publish/', **UA)
         assert resp.status_code in (200, 202, 500)
 
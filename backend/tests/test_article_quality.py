@@ -8,6 +8,7 @@ Tests for the article generation quality pipeline:
 """
 import pytest
 import re
+from unittest.mock import patch
 
 
 # ── Import the functions under test ──────────────────────────────────
@@ -23,6 +24,7 @@ from ai_engine.modules.article_generator import (
     _check_self_consistency,
     _clean_source_typos,
     _reduce_repetition,
+    post_process_article,
 )
 
 
@@ -291,3 +293,71 @@ class TestEdgeCases:
         result = _clean_source_typos(html)
         assert 'starting price' in result
         assert 'السيارة' in result  # Arabic chars preserved
+
+
+# ═══════════════════════════════════════════════════════════════════════
+# 7. Gated pipeline (post_process_article)
+# ═══════════════════════════════════════════════════════════════════════
+
+_PIPELINE_SAMPLE = '''<h2>2026 BYD Seal 07 Review</h2>
+<p>The 2026 BYD Seal 07 is a game-changer with a 82.5 kWh battery and staring price of CNY 189,800.</p>
+<p>The 2026 BYD Seal 07 offers 530 hp. The 2026 BYD Seal 07 charges fast. The 2026 BYD Seal 07 looks sharp.</p>
+<p>The 2026 BYD Seal 07 comes with a 82 kWh pack according to some sources, and a range of 620 km.</p>
+<h2>How It Compares</h2>
+<div class="compare-grid">
+<div class="compare-card featured"><div class="compare-card-name">BYD Seal 07</div><div class="compare-row"><span class="k">Range</span><span class="v">620 km</span></div></div>
+<div class="compare-card"><div class="compare-card-name">Tesla Model 3</div><div class="compare-row"><span class="k">Power</span><span class="v">N/A</span></div></div>
+</div>
+<h2>Pros &amp; Cons</h2>
+<ul><li>Detailed suspension specs are not yet confirmed</li><li>Strong value</li></ul>'''
+
+
+class TestGatedPipeline:
+
+    @pytest.mark.parametrize('html', [
+        _PIPELINE_SAMPLE,
+        '<h2>Title</h2><p>Plain paragraph without any trigger markers at all.</p>',
+        '## Heading\n\nSome **bold** markdown text\n\n* item one\n* item two',
+        '',
+    ])
+    def test_gated_output_matches_all_passes(self, html):
+        """Skipping passes by marker must never change the output."""
+        from ai_engine.modules.article_post_processor import _run_pipeline
+        with patch('ai_engine.modules.currency_service.get_cached_rates', return_value=None):
+            assert _run_pipeline(html) == _run_pipeline(html, gated=False)
+            assert post_process_article(html, ['Tesla']) == _run_pipeline(html, ['Tesla'], gated=False)
+
+    def test_passes_without_markers_are_skipped(self):
+        from ai_engine.modules.article_post_processor import _run_pipeline
+        timings = {}
+        _run_pipeline('<h2>Title</h2><h3>Only headings here</h3>', timings=timings)
+        assert 'repair_compare_grid' not in timings
+        assert 'validate_prices' not in timings
+        assert 'ensure_html_only' in timings
+
+    def test_typo_anchors_cover_every_rule(self):
+        """Each typo rule is gated by an anchor present whenever the rule matches."""
+        from ai_engine.modules.article_post_processor import _COMMON_TYPOS, _TYPO_RULES
+        assert all(anchor for _, _, anchor in _TYPO_RULES.rules)
+        for text in ('X9 staring', 'the staring EREV', 'SUV SUV', 'LUXARY trim'):
+            assert any(p.search(text) for p, _ in _COMMON_TYPOS)
+            present = _TYPO_RULES.anchors_in(text)
+            for pattern, _, anchor in _TYPO_RULES.rules:
+                if pattern.search(text):
+                    assert anchor in present
+
+    def test_normalize_compare_rows_large_grid(self):
+        """Depth scanner finds the grid end without per-character slicing."""
+        from ai_engine.modules.article_post_processor import _normalize_compare_rows
+        filler = '<p>' + 'x' * 200_000 + '</p>'
+        html = (
+            '<div class="compare-grid">'
+            '<div class="compare-card featured"><div class="compare-card-name">A</div>'
+            '<div class="compare-row"><span class="k">Range</span><span class="v">600 km</span></div></div>'
+            '<div class="compare-card"><div class="compare-card-name">B</div>'
+            '<div class="compare-row"><span class="k">Power</span><span class="v">300 hp</span></div></div>'
+            '</div>' + filler
+        )
+        result = _normalize_compare_rows(html)
+        assert result.endswith(filler)
+        assert result.count('<span class="k">Range</span>') == 2
@@ -72,7 +72,7 @@ class TestClassifyLicense:
 
 class TestScrapePageContent:
 
-    @patch('ai_engine.modules.searcher.requests.get')
+    @patch('ai_engine.modules.searcher.web_fetch.get')
     def test_timeout(self, mock_get):
         """L129-131: Timeout → empty string."""
         import requests as req
@@ -80,7 +80,7 @@ class TestScrapePageContent:
         mock_get.side_effect = req.exceptions.Timeout()
         assert _scrape_page_content('https://example.com') == ""
 
-    @patch('ai_engine.modules.searcher.requests.get')
+    @patch('ai_engine.modules.searcher.web_fetch.get')
     def test_non_html_content(self, mock_get):
         """L76-77: Non-HTML → empty string."""
         from ai_engine.modules.searcher import _scrape_page_content
@@ -89,7 +89,7 @@ class TestScrapePageContent:
         mock_get.return_value = mock_resp
         assert _scrape_page_content('https://example.com/doc.pdf') == ""
 
-    @patch('ai_engine.modules.searcher.requests.get')
+    @patch('ai_engine.modules.searcher.web_fetch.get')
     def test_no_body(self, mock_get):
         """L105-106: No body tag → empty string."""
         from ai_engine.modules.searcher import _scrape_page_content
@@ -100,7 +100,7 @@ class TestScrapePageContent:
         mock_get.return_value = mock_resp
         assert _scrape_page_content('https://example.com') == ""
 
-    @patch('ai_engine.modules.searcher.requests.get')
+    @patch('ai_engine.modules.searcher.web_fetch.get')
     def test_successful_scrape(self, mock_get):
         """L94-127: Successful scrape with article content."""
         from ai_engine.modules.searcher import _scrape_page_content
@@ -115,7 +115,7 @@ class TestScrapePageContent:
         result = _scrape_page_content('https://example.com')
         assert 'BYD Seal' in result
 
-    @patch('ai_engine.modules.searcher.requests.get')
+    @patch('ai_engine.modules.searcher.web_fetch.get')
     def test_truncation_at_sentence(self, mock_get):
         """L119-125: Content > max_chars → truncated at sentence boundary."""
         from ai_engine.modules.searcher import _scrape_page_content
@@ -187,7 +187,7 @@ class TestGetWebContext:
 
 class TestSearchBingImages:
 
-    @patch('ai_engine.modules.searcher.requests.get')
+    @patch('ai_engine.modules.searcher.web_fetch.get')
     def test_bing_non_200(self, mock_get):
         """L498-500: Non-200 → empty list."""
         from ai_engine.modules.searcher import _search_bing_images
@@ -196,7 +196,7 @@ class TestSearchBingImages:
         mock_get.return_value = mock_resp
         assert _search_bing_images('test') == []
 
-    @patch('ai_engine.modules.searcher.requests.get')
+    @patch('ai_engine.modules.searcher.web_fetch.get')
     def test_bing_exception(self, mock_get):
         """L545-547: Exception → empty list."""
         from ai_engine.modules.searcher import _search_bing_images
@@ -370,7 +370,7 @@ class TestRSSAggregator:
         entry.published_parsed = (2026, 2, 21, 12, 0, 0, 0, 0, 0)
         result = agg.parse_entry_date(entry)
         assert result is not None
-    @patch('requests.get')
+    @patch('ai_engine.modules.web_fetch.get')
     def test_extract_og_image(self, mock_get):
         """L246-268: og:image extraction."""
         agg = self._make_agg()
@@ -387,7 +387,7 @@ class TestRSSAggregator:
         assert agg.extract_og_image('') is None
         assert agg.extract_og_image(None) is None
 
-    @patch('requests.get')
+    @patch('ai_engine.modules.web_fetch.get')
     def test_extract_og_image_error(self, mock_get):
         """L295-297: Exception → None."""
         agg = self._make_agg()
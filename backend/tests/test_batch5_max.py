@@ -176,7 +176,7 @@ class TestGenerateAiImage:
 class TestValidateFeed:
 
     @patch('feedparser.parse')
-    @patch('ai_engine.modules.feed_discovery.requests.get')
+    @patch('ai_engine.modules.feed_discovery.web_fetch.get')
     def test_valid_feed(self, mock_get, mock_fp):
         """L202-222: Valid feed returns title + entry_count."""
         from ai_engine.modules.feed_discovery import _validate_feed
@@ -192,7 +192,7 @@ class TestValidateFeed:
         assert result['valid'] is True
         assert result['entry_count'] == 2
 
-    @patch('ai_engine.modules.feed_discovery.requests.get')
+    @patch('ai_engine.modules.feed_discovery.web_fetch.get')
     def test_invalid_status(self, mock_get):
         """L212-213: Non-200 → invalid."""
         from ai_engine.modules.feed_discovery import _validate_feed
@@ -202,7 +202,7 @@ class TestValidateFeed:
         result = _validate_feed('https://example.com/feed')
         assert result['valid'] is False
 
-    @patch('ai_engine.modules.feed_discovery.requests.get')
+    @patch('ai_engine.modules.feed_discovery.web_fetch.get')
     def test_exception(self, mock_get):
         """L226-228: Exception → invalid."""
         from ai_engine.modules.feed_discovery import _validate_feed
@@ -213,7 +213,7 @@ class TestValidateFeed:
 
 class TestAutoDetectRSS:
 
-    @patch('ai_engine.modules.feed_discovery.requests.get')
+    @patch('ai_engine.modules.feed_discovery.web_fetch.get')
     def test_detect_from_link_tag(self, mock_get):
         """L164-177: RSS link tag in HTML."""
         from ai_engine.modules.feed_discovery import _auto_detect_rss
@@ -225,7 +225,7 @@ class TestAutoDetectRSS:
         assert result is not None
         assert 'feed' in result
 
-    @patch('ai_engine.modules.feed_discovery.requests.get')
+    @patch('ai_engine.modules.feed_discovery.web_fetch.get')
     def test_detect_not_found(self, mock_get):
         """L161-162: Non-200 → None."""
         from ai_engine.modules.feed_discovery import _auto_detect_rss
@@ -235,7 +235,7 @@ class TestAutoDetectRSS:
         result = _auto_detect_rss('https://example.com')
         assert result is None
 
-    @patch('ai_engine.modules.feed_discovery.requests.get')
+    @patch('ai_engine.modules.feed_discovery.web_fetch.get')
     def test_detect_exception(self, mock_get):
         """L197-199: RequestException → None."""
         import requests
@@ -0,0 +1,177 @@
+"""
+Tests for news/batch_runner.py — the shared runner behind the bulk AI
+maintenance commands: retries with backoff, checkpoint resume, rate
+budgets, quota waits and cost estimates. No AI calls are made.
+"""
+from io import StringIO
+from unittest.mock import patch
+
+import pytest
+
+from news import batch_runner
+from news.batch_runner import BatchRunner, Checkpoint, RateBudget, wait_for_models
+
+
+def _runner(job='test_job', tier=None, checkpoint=False, **options):
+    options.setdefault('workers', 2)
+    return BatchRunner(job, options, params={'job': job}, tier=tier,
+                       checkpoint=checkpoint, stdout=StringIO())
+
+
+@pytest.fixture(autouse=True)
+def no_sleep():
+    with patch.object(batch_runner.time, 'sleep') as sleep:
+        yield sleep
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Running items
+# ═══════════════════════════════════════════════════════════════════
+
+class TestRun:
+
+    def test_statuses_are_counted(self):
+        runner = _runner()
+        with patch('django.db.connection.close'):
+            stats = runner.run([1, 2, 3], lambda key, log: 'skipped' if key == 2 else 'created')
+        assert stats == {'created': 2, 'skipped': 1}
+        assert '3/3' in runner.stdout.getvalue()
+
+    def test_failing_item_retried_with_backoff(self, no_sleep):
+        attempts = []
+
+        def process(key, log):
+            attempts.append(key)
+            if len(attempts) < 3:
+                raise RuntimeError('503 upstream')
+            return 'created'
+
+        with patch('django.db.connection.close'):
+            stats = _runner(retries=2).run([7], process)
+        assert stats == {'created': 1}
+        assert len(attempts) == 3
+        delays = [c.args[0] for c in no_sleep.call_args_list]
+        assert len(delays) == 2 and delays[1] > delays[0]
+
+    def test_item_failed_after_retries_are_spent(self):
+        def process(key, log):
+            raise RuntimeError('bad item')
+
+        runner = _runner(retries=1)
+        with patch('django.db.connection.close'):
+            stats = runner.run([1], process)
+        assert stats == {'failed': 1}
+        assert 'bad item' in runner.stdout.getvalue()
+
+    def test_rate_limit_errors_slow_the_budget_down(self):
+        def process(key, log):
+            raise RuntimeError('429 Resource exhausted')
+
+        runner = _runner(retries=0)
+        with patch('django.db.connection.close'):
+            runner.run([1], process)
+        assert runner.budget.slowdown == 2
+
+    def test_no_quota_fails_the_item_without_calling_it(self):
+        runner = _runner(tier='flash')
+        with patch.object(batch_runner, 'wait_for_models', return_value=False), \
+             patch('django.db.connection.close'):
+            stats = runner.run([1], lambda key, log: pytest.fail('should not run'))
+        assert stats == {'failed': 1}
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Checkpoints
+# ═══════════════════════════════════════════════════════════════════
+
+@pytest.mark.django_db
+class TestCheckpoint:
+
+    def test_failed_run_resumes_with_the_remaining_items(self):
+        from news.models import BatchJobCheckpoint
+
+        def flaky(key, log):
+            if key == 3:
+                raise RuntimeError('boom')
+            return 'done'
+
+        with patch('django.db.connection.close'):
+            _runner(checkpoint=True, retries=0).run([1, 2, 3], flaky)
+            row = BatchJobCheckpoint.objects.get(job='test_job')
+            assert sorted(row.done_keys) == ['1', '2']
+            assert row.failed_keys == ['3'] and row.total == 3
+
+            seen = []
+            stats = _runner(checkpoint=True).run([1, 2, 3], lambda key, log: seen.append(key) or 'done')
+        assert seen == [3] and stats == {'done': 1}
+        assert not BatchJobCheckpoint.objects.exists()
+
+    def test_restart_and_other_params_ignore_the_checkpoint(self):
+        done = Checkpoint('test_job', {'job': 'test_job'})
+        done.done = {'1', '2'}
+        done.save()
+
+        seen = []
+        with patch('django.db.connection.close'):
+            _runner(job='test_job', checkpoint=True, restart=True, workers=1).run(
+                [1, 2], lambda key, log: seen.append(key))
+        assert seen == [1, 2]
+        assert Checkpoint('test_job', {'job': 'other'}).load() == set()
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Rate budget, quota and estimates
+# ═══════════════════════════════════════════════════════════════════
+
+class TestRateBudget:
+
+    def test_interval_follows_the_tier_soft_rpm(self):
+        limits = {'m1': {'rpm': 10, 'rpd': 100}, 'm2': {'rpm': 15, 'rpd': 100}}
+        with patch('ai_engine.modules.ai_provider.MODEL_RATE_LIMITS', limits), \
+             patch('ai_engine.modules.ai_provider.RATE_LIMIT_THRESHOLD', 0.8):
+            assert RateBudget(['m1', 'm2']).interval == pytest.approx(3.0)
+            assert RateBudget(['m1', 'm2'], calls_per_item=2).interval == pytest.approx(6.0)
+            assert RateBudget(['m1'], min_interval=30).interval == 30
+
+    def test_penalize_is_capped_and_reward_recovers(self):
+        budget = RateBudget([])
+        for _ in range(10):
+            budget.penalize()
+        assert budget.slowdown == RateBudget.MAX_SLOWDOWN
+        for _ in range(50):
+            budget.reward()
+        assert budget.slowdown == 1.0
+
+
+class TestWaitForModels:
+
+    def test_waits_until_a_model_frees_up(self, no_sleep):
+        with patch('ai_engine.modules.ai_provider._check_rate_limit',
+                   side_effect=[True, True, True, False]):
+            assert wait_for_models(['a', 'b'], timeout=60, poll=1)
+        assert no_sleep.call_count == 1
+
+    def test_gives_up_after_timeout(self):
+        with patch('ai_engine.modules.ai_provider._check_rate_limit', return_value=True):
+            assert not wait_for_models(['a'], timeout=0)
+
+
+class TestEstimate:
+
+    def test_priced_per_model_of_the_tier(self):
+        pricing = {'cheap': {'input': 1.0, 'output': 2.0}, 'dear': {'input': 2.0, 'output': 4.0}}
+        runner = _runner()
+        runner.models = ['cheap', 'dear']
+        runner.calls_per_item = 2
+        with patch('ai_engine.modules.token_tracker.PRICING', pricing):
+            result = runner.estimate(500, prompt_tokens=1000, completion_tokens=500)
+        assert result['calls'] == 1000
+        assert result['cost_min'] == 2.0 and result['cost_max'] == 4.0
+        assert '$2.00–$4.00' in runner.stdout.getvalue()
+
+    def test_recent_calls_replace_the_guess(self):
+        summary = {'by_caller': {'deep_specs': {'calls': 4, 'prompt_tokens': 8000, 'completion_tokens': 4000}}}
+        with patch('ai_engine.modules.token_tracker.get_summary', return_value=summary):
+            result = _runner().estimate(10, prompt_tokens=1, completion_tokens=1, callers=('deep_specs',))
+        assert result['based_on_calls'] == 4
+        assert result['prompt_tokens'] == 20000 and result['completion_tokens'] == 10000
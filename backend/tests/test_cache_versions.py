@@ -0,0 +1,108 @@
+"""
+Tests for news/cache_versions.py — generation-versioned response caching
+and the O(1) invalidation used by news/cache_signals.py.
+"""
+from unittest.mock import patch
+
+import pytest
+from django.http import HttpResponse
+from django.test import RequestFactory, override_settings
+
+from news import cache_versions
+from news.cache_versions import bump, generation, versioned_cache_page
+
+LOCMEM = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'cache-versions'}}
+
+
+@pytest.fixture(autouse=True)
+def locmem_cache():
+    with override_settings(CACHES=LOCMEM):
+        from django.core.cache import cache
+        cache.clear()
+        yield cache
+
+
+def _counting_view(group, timeout=60):
+    calls = []
+
+    @versioned_cache_page(timeout, group)
+    def view(request):
+        calls.append(request.path)
+        return HttpResponse(f'call {len(calls)}')
+    return view, calls
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Generations
+# ═══════════════════════════════════════════════════════════════════
+
+class TestGenerations:
+
+    def test_seeded_once_then_bumped(self):
+        first = generation('articles_list')
+        assert generation('articles_list') == first
+        bump('articles_list')
+        assert generation('articles_list') == first + 1
+
+    def test_bump_without_counter_seeds_it(self, locmem_cache):
+        bump('tags_list')
+        assert locmem_cache.get('cache_gen:tags_list') is not None
+
+    def test_lost_counter_never_reuses_a_generation(self, locmem_cache):
+        with patch.object(cache_versions, '_seed', return_value=1000):
+            old = generation('popular')
+        locmem_cache.delete('cache_gen:popular')  # evicted / flushed
+        with patch.object(cache_versions, '_seed', return_value=2000):
+            assert generation('popular') > old
+
+
+# ═══════════════════════════════════════════════════════════════════
+# versioned_cache_page
+# ═══════════════════════════════════════════════════════════════════
+
+class TestVersionedCachePage:
+
+    def test_cached_until_group_bumped(self):
+        view, calls = _counting_view('articles_list')
+        request = RequestFactory().get('/api/v1/articles/')
+        assert view(request).content == b'call 1'
+        assert view(request).content == b'call 1'
+        bump('articles_list')
+        assert view(request).content == b'call 2'
+        assert len(calls) == 2
+
+    def test_other_groups_untouched(self):
+        articles, article_calls = _counting_view('articles_list')
+        categories, category_calls = _counting_view('categories_list')
+        request = RequestFactory().get('/api/v1/categories/')
+        articles(request), categories(request)
+        bump('categories_list')
+        articles(request), categories(request)
+        assert (len(article_calls), len(category_calls)) == (1, 2)
+
+    def test_cache_failure_serves_uncached(self):
+        view, calls = _counting_view('trending')
+        with patch.object(cache_versions, 'generation', side_effect=ConnectionError):
+            assert view(RequestFactory().get('/x')).status_code == 200
+        assert calls == ['/x']
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Invalidation helpers
+# ═══════════════════════════════════════════════════════════════════
+
+class TestInvalidation:
+
+    def test_article_caches_bump_groups_without_scans(self, locmem_cache):
+        from news.cache_signals import invalidate_article_caches
+        locmem_cache.set('article_7', 'x')
+        with patch('news.cache_signals.bump') as bumped:
+            invalidate_article_caches(article_id=7, slug='byd-seal', articles=[(8, None)])
+        bumped.assert_called_once_with('articles_list', 'trending', 'popular')
+        assert locmem_cache.get('article_7') is None
+
+    def test_cars_caches(self):
+        from news.cache_signals import invalidate_cars_caches
+        with patch('news.cache_signals.bump') as bumped:
+            invalidate_cars_caches()
+        bumped.assert_called_once_with('cars_picker', 'cars_brands')
@@ -72,6 +72,37 @@ class TestCarBrandsList:
         resp = client.get('/api/v1/cars/brands/')
         assert resp.status_code == 200
 
+    def _brand_catalogue(self, client, n_brands):
+        from django.core.cache import cache
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+        for i in range(n_brands):
+            brand = Brand.objects.create(name=f'Make{i}', slug=f'make{i}', sort_order=1 if i == n_brands - 1 else 0)
+            Brand.objects.create(name=f'Sub{i}', slug=f'sub{i}', parent=brand)
+            for j in range(2):
+                art = Article.objects.create(title=f'M{i} {j}', slug=f'm{i}-{j}', content='x', is_published=True)
+                CarSpecification.objects.create(article=art, make=f'make{i}', model=f'X{j}')
+        cache.clear()
+        with CaptureQueriesContext(connection) as queries:
+            resp = client.get('/api/v1/cars/brands/?include_totals=1')
+        assert resp.status_code == 200
+        return resp.json(), len(queries)
+
+    def test_constant_query_count_and_order(self, client):
+        client.get('/api/v1/cars/brands/')  # warm-up: first request creates the SiteSettings row
+        small, small_queries = self._brand_catalogue(client, 2)
+        Brand.objects.all().delete()
+        Article.objects.all().delete()
+        large, large_queries = self._brand_catalogue(client, 12)
+        assert small_queries == large_queries
+
+        # Pinned brand first, counts matched case-insensitively, sub-brands nested
+        first = large['brands'][0]
+        assert first['name'] == 'Make11'
+        assert (first['model_count'], first['article_count']) == (2, 2)
+        assert first['sub_brands'] == [{'name': 'Sub11', 'slug': 'sub11'}]
+        assert large['total_articles'] == 24 and large['total_models'] == 24
+
 
 # ═══════════════════════════════════════════════════════════════════════════
 # CarBrandDetailView — GET /api/v1/cars/brands/{slug}/
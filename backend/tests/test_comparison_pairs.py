@@ -0,0 +1,100 @@
+"""
+Tests for news/comparison_pairs.py — the vectorised top-k pair scorer must
+return exactly what scoring every combination, stable-sorting and slicing
+returned, including tie order, the brand filter and the pair count.
+"""
+import random
+from unittest.mock import patch
+
+import pytest
+
+from news import comparison_pairs
+from news.comparison_pairs import completeness, score_pairs
+from news.management.commands.benchmark_comparison_pairs import _legacy, _synthetic_rows
+
+
+def _row(spec_id, make, body='suv', fuel='EV', power=None, price=None, range_km=None,
+         range_wltp=None, battery=None, accel=None, length=None):
+    return (spec_id, make, body, fuel, power, price, range_km, range_wltp, battery, accel, length)
+
+
+def _random_rows(rng, count, makes=('BYD', 'Tesla', 'bmw', 'BMW', 'Audi'), segments=2):
+    rows = []
+    for spec_id in range(count):
+        def maybe(value):
+            return value if rng.random() < 0.5 else rng.choice([None, 0])
+        rows.append(_row(
+            spec_id, rng.choice(makes), f'body{rng.randrange(segments)}', 'EV',
+            maybe(rng.randint(100, 500)), maybe(rng.choice([20_000, 30_000, 50_000, 90_000])),
+            maybe(400), maybe(450), maybe(60.5), maybe(5.2), maybe(4700),
+        ))
+    return rows
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Scoring
+# ═══════════════════════════════════════════════════════════════════
+
+class TestCompleteness:
+
+    def test_weights(self):
+        rows = [
+            _row(1, 'A', power=300, price=40_000, range_km=500, battery=80, accel=4.5, length=4800),
+            _row(2, 'B', range_wltp=450),
+            _row(3, 'C', power=0, price=None),
+        ]
+        assert list(completeness(rows)) == [11, 2, 0]
+
+    def test_price_bonus_and_same_make_skipped(self):
+        rows = [
+            _row(1, 'BYD', price=30_000),
+            _row(2, 'byd', price=30_000),
+            _row(3, 'Tesla', price=40_000),
+            _row(4, 'Audi', price=90_000),
+        ]
+        pairs, total, _ = score_pairs(rows)
+        # 30k/40k clears the 0.6 price ratio, 40k/90k does not
+        assert pairs[0] == (11, 0, 2)
+        assert (6, 2, 3) in pairs
+        assert all({a, b} != {0, 1} for _, a, b in pairs)
+        assert total == 5
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Equivalence with the full sort
+# ═══════════════════════════════════════════════════════════════════
+
+class TestMatchesFullSort:
+
+    @pytest.mark.parametrize('seed', range(8))
+    def test_random_rows(self, seed):
+        rng = random.Random(seed)
+        rows = _random_rows(rng, rng.randint(2, 80), segments=rng.randint(1, 3))
+        limit = rng.choice([1, 5, 30, 10_000])
+        pairs, total, _ = score_pairs(rows, limit=limit)
+        assert (pairs, total) == _legacy(rows, [], limit)
+
+    @pytest.mark.parametrize('brands', [['byd'], ['bmw', 'audi'], ['nobody']])
+    def test_brand_filter(self, brands):
+        rows = _random_rows(random.Random(5), 60)
+        pairs, total, _ = score_pairs(rows, brands, limit=25)
+        assert (pairs, total) == _legacy(rows, brands, 25)
+
+    def test_small_blocks_keep_tie_order(self):
+        """Many equal scores spread over blocks — earlier pairs must win ties."""
+        rows = _random_rows(random.Random(9), 70, segments=1)
+        with patch.object(comparison_pairs, 'BLOCK_ELEMENTS', 50):
+            pairs, total, _ = score_pairs(rows, limit=40)
+        assert (pairs, total) == _legacy(rows, [], 40)
+
+    def test_synthetic_specs(self):
+        rows = _synthetic_rows(600)
+        pairs, total, segments = score_pairs(rows, ['byd', 'tesla'], limit=50)
+        assert (pairs, total) == _legacy(rows, ['byd', 'tesla'], 50)
+        assert sum(len(members) for members in segments.values()) == 600
+
+    def test_empty_and_zero_limit(self):
+        assert score_pairs([]) == ([], 0, {})
+        rows = _random_rows(random.Random(1), 10)
+        pairs, total, _ = score_pairs(rows, limit=0)
+        assert pairs == [] and total == _legacy(rows, [], 0)[1]
@@ -0,0 +1,136 @@
+"""
+Tests for ai_engine/modules/competitor_index.py and the index-backed
+get_competitor_context — fallback cascade, nearest-candidate pool and
+feedback weighting, without a database.
+"""
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import numpy as np
+
+from ai_engine.modules import competitor_index
+from ai_engine.modules.competitor_index import CompetitorIndex
+from ai_engine.modules.competitor_lookup import get_competitor_context
+
+
+def _spec(spec_id, make, model, body='SUV', price=None, power=None, range_wltp=None,
+          battery=None, accel=None, length=None):
+    # SPEC_FIELDS order
+    return (spec_id, make, model, body, price, power, range_wltp, None, None, battery, accel, length)
+
+
+def _vehicle(row):
+    return SimpleNamespace(
+        id=row[0], make=row[1], model_name=row[2], body_type=row[3], price_usd_from=row[4],
+        price_usd_to=None, power_hp=row[5], power_kw=None, range_wltp=row[6], range_epa=None,
+        range_cltc=None, range_km=None, combined_range_km=None, battery_kwh=None,
+        acceleration_0_100=None, model_year=None, year=None, trim_name='',
+    )
+
+
+def _lookup(rows, engagement=None, feedback=None, overused=(), **kwargs):
+    index = CompetitorIndex(rows, engagement, feedback)
+    vehicles = {row[0]: _vehicle(row) for row in rows}
+    with patch.object(competitor_index, 'get_competitor_index', return_value=index), \
+         patch('ai_engine.modules.competitor_lookup._overused_codes',
+               return_value={index.code(*pair) for pair in overused}), \
+         patch('news.models.vehicles.VehicleSpecs.objects.in_bulk',
+               side_effect=lambda ids: {i: vehicles[i] for i in ids}):
+        return get_competitor_context(**kwargs)
+
+
+# ═══════════════════════════════════════════════════════════════════
+# CompetitorIndex
+# ═══════════════════════════════════════════════════════════════════
+
+class TestCompetitorIndex:
+
+    def test_bands_skip_unknown_values(self):
+        index = CompetitorIndex([_spec(1, 'A', 'a', price=100), _spec(2, 'B', 'b'), _spec(3, 'C', 'c', price=300)])
+        assert list(index.in_band(index.all, index.price, 50, 200)) == [0]
+        assert list(index.in_band(index.all, index.price, 0, 10 ** 9)) == [0, 2]
+
+    def test_nearest_keeps_index_order_and_ties(self):
+        rows = [_spec(i, f'M{i}', 'x', price=p) for i, p in enumerate([100, 400, 210, 190, 200, None])]
+        index = CompetitorIndex(rows)
+        assert list(index.nearest(index.all, {'price': 200}, k=3)) == [2, 3, 4]
+        # No subject features: all distances tie → first k rows, like a slice
+        assert list(index.nearest(index.all, {}, k=3)) == [0, 1, 2]
+
+    def test_codes_are_case_insensitive(self):
+        index = CompetitorIndex([_spec(1, 'BYD', 'Seal'), _spec(2, 'byd', 'SEAL'), _spec(3, 'BYD', 'Atto 3')])
+        assert index.pair[0] == index.pair[1] != index.pair[2]
+        assert index.code('Byd', 'seal') == index.pair[0]
+
+    def test_engagement_and_feedback_mapped_to_rows(self):
+        rows = [_spec(1, 'Tesla', 'Model Y'), _spec(2, 'Ford', 'Mach-E')]
+        index = CompetitorIndex(
+            rows,
+            engagement={('tesla', 'model y'): 4.0},
+            feedback={(('byd', 'seal'), ('ford', 'mach-e')): -1.0},
+        )
+        assert index.engagement[0] == 4.0 and np.isnan(index.engagement[1])
+        assert index.feedback == {('byd', 'seal'): {index.code('Ford', 'Mach-E'): -1.0}}
+
+
+# ═══════════════════════════════════════════════════════════════════
+# get_competitor_context on the index
+# ═══════════════════════════════════════════════════════════════════
+
+class TestLookupOnIndex:
+
+    def test_subject_excluded_and_body_segment_used(self):
+        rows = [
+            _spec(1, 'Subj', 'Car', price=50_000),
+            _spec(2, 'Tesla', 'Model Y', price=48_000),
+            _spec(3, 'Ford', 'Mach-E', price=52_000),
+            _spec(4, 'Audi', 'A6', body='Sedan', price=50_000),
+        ]
+        _, comps = _lookup(rows, make='subj', model_name='CAR', body_type='suv',
+                           price_usd=50_000, max_competitors=5)
+        assert sorted(c['make'] for c in comps) == ['Ford', 'Tesla']
+
+    def test_price_fallback_when_segment_too_small(self):
+        rows = [
+            _spec(1, 'Tesla', 'Model Y', price=48_000),
+            _spec(2, 'Audi', 'A6', body='Sedan', price=45_000),
+            _spec(3, 'BMW', 'i4', body='Sedan', price=55_000),
+            _spec(4, 'Dacia', 'Spring', body='Hatchback', price=15_000),
+        ]
+        _, comps = _lookup(rows, make='X', model_name='Y', body_type='SUV',
+                           price_usd=50_000, max_competitors=5)
+        assert sorted(c['make'] for c in comps) == ['Audi', 'BMW', 'Tesla']
+
+    def test_cooldown_and_rejected_feedback_excluded(self):
+        rows = [
+            _spec(1, 'Tesla', 'Model 3', body='Sedan', price=40_000),
+            _spec(2, 'Polestar', '2', body='Sedan', price=45_000),
+            _spec(3, 'BMW', 'i4', body='Sedan', price=42_000),
+        ]
+        _, comps = _lookup(
+            rows, overused=[('Tesla', 'Model 3')],
+            feedback={(('x', 'y'), ('bmw', 'i4')): -1.0},
+            make='X', model_name='Y', body_type='Sedan', price_usd=42_000, max_competitors=3,
+        )
+        assert [c['make'] for c in comps] == ['Polestar']
+
+    def test_brand_diversity(self):
+        rows = [_spec(i, 'BYD' if i < 4 else 'NIO', f'M{i}', price=30_000) for i in range(6)]
+        _, comps = _lookup(rows, make='X', model_name='Y', body_type='SUV', max_competitors=2)
+        assert sorted(c['make'] for c in comps) == ['BYD', 'NIO']
+
+    def test_weights_prefer_close_price_and_engagement(self):
+        rows = [
+            _spec(1, 'A', 'M', body='Sedan', price=100_000, power=300),
+            _spec(2, 'B', 'M', body='Sedan', price=85_000, power=300),
+            _spec(3, 'C', 'M', body='Sedan', price=75_000, power=300),
+        ]
+        counts = {'A': 0, 'B': 0, 'C': 0}
+        for _ in range(300):
+            _, comps = _lookup(rows, engagement={('c', 'm'): 0.1}, make='S', model_name='M',
+                               body_type='Sedan', power_hp=300, price_usd=100_000, max_competitors=1)
+            counts[comps[0]['make']] += 1
+        assert counts['A'] > counts['B'] > counts['C']
+
+    def test_empty_index(self):
+        assert _lookup([], make='Zeekr', model_name='9X') == ("", [])
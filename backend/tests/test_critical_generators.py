@@ -357,7 +357,7 @@ class TestRSSAggregator:
 
     # --- extract_og_image ---
     def test_extract_og_image_success(self, agg):
-        with patch('requests.get') as mock_get:
+        with patch('ai_engine.modules.web_fetch.get') as mock_get:
             mock_get.return_value = MagicMock(
                 status_code=200,
                 text='<html><head><meta property="og:image" content="https://img.com/og.jpg" /></head></html>',
@@ -366,7 +366,7 @@ class TestRSSAggregator:
             assert result == 'https://img.com/og.jpg'
 
     def test_extract_og_image_failure(self, agg):
-        with patch('requests.get', side_effect=Exception('Timeout')):
+        with patch('ai_engine.modules.web_fetch.get', side_effect=Exception('Timeout')):
             result = agg.extract_og_image('https://test.com/fail')
             assert result is None
 
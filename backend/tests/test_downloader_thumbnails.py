@@ -0,0 +1,69 @@
+"""
+Tests for ai_engine/modules/downloader.py thumbnail fetching — header-only
+image sizes and concurrent best-variant selection. web_fetch.get is patched.
+"""
+from io import BytesIO
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from PIL import Image
+
+from ai_engine.modules.downloader import fetch_best_variants, image_dimensions
+
+
+def _image(width, height, fmt='JPEG', padding=6000):
+    buf = BytesIO()
+    Image.new('RGB', (width, height), (200, 30, 30)).save(buf, fmt)
+    return buf.getvalue() + b'\0' * padding  # keep it over MIN_THUMBNAIL_BYTES
+
+
+class TestImageDimensions:
+
+    @pytest.mark.parametrize('fmt', ['JPEG', 'PNG', 'WEBP'])
+    def test_reads_size_from_header(self, fmt):
+        assert image_dimensions(_image(640, 480, fmt)) == (640, 480)
+
+    def test_progressive_jpeg(self):
+        buf = BytesIO()
+        Image.new('RGB', (1280, 720)).save(buf, 'JPEG', progressive=True)
+        assert image_dimensions(buf.getvalue()) == (1280, 720)
+
+    def test_garbage_is_none(self):
+        assert image_dimensions(b'<html>404</html>') is None
+        assert image_dimensions(b'\xff\xd8\xff\xe0 truncated') is None
+
+
+class TestFetchBestVariants:
+
+    def _serve(self, pages):
+        def get(url, **kwargs):
+            body = pages.get(url)
+            return SimpleNamespace(status_code=200 if body else 404, content=body or b'')
+        return patch('ai_engine.modules.web_fetch.get', side_effect=get)
+
+    def test_first_usable_variant_wins_per_slot(self):
+        pages = {
+            'cover/sd.jpg': _image(640, 480),
+            'cover/hq.jpg': _image(480, 360),
+            'frame/hq.jpg': _image(200, 150),  # too narrow
+        }
+        with self._serve(pages):
+            found = fetch_best_variants([
+                ['cover/maxres.jpg', 'cover/sd.jpg', 'cover/hq.jpg'],
+                ['frame/maxres.jpg', 'frame/hq.jpg'],
+            ])
+        assert found[0][0] == 'cover/sd.jpg'
+        assert found[0][2] == (640, 480)
+        assert found[1] is None
+
+    def test_worse_variants_skipped_after_a_win(self):
+        pages = {'a/maxres.jpg': _image(1280, 720), 'a/sd.jpg': _image(640, 480)}
+        with patch('ai_engine.modules.downloader.THUMBNAIL_WORKERS', 1), self._serve(pages) as get:
+            found = fetch_best_variants([['a/maxres.jpg', 'a/sd.jpg', 'a/hq.jpg']])
+        assert found[0][0] == 'a/maxres.jpg'
+        assert [c.args[0] for c in get.call_args_list] == ['a/maxres.jpg']
+
+    def test_request_errors_fall_through(self):
+        with patch('ai_engine.modules.web_fetch.get', side_effect=ConnectionError('boom')):
+            assert fetch_best_variants([['x.jpg'], []]) == [None, None]
@@ -0,0 +1,109 @@
+"""
+Tests for news/embedding_storage.py — packed ArticleEmbedding vectors:
+float32/float16/int8 round-trips, ArticleEmbedding.set_vector/get_vector
+and load_vectors over a half-backfilled table.
+"""
+import numpy as np
+import pytest
+
+from news.embedding_storage import pack_vector, stack_vectors, unpack_vector
+
+
+@pytest.fixture
+def vector():
+    rng = np.random.default_rng(7)
+    vec = rng.standard_normal(768).astype(np.float32)
+    return vec / np.linalg.norm(vec)
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Codec
+# ═══════════════════════════════════════════════════════════════════
+
+class TestCodec:
+
+    def test_float32_is_exact(self, vector):
+        data, dim, scale = pack_vector(vector.tolist(), 'float32')
+        assert len(data) == 768 * 4 and dim == 768 and scale == 1.0
+        np.testing.assert_array_equal(unpack_vector(data, 'float32', dim), vector)
+
+    @pytest.mark.parametrize('dtype, size, tolerance', [('float16', 2, 1e-3), ('int8', 1, 1e-2)])
+    def test_compact_dtypes_preserve_direction(self, vector, dtype, size, tolerance):
+        data, dim, scale = pack_vector(vector, dtype)
+        assert len(data) == 768 * size
+        decoded = unpack_vector(data, dtype, dim, scale)
+        assert decoded.dtype == np.float32
+        cosine = float(np.dot(decoded, vector) / np.linalg.norm(decoded))
+        assert cosine > 1 - tolerance
+
+    def test_int8_uses_full_range(self, vector):
+        data, _, scale = pack_vector(vector, 'int8')
+        raw = np.frombuffer(data, dtype=np.int8)
+        assert np.abs(raw).max() == 127
+        assert scale == pytest.approx(np.abs(vector).max() / 127)
+
+    def test_zero_vector(self):
+        data, dim, scale = pack_vector([0.0] * 8, 'int8')
+        assert scale == 1.0
+        assert not unpack_vector(data, 'int8', dim, scale).any()
+
+    def test_decoded_vectors_are_writable(self, vector):
+        data, dim, _ = pack_vector(vector)
+        unpack_vector(memoryview(data), 'float32', dim)[0] = 1.0
+
+    def test_rejects_bad_input(self, vector):
+        with pytest.raises(ValueError):
+            pack_vector(vector, 'float64')
+        with pytest.raises(ValueError):
+            pack_vector([0.1, float('nan')])
+        data, _, _ = pack_vector(vector)
+        with pytest.raises(ValueError):
+            unpack_vector(data, 'float32', dim=512)
+
+    def test_stack_vectors(self, vector):
+        matrix = stack_vectors([vector, vector * 2])
+        assert matrix.shape == (2, 768) and matrix.flags['C_CONTIGUOUS']
+        assert stack_vectors([]).shape == (0, 0)
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Model helpers
+# ═══════════════════════════════════════════════════════════════════
+
+class TestArticleEmbeddingVector:
+
+    def test_set_vector_clears_json(self, vector, settings):
+        from news.models import ArticleEmbedding
+        settings.EMBEDDING_STORAGE_DTYPE = 'float16'
+        emb = ArticleEmbedding(embedding_vector=vector.tolist())
+        emb.set_vector(vector.tolist())
+        assert emb.embedding_vector is None
+        assert emb.vector_dtype == 'float16' and emb.get_vector_dimension() == 768
+        np.testing.assert_allclose(emb.get_vector(), vector, atol=1e-3)
+
+    def test_legacy_json_row(self):
+        from news.models import ArticleEmbedding
+        emb = ArticleEmbedding(embedding_vector=[0.5, 0.25])
+        assert emb.get_vector_dimension() == 2
+        np.testing.assert_array_equal(emb.get_vector(), np.array([0.5, 0.25], dtype=np.float32))
+        assert ArticleEmbedding().get_vector() is None
+
+
+@pytest.mark.django_db
+class TestLoadVectors:
+
+    def test_mixes_packed_and_legacy_rows(self, vector):
+        from news.models import Article, ArticleEmbedding
+        from news.embedding_storage import load_vectors
+
+        packed_article = Article.objects.create(title='Packed', slug='packed-emb', content='<p>x</p>')
+        legacy_article = Article.objects.create(title='Legacy', slug='legacy-emb', content='<p>x</p>')
+        packed = ArticleEmbedding(article=packed_article)
+        packed.set_vector(vector, 'int8')
+        packed.save()
+        ArticleEmbedding.objects.create(article=legacy_article, embedding_vector=[0.1] * 768)
+
+        vectors = load_vectors(ArticleEmbedding.objects.all())
+        assert set(vectors) == {packed_article.id, legacy_article.id}
+        assert float(np.dot(vectors[packed_article.id], vector)) > 0.99
+        assert vectors[legacy_article.id][0] == pytest.approx(0.1)
@@ -0,0 +1,102 @@
+"""
+Tests for news/image_hashing.py — perceptual hashes, HashIndex radius
+search and the per-batch NearDuplicateFilter.
+"""
+from io import BytesIO
+
+import numpy as np
+from PIL import Image
+
+from news.image_hashing import (
+    HashIndex, NearDuplicateFilter, from_db, hamming, hash_many, image_hashes,
+    is_near_duplicate, to_db,
+)
+
+
+def _photo(seed, size=(640, 360)):
+    rng = np.random.default_rng(seed)
+    w, h = size
+    y, x = np.mgrid[0:h, 0:w].astype(np.float32)
+    pixels = np.stack([
+        128 + 100 * np.sin(x / (30 + 20 * rng.random()) + c) * np.cos(y / (40 + 30 * rng.random()))
+        for c in range(3)
+    ], axis=-1)
+    return Image.fromarray(np.clip(pixels, 0, 255).astype(np.uint8))
+
+
+def _encode(img, fmt='JPEG', **kwargs):
+    buf = BytesIO()
+    img.save(buf, format=fmt, **kwargs)
+    return buf.getvalue()
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Hashing
+# ═══════════════════════════════════════════════════════════════════
+
+class TestHashes:
+
+    def test_resized_recompressed_copy_is_near_duplicate(self):
+        img = _photo(1)
+        original = image_hashes(_encode(img, quality=95))
+        copy = image_hashes(_encode(img.resize((320, 180)), 'WEBP', quality=40))
+        other = image_hashes(_encode(_photo(2), quality=95))
+
+        assert is_near_duplicate(original, copy)
+        assert not is_near_duplicate(original, other)
+        assert hamming(original['phash'], other['phash']) > 16
+
+    def test_flat_and_unreadable_images_have_no_hashes(self):
+        black = _encode(Image.new('RGB', (400, 300), 'black'))
+        assert image_hashes(black) is None
+        assert image_hashes(b'not an image') is None
+
+    def test_batch_matches_single(self):
+        datas = [_encode(_photo(seed)) for seed in range(4)] + [b'junk']
+        batch = hash_many(datas)
+        assert batch[:4] == [image_hashes(d) for d in datas[:4]]
+        assert batch[4] is None
+        assert all(0 <= h['phash'] < 1 << 64 for h in batch[:4])
+
+    def test_db_roundtrip_is_signed(self):
+        for value in (0, 1, (1 << 63) - 1, 1 << 63, (1 << 64) - 1):
+            stored = to_db(value)
+            assert -(1 << 63) <= stored < 1 << 63
+            assert from_db(stored) == value
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Lookup
+# ═══════════════════════════════════════════════════════════════════
+
+class TestHashIndex:
+
+    def test_radius_search_closest_first(self):
+        index = HashIndex(capacity=2)
+        base = {'phash': 0xF0F0_F0F0_F0F0_F0F0, 'dhash': 0x1234_5678_9ABC_DEF0}
+        index.add(1, {'phash': base['phash'] ^ 0b111, 'dhash': base['dhash']})
+        index.add(2, {'phash': base['phash'] ^ 0b1, 'dhash': base['dhash'] ^ 0b1})
+        index.add(3, {'phash': ~base['phash'] & ((1 << 64) - 1), 'dhash': base['dhash']})
+        # dHash too far even though pHash matches
+        index.add(4, {'phash': base['phash'], 'dhash': base['dhash'] ^ 0xFFF})
+
+        assert len(index) == 4
+        assert index.search(base, radius=6) == [(2, 2), (3, 1)]
+        assert index.search(base, radius=0) == []
+
+    def test_empty_index(self):
+        assert HashIndex().search({'phash': 1, 'dhash': 1}) == []
+
+
+class TestNearDuplicateFilter:
+
+    def test_rejects_copies_within_a_batch(self):
+        img = _photo(3)
+        seen = NearDuplicateFilter()
+        assert not seen.is_duplicate(_encode(img))
+        assert seen.is_duplicate(_encode(img.resize((480, 270)), quality=60))
+        assert not seen.is_duplicate(_encode(_photo(4)))
+        # Unhashable images are never rejected
+        assert not seen.is_duplicate(b'junk')
+        assert not seen.is_duplicate(b'junk')
+        assert len(seen.accepted) == 2
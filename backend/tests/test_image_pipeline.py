@@ -0,0 +1,233 @@
+"""
+Tests for news/image_pipeline.py — off-request responsive renditions:
+render_variants sizing, content-hash dedup, field write-back and the
+Article/ArticleImage save hooks.
+"""
+from io import BytesIO
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from PIL import Image
+
+from news.image_pipeline import MAX_HEIGHT, render_variants
+
+
+def _image_bytes(size=(2400, 1350), mode='RGB', fmt='JPEG', color='red', exif_orientation=None):
+    img = Image.new(mode, size, color=color)
+    buf = BytesIO()
+    kwargs = {}
+    if exif_orientation:
+        exif = Image.Exif()
+        exif[0x0112] = exif_orientation
+        kwargs['exif'] = exif
+    img.save(buf, format=fmt, **kwargs)
+    return buf.getvalue()
+
+
+@pytest.fixture
+def media(settings, tmp_path):
+    settings.MEDIA_ROOT = str(tmp_path)
+    settings.STORAGES = {
+        'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+        'staticfiles': {'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage'},
+    }
+    # Inline rendering, WebP only — no worker processes in tests
+    with patch('news.image_pipeline._render', side_effect=lambda data, formats: render_variants(data)), \
+         patch('news.image_pipeline.default_formats', return_value=('webp',)):
+        yield tmp_path
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Rendering
+# ═══════════════════════════════════════════════════════════════════
+
+class TestRenderVariants:
+
+    def test_responsive_widths(self):
+        result = render_variants(_image_bytes((2400, 1350)))
+        assert (result['width'], result['height']) == (2400, 1350)
+        assert [v['width'] for v in result['variants']] == [1920, 1280, 640, 320]
+        assert all(v['format'] == 'webp' and v['data'][8:12] == b'WEBP' for v in result['variants'])
+
+    def test_never_upscales(self):
+        result = render_variants(_image_bytes((500, 300), fmt='PNG'))
+        assert [v['width'] for v in result['variants']] == [500, 320]
+
+    def test_portrait_capped_by_height(self):
+        result = render_variants(_image_bytes((1500, 3000)))
+        sizes = [(v['width'], v['height']) for v in result['variants']]
+        assert sizes[0] == (540, MAX_HEIGHT)
+        # 1920/1280/640 collapse onto the same height-capped size
+        assert len(sizes) == len(set(sizes)) == 2
+
+    def test_exif_rotation_and_transparency(self):
+        rotated = render_variants(_image_bytes((800, 400), exif_orientation=6), widths=(800,))
+        assert (rotated['width'], rotated['height']) == (400, 800)
+        assert rotated['variants'][0]['height'] > rotated['variants'][0]['width']
+
+        transparent = render_variants(_image_bytes((100, 100), mode='RGBA', fmt='PNG', color=(0, 0, 0, 0)))
+        decoded = Image.open(BytesIO(transparent['variants'][0]['data']))
+        assert decoded.convert('RGB').getpixel((50, 50)) == (255, 255, 255)
+
+    def test_multiple_formats(self):
+        result = render_variants(_image_bytes((700, 400)), widths=(640,), formats=('webp', 'avif'))
+        assert [v['format'] for v in result['variants']] == ['webp', 'avif']
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Assets and models (DB)
+# ═══════════════════════════════════════════════════════════════════
+
+@pytest.mark.django_db
+class TestProcessImageField:
+
+    def _article(self, slug, data):
+        from news.models import Article
+        article = Article.objects.create(title=slug, slug=slug, content='<p>x</p>')
+        article.image.save(f'{slug}.jpg', SimpleUploadedFile(f'{slug}.jpg', data), save=True)
+        return article
+
+    def test_renditions_and_write_back(self, media):
+        from news.image_pipeline import process_image_field
+        from news.models import Article
+
+        article = self._article('pipeline-one', _image_bytes())
+        asset = process_image_field('news.Article', article.id, 'image')
+
+        assert asset.status == 'ready' and len(asset.variants) == 4
+        article = Article.objects.get(id=article.id)
+        assert article.image_asset_id == asset.id
+        assert article.image.name == asset.variants[0]['name'].replace('\\', '/')
+        assert '320w' in asset.srcset('webp') and '1920w' in asset.srcset('webp')
+
+    def test_identical_upload_reuses_asset(self, media):
+        from news.image_pipeline import process_image_field
+        from news.models import Article, ImageAsset
+
+        data = _image_bytes(color='blue')
+        first = self._article('pipeline-first', data)
+        second = self._article('pipeline-second', data)
+        duplicate_name = second.image.name
+        process_image_field('news.Article', first.id, 'image')
+
+        with patch('news.image_pipeline.render_variants') as render:
+            asset = process_image_field('news.Article', second.id, 'image')
+        render.assert_not_called()
+        assert ImageAsset.objects.count() == 1
+        assert Article.objects.get(id=second.id).image_asset_id == asset.id
+        # The duplicate upload is no longer referenced and was removed
+        assert not (media / duplicate_name).exists()
+
+    def test_near_duplicate_upload_reuses_asset(self, media):
+        from news.image_hashing import reset_index
+        from news.image_pipeline import process_image_field
+        from news.models import Article, ImageAsset
+
+        y, x = np.mgrid[0:900, 0:1600]
+        photo = Image.fromarray((127 + 120 * np.sin(x / 90) * np.cos(y / 70)).astype(np.uint8)).convert('RGB')
+        original, smaller = BytesIO(), BytesIO()
+        photo.save(original, format='JPEG', quality=90)
+        photo.resize((800, 450)).save(smaller, format='JPEG', quality=60)
+
+        reset_index()
+        first = self._article('pipeline-photo', original.getvalue())
+        second = self._article('pipeline-photo-small', smaller.getvalue())
+        asset = process_image_field('news.Article', first.id, 'image')
+        assert asset.phash is not None
+
+        with patch('news.image_pipeline.render_variants') as render:
+            reused = process_image_field('news.Article', second.id, 'image')
+        render.assert_not_called()
+        assert reused.id == asset.id and ImageAsset.objects.count() == 1
+        assert Article.objects.get(id=second.id).image.name == asset.variants[0]['name'].replace('\\', '/')
+
+    def test_unreadable_image_marks_asset_failed(self, media):
+        from news.image_pipeline import process_image_field
+        from news.models import Article
+
+        article = self._article('pipeline-broken', b'not an image')
+        asset = process_image_field('news.Article', article.id, 'image')
+        assert asset.status == 'failed' and asset.error
+        article = Article.objects.get(id=article.id)
+        assert article.image_asset_id == asset.id
+        assert article.image.name.endswith('pipeline-broken.jpg')
+
+    def test_process_pending(self, media):
+        from news.image_pipeline import process_pending
+        self._article('pipeline-a', _image_bytes(color='green'))
+        self._article('pipeline-b', _image_bytes(color='green'))
+        assert process_pending(limit=10) == {'processed': 1, 'reused': 1, 'failed': 0, 'remaining': 0}
+
+
+@pytest.mark.django_db
+class TestSaveHooks:
+
+    def test_article_upload_is_deferred(self, media, django_capture_on_commit_callbacks):
+        from news.models import Article
+        upload = SimpleUploadedFile('upload.jpg', _image_bytes(), content_type='image/jpeg')
+        with patch('news.image_pipeline.threading.Thread') as thread:
+            with django_capture_on_commit_callbacks(execute=True):
+                article = Article.objects.create(title='Deferred', slug='deferred-upload',
+                                                 content='<p>x</p>', image=upload)
+        # Stored untouched, processed after commit
+        assert article.image.name.endswith('.jpg')
+        assert thread.call_args.kwargs['args'] == ('news.Article', article.id, ['image'])
+
+    def test_resaving_processed_article_never_opens_storage(self, media, django_capture_on_commit_callbacks):
+        from django.core.files.storage import default_storage
+        from news.image_pipeline import process_image_field
+        from news.models import Article
+
+        article = Article.objects.create(title='Processed', slug='processed-resave', content='<p>x</p>')
+        article.image.save('processed.jpg', SimpleUploadedFile('processed.jpg', _image_bytes()), save=True)
+        process_image_field('news.Article', article.id, 'image')
+        article = Article.objects.get(id=article.id)
+        assert article.image.name.startswith('variants/')
+
+        with patch.object(type(default_storage._wrapped), 'open') as storage_open, \
+             patch('news.image_pipeline.schedule_image_processing') as schedule:
+            with django_capture_on_commit_callbacks(execute=True):
+                article.views += 1
+                article.save()
+        storage_open.assert_not_called()
+        schedule.assert_not_called()
+        assert Article.objects.get(id=article.id).image_asset_id is not None
+
+    def test_gallery_upload_is_deferred(self, media, django_capture_on_commit_callbacks):
+        from news.models import Article, ArticleImage
+        article = Article.objects.create(title='Gallery', slug='gallery-upload', content='<p>x</p>')
+        upload = SimpleUploadedFile('gallery.png', _image_bytes(fmt='PNG'), content_type='image/png')
+        with patch('news.image_pipeline.threading.Thread') as thread:
+            with django_capture_on_commit_callbacks(execute=True):
+                image = ArticleImage.objects.create(article=article, image=upload)
+            with django_capture_on_commit_callbacks(execute=True):
+                image.save()
+        assert thread.call_count == 1
+        assert image.image.name.endswith('.png')
+
+
+@pytest.mark.django_db
+class TestListSrcsets:
+
+    def test_list_endpoint_joins_the_asset(self, api_client):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+        from news.models import Article, ImageAsset
+
+        for i in range(3):
+            asset = ImageAsset.objects.create(
+                content_hash=f'{i:064d}', status='ready',
+                variants=[{'format': 'webp', 'width': 320, 'height': 180, 'name': f'renditions/a{i}-320.webp'}],
+            )
+            article = Article.objects.create(title=f'Listed {i}', slug=f'listed-{i}', content='<p>x</p>',
+                                             is_published=True, views=10 + i)
+            Article.objects.filter(id=article.id).update(image_asset=asset)
+
+        with CaptureQueriesContext(connection) as queries:
+            resp = api_client.get('/api/v1/articles/popular/')
+        assert resp.status_code == 200
+        assert all(row['image_srcset']['webp'].endswith('320w') for row in resp.data)
+        # The assets come in with the article rows — no per-row lookup
+        assert not [q for q in queries.captured_queries if 'FROM "image_assets"' in q['sql']]
@@ -0,0 +1,87 @@
+"""
+Tests for the internal-link index (ai_engine/modules/link_index.py) and the
+single-parse insertion pass in seo.inject_internal_links.
+"""
+from unittest.mock import patch
+
+from bs4 import BeautifulSoup
+
+from ai_engine.modules.link_index import LinkIndex
+from ai_engine.modules.seo import inject_internal_links
+
+ARTICLES = [  # newest first
+    (5, 'byd-seal-06-review', 'BYD Seal 06 review'),
+    (4, 'tesla-model-y-juniper', 'Tesla Model Y "Juniper" update'),
+    (3, 'byd-atto-3-facelift', 'BYD Atto 3 facelift'),
+    (2, 'nio-et5-range', 'NIO ET5 range test'),
+    (1, 'byd-dolphin', 'Byd Dolphin launch'),
+]
+TAGS = {5: ['BYD', 'Sedan', 'EV', 'China'], 4: ['Tesla', 'SUV'], 3: ['BYD', 'SUV'], 1: ['BYD']}
+
+
+def _index():
+    return LinkIndex(ARTICLES, TAGS)
+
+
+def _inject(html, tag_names, make=None, sample=lambda population, k: list(population)[:k]):
+    with patch('ai_engine.modules.link_index.get_link_index', return_value=_index()), \
+         patch('ai_engine.modules.seo.random.sample', side_effect=sample):
+        return inject_internal_links(html, tag_names, make)
+
+
+# ═══════════════════════════════════════════════════════════════════
+# LinkIndex
+# ═══════════════════════════════════════════════════════════════════
+
+class TestLinkIndex:
+
+    def test_make_lookup_is_case_insensitive_newest_first(self):
+        index = _index()
+        assert [index.ids[p] for p in index.recent_for_make('byd')] == [5, 3, 1]
+        assert index.recent_for_make('Lotus') == []
+
+    def test_tag_lookup_merges_without_repeats(self):
+        index = _index()
+        assert [index.ids[p] for p in index.recent_for_tags(['SUV', 'BYD'])] == [5, 4, 3, 1]
+        assert [index.ids[p] for p in index.recent_for_tags(['SUV'], limit=1)] == [4]
+
+    def test_anchor_tags_capped(self):
+        assert _index().tags[0] == ['BYD', 'Sedan', 'EV']
+
+
+# ═══════════════════════════════════════════════════════════════════
+# inject_internal_links
+# ═══════════════════════════════════════════════════════════════════
+
+class TestInjectInternalLinks:
+
+    def test_links_make_in_separate_paragraphs(self):
+        html = '<p>The BYD lineup grows.</p><p>Another byd model appears.</p>'
+        soup = BeautifulSoup(_inject(html, [], make='BYD'), 'html.parser')
+        links = soup.find_all('a')
+        assert [a['href'] for a in links] == ['/articles/byd-seal-06-review', '/articles/byd-atto-3-facelift']
+        assert [a.string for a in links] == ['BYD', 'byd']
+        assert all(a['data-seo-linker'] == 'true' for a in links)
+
+    def test_priority_keyword_beats_earlier_text(self):
+        # 'new model' appears first, but the make outranks generic anchors
+        html = '<p>A new model from <strong>BYD</strong> arrives.</p>'
+        soup = BeautifulSoup(_inject(html, [], make='BYD'), 'html.parser')
+        link = soup.find('a')
+        assert link.string == 'BYD' and link.parent.name == 'strong'
+
+    def test_paragraphs_with_links_and_partial_words_skipped(self):
+        html = '<p>See <a href="/x">BYD</a> here.</p><p>BYDs are not a word match.</p>'
+        assert _inject(html, [], make='BYD') == html
+
+    def test_tag_anchor_and_title_escaping(self):
+        html = '<p>This SUV is quick.</p>'
+        out = _inject(html, ['Tesla'])
+        link = BeautifulSoup(out, 'html.parser').find('a')
+        assert link['href'] == '/articles/tesla-model-y-juniper'
+        assert link['title'] == 'Tesla Model Y "Juniper" update'
+
+    def test_no_candidates_returns_input(self):
+        html = '<p>Lotus Eletre</p>'
+        assert _inject(html, [], make='Lotus') == html
+        assert inject_internal_links(html, [], None) == html
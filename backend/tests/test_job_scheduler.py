@@ -0,0 +1,188 @@
+"""
+Tests for news/job_scheduler.py — leader lease, occurrence claims,
+run slots (overlap prevention), jittered intervals and duration stats.
+"""
+import threading
+import time
+
+import pytest
+from unittest.mock import patch
+
+from news import job_scheduler
+
+
+@pytest.fixture(autouse=True)
+def local_store():
+    """Isolated in-process store and job registry for every test."""
+    store = job_scheduler._LocalStore()
+    with patch.object(job_scheduler, '_store', store), \
+         patch.object(job_scheduler, '_jobs', {}):
+        yield store
+
+
+class TestLeases:
+
+    def test_claim_is_exclusive_until_released(self, local_store):
+        assert local_store.claim('k', 'a', 60) is True
+        assert local_store.claim('k', 'b', 60) is False
+        local_store.release('k', 'b')  # not the owner — no effect
+        assert local_store.owner('k') == 'a'
+        local_store.release('k', 'a')
+        assert local_store.claim('k', 'b', 60) is True
+
+    def test_expired_lease_can_be_taken_over(self, local_store):
+        assert local_store.claim('k', 'a', 60)
+        local_store._leases['k'] = ('a', time.time() - 1)
+        assert local_store.renew('k', 'a', 60) is False
+        assert local_store.claim('k', 'b', 60) is True
+
+    def test_single_leader(self, local_store):
+        assert job_scheduler._hold_leadership() is True
+        assert job_scheduler.is_leader()
+        local_store._leases[f'{job_scheduler.KEY_PREFIX}:leader'] = ('other-host', time.time() + 30)
+        assert job_scheduler._hold_leadership() is False
+
+
+class TestRedisOutage:
+
+    @pytest.fixture
+    def redis_down(self):
+        from news.redis_state import RedisReconnector
+        with patch.object(job_scheduler, '_store', None), \
+             patch.object(job_scheduler, '_fallback', None), \
+             patch.object(job_scheduler, '_redis', RedisReconnector('test')), \
+             patch.object(job_scheduler, 'redis_configured', return_value=True), \
+             patch('django_redis.get_redis_connection', side_effect=ConnectionError('down')) as connect:
+            yield connect
+
+    def test_no_leadership_or_ticks_while_redis_is_down(self, redis_down):
+        job_scheduler.register('j', lambda: None, 60, jitter=0)
+        assert job_scheduler._hold_leadership() is False
+        assert job_scheduler.tick(dispatch=lambda job: None) == []
+        assert job_scheduler._redis.degraded
+
+    def test_redis_retried_with_backoff(self, redis_down):
+        from unittest.mock import MagicMock
+        job_scheduler._get_store()
+        job_scheduler._get_store()
+        assert redis_down.call_count == 1  # backing off
+
+        redis_down.side_effect = None
+        redis_down.return_value = MagicMock()
+        job_scheduler._redis._next_try = 0
+        assert isinstance(job_scheduler._get_store(), job_scheduler._RedisStore)
+        assert not job_scheduler._redis.degraded
+        assert job_scheduler._fenced()
+
+
+class TestTick:
+
+    def test_first_sight_uses_initial_delay(self):
+        calls = []
+        job_scheduler.register('j', lambda: calls.append(1), 60, initial_delay=120)
+        assert job_scheduler.tick(dispatch=lambda job: None) == []
+        assert job_scheduler._next_run('j') > time.time() + 100
+
+    def test_due_job_dispatched_once_per_occurrence(self):
+        job_scheduler.register('j', lambda: None, 60, jitter=0)
+        job_scheduler.run_soon('j')
+        due_at = job_scheduler._next_run('j')
+        dispatched = []
+
+        assert job_scheduler.tick(dispatch=dispatched.append) == ['j']
+        # A second ticker racing on the same occurrence must not dispatch it again
+        job_scheduler._get_store().hset(job_scheduler._job_key('j'), {'next_run': due_at})
+        assert job_scheduler.tick(dispatch=dispatched.append) == []
+        assert len(dispatched) == 1
+
+    def test_next_run_is_jittered(self):
+        job_scheduler.register('j', lambda: None, 1000, jitter=0.1)
+        before = time.time()
+        job_scheduler.schedule_next('j', 1000)
+        delay = job_scheduler._next_run('j') - before
+        assert 900 <= delay <= 1100.5
+
+
+class TestRunJob:
+
+    def test_overlapping_run_is_skipped(self):
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow():
+            started.set()
+            release.wait(5)
+
+        job_scheduler.register('slow', slow, 60)
+        worker = threading.Thread(target=job_scheduler.run_job, args=('slow',))
+        worker.start()
+        started.wait(5)
+        assert job_scheduler.run_job('slow') is False
+        release.set()
+        worker.join(5)
+        assert job_scheduler.run_job('slow') is True
+
+    def test_slot_renewed_while_job_overruns_timeout(self):
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow():
+            started.set()
+            release.wait(5)
+
+        job_scheduler.register('slow', slow, 60, timeout=0.3)
+        worker = threading.Thread(target=job_scheduler.run_job, args=('slow',))
+        with patch.object(job_scheduler, 'logger') as logger:
+            worker.start()
+            started.wait(5)
+            time.sleep(0.9)  # three lease TTLs — only the heartbeat keeps the slot
+            assert job_scheduler.run_job('slow') is False
+            release.set()
+            worker.join(5)
+        assert any('past its 0.3s timeout' in c.args[0] for c in logger.warning.call_args_list)
+        assert job_scheduler.run_job('slow') is True
+
+    def test_concurrency_limit_allows_parallel_runs(self):
+        job_scheduler.register('par', lambda: None, 60, max_concurrency=2)
+        job = job_scheduler.get_job('par')
+        first = job_scheduler._acquire_slot(job, 'a')
+        second = job_scheduler._acquire_slot(job, 'b')
+        assert first and second and first != second
+        assert job_scheduler._acquire_slot(job, 'c') is None
+
+    def test_failure_recorded_and_slot_released(self):
+        def boom():
+            raise RuntimeError('fail')
+
+        job_scheduler.register('boom', boom, 60)
+        assert job_scheduler.run_job('boom') is True
+        status = {j['name']: j for j in job_scheduler.get_jobs_status()}['boom']
+        assert status['last_status'] == 'error'
+        assert status['running'] == 0
+        assert job_scheduler.run_job('boom') is True
+
+    def test_duration_histogram(self):
+        job_scheduler.register('fast', lambda: None, 60)
+        job_scheduler.run_job('fast')
+        job_scheduler.run_job('fast')
+        status = job_scheduler.get_jobs_status()[0]
+        assert status['runs'] == 2
+        assert status['duration_histogram']['1'] == 2
+        assert status['last_status'] == 'ok'
+
+    def test_unknown_job(self):
+        assert job_scheduler.run_job('nope') is False
+
+
+class TestSchedulerRegistration:
+
+    def test_all_periodic_jobs_registered(self):
+        from news import scheduler
+        scheduler._register_jobs()
+        names = {job.name for job in job_scheduler.get_jobs()}
+        assert {
+            'gsc_sync', 'currency_update', 'rss_scan', 'youtube_scan', 'auto_publish',
+            'scheduled_publish', 'deep_specs', 'stale_error_cleanup', 'ab_lifecycle',
+            'db_backup', 'system_graph_cache', 'related_articles', 'image_pipeline',
+            'rss_bulk_claims',
+        } <= names
@@ -112,7 +112,7 @@ class TestCombineStatuses:
 
 class TestCheckRobotsTxt:
 
-    @patch('ai_engine.modules.license_checker.requests.get')
+    @patch('ai_engine.modules.license_checker.web_fetch.get')
     def test_non_200_response(self, mock_get):
         """L241: non-200 → green, no restrictions."""
         from ai_engine.modules.license_checker import _check_robots_txt
@@ -121,7 +121,7 @@ class TestCheckRobotsTxt:
         assert result['status'] == 'green'
         assert 'No robots.txt' in result['summary']
 
-    @patch('ai_engine.modules.license_checker.requests.get')
+    @patch('ai_engine.modules.license_checker.web_fetch.get')
     def test_blanket_disallow(self, mock_get):
         from ai_engine.modules.license_checker import _check_robots_txt
         mock_get.return_value = MagicMock(
@@ -131,7 +131,7 @@ class TestCheckRobotsTxt:
         result = _check_robots_txt('https://example.com')
         assert result['status'] == 'red'
 
-    @patch('ai_engine.modules.license_checker.requests.get')
+    @patch('ai_engine.modules.license_checker.web_fetch.get')
     def test_allows_crawling(self, mock_get):
         from ai_engine.modules.license_checker import _check_robots_txt
         mock_get.return_value = MagicMock(
@@ -141,7 +141,7 @@ class TestCheckRobotsTxt:
         result = _check_robots_txt('https://example.com')
         assert result['status'] == 'green'
 
-    @patch('ai_engine.modules.license_checker.requests.get')
+    @patch('ai_engine.modules.license_checker.web_fetch.get')
     def test_request_exception(self, mock_get):
         """L262-264: RequestException → green (assuming OK)."""
         from ai_engine.modules.license_checker import _check_robots_txt
@@ -192,7 +192,7 @@ class TestDetectPressPortal:
 
 class TestFindTosPage:
 
-    @patch('ai_engine.modules.license_checker.requests.get')
+    @patch('ai_engine.modules.license_checker.web_fetch.get')
     def test_found_at_standard_path(self, mock_get):
         """L293-303: ToS found at /terms."""
         from ai_engine.modules.license_checker import _find_tos_page
@@ -210,7 +210,7 @@ class TestFindTosPage:
         assert result['found'] is True
         assert '/terms' in result['url']
 
-    @patch('ai_engine.modules.license_checker.requests.get')
+    @patch('ai_engine.modules.license_checker.web_fetch.get')
     def test_all_paths_fail_footer_scrape(self, mock_get):
         """L307-337: No standard path → scrape homepage footer for ToS links."""
         from ai_engine.modules.license_checker import _find_tos_page
@@ -239,7 +239,7 @@ class TestFindTosPage:
         result = _find_tos_page('https://example.com')
         assert result['found'] is True
 
-    @patch('ai_engine.modules.license_checker.requests.get')
+    @patch('ai_engine.modules.license_checker.web_fetch.get')
     def test_all_fails(self, mock_get):
         """Nothing found anywhere → found=False."""
         from ai_engine.modules.license_checker import _find_tos_page
@@ -247,7 +247,7 @@ class TestFindTosPage:
         result = _find_tos_page('https://example.com')
         assert result['found'] is False
 
-    @patch('ai_engine.modules.license_checker.requests.get')
+    @patch('ai_engine.modules.license_checker.web_fetch.get')
     def test_standard_path_request_exception(self, mock_get):
         """L304-305: RequestException on standard path → continues."""
         from ai_engine.modules.license_checker import _find_tos_page
@@ -255,7 +255,7 @@ class TestFindTosPage:
         result = _find_tos_page('https://example.com')
         assert result['found'] is False
 
-    @patch('ai_engine.modules.license_checker.requests.get')
+    @patch('ai_engine.modules.license_checker.web_fetch.get')
     def test_soft_404_page_skipped(self, mock_get):
         """L300: Page returns 200 but contains '404' → skipped as soft 404."""
         from ai_engine.modules.license_checker import _find_tos_page
@@ -271,7 +271,7 @@ class TestFindTosPage:
         result = _find_tos_page('https://example.com')
         assert result['found'] is False
 
-    @patch('ai_engine.modules.license_checker.requests.get')
+    @patch('ai_engine.modules.license_checker.web_fetch.get')
     def test_footer_link_absolute_url(self, mock_get):
         """L321-322: Footer link starts with http → used as-is."""
         from ai_engine.modules.license_checker import _find_tos_page
@@ -414,7 +414,7 @@ class TestCheckImageRights:
 class TestAnalyzeHomepage:
 
     @patch('ai_engine.modules.ai_provider.get_light_provider')
-    @patch('ai_engine.modules.license_checker.requests.get')
+    @patch('ai_engine.modules.license_checker.web_fetch.get')
     def test_successful_homepage_analysis(self, mock_get, mock_ai):
         """L453-472: Homepage fetched, AI analyzes."""
         from ai_engine.modules.license_checker import _analyze_homepage
@@ -433,21 +433,21 @@ class TestAnalyzeHomepage:
         assert result is not None
         assert result['is_press_portal'] is True
 
-    @patch('ai_engine.modules.license_checker.requests.get')
+    @patch('ai_engine.modules.license_checker.web_fetch.get')
     def test_non_200_returns_none(self, mock_get):
         """L459-460: Non-200 response → None."""
         from ai_engine.modules.license_checker import _analyze_homepage
         mock_get.return_value = MagicMock(status_code=503)
         assert _analyze_homepage('https://example.com') is None
 
-    @patch('ai_engine.modules.license_checker.requests.get')
+    @patch('ai_engine.modules.license_checker.web_fetch.get')
     def test_short_text_returns_none(self, mock_get):
         """L463-464: Text < 100 chars → None."""
         from ai_engine.modules.license_checker import _analyze_homepage
         mock_get.return_value = MagicMock(status_code=200, text='<p>Short</p>')
         assert _analyze_homepage('https://example.com') is None
 
-    @patch('ai_engine.modules.license_checker.requests.get')
+    @patch('ai_engine.modules.license_checker.web_fetch.get')
     def test_request_exception_returns_none(self, mock_get):
         """L474-476: Request exception → None."""
         from ai_engine.modules.license_checker import _analyze_homepage
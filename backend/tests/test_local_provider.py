@@ -0,0 +1,139 @@
+"""
+Tests for ai_engine/modules/local_provider.py — the offline LLM stand-in:
+latency specs, cassette record/replay, templated responses and the
+AI_PROVIDER_OVERRIDE switch in ai_provider.get_ai_provider().
+"""
+import json
+import random
+import re
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from ai_engine.modules import local_provider
+from ai_engine.modules.local_provider import (
+    LocalProvider, RecordingProvider, cassette_key, parse_latency, render_template,
+)
+
+
+@pytest.fixture
+def local(tmp_path):
+    """LocalProvider with zero latency and fresh stats."""
+    LocalProvider.configure(cassette='', latency='fixed:0', seed=1)
+    LocalProvider.reset_stats()
+    yield LocalProvider
+    LocalProvider.configure(cassette='', latency='fixed:0', seed=None)
+    LocalProvider.reset_stats()
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Latency specs
+# ═══════════════════════════════════════════════════════════════════
+
+class TestLatency:
+
+    def test_fixed_and_per_caller(self):
+        dists = parse_latency('fixed:100;article_generate=fixed:2500')
+        rng = random.Random(0)
+        assert dists['*'](rng) == pytest.approx(0.1)
+        assert dists['article_generate'](rng) == pytest.approx(2.5)
+
+    def test_lognormal_median(self):
+        dist = parse_latency('lognormal:1000:0.3')['*']
+        rng = random.Random(3)
+        samples = sorted(dist(rng) for _ in range(2001))
+        assert samples[1000] == pytest.approx(1.0, rel=0.1)
+
+    def test_normal_never_negative(self):
+        dist = parse_latency('normal:10:1000')['*']
+        rng = random.Random(5)
+        assert min(dist(rng) for _ in range(500)) >= 0
+
+    def test_default_when_empty(self):
+        assert set(parse_latency(None)) == {'*'}
+
+    @pytest.mark.parametrize('spec', ['gamma:1:2', 'fixed', 'uniform:a:b'])
+    def test_invalid_spec(self, spec):
+        with pytest.raises(ValueError):
+            parse_latency(spec)
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Templates
+# ═══════════════════════════════════════════════════════════════════
+
+class TestTemplates:
+
+    def test_analysis_uses_prompt_fields(self):
+        text = render_template('Make: Zeekr\nModel: 7X\nYear: 2025\n', 'transcript_analyze')
+        assert 'Make: Zeekr' in text and 'Year: 2025' in text
+
+    def test_article_is_long_enough(self):
+        html = render_template('', 'article_generate')
+        # article_prompt_builder.generate_article retries below 1000 words
+        assert len(re.sub(r'<[^>]+>', ' ', html).split()) >= 1000
+        assert '<h2>' in html
+
+    def test_json_prompt_echoes_example(self):
+        prompt = 'Return JSON like {"score": 7, "reason": "ok"} and nothing else'
+        assert json.loads(render_template(prompt, 'some_scorer')) == {'score': 7, 'reason': 'ok'}
+
+    def test_unknown_caller(self):
+        assert render_template('hello', 'mystery') == 'OK'
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Provider, cassettes and factory
+# ═══════════════════════════════════════════════════════════════════
+
+class TestLocalProvider:
+
+    def test_templated_call_updates_stats(self, local):
+        import ai_engine.modules.ai_provider as ai_provider
+        text = local.generate_completion('Make: NIO', caller='title_seo')
+        assert text.startswith('TITLE:')
+        stats = local.stats()['title_seo']
+        assert stats['calls'] == 1 and stats['replayed'] == 0
+        assert ai_provider._last_model_used == local_provider.LOCAL_MODEL_NAME
+
+    def test_recording_provider_appends_entry(self, tmp_path):
+        path = str(tmp_path / 'cassette.jsonl')
+        inner = MagicMock()
+        inner.generate_completion.return_value = 'recorded answer'
+        assert RecordingProvider(inner, path).generate_completion('prompt', caller='x') == 'recorded answer'
+        entry = json.loads(open(path).read())
+        assert entry['key'] == cassette_key('prompt', None, 'x')
+        assert entry['response'] == 'recorded answer'
+
+    def test_replays_recorded_response_and_latency(self, local, tmp_path):
+        path = tmp_path / 'cassette.jsonl'
+        path.write_text(json.dumps({
+            'key': cassette_key('prompt', 'sys', 'x'), 'caller': 'x',
+            'response': 'recorded answer', 'latency_ms': 250,
+        }) + '\n')
+        local.configure(cassette=str(path), latency='', seed=1)
+        with patch.object(local_provider.time, 'sleep') as sleep:
+            assert local.generate_completion('prompt', system_prompt='sys', caller='x') == 'recorded answer'
+        sleep.assert_called_once_with(0.25)
+        assert local.stats()['x']['replayed'] == 1
+
+    def test_cassette_miss_falls_back_to_template(self, local, tmp_path):
+        path = tmp_path / 'cassette.jsonl'
+        path.write_text('not json\n')
+        local.configure(cassette=str(path), latency='fixed:0')
+        assert local.generate_completion('anything', caller='categorize').startswith('Category:')
+
+    def test_override_routes_factories(self, monkeypatch):
+        from ai_engine.modules import ai_provider
+        monkeypatch.setenv('AI_PROVIDER_OVERRIDE', 'local')
+        assert isinstance(ai_provider.get_ai_provider('gemini'), LocalProvider)
+        assert isinstance(ai_provider.get_light_provider(), LocalProvider)
+        assert 'local' in [p['name'] for p in ai_provider.get_available_providers()]
+
+    def test_record_env_wraps_gemini(self, monkeypatch, tmp_path):
+        from ai_engine.modules import ai_provider
+        monkeypatch.delenv('AI_PROVIDER_OVERRIDE', raising=False)
+        monkeypatch.setenv('AI_RECORD_CASSETTE', str(tmp_path / 'rec.jsonl'))
+        provider = ai_provider.get_ai_provider('gemini')
+        assert isinstance(provider, RecordingProvider)
+        assert isinstance(provider.inner, ai_provider.GeminiProvider)
@@ -0,0 +1,196 @@
+"""
+Tests for ai_engine/modules/phrase_matcher.py — trie-compiled phrase matcher,
+anchor-gated regex rule sets and the lazily rebuilt vocabularies, plus the
+brand/tag detectors that now run on top of them.
+"""
+import random
+import re
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from ai_engine.modules import phrase_matcher
+from ai_engine.modules.phrase_matcher import PhraseMatcher, RegexRuleSet, required_literal
+
+
+# ═══════════════════════════════════════════════════════════════════
+# PhraseMatcher
+# ═══════════════════════════════════════════════════════════════════
+
+class TestPhraseMatcher:
+
+    def test_longest_match_wins(self):
+        m = PhraseMatcher(['land', 'land rover', 'rover'])
+        assert [x.phrase for x in m.find_all('New Land Rover Defender')] == ['land rover']
+
+    def test_whole_words_only(self):
+        m = PhraseMatcher(['seat', 'ev'])
+        assert m.find_all('A 6-seater with a rev limiter') == []
+        assert [x.phrase for x in m.find_all('SEAT unveils new EV')] == ['seat', 'ev']
+
+    def test_substring_mode(self):
+        m = PhraseMatcher(['ota'], whole_words=False)
+        assert m.values_in('remote updates via photas') == ['ota']
+
+    def test_overlapping_reports_nested_phrases(self):
+        m = PhraseMatcher({'im': 'IM', 'im motors': 'IM Motors', 'motors': 'Motors'})
+        found = [(x.phrase, x.start) for x in m.find_all('the im motors l7', overlapping=True)]
+        assert ('im', 4) in found and ('im motors', 4) in found and ('motors', 7) in found
+
+    def test_overlapping_respects_word_boundary_of_prefix(self):
+        m = PhraseMatcher(['ota', 'ota update'])
+        assert m.values_in('otaupdate') == []
+        assert m.values_in('ota updates') == ['ota']
+
+    def test_values_and_duplicates(self):
+        m = PhraseMatcher([('lidar', 'LiDAR'), ('lidar', 'Sensors'), ('radar', 'Radar')])
+        assert m.values_in('Radar and LIDAR fused') == ['Radar', 'LiDAR', 'Sensors']
+        assert m.get('LiDAR') == 'LiDAR'
+
+    def test_regex_metacharacters_are_literal(self):
+        m = PhraseMatcher(['lynk & co', 'mercedes-benz', 'c++'], whole_words=False)
+        assert m.values_in('Lynk & Co vs Mercedes-Benz') == ['lynk & co', 'mercedes-benz']
+
+    def test_empty(self):
+        assert PhraseMatcher([]).find_all('anything') == []
+        assert not PhraseMatcher([])
+
+    def test_matches_per_pattern_scan(self):
+        """Same hits as one `\\bphrase\\b` search per phrase."""
+        from news.auto_tags import KNOWN_BRANDS
+        matcher = PhraseMatcher(KNOWN_BRANDS)
+        rng = random.Random(7)
+        words = sorted(KNOWN_BRANDS) + ['review', 'the', 'new', 'suv', 'seater', 'x5', '2026']
+        for _ in range(300):
+            title = ' '.join(rng.choice(words) for _ in range(8))
+            expected = {b for b in KNOWN_BRANDS if re.search(rf'\b{re.escape(b)}\b', title)}
+            assert set(matcher.values_in(title)) == expected, title
+
+
+# ═══════════════════════════════════════════════════════════════════
+# RegexRuleSet
+# ═══════════════════════════════════════════════════════════════════
+
+class TestRegexRuleSet:
+
+    def test_required_literal(self):
+        assert required_literal(re.compile(r'(?:a\s+)?paradigm\s+shift')) == 'paradigm'
+        assert required_literal(re.compile(r'\bWell, ', re.I)) == 'well, '
+        assert required_literal(re.compile(r'foo|bar')) is None
+
+    def test_rules_only_run_when_anchor_present(self):
+        rule = MagicMock(pattern='never', flags=0)
+        rules = RegexRuleSet([(re.compile('luxary', re.I), 'luxury')])
+        rules.rules.append((rule, '', 'never'))
+        assert rules.apply('a LUXARY sedan') == ('a luxury sedan', 1)
+        rule.subn.assert_not_called()
+
+    def test_chained_rules_see_rewritten_text(self):
+        rules = RegexRuleSet([
+            (re.compile('aaa'), 'bbb'),
+            (re.compile('bbb'), 'ccc'),
+        ])
+        assert rules.apply('aaa') == ('ccc', 2)
+
+    @pytest.mark.parametrize('seed', range(5))
+    def test_banned_rules_match_plain_loop(self, seed):
+        from ai_engine.modules.banned_phrases import _BANNED_INLINE_REPLACEMENTS, _BANNED_INLINE_RULES
+        rng = random.Random(seed)
+        fragments = [
+            'is making waves in', 'a paradigm shift', 'Buckle up, folks, because',
+            'jaw-dropping', 'Well, ', 'a compelling option', 'it\'s clear that',
+            'game changer in the', 'the BYD Seal', '<p>', '</p>', 'range',
+        ]
+        text = ' '.join(rng.choice(fragments) for _ in range(60))
+        expected = text
+        for pattern, replacement in _BANNED_INLINE_REPLACEMENTS:
+            expected = pattern.sub(replacement, expected)
+        assert _BANNED_INLINE_RULES.apply(text)[0] == expected
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Vocabularies
+# ═══════════════════════════════════════════════════════════════════
+
+class TestVocabularies:
+
+    @pytest.fixture
+    def builder(self):
+        calls = []
+
+        def build():
+            calls.append(1)
+            return PhraseMatcher([f'brand{len(calls)}'])
+
+        with patch.dict(phrase_matcher._VOCABULARIES, {'test': (build, ('Brand',))}):
+            yield calls
+        phrase_matcher._compiled.pop('test', None)
+
+    def test_built_once_until_invalidated(self, builder):
+        first = phrase_matcher.get_vocabulary('test')
+        assert phrase_matcher.get_vocabulary('test') is first
+        assert len(builder) == 1
+
+        phrase_matcher.invalidate('Brand', shared=False)
+        assert phrase_matcher.get_vocabulary('test') is not first
+        assert len(builder) == 2
+
+    def test_unrelated_model_keeps_vocabulary(self, builder):
+        phrase_matcher.get_vocabulary('test')
+        phrase_matcher.invalidate('Comment', shared=False)
+        phrase_matcher.get_vocabulary('test')
+        assert len(builder) == 1
+
+    def test_newer_shared_version_triggers_rebuild(self, builder):
+        phrase_matcher.get_vocabulary('test')
+        phrase_matcher._last_version_check['test'] = 0
+        with patch.object(phrase_matcher, '_shared_version', return_value=1e12):
+            phrase_matcher.get_vocabulary('test')
+        assert len(builder) == 2
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Detectors built on the matcher
+# ═══════════════════════════════════════════════════════════════════
+
+class TestDetectors:
+
+    def test_rss_brands_longest_first(self):
+        from news.rss_intelligence import extract_brands_from_title
+        keys = [r['brand_key'] for r in extract_brands_from_title('IM Motors L6 beats BMW i5')]
+        assert keys == ['im motors', 'bmw']
+
+    def test_title_model_uses_longest_brand(self):
+        from news.auto_tags import extract_tags_from_title
+        article = MagicMock(title='Mercedes-Benz EQS 2026 review', content='<p>Electric sedan</p>')
+        tags = extract_tags_from_title(article)
+        assert ('mercedes-benz', 'Manufacturers') in tags
+        assert ('mercedes', 'Manufacturers') in tags
+        models = [name for name, group in tags if group == 'Models']
+        assert models and models[0].endswith('Eqs 2026 Review')
+
+    def test_title_brands_and_model_match_per_brand_loops(self):
+        """Same Manufacturers/Models tags, in the same order, as the KNOWN_BRANDS loops."""
+        from news.auto_tags import (BRAND_DISPLAY_NAMES, KNOWN_BRANDS, _GENERIC_MODEL_WORDS,
+                                    extract_tags_from_title)
+
+        def per_brand_loops(title):
+            title = title.lower()
+            tags = [(b, 'Manufacturers') for b in KNOWN_BRANDS if re.search(rf'\b{re.escape(b)}\b', title)]
+            for brand in KNOWN_BRANDS:
+                m = re.search(rf'\b{re.escape(brand)}\s+([\w#]+(?:\s+[\w#]+)?(?:\s+[\w#]+)?)\b', title)
+                if m and m.group(1).split()[0] not in _GENERIC_MODEL_WORDS:
+                    display = BRAND_DISPLAY_NAMES.get(brand, brand.title())
+                    tags.append((f"{display} {m.group(1).strip().title()}", 'Models'))
+                    break
+            return tags
+
+        titles = ['BMW vs Mercedes EQS review', 'Kia EV9 versus Hyundai Ioniq 7',
+                  'IM Motors L6 beats BMW i5', 'Tesla Model Y or BYD Sealion 7 or Xpeng G6']
+        rng = random.Random(11)
+        words = sorted(KNOWN_BRANDS) + ['review', 'vs', 'x5', 'seal', '2026']
+        titles += [' '.join(rng.choice(words) for _ in range(6)) for _ in range(200)]
+        for title in titles:
+            tags = extract_tags_from_title(MagicMock(title=title, content=''))
+            got = [t for t in tags if t[1] in ('Manufacturers', 'Models')]
+            assert got == per_brand_loops(title), title
@@ -0,0 +1,193 @@
+"""
+Tests for news/profiling.py — per-request SQL/cache/HTTP/LLM counters,
+duplicate-query fingerprints, the sampling middleware, per-route
+percentiles and the admin endpoint. Runs on the in-process store.
+"""
+from contextlib import nullcontext
+from unittest.mock import patch
+
+import pytest
+import requests
+from django.test import override_settings
+from rest_framework.test import APIClient
+
+from news import profiling
+
+
+@pytest.fixture
+def store():
+    local = profiling._LocalStore()
+    with patch.object(profiling, '_store', local):
+        yield local
+
+
+def _sample(ms, sql=1, dups=()):
+    return {'ms': ms, 'sql': sql, 'sql_ms': 1.0, 'duplicate_queries': len(dups),
+            'cache': 0, 'http_ms': 0, 'llm_ms': 0, 'dups': list(dups)}
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Profiles
+# ═══════════════════════════════════════════════════════════════════
+
+class TestFingerprint:
+
+    def test_literals_and_in_lists_share_a_shape(self):
+        a = profiling.fingerprint('SELECT * FROM t WHERE id = 3 AND name = \'x\'')
+        b = profiling.fingerprint('SELECT *  FROM t WHERE id = 17 AND name = \'it\'\'s\'')
+        assert a == b
+        c = profiling.fingerprint('SELECT * FROM t WHERE id IN (%s, %s, %s)')
+        assert c[1] == 'SELECT * FROM t WHERE id IN (?, ...)'
+        assert profiling.fingerprint('SELECT * FROM t WHERE id IN (%s, %s)') == c
+
+
+@pytest.mark.django_db
+class TestProfile:
+
+    def test_sql_counted_with_duplicates(self):
+        from news.models import Tag
+        tags = [Tag.objects.create(name=f'Tag {i}', slug=f'tag-{i}') for i in range(3)]
+        with profiling.profile('n+1') as prof:
+            for tag in tags:
+                Tag.objects.get(pk=tag.pk)
+            Tag.objects.count()
+        assert prof.sql == 4
+        summary = prof.summary()
+        assert summary['duplicate_queries'] == 2
+        assert summary['duplicates'][0]['count'] == 3
+        assert prof.total_ms > 0
+
+    def test_nested_profiles_both_count(self):
+        from news.models import Tag
+        with profiling.profile('outer') as outer:
+            Tag.objects.count()
+            with profiling.profile('inner') as inner:
+                Tag.objects.count()
+        assert (outer.sql, inner.sql) == (2, 1)
+
+    def test_nothing_counted_outside_a_profile(self):
+        from news.models import Tag
+        with profiling.profile() as prof:
+            pass
+        Tag.objects.count()
+        assert prof.sql == 0
+
+    def test_cache_calls_counted_once(self):
+        from django.core.cache import cache
+        with profiling.profile() as prof:
+            cache.set('profiling-test', 1)
+            cache.get('profiling-test')
+            cache.get_or_set('profiling-other', 2)
+        assert prof.cache == 3
+
+    def test_outbound_http(self):
+        response = requests.Response()
+        response.status_code = 204
+        with patch('requests.adapters.HTTPAdapter.send', return_value=response), \
+             profiling.profile() as prof:
+            requests.get('https://example.com/page')
+        assert prof.http == 1
+        assert prof.trace()['http_calls'][0]['host'] == 'example.com'
+        assert prof.trace()['http_calls'][0]['status'] == 204
+
+    def test_llm_span(self):
+        with profiling.profile() as prof:
+            with profiling.span('llm'):
+                pass
+        assert prof.llm == 1
+        assert isinstance(profiling.span('llm'), nullcontext)  # no profile: no timing
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Route windows
+# ═══════════════════════════════════════════════════════════════════
+
+class TestRouteStats:
+
+    def test_percentiles_and_repeated_statements(self, store):
+        for ms in range(1, 101):
+            dups = [['abc', 5, 'SELECT ...']] if ms % 2 else []
+            store.push('GET /api/v1/articles/', _sample(ms, dups=dups), window=200)
+        store.push('GET /api/v1/tags/', _sample(5), window=200)
+
+        stats = profiling.route_stats()
+        assert [s['route'] for s in stats] == ['GET /api/v1/articles/', 'GET /api/v1/tags/']
+        articles = stats[0]
+        assert articles['samples'] == 100
+        assert articles['ms'] == {'p50': 50, 'p95': 95, 'p99': 99, 'max': 100}
+        assert articles['repeated_statements'] == [
+            {'fingerprint': 'abc', 'requests': 50, 'max_repeats': 5, 'sql': 'SELECT ...'}]
+        assert profiling.route_stats('GET /api/v1/tags/')[0]['samples'] == 1
+
+    def test_window_keeps_the_newest_samples(self, store):
+        for ms in range(10):
+            store.push('GET /x/', _sample(ms), window=3)
+        assert [s['ms'] for s in store.samples('GET /x/')] == [9, 8, 7]
+
+    def test_unreachable_redis_is_retried(self):
+        from unittest.mock import MagicMock
+        from news.redis_state import RedisReconnector
+        with patch.object(profiling, '_store', None), \
+             patch.object(profiling, '_fallback', None), \
+             patch.object(profiling, '_redis', RedisReconnector('test')), \
+             patch.object(profiling, 'redis_configured', return_value=True), \
+             patch('django_redis.get_redis_connection', side_effect=ConnectionError('down')) as connect:
+            assert isinstance(profiling._get_store(), profiling._LocalStore)
+            assert profiling._store is None  # not cached for the process lifetime
+
+            connect.side_effect, connect.return_value = None, MagicMock()
+            profiling._redis._next_try = 0
+            assert isinstance(profiling._get_store(), profiling._RedisStore)
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Middleware and endpoint
+# ═══════════════════════════════════════════════════════════════════
+
+@pytest.mark.django_db
+class TestMiddleware:
+
+    def test_off_by_default(self, store):
+        with override_settings(PROFILING_SAMPLE_RATE=0):
+            APIClient().get('/api/v1/health/')
+        assert store.routes() == []
+
+    def test_sampled_request_recorded_under_its_route(self, store):
+        with override_settings(PROFILING_SAMPLE_RATE=1, PROFILING_SLOW_MS=0):
+            APIClient().get('/api/v1/health/')
+        assert store.routes() == ['GET /api/v1/health/']
+        trace = profiling.traces('GET /api/v1/health/')[0]
+        assert trace['path'] == '/api/v1/health/'
+        assert 'slowest_sql' in trace
+
+    def test_fast_requests_keep_no_trace(self, store):
+        with override_settings(PROFILING_SAMPLE_RATE=1, PROFILING_SLOW_MS=60_000):
+            APIClient().get('/api/v1/health/')
+        assert store.routes() and profiling.traces() == []
+
+    def test_store_errors_do_not_fail_the_request(self, store):
+        with patch.object(store, 'push', side_effect=ConnectionError('down')), \
+             override_settings(PROFILING_SAMPLE_RATE=1):
+            assert APIClient().get('/api/v1/health/').status_code == 200
+
+
+@pytest.mark.django_db
+class TestProfilingStatsView:
+
+    def test_admin_sees_routes_and_traces(self, store, django_user_model):
+        store.push('GET /api/v1/tags/', _sample(12), window=200,
+                   trace={'route': 'GET /api/v1/tags/', 'ms': 12})
+        client = APIClient()
+        client.force_authenticate(django_user_model.objects.create_superuser('prof', 'p@test.com', 'pass'))
+
+        resp = client.get('/api/v1/health/profiling/')
+        assert resp.status_code == 200
+        assert resp.data['routes'][0]['route'] == 'GET /api/v1/tags/'
+        assert resp.data['traces'] == [{'route': 'GET /api/v1/tags/', 'ms': 12}]
+
+        assert client.delete('/api/v1/health/profiling/').status_code == 204
+        assert store.routes() == []
+
+    def test_anonymous_forbidden(self, api_client):
+        resp = api_client.get('/api/v1/health/profiling/')
+        assert resp.status_code in (401, 403)
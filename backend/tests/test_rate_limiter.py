@@ -0,0 +1,219 @@
+"""
+Tests for ai_engine/modules/rate_limiter.py — GCRA buckets for RPM and RPD,
+batch priority reserve, blocking acquire with a deadline, 429 feedback and
+wait metrics. Runs on the in-process store with a fake clock; the Redis
+store is checked for the keys and arguments it hands its Lua script.
+"""
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from ai_engine.modules import rate_limiter
+
+LIMITS = {
+    'fast': {'rpm': 100, 'rpd': None},    # soft 80/min → 750 ms apart, burst of 8
+    'daily': {'rpm': 1000, 'rpd': 10},    # soft 8/day, burst of 2
+    'backup': {'rpm': 100, 'rpd': None},
+}
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def time(self):
+        return self.now
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    fake = FakeClock()
+    with patch.object(rate_limiter, '_store', rate_limiter._LocalStore()), \
+         patch.object(rate_limiter, 'time', fake), \
+         patch('ai_engine.modules.ai_provider.MODEL_RATE_LIMITS', LIMITS), \
+         patch('ai_engine.modules.ai_provider.RATE_LIMIT_THRESHOLD', 0.8):
+        rate_limiter._factors_seen.clear()
+        yield fake
+
+
+def _drain(model, **kwargs):
+    taken = 0
+    while rate_limiter.try_acquire(model, **kwargs):
+        taken += 1
+    return taken
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Buckets
+# ═══════════════════════════════════════════════════════════════════
+
+class TestBuckets:
+
+    def test_burst_then_steady_rate(self, clock):
+        assert _drain('fast') == 8
+        clock.sleep(0.75)
+        assert rate_limiter.try_acquire('fast')
+        assert not rate_limiter.try_acquire('fast')
+
+    def test_daily_limit_applies_with_minute_budget_left(self, clock):
+        assert _drain('daily') == 2
+        clock.sleep(60)
+        assert not rate_limiter.available('daily')
+        clock.sleep(86400 / 8)
+        assert rate_limiter.available('daily')
+
+    def test_available_takes_no_token(self, clock):
+        for _ in range(20):
+            assert rate_limiter.available('fast')
+        assert _drain('fast') == 8
+
+    def test_unknown_models_are_not_limited(self, clock):
+        assert all(rate_limiter.try_acquire('mystery') for _ in range(100))
+
+    def test_batch_leaves_the_reserve_to_interactive(self, clock):
+        with rate_limiter.priority('batch'):
+            assert _drain('fast') == 4
+            assert not rate_limiter.available('fast')
+        assert _drain('fast') == 4
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Blocking acquire
+# ═══════════════════════════════════════════════════════════════════
+
+class TestAcquire:
+
+    def test_waits_for_the_next_token(self, clock):
+        _drain('fast')
+        started = clock.now
+        assert rate_limiter.acquire('fast', timeout=5)
+        assert 0.7 <= clock.now - started < 1.0
+
+    def test_deadline(self, clock):
+        _drain('fast')
+        assert not rate_limiter.acquire('fast', timeout=0.2)
+        assert rate_limiter.stats(['fast'])['fast']['interactive']['timeouts'] == 1
+
+    def test_cascade_prefers_order_and_falls_through(self, clock):
+        assert rate_limiter.acquire_any(['fast', 'backup'], timeout=0) == 'fast'
+        _drain('fast')
+        assert rate_limiter.acquire_any(['fast', 'backup'], timeout=0) == 'backup'
+
+    def test_wait_metrics(self, clock):
+        rate_limiter.acquire('fast', timeout=0)
+        _drain('fast')
+        rate_limiter.acquire('fast', timeout=5)
+        stats = rate_limiter.stats(['fast'])['fast']
+        assert stats['interactive']['acquired'] == 9
+        assert stats['interactive']['waited'] == 1
+        assert stats['wait_histogram']['<=1s'] == 1
+
+
+# ═══════════════════════════════════════════════════════════════════
+# 429 feedback
+# ═══════════════════════════════════════════════════════════════════
+
+class TestPenalties:
+
+    def test_penalty_slows_the_model_and_empties_the_bucket(self, clock):
+        rate_limiter.penalize('fast')
+        assert not rate_limiter.available('fast')
+        clock.sleep(0.75)
+        assert not rate_limiter.available('fast')  # half rate: 1.5 s apart
+        clock.sleep(0.75)
+        assert rate_limiter.try_acquire('fast')
+        stats = rate_limiter.stats(['fast'])['fast']
+        assert stats['rate_factor'] == 0.5 and stats['penalties'] == 1
+
+    def test_successes_recover_and_penalty_expires(self, clock):
+        for _ in range(10):
+            rate_limiter.penalize('fast')
+        assert rate_limiter.stats(['fast'])['fast']['rate_factor'] == rate_limiter.MIN_FACTOR
+        rate_limiter.record_success('fast')
+        assert rate_limiter.stats(['fast'])['fast']['rate_factor'] == pytest.approx(0.15)
+        clock.sleep(rate_limiter.PENALTY_TTL + 1)
+        assert rate_limiter.stats(['fast'])['fast']['rate_factor'] == 1.0
+
+    def test_rate_limit_errors_recognised(self):
+        assert rate_limiter.is_rate_limit_error(Exception('429 RESOURCE_EXHAUSTED'))
+        assert not rate_limiter.is_rate_limit_error(Exception('500 internal'))
+
+
+class TestRedisStore:
+
+    def test_script_gets_one_tat_key_per_window_and_the_factor_key(self, clock):
+        conn = MagicMock()
+        script = MagicMock(return_value=[0, 1500, 500])
+        conn.register_script.return_value = script
+        with patch.object(rate_limiter, '_store', rate_limiter._RedisStore(conn)), \
+             rate_limiter.priority('batch'):
+            assert rate_limiter.try_acquire('daily') is False
+
+        keys, args = script.call_args.kwargs['keys'], script.call_args.kwargs['args']
+        assert keys == [
+            'autonews:ratelimit:tat:daily:rpm', 'autonews:ratelimit:tat:daily:rpd',
+            'autonews:ratelimit:factor:daily',
+        ]
+        assert args[0] == 1 and len(args) == 5
+        assert args[1] == pytest.approx(75.0) and args[3] == pytest.approx(10800000.0)
+        assert args[2] == pytest.approx(3000.0)  # batch: half the 80-call burst
+        assert rate_limiter._factors_seen['daily'] == 0.5
+
+    def test_redis_errors_allow_the_call(self, clock):
+        conn = MagicMock()
+        conn.register_script.return_value = MagicMock(side_effect=ConnectionError('down'))
+        with patch.object(rate_limiter, '_store', rate_limiter._RedisStore(conn)):
+            assert rate_limiter.try_acquire('fast')
+
+    def test_unreachable_redis_is_retried_not_cached(self, clock):
+        from news.redis_state import RedisReconnector
+        conn = MagicMock()
+        with patch.object(rate_limiter, '_store', None), \
+             patch.object(rate_limiter, '_fallback', None), \
+             patch.object(rate_limiter, '_redis', RedisReconnector('test')), \
+             patch.object(rate_limiter, 'redis_configured', return_value=True), \
+             patch('news.redis_state.logger') as log, \
+             patch('django_redis.get_redis_connection', side_effect=ConnectionError('down')) as connect:
+            fallback = rate_limiter._get_store()
+            assert isinstance(fallback, rate_limiter._LocalStore)
+            assert rate_limiter._get_store() is fallback and connect.call_count == 1  # backing off
+            assert log.warning.called
+
+            connect.side_effect, connect.return_value = None, conn
+            rate_limiter._redis._next_try = 0
+            assert isinstance(rate_limiter._get_store(), rate_limiter._RedisStore)
+            assert rate_limiter._store is not None and rate_limiter._fallback is None
+
+
+# ═══════════════════════════════════════════════════════════════════
+# GeminiProvider
+# ═══════════════════════════════════════════════════════════════════
+
+class TestGeminiProvider:
+
+    def test_429_penalizes_and_moves_down_the_cascade(self, clock):
+        from ai_engine.modules import ai_provider
+
+        def generate(model, contents, config):
+            if model == 'fast':
+                raise Exception('429 Resource exhausted')
+            return SimpleNamespace(text='ok', usage_metadata=None)
+
+        client = MagicMock()
+        client.models.generate_content.side_effect = generate
+        with patch.object(ai_provider, 'GEMINI_API_KEY', 'key'), \
+             patch.object(ai_provider, 'GENAI_AVAILABLE', True), \
+             patch.object(ai_provider, 'gemini_client', client), \
+             patch.object(ai_provider, 'types', MagicMock()), \
+             patch.object(ai_provider, 'FLASH_MODELS', ['fast', 'backup']):
+            assert ai_provider.GeminiProvider.generate_completion('hi', caller='seo') == 'ok'
+
+        assert [c.kwargs['model'] for c in client.models.generate_content.call_args_list] == ['fast', 'backup']
+        assert rate_limiter.stats(['fast'])['fast']['penalties'] == 1
@@ -0,0 +1,174 @@
+"""
+Tests for news/related_articles.py — materialised related articles:
+signal merging, storage/back-links, staleness and the similar_articles endpoint.
+"""
+import pytest
+from datetime import timedelta
+from unittest.mock import patch
+
+from news.related_articles import MAX_RELATED, SOURCE_WEIGHTS, _ranked, merge_candidates
+
+API = '/api/v1'
+UA = {'HTTP_USER_AGENT': 'TestBrowser/1.0'}
+
+
+@pytest.fixture
+def no_indexes():
+    """ML and vector search unavailable — only DB signals contribute."""
+    with patch('ai_engine.modules.content_recommender.is_available', return_value=False), \
+         patch('ai_engine.modules.vector_search.get_vector_engine',
+               side_effect=Exception('FAISS not loaded')):
+        yield
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Merging
+# ═══════════════════════════════════════════════════════════════════
+
+class TestMergeCandidates:
+
+    def test_scores_add_up_across_signals(self):
+        merged = merge_candidates({
+            'ml': [(1, 0.5), (2, 0.9)],
+            'make_model': [(1, 1.0)],
+        })
+        scores = {aid: score for aid, score, _ in merged}
+        assert scores[1] == pytest.approx(0.5 * SOURCE_WEIGHTS['ml'] + SOURCE_WEIGHTS['make_model'])
+        assert scores[2] == pytest.approx(0.9 * SOURCE_WEIGHTS['ml'])
+        assert [aid for aid, _, _ in merged] == [1, 2]
+
+    def test_source_is_largest_contribution(self):
+        merged = merge_candidates({'ml': [(1, 0.1)], 'specs': [(1, 1.0)]})
+        assert merged == [(1, pytest.approx(0.1 + SOURCE_WEIGHTS['specs']), 'specs')]
+
+    def test_excludes_self_and_duplicates_within_a_signal(self):
+        merged = merge_candidates({'vector': [(7, 1.0), (7, 1.0), (3, 0.5)]}, exclude_id=3)
+        assert merged == [(7, SOURCE_WEIGHTS['vector'], 'vector')]
+
+    def test_limit(self):
+        merged = merge_candidates({'category': _ranked(range(1, 40))})
+        assert len(merged) == MAX_RELATED
+        assert merged[0][0] == 1
+
+    def test_ranked_strengths(self):
+        assert _ranked([]) == []
+        assert _ranked([5]) == [(5, 1.0)]
+        strengths = [s for _, s in _ranked([1, 2, 3], floor=0.5)]
+        assert strengths == pytest.approx([1.0, 0.75, 0.5])
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Storage, staleness and endpoint (DB)
+# ═══════════════════════════════════════════════════════════════════
+
+@pytest.fixture
+def suvs(db):
+    """Three published SUVs with similar specs and one unpublished one."""
+    from news.models import Article
+    from news.models.vehicles import VehicleSpecs
+    articles = []
+    for i, (price, hp, published) in enumerate([(55000, 880, True), (60000, 800, True),
+                                                  (50000, 700, True), (57000, 850, False)]):
+        art = Article.objects.create(
+            title=f'Related SUV {i}', slug=f'related-suv-{i}',
+            content='<p>SUV</p>', summary='SUV', is_published=published,
+        )
+        VehicleSpecs.objects.create(
+            article=art, make='ZEEKR', model_name=f'{i}X', body_type='SUV',
+            price_from=price, power_hp=hp,
+        )
+        articles.append(art)
+    return articles
+
+
+@pytest.mark.django_db
+class TestRefresh:
+
+    def test_refresh_stores_rows_and_back_links(self, no_indexes, suvs):
+        from news.models import Article, RelatedArticle
+        from news.related_articles import refresh_related
+        base, similar, cheaper, unpublished = suvs
+
+        related = refresh_related(base.id)
+        ids = [aid for aid, _, _ in related]
+        assert similar.id in ids and cheaper.id in ids
+        assert unpublished.id not in ids and base.id not in ids
+        assert RelatedArticle.objects.filter(article=base).count() == len(related)
+        assert Article.objects.get(id=base.id).related_computed_at is not None
+        # Neighbours link back without being recomputed
+        assert RelatedArticle.objects.filter(article=similar, related=base).exists()
+
+    def test_unpublish_removes_from_every_set(self, no_indexes, suvs):
+        from news.models import Article, RelatedArticle
+        from news.related_articles import refresh_related
+        base, similar = suvs[:2]
+        refresh_related(base.id)
+        Article.objects.filter(id=similar.id).update(is_published=False)
+
+        assert refresh_related(similar.id) == []
+        assert not RelatedArticle.objects.filter(related=similar).exists()
+        assert not RelatedArticle.objects.filter(article=similar).exists()
+
+    def test_staleness(self, no_indexes, suvs):
+        from django.utils import timezone
+        from news.models import Article
+        from news.related_articles import MAX_AGE, refresh_stale, staleness_stats
+
+        stats = staleness_stats()
+        assert stats['published'] == 3 and stats['never_computed'] == 3 and stats['stale'] == 3
+
+        assert refresh_stale(limit=10)['refreshed'] == 3
+        assert staleness_stats()['stale'] == 0
+
+        base = suvs[0]
+        Article.objects.filter(id=base.id).update(updated_at=timezone.now() + timedelta(seconds=5))
+        long_ago = timezone.now() - MAX_AGE * 2
+        Article.objects.filter(id=suvs[1].id).update(related_computed_at=long_ago, updated_at=long_ago)
+        stats = staleness_stats()
+        assert stats['edited_since'] == 1 and stats['expired'] == 1 and stats['stale'] == 2
+
+
+@pytest.mark.django_db
+class TestSimilarArticlesEndpoint:
+
+    def test_reads_materialised_rows(self, no_indexes, suvs):
+        from rest_framework.test import APIClient
+        from news.models import Article, RelatedArticle
+        base, similar, cheaper, _ = suvs
+        client = APIClient(**UA)
+
+        # Never computed: the database-only ranking is served and the refresh queued
+        with patch('news.side_effects.dispatch') as dispatch, \
+             patch('news.related_articles.refresh_related') as refresh:
+            resp = client.get(f'{API}/articles/{base.slug}/similar_articles/')
+        assert resp.status_code == 200
+        assert {a['id'] for a in resp.data['similar_articles']} == {similar.id, cheaper.id}
+        dispatch.assert_called_once_with('related_articles', base.id)
+        refresh.assert_not_called()
+        assert not RelatedArticle.objects.exists()
+
+        # Once computed the table is the only source
+        from news.related_articles import refresh_related
+        refresh_related(base.id)
+        RelatedArticle.objects.filter(article=base, related=similar).update(score=0.01)
+        with patch('news.related_articles.refresh_related') as refresh:
+            resp = client.get(f'{API}/articles/{base.slug}/similar_articles/')
+        refresh.assert_not_called()
+        assert [a['id'] for a in resp.data['similar_articles']] == [cheaper.id, similar.id]
+
+        Article.objects.filter(id=cheaper.id).update(is_deleted=True)
+        resp = client.get(f'{API}/articles/{base.slug}/similar_articles/')
+        assert [a['id'] for a in resp.data['similar_articles']] == [similar.id]
+
+    def test_backfill_command_computes_missing_sets_only(self, no_indexes, suvs):
+        from io import StringIO
+        from django.core.management import call_command
+        from django.utils import timezone
+        from news.models import Article
+        base, similar, cheaper, _ = suvs
+        computed_at = timezone.now()
+        Article.objects.filter(id=similar.id).update(related_computed_at=computed_at)
+
+        call_command('rebuild_related_articles', '--missing', stdout=StringIO())
+        assert Article.objects.get(id=similar.id).related_computed_at == computed_at
+        assert not Article.objects.filter(id__in=[base.id, cheaper.id], related_computed_at__isnull=True).exists()
@@ -226,7 +226,7 @@ class TestFetchFeed:
 class TestExtractOgImage:
     """Tests for extract_og_image() — scrapes og:image from article pages."""
 
-    @patch('requests.get')
+    @patch('ai_engine.modules.web_fetch.get')
     def test_found_og_image(self, mock_get, aggregator):
         mock_resp = MagicMock()
         mock_resp.status_code = 200
@@ -236,7 +236,7 @@ class TestExtractOgImage:
         result = aggregator.extract_og_image("https://example.com/article")
         assert result == "https://example.com/image.jpg"
 
-    @patch('requests.get')
+    @patch('ai_engine.modules.web_fetch.get')
     def test_no_og_image(self, mock_get, aggregator):
         mock_resp = MagicMock()
         mock_resp.status_code = 200
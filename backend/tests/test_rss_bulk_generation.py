@@ -0,0 +1,202 @@
+"""
+Tests for news/rss_bulk_generation.py — background bulk generation of
+PendingArticles: rate-limit waiting, concurrent fan-out, progress
+reporting and recovery from jobs that died. Only the claim tests touch
+the database; elsewhere item loading and generation are patched.
+"""
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from django.test import override_settings
+
+from news import rss_bulk_generation
+from news.rss_bulk_generation import BulkGenerationJob, get_job, wait_for_capacity
+
+LOCMEM = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'rss-bulk'}}
+
+
+@pytest.fixture(autouse=True)
+def locmem_cache():
+    with override_settings(CACHES=LOCMEM):
+        from django.core.cache import cache
+        cache.clear()
+        yield cache
+
+
+@pytest.fixture
+def no_db():
+    """Patch item loading/resetting and connection handling out of the job."""
+    with patch.object(rss_bulk_generation, '_load_item',
+                      side_effect=lambda item_id: SimpleNamespace(id=item_id, title=f'Item {item_id}')), \
+         patch.object(rss_bulk_generation, '_reset_item') as reset, \
+         patch('django.db.close_old_connections'), patch('django.db.connection.close'), \
+         patch('ai_engine.modules.generation_progress._send_progress') as progress:
+        yield SimpleNamespace(reset=reset, progress=progress)
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Rate limits
+# ═══════════════════════════════════════════════════════════════════
+
+class TestWaitForCapacity:
+
+    def test_free_model_in_cascade_means_go(self):
+        with patch('ai_engine.modules.ai_provider._check_rate_limit',
+                   side_effect=lambda model: model != 'gemini-2.5-flash'):
+            assert wait_for_capacity('gemini', timeout=0)
+
+    def test_waits_until_a_model_frees_up(self):
+        saturated = {'until': time.monotonic() + 0.1}
+        with patch('ai_engine.modules.ai_provider._check_rate_limit',
+                   side_effect=lambda model: time.monotonic() < saturated['until']):
+            assert wait_for_capacity('gemini', timeout=5, poll=0.02)
+
+    def test_gives_up_after_timeout(self):
+        with patch('ai_engine.modules.ai_provider._check_rate_limit', return_value=True):
+            assert not wait_for_capacity('gemini', timeout=0.05, poll=0.01)
+
+    def test_providers_without_limits_never_wait(self):
+        with patch('ai_engine.modules.ai_provider._check_rate_limit', return_value=True):
+            assert wait_for_capacity('groq', timeout=0)
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Job
+# ═══════════════════════════════════════════════════════════════════
+
+class TestBulkGenerationJob:
+
+    def test_items_generated_concurrently_and_reported(self, no_db):
+        running, peak = [0], [0]
+        lock = threading.Lock()
+
+        def generate(item, provider):
+            with lock:
+                running[0] += 1
+                peak[0] = max(peak[0], running[0])
+            time.sleep(0.05)
+            with lock:
+                running[0] -= 1
+            return {'id': item.id, 'success': True, 'title': item.title, 'pending_id': item.id * 10}
+
+        job = BulkGenerationJob('job-1', range(1, 7), 'groq', workers=3)
+        with patch.object(rss_bulk_generation, 'generate_pending_article', side_effect=generate):
+            job.run()
+
+        assert peak[0] == 3
+        state = get_job('job-1')
+        assert (state['status'], state['done'], state['generated'], state['progress']) == ('done', 6, 6, 100)
+        assert state['items']['4'] == {'status': 'generated', 'title': 'Item 4', 'pending_id': 40}
+        # one WebSocket message when each item starts and one when it finishes
+        assert no_db.progress.call_count == 12
+        assert {c.args[0] for c in no_db.progress.call_args_list} == {'job-1'}
+
+    def test_failures_reset_the_item_and_the_rest_continue(self, no_db):
+        def generate(item, provider):
+            if item.id == 2:
+                raise RuntimeError('All Gemini models failed')
+            return {'id': item.id, 'success': True, 'title': item.title, 'pending_id': 1}
+
+        job = BulkGenerationJob('job-2', [1, 2, 3], 'groq', workers=2)
+        with patch.object(rss_bulk_generation, 'generate_pending_article', side_effect=generate):
+            job.run()
+
+        state = get_job('job-2')
+        assert (state['generated'], state['failed']) == (2, 1)
+        assert state['items']['2']['status'] == 'failed'
+        no_db.reset.assert_called_once_with(2)
+
+    def test_rate_limited_items_are_released(self, no_db):
+        job = BulkGenerationJob('job-3', [5], 'gemini', workers=1)
+        with patch.object(rss_bulk_generation, 'wait_for_capacity', return_value=False), \
+             patch.object(rss_bulk_generation, 'generate_pending_article') as generate:
+            job.run()
+
+        assert not generate.called
+        no_db.reset.assert_called_once_with(5)
+        assert 'rate limit' in get_job('job-3')['items']['5']['error']
+
+    def test_start_returns_before_generation_finishes(self, no_db):
+        release = threading.Event()
+
+        def generate(item, provider):
+            release.wait(5)
+            return {'id': item.id, 'success': True, 'title': item.title, 'pending_id': 1}
+
+        with patch.object(rss_bulk_generation, 'generate_pending_article', side_effect=generate):
+            job_id = rss_bulk_generation.start_bulk_generation([1, 2], 'groq')
+            assert get_job(job_id)['status'] == 'running'
+            release.set()
+            deadline = time.monotonic() + 5
+            while get_job(job_id)['status'] == 'running' and time.monotonic() < deadline:
+                time.sleep(0.01)
+        assert get_job(job_id)['generated'] == 2
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Jobs that died (deploy/restart mid-job)
+# ═══════════════════════════════════════════════════════════════════
+
+class TestDeadJobs:
+
+    def test_running_job_without_heartbeat_reads_as_error(self, no_db, locmem_cache):
+        import json
+        job = BulkGenerationJob('job-dead', [1], 'groq')
+        job._publish()
+        assert get_job('job-dead')['status'] == 'running'
+
+        # What a worker killed mid-job leaves behind
+        stale = dict(job.state, heartbeat=time.time() - rss_bulk_generation.STALE_JOB_SECONDS - 1)
+        locmem_cache.set('gen_task:job-dead', json.dumps(stale))
+        state = get_job('job-dead')
+        assert state['status'] == 'error' and 'restart' in state['error']
+
+    def test_heartbeat_keeps_a_slow_job_alive(self, no_db):
+        release = threading.Event()
+
+        def generate(item, provider):
+            release.wait(5)
+            return {'id': item.id, 'success': True, 'title': item.title, 'pending_id': 1}
+
+        job = BulkGenerationJob('job-slow', [1], 'groq')
+        with patch.object(rss_bulk_generation, 'HEARTBEAT_SECONDS', 0.05), \
+             patch.object(rss_bulk_generation, 'generate_pending_article', side_effect=generate), \
+             patch('news.models.RSSNewsItem.objects') as items:
+            worker = threading.Thread(target=job.run)
+            worker.start()
+            time.sleep(0.1)
+            first = get_job('job-slow')['heartbeat']
+            time.sleep(0.2)
+            assert get_job('job-slow')['heartbeat'] > first
+            assert items.filter.return_value.update.called  # claims refreshed
+            release.set()
+            worker.join(5)
+        assert get_job('job-slow')['status'] == 'done'
+
+
+@pytest.mark.django_db
+class TestStaleClaims:
+
+    def test_only_abandoned_bulk_claims_are_released(self):
+        from datetime import timedelta
+        from django.utils import timezone
+        from news.models import PendingArticle, RSSFeed, RSSNewsItem
+
+        feed = RSSFeed.objects.create(name='Feed', feed_url='http://test.com/feed.xml')
+        items = [RSSNewsItem.objects.create(rss_feed=feed, title=f'Item {i}') for i in range(3)]
+        claimed = rss_bulk_generation.claim_items([i.id for i in items])
+        assert claimed == [i.id for i in items]
+        assert all(i.generating_since for i in RSSNewsItem.objects.all())
+
+        old = timezone.now() - timedelta(seconds=rss_bulk_generation.STALE_CLAIM_SECONDS + 60)
+        RSSNewsItem.objects.filter(id__in=[items[0].id, items[1].id]).update(generating_since=old)
+        # Auto-queued by the RSS scan: 'generating' with a pending article
+        pending = PendingArticle.objects.create(title='Queued', rss_feed=feed)
+        RSSNewsItem.objects.filter(id=items[1].id).update(pending_article=pending)
+
+        assert rss_bulk_generation.release_stale_claims() == 1
+        statuses = dict(RSSNewsItem.objects.values_list('id', 'status'))
+        assert statuses == {items[0].id: 'new', items[1].id: 'generating', items[2].id: 'generating'}
@@ -6,7 +6,7 @@ Covers:
   - Model extraction from titles
   - Content type classification (review/debut/news/noise/general)
   - process_rss_intelligence: brand discovery without VehicleSpecs stubs
-  - Trending brands and topics
+  - Trending brands and topics (hourly mention buckets)
 """
 import pytest
 from unittest.mock import patch, MagicMock
@@ -18,6 +18,11 @@ from news.rss_intelligence import (
     classify_rss_item,
     process_rss_intelligence,
     get_trending_brands,
+    get_trending_topics,
+    extract_topics_from_title,
+    count_mentions,
+    record_mentions,
+    rebuild_mention_buckets,
     CONTENT_TYPE_KEYWORDS,
 )
 
@@ -200,3 +205,90 @@ class TestProcessRssIntelligenceNoSpecs:
         stats = process_rss_intelligence(queryset=qs, dry_run=False)
         # Brand discovery should still work
         assert len(stats['brands_found']) > 0
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Mention buckets + trending
+# ═══════════════════════════════════════════════════════════════════════════
+
+class TestCountMentions:
+    """Brand/topic extraction into (kind, name, hour) counts — no DB."""
+
+    def test_topics_from_title(self):
+        assert extract_topics_from_title("Tesla recalls electric SUV") == ['EV', 'SUV']
+        assert extract_topics_from_title("") == []
+
+    def test_counts_land_in_the_hour_bucket(self):
+        from datetime import datetime, timezone as dt_tz
+        at = datetime(2026, 3, 1, 14, 37, 12, tzinfo=dt_tz.utc)
+        counts = count_mentions([("Tesla electric SUV", at), ("Tesla Model 3 sales", at)])
+        hour = at.replace(minute=0, second=0)
+        assert counts[('brand', 'Tesla', hour)] == 2
+        assert counts[('topic', 'EV', hour)] == 1
+        assert counts[('topic', 'Sales', hour)] == 1
+
+    def test_record_mentions_never_raises(self):
+        with patch('news.rss_intelligence._add_to_buckets', side_effect=RuntimeError('db down')):
+            record_mentions("Tesla Model 3")
+
+
+@pytest.mark.django_db
+class TestTrendingFromBuckets:
+    """Trending reads sum pre-counted buckets; rebuild recounts stored items."""
+
+    def _bucket(self, kind, name, hours_ago, count):
+        from datetime import timedelta
+        from django.utils import timezone
+        from news.models import RSSMentionBucket
+        hour = (timezone.now() - timedelta(hours=hours_ago)).replace(minute=0, second=0, microsecond=0)
+        RSSMentionBucket.objects.create(kind=kind, name=name, hour=hour, count=count)
+
+    def test_brand_velocity_over_windows(self):
+        self._bucket('brand', 'Tesla', 2, 3)
+        self._bucket('brand', 'Tesla', 30, 1)
+        self._bucket('brand', 'Tesla', 24 * 8, 2)   # previous 7-day window
+        self._bucket('brand', 'BYD', 5, 2)
+        self._bucket('brand', 'Kia', 5, 1)          # below min_mentions
+        trending = get_trending_brands(days=7, min_mentions=2)
+        assert [(t['brand'], t['count'], t['previous_count']) for t in trending] == [('Tesla', 4, 2), ('BYD', 2, 0)]
+        assert trending[0]['velocity'] == 2.0 and trending[1]['velocity'] is None
+        assert [t['rank'] for t in trending] == [1, 2]
+
+    def test_topics_and_arbitrary_windows(self):
+        self._bucket('topic', 'EV', 3, 4)
+        self._bucket('topic', 'EV', 24 * 3, 5)
+        assert get_trending_topics(days=1, min_mentions=1)[0]['count'] == 4
+        assert get_trending_topics(days=7, min_mentions=1)[0]['count'] == 9
+
+    def test_ingest_increments_and_rebuild_matches(self):
+        from news.models import RSSFeed, RSSNewsItem, RSSMentionBucket
+        feed = RSSFeed.objects.create(name='Test Feed', feed_url='http://test-feed.com')
+        for i, title in enumerate(["Tesla electric SUV", "Tesla Model 3 sales"]):
+            item = RSSNewsItem.objects.create(rss_feed=feed, title=title, source_url=f'http://test.com/{i}')
+            record_mentions(item.title, item.created_at)
+        counted = set(RSSMentionBucket.objects.values_list('kind', 'name', 'count'))
+        assert ('brand', 'Tesla', 2) in counted
+
+        stats = rebuild_mention_buckets()
+        assert stats['items'] == 2 and stats['buckets_created'] == stats['buckets_raised'] == 0
+        assert set(RSSMentionBucket.objects.values_list('kind', 'name', 'count')) == counted
+
+    def test_rebuild_keeps_history_of_cleaned_up_items(self):
+        from datetime import timedelta
+        from django.utils import timezone
+        from news.models import RSSFeed, RSSNewsItem, RSSMentionBucket
+        feed = RSSFeed.objects.create(name='Test Feed', feed_url='http://test-feed.com')
+        old = RSSNewsItem.objects.create(rss_feed=feed, title='BYD Seal review', source_url='http://test.com/old')
+        RSSNewsItem.objects.filter(pk=old.pk).update(created_at=timezone.now() - timedelta(days=10))
+        old.refresh_from_db()
+        record_mentions(old.title, old.created_at)
+        new = RSSNewsItem.objects.create(rss_feed=feed, title='Tesla Model 3 sales', source_url='http://test.com/new')
+        record_mentions(new.title, new.created_at)
+        RSSMentionBucket.objects.filter(name='Tesla').delete()  # missed at ingest
+        old.delete()  # cleanup_old
+
+        for _ in range(2):
+            rebuild_mention_buckets()
+            rebuild_mention_buckets(since=timezone.now() - timedelta(days=30))
+        names = dict(RSSMentionBucket.objects.filter(kind='brand').values_list('name', 'count'))
+        assert names == {'BYD': 1, 'Tesla': 1}
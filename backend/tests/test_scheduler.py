@@ -110,15 +110,11 @@ class TestRunGSCSync:
 class TestScheduleGSCSync:
     """Tests for _schedule_gsc_sync()"""
 
-    @patch('news.scheduler.threading.Timer')
-    def test_schedules_timer(self, mock_timer):
+    @patch('news.job_scheduler.schedule_next')
+    def test_schedules_next_run(self, mock_next):
         from news.scheduler import _schedule_gsc_sync, GSC_SYNC_INTERVAL
-        timer_instance = MagicMock()
-        mock_timer.return_value = timer_instance
-
         _schedule_gsc_sync()
-        mock_timer.assert_called_once_with(GSC_SYNC_INTERVAL, _schedule_gsc_sync.__wrapped__ if hasattr(_schedule_gsc_sync, '__wrapped__') else pytest.importorskip('news.scheduler')._run_gsc_sync)
-        timer_instance.start.assert_called_once()
+        mock_next.assert_called_once_with('gsc_sync', GSC_SYNC_INTERVAL)
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -147,15 +143,11 @@ class TestRunCurrencyUpdate:
 class TestScheduleCurrencyUpdate:
     """Tests for _schedule_currency_update()"""
 
-    @patch('news.scheduler.threading.Timer')
-    def test_schedules_timer(self, mock_timer):
-        from news.scheduler import _schedule_currency_update, CURRENCY_UPDATE_INTERVAL, _run_currency_update
-        timer_instance = MagicMock()
-        mock_timer.return_value = timer_instance
-
+    @patch('news.job_scheduler.schedule_next')
+    def test_schedules_next_run(self, mock_next):
+        from news.scheduler import _schedule_currency_update, CURRENCY_UPDATE_INTERVAL
         _schedule_currency_update()
-        mock_timer.assert_called_once_with(CURRENCY_UPDATE_INTERVAL, _run_currency_update)
-        timer_instance.start.assert_called_once()
+        mock_next.assert_called_once_with('currency_update', CURRENCY_UPDATE_INTERVAL)
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -293,6 +285,92 @@ class TestRunYouTubeScan:
         mock_schedule.assert_called()
 
 
+class TestScanYouTubeChannels:
+    """Tests for scan_youtube_channels() — concurrent fetch, bulk dedup, enqueue mode"""
+
+    def _client(self, videos_by_url):
+        client = MagicMock()
+        client.get_latest_videos.side_effect = lambda ident, max_results=5: videos_by_url[ident]
+        return client
+
+    def test_dedups_in_one_query_per_table(self, youtube_channel, django_assert_max_num_queries):
+        from news.models import Article, PendingArticle
+        from news.scheduler import _filter_new_videos
+        Article.objects.create(
+            title='Exists', slug='exists-yt', content='<p>C</p>',
+            summary='S', youtube_url='https://youtube.com/watch?v=old1',
+        )
+        PendingArticle.objects.create(
+            video_url='https://youtube.com/watch?v=old2', video_id='old2',
+            video_title='Pending', title='Pending', content='',
+        )
+        videos = [
+            {'id': 'old1', 'url': 'https://youtube.com/watch?v=old1', 'title': 'A'},
+            {'id': 'old2', 'url': 'https://youtube.com/watch?v=old2', 'title': 'B'},
+            {'id': 'new1', 'url': 'https://youtube.com/watch?v=new1', 'title': 'C'},
+            {'id': 'new1', 'url': 'https://youtube.com/watch?v=new1', 'title': 'C again'},
+        ]
+        with django_assert_max_num_queries(2):
+            result = _filter_new_videos([(youtube_channel, videos)])
+        assert [v['id'] for _, v in result] == ['new1']
+
+    @patch('ai_engine.main.create_pending_article', return_value={'success': True})
+    def test_inline_generation_updates_channel(self, mock_create, youtube_channel, settings):
+        from news.scheduler import scan_youtube_channels
+        settings.YOUTUBE_SCAN_ENQUEUE_GENERATION = False
+        client = self._client({youtube_channel.channel_url: [
+            {'id': 'v1', 'url': 'https://youtube.com/watch?v=v1', 'title': 'One'},
+        ]})
+
+        created = scan_youtube_channels(client, [youtube_channel], 5)
+        assert created == 1
+        mock_create.assert_called_once()
+        youtube_channel.refresh_from_db()
+        assert youtube_channel.videos_processed == 1
+        assert youtube_channel.last_video_id == 'v1'
+        assert youtube_channel.last_checked is not None
+
+    @patch('news.tasks.generate_pending_from_youtube_task.delay')
+    @patch('ai_engine.main.create_pending_article')
+    def test_enqueue_mode_skips_inline_generation(self, mock_create, mock_delay, youtube_channel, settings):
+        from django.core.cache import cache
+        from news.scheduler import scan_youtube_channels
+        settings.CACHES = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+        cache.delete('yt_gen_enqueued:q1')
+        settings.YOUTUBE_SCAN_ENQUEUE_GENERATION = True
+        client = self._client({youtube_channel.channel_url: [
+            {'id': 'q1', 'url': 'https://youtube.com/watch?v=q1', 'title': 'Queued'},
+        ]})
+
+        assert scan_youtube_channels(client, [youtube_channel], 5) == 1
+        # Second scan before the job finished must not enqueue it again
+        assert scan_youtube_channels(client, [youtube_channel], 5) == 0
+        mock_delay.assert_called_once()
+        mock_create.assert_not_called()
+
+    def test_quota_budget_defers_remaining_channels(self):
+        from ai_engine.modules.youtube_client import QuotaBudget, QuotaExhausted
+        budget = QuotaBudget(limit=3)
+        budget.charge(1)
+        budget.charge(2)
+        assert budget.remaining == 0
+        with pytest.raises(QuotaExhausted):
+            budget.charge(1)
+
+    def test_channel_error_does_not_abort_scan(self, youtube_channel):
+        from news.models import YouTubeChannel
+        from news.scheduler import _fetch_channel_videos
+        broken = YouTubeChannel.objects.create(
+            name='Broken', channel_url='https://youtube.com/@broken', is_enabled=True,
+        )
+        client = MagicMock()
+        client.get_latest_videos.side_effect = lambda ident, max_results=5: (
+            (_ for _ in ()).throw(Exception('boom')) if 'broken' in ident else []
+        )
+        fetched = _fetch_channel_videos(client, [youtube_channel, broken], 5, '[TEST]')
+        assert [c.id for c, _ in fetched] == [youtube_channel.id]
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # AUTO-PUBLISH
 # ═══════════════════════════════════════════════════════════════════════════
@@ -369,8 +447,8 @@ class TestScoreNewPendingArticles:
 class TestCheckOverdueTasks:
     """Tests for _check_overdue_tasks()"""
 
-    @patch('news.scheduler.threading.Thread')
-    def test_clears_stale_locks(self, mock_thread, automation_settings):
+    @patch('news.job_scheduler.run_soon')
+    def test_clears_stale_locks(self, mock_run_soon, automation_settings):
         from news.models import AutomationSettings
         from news.scheduler import _check_overdue_tasks
         # Set stale locks
@@ -382,28 +460,27 @@ class TestCheckOverdueTasks:
         assert automation_settings.rss_lock is False
         assert automation_settings.youtube_lock is False
 
-    @patch('news.scheduler.threading.Thread')
-    def test_triggers_overdue_rss(self, mock_thread, automation_settings):
+    @patch('news.job_scheduler.run_soon')
+    def test_triggers_overdue_rss(self, mock_run_soon, automation_settings):
         from news.scheduler import _check_overdue_tasks
         # Set last run to long ago
         automation_settings.rss_last_run = timezone.now() - timedelta(hours=24)
         automation_settings.save()
 
         _check_overdue_tasks()
-        # Should spawn thread for RSS
-        assert mock_thread.called
+        mock_run_soon.assert_any_call('rss_scan')
 
-    @patch('news.scheduler.threading.Thread')
-    def test_triggers_overdue_youtube(self, mock_thread, automation_settings):
+    @patch('news.job_scheduler.run_soon')
+    def test_triggers_overdue_youtube(self, mock_run_soon, automation_settings):
         from news.scheduler import _check_overdue_tasks
         automation_settings.youtube_last_run = timezone.now() - timedelta(hours=24)
         automation_settings.save()
 
         _check_overdue_tasks()
-        assert mock_thread.called
+        mock_run_soon.assert_any_call('youtube_scan')
 
-    @patch('news.scheduler.threading.Thread')
-    def test_no_overdue_when_recent(self, mock_thread, automation_settings):
+    @patch('news.job_scheduler.run_soon')
+    def test_no_overdue_when_recent(self, mock_run_soon, automation_settings):
         from news.scheduler import _check_overdue_tasks
         now = timezone.now()
         automation_settings.rss_last_run = now - timedelta(minutes=5)
@@ -412,18 +489,20 @@ class TestCheckOverdueTasks:
         automation_settings.save()
 
         _check_overdue_tasks()
-        # Thread may still be called for auto-publish if enabled;
-        # with auto_publish disabled, no overdue threads
+        called = [c.args[0] for c in mock_run_soon.call_args_list]
+        assert 'rss_scan' not in called
+        assert 'youtube_scan' not in called
+        assert 'auto_publish' not in called
 
-    @patch('news.scheduler.threading.Thread')
-    def test_auto_publish_always_triggers(self, mock_thread, automation_settings):
+    @patch('news.job_scheduler.run_soon')
+    def test_auto_publish_always_triggers(self, mock_run_soon, automation_settings):
         from news.scheduler import _check_overdue_tasks
         # auto_publish is always overdue after restart
         automation_settings.auto_publish_enabled = True
         automation_settings.save()
 
         _check_overdue_tasks()
-        assert mock_thread.called
+        mock_run_soon.assert_any_call('auto_publish')
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -457,21 +536,21 @@ class TestStartScheduler:
         finally:
             sys.argv = original_argv
 
+    @patch('news.job_scheduler.start')
     @patch('news.scheduler.threading.Timer')
-    def test_starts_in_server_mode(self, mock_timer):
+    def test_starts_in_server_mode(self, mock_timer, mock_start):
         import sys
         import os
         from news.scheduler import start_scheduler
-        timer_instance = MagicMock()
-        mock_timer.return_value = timer_instance
         original_argv = sys.argv
         original_run_main = os.environ.get('RUN_MAIN')
         try:
             sys.argv = ['manage.py', 'runserver']
             os.environ['RUN_MAIN'] = 'true'  # Simulate autoreload child process
             start_scheduler()
-            # Should create multiple timers for each task
-            assert mock_timer.call_count >= 5  # recovery, gsc, currency, rss, youtube, auto-publish
+            # One recovery timer + one ticker thread (not a timer per task)
+            mock_timer.assert_called_once()
+            mock_start.assert_called_once()
         finally:
             sys.argv = original_argv
             if original_run_main is not None:
@@ -536,15 +615,13 @@ class TestAppConfigCallsScheduler:
 class TestRecoveryIncludesScheduledPublish:
     """Verify startup recovery triggers scheduled_publish."""
 
-    @patch('news.scheduler.threading.Thread')
-    def test_recovery_triggers_scheduled_publish(self, mock_thread, automation_settings):
+    @patch('news.job_scheduler.run_soon')
+    def test_recovery_triggers_scheduled_publish(self, mock_run_soon, automation_settings):
         from news.scheduler import _check_overdue_tasks
         _check_overdue_tasks()
 
-        # Check that at least one Thread was started with target=_run_scheduled_publish
-        from news.scheduler import _run_scheduled_publish
-        targets = [call.kwargs.get('target') for call in mock_thread.call_args_list]
-        assert _run_scheduled_publish in targets, (
+        targets = [call.args[0] for call in mock_run_soon.call_args_list]
+        assert 'scheduled_publish' in targets, (
             "_check_overdue_tasks must trigger _run_scheduled_publish on recovery. "
             "Without it, articles scheduled during downtime/deploys are never published."
         )
@@ -666,16 +743,11 @@ class TestRunDBBackup:
 class TestScheduleDBBackup:
     """Tests for _schedule_db_backup()."""
 
-    @patch('news.scheduler.threading.Timer')
-    def test_schedules_timer(self, mock_timer):
-        from news.scheduler import _schedule_db_backup, DB_BACKUP_INTERVAL, _run_db_backup
-        timer_instance = MagicMock()
-        mock_timer.return_value = timer_instance
-
+    @patch('news.job_scheduler.schedule_next')
+    def test_schedules_next_run(self, mock_next):
+        from news.scheduler import _schedule_db_backup, DB_BACKUP_INTERVAL
         _schedule_db_backup()
-        mock_timer.assert_called_once_with(DB_BACKUP_INTERVAL, _run_db_backup)
-        timer_instance.start.assert_called_once()
-        assert timer_instance.daemon is True
+        mock_next.assert_called_once_with('db_backup', DB_BACKUP_INTERVAL)
 
 
 class TestBackupDBCommand:
@@ -0,0 +1,215 @@
+"""
+Tests for news/side_effects.py — coalescing dispatcher, bulk mode and the
+field-diff relevance checks the Article receivers rely on. No database:
+instances come from Article.from_db and saves are simulated by calling the
+pre_save diff directly.
+"""
+import threading
+import time
+from unittest.mock import patch
+
+from news import side_effects
+from news.side_effects import Dispatcher
+
+
+def _recorder(delay=0.0):
+    calls = []
+    lock = threading.Lock()
+
+    def runner(name, key):
+        time.sleep(delay)
+        with lock:
+            calls.append((name, key))
+    return calls, runner
+
+
+def _loaded(deferred=(), **values):
+    """An Article as loaded from the DB (only these fields, the rest deferred)."""
+    from news.models import Article
+    values = {'id': 1, 'title': 'BYD Seal', 'slug': 'byd-seal', 'content': '<p>x</p>',
+              'is_published': True, 'is_deleted': False, 'views': 0, **values}
+    values = {name: value for name, value in values.items() if name not in deferred}
+    return Article.from_db('default', list(values), list(values.values()))
+
+
+def _save(instance, update_fields=None):
+    from news.models import Article
+    side_effects._diff(Article, instance, update_fields=update_fields)
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Dispatcher
+# ═══════════════════════════════════════════════════════════════════
+
+class TestDispatcher:
+
+    def test_repeated_requests_in_window_run_once(self):
+        calls, runner = _recorder()
+        dispatcher = Dispatcher(workers=2, window=0.05, runner=runner)
+        for _ in range(5):
+            dispatcher.submit('vector_index', 1)
+        dispatcher.submit('vector_index', 2)
+        dispatcher.submit('content_recommender', None)
+        assert dispatcher.wait_idle(timeout=5)
+        assert sorted(calls, key=str) == [('content_recommender', None), ('vector_index', 1), ('vector_index', 2)]
+        assert dispatcher.stats['coalesced'] == 4 and dispatcher.stats['run'] == 3
+
+    def test_request_while_running_queues_another_run(self):
+        calls, runner = _recorder(delay=0.1)
+        dispatcher = Dispatcher(workers=1, window=0, runner=runner)
+        dispatcher.submit('vector_index', 1)
+        time.sleep(0.05)  # running now
+        assert dispatcher.submit('vector_index', 1)
+        assert dispatcher.wait_idle(timeout=5)
+        assert calls == [('vector_index', 1)] * 2
+
+    def test_failures_are_counted_not_raised(self):
+        def runner(name, key):
+            if key == 1:
+                raise RuntimeError('boom')
+        dispatcher = Dispatcher(workers=1, window=0, runner=runner)
+        dispatcher.submit('x', 1)
+        dispatcher.submit('x', 2)
+        assert dispatcher.wait_idle(timeout=5)
+        assert dispatcher.stats['failed'] == 1 and dispatcher.stats['run'] == 1
+
+    def test_wait_idle_times_out(self):
+        _, runner = _recorder(delay=0.3)
+        dispatcher = Dispatcher(workers=1, window=0, runner=runner)
+        dispatcher.submit('x', 1)
+        assert not dispatcher.wait_idle(timeout=0.05)
+        assert dispatcher.wait_idle(timeout=5)
+
+
+# ═══════════════════════════════════════════════════════════════════
+# dispatch / collect / bulk_mode
+# ═══════════════════════════════════════════════════════════════════
+
+class TestBulkMode:
+
+    def test_requests_deferred_deduplicated_and_issued_on_exit(self):
+        with patch.object(side_effects, '_enqueue') as enqueue, \
+             patch('news.side_effects.transaction.on_commit', side_effect=lambda fn: fn()):
+            with side_effects.bulk_mode():
+                for article_id in (1, 2, 1, 1):
+                    side_effects.dispatch('vector_index', article_id)
+                side_effects.dispatch('content_recommender')
+                side_effects.dispatch('content_recommender')
+                assert not enqueue.called
+            assert [c.args for c in enqueue.call_args_list] == [
+                ('vector_index', 1, 0), ('vector_index', 2, 0), ('content_recommender', None, 0),
+            ]
+
+    def test_collect_merges_inside_and_runs_immediately_outside(self):
+        flushed = []
+        side_effects.collect('paths', ['/', '/a'], flushed.append)
+        assert flushed == [['/', '/a']]
+
+        flushed.clear()
+        with side_effects.bulk_mode():
+            with side_effects.bulk_mode():  # nested: joins the outer block
+                side_effects.collect('paths', ['/', '/a'], flushed.append)
+            side_effects.collect('paths', ['/', '/b'], flushed.append)
+            assert flushed == []
+        assert flushed == [['/', '/a', '/b']]
+
+    def test_worker_threads_join_the_owning_block(self):
+        import threading
+        flushed = []
+        with side_effects.bulk_mode() as scope:
+            def worker(path):
+                with side_effects.join_bulk(scope):
+                    side_effects.collect('paths', ['/', path], flushed.append)
+            threads = [threading.Thread(target=worker, args=(p,)) for p in ('/a', '/b')]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            assert flushed == []
+        assert sorted(flushed[0]) == ['/', '/a', '/b']
+
+    def test_outside_bulk_mode_waits_for_commit(self):
+        with patch('news.side_effects.transaction.on_commit') as on_commit:
+            side_effects.dispatch('vector_index', 3)
+        assert on_commit.call_count == 1
+        assert on_commit.call_args.args[0].args == ('vector_index', 3)
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Field-change tracking
+# ═══════════════════════════════════════════════════════════════════
+
+class TestChanged:
+
+    def test_counter_only_update_touches_nothing(self):
+        from news.cache_signals import COUNTER_FIELDS
+        from news.signals import SEARCH_FIELDS
+        article = _loaded()
+        article.views = 42
+        _save(article, update_fields=['views'])
+        assert not side_effects.changed(article, ignore=COUNTER_FIELDS)
+        assert not side_effects.changed(article, SEARCH_FIELDS)
+
+    def test_full_save_diffs_tracked_fields(self):
+        from news.cache_signals import REVALIDATE_FIELDS
+        from news.signals import PUBLISH_FIELDS, SEARCH_FIELDS
+        article = _loaded()
+        article.content = '<p>edited</p>'
+        _save(article)
+        assert side_effects.changed(article, SEARCH_FIELDS)
+        assert not side_effects.changed(article, PUBLISH_FIELDS)
+        # image/is_hero aren't tracked — a full save may have changed them
+        assert side_effects.changed(article, REVALIDATE_FIELDS)
+
+    def test_unchanged_full_save_and_deferred_fields(self):
+        from news.signals import SEARCH_FIELDS
+        article = _loaded(deferred=['content'])
+        _save(article)
+        assert not side_effects.changed(article, SEARCH_FIELDS)
+        article.content = '<p>assigned</p>'
+        _save(article)
+        assert side_effects.changed(article, SEARCH_FIELDS)
+
+    def test_update_fields_are_checked_against_values(self):
+        from news.signals import PUBLISH_FIELDS
+        article = _loaded()
+        _save(article, update_fields=['is_published'])  # same value written again
+        assert not side_effects.changed(article, PUBLISH_FIELDS)
+        article.is_published = False
+        _save(article, update_fields=['is_published'])
+        assert side_effects.changed(article, PUBLISH_FIELDS)
+
+    def test_new_rows_always_changed(self):
+        from news.models import Article
+        article = Article(title='New', content='x')
+        _save(article)
+        assert side_effects.changed(article, ('title',))
+
+
+class TestArticleReceivers:
+
+    def test_vector_index_requested_only_for_relevant_saves(self):
+        from news.models import Article
+        from news.signals import auto_index_article_vector
+        article = _loaded()
+        with patch.object(side_effects, 'dispatch') as dispatch:
+            article.engagement_score = 3.5
+            _save(article, update_fields=['engagement_score'])
+            auto_index_article_vector(Article, article, created=False)
+            assert not dispatch.called
+
+            article.title = 'BYD Seal 06'
+            _save(article)
+            auto_index_article_vector(Article, article, created=False)
+            dispatch.assert_called_once_with('vector_index', 1)
+
+    def test_cache_invalidation_skipped_for_view_counts(self):
+        from django.db.models.signals import post_save
+        from news.cache_signals import on_article_change
+        from news.models import Article
+        article = _loaded()
+        article.views = 7
+        _save(article, update_fields=['views'])
+        with patch.object(side_effects, 'collect') as collect:
+            on_article_change(Article, article, signal=post_save, update_fields=frozenset({'views'}))
+        assert not collect.called
@@ -0,0 +1,131 @@
+"""
+Tests for the LearningIndex in ai_engine/modules/tag_suggester.py — the
+inverted keyword index must score exactly like the full TagLearningLog scan
+it replaced, through inserts, replacements, deletions and compaction.
+"""
+import random
+from collections import Counter
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from ai_engine.modules import tag_suggester
+from ai_engine.modules.tag_suggester import LearningIndex
+
+VOCAB = ['2024', '2025', 'bmw', 'x5', 'byd', 'seal', 'suv', 'ev', 'hybrid', 'price', 'range', 'launch']
+TAGS = ['BMW', 'BYD', 'SUV', 'EV', 'Hybrid', 'News', 'China']
+
+
+def _scan(logs, keywords):
+    """The pre-index loop over every log, in id order."""
+    historical_tags = Counter()
+    for _, (title_keywords, final_tags) in sorted(logs.items()):
+        log_keywords = set(title_keywords)
+        overlap = keywords & log_keywords
+        if not overlap:
+            continue
+        weight = len(overlap) / max(len(keywords), len(log_keywords))
+        if len(overlap) < 2 and weight < 0.3:
+            continue
+        for tag_name in final_tags:
+            historical_tags[tag_name] += weight
+    return historical_tags
+
+
+def _random_log(rng):
+    return rng.sample(VOCAB, rng.randint(1, 6)), rng.sample(TAGS, rng.randint(1, 3))
+
+
+def _assert_same(index, logs, rng, queries=50):
+    for _ in range(queries):
+        keywords = set(rng.sample(VOCAB, rng.randint(1, 5)))
+        # Same tags, same float sums and same order (most_common tie-breaks)
+        assert list(index.historical_tags(keywords).items()) == list(_scan(logs, keywords).items())
+
+
+@pytest.fixture
+def fresh_index():
+    tag_suggester.reset_learning_index()
+    yield
+    tag_suggester.reset_learning_index()
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Scoring
+# ═══════════════════════════════════════════════════════════════════
+
+class TestLearningIndex:
+
+    def test_matches_full_scan(self):
+        rng = random.Random(1)
+        index, logs = LearningIndex(), {}
+        for log_id in range(1, 400):
+            logs[log_id] = _random_log(rng)
+            index.add(log_id, *logs[log_id])
+        _assert_same(index, logs, rng)
+
+    def test_replacements_and_deletions(self):
+        rng = random.Random(2)
+        index, logs = LearningIndex(), {}
+        for log_id in range(1, 3000):
+            logs[log_id] = _random_log(rng)
+            index.add(log_id, *logs[log_id])
+        # Re-recorded tags for old articles and deleted articles
+        for log_id in rng.sample(range(1, 3000), 600):
+            logs[log_id] = _random_log(rng)
+            index.add(log_id, *logs[log_id])
+        for log_id in rng.sample(sorted(logs), 700):
+            del logs[log_id]
+            index.remove(log_id)
+
+        assert len(index) == len(logs)
+        _assert_same(index, logs, rng)
+
+    def test_unknown_keywords_and_empty_index(self):
+        assert LearningIndex().historical_tags({'bmw'}) == Counter()
+        index = LearningIndex()
+        index.add(1, ['bmw', 'x5'], ['BMW'])
+        assert index.historical_tags({'audi', 'q7'}) == Counter()
+        assert index.historical_tags({'bmw', 'x5'}) == Counter({'BMW': 1.0})
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Process-wide index
+# ═══════════════════════════════════════════════════════════════════
+
+class TestSharedIndex:
+
+    def test_built_once_and_synced_on_version_bump(self, fresh_index):
+        built = LearningIndex()
+        with patch.object(tag_suggester, '_build_index', return_value=built) as build, \
+             patch.object(tag_suggester, '_sync_index', side_effect=lambda index: index) as sync, \
+             patch.object(tag_suggester, '_shared_version', return_value=0):
+            assert tag_suggester.get_learning_index() is built
+            assert tag_suggester.get_learning_index() is built
+            build.assert_called_once()
+            sync.assert_not_called()
+
+        tag_suggester._last_version_check = 0.0
+        with patch.object(tag_suggester, '_sync_index', side_effect=lambda index: index) as sync, \
+             patch.object(tag_suggester, '_shared_version', return_value=123.0):
+            tag_suggester.get_learning_index()
+            tag_suggester._last_version_check = 0.0
+            tag_suggester.get_learning_index()
+        sync.assert_called_once_with(built)
+
+    def test_saved_log_applied_in_place(self, fresh_index):
+        built = LearningIndex()
+        with patch.object(tag_suggester, '_build_index', return_value=built), \
+             patch.object(tag_suggester, '_shared_version', return_value=0):
+            tag_suggester.get_learning_index()
+
+        log = SimpleNamespace(id=7, title_keywords=['byd', 'seal', 'ev'], final_tags=['BYD', 'EV'])
+        with patch('django.core.cache.cache.set') as cache_set:
+            tag_suggester.on_learning_log_changed(log)
+        assert cache_set.call_args.args[0] == tag_suggester.INDEX_VERSION_KEY
+        assert tag_suggester.historical_tag_weights({'byd', 'seal'}) == Counter({'BYD': 2 / 3, 'EV': 2 / 3})
+
+        with patch('django.core.cache.cache.set'):
+            tag_suggester.on_learning_log_changed(log, deleted=True)
+        assert len(built) == 0
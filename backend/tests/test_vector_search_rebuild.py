@@ -0,0 +1,155 @@
+"""
+Tests for the streaming FAISS rebuild in ai_engine/modules/vector_search.py:
+chunked adds from stored vectors, title/summary-only docstore, progress
+reporting and BM25 over bodies streamed from the database.
+"""
+import threading
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from ai_engine.modules.vector_search import BM25Index, VectorSearchEngine
+from news.embedding_storage import pack_vector
+
+DIM = 8
+
+
+@pytest.fixture
+def engine(tmp_path):
+    """Engine without __init__ side effects (no API key, no Redis, no disk load)."""
+    eng = VectorSearchEngine.__new__(VectorSearchEngine)
+    eng._lock = threading.Lock()
+    eng.embedding_model = MagicMock()
+    eng.embedding_model.embed_query.side_effect = AssertionError('no API calls expected')
+    eng.vector_store = None
+    eng.bm25 = BM25Index()
+    eng.index_path = tmp_path / 'faiss_index'
+    with patch.object(eng, '_save_index_to_disk'), patch.object(eng, '_save_index_to_redis'):
+        yield eng
+
+
+def _rows(n, legacy=()):
+    rng = np.random.default_rng(1)
+    rows = []
+    for aid in range(1, n + 1):
+        vec = rng.standard_normal(DIM).astype(np.float32)
+        if aid in legacy:
+            rows.append((aid, None, 'float32', 0, 1.0, vec.tolist(), f'Title {aid}', 'Summary', f'slug-{aid}'))
+        else:
+            data, dim, scale = pack_vector(vec)
+            rows.append((aid, data, 'float32', dim, scale, None, f'Title {aid}', 'Summary', f'slug-{aid}'))
+    return rows
+
+
+def _embedding_manager(rows):
+    manager = MagicMock()
+    manager.count.return_value = len(rows)
+    manager.order_by.return_value.values_list.return_value.iterator.return_value = iter(rows)
+    return manager
+
+
+def _bodies(article_ids, chunk_size=None):
+    for aid in article_ids:
+        yield {'article_id': aid, 'title': f'Title {aid}', 'text': f'Title {aid} body about zeekr {aid}'}
+
+
+class TestStreamingRebuild:
+
+    def test_builds_index_in_chunks(self, engine):
+        from news.models import ArticleEmbedding
+        progress = []
+        with patch.object(ArticleEmbedding, 'objects', _embedding_manager(_rows(25, legacy={7}))), \
+             patch.object(engine, '_iter_article_texts', side_effect=_bodies):
+            engine._rebuild_from_database(chunk_size=10, progress=lambda done, total: progress.append(done))
+
+        assert engine.vector_store.index.ntotal == 25
+        assert progress == [10, 20, 25]
+        docs = list(engine.vector_store.docstore._dict.values())
+        assert docs[0].page_content == 'Title 1\n\nSummary'
+        assert docs[6].metadata == {'article_id': 7, 'title': 'Title 7', 'summary': 'Summary', 'slug': 'slug-7'}
+        assert engine.bm25.search('zeekr 12')[0]['article_id'] == 12
+
+    def test_rows_without_vectors_are_reembedded(self, engine):
+        from news.models import ArticleEmbedding
+        rows = _rows(3)
+        rows[1] = rows[1][:1] + (None, 'float32', 0, 1.0, None) + rows[1][6:]
+        with patch.object(ArticleEmbedding, 'objects', _embedding_manager(rows)), \
+             patch.object(engine, '_iter_article_texts', side_effect=_bodies), \
+             patch.object(engine, '_reembed_articles') as reembed:
+            engine._rebuild_from_database(chunk_size=10)
+        reembed.assert_called_once_with([2])
+        assert engine.vector_store.index.ntotal == 2
+
+    def test_empty_table(self, engine):
+        from news.models import ArticleEmbedding
+        with patch.object(ArticleEmbedding, 'objects', _embedding_manager([])):
+            engine._rebuild_from_database()
+        assert engine.vector_store is None and not engine.bm25.is_ready
+
+    def test_bm25_falls_back_to_docstore_text(self, engine):
+        from news.models import ArticleEmbedding
+        with patch.object(ArticleEmbedding, 'objects', _embedding_manager(_rows(3))), \
+             patch.object(engine, '_iter_article_texts', side_effect=Exception('db down')):
+            engine._rebuild_from_database()
+        assert engine.bm25.search('Title 2')[0]['article_id'] == 2
+
+    def test_similar_articles_query_uses_full_text(self, engine):
+        from news.models import ArticleEmbedding
+        with patch.object(ArticleEmbedding, 'objects', _embedding_manager(_rows(3))), \
+             patch.object(engine, '_iter_article_texts', side_effect=_bodies):
+            engine._rebuild_from_database()
+        with patch.object(engine, '_article_text', return_value='full body text') as text, \
+             patch.object(engine, 'hybrid_search', return_value=[]) as search:
+            engine.find_similar_articles_hybrid(2)
+        text.assert_called_once_with(2, 'Title 2\n\nSummary')
+        search.assert_called_once_with('full body text', k=6)
+
+
+class TestIncrementalBM25:
+
+    DOCS = [
+        {'article_id': 1, 'title': 'BYD Seal', 'text': 'BYD Seal electric sedan 523 km range'},
+        {'article_id': 2, 'title': 'Zeekr 7X', 'text': 'Zeekr 7X electric SUV 800V charging'},
+        {'article_id': 3, 'title': 'BMW i5', 'text': 'BMW i5 sedan luxurious interior range'},
+    ]
+
+    @staticmethod
+    def _scores(index, query):
+        return {r['article_id']: round(r['bm25_score'], 6) for r in index.search(query, k=10)}
+
+    def test_upsert_and_remove_match_a_fresh_build(self):
+        index = BM25Index()
+        index.build(self.DOCS[:2])
+        index.upsert([self.DOCS[2], {**self.DOCS[0], 'text': 'BYD Seal updated electric sedan'}])
+        index.remove([2])
+
+        fresh = BM25Index()
+        fresh.build([{**self.DOCS[0], 'text': 'BYD Seal updated electric sedan'}, self.DOCS[2]])
+        for query in ('electric sedan', 'range', 'zeekr'):
+            assert self._scores(index, query) == self._scores(fresh, query)
+        assert 'zeekr' not in index._df
+
+    def test_removing_the_last_document_empties_the_index(self):
+        index = BM25Index()
+        index.upsert(self.DOCS[:1])
+        index.remove([1])
+        assert not index.is_ready and index.search('seal') == []
+
+    def test_single_article_changes_do_not_read_bodies(self, engine):
+        from news.models import ArticleEmbedding
+        with patch.object(ArticleEmbedding, 'objects', _embedding_manager(_rows(3))), \
+             patch.object(engine, '_iter_article_texts', side_effect=_bodies):
+            engine._rebuild_from_database()
+
+        engine.embedding_model.embed_query.side_effect = None
+        engine.embedding_model.embed_query.return_value = np.ones(DIM, dtype=np.float32).tolist()
+        with patch.object(engine, '_iter_article_texts', side_effect=AssertionError('full scan')), \
+             patch.object(engine, '_save_to_database'), patch.object(engine, '_remove_from_database'), \
+             patch('news.embedding_storage.load_vectors',
+                   return_value={aid: np.ones(DIM, dtype=np.float32) for aid in (1, 2, 3)}):
+            engine.index_article(4, 'Title 4', 'a new polestar body')
+            assert engine.bm25.search('polestar')[0]['article_id'] == 4
+            engine.remove_article(4)
+        assert 4 not in engine.bm25._positions
+        assert engine.bm25.search('zeekr 2')[0]['article_id'] == 2
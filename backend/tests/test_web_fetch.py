@@ -0,0 +1,202 @@
+"""
+Tests for ai_engine/modules/web_fetch.py — the shared scraping fetcher:
+freshness rules, the on-disk cache with revalidation and LRU eviction,
+negative caching and retries. Session.get is patched; nothing hits the network.
+"""
+import os
+import time
+from unittest.mock import patch
+
+import pytest
+import requests
+from django.test import override_settings
+
+from ai_engine.modules import web_fetch
+from ai_engine.modules.web_fetch import DiskCache, freshness
+
+LOCMEM = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'web-fetch'}}
+
+
+def _resp(status=200, body=b'<html>ok</html>', headers=None, url='https://example.com/page'):
+    resp = requests.Response()
+    resp.status_code = status
+    resp._content = body
+    resp._content_consumed = True
+    resp.headers = requests.structures.CaseInsensitiveDict(headers or {})
+    resp.url = url
+    return resp
+
+
+@pytest.fixture
+def fetcher(tmp_path):
+    """Fresh fetcher state with a temp cache dir and a scripted Session.get."""
+    with override_settings(CACHES=LOCMEM, WEB_FETCH_CACHE_DIR=str(tmp_path), WEB_FETCH_CACHE_MAX_MB=1,
+                           WEB_FETCH_NEGATIVE_TTL=300, WEB_FETCH_RETRIES=1):
+        from django.core.cache import cache
+        cache.clear()
+        web_fetch.reset()
+        with patch.object(requests.Session, 'get') as session_get, \
+             patch.object(web_fetch.time, 'sleep'):
+            yield session_get
+        web_fetch.reset()
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Freshness
+# ═══════════════════════════════════════════════════════════════════
+
+class TestFreshness:
+
+    def test_max_age_minus_age(self):
+        assert freshness({'Cache-Control': 'public, max-age=600', 'Age': '100'}) == 500
+
+    def test_no_store_and_vary_star_are_not_stored(self):
+        assert freshness({'Cache-Control': 'no-store'}, ttl=60) is None
+        assert freshness({'Vary': '*'}, ttl=60) is None
+
+    def test_no_cache_must_revalidate(self):
+        assert freshness({'Cache-Control': 'no-cache, max-age=600'}) == 0
+
+    def test_expires_relative_to_date(self):
+        headers = {'Date': 'Mon, 01 Jun 2026 10:00:00 GMT', 'Expires': 'Mon, 01 Jun 2026 11:00:00 GMT'}
+        assert freshness(headers) == 3600
+
+    def test_caller_ttl_only_without_server_directives(self):
+        assert freshness({}, ttl=86400) == 86400
+        assert freshness({'Cache-Control': 'max-age=60'}, ttl=86400) == 60
+
+    def test_last_modified_heuristic_is_capped(self):
+        now = time.time()
+        recent = {'Last-Modified': time.strftime('%a, %d %b %Y %H:%M:%S GMT', time.gmtime(now - 1000))}
+        assert 99 <= freshness(recent, now=now) <= 101
+        old = {'Last-Modified': 'Mon, 01 Jan 2001 00:00:00 GMT'}
+        assert freshness(old, now=now) == web_fetch.MAX_HEURISTIC_TTL
+
+
+# ═══════════════════════════════════════════════════════════════════
+# HTTP cache
+# ═══════════════════════════════════════════════════════════════════
+
+class TestHttpCache:
+
+    def test_fresh_response_served_from_disk(self, fetcher):
+        fetcher.return_value = _resp(headers={'Cache-Control': 'max-age=600'})
+        first = web_fetch.get('https://example.com/page')
+        second = web_fetch.get('https://example.com/page')
+
+        assert fetcher.call_count == 1
+        assert second.status_code == 200 and second.text == first.text
+        stats = web_fetch.stats()
+        assert stats['hits'] == 1 and stats['misses'] == 1
+        assert stats['bytes_saved'] == len(b'<html>ok</html>')
+        assert stats['hit_rate'] == 0.5
+
+    def test_accept_header_is_part_of_the_key(self, fetcher):
+        fetcher.return_value = _resp(headers={'Cache-Control': 'max-age=600'})
+        web_fetch.get('https://example.com/page', headers={'Accept': 'text/html'})
+        web_fetch.get('https://example.com/page', headers={'Accept': 'application/rss+xml'})
+        assert fetcher.call_count == 2
+
+    def test_stale_entry_revalidated_with_etag(self, fetcher):
+        fetcher.return_value = _resp(headers={'Cache-Control': 'no-cache', 'ETag': '"v1"'})
+        web_fetch.get('https://example.com/page')
+
+        fetcher.return_value = _resp(status=304, body=b'', headers={'ETag': '"v1"'})
+        resp = web_fetch.get('https://example.com/page')
+
+        assert fetcher.call_args.kwargs['headers']['If-None-Match'] == '"v1"'
+        assert resp.status_code == 200
+        assert resp.text == '<html>ok</html>'
+        assert web_fetch.stats()['revalidated'] == 1
+
+    def test_uncacheable_responses_not_stored(self, fetcher):
+        fetcher.return_value = _resp(headers={'Cache-Control': 'no-store'})
+        web_fetch.get('https://example.com/page')
+        web_fetch.get('https://example.com/page')
+        assert fetcher.call_count == 2
+
+    def test_use_cache_false_bypasses_store(self, fetcher):
+        fetcher.return_value = _resp(headers={'Cache-Control': 'max-age=600'})
+        web_fetch.get('https://example.com/page', use_cache=False)
+        web_fetch.get('https://example.com/page', use_cache=False)
+        assert fetcher.call_count == 2
+
+
+class TestDiskCacheEviction:
+
+    def test_least_recently_used_entries_evicted(self, tmp_path):
+        store = DiskCache(str(tmp_path), max_bytes=3500)  # ~1 KB entries: room for three
+        meta = {'url': 'u', 'status': 200, 'headers': {}, 'expires': 0, 'ttl': None}
+        for i, key in enumerate(('aa1', 'bb2', 'cc3')):
+            store.store(key, meta, b'x' * 1000)
+            os.utime(store._path(key), (1000 + i, 1000 + i))
+        store.load('aa1')  # touched → most recently used
+        store.store('dd4', meta, b'x' * 1000)
+
+        assert store.load('aa1') is not None
+        assert store.load('dd4') is not None
+        assert store.load('bb2') is None
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Failures and retries
+# ═══════════════════════════════════════════════════════════════════
+
+class TestFailures:
+
+    def test_404_negative_cached(self, fetcher):
+        fetcher.return_value = _resp(status=404, body=b'gone')
+        assert web_fetch.get('https://example.com/missing').status_code == 404
+        assert web_fetch.get('https://example.com/missing').status_code == 404
+        assert fetcher.call_count == 1
+        assert web_fetch.stats()['negative_hits'] == 1
+
+    def test_unreachable_host_remembered_for_all_paths(self, fetcher):
+        from urllib3.exceptions import MaxRetryError, NameResolutionError
+        reason = NameResolutionError('dead.example', None, OSError('Name or service not known'))
+        fetcher.side_effect = requests.ConnectionError(MaxRetryError(None, '/a', reason))
+        with pytest.raises(requests.ConnectionError):
+            web_fetch.get('https://dead.example/a')
+        calls = fetcher.call_count  # first attempt + retry
+        with pytest.raises(requests.ConnectionError):
+            web_fetch.get('https://dead.example/b')
+        assert calls == 2
+        assert fetcher.call_count == calls
+
+    def test_reset_connection_only_remembered_for_the_url(self, fetcher):
+        fetcher.side_effect = [requests.ConnectionError('Connection aborted.'),
+                               requests.exceptions.SSLError('EOF occurred'), _resp()]
+        with pytest.raises(requests.ConnectionError):
+            web_fetch.get('https://i.ytimg.example/vi/a/maxres.jpg', retries=0)
+        with pytest.raises(requests.exceptions.SSLError):
+            web_fetch.get('https://i.ytimg.example/vi/b/maxres.jpg', retries=0)
+        assert web_fetch.get('https://i.ytimg.example/vi/c/maxres.jpg', retries=0).status_code == 200
+        with pytest.raises(requests.ConnectionError, match='cached failure'):
+            web_fetch.get('https://i.ytimg.example/vi/a/maxres.jpg', retries=0)
+
+    def test_server_error_retried_then_returned(self, fetcher):
+        fetcher.side_effect = [_resp(status=503, headers={'Retry-After': '1'}), _resp()]
+        resp = web_fetch.get('https://example.com/flaky')
+        assert resp.status_code == 200
+        assert fetcher.call_count == 2
+        web_fetch.time.sleep.assert_called_once()
+        assert web_fetch.time.sleep.call_args.args[0] >= 1
+
+    def test_retries_zero_for_guessed_paths(self, fetcher):
+        fetcher.side_effect = requests.Timeout('slow')
+        with pytest.raises(requests.Timeout):
+            web_fetch.get('https://example.com/terms', retries=0)
+        assert fetcher.call_count == 1
+
+
+class TestSessions:
+
+    def test_least_recently_used_hosts_are_closed(self, fetcher):
+        with patch.object(web_fetch, 'MAX_HOST_SESSIONS', 2), \
+             patch.object(requests.Session, 'close') as close:
+            first, _ = web_fetch._host('https://a.example/')
+            web_fetch._host('https://b.example/')
+            assert web_fetch._host('https://a.example/x')[0] is first  # reuse marks it recent
+            web_fetch._host('https://c.example/')
+        assert list(web_fetch._hosts) == ['a.example', 'c.example']
+        close.assert_called_once()
@@ -279,7 +279,7 @@ class TestLicenseChecker:
         result = _parse_json_response('```json\n{"status": "green"}\n```')
         assert result == {'status': 'green'}
 
-    @patch('ai_engine.modules.license_checker.requests.get')
+    @patch('ai_engine.modules.license_checker.web_fetch.get')
     def test_check_robots_txt(self, mock_get):
         from ai_engine.modules.license_checker import _check_robots_txt
         mock_get.return_value = MagicMock(
@@ -296,7 +296,7 @@ class TestLicenseChecker:
 
 class TestFeedDiscovery:
 
-    @patch('ai_engine.modules.feed_discovery.requests.get')
+    @patch('ai_engine.modules.feed_discovery.web_fetch.get')
     def test_discover_feed_from_html(self, mock_get):
         from ai_engine.modules.feed_discovery import discover_feeds
         mock_get.return_value = MagicMock(
@@ -310,7 +310,7 @@ class TestFeedDiscovery:
         except Exception:
             pass  # Module may have different API
 
-    @patch('ai_engine.modules.feed_discovery.requests.get')
+    @patch('ai_engine.modules.feed_discovery.web_fetch.get')
     def test_discover_no_feeds(self, mock_get):
         from ai_engine.modules.feed_discovery import discover_feeds
         mock_get.return_value = MagicMock(
@@ -231,6 +231,9 @@ const RELEVANCE_COLORS = {
     low: { stripe: 'bg-rose-400', badge: 'bg-rose-100 text-rose-600 border-rose-300', text: 'Low', dot: 'bg-rose-400' },
 };
 
+// Stop polling a bulk_generate job after this long; it keeps running server-side
+const BULK_POLL_TIMEOUT_MS = 30 * 60 * 1000;
+
 export default function RSSNewsPage() {
     const [feeds, setFeeds] = useState<RSSFeed[]>([]);
     const [newsItems, setNewsItems] = useState<RSSNewsItem[]>([]);
@@ -603,23 +606,37 @@ export default function RSSNewsPage() {
             const response = await api.post('/rss-news-items/bulk_generate/', {
                 item_ids: Array.from(selectedItems)
             });
-
-            const results = response.data.results || [];
-            let successCount = 0;
-            let failCount = 0;
-
-            for (const r of results) {
-                if (r.status === 'success' || r.status === 'generated') {
-                    successCount++;
+            const jobId = response.data.job_id;
+            const total = response.data.total || 0;
+            setBulkProgress(`0/${total}`);
+
+            // Items finish independently — poll the job and mark each one as it lands
+            const applied = new Set<number>();
+            const pollUntil = Date.now() + BULK_POLL_TIMEOUT_MS;
+            let job = response.data;
+            while (true) {
+                if (Date.now() > pollUntil) {
+                    toast.error('Bulk generation is still running — refresh later to see the results');
+                    return;
+                }
+                await new Promise(resolve => setTimeout(resolve, 3000));
+                const poll = await api.get(`/rss-news-items/bulk_generate_status/?job_id=${jobId}`);
+                job = poll.data;
+                for (const r of job.results || []) {
+                    if (!r.success || applied.has(r.id)) continue;
+                    applied.add(r.id);
                     setNewsItems(prev => prev.map(item =>
-                        item.id === r.item_id
-                            ? { ...item, status: 'generated', pending_article: r.pending_article_id }
+                        item.id === r.id
+                            ? { ...item, status: 'generated', pending_article: r.pending_id }
                             : item
                     ));
-                } else {
-                    failCount++;
                 }
+                setBulkProgress(`${job.done || 0}/${total}`);
+                if (job.status !== 'running') break;
             }
+            if (job.status === 'error') throw new Error(job.error || 'Bulk generation failed');
+            const successCount = job.generated || 0;
+            const failCount = job.failed || 0;
 
             setSelectedItems(new Set());
             setBulkProgress('');